@@ -7,5 +7,32 @@ S3_DEPENDENCY_BUCKET = os.environ.get(
     "S3_DEPENDENCY_BUCKET", "gitauto-dependency-cache"
 )
 
+# Dependency tarballs are content-addressed under this prefix: {prefix}{scope}/{manifest_hash}/{tarball_name}, shared by every repo whose manifests hash the same. GitHub owner names can't start with "_", so this never collides with the {owner}/{repo}/ prefixes that hold each repo's pointers and manifests.
+DEPENDENCY_CAS_S3_PREFIX = "_deps/"
+
+# Scope for installs that used no owner credentials, so forks and repos in other orgs with identical manifests share one tarball. Installs that used an owner's private registry token are scoped by owner id instead.
+DEPENDENCY_CAS_SHARED_SCOPE = "shared"
+
+# When set, dependency tarballs, pointers and manifests live in this local directory (one subdirectory per bucket) instead of S3; used by tests and local runs
+DEPENDENCY_STORE_DIR = os.environ.get("DEPENDENCY_STORE_DIR", "")
+
 # 10 minutes - max time to wait for subprocess commands (linters, test runners, etc.)
 SUBPROCESS_TIMEOUT_SECONDS = 600
+
+# Lambda's only writable directory; clones live under /tmp/{owner}/{repo}
+TMP_DIR = "/tmp"
+
+# Package-manager and tool caches in /tmp that cleanup_tmp and evict_other_owner_clones never delete
+TMP_SYSTEM_DIRS = ("pip", "npm", "yarn", "cache")
+
+# Clones in /tmp survive warm Lambda starts; this manifest records each clone's last use and size so cleanup_tmp can evict least-recently-used clones instead of wiping /tmp
+CLONE_CACHE_MANIFEST_PATH = "/tmp/.gitauto_clone_cache.json"
+
+# cleanup_tmp starts evicting once /tmp is this full (fraction of the ephemeral storage) and stops at the low watermark
+CLONE_CACHE_HIGH_WATERMARK = 0.7
+CLONE_CACHE_LOW_WATERMARK = 0.5
+
+# web_fetch/curl results shared by every container and customer (public URLs only, see fetch_with_cache)
+S3_FETCH_CACHE_BUCKET = os.environ.get("S3_FETCH_CACHE_BUCKET", S3_DEPENDENCY_BUCKET)
+# GitHub owner names can't start with "_", so this never collides with the {owner}/{repo}/ dependency prefixes
+FETCH_CACHE_S3_PREFIX = "_fetch-cache/"
@@ -23,3 +23,11 @@ MAX_OUTPUT_TOKENS: dict[ClaudeModelId, int] = {
     ClaudeModelId.SONNET_4_5: 64_000,
     ClaudeModelId.HAIKU_4_5: 64_000,
 }
+
+# https://platform.claude.com/docs/en/build-with-claude/prompt-caching
+# Ephemeral cache entries live 5 minutes (refreshed on every hit), so prefixes we wrote longer ago than this are not worth anchoring on.
+PROMPT_CACHE_TTL_SECONDS = 300
+
+# Cache reads bill at 0.1x the base input price and 5-minute cache writes at 1.25x.
+CACHE_READ_PRICE_RATIO = 0.1
+CACHE_WRITE_PRICE_RATIO = 1.25
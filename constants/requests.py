@@ -1 +1,11 @@
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+
+# Cached web_fetch/curl pages are served without a request for this long, then revalidated with If-None-Match / If-Modified-Since
+FETCH_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Bounds in characters of cached content: the in-process LRU evicts past the first, and larger entries than the second stay out of S3
+FETCH_CACHE_MEMORY_MAX_CHARS = 64 * 1024 * 1024
+FETCH_CACHE_S3_MAX_CHARS = 2 * 1024 * 1024
+
+# Bound in bytes of response bodies kept for GitHub REST conditional requests (If-None-Match / If-Modified-Since)
+GITHUB_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
@@ -5,3 +5,6 @@ SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 
 # 500 caused "URI Too Long" for .in_() with long file paths in delete_coverages_by_paths
 SUPABASE_BATCH_SIZE = 100
+
+# Rows per upsert request; a whole repo in one request timed out for repos with tens of thousands of files
+SUPABASE_UPSERT_BATCH_SIZE = 500
@@ -1,3 +1,6 @@
+# Handlers are imported where they are dispatched, not here: each one pulls in LLM/Stripe/GitHub SDKs that most invocations never use, and every module loaded here is paid on every cold start (see scripts/benchmark/import_time.py)
+# pylint: disable=import-outside-toplevel
+
 # Standard imports
 import asyncio
 import json
@@ -18,21 +21,14 @@ from constants.general import PRODUCT_NAME
 from payloads.aws.event_bridge_scheduler.event_types import EventBridgeSchedulerEvent
 from payloads.aws.setup_installed_repository_event import SetupInstalledRepositoryEvent
 from services.aws.cleanup_tmp import cleanup_tmp
-from services.github.token.get_installation_token import get_installation_access_token
+from services.github.utils.add_conditional_headers import GITHUB_RESPONSE_CACHE_STATS
 from services.github.utils.verify_webhook_signature import verify_webhook_signature
 from services.sentry.before_send import before_send
 from services.slack.slack_notify import slack_notify
 from services.supabase.webhook_deliveries.insert_webhook_delivery import (
     insert_webhook_delivery,
 )
-from services.webhook.setup_installed_repository import setup_installed_repository
-from services.webhook.schedule_handler import schedule_handler
-from services.webhook.setup_handler import setup_handler
-from services.webhook.webhook_handler import handle_webhook_event
-from services.website.retarget_pr import retarget_pr
-from services.website.sync_files_from_github_to_coverage import (
-    sync_files_from_github_to_coverage,
-)
+from services.webhook.utils.is_routed_event import is_routed_event
 from services.website.verify_api_key import verify_api_key
 from utils.aws.extract_lambda_info import extract_lambda_info
 from utils.logging.logging_config import (
@@ -62,6 +58,7 @@ mangum_handler = Mangum(app=app, lifespan="off")
 # Here is an entry point for the AWS Lambda function. Mangum is a library that allows you to use FastAPI with AWS Lambda.
 def handler(event, context):
     clear_state()  # Prevent metadata from previous invocation bleeding into this one on warm starts
+    GITHUB_RESPONSE_CACHE_STATS.clear()  # The cached responses persist across warm starts; the hit/miss counts are per invocation
     cleanup_tmp()  # Clean at START (not end) so it runs even if previous invocation crashed/timed out
     set_request_id(getattr(context, "aws_request_id", "local"))
 
@@ -72,6 +69,10 @@ def handler(event, context):
         repo_name = event["repo_name"]
         set_owner_repo(owner_name, repo_name)
         logger.info("handler: dispatching setup_installed_repository event")
+        from services.webhook.setup_installed_repository import (
+            setup_installed_repository,
+        )
+
         setup_installed_repository(
             owner_id=event["owner_id"],
             owner_name=owner_name,
@@ -97,6 +98,8 @@ def handler(event, context):
             f"Event Scheduler started for {owner_name}/{repo_name}"
         )
 
+        from services.webhook.schedule_handler import schedule_handler
+
         pr_url = schedule_handler(event=event)
         if pr_url:
             logger.info("schedule_handler created PR %s", pr_url)
@@ -120,6 +123,22 @@ async def handle_webhook(request: Request) -> dict[str, str]:
     event_name: str = request.headers.get("X-GitHub-Event", "Event not specified")
     delivery_id: str = request.headers.get("X-GitHub-Delivery", "No delivery ID")
 
+    # Process the webhook event but never raise an exception as some event_name like "marketplace_purchase" doesn't have a payload
+    try:
+        request_body: bytes = await request.body()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("Error reading request body: %s", e)
+        request_body = b""
+
+    # Most deliveries are event/action pairs nothing handles; drop them before any DB or network I/O
+    if not is_routed_event(event_name, request_body):
+        logger.info(
+            "Unrouted webhook ignored - delivery_id=%s event=%s",
+            delivery_id,
+            event_name,
+        )
+        return {"message": "Webhook ignored"}
+
     # Deduplicate webhook delivery using atomic database insert (None = DB error, still process)
     if (
         insert_webhook_delivery(
@@ -140,13 +159,6 @@ async def handle_webhook(request: Request) -> dict[str, str]:
     # Validate if the webhook signature comes from GitHub
     await verify_webhook_signature(request=request, secret=GITHUB_WEBHOOK_SECRET)
 
-    # Process the webhook event but never raise an exception as some event_name like "marketplace_purchase" doesn't have a payload
-    try:
-        request_body: bytes = await request.body()
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("Error reading request body: %s", e)
-        request_body = b""
-
     payload: Any = {}
     try:
         # First try to parse the body as JSON
@@ -180,6 +192,8 @@ async def handle_webhook(request: Request) -> dict[str, str]:
             repository.get("owner", {}).get("login", ""), repository.get("name", "")
         )
 
+    from services.webhook.webhook_handler import handle_webhook_event
+
     await handle_webhook_event(
         event_name=event_name, payload=payload, lambda_info=lambda_info
     )
@@ -209,6 +223,10 @@ async def api_sync_files_from_github_to_coverage(
     api_key: str = Header(..., alias="X-API-Key"),
 ):
     """Sync repository files from local clone to coverage database. Returns immediately via background_tasks.add_task."""
+    from services.website.sync_files_from_github_to_coverage import (
+        sync_files_from_github_to_coverage,
+    )
+
     background_tasks.add_task(
         sync_files_from_github_to_coverage,
         owner=owner,
@@ -244,6 +262,11 @@ async def api_retarget_pr(
     set_event_action("website", "retarget_pr")
     set_trigger("retarget")
 
+    from services.github.token.get_installation_token import (
+        get_installation_access_token,
+    )
+    from services.website.retarget_pr import retarget_pr
+
     token = get_installation_access_token(installation_id=body.installation_id)
     background_tasks.add_task(
         retarget_pr,
@@ -270,6 +293,8 @@ async def setup_coverage_workflow(
 ):
     verify_api_key(api_key)
     logger.info("setup_coverage_workflow: invoking setup_handler")
+    from services.webhook.setup_handler import setup_handler
+
     return await setup_handler(
         owner_name=owner,
         repo_name=repo,
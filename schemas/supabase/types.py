@@ -162,6 +162,30 @@ class CoveragesInsert(TypedDict):
     platform: str
 
 
+class CoverageSyncs(TypedDict):
+    id: int
+    owner_id: int
+    repo_id: int
+    branch_name: str
+    commit_sha: str | None
+    tree_sha: str | None
+    created_at: datetime.datetime
+    created_by: str
+    updated_at: datetime.datetime
+    updated_by: str
+    platform: str
+
+
+class CoverageSyncsInsert(TypedDict):
+    owner_id: int
+    repo_id: int
+    branch_name: str
+    commit_sha: NotRequired[str | None]
+    tree_sha: NotRequired[str | None]
+    created_by: str
+    updated_by: str
+    platform: str
+
 class Credits(TypedDict):
     id: int
     owner_id: int
@@ -228,6 +252,19 @@ class InstallationsInsert(TypedDict):
     platform: str
 
 
+class LlmMessages(TypedDict):
+    hash: str
+    content: str
+    last_seen_at: datetime.datetime
+    created_at: datetime.datetime
+
+
+class LlmMessagesInsert(TypedDict):
+    hash: str
+    content: str
+    last_seen_at: NotRequired[datetime.datetime]
+
+
 class LlmRequests(TypedDict):
     id: int
     usage_id: int | None
@@ -248,6 +285,13 @@ class LlmRequests(TypedDict):
     created_by: str | None
     updated_at: datetime.datetime
     updated_by: str | None
+    cache_read_input_tokens: int
+    cache_creation_input_tokens: int
+    input_message_hashes: list[str] | None
+    parent_request_id: int | None
+    parent_prefix_length: int
+    time_to_first_token_ms: int | None
+    tool_overlap_ms: int | None
 
 
 class LlmRequestsInsert(TypedDict):
@@ -267,6 +311,13 @@ class LlmRequestsInsert(TypedDict):
     error_message: NotRequired[str | None]
     created_by: NotRequired[str | None]
     updated_by: NotRequired[str | None]
+    cache_read_input_tokens: NotRequired[int]
+    cache_creation_input_tokens: NotRequired[int]
+    input_message_hashes: NotRequired[list[str] | None]
+    parent_request_id: NotRequired[int | None]
+    parent_prefix_length: NotRequired[int]
+    time_to_first_token_ms: NotRequired[int | None]
+    tool_overlap_ms: NotRequired[int | None]
 
 
 class MarketingCoverage(TypedDict):
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Time applying -U0 diffs to the CPython fixtures: `git apply --unidiff-zero` through a temp diff file and a rewritten target (what apply_patch used to do) versus apply_unified_diff in memory.
+
+Each round edits a fixture in a few random places, builds the diff with difflib, and applies it both ways. Both sides must produce the same content. Logging is disabled so the timing reflects the patch work, not log I/O.
+
+Usage:
+  python3 scripts/benchmark/apply_unified_diff.py
+  python3 scripts/benchmark/apply_unified_diff.py --rounds 50
+"""
+
+import argparse
+import difflib
+import logging
+import os
+from pathlib import Path
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from utils.files.apply_unified_diff import apply_unified_diff
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent.parent / "services/git/fixtures"
+
+
+def make_diff(lines: list[str], rng: random.Random):
+    new_lines = list(lines)
+    for position in sorted(rng.sample(range(0, len(lines) - 5, 7), 6), reverse=True):
+        new_lines[position : position + 1] = [f"    edited_{position} = 1"]
+    diff = difflib.unified_diff(
+        lines, new_lines, "a/target.py", "b/target.py", n=0, lineterm=""
+    )
+    return "".join(f"{line}\n" for line in diff)
+
+
+def git_apply(work_dir: str, text: str, diff_text: str):
+    target = os.path.join(work_dir, "target.py")
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(text)
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".diff", delete=False) as f:
+        f.write(diff_text)
+    subprocess.run(
+        ["git", "apply", "--verbose", "--unidiff-zero", f.name],
+        cwd=work_dir,
+        check=True,
+        capture_output=True,
+    )
+    os.remove(f.name)
+    with open(target, encoding="utf-8") as f:
+        return f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+    git_seconds: list[float] = []
+    engine_seconds: list[float] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        subprocess.run(["git", "init", "-q"], cwd=work_dir, check=True)
+        for fixture in sorted(FIXTURES_DIR.glob("*.py.txt")):
+            text = fixture.read_text(encoding="utf-8")
+            lines = text.split("\n")[:-1]
+            for _ in range(args.rounds):
+                diff_text = make_diff(lines, rng)
+
+                start = time.perf_counter()
+                expected = git_apply(work_dir, text, diff_text)
+                git_seconds.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                result = apply_unified_diff(text, diff_text, "target.py")
+                engine_seconds.append(time.perf_counter() - start)
+
+                assert result.content == expected, "engine and git apply disagree"
+
+    print(f"diffs={len(git_seconds)} (6 zero-context hunks each)")
+    print(f"{'':<20} {'total':>9} {'median':>9}")
+    for name, seconds in (
+        ("git apply + files", git_seconds),
+        ("apply_unified_diff", engine_seconds),
+    ):
+        print(
+            f"{name:<20} {sum(seconds):>8.3f}s {statistics.median(seconds) * 1000:>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Read every coverage row of a synthetic repo the old way (select "*", OFFSET pages) and through iter_coverages with the projections delete_stale_coverages and schedule_handler use.
+
+The table is an in-memory fake of the PostgREST query builder. MB is the JSON the client would download, parse is the client-side json.loads time, and "rows scanned" counts what Postgres reads to produce each page: an OFFSET page walks past every earlier row, a keyset page seeks straight to its first row.
+
+Usage:
+  python3 scripts/benchmark/coverage_reads.py
+  python3 scripts/benchmark/coverage_reads.py --rows 100000
+"""
+
+import argparse
+import bisect
+import gc
+import json
+import logging
+from pathlib import Path
+import random
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from services.supabase.coverages.iter_coverages import PAGE_SIZE, iter_coverages
+from services.webhook.schedule_handler import CANDIDATE_COVERAGE_COLUMNS
+
+
+def make_rows(total: int):
+    rng = random.Random(0)
+    rows = []
+    for i in range(total):
+        uncovered = sorted(rng.sample(range(1, 2000), rng.randint(0, 120)))
+        rows.append(
+            {
+                "id": i + 1,
+                "platform": "github",
+                "owner_id": 1,
+                "repo_id": 2,
+                "level": "file",
+                "full_path": f"packages/pkg{i // 500}/src/module{i % 500}/file{i}.ts",
+                "file_size": rng.randint(100, 50_000),
+                "statement_coverage": rng.choice([None, 0.0, 42.5, 100.0]),
+                "function_coverage": rng.choice([None, 0.0, 50.0, 100.0]),
+                "branch_coverage": rng.choice([None, 0.0, 33.3, 100.0]),
+                "line_coverage": rng.choice([None, 0.0, 61.2, 100.0]),
+                "uncovered_lines": ", ".join(map(str, uncovered)),
+                "uncovered_functions": ", ".join(
+                    f"fn{j}" for j in range(rng.randint(0, 15))
+                ),
+                "uncovered_branches": ", ".join(
+                    f"line {n}, block 0, if branch" for n in uncovered[:40]
+                ),
+                "is_excluded_from_testing": False,
+                "exclusion_reason": None,
+                "impl_blob_sha": f"{i:040x}",
+                "test_blob_sha": None,
+                "checklist_hash": "c" * 64,
+                "quality_checks": {
+                    f"category{c}": {
+                        f"check{k}": {"status": "pass", "reason": "x" * 40}
+                        for k in range(4)
+                    }
+                    for c in range(6)
+                },
+                "created_by": "bench",
+                "updated_by": "bench",
+                "branch_name": "main",
+            }
+        )
+    rows.sort(key=lambda r: r["full_path"])
+    return rows
+
+
+class FakeTable:
+    def __init__(self, rows: list[dict], paths: list[str], stats: dict):
+        self.rows = rows
+        self.paths = paths
+        self.stats = stats
+        self.columns: list[str] | None = None
+        self.after: str | None = None
+        self.offset = 0
+        self.limit_n = PAGE_SIZE
+
+    def select(self, columns: str):
+        self.columns = None if columns == "*" else columns.split(",")
+        return self
+
+    def eq(self, _column, _value):
+        # Every synthetic row belongs to the one repo being read
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def gt(self, _column, value):
+        self.after = value
+        return self
+
+    def limit(self, n: int):
+        self.limit_n = n
+        return self
+
+    def range(self, start: int, end: int):
+        self.offset = start
+        self.limit_n = end - start + 1
+        return self
+
+    def execute(self):
+        if self.after is not None:
+            start = bisect.bisect_right(self.paths, self.after)
+            self.stats["scanned"] += min(self.limit_n, len(self.rows) - start)
+        else:
+            start = self.offset
+            self.stats["scanned"] += min(start + self.limit_n, len(self.rows))
+        page = self.rows[start : start + self.limit_n]
+        if self.columns is not None:
+            page = [{c: r[c] for c in self.columns} for r in page]
+        payload = json.dumps(page)
+        self.stats["bytes"] += len(payload)
+        self.stats["requests"] += 1
+        start = time.perf_counter()
+        data = json.loads(payload)
+        self.stats["parse"] += time.perf_counter() - start
+        return type("Result", (), {"data": data})()
+
+
+class FakeClient:
+    def __init__(self, rows: list[dict], stats: dict):
+        self.rows = rows
+        self.paths = [r["full_path"] for r in rows]
+        self.stats = stats
+
+    def table(self, _name: str):
+        return FakeTable(self.rows, self.paths, self.stats)
+
+
+def legacy_read(client: FakeClient):
+    # get_all_coverages before keyset pagination
+    records = []
+    offset = 0
+    while True:
+        result = (
+            client.table("coverages")
+            .select("*")
+            .eq("platform", "github")
+            .eq("owner_id", 1)
+            .eq("repo_id", 2)
+            .eq("level", "file")
+            .order("statement_coverage,file_size,full_path", desc=False)
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        )
+        records.extend(result.data)
+        if len(result.data) < PAGE_SIZE:
+            return records
+        offset += PAGE_SIZE
+
+
+def measure(label: str, rows: list[dict], read):
+    stats = {"scanned": 0, "bytes": 0, "requests": 0, "parse": 0.0}
+    client = FakeClient(rows, stats)
+    # Collect the previous run's rows first so its garbage doesn't land in this run's parse time
+    gc.collect()
+    with patch("services.supabase.coverages.iter_coverages.supabase", client):
+        got = [row["full_path"] for row in read(client)]
+    print(
+        f"{label:<32} {stats['requests']:4d} requests  {stats['scanned']:>11,} rows scanned  {stats['bytes'] / 1e6:7.1f} MB  parse {stats['parse']:6.3f}s"
+    )
+    return got
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rows = make_rows(args.rows)
+    print(f"rows={len(rows)} page_size={PAGE_SIZE}")
+
+    legacy = measure('select("*") + OFFSET', rows, legacy_read)
+    full = measure(
+        'iter_coverages("*")',
+        rows,
+        lambda _c: list(iter_coverages(platform="github", owner_id=1, repo_id=2)),
+    )
+    candidates = measure(
+        "iter_coverages(schedule_handler)",
+        rows,
+        lambda _c: list(
+            iter_coverages(
+                platform="github",
+                owner_id=1,
+                repo_id=2,
+                columns=CANDIDATE_COVERAGE_COLUMNS,
+            )
+        ),
+    )
+    paths = measure(
+        "iter_coverages(full_path)",
+        rows,
+        lambda _c: list(
+            iter_coverages(
+                platform="github", owner_id=1, repo_id=2, columns=["full_path"]
+            )
+        ),
+    )
+
+    print(f"same paths: {sorted(legacy) == full == candidates == paths}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Count CodeBuild installs and stored tarball bytes for a set of repos sharing manifests: tarballs keyed by {owner}/{repo} (before) versus content-addressed by manifest hash behind per-repo pointers.
+
+Runs check_s3_dep_freshness_and_trigger_install against a LocalObjectStore; a triggered install is simulated by writing the tarball and pointer the way the CodeBuild buildspec does. Repos are forks/siblings spread over a few distinct manifest sets. Logging is disabled so the timing reflects the cache, not log I/O.
+
+Usage:
+  python3 scripts/benchmark/dep_cache_cas.py
+  python3 scripts/benchmark/dep_cache_cas.py --repos 200 --manifest-sets 5 --tarball-mb 50
+"""
+
+import argparse
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.check_s3_dep_freshness_and_trigger_install import (
+    check_s3_dep_freshness_and_trigger_install,
+)
+from services.aws.s3.local_object_store import LocalObjectStore
+from services.aws.s3.write_dep_pointer import write_dep_pointer
+
+MODULE = "services.aws.s3.check_s3_dep_freshness_and_trigger_install"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repos", type=int, default=60)
+    parser.add_argument("--manifest-sets", type=int, default=3)
+    parser.add_argument("--tarball-mb", type=float, default=80.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    repos = [(f"repo{i}", f"hash{i % args.manifest_sets}") for i in range(args.repos)]
+
+    # Before: one tarball per repo, so every repo pays one install
+    per_repo_installs = len(repos)
+    per_repo_bytes = len(repos) * args.tarball_mb
+
+    with tempfile.TemporaryDirectory() as root:
+        store = LocalObjectStore(root=root)
+        installs: list[str] = []
+
+        def fake_install(*, s3_key_prefix: str, **_kwargs):
+            owner_name, repo_name = s3_key_prefix.split("/")
+            cas_key = store.get_object(
+                Bucket=S3_DEPENDENCY_BUCKET,
+                Key=f"{s3_key_prefix}/manifests/.cas-key.node_modules.tar.gz",
+            )["Body"].read()
+            store.put_object(
+                Bucket=S3_DEPENDENCY_BUCKET, Key=cas_key.decode(), Body=b"tarball"
+            )
+            write_dep_pointer(
+                owner_name,
+                repo_name,
+                "node_modules.tar.gz",
+                cas_key.decode(),
+                cas_key.decode().split("/")[2],
+            )
+            installs.append(s3_key_prefix)
+
+        clients = [
+            patch(f"{module}.get_dep_store_client", return_value=store)
+            for module in (
+                MODULE,
+                "services.aws.s3.head_dep_object",
+                "services.aws.s3.read_dep_pointer",
+                "services.aws.s3.write_dep_pointer",
+            )
+        ]
+        for client in clients:
+            client.start()
+        start = time.perf_counter()
+        with patch(f"{MODULE}.run_install_via_codebuild", side_effect=fake_install):
+            for repo_name, manifest_hash in repos:
+                check_s3_dep_freshness_and_trigger_install(
+                    owner_name="owner",
+                    repo_name=repo_name,
+                    owner_id=1,
+                    pkg_manager="npm",
+                    tarball_name="node_modules.tar.gz",
+                    manifest_hash=manifest_hash,
+                    manifest_files={"package.json": "{}"},
+                    log_prefix="node",
+                )
+        seconds = time.perf_counter() - start
+        for client in clients:
+            client.stop()
+
+        blobs = store.list_objects_v2(Bucket=S3_DEPENDENCY_BUCKET, Prefix="_deps/")
+
+    cas_bytes = blobs["KeyCount"] * args.tarball_mb
+    print(
+        f"repos={args.repos} manifest sets={args.manifest_sets} tarball={args.tarball_mb:.0f}MB"
+    )
+    print(f"{'':<16} {'installs':>9} {'stored MB':>10}")
+    print(f"{'per-repo keys':<16} {per_repo_installs:>9} {per_repo_bytes:>10.0f}")
+    print(f"{'content-keyed':<16} {len(installs):>9} {cas_bytes:>10.0f}")
+    print(f"freshness checks: {seconds / len(repos) * 1000:.2f}ms each (local store)")
+
+
+if __name__ == "__main__":
+    main()
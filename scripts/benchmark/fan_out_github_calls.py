@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Time updating every open PR branch after a push: one update-branch call after another (what handle_push used to do) versus fan_out_github_calls.
+
+The GitHub call is simulated with a fixed round-trip sleep, so the numbers show the fan-out's effect on wall time and not network variance. Both sides must return the same statuses in the same order. Logging is disabled so the timing reflects the calls, not log I/O.
+
+Usage:
+  python3 scripts/benchmark/fan_out_github_calls.py
+  python3 scripts/benchmark/fan_out_github_calls.py --prs 60 --latency-ms 250
+"""
+
+import argparse
+import logging
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from services.github.utils.fan_out_github_calls import fan_out_github_calls
+from services.github.utils.get_github_token_key import get_github_token_key
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prs", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    pr_numbers = list(range(1, args.prs + 1))
+
+    def update(pr_number: int):
+        time.sleep(args.latency_ms / 1000)
+        return ("conflict", None) if pr_number % 7 == 0 else ("updated", None)
+
+    start = time.perf_counter()
+    serial = [update(pr_number) for pr_number in pr_numbers]
+    serial_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fanned = fan_out_github_calls(
+        pr_numbers,
+        update,
+        lambda result: result[0] == "rate_limited",
+        token_key=get_github_token_key("benchmark"),
+    )
+    fan_out_seconds = time.perf_counter() - start
+
+    assert fanned == serial, "fan-out and serial disagree"
+
+    print(f"open PRs={args.prs} latency={args.latency_ms:.0f}ms per update-branch")
+    print(f"{'serial loop':<14} {serial_seconds:>7.2f}s")
+    print(f"{'fan-out':<14} {fan_out_seconds:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Time repeated search_local_file_contents queries on one clone: grep over the tracked files per query versus the in-memory file content index.
+
+The fixture is a committed git repo shaped like a monorepo plus an untracked node_modules tree. Each side runs the same queries --rounds times, the way an agent searches "from as many angles as possible" and then again after its edits. The index side pays for its one-time build (reading every tracked text file) in the first search, and a commit halfway through so the timing covers the incremental refresh too. Both sides must return identical results. Logging is disabled so the timing reflects the search work, not log I/O.
+
+Usage:
+  python3 scripts/benchmark/file_content_index.py
+  python3 scripts/benchmark/file_content_index.py --files 50000 --queries 10 --rounds 5
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from services.git.get_repo_snapshot import REPO_SNAPSHOTS
+from utils.files.get_file_content_index import FILE_CONTENT_INDEXES
+from utils.files.grep_files import grep_files
+from utils.files.search_file_content_index import search_file_content_index
+
+
+def git(repo_dir: str, *args: str):
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com", *args],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+    )
+
+
+def make_repo(repo_dir: str, total_files: int):
+    written = 0
+    pkg = 0
+    while written < total_files:
+        for i in range(20):
+            for rel_path in (
+                f"packages/pkg{pkg}/src/module{i}/handler{i}.ts",
+                f"packages/pkg{pkg}/src/module{i}/handler{i}.test.ts",
+                f"packages/pkg{pkg}/src/module{i}/util{i}.ts",
+                f"packages/pkg{pkg}/docs/module{i}.md",
+            ):
+                full = os.path.join(repo_dir, rel_path)
+                os.makedirs(os.path.dirname(full), exist_ok=True)
+                with open(full, "w", encoding="utf-8") as f:
+                    f.write(f"import {{ helper{i} }} from './util{i}';\n")
+                    f.write(f"export const value{pkg}_{i} = helper{i}({written});\n")
+                    f.write("// " + "lorem ipsum dolor sit amet " * 8 + "\n")
+                written += 1
+        pkg += 1
+
+    with open(os.path.join(repo_dir, ".gitignore"), "w", encoding="utf-8") as f:
+        f.write("node_modules/\n")
+    git(repo_dir, "init", "-q")
+    git(repo_dir, "add", "-A")
+    git(repo_dir, "commit", "-q", "-m", "fixture")
+
+    for i in range(total_files // 2):
+        full = os.path.join(repo_dir, f"node_modules/dep{i // 50}/lib/file{i}.js")
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8") as f:
+            f.write("module.exports = helper1;\n")
+
+
+def edit(repo_dir: str):
+    """What one write_and_commit_file leaves behind: one changed file, one new commit."""
+    path = os.path.join(repo_dir, "packages/pkg0/src/module1/util1.ts")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("export const value0_edited = 1;\n")
+    git(repo_dir, "commit", "-q", "-am", "edit")
+
+
+def run(repo_dir: str, queries: list[str], rounds: int, search):
+    results = []
+    seconds: list[float] = []
+    for round_number in range(rounds):
+        if round_number == rounds // 2:
+            edit(repo_dir)
+        for query in queries:
+            start = time.perf_counter()
+            results.append(search(query, repo_dir))
+            seconds.append(time.perf_counter() - start)
+    return seconds, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    queries = [f"value{i}_" for i in range(args.queries - 2)] + ["helper1", "nowhere"]
+    searches = len(queries) * args.rounds
+    with tempfile.TemporaryDirectory() as grep_dir, tempfile.TemporaryDirectory() as index_dir:
+        make_repo(grep_dir, args.files)
+        make_repo(index_dir, args.files)
+
+        REPO_SNAPSHOTS.clear()
+        grep_seconds, grep_results = run(
+            grep_dir,
+            queries,
+            args.rounds,
+            lambda query, repo_dir: grep_files(query=query, search_dir=repo_dir),
+        )
+
+        REPO_SNAPSHOTS.clear()
+        FILE_CONTENT_INDEXES.clear()
+        index_seconds, index_results = run(
+            index_dir,
+            queries,
+            args.rounds,
+            lambda query, repo_dir: search_file_content_index(
+                query=query, clone_dir=repo_dir
+            ),
+        )
+
+    assert index_results == grep_results, "index and grep disagree"
+
+    print(f"tracked files={args.files} searches={searches} (one commit halfway)")
+    print(f"{'':<16} {'total':>9} {'first':>9} {'median':>9}")
+    for name, seconds in (
+        ("grep per query", grep_seconds),
+        ("content index", index_seconds),
+    ):
+        print(
+            f"{name:<16} {sum(seconds):>8.3f}s {seconds[0] * 1000:>7.1f}ms"
+            f" {statistics.median(seconds) * 1000:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
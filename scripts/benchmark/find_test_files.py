@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Look up test files for every source file of a synthetic tree, once per call through find_test_files and once through a shared build_test_file_index.
+
+The tree mimics a large monorepo: N packages with src/, colocated tests, __tests__/ dirs and a mirrored test/ tree. Logging is disabled so the timing reflects the matching work, not log I/O.
+
+Usage:
+  python3 scripts/benchmark/find_test_files.py
+  python3 scripts/benchmark/find_test_files.py --files 50000 --lookups 500
+"""
+
+import argparse
+import logging
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from utils.files.build_test_file_index import build_test_file_index
+from utils.files.find_test_files import find_test_files
+from utils.files.find_test_files_in_index import find_test_files_in_index
+
+
+def make_tree(total_files: int):
+    paths: list[str] = []
+    pkg = 0
+    while len(paths) < total_files:
+        for i in range(20):
+            paths.append(f"packages/pkg{pkg}/src/module{i}/handler{i}.ts")
+            paths.append(f"packages/pkg{pkg}/src/module{i}/handler{i}.test.ts")
+            paths.append(f"packages/pkg{pkg}/src/module{i}/__tests__/util{i}.spec.ts")
+            paths.append(f"packages/pkg{pkg}/src/module{i}/util{i}.ts")
+            paths.append(f"packages/pkg{pkg}/test/module{i}/service{i}.test.ts")
+            paths.append(f"packages/pkg{pkg}/src/module{i}/service{i}.ts")
+            paths.append(f"packages/pkg{pkg}/docs/module{i}.md")
+        pkg += 1
+    return paths[:total_files]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    all_files = make_tree(args.files)
+    impl_files = [fp for fp in all_files if fp.endswith(".ts") and ".test." not in fp]
+    impl_files = [fp for fp in impl_files if "__tests__" not in fp][: args.lookups]
+
+    start = time.perf_counter()
+    legacy = [find_test_files(fp, all_files, None) for fp in impl_files]
+    per_call_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = build_test_file_index(all_files, None)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = [find_test_files_in_index(index, fp) for fp in impl_files]
+    lookup_seconds = time.perf_counter() - start
+
+    print(f"files={len(all_files)} lookups={len(impl_files)}")
+    print(f"find_test_files per call:  {per_call_seconds:8.3f}s")
+    print(
+        f"shared index:              {build_seconds + lookup_seconds:8.3f}s (build {build_seconds:.3f}s, lookups {lookup_seconds:.4f}s)"
+    )
+    print(f"identical results: {legacy == indexed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Cold-start import cost of each Lambda entry path, measured with `python -X importtime` in a fresh interpreter per run.
+
+Each entry path imports main.py plus the handler that main.py would import on dispatch, so the numbers are what a cold container pays before the handler runs. Timings vary by machine; the LAZY_PACKAGES check does not, and the script exits 1 when a path loads a package it should not (an eager import crept back into main.py, or a mypy_boto3 stub is imported outside TYPE_CHECKING).
+
+Usage:
+  python3 scripts/benchmark/import_time.py
+  python3 scripts/benchmark/import_time.py --runs 10 --top 15
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+ENTRY_PATHS = {
+    "interpreter": [],
+    "import main": ["main"],
+    "setup_installed_repository": [
+        "main",
+        "services.webhook.setup_installed_repository",
+    ],
+    "schedule": ["main", "services.webhook.schedule_handler"],
+    "webhook": ["main", "services.webhook.webhook_handler"],
+}
+
+# Packages each path must not load. Every path is also checked for mypy_boto3_* stubs, which are type-checking only.
+LAZY_PACKAGES = {
+    "import main": (
+        "anthropic",
+        "boto3",
+        "bs4",
+        "google.genai",
+        "html2text",
+        "openai",
+        "stripe",
+    ),
+}
+
+
+def measure(modules: list[str]):
+    """Return ({module: cumulative_us}, total_us) for one fresh interpreter importing modules in order."""
+    code = "; ".join(f"import {m}" for m in modules) or "pass"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        module = name.strip()
+        cumulative[module] = int(cumulative_us)
+        # Top-level rows have a single leading space and already include everything they imported
+        if name.startswith(" ") and not name.startswith("  "):
+            total += int(cumulative_us)
+    return cumulative, total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    violations: list[str] = []
+    print(f"{'entry path':<28} {'median':>9} {'min':>9} {'modules':>8}")
+    reports: dict[str, dict[str, int]] = {}
+    for path_name, modules in ENTRY_PATHS.items():
+        totals: list[int] = []
+        cumulative: dict[str, int] = {}
+        for _ in range(args.runs):
+            cumulative, total = measure(modules)
+            totals.append(total)
+        reports[path_name] = cumulative
+        print(
+            f"{path_name:<28} {statistics.median(totals) / 1000:>7.0f}ms {min(totals) / 1000:>7.0f}ms {len(cumulative):>8}"
+        )
+
+        loaded = set(cumulative)
+        for package in LAZY_PACKAGES.get(path_name, ()):
+            if package in loaded or any(m.startswith(package + ".") for m in loaded):
+                violations.append(f"{path_name}: loads {package}")
+        violations.extend(
+            f"{path_name}: loads {m} at runtime"
+            for m in sorted(loaded)
+            if m.startswith("mypy_boto3_") and "." not in m
+        )
+
+    for path_name, cumulative in reports.items():
+        if not cumulative or not args.top:
+            continue
+        print(f"\n{path_name}: heaviest imports (cumulative, last run)")
+        for module, us in sorted(cumulative.items(), key=lambda kv: -kv[1])[: args.top]:
+            print(f"  {us / 1000:>7.0f}ms  {module}")
+
+    if violations:
+        print("\nLazy import check FAILED:")
+        for violation in violations:
+            print(f"  {violation}")
+        sys.exit(1)
+    print("\nLazy import check passed")
+
+
+if __name__ == "__main__":
+    main()
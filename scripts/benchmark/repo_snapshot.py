@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Time the file discovery one PR run does on a clone: separate walks per helper versus one shared RepoSnapshot.
+
+The fixture is a committed git repo shaped like a monorepo (packages with src/, colocated and __tests__ tests, docs). The untracked node_modules tree stands in for installed dependencies that every os.walk had to prune. "separate walks per helper" repeats what the helpers did before the snapshot: git ls-files, an os.walk each for the naming and location conventions (with their per-file matching), git ls-tree -r -l, and a grep -r per search. "one shared snapshot" runs the same helpers as they are now. Discovery (listings and convention detection) and searches are timed separately since grep reads every file either way. Logging is disabled so the timing reflects the discovery work, not log I/O.
+
+Usage:
+  python3 scripts/benchmark/repo_snapshot.py
+  python3 scripts/benchmark/repo_snapshot.py --files 50000 --searches 20
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from constants.files import SKIP_DIRS, TEST_NAMING_PATTERNS
+from services.git.get_file_tree import get_file_tree
+from services.git.get_repo_snapshot import REPO_SNAPSHOTS
+from utils.files.detect_test_location_convention import (
+    detect_test_location_convention,
+)
+from utils.files.detect_test_naming_convention import detect_test_naming_convention
+from utils.files.grep_files import grep_files
+from utils.files.grep_patterns import GREP_EXCLUDE_DIRS
+from utils.files.is_test_file import is_test_file
+
+
+def make_repo(repo_dir: str, total_files: int):
+    written = 0
+    pkg = 0
+    while written < total_files:
+        for i in range(20):
+            for rel_path in (
+                f"packages/pkg{pkg}/src/module{i}/handler{i}.ts",
+                f"packages/pkg{pkg}/src/module{i}/handler{i}.test.ts",
+                f"packages/pkg{pkg}/src/module{i}/__tests__/util{i}.spec.ts",
+                f"packages/pkg{pkg}/src/module{i}/util{i}.ts",
+                f"packages/pkg{pkg}/docs/module{i}.md",
+            ):
+                full = os.path.join(repo_dir, rel_path)
+                os.makedirs(os.path.dirname(full), exist_ok=True)
+                with open(full, "w", encoding="utf-8") as f:
+                    f.write(f"export const value{pkg}_{i} = {written};\n")
+                written += 1
+        pkg += 1
+
+    with open(os.path.join(repo_dir, ".gitignore"), "w", encoding="utf-8") as f:
+        f.write("node_modules/\n")
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com"]
+        + ["commit", "-q", "-m", "fixture"],
+        cwd=repo_dir,
+        check=True,
+    )
+
+    # Installed dependencies: untracked, but on disk for every walk to descend into
+    for i in range(total_files // 2):
+        full = os.path.join(repo_dir, f"node_modules/dep{i // 50}/lib/file{i}.js")
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8") as f:
+            f.write("module.exports = 1;\n")
+
+
+def separate_discovery(repo_dir: str):
+    subprocess.run(["git", "ls-files"], cwd=repo_dir, check=True, capture_output=True)
+
+    # detect_test_naming_convention: walk, match each file name
+    for _dirpath, dirnames, filenames in os.walk(repo_dir):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            filename_lower = filename.lower()
+            for p in TEST_NAMING_PATTERNS:
+                if p.detect.search(filename_lower):  # pylint: disable=no-member
+                    break
+
+    # detect_test_location_convention: walk again, classify each file name
+    for dirpath, dirnames, filenames in os.walk(repo_dir):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if is_test_file(filename):
+                os.path.relpath(os.path.join(dirpath, filename), repo_dir)
+
+    subprocess.run(
+        ["git", "ls-tree", "--full-tree", "-l", "-r", "HEAD"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+    )
+
+
+def separate_searches(repo_dir: str, queries: list[str]):
+    for query in queries:
+        subprocess.run(
+            ["grep", "-r", "-n", "--binary-files=without-match", *GREP_EXCLUDE_DIRS]
+            + ["-e", query, "."],
+            cwd=repo_dir,
+            check=False,
+            capture_output=True,
+        )
+
+
+def shared_discovery(repo_dir: str):
+    REPO_SNAPSHOTS.clear()
+    get_file_tree(clone_dir=repo_dir, ref="HEAD")
+    detect_test_naming_convention(repo_dir)
+    detect_test_location_convention(repo_dir)
+
+
+def shared_searches(repo_dir: str, queries: list[str]):
+    for query in queries:
+        grep_files(query=query, search_dir=repo_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--searches", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    queries = [f"value{i}_" for i in range(args.searches)]
+    with tempfile.TemporaryDirectory() as repo_dir:
+        make_repo(repo_dir, args.files)
+
+        timings: dict[str, list[float]] = {}
+        for name, discovery, searches in (
+            ("separate walks per helper", separate_discovery, separate_searches),
+            ("one shared snapshot", shared_discovery, shared_searches),
+        ):
+            start = time.perf_counter()
+            discovery(repo_dir)
+            middle = time.perf_counter()
+            searches(repo_dir, queries)
+            timings[name] = [middle - start, time.perf_counter() - middle]
+
+    print(f"tracked files={args.files} searches={args.searches}")
+    print(f"{'':<26} {'discovery':>10} {'searches':>10}")
+    for name, (discovery_seconds, search_seconds) in timings.items():
+        print(f"{name:<26} {discovery_seconds:>9.3f}s {search_seconds:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Replay recorded conversations through trim_messages_to_token_limit and compare against the legacy one-count-per-removal loop.
+
+The "server" counter is a local regex tokenizer plus a simulated round-trip latency so the benchmark runs offline. Pass --live to use Anthropic's messages.count_tokens instead (needs ANTHROPIC_API_KEY).
+
+Usage:
+  python3 scripts/benchmark/trim_messages.py
+  python3 scripts/benchmark/trim_messages.py --budget-ratio 0.3 --latency-ms 250
+  python3 scripts/benchmark/trim_messages.py --live
+"""
+
+import argparse
+from functools import partial
+import json
+from pathlib import Path
+import re
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from constants.models import ClaudeModelId
+from services.claude.client import claude
+from services.claude.count_tokens import count_tokens_claude
+from services.messages.estimate_message_tokens import estimate_message_tokens
+from services.messages.plan_message_trim import plan_message_trim
+from services.messages.trim_messages import trim_messages_to_token_limit
+
+CLAUDE_DIR = Path(__file__).resolve().parent.parent.parent / "services" / "claude"
+CONVERSATIONS = [
+    CLAUDE_DIR / "test_messages.json",
+    CLAUDE_DIR / "fixtures" / "llm_97545_input_content.json",
+    CLAUDE_DIR / "fixtures" / "real_tool_pair_messages.json",
+    CLAUDE_DIR / "fixtures" / "real_verify_messages.json",
+]
+TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+
+
+def load_conversation(path: Path):
+    # insert_llm_request stores the system prompt as a leading role="system" entry; the SDK takes it separately.
+    messages = json.loads(path.read_text(encoding="utf-8"))
+    return [m for m in messages if m.get("role") != "system"]
+
+
+def make_offline_counter(latency_ms: int):
+    calls = {"n": 0}
+
+    def count(messages):
+        calls["n"] += 1
+        time.sleep(latency_ms / 1000)
+        return sum(
+            len(TOKEN_PATTERN.findall(json.dumps(m, default=str))) for m in messages
+        )
+
+    return count, calls
+
+
+def make_live_counter():
+    calls = {"n": 0}
+    count_fn = partial(
+        count_tokens_claude, client=claude, model=ClaudeModelId.SONNET_4_6
+    )
+
+    def count(messages):
+        calls["n"] += 1
+        return count_fn(messages)
+
+    return count, calls
+
+
+def legacy_trim(messages, max_input, count_fn):
+    # Same removal order as plan_message_trim, but re-counting after every single unit like the pre-planner loop did.
+    token_input = count_fn(messages)
+    while token_input > max_input and len(messages) > 1:
+        trimmed, _ = plan_message_trim(
+            messages, [1] * len(messages), max_input + 1, max_input
+        )
+        if len(trimmed) == len(messages):
+            break
+        messages = trimmed
+        token_input = count_fn(messages)
+    return messages, token_input
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ratio", type=float, default=0.5)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    header = f"{'conversation':40} {'msgs':>5} {'tokens':>8} {'budget':>8} {'legacy calls':>12} {'new calls':>9} {'legacy s':>8} {'new s':>6} {'kept':>9}"
+    print(header)
+    print("-" * len(header))
+    for path in CONVERSATIONS:
+        messages = load_conversation(path)
+        count, calls = (
+            make_live_counter() if args.live else make_offline_counter(args.latency_ms)
+        )
+        total = count(messages)
+        budget = int(total * args.budget_ratio)
+
+        calls["n"] = 0
+        start = time.perf_counter()
+        legacy_kept, _ = legacy_trim(messages, budget, count)
+        legacy_seconds = time.perf_counter() - start
+        legacy_calls = calls["n"]
+
+        calls["n"] = 0
+        start = time.perf_counter()
+        kept, _ = trim_messages_to_token_limit(
+            messages,
+            max_input=budget,
+            count_tokens_fn=count,
+            estimate_tokens_fn=estimate_message_tokens,
+        )
+        new_seconds = time.perf_counter() - start
+
+        print(
+            f"{path.name:40} {len(messages):>5} {total:>8} {budget:>8} {legacy_calls:>12} {calls['n']:>9} {legacy_seconds:>8.2f} {new_seconds:>6.2f} {len(kept):>4}/{len(legacy_kept):<4}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position
+# ruff: noqa: E402
+"""Move legacy inline llm_requests.input_content into the content-addressed llm_messages store.
+
+Each row's JSON transcript is split into messages, upserted into llm_messages (identical messages across rows collapse to one row), and the row is rewritten to reference the ordered hash list with input_content cleared. Rows are migrated as roots (no parent_request_id); only new rows written by insert_llm_request get hash deltas.
+
+Required DDL (apply in Supabase before running and before deploying the insert_llm_request change):
+
+  CREATE TABLE llm_messages (
+    hash text PRIMARY KEY,
+    content text NOT NULL,
+    last_seen_at timestamptz NOT NULL DEFAULT now(),
+    created_at timestamptz NOT NULL DEFAULT now()
+  );
+  CREATE INDEX llm_messages_last_seen_at_idx ON llm_messages (last_seen_at);
+  ALTER TABLE llm_requests
+    ADD COLUMN input_message_hashes text[],
+    ADD COLUMN parent_request_id bigint REFERENCES llm_requests (id) ON DELETE SET NULL,
+    ADD COLUMN parent_prefix_length integer NOT NULL DEFAULT 0;
+
+Usage:
+  python3 scripts/supabase/migrate_llm_request_transcripts.py --dry-run
+  python3 scripts/supabase/migrate_llm_request_transcripts.py --limit 5000
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+load_dotenv()
+
+from constants.supabase import SUPABASE_BATCH_SIZE
+from services.supabase.client import supabase
+from services.supabase.llm_messages.store_llm_messages import store_llm_messages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--limit", type=int, default=0, help="0 = no limit")
+    args = parser.parse_args()
+
+    migrated = 0
+    saved_chars = 0
+    last_id = 0
+    while not args.limit or migrated < args.limit:
+        batch = (
+            supabase.table("llm_requests")
+            .select("id, input_content")
+            .gt("id", last_id)
+            .is_("input_message_hashes", "null")
+            .neq("input_content", "")
+            .order("id")
+            .limit(SUPABASE_BATCH_SIZE)
+            .execute()
+        )
+        if not batch.data:
+            break
+
+        for row in batch.data:
+            last_id = row["id"]
+            messages = json.loads(row["input_content"])
+            if args.dry_run:
+                migrated += 1
+                saved_chars += len(row["input_content"])
+                continue
+
+            stored = store_llm_messages(messages)
+            if stored is None:
+                print(f"Skipping id={row['id']}: llm_messages upsert failed")
+                continue
+
+            supabase.table("llm_requests").update(
+                {
+                    "input_message_hashes": stored[0],
+                    "input_content": "",
+                    "updated_by": "system",
+                }
+            ).eq("id", row["id"]).execute()
+            migrated += 1
+            saved_chars += len(row["input_content"])
+
+        print(f"Migrated {migrated} rows so far (last id={last_id})")
+
+    verb = "Would migrate" if args.dry_run else "Migrated"
+    print(f"{verb} {migrated} rows, {saved_chars:,} chars of inline input_content")
+
+
+if __name__ == "__main__":
+    main()
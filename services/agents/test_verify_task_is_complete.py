@@ -2,20 +2,26 @@
 # pylint: disable=too-many-lines,unused-argument
 # pyright: reportArgumentType=false
 # pyright: reportUnusedVariable=false
+import asyncio
 from unittest.mock import patch, AsyncMock
 
 import pytest
 
 from services.agents.run_quality_gate import QualityGateResult
 from services.agents.verify_task_is_complete import verify_task_is_complete
-from services.eslint.run_eslint_fix import ESLintResult
+from services.eslint.run_eslint_fix_batch import ESLintResult
 from services.jest.run_js_ts_test import JsTsTestResult
 from services.phpunit.run_phpunit_test import PhpunitResult
-from services.prettier.run_prettier_fix import PrettierResult
+from services.prettier.run_prettier_fix_batch import PrettierResult
 from services.pytest.run_pytest_test import PytestResult
 from services.tsc.run_tsc_check import TscResult
 
 
+def for_every_file(result):
+    """side_effect for a mocked *_fix_batch that returns the same per-file result for every file passed in."""
+    return lambda **kwargs: {file_path: result for file_path in kwargs["files"]}
+
+
 @pytest.fixture(autouse=True)
 def mock_tsc_check():
     """Auto-mock run_tsc_check for all tests to prevent actual tsc execution."""
@@ -120,8 +126,8 @@ async def test_verify_task_is_complete_success_with_changes(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.read_local_file")
 @patch("services.agents.verify_task_is_complete.get_pull_request_files")
 async def test_verify_partial_fix_with_remaining_errors(
@@ -139,12 +145,16 @@ async def test_verify_partial_fix_with_remaining_errors(
     original = "const x = 1\nconst unused = 2;"
     fixed = "const x = 1;\nconst unused = 2;"
     mock_get_raw.return_value = original
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content=fixed,
-        lint_errors="Line 2: 'unused' is defined but never used (no-unused-vars)",
-        coverage_errors=None,
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content=fixed,
+            lint_errors="Line 2: 'unused' is defined but never used (no-unused-vars)",
+            coverage_errors=None,
+        )
     )
 
     result = await verify_task_is_complete(base_args)
@@ -157,6 +167,36 @@ async def test_verify_partial_fix_with_remaining_errors(
     assert result.error_files == {"src/index.ts"}
 
 
+@pytest.mark.asyncio
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
+@patch("services.agents.verify_task_is_complete.read_local_file")
+@patch("services.agents.verify_task_is_complete.get_pull_request_files")
+async def test_verify_prettier_error_lints_original_content(
+    mock_get_files,
+    mock_get_raw,
+    mock_prettier,
+    mock_eslint,
+    create_test_base_args,
+    tmp_path,
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+    mock_get_files.return_value = [
+        {"filename": "src/index.ts", "status": "modified"},
+    ]
+    original = "const x = (1"
+    mock_get_raw.return_value = original
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=False, content="partial", error="SyntaxError")
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
+    )
+
+    await verify_task_is_complete(base_args)
+
+    assert mock_eslint.call_args.kwargs["files"] == {"src/index.ts": original}
+
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_complete.get_pull_request_files")
 async def test_verify_task_is_complete_failure_no_changes(
@@ -221,8 +261,8 @@ async def test_verify_task_is_complete_api_error_returns_default(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.ensure_jest_uses_tsconfig_for_tests")
 @patch("services.agents.verify_task_is_complete.ensure_tsconfig_relaxed_for_tests")
 @patch("services.agents.verify_task_is_complete.write_and_commit_file")
@@ -253,9 +293,11 @@ async def test_verify_autofixes_missing_braces_in_test_file(
 });"""
     mock_upload.return_value = True
     mock_ensure_tsconfig.return_value = (None, None)
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
 
     result = await verify_task_is_complete(base_args)
@@ -287,8 +329,8 @@ async def test_verify_passes_with_correct_test_syntax(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.read_local_file")
 @patch("services.agents.verify_task_is_complete.get_pull_request_files")
 async def test_verify_ignores_non_test_files(
@@ -304,9 +346,11 @@ async def test_verify_ignores_non_test_files(
         {"filename": "src/components/Button.tsx", "status": "modified"},
     ]
     mock_get_raw.return_value = "const x = 1;\n"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
 
     result = await verify_task_is_complete(base_args)
@@ -332,8 +376,8 @@ async def test_verify_ignores_removed_test_files(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.ensure_jest_uses_tsconfig_for_tests")
 @patch("services.agents.verify_task_is_complete.ensure_tsconfig_relaxed_for_tests")
 @patch("services.agents.verify_task_is_complete.read_local_file")
@@ -359,9 +403,11 @@ async def test_verify_checks_both_ts_test_files(
   });
 });"""
     mock_ensure_tsconfig.return_value = (None, None)
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
 
     result = await verify_task_is_complete(base_args)
@@ -371,8 +417,8 @@ async def test_verify_checks_both_ts_test_files(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.ensure_jest_uses_tsconfig_for_tests")
 @patch("services.agents.verify_task_is_complete.ensure_tsconfig_relaxed_for_tests")
 @patch("services.agents.verify_task_is_complete.read_local_file")
@@ -398,9 +444,11 @@ async def test_verify_checks_only_ts_when_mixed_with_py(
   });
 });"""
     mock_ensure_tsconfig.return_value = (None, None)
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
 
     result = await verify_task_is_complete(base_args)
@@ -428,8 +476,8 @@ async def test_verify_ignores_all_non_js_test_files(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.ensure_jest_uses_tsconfig_for_tests")
 @patch("services.agents.verify_task_is_complete.ensure_tsconfig_relaxed_for_tests")
 @patch("services.agents.verify_task_is_complete.write_and_commit_file")
@@ -467,9 +515,11 @@ async def test_verify_autofixes_when_one_of_two_ts_files_has_missing_braces(
     mock_get_raw.side_effect = [correct_content, broken_content]
     mock_upload.return_value = True
     mock_ensure_tsconfig.return_value = (None, None)
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
 
     result = await verify_task_is_complete(base_args)
@@ -479,8 +529,8 @@ async def test_verify_autofixes_when_one_of_two_ts_files_has_missing_braces(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.ensure_jest_uses_tsconfig_for_tests")
 @patch("services.agents.verify_task_is_complete.ensure_tsconfig_relaxed_for_tests")
 @patch("services.agents.verify_task_is_complete.write_and_commit_file")
@@ -513,9 +563,11 @@ async def test_verify_autofixes_ts_with_missing_braces_ignores_py(
     mock_get_raw.return_value = broken_content
     mock_upload.return_value = True
     mock_ensure_tsconfig.return_value = (None, None)
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
 
     result = await verify_task_is_complete(base_args)
@@ -561,8 +613,8 @@ async def test_verify_fails_when_jest_tests_fail(
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_complete.run_js_ts_test", new_callable=AsyncMock)
 @patch("services.agents.verify_task_is_complete.run_tsc_check", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.read_local_file")
 @patch("services.agents.verify_task_is_complete.get_pull_request_files")
 async def test_verify_error_files_collected_from_eslint_and_jest(
@@ -582,12 +634,16 @@ async def test_verify_error_files_collected_from_eslint_and_jest(
         {"filename": "src/index.test.js", "status": "modified"},
     ]
     mock_get_raw.return_value = "const x = 1;"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content="const x = 1;",
-        lint_errors="Line 1: 'x' is defined but never used (no-unused-vars)",
-        coverage_errors=None,
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content="const x = 1;",
+            lint_errors="Line 1: 'x' is defined but never used (no-unused-vars)",
+            coverage_errors=None,
+        )
     )
     mock_tsc.return_value = TscResult(success=True, errors=[], error_files=set())
     mock_jest.return_value = JsTsTestResult(
@@ -1281,8 +1337,8 @@ async def test_ensure_eslint_relaxed_not_called_for_non_test_files(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.read_local_file")
 @patch("services.agents.verify_task_is_complete.get_pull_request_files")
 async def test_coverage_error_no_unnecessary_condition_blocks_completion(
@@ -1306,12 +1362,16 @@ async def test_coverage_error_no_unnecessary_condition_blocks_completion(
     mock_get_raw.return_value = (
         "const x = paymentMethod !== undefined ? <Component /> : null;"
     )
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content="const x = paymentMethod !== undefined ? <Component /> : null;",
-        lint_errors=None,
-        coverage_errors="Line 1: Unnecessary conditional, expected expression to always be truthy (@typescript-eslint/no-unnecessary-condition)",
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content="const x = paymentMethod !== undefined ? <Component /> : null;",
+            lint_errors=None,
+            coverage_errors="Line 1: Unnecessary conditional, expected expression to always be truthy (@typescript-eslint/no-unnecessary-condition)",
+        )
     )
 
     result = await verify_task_is_complete(base_args)
@@ -1326,8 +1386,8 @@ async def test_coverage_error_no_unnecessary_condition_blocks_completion(
 
 
 @pytest.mark.asyncio
-@patch("services.agents.verify_task_is_complete.run_eslint_fix")
-@patch("services.agents.verify_task_is_complete.run_prettier_fix")
+@patch("services.agents.verify_task_is_complete.run_eslint_fix_batch")
+@patch("services.agents.verify_task_is_complete.run_prettier_fix_batch")
 @patch("services.agents.verify_task_is_complete.read_local_file")
 @patch("services.agents.verify_task_is_complete.get_pull_request_files")
 async def test_lint_only_errors_still_block_completion(
@@ -1347,12 +1407,16 @@ async def test_lint_only_errors_still_block_completion(
         {"filename": "src/utils.ts", "status": "modified"},
     ]
     mock_get_raw.return_value = "const x: any = 1;"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content="const x: any = 1;",
-        lint_errors="Line 1: Unexpected any (@typescript-eslint/no-explicit-any)",
-        coverage_errors=None,
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content="const x: any = 1;",
+            lint_errors="Line 1: Unexpected any (@typescript-eslint/no-explicit-any)",
+            coverage_errors=None,
+        )
     )
 
     result = await verify_task_is_complete(base_args)
@@ -1511,3 +1575,53 @@ async def test_jest_infra_failure_skipped(
 
     assert result.success is True
     assert result.message == "Task completed."
+
+
+@pytest.mark.asyncio
+@patch(
+    "services.agents.verify_task_is_complete.run_pytest_test", new_callable=AsyncMock
+)
+@patch("services.agents.verify_task_is_complete.run_js_ts_test", new_callable=AsyncMock)
+@patch("services.agents.verify_task_is_complete.run_tsc_check", new_callable=AsyncMock)
+@patch("services.agents.verify_task_is_complete.get_pull_request_files")
+async def test_tsc_jest_and_pytest_run_concurrently(
+    mock_get_files, mock_tsc, mock_jest, mock_pytest, create_test_base_args, tmp_path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+    mock_get_files.return_value = [
+        {"filename": "tests/test_app.py", "status": "modified"},
+    ]
+    # Each stage waits until every stage has started; run back to back this would time out
+    all_started = asyncio.Barrier(3)
+
+    async def tsc_stage(**_kwargs):
+        await asyncio.wait_for(all_started.wait(), timeout=2)
+        return TscResult(
+            success=False, errors=["a.ts(1,1): error TS1"], error_files=set()
+        )
+
+    async def jest_stage(**_kwargs):
+        await asyncio.wait_for(all_started.wait(), timeout=2)
+        return JsTsTestResult(errors=["jest failed"], runner_name="jest")
+
+    async def pytest_stage(**_kwargs):
+        await asyncio.wait_for(all_started.wait(), timeout=2)
+        return PytestResult(success=False, errors=["pytest failed"])
+
+    mock_tsc.side_effect = tsc_stage
+    mock_jest.side_effect = jest_stage
+    mock_pytest.side_effect = pytest_stage
+
+    result = await verify_task_is_complete(base_args)
+
+    # Errors keep the sequential tsc -> jest -> pytest order
+    assert result.success is False
+    assert result.message == (
+        "Task NOT complete. Fix these errors:\n"
+        "- tsc: a.ts(1,1): error TS1\n"
+        "- jest: jest failed\n"
+        "- pytest: pytest failed"
+    )
+    mock_pytest.assert_awaited_once_with(
+        base_args=base_args, test_file_paths=["tests/test_app.py"]
+    )
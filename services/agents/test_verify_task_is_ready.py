@@ -6,24 +6,36 @@ from unittest.mock import patch, AsyncMock
 import pytest
 
 from services.agents.verify_task_is_ready import verify_task_is_ready
-from services.eslint.run_eslint_fix import ESLintResult
+from services.eslint.run_eslint_fix_batch import ESLintResult
 from services.jest.run_js_ts_test import JsTsTestResult
-from services.prettier.run_prettier_fix import PrettierResult
+from services.prettier.run_prettier_fix_batch import PrettierResult
 from services.tsc.run_tsc_check import TscResult
 
 
+def for_every_file(result):
+    """side_effect for a mocked *_fix_batch that returns the same per-file result for every file passed in."""
+    return lambda **kwargs: {file_path: result for file_path in kwargs["files"]}
+
+
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_valid_file_returns_success(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
 ):
     mock_read_local_file.return_value = "function foo() { return 1; }"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
     base_args = create_test_base_args()
     result = await verify_task_is_ready(
@@ -40,18 +52,25 @@ async def test_valid_file_returns_success(
 
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_prettier_fails_returns_errors(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
 ):
     mock_read_local_file.return_value = "function foo() { return 1;"
-    mock_prettier.return_value = PrettierResult(
-        success=False, content=None, error="SyntaxError: Unexpected token"
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(
+            success=False, content=None, error="SyntaxError: Unexpected token"
+        )
     )
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
     base_args = create_test_base_args()
     result = await verify_task_is_ready(
@@ -67,19 +86,59 @@ async def test_prettier_fails_returns_errors(
 
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
+@patch("services.agents.verify_task_is_ready.read_local_file")
+async def test_prettier_error_lints_original_content(
+    mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
+):
+    mock_read_local_file.return_value = "function foo() { return 1;"
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=False, content="partial", error="SyntaxError")
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
+    )
+    base_args = create_test_base_args()
+    await verify_task_is_ready(
+        base_args=base_args,
+        run_phpunit=False,
+        file_paths=["src/broken.ts"],
+    )
+    assert mock_eslint.call_args.kwargs["files"] == {
+        "src/broken.ts": "function foo() { return 1;"
+    }
+    mock_commit.assert_not_called()
+
+@pytest.mark.asyncio
+@patch("services.agents.verify_task_is_ready.git_commit_and_push")
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_eslint_fails_returns_errors(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
 ):
     mock_read_local_file.return_value = "function foo() { return 1; }"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content=None,
-        lint_errors=None,
-        coverage_errors="Parsing error: Unexpected token",
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content=None,
+            lint_errors=None,
+            coverage_errors="Parsing error: Unexpected token",
+        )
     )
     base_args = create_test_base_args()
     result = await verify_task_is_ready(
@@ -125,8 +184,13 @@ async def test_empty_file_list(create_test_base_args):
 
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_file_not_found_skipped(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
@@ -146,8 +210,13 @@ async def test_file_not_found_skipped(
 
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_fixes_applied_and_pushed(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
@@ -155,11 +224,11 @@ async def test_fixes_applied_and_pushed(
     original = "function foo() { return 1; }"
     formatted = "function foo() {\n  return 1;\n}"
     mock_read_local_file.return_value = original
-    mock_prettier.return_value = PrettierResult(
-        success=True, content=formatted, error=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=formatted, error=None)
     )
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
     base_args = create_test_base_args()
     result = await verify_task_is_ready(
@@ -176,8 +245,13 @@ async def test_fixes_applied_and_pushed(
 
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_eslint_partial_fix_pushes_and_reports_errors(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
@@ -185,12 +259,16 @@ async def test_eslint_partial_fix_pushes_and_reports_errors(
     original = "const x = 1\nconst unused = 2;"
     fixed = "const x = 1;\nconst unused = 2;"
     mock_read_local_file.return_value = original
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content=fixed,
-        lint_errors="Line 2: 'unused' is defined but never used (no-unused-vars)",
-        coverage_errors=None,
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content=fixed,
+            lint_errors="Line 2: 'unused' is defined but never used (no-unused-vars)",
+            coverage_errors=None,
+        )
     )
     base_args = create_test_base_args()
     result = await verify_task_is_ready(
@@ -209,8 +287,13 @@ async def test_eslint_partial_fix_pushes_and_reports_errors(
 
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_no_explicit_any_ignored(
     mock_read_local_file, mock_prettier, mock_eslint, mock_commit, create_test_base_args
@@ -218,12 +301,16 @@ async def test_no_explicit_any_ignored(
     mock_read_local_file.return_value = (
         "export async function getUsers(): Promise<any[]> { return []; }"
     )
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=False,
-        content=None,
-        lint_errors="Line 79: Unexpected any. Specify a different type (@typescript-eslint/no-explicit-any); Line 111: Unexpected any. Specify a different type (@typescript-eslint/no-explicit-any)",
-        coverage_errors=None,
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(
+            success=False,
+            content=None,
+            lint_errors="Line 79: Unexpected any. Specify a different type (@typescript-eslint/no-explicit-any); Line 111: Unexpected any. Specify a different type (@typescript-eslint/no-explicit-any)",
+            coverage_errors=None,
+        )
     )
     base_args = create_test_base_args(
         owner="Foxquilt",
@@ -245,8 +332,13 @@ async def test_no_explicit_any_ignored(
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.run_tsc_check")
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_run_tsc_reports_type_errors(
     mock_read_local_file,
@@ -257,9 +349,11 @@ async def test_run_tsc_reports_type_errors(
     create_test_base_args,
 ):
     mock_read_local_file.return_value = "const x: number = 'hello';"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
     mock_tsc.return_value = TscResult(
         success=False,
@@ -288,8 +382,13 @@ async def test_run_tsc_reports_type_errors(
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.run_js_ts_test")
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_run_jest_reports_test_failures(
     mock_read_local_file,
@@ -302,9 +401,11 @@ async def test_run_jest_reports_test_failures(
     mock_read_local_file.return_value = (
         "describe('test', () => { it('fails', () => { expect(true).toBe(false); }); });"
     )
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
     mock_jest.return_value = JsTsTestResult(
         success=False,
@@ -330,8 +431,13 @@ async def test_run_jest_reports_test_failures(
 @pytest.mark.asyncio
 @patch("services.agents.verify_task_is_ready.run_js_ts_test")
 @patch("services.agents.verify_task_is_ready.git_commit_and_push")
-@patch("services.agents.verify_task_is_ready.run_eslint_fix", new_callable=AsyncMock)
-@patch("services.agents.verify_task_is_ready.run_prettier_fix", new_callable=AsyncMock)
+@patch(
+    "services.agents.verify_task_is_ready.run_eslint_fix_batch", new_callable=AsyncMock
+)
+@patch(
+    "services.agents.verify_task_is_ready.run_prettier_fix_batch",
+    new_callable=AsyncMock,
+)
 @patch("services.agents.verify_task_is_ready.read_local_file")
 async def test_impl_files_excluded_from_jest(
     mock_read_local_file,
@@ -349,9 +455,11 @@ async def test_impl_files_excluded_from_jest(
     tests for impl files is verify_task_is_complete's job.
     """
     mock_read_local_file.return_value = "export function foo() { return 1; }"
-    mock_prettier.return_value = PrettierResult(success=True, content=None, error=None)
-    mock_eslint.return_value = ESLintResult(
-        success=True, content=None, lint_errors=None, coverage_errors=None
+    mock_prettier.side_effect = for_every_file(
+        PrettierResult(success=True, content=None, error=None)
+    )
+    mock_eslint.side_effect = for_every_file(
+        ESLintResult(success=True, content=None, lint_errors=None, coverage_errors=None)
     )
     mock_jest.return_value = JsTsTestResult()
 
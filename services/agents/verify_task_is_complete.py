@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 from dataclasses import dataclass, field
 
 from anthropic.types import ToolUnionParam
@@ -16,7 +18,7 @@ from services.agents.run_quality_gate import (
 from services.eslint.ensure_eslint_relaxed_for_tests import (
     ensure_eslint_relaxed_for_tests,
 )
-from services.eslint.run_eslint_fix import run_eslint_fix
+from services.eslint.run_eslint_fix_batch import ESLintResult, run_eslint_fix_batch
 from services.github.comments.create_comment import create_comment
 from services.git.write_and_commit_file import write_and_commit_file
 from services.eslint.get_eslint_config import get_eslint_config
@@ -35,7 +37,11 @@ from services.node.ensure_tsconfig_relaxed_for_tests import (
 from services.node.ensure_vitest_timeout_for_ci import ensure_vitest_timeout_for_ci
 from services.node.switch_node_version import switch_node_version
 from services.phpunit.run_phpunit_test import run_phpunit_test
-from services.prettier.run_prettier_fix import run_prettier_fix
+from services.prettier.merge_prettier_output import merge_prettier_output
+from services.prettier.run_prettier_fix_batch import (
+    PrettierResult,
+    run_prettier_fix_batch,
+)
 from services.pytest.run_pytest_test import run_pytest_test
 from services.slack.slack_notify import slack_notify
 from services.tsc.create_tsc_issue import create_tsc_issue
@@ -47,6 +53,7 @@ from utils.files.is_source_file import is_source_file
 from utils.files.read_local_file import read_local_file
 from utils.logging.logging_config import logger
 from utils.logs.detect_infra_failure import detect_infra_failure
+from utils.time.time_coroutine import time_coroutine
 
 # See https://docs.anthropic.com/en/docs/build-with-claude/tool-use#defining-tools
 # No parameters needed - agent calls with empty {} (JSON Schema requires the object structure)
@@ -201,16 +208,27 @@ async def verify_task_is_complete(
     non_removed_files = [f["filename"] for f in pr_files if f["status"] != "removed"]
     js_ts_files = filter_js_ts_files(non_removed_files)
 
+    format_start = time.perf_counter()
+    original_contents: dict[str, str] = {}
     for file_path in js_ts_files:
         content = read_local_file(file_path=file_path, base_dir=clone_dir)
         if not content:
             logger.info("Skipping %s: empty or unreadable", file_path)
             continue
+        original_contents[file_path] = content
 
-        prettier_result = await run_prettier_fix(
-            base_args=base_args,
-            file_path=file_path,
-            file_content=content,
+    # One Prettier process and one ESLint process for all changed files instead of an npx launch per file per tool. ESLint lints the Prettier output, as it did when the two ran file by file.
+    prettier_results = await run_prettier_fix_batch(
+        base_args=base_args, files=original_contents
+    )
+    formatted_contents = merge_prettier_output(original_contents, prettier_results)
+    eslint_results = await run_eslint_fix_batch(
+        base_args=base_args, files=formatted_contents
+    )
+
+    for file_path, content in original_contents.items():
+        prettier_result = prettier_results.get(
+            file_path, PrettierResult(success=True, content=None, error=None)
         )
         if prettier_result.content and prettier_result.content != content:
             logger.info("Prettier changed %s; committing", file_path)
@@ -220,19 +238,22 @@ async def verify_task_is_complete(
                 base_args=base_args,
                 commit_message=f"Format {file_path} with Prettier",
             )
-            content = prettier_result.content
             formatting_applied.append(f"- {file_path}: Prettier")
         if prettier_result.error:
             logger.warning("Prettier error on %s: %s", file_path, prettier_result.error)
             remaining_errors.append(f"- {file_path}: Prettier: {prettier_result.error}")
             error_files.add(file_path)
 
-        eslint_result = await run_eslint_fix(
-            base_args=base_args,
-            file_path=file_path,
-            file_content=content,
+        eslint_result = eslint_results.get(
+            file_path,
+            ESLintResult(
+                success=True, content=None, lint_errors=None, coverage_errors=None
+            ),
         )
-        if eslint_result.content and eslint_result.content != content:
+        if (
+            eslint_result.content
+            and eslint_result.content != formatted_contents[file_path]
+        ):
             logger.info("ESLint changed %s; committing", file_path)
             write_and_commit_file(
                 file_content=eslint_result.content,
@@ -249,11 +270,71 @@ async def verify_task_is_complete(
             remaining_errors.append(f"- {file_path}: ESLint: {'; '.join(eslint_all)}")
             error_files.add(file_path)
 
+    format_seconds = time.perf_counter() - format_start
+
     if formatting_applied:
         logger.info("Applied formatting to files:\n%s", "\n".join(formatting_applied))
 
-    # Run tsc type check on all non-removed files
-    tsc_result = await run_tsc_check(base_args=base_args, file_paths=non_removed_files)
+    # Set by new_pr_handler for schedule PRs so run_js_ts_test collects coverage using Istanbul instead of V8.
+    impl_file_to_collect_coverage_from = base_args.get(
+        "impl_file_to_collect_coverage_from", ""
+    )
+    php_test_files = [
+        f["filename"]
+        for f in pr_files
+        if run_phpunit
+        and f["filename"].endswith(PHP_TEST_FILE_EXTENSIONS)
+        and f["status"] != "removed"
+    ]
+    py_test_files = [
+        f["filename"]
+        for f in pr_files
+        if is_python_test_file(f["filename"]) and f["status"] != "removed"
+    ]
+
+    # tsc, jest/vitest, phpunit and pytest only read the tree that Prettier/ESLint finished writing above, so they run concurrently instead of back to back. Results are still processed in the original order so the error message is unchanged.
+    checks_start = time.perf_counter()
+    (
+        (tsc_result, tsc_seconds),
+        (jest_result, jest_seconds),
+        (phpunit_result, phpunit_seconds),
+        (pytest_result, pytest_seconds),
+    ) = await asyncio.gather(
+        # Run tsc type check on all non-removed files
+        time_coroutine(
+            "tsc",
+            run_tsc_check(base_args=base_args, file_paths=non_removed_files),
+        ),
+        # Always pass source files so jest --findRelatedTests can discover dependent tests
+        # (e.g., dead code removal from a source file may break tests not in the PR).
+        time_coroutine(
+            "jest",
+            run_js_ts_test(
+                base_args=base_args,
+                test_file_paths=js_test_files,
+                source_file_paths=[f for f in js_ts_files if is_source_file(f)],
+                impl_file_to_collect_coverage_from=impl_file_to_collect_coverage_from,
+            ),
+        ),
+        time_coroutine(
+            "phpunit",
+            run_phpunit_test(base_args=base_args, test_file_paths=php_test_files),
+        ),
+        time_coroutine(
+            "pytest",
+            run_pytest_test(base_args=base_args, test_file_paths=py_test_files),
+        ),
+    )
+    logger.info(
+        "verify_task_is_complete timings: prettier+eslint batch=%.2fs, tsc=%.2fs, jest=%.2fs, phpunit=%.2fs, pytest=%.2fs, concurrent checks wall=%.2fs",
+        format_seconds,
+        tsc_seconds,
+        jest_seconds,
+        phpunit_seconds,
+        pytest_seconds,
+        time.perf_counter() - checks_start,
+    )
+
     if tsc_result.errors:
         logger.info("tsc produced %d errors; classifying", len(tsc_result.errors))
         baseline = base_args.get("baseline_tsc_errors", set())
@@ -282,19 +363,6 @@ async def verify_task_is_complete(
             )
             create_tsc_issue(base_args=base_args, unrelated_errors=unrelated_tsc_errors)
 
-    # Set by new_pr_handler for schedule PRs so run_js_ts_test collects coverage using Istanbul instead of V8.
-    impl_file_to_collect_coverage_from = base_args.get(
-        "impl_file_to_collect_coverage_from", ""
-    )
-
-    # Always pass source files so jest --findRelatedTests can discover dependent tests
-    # (e.g., dead code removal from a source file may break tests not in the PR).
-    jest_result = await run_js_ts_test(
-        base_args=base_args,
-        test_file_paths=js_test_files,
-        source_file_paths=[f for f in js_ts_files if is_source_file(f)],
-        impl_file_to_collect_coverage_from=impl_file_to_collect_coverage_from,
-    )
     if jest_result.errors:
         logger.info(
             "Jest reported %d errors; checking infra failure", len(jest_result.errors)
@@ -351,33 +419,12 @@ async def verify_task_is_complete(
         )
         formatting_applied.append(f"- {snap_path}: Snapshot updated")
 
-    if run_phpunit:
-        logger.info("Running phpunit for PR PHP test files")
-        php_test_files = [
-            f["filename"]
-            for f in pr_files
-            if f["filename"].endswith(PHP_TEST_FILE_EXTENSIONS)
-            and f["status"] != "removed"
-        ]
-        phpunit_result = await run_phpunit_test(
-            base_args=base_args,
-            test_file_paths=php_test_files,
-        )
-        if phpunit_result.errors:
-            logger.warning("phpunit reported %d errors", len(phpunit_result.errors))
-            for err in phpunit_result.errors:
-                remaining_errors.append(f"- phpunit: {err}")
-            error_files.update(phpunit_result.error_files)
+    if phpunit_result.errors:
+        logger.warning("phpunit reported %d errors", len(phpunit_result.errors))
+        for err in phpunit_result.errors:
+            remaining_errors.append(f"- phpunit: {err}")
+        error_files.update(phpunit_result.error_files)
 
-    py_test_files = [
-        f["filename"]
-        for f in pr_files
-        if is_python_test_file(f["filename"]) and f["status"] != "removed"
-    ]
-    pytest_result = await run_pytest_test(
-        base_args=base_args,
-        test_file_paths=py_test_files,
-    )
     if pytest_result.errors:
         logger.warning("pytest reported %d errors", len(pytest_result.errors))
         for err in pytest_result.errors:
@@ -1,12 +1,16 @@
 from dataclasses import dataclass, field
 
 from constants.files import PHP_TEST_FILE_EXTENSIONS
-from services.eslint.run_eslint_fix import run_eslint_fix
+from services.eslint.run_eslint_fix_batch import ESLintResult, run_eslint_fix_batch
 from services.git.git_commit_and_push import git_commit_and_push
 from services.types.base_args import BaseArgs
 from services.jest.run_js_ts_test import run_js_ts_test
 from services.phpunit.run_phpunit_test import run_phpunit_test
-from services.prettier.run_prettier_fix import run_prettier_fix
+from services.prettier.merge_prettier_output import merge_prettier_output
+from services.prettier.run_prettier_fix_batch import (
+    PrettierResult,
+    run_prettier_fix_batch,
+)
 from services.pytest.run_pytest_test import run_pytest_test
 from services.tsc.run_tsc_check import run_tsc_check
 from utils.error.handle_exceptions import handle_exceptions
@@ -40,43 +44,60 @@ async def verify_task_is_ready(
 
     js_ts_files = filter_js_ts_files(file_paths)
     if not js_ts_files:
+        logger.info("verify_task_is_ready: no JS/TS files to check")
         return VerifyTaskIsReadyResult()
 
     errors: list[str] = []
     formatting_applied: list[str] = []
     files_with_errors: set[str] = set()
+    original_contents: dict[str, str] = {}
     for file_path in js_ts_files:
         content = read_local_file(file_path=file_path, base_dir=clone_dir)
         if not content:
+            logger.info("Skipping %s: empty or unreadable", file_path)
             continue
+        original_contents[file_path] = content
 
-        prettier_result = await run_prettier_fix(
-            base_args=base_args,
-            file_path=file_path,
-            file_content=content,
+    # One Prettier process and one ESLint process for all files; ESLint lints the Prettier output
+    prettier_results = await run_prettier_fix_batch(
+        base_args=base_args, files=original_contents
+    )
+    formatted_contents = merge_prettier_output(original_contents, prettier_results)
+    eslint_results = await run_eslint_fix_batch(
+        base_args=base_args, files=formatted_contents
+    )
+
+    for file_path, content in original_contents.items():
+        prettier_result = prettier_results.get(
+            file_path, PrettierResult(success=True, content=None, error=None)
         )
         if prettier_result.error:
-            errors.append(f"- {file_path}: Prettier: {prettier_result.error}")
-            files_with_errors.add(file_path)
             logger.warning(
                 "Prettier failed on %s: %s", file_path, prettier_result.error
             )
+            errors.append(f"- {file_path}: Prettier: {prettier_result.error}")
+            files_with_errors.add(file_path)
         elif prettier_result.content and prettier_result.content != content:
+            logger.info("Committing Prettier formatting of %s", file_path)
             git_commit_and_push(
                 base_args=base_args,
                 message=f"Format {file_path} with Prettier",
                 files=[file_path],
             )
-            content = prettier_result.content
             formatting_applied.append(f"- {file_path}: Prettier")
 
-        eslint_result = await run_eslint_fix(
-            base_args=base_args,
-            file_path=file_path,
-            file_content=content,
+        eslint_result = eslint_results.get(
+            file_path,
+            ESLintResult(
+                success=True, content=None, lint_errors=None, coverage_errors=None
+            ),
         )
         # Push partial fixes even if errors remain
-        if eslint_result.content and eslint_result.content != content:
+        if (
+            eslint_result.content
+            and eslint_result.content != formatted_contents[file_path]
+        ):
+            logger.info("Committing ESLint fixes to %s", file_path)
             git_commit_and_push(
                 base_args=base_args,
                 message=f"Lint {file_path} with ESLint",
@@ -86,13 +107,13 @@ async def verify_task_is_ready(
         # Report only coverage-relevant errors (dead code, unreachable code, parsing).
         # Style-only errors like no-explicit-any are irrelevant to coverage.
         if eslint_result.coverage_errors:
-            errors.append(f"- {file_path}: ESLint: {eslint_result.coverage_errors}")
-            files_with_errors.add(file_path)
             logger.warning(
                 "ESLint coverage-relevant errors on %s: %s",
                 file_path,
                 eslint_result.coverage_errors,
             )
+            errors.append(f"- {file_path}: ESLint: {eslint_result.coverage_errors}")
+            files_with_errors.add(file_path)
         if eslint_result.lint_errors:
             logger.info(
                 "ESLint style-only errors on %s (ignored): %s",
@@ -106,6 +127,7 @@ async def verify_task_is_ready(
     tsc_errors: list[str] = []
     tsc_result = await run_tsc_check(base_args=base_args, file_paths=file_paths)
     if tsc_result.errors:
+        logger.info("tsc reported %d errors", len(tsc_result.errors))
         tsc_errors = tsc_result.errors
         for err in tsc_result.errors:
             errors.append(f"- tsc: {err}")
@@ -119,17 +141,22 @@ async def verify_task_is_ready(
         impl_file_to_collect_coverage_from="",
     )
     if jest_result.errors:
+        logger.info(
+            "%s reported %d errors", jest_result.runner_name, len(jest_result.errors)
+        )
         for err in jest_result.errors:
             errors.append(f"- {jest_result.runner_name}: {err}")
         files_with_errors.update(jest_result.error_files)
 
     if run_phpunit:
+        logger.info("Running phpunit")
         php_test_files = [f for f in file_paths if f.endswith(PHP_TEST_FILE_EXTENSIONS)]
         phpunit_result = await run_phpunit_test(
             base_args=base_args,
             test_file_paths=php_test_files,
         )
         if phpunit_result.errors:
+            logger.info("phpunit reported %d errors", len(phpunit_result.errors))
             for err in phpunit_result.errors:
                 errors.append(f"- phpunit: {err}")
             files_with_errors.update(phpunit_result.error_files)
@@ -140,11 +167,13 @@ async def verify_task_is_ready(
         test_file_paths=py_test_files,
     )
     if pytest_result.errors:
+        logger.info("pytest reported %d errors", len(pytest_result.errors))
         for err in pytest_result.errors:
             errors.append(f"- pytest: {err}")
         files_with_errors.update(pytest_result.error_files)
 
     if errors:
+        logger.info("verify_task_is_ready: %d errors", len(errors))
         return VerifyTaskIsReadyResult(
             success=False,
             errors=errors,
@@ -153,6 +182,7 @@ async def verify_task_is_ready(
             tsc_errors=tsc_errors,
         )
 
+    logger.info("verify_task_is_ready: all checks passed")
     return VerifyTaskIsReadyResult(
         fixes_applied=formatting_applied, tsc_errors=tsc_errors
     )
@@ -1,8 +1,12 @@
-"""Clean up /tmp at the start of each Lambda invocation.
+"""Keep /tmp under budget at the start of each Lambda invocation.
 
 Lambda containers handle ONE request at a time. When a new request starts on a warm
-container, the previous request has already finished. So we can safely delete all
-PR folders from /tmp to prevent /tmp filling up (10GB limit).
+container, the previous request has already finished, so nothing in /tmp is in use.
+Clones are kept across invocations as a cache: git_clone_to_tmp updates an existing
+clone in place (fetch + checkout) instead of cloning again, and touch_clone_cache
+records when each clone was last used. Only when /tmp nears its budget (10GB limit)
+are the least-recently-used clones deleted. Reuse never crosses owners:
+git_clone_to_tmp calls evict_other_owner_clones before any customer code runs.
 
 Why at START, not END: If Lambda times out or crashes (OOM), cleanup at END won't run.
 Cleanup at START guarantees it runs regardless of how the previous invocation ended.
@@ -11,59 +15,108 @@ Cleanup at START guarantees it runs regardless of how the previous invocation en
 import os
 import shutil
 
+from constants.aws import (
+    CLONE_CACHE_HIGH_WATERMARK,
+    CLONE_CACHE_LOW_WATERMARK,
+    CLONE_CACHE_MANIFEST_PATH,
+    TMP_DIR,
+    TMP_SYSTEM_DIRS,
+)
+from services.aws.load_clone_cache_manifest import load_clone_cache_manifest
+from services.aws.save_clone_cache_manifest import save_clone_cache_manifest
 from utils.logging.logging_config import logger
 
-TMP_DIR = "/tmp"
-
 
 def cleanup_tmp():
-    """Delete all owner/repo folders from /tmp.
+    """Evict least-recently-used clones from /tmp once it is above CLONE_CACHE_HIGH_WATERMARK, down to CLONE_CACHE_LOW_WATERMARK.
 
-    Safe to call at invocation start because Lambda containers handle one request
-    at a time - any previous request has already finished.
+    The common case is a single statvfs call: no directory walk on the startup path.
+    Owner folders that no manifest entry lives under (left by a crash before touch_clone_cache ran, or by older code) are evicted before any tracked clone.
     """
     # Only run on Lambda - local /tmp is shared by all processes
     # AWS_LAMBDA_FUNCTION_NAME is automatically set by AWS Lambda runtime
     if not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        logger.debug("cleanup_tmp: not on Lambda, skipping")
         return
 
     if not os.path.exists(TMP_DIR):
+        logger.debug("cleanup_tmp: %s does not exist", TMP_DIR)
         return
 
-    deleted_count = 0
-    deleted_bytes = 0
+    usage = shutil.disk_usage(TMP_DIR)
+    used = usage.used
+    if used < usage.total * CLONE_CACHE_HIGH_WATERMARK:
+        logger.info(
+            "Clone cache: /tmp %.0f%% full, keeping cached clones",
+            100 * used / usage.total,
+        )
+        return
 
-    # /tmp/{owner}/{repo}/pr-{number} structure
-    # We delete at the owner level to clean everything
+    manifest = load_clone_cache_manifest(CLONE_CACHE_MANIFEST_PATH)
+
+    # /tmp/{owner}/{repo}[/pr-{number}] structure
+    untracked: list[str] = []
     for item in os.listdir(TMP_DIR):
         item_path = os.path.join(TMP_DIR, item)
 
         # Skip non-directories and system files
         if not os.path.isdir(item_path):
+            logger.debug("Clone cache: skipping non-directory %s", item_path)
             continue
 
         # Skip common system/tool directories that shouldn't be deleted
-        if item.startswith(".") or item in ("pip", "npm", "yarn", "cache"):
+        if item.startswith(".") or item in TMP_SYSTEM_DIRS:
+            logger.debug("Clone cache: skipping system directory %s", item_path)
             continue
 
-        # This is likely an owner directory (e.g., /tmp/Foxquilt)
-        # Calculate size before deleting
+        if not any(clone_dir.startswith(item_path + os.sep) for clone_dir in manifest):
+            logger.info("Clone cache: %s is untracked, evicting first", item_path)
+            untracked.append(item_path)
+
+    lru_clones = sorted(
+        manifest, key=lambda clone_dir: manifest[clone_dir]["last_used"]
+    )
+
+    deleted_count = 0
+    deleted_bytes = 0
+    for path in untracked + lru_clones:
+        if used <= usage.total * CLONE_CACHE_LOW_WATERMARK:
+            logger.info("Clone cache: /tmp back under low watermark")
+            break
+
         try:
-            for dirpath, _, filenames in os.walk(item_path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        deleted_bytes += os.path.getsize(filepath)
-                    except OSError:
-                        pass
-
-            shutil.rmtree(item_path)
-            deleted_count += 1
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            # Already gone with an evicted parent clone (e.g. /tmp/o/r/pr-1 inside /tmp/o/r)
+            logger.debug("Clone cache: %s already removed", path)
         except OSError as e:
-            logger.warning("Failed to delete %s: %s", item_path, e)
+            logger.warning("Failed to delete %s: %s", path, e)
+            continue
 
-    if deleted_count > 0:
-        deleted_mb = deleted_bytes / (1024 * 1024)
-        logger.info(
-            "Cleaned /tmp: deleted %d folders (%.1f MB)", deleted_count, deleted_mb
-        )
+        # Drop the clone and anything nested under it from the manifest, then any owner folder it leaves empty
+        for clone_dir in list(manifest):
+            if clone_dir == path or clone_dir.startswith(path + os.sep):
+                logger.debug("Clone cache: forgetting %s", clone_dir)
+                del manifest[clone_dir]
+        parent = os.path.dirname(path)
+        while (
+            parent.startswith(TMP_DIR + os.sep)
+            and os.path.isdir(parent)
+            and not os.listdir(parent)
+        ):
+            logger.debug("Clone cache: removing empty %s", parent)
+            os.rmdir(parent)
+            parent = os.path.dirname(parent)
+
+        new_used = shutil.disk_usage(TMP_DIR).used
+        deleted_bytes += max(used - new_used, 0)
+        used = new_used
+        deleted_count += 1
+
+    save_clone_cache_manifest(CLONE_CACHE_MANIFEST_PATH, manifest)
+    logger.info(
+        "Cleaned /tmp: evicted %d folders (%.1f MB), %d cached clones kept",
+        deleted_count,
+        deleted_bytes / (1024 * 1024),
+        len(manifest),
+    )
@@ -0,0 +1,62 @@
+import os
+import shutil
+
+from constants.aws import CLONE_CACHE_MANIFEST_PATH, TMP_DIR, TMP_SYSTEM_DIRS
+from services.aws.load_clone_cache_manifest import load_clone_cache_manifest
+from services.aws.save_clone_cache_manifest import save_clone_cache_manifest
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(raise_on_error=True)
+def evict_other_owner_clones(clone_dir: str):
+    """Delete every /tmp/{owner} folder except clone_dir's owner, so cached clones (and whatever a previous customer's tests, npm scripts or build left in them) are only ever reused by the same owner.
+
+    Raises on failure so git_clone_to_tmp stops before updating or creating the clone.
+    """
+    # Same guard as cleanup_tmp: only Lambda keeps clones across invocations, local /tmp is shared by all processes
+    if not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        logger.debug("evict_other_owner_clones: not on Lambda, skipping")
+        return
+
+    relative = os.path.relpath(clone_dir, TMP_DIR)
+    if relative.startswith(".."):
+        logger.info("evict_other_owner_clones: %s is not under %s", clone_dir, TMP_DIR)
+        return
+    owner_dir = os.path.join(TMP_DIR, relative.split(os.sep)[0])
+
+    for item in os.listdir(TMP_DIR):
+        item_path = os.path.join(TMP_DIR, item)
+        if item_path == owner_dir:
+            logger.debug("evict_other_owner_clones: keeping %s", item_path)
+            continue
+
+        if os.path.islink(item_path):
+            logger.info("evict_other_owner_clones: removing symlink %s", item_path)
+            os.remove(item_path)
+            continue
+
+        # Same rule as cleanup_tmp: files and tool caches stay, every owner folder goes
+        if not os.path.isdir(item_path) or item.startswith("."):
+            logger.debug("evict_other_owner_clones: skipping %s", item_path)
+            continue
+        if item in TMP_SYSTEM_DIRS:
+            logger.debug("evict_other_owner_clones: skipping tool cache %s", item_path)
+            continue
+
+        logger.info("evict_other_owner_clones: deleting %s", item_path)
+        shutil.rmtree(item_path)
+
+    manifest = load_clone_cache_manifest(CLONE_CACHE_MANIFEST_PATH)
+    kept = {
+        path: entry
+        for path, entry in manifest.items()
+        if path.startswith(owner_dir + os.sep)
+    }
+    if len(kept) != len(manifest):
+        logger.info(
+            "evict_other_owner_clones: forgetting %d clone(s)",
+            len(manifest) - len(kept),
+        )
+        save_clone_cache_manifest(CLONE_CACHE_MANIFEST_PATH, kept)
+    logger.info("evict_other_owner_clones: only %s left in %s", owner_dir, TMP_DIR)
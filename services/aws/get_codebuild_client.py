@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import boto3
+
+from constants.aws import AWS_REGION
+from utils.logging.logging_config import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_codebuild import CodeBuildClient
+
+
+@cache
+def get_codebuild_client() -> CodeBuildClient:
+    """CodeBuild client, created the first time a dependency install is sent to CodeBuild."""
+    logger.info("get_codebuild_client: creating codebuild client in %s", AWS_REGION)
+    return boto3.client("codebuild", region_name=AWS_REGION)
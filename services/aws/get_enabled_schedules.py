@@ -1,5 +1,6 @@
-from services.aws.clients import scheduler_client
+from services.aws.get_scheduler_client import get_scheduler_client
 from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
 
 
 @handle_exceptions(default_return_value=set(), raise_on_error=False)
@@ -10,19 +11,24 @@ def get_enabled_schedules():
 
     while True:
         if next_token:
-            response = scheduler_client.list_schedules(NextToken=next_token)
+            logger.info("get_enabled_schedules: fetching next page")
+            response = get_scheduler_client().list_schedules(NextToken=next_token)
         else:
-            response = scheduler_client.list_schedules()
+            logger.info("get_enabled_schedules: fetching first page")
+            response = get_scheduler_client().list_schedules()
 
         for schedule in response.get("Schedules", []):
             state = schedule.get("State", "")
             name = schedule.get("Name", "")
             if state == "ENABLED" and name.startswith("gitauto-repo-"):
+                logger.debug("get_enabled_schedules: %s is enabled", name)
                 parts = name.replace("gitauto-repo-", "").split("-")
                 repo_keys.add((int(parts[0]), int(parts[1])))
 
         next_token = response.get("NextToken")
         if not next_token:
+            logger.info("get_enabled_schedules: no more pages")
             break
 
+    logger.info("get_enabled_schedules: found %d schedules", len(repo_keys))
     return repo_keys
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import boto3
+
+from constants.aws import AWS_REGION
+from utils.logging.logging_config import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_lambda import LambdaClient
+
+
+@cache
+def get_lambda_client() -> LambdaClient:
+    """Lambda client for fanning out per-repo invocations, created on first use."""
+    logger.info("get_lambda_client: creating lambda client in %s", AWS_REGION)
+    return boto3.client("lambda", region_name=AWS_REGION)
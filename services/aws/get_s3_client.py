@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import boto3
+
+from constants.aws import AWS_REGION
+from utils.logging.logging_config import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3 import S3Client
+
+
+@cache
+def get_s3_client() -> S3Client:
+    """S3 client for the dependency tarball bucket and the fetch cache, created on first use so invocations that never touch S3 skip it."""
+    logger.info("get_s3_client: creating s3 client in %s", AWS_REGION)
+    return boto3.client("s3", region_name=AWS_REGION)
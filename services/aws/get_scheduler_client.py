@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import boto3
+
+from constants.aws import AWS_REGION
+from utils.logging.logging_config import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_scheduler import EventBridgeSchedulerClient
+
+
+@cache
+def get_scheduler_client() -> EventBridgeSchedulerClient:
+    """EventBridge Scheduler client, created on first use; only the schedule management paths need it."""
+    logger.info("get_scheduler_client: creating scheduler client in %s", AWS_REGION)
+    return boto3.client("scheduler", region_name=AWS_REGION)
@@ -1,6 +1,7 @@
 # Local imports
-from services.aws.clients import scheduler_client
+from services.aws.get_scheduler_client import get_scheduler_client
 from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
 
 
 @handle_exceptions(default_return_value=[], raise_on_error=False)
@@ -10,18 +11,23 @@ def get_schedulers_by_owner_id(owner_id: int):
 
     while True:
         if next_token:
-            response = scheduler_client.list_schedules(NextToken=next_token)
+            logger.info("get_schedulers_by_owner_id: fetching next page")
+            response = get_scheduler_client().list_schedules(NextToken=next_token)
         else:
-            response = scheduler_client.list_schedules()
+            logger.info("get_schedulers_by_owner_id: fetching first page")
+            response = get_scheduler_client().list_schedules()
 
         for schedule in response.get("Schedules", []):
             schedule_name = schedule.get("Name", "")
             # Match pattern: gitauto-repo-{ownerId}-{repoId} or gitauto-repo-{ownerId}-{repoId}-{index}
             if schedule_name.startswith(f"gitauto-repo-{owner_id}-"):
+                logger.debug("get_schedulers_by_owner_id: matched %s", schedule_name)
                 schedules.append(schedule_name)
 
         next_token = response.get("NextToken")
         if not next_token:
+            logger.info("get_schedulers_by_owner_id: no more pages")
             break
 
+    logger.info("get_schedulers_by_owner_id: found %d schedules", len(schedules))
     return schedules
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import boto3
+
+from constants.aws import AWS_REGION
+from utils.logging.logging_config import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_ssm import SSMClient
+
+
+@cache
+def get_ssm_client() -> SSMClient:
+    """SSM client, created on first use; in prod get_internal_env_var_names is its only caller and is itself cached."""
+    logger.info("get_ssm_client: creating ssm client in %s", AWS_REGION)
+    return boto3.client("ssm", region_name=AWS_REGION)
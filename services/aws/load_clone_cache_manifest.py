@@ -0,0 +1,39 @@
+import json
+import os
+from typing import TypedDict
+
+from constants.aws import TMP_DIR
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+class CloneCacheEntry(TypedDict):
+    last_used: float
+    size_bytes: int
+
+
+@handle_exceptions(default_return_value={}, raise_on_error=False)
+def load_clone_cache_manifest(manifest_path: str):
+    """Return {clone_dir: CloneCacheEntry}. A missing or corrupt manifest (e.g. Lambda killed mid-write on an older runtime) is treated as empty: the clones it described become untracked and are evicted first."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest: dict[str, CloneCacheEntry] = json.load(f)
+    except FileNotFoundError:
+        logger.info("load_clone_cache_manifest: no manifest at %s", manifest_path)
+        return {}
+    except json.JSONDecodeError:
+        logger.warning(
+            "load_clone_cache_manifest: corrupt manifest at %s", manifest_path
+        )
+        return {}
+
+    # The manifest sits in /tmp next to customer code; never let an entry point cleanup_tmp's rmtree outside it
+    clones = {
+        path: entry
+        for path, entry in manifest.items()
+        if path.startswith(TMP_DIR + os.sep) and os.path.normpath(path) == path
+    }
+    logger.info(
+        "load_clone_cache_manifest: %d clone(s) in %s", len(clones), manifest_path
+    )
+    return clones
@@ -1,13 +1,16 @@
-from mypy_boto3_codebuild.type_defs import EnvironmentVariableTypeDef
+from typing import TYPE_CHECKING
 
 from constants.aws import S3_DEPENDENCY_BUCKET
 from constants.general import IS_PRD
 from constants.node import FALLBACK_NODE_VERSION
-from services.aws.clients import codebuild_client
+from services.aws.get_codebuild_client import get_codebuild_client
 from services.supabase.npm_tokens.get_npm_token import get_npm_token
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_codebuild.type_defs import EnvironmentVariableTypeDef
+
 
 @handle_exceptions(default_return_value=None, raise_on_error=False)
 def run_install_via_codebuild(
@@ -35,7 +38,7 @@ def run_install_via_codebuild(
         logger.info("codebuild: NPM_TOKEN added for owner_id %s", owner_id)
 
     # https://docs.aws.amazon.com/codebuild/latest/APIReference/API_StartBuild.html
-    response = codebuild_client.start_build(
+    response = get_codebuild_client().start_build(
         projectName="gitauto-package-install",
         environmentVariablesOverride=env_overrides,
     )
@@ -1,10 +1,12 @@
-from botocore.exceptions import ClientError
-
 from config import UTF8
-from constants.aws import S3_DEPENDENCY_BUCKET
+from constants.aws import DEPENDENCY_CAS_SHARED_SCOPE, S3_DEPENDENCY_BUCKET
 from constants.node import FALLBACK_NODE_VERSION
-from services.aws.clients import s3_client
 from services.aws.run_install_via_codebuild import run_install_via_codebuild
+from services.aws.s3.get_dep_cas_key import get_dep_cas_key
+from services.aws.s3.get_dep_store_client import get_dep_store_client
+from services.aws.s3.head_dep_object import head_dep_object
+from services.aws.s3.read_dep_pointer import read_dep_pointer
+from services.aws.s3.write_dep_pointer import write_dep_pointer
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -20,51 +22,67 @@ def check_s3_dep_freshness_and_trigger_install(
     manifest_files: dict[str, str],  # filename -> content, uploaded to S3 for CodeBuild
     log_prefix: str,  # e.g. "node" or "php"
     node_version: str = FALLBACK_NODE_VERSION,
+    cas_scope: str = DEPENDENCY_CAS_SHARED_SCOPE,
 ):
-    """Check S3 tarball freshness and trigger CodeBuild if stale. Returns True if fresh."""
-    # Check S3 tarball freshness via HeadObject metadata
-    s3_key = f"{owner_name}/{repo_name}/{tarball_name}"
-    try:
-        head = s3_client.head_object(Bucket=S3_DEPENDENCY_BUCKET, Key=s3_key)
-        s3_hash = head.get("Metadata", {}).get("manifest-hash")
-        if s3_hash == manifest_hash:
-            logger.info(
-                "%s: S3 tarball is fresh (hash=%s), reusing", log_prefix, manifest_hash
-            )
-            return True
+    """Check for a tarball built from these manifests and trigger CodeBuild if there is none. Returns True if fresh.
+
+    Tarballs are content-addressed by manifest hash (see get_dep_cas_key), so a fork, a monorepo sibling or any repo with identical manifests reuses one build. A fresh tarball is recorded in the repo's pointer, which download_and_extract_s3_deps follows; run this before extracting so a stale archive is never the one unpacked when a fresh one exists.
+    """
+    cas_key = get_dep_cas_key(manifest_hash, tarball_name, cas_scope)
+    pointer = {"key": cas_key, "manifest_hash": manifest_hash}
+    fresh = head_dep_object(cas_key) is not None
+
+    # Repos cached before tarballs were content-addressed keep theirs at {owner}/{repo}/{tarball_name} with the hash in metadata; adopt a matching one instead of reinstalling
+    legacy_key = f"{owner_name}/{repo_name}/{tarball_name}"
+    legacy = None if fresh else head_dep_object(legacy_key)
+    if legacy and legacy.get("Metadata", {}).get("manifest-hash") == manifest_hash:
+        logger.info(
+            "%s: Adopting legacy tarball %s as %s", log_prefix, legacy_key, cas_key
+        )
+        get_dep_store_client().copy_object(
+            Bucket=S3_DEPENDENCY_BUCKET,
+            Key=cas_key,
+            CopySource={"Bucket": S3_DEPENDENCY_BUCKET, "Key": legacy_key},
+        )
+        fresh = True
 
+    if fresh:
         logger.info(
-            "%s: S3 tarball stale (s3=%s, local=%s), triggering install",
+            "%s: Tarball is fresh (hash=%s), reusing %s",
             log_prefix,
-            s3_hash,
             manifest_hash,
+            cas_key,
         )
+        if read_dep_pointer(owner_name, repo_name, tarball_name) != pointer:
+            logger.info(
+                "%s: Pointing %s/%s at %s", log_prefix, owner_name, repo_name, cas_key
+            )
+            write_dep_pointer(
+                owner_name, repo_name, tarball_name, cas_key, manifest_hash
+            )
+        return True
 
-    except ClientError as e:
-        error_info = e.response.get("Error")
-        error_code = error_info.get("Code") if error_info else None
-        if error_code in ("404", "NoSuchKey"):
-            logger.info("%s: No S3 tarball found, triggering install", log_prefix)
-        else:
-            raise
+    logger.info(
+        "%s: No tarball for hash=%s, triggering install", log_prefix, manifest_hash
+    )
 
     # Upload manifest files to S3 so CodeBuild can read them
     s3_prefix = f"{owner_name}/{repo_name}/manifests"
     for filename, content in manifest_files.items():
-        s3_client.put_object(
+        get_dep_store_client().put_object(
             Bucket=S3_DEPENDENCY_BUCKET,
             Key=f"{s3_prefix}/{filename}",
             Body=content.encode(UTF8),
         )
         logger.info("%s: Uploaded %s to S3", log_prefix, filename)
 
-    # Write manifest hash to S3 for CodeBuild to use as tarball metadata
-    s3_client.put_object(
+    # CodeBuild uploads the tarball to this key and then writes the repo's pointer to it. One file per tarball, since node, php and python installs share the manifests prefix.
+    get_dep_store_client().put_object(
         Bucket=S3_DEPENDENCY_BUCKET,
-        Key=f"{s3_prefix}/.manifest-hash",
-        Body=manifest_hash.encode(UTF8),
+        Key=f"{s3_prefix}/.cas-key.{tarball_name}",
+        Body=cas_key.encode(UTF8),
     )
-    logger.info("%s: Uploaded manifest hash to S3", log_prefix)
+    logger.info("%s: Uploaded tarball key %s to S3", log_prefix, cas_key)
 
     # Trigger CodeBuild install (fire and forget, bypasses Lambda 15-min timeout)
     s3_key_prefix = f"{owner_name}/{repo_name}"
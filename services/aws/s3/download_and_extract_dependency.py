@@ -1,10 +1,8 @@
 import os
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
-from botocore.exceptions import ClientError
-
-from constants.aws import S3_DEPENDENCY_BUCKET
-from services.aws.clients import s3_client
+from services.aws.s3.read_dep_pointer import read_dep_pointer
+from services.aws.s3.stream_extract_s3_tarball import stream_extract_s3_tarball
 from utils.error.handle_exceptions import handle_exceptions
 from utils.files.is_dependency_file import SUPPORTED_DEPENDENCY_DIRS
 from utils.logging.logging_config import logger
@@ -17,7 +15,11 @@ def download_and_extract_s3_deps(
     repo_name: str,
     clone_dir: str,
 ):
-    """Download cached dependency tarballs from S3 and extract to clone_dir."""
+    """Stream cached dependency tarballs from S3 into clone_dir, all dependency dirs in parallel.
+
+    Package tarballs are content-addressed, so each dir is found through the repo's pointer ({owner}/{repo}/{dep_dir}.tar.gz.json), which check_s3_dep_freshness_and_trigger_install moves to the fresh build; call this after the ensure_* checks. mongodb-binaries is not keyed by manifests and stays at {owner}/{repo}/mongodb-binaries.tar.gz.
+    """
+    to_restore: list[str] = []
     for dep_dir in SUPPORTED_DEPENDENCY_DIRS:
         target_path = os.path.join(clone_dir, dep_dir)
         if os.path.exists(target_path):
@@ -25,37 +27,48 @@ def download_and_extract_s3_deps(
                 "S3 extract skip: %s already exists at %s", dep_dir, target_path
             )
             continue
+        logger.debug("S3 extract: queueing %s", dep_dir)
+        to_restore.append(dep_dir)
 
-        s3_key = f"{owner_name}/{repo_name}/{dep_dir}.tar.gz"
-        local_tarball = os.path.join(clone_dir, f"{dep_dir}.tar.gz")
+    if not to_restore:
+        logger.info("S3 extract: all dependency dirs already present")
+        return
 
-        # 404 is expected (e.g. Node repo has no vendor.tar.gz), skip and continue loop
-        try:
-            s3_client.download_file(
-                Bucket=S3_DEPENDENCY_BUCKET,
-                Key=s3_key,
-                Filename=local_tarball,
+    # One thread per archive: each spends its time in network reads and the tar child process, not in the GIL
+    with ThreadPoolExecutor(max_workers=len(to_restore)) as executor:
+        pointers = dict(
+            zip(
+                to_restore,
+                executor.map(
+                    lambda dep_dir: (
+                        {"key": f"{owner_name}/{repo_name}/{dep_dir}.tar.gz"}
+                        if dep_dir == "mongodb-binaries"
+                        else read_dep_pointer(
+                            owner_name, repo_name, f"{dep_dir}.tar.gz"
+                        )
+                    ),
+                    to_restore,
+                ),
             )
-        except ClientError as e:
-            error_info = e.response.get("Error")
-            error_code = error_info.get("Code") if error_info else None
-            if error_code in ("404", "NoSuchKey"):
-                logger.info(
-                    "S3 extract skip: no tarball at s3://%s/%s",
-                    S3_DEPENDENCY_BUCKET,
-                    s3_key,
-                )
+        )
+        futures = {}
+        for dep_dir, pointer in pointers.items():
+            if pointer is None:
+                logger.info("S3 extract skip: no %s tarball for this repo", dep_dir)
                 continue
-            raise
+            logger.debug("S3 extract: %s -> %s", dep_dir, pointer["key"])
+            futures[dep_dir] = executor.submit(
+                stream_extract_s3_tarball,
+                s3_key=pointer["key"],
+                clone_dir=clone_dir,
+                target_path=os.path.join(clone_dir, dep_dir),
+            )
+        # .result() re-raises the first failure, same as the old sequential loop
+        streamed = {dep_dir: future.result() for dep_dir, future in futures.items()}
 
-        logger.info("Extracting %s from S3 tarball...", dep_dir)
-        subprocess.run(
-            # x=extract, z=gzip, f=file, C=target dir
-            ["tar", "-xzf", local_tarball, "-C", clone_dir],
-            check=True,
-            capture_output=True,
-        )
-        os.remove(local_tarball)
-        logger.info(
-            "Extracted: s3://%s/%s -> %s", S3_DEPENDENCY_BUCKET, s3_key, target_path
-        )
+    restored = [dep_dir for dep_dir, size in streamed.items() if size is not None]
+    logger.info(
+        "S3 extract: restored %s (%.1f MB streamed)",
+        restored,
+        sum(size or 0 for size in streamed.values()) / (1024 * 1024),
+    )
@@ -0,0 +1,13 @@
+from constants.aws import DEPENDENCY_CAS_S3_PREFIX, DEPENDENCY_CAS_SHARED_SCOPE
+from utils.logging.logging_config import logger
+
+
+def get_dep_cas_key(
+    manifest_hash: str,
+    tarball_name: str,  # e.g. "node_modules.tar.gz"
+    scope: str = DEPENDENCY_CAS_SHARED_SCOPE,  # "shared", or the owner id for installs that used the owner's registry token
+):
+    """Content-addressed key of the dependency tarball built from manifests hashing to manifest_hash."""
+    key = f"{DEPENDENCY_CAS_S3_PREFIX}{scope}/{manifest_hash}/{tarball_name}"
+    logger.info("get_dep_cas_key: %s", key)
+    return key
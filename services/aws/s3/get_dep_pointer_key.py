@@ -0,0 +1,8 @@
+from utils.logging.logging_config import logger
+
+
+def get_dep_pointer_key(owner_name: str, repo_name: str, tarball_name: str):
+    """Key of the small JSON object naming which content-addressed tarball a repo's dependency dir is restored from."""
+    key = f"{owner_name}/{repo_name}/{tarball_name}.json"
+    logger.info("get_dep_pointer_key: %s", key)
+    return key
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from constants.aws import DEPENDENCY_STORE_DIR
+from services.aws.get_s3_client import get_s3_client
+from services.aws.s3.local_object_store import LocalObjectStore
+from utils.logging.logging_config import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3 import S3Client
+
+
+@cache
+def get_dep_store_client() -> S3Client | LocalObjectStore:
+    """Client for the dependency cache bucket: S3, or a LocalObjectStore under DEPENDENCY_STORE_DIR when that is set."""
+    if DEPENDENCY_STORE_DIR:
+        logger.info("get_dep_store_client: using local store %s", DEPENDENCY_STORE_DIR)
+        return LocalObjectStore(root=DEPENDENCY_STORE_DIR)
+
+    logger.info("get_dep_store_client: using s3")
+    return get_s3_client()
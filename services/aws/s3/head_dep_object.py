@@ -0,0 +1,24 @@
+from botocore.exceptions import ClientError
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.get_dep_store_client import get_dep_store_client
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(raise_on_error=True)
+def head_dep_object(key: str):
+    """HeadObject on the dependency cache bucket: the response (ContentLength, Metadata, ...) or None when the object does not exist. Other S3 errors raise."""
+    try:
+        head = get_dep_store_client().head_object(Bucket=S3_DEPENDENCY_BUCKET, Key=key)
+    except ClientError as e:
+        error_info = e.response.get("Error")
+        error_code = error_info.get("Code") if error_info else None
+        if error_code in ("404", "NoSuchKey"):
+            logger.info("head_dep_object: no object at %s", key)
+            return None
+        logger.error("head_dep_object: head_object failed with %s", error_code)
+        raise
+
+    logger.info("head_dep_object: found %s", key)
+    return head
@@ -0,0 +1,127 @@
+# pylint: disable=invalid-name
+import json
+import os
+import shutil
+from dataclasses import dataclass
+
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+
+from config import UTF8
+from utils.logging.logging_config import logger
+
+
+@dataclass
+class LocalObjectStore:
+    """Directory-backed stand-in for the S3 client calls the dependency cache makes (head/get/put/copy/delete/list), with the same keyword arguments, return shapes and 404 ClientErrors.
+
+    Objects live at {root}/{Bucket}/{Key}; user metadata sits beside them in {root}/.metadata/{Bucket}/{Key}.json.
+    """
+
+    root: str
+
+    def head_object(self, *, Bucket: str, Key: str):
+        path = os.path.join(self.root, Bucket, Key)
+        if not os.path.isfile(path):
+            logger.info("LocalObjectStore: no object at %s/%s", Bucket, Key)
+            raise ClientError(
+                {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+            )
+
+        metadata: dict[str, str] = {}
+        metadata_path = os.path.join(self.root, ".metadata", Bucket, f"{Key}.json")
+        if os.path.isfile(metadata_path):
+            logger.debug("LocalObjectStore: reading metadata for %s/%s", Bucket, Key)
+            with open(metadata_path, encoding=UTF8) as f:
+                metadata = json.load(f)
+        logger.debug("LocalObjectStore: head %s/%s", Bucket, Key)
+        return {"ContentLength": os.path.getsize(path), "Metadata": metadata}
+
+    def get_object(self, *, Bucket: str, Key: str):
+        path = os.path.join(self.root, Bucket, Key)
+        if not os.path.isfile(path):
+            logger.info("LocalObjectStore: no object at %s/%s", Bucket, Key)
+            raise ClientError(
+                {"Error": {"Code": "NoSuchKey", "Message": "Not Found"}}, "GetObject"
+            )
+
+        head = self.head_object(Bucket=Bucket, Key=Key)
+        logger.debug("LocalObjectStore: get %s/%s", Bucket, Key)
+        # The caller reads or iterates Body to the end, which closes the file as a real S3 body would
+        return {
+            **head,
+            "Body": StreamingBody(
+                open(path, "rb"),  # pylint: disable=consider-using-with
+                head["ContentLength"],
+            ),
+        }
+
+    def put_object(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        Body: bytes,
+        Metadata: dict[str, str] | None = None,
+        **_kwargs,
+    ):
+        path = os.path.join(self.root, Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(Body)
+
+        metadata_path = os.path.join(self.root, ".metadata", Bucket, f"{Key}.json")
+        os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
+        with open(metadata_path, "w", encoding=UTF8) as f:
+            json.dump(Metadata or {}, f)
+        logger.debug("LocalObjectStore: put %s/%s", Bucket, Key)
+        return {}
+
+    def copy_object(
+        self, *, Bucket: str, Key: str, CopySource: dict[str, str], **_kwargs
+    ):
+        """Server-side copy; metadata travels with the object, as with S3's default MetadataDirective=COPY."""
+        source = os.path.join(self.root, CopySource["Bucket"], CopySource["Key"])
+        if not os.path.isfile(source):
+            logger.info("LocalObjectStore: no copy source %s", CopySource)
+            raise ClientError(
+                {"Error": {"Code": "NoSuchKey", "Message": "Not Found"}}, "CopyObject"
+            )
+
+        metadata = self.head_object(**CopySource)["Metadata"]
+        target = os.path.join(self.root, Bucket, Key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(source, target)
+        metadata_path = os.path.join(self.root, ".metadata", Bucket, f"{Key}.json")
+        os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
+        with open(metadata_path, "w", encoding=UTF8) as f:
+            json.dump(metadata, f)
+        logger.debug("LocalObjectStore: copied %s to %s/%s", CopySource, Bucket, Key)
+        return {}
+
+    def delete_object(self, *, Bucket: str, Key: str):
+        for path in (
+            os.path.join(self.root, Bucket, Key),
+            os.path.join(self.root, ".metadata", Bucket, f"{Key}.json"),
+        ):
+            if os.path.isfile(path):
+                logger.debug("LocalObjectStore: removing %s", path)
+                os.remove(path)
+        logger.debug("LocalObjectStore: deleted %s/%s", Bucket, Key)
+        return {}
+
+    def list_objects_v2(self, *, Bucket: str, Prefix: str = ""):
+        bucket_dir = os.path.join(self.root, Bucket)
+        keys: list[str] = []
+        for dirpath, _dirnames, filenames in os.walk(bucket_dir):
+            rel_dir = os.path.relpath(dirpath, bucket_dir)
+            keys.extend(
+                name if rel_dir == "." else f"{rel_dir}/{name}" for name in filenames
+            )
+        contents = [
+            {"Key": key, "Size": os.path.getsize(os.path.join(self.root, Bucket, key))}
+            for key in sorted(keys)
+            if key.startswith(Prefix)
+        ]
+        logger.debug("LocalObjectStore: %d objects under %s", len(contents), Prefix)
+        return {"Contents": contents, "KeyCount": len(contents)}
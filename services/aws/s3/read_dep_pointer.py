@@ -0,0 +1,33 @@
+import json
+
+from botocore.exceptions import ClientError
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.get_dep_pointer_key import get_dep_pointer_key
+from services.aws.s3.get_dep_store_client import get_dep_store_client
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def read_dep_pointer(
+    owner_name: str, repo_name: str, tarball_name: str
+) -> dict[str, str] | None:
+    """Return the repo's pointer ({"key": <tarball key>, "manifest_hash": ...}), or None when the repo has none yet."""
+    pointer_key = get_dep_pointer_key(owner_name, repo_name, tarball_name)
+    try:
+        response = get_dep_store_client().get_object(
+            Bucket=S3_DEPENDENCY_BUCKET, Key=pointer_key
+        )
+    except ClientError as e:
+        error_info = e.response.get("Error")
+        error_code = error_info.get("Code") if error_info else None
+        if error_code in ("404", "NoSuchKey"):
+            logger.info("read_dep_pointer: no pointer at %s", pointer_key)
+            return None
+        logger.error("read_dep_pointer: get_object failed with %s", error_code)
+        raise
+
+    pointer = json.loads(response["Body"].read())
+    logger.info("read_dep_pointer: %s -> %s", pointer_key, pointer.get("key"))
+    return pointer
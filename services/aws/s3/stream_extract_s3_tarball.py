@@ -0,0 +1,101 @@
+import shutil
+import subprocess
+import tempfile
+import time
+
+from botocore.exceptions import ClientError
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.get_dep_store_client import get_dep_store_client
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+# 1 MiB reads keep the tar pipe busy without holding a large body in memory
+S3_STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+@handle_exceptions(raise_on_error=True)
+def stream_extract_s3_tarball(*, s3_key: str, clone_dir: str, target_path: str):
+    """Pipe s3://S3_DEPENDENCY_BUCKET/{s3_key} into `tar -x -C clone_dir` while it downloads and return the compressed bytes streamed, or None when the object does not exist.
+
+    Nothing is written to disk but the extracted files, and the network read overlaps decompression. pigz is used for decompression when installed (separate read, inflate and checksum threads), gzip otherwise. A failed extract removes the partial target_path so the caller falls back to a fresh install instead of using half a node_modules.
+    """
+    # 404 is expected (e.g. Node repo has no vendor.tar.gz)
+    try:
+        response = get_dep_store_client().get_object(
+            Bucket=S3_DEPENDENCY_BUCKET, Key=s3_key
+        )
+    except ClientError as e:
+        error_info = e.response.get("Error")
+        error_code = error_info.get("Code") if error_info else None
+        if error_code in ("404", "NoSuchKey"):
+            logger.info(
+                "S3 extract skip: no tarball at s3://%s/%s",
+                S3_DEPENDENCY_BUCKET,
+                s3_key,
+            )
+            return None
+        logger.error("S3 get_object failed for %s: %s", s3_key, error_code)
+        raise
+
+    pigz = shutil.which("pigz")
+    # x=extract, -I pigz / z=gzip, f -=read archive from stdin, C=target dir
+    decompress = ["-I", pigz] if pigz else ["-z"]
+    cmd = ["tar", "-x", *decompress, "-f", "-", "-C", clone_dir]
+    logger.info("Streaming s3://%s/%s into %s", S3_DEPENDENCY_BUCKET, s3_key, cmd)
+
+    start = time.perf_counter()
+    streamed = 0
+    # stderr goes to a file, not a pipe: nobody reads it until tar exits, and a full pipe would block tar while we block writing its stdin
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr_file
+        ) as proc:
+            stdin = proc.stdin
+            if stdin is None:
+                logger.error("tar stdin pipe was not created for %s", s3_key)
+                raise RuntimeError(f"tar stdin pipe missing for {s3_key}")
+            try:
+                try:
+                    for chunk in response["Body"].iter_chunks(S3_STREAM_CHUNK_BYTES):
+                        stdin.write(chunk)
+                        streamed += len(chunk)
+                    stdin.close()
+                except BrokenPipeError:
+                    # tar exited early (corrupt archive, disk full); its exit code and stderr below say why
+                    logger.warning(
+                        "tar closed its input early while streaming %s", s3_key
+                    )
+                returncode = proc.wait()
+            except BaseException:
+                # Download dropped mid-stream, Lambda timeout, KeyboardInterrupt: tar has only part of the archive, so nothing it wrote can be used
+                logger.error("Streaming %s aborted, removing %s", s3_key, target_path)
+                proc.kill()
+                proc.wait()
+                # Drop the buffered chunk now; the flush Popen's exit would attempt on the dead pipe raises BrokenPipeError over the real error
+                try:
+                    stdin.close()
+                except BrokenPipeError:
+                    logger.debug("Discarded unwritten tar input for %s", s3_key)
+                shutil.rmtree(target_path, ignore_errors=True)
+                raise
+
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            logger.error("tar failed for %s (exit %d): %s", s3_key, returncode, stderr)
+            shutil.rmtree(target_path, ignore_errors=True)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+
+    seconds = time.perf_counter() - start
+    logger.info(
+        "Extracted s3://%s/%s -> %s: %.1f MB in %.2fs (%.1f MB/s, %s)",
+        S3_DEPENDENCY_BUCKET,
+        s3_key,
+        target_path,
+        streamed / (1024 * 1024),
+        seconds,
+        streamed / (1024 * 1024) / seconds if seconds else 0.0,
+        "pigz" if pigz else "gzip",
+    )
+    return streamed
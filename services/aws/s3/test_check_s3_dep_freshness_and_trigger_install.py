@@ -1,98 +1,169 @@
-# pyright: reportUnusedVariable=false
+# pylint: disable=redefined-outer-name
 from unittest.mock import patch
 
-from botocore.exceptions import ClientError
+import pytest
 
+from constants.aws import S3_DEPENDENCY_BUCKET
 from services.aws.s3.check_s3_dep_freshness_and_trigger_install import (
     check_s3_dep_freshness_and_trigger_install,
 )
+from services.aws.s3.local_object_store import LocalObjectStore
 
 MODULE = "services.aws.s3.check_s3_dep_freshness_and_trigger_install"
-
-
-def test_returns_true_when_s3_tarball_is_fresh():
-    with patch(f"{MODULE}.s3_client") as mock_s3:
-        mock_s3.head_object.return_value = {"Metadata": {"manifest-hash": "abc123"}}
-
-        result = check_s3_dep_freshness_and_trigger_install(
-            owner_name="owner",
-            repo_name="repo",
-            owner_id=123,
-            pkg_manager="npm",
-            tarball_name="node_modules.tar.gz",
-            manifest_hash="abc123",
-            manifest_files={"package.json": "{}"},
-            log_prefix="node",
-        )
-
-        assert result is True
-        mock_s3.put_object.assert_not_called()
-
-
-def test_triggers_codebuild_when_hash_differs():
-    with patch(f"{MODULE}.s3_client") as mock_s3:
-        mock_s3.head_object.return_value = {"Metadata": {"manifest-hash": "old_hash"}}
-        with patch(f"{MODULE}.run_install_via_codebuild") as mock_codebuild:
-            result = check_s3_dep_freshness_and_trigger_install(
-                owner_name="owner",
-                repo_name="repo",
-                owner_id=123,
-                pkg_manager="npm",
-                tarball_name="node_modules.tar.gz",
-                manifest_hash="new_hash",
-                manifest_files={"package.json": "{}"},
-                log_prefix="node",
-            )
-
-            assert result is False
-            mock_codebuild.assert_called_once()
-
-
-def test_triggers_codebuild_when_no_tarball():
-    with patch(f"{MODULE}.s3_client") as mock_s3:
-        mock_s3.head_object.side_effect = ClientError(
-            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
-        )
-        with patch(f"{MODULE}.run_install_via_codebuild") as mock_codebuild:
-            result = check_s3_dep_freshness_and_trigger_install(
-                owner_name="owner",
-                repo_name="repo",
-                owner_id=123,
-                pkg_manager="npm",
-                tarball_name="node_modules.tar.gz",
-                manifest_hash="abc123",
-                manifest_files={"package.json": "{}"},
-                log_prefix="node",
-            )
-
-            assert result is False
-            mock_codebuild.assert_called_once()
-
-
-def test_uploads_all_manifest_files():
-    with patch(f"{MODULE}.s3_client") as mock_s3:
-        mock_s3.head_object.side_effect = ClientError(
-            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
-        )
-        with patch(f"{MODULE}.run_install_via_codebuild"):
-            check_s3_dep_freshness_and_trigger_install(
-                owner_name="owner",
-                repo_name="repo",
-                owner_id=123,
-                pkg_manager="npm",
-                tarball_name="node_modules.tar.gz",
-                manifest_hash="abc123",
-                manifest_files={
-                    "package.json": '{"name": "test"}',
-                    ".npmrc": "registry=https://registry.npmjs.org/",
-                    "yarn.lock": "lockfile",
-                },
-                log_prefix="node",
-            )
-
-            put_calls = mock_s3.put_object.call_args_list
-            keys = [c.kwargs["Key"] for c in put_calls]
-            assert "owner/repo/manifests/package.json" in keys
-            assert "owner/repo/manifests/.npmrc" in keys
-            assert "owner/repo/manifests/yarn.lock" in keys
-            assert "owner/repo/manifests/.manifest-hash" in keys
+CAS_KEY = "_deps/shared/abc123/node_modules.tar.gz"
+
+
+@pytest.fixture
+def store(tmp_path):
+    local_store = LocalObjectStore(root=str(tmp_path))
+    with patch(f"{MODULE}.get_dep_store_client", return_value=local_store), patch(
+        "services.aws.s3.head_dep_object.get_dep_store_client",
+        return_value=local_store,
+    ), patch(
+        "services.aws.s3.read_dep_pointer.get_dep_store_client",
+        return_value=local_store,
+    ), patch(
+        "services.aws.s3.write_dep_pointer.get_dep_store_client",
+        return_value=local_store,
+    ):
+        yield local_store
+
+
+@pytest.fixture
+def mock_codebuild():
+    with patch(f"{MODULE}.run_install_via_codebuild") as mock:
+        yield mock
+
+
+def put(store: LocalObjectStore, key: str, body: bytes, **kwargs):
+    store.put_object(Bucket=S3_DEPENDENCY_BUCKET, Key=key, Body=body, **kwargs)
+
+
+def read(store: LocalObjectStore, key: str):
+    return store.get_object(Bucket=S3_DEPENDENCY_BUCKET, Key=key)["Body"].read()
+
+
+def keys(store: LocalObjectStore):
+    return [
+        obj["Key"]
+        for obj in store.list_objects_v2(Bucket=S3_DEPENDENCY_BUCKET)["Contents"]
+    ]
+
+
+def check(repo_name: str = "repo", manifest_hash: str = "abc123", **kwargs):
+    return check_s3_dep_freshness_and_trigger_install(
+        owner_name="owner",
+        repo_name=repo_name,
+        owner_id=123,
+        pkg_manager="npm",
+        tarball_name="node_modules.tar.gz",
+        manifest_hash=manifest_hash,
+        manifest_files={"package.json": "{}", "package-lock.json": "lock"},
+        log_prefix="node",
+        **kwargs,
+    )
+
+
+def test_returns_true_when_tarball_for_hash_exists(store, mock_codebuild):
+    put(store, CAS_KEY, b"tarball")
+    put(
+        store,
+        "owner/repo/node_modules.tar.gz.json",
+        b'{"key": "_deps/shared/abc123/node_modules.tar.gz", "manifest_hash": "abc123"}',
+    )
+
+    assert check() is True
+    mock_codebuild.assert_not_called()
+    assert keys(store) == [CAS_KEY, "owner/repo/node_modules.tar.gz.json"]
+
+
+def test_reuses_tarball_built_for_another_repo(store, mock_codebuild):
+    put(store, CAS_KEY, b"tarball")
+
+    assert check(repo_name="fork") is True
+    mock_codebuild.assert_not_called()
+    assert read(store, "owner/fork/node_modules.tar.gz.json") == (
+        b'{"key": "_deps/shared/abc123/node_modules.tar.gz", "manifest_hash": "abc123"}'
+    )
+
+
+def test_owner_scope_does_not_see_shared_tarball(store, mock_codebuild):
+    put(store, CAS_KEY, b"tarball")
+
+    assert check(cas_scope="123") is False
+    mock_codebuild.assert_called_once()
+    assert read(store, "owner/repo/manifests/.cas-key.node_modules.tar.gz") == (
+        b"_deps/123/abc123/node_modules.tar.gz"
+    )
+
+
+def test_adopts_legacy_tarball_with_matching_hash(store, mock_codebuild):
+    put(
+        store,
+        "owner/repo/node_modules.tar.gz",
+        b"legacy",
+        Metadata={"manifest-hash": "abc123"},
+    )
+
+    assert check() is True
+    mock_codebuild.assert_not_called()
+    assert read(store, CAS_KEY) == b"legacy"
+    assert store.head_object(Bucket=S3_DEPENDENCY_BUCKET, Key=CAS_KEY)["Metadata"] == {
+        "manifest-hash": "abc123"
+    }
+    assert read(store, "owner/repo/node_modules.tar.gz.json") == (
+        b'{"key": "_deps/shared/abc123/node_modules.tar.gz", "manifest_hash": "abc123"}'
+    )
+
+
+def test_triggers_codebuild_when_legacy_hash_differs(store, mock_codebuild):
+    put(
+        store,
+        "owner/repo/node_modules.tar.gz",
+        b"legacy",
+        Metadata={"manifest-hash": "old_hash"},
+    )
+
+    assert check() is False
+    mock_codebuild.assert_called_once_with(
+        s3_key_prefix="owner/repo",
+        owner_id=123,
+        pkg_manager="npm",
+        node_version="22",
+    )
+
+
+def test_stale_hash_uploads_manifests_and_keeps_old_pointer(store, mock_codebuild):
+    old_pointer = b'{"key": "_deps/shared/old_hash/node_modules.tar.gz", "manifest_hash": "old_hash"}'
+    put(store, "_deps/shared/old_hash/node_modules.tar.gz", b"old")
+    put(store, "owner/repo/node_modules.tar.gz.json", old_pointer)
+
+    assert check() is False
+    mock_codebuild.assert_called_once()
+    assert keys(store) == [
+        "_deps/shared/old_hash/node_modules.tar.gz",
+        "owner/repo/manifests/.cas-key.node_modules.tar.gz",
+        "owner/repo/manifests/package-lock.json",
+        "owner/repo/manifests/package.json",
+        "owner/repo/node_modules.tar.gz.json",
+    ]
+    assert read(store, "owner/repo/manifests/.cas-key.node_modules.tar.gz") == (
+        CAS_KEY.encode()
+    )
+    # The repo keeps extracting its last build until CodeBuild moves the pointer
+    assert read(store, "owner/repo/node_modules.tar.gz.json") == old_pointer
+
+
+def test_moves_pointer_once_new_build_exists(store, mock_codebuild):
+    put(
+        store,
+        "owner/repo/node_modules.tar.gz.json",
+        b'{"key": "_deps/shared/old_hash/node_modules.tar.gz", "manifest_hash": "old_hash"}',
+    )
+    put(store, CAS_KEY, b"tarball")
+
+    assert check() is True
+    mock_codebuild.assert_not_called()
+    assert read(store, "owner/repo/node_modules.tar.gz.json") == (
+        b'{"key": "_deps/shared/abc123/node_modules.tar.gz", "manifest_hash": "abc123"}'
+    )
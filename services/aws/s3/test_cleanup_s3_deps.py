@@ -7,8 +7,8 @@ MODULE = "services.aws.s3.cleanup_s3_deps"
 
 
 def test_deletes_s3_objects():
-    with patch(f"{MODULE}.s3_client") as mock_s3:
-        mock_s3.list_objects_v2.return_value = {
+    with patch(f"{MODULE}.get_dep_store_client") as mock_s3:
+        mock_s3.return_value.list_objects_v2.return_value = {
             "Contents": [
                 {"Key": "owner/repo/node_modules.tar.gz"},
                 {"Key": "owner/repo/manifests/package.json"},
@@ -17,15 +17,15 @@ def test_deletes_s3_objects():
 
         result = cleanup_s3_deps("owner", "repo")
 
-        assert mock_s3.delete_object.call_count == 2
+        assert mock_s3.return_value.delete_object.call_count == 2
         assert result is True
 
 
 def test_returns_true_when_no_objects():
-    with patch(f"{MODULE}.s3_client") as mock_s3:
-        mock_s3.list_objects_v2.return_value = {"Contents": []}
+    with patch(f"{MODULE}.get_dep_store_client") as mock_s3:
+        mock_s3.return_value.list_objects_v2.return_value = {"Contents": []}
 
         result = cleanup_s3_deps("owner", "repo")
 
-        mock_s3.delete_object.assert_not_called()
+        mock_s3.return_value.delete_object.assert_not_called()
         assert result is True
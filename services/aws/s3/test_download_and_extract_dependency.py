@@ -1,9 +1,17 @@
 import os
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import patch
 
-from botocore.exceptions import ClientError
 
 from services.aws.s3.download_and_extract_dependency import download_and_extract_s3_deps
+from services.aws.s3.local_object_store import LocalObjectStore
+from services.aws.s3.write_dep_pointer import write_dep_pointer
+
+MODULE = "services.aws.s3.download_and_extract_dependency"
+
+
+def fake_pointer(_owner_name: str, _repo_name: str, tarball_name: str):
+    return {"key": f"_deps/shared/abc123/{tarball_name}", "manifest_hash": "abc123"}
 
 
 def test_skips_when_target_dirs_exist(tmp_path):
@@ -13,43 +21,128 @@ def test_skips_when_target_dirs_exist(tmp_path):
     os.makedirs(os.path.join(clone_dir, "vendor"))
     os.makedirs(os.path.join(clone_dir, "venv"))
 
-    with patch("services.aws.s3.download_and_extract_dependency.s3_client") as mock_s3:
+    with patch(f"{MODULE}.stream_extract_s3_tarball") as mock_stream:
         download_and_extract_s3_deps(
             owner_name="owner", repo_name="repo", clone_dir=clone_dir
         )
-        mock_s3.download_file.assert_not_called()
+        mock_stream.assert_not_called()
 
 
 def test_skips_when_s3_returns_no_such_key(tmp_path):
     clone_dir = str(tmp_path)
 
-    with patch("services.aws.s3.download_and_extract_dependency.s3_client") as mock_s3:
-        mock_s3.download_file.side_effect = ClientError(
-            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
-        )
+    with patch(f"{MODULE}.read_dep_pointer", side_effect=fake_pointer), patch(
+        f"{MODULE}.stream_extract_s3_tarball",
+        return_value=None,
+    ) as mock_stream:
         download_and_extract_s3_deps(
             owner_name="owner", repo_name="repo", clone_dir=clone_dir
         )
         # Should not raise, just skip
+        assert mock_stream.call_count == 4
 
 
 def test_downloads_and_extracts_tarball(tmp_path):
     clone_dir = str(tmp_path)
+    os.makedirs(os.path.join(clone_dir, "vendor"))
 
-    with patch(
-        "services.aws.s3.download_and_extract_dependency.s3_client"
-    ) as mock_s3, patch(
-        "services.aws.s3.download_and_extract_dependency.subprocess.run"
-    ) as mock_run, patch(
-        "services.aws.s3.download_and_extract_dependency.os.remove"
+    with patch(f"{MODULE}.read_dep_pointer", side_effect=fake_pointer), patch(
+        f"{MODULE}.stream_extract_s3_tarball",
+        return_value=1024,
+    ) as mock_stream:
+        download_and_extract_s3_deps(
+            owner_name="owner", repo_name="repo", clone_dir=clone_dir
+        )
+
+    # mongodb-binaries, node_modules and venv; vendor already exists. Package dirs follow their pointer, mongodb-binaries stays per repo.
+    assert sorted(c.kwargs["s3_key"] for c in mock_stream.call_args_list) == [
+        "_deps/shared/abc123/node_modules.tar.gz",
+        "_deps/shared/abc123/venv.tar.gz",
+        "owner/repo/mongodb-binaries.tar.gz",
+    ]
+    node_modules_call = next(
+        c
+        for c in mock_stream.call_args_list
+        if c.kwargs["s3_key"] == "_deps/shared/abc123/node_modules.tar.gz"
+    )
+    assert node_modules_call.kwargs["clone_dir"] == clone_dir
+    assert node_modules_call.kwargs["target_path"] == os.path.join(
+        clone_dir, "node_modules"
+    )
+
+
+def test_restores_dependency_dirs_in_parallel(tmp_path):
+    # Each fake restore waits for all four to be in flight at once; a sequential loop would time out at the barrier
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_stream(**_kwargs):
+        barrier.wait()
+        return 1
+
+    with patch(f"{MODULE}.read_dep_pointer", side_effect=fake_pointer), patch(
+        f"{MODULE}.stream_extract_s3_tarball",
+        side_effect=fake_stream,
+    ) as mock_stream:
+        download_and_extract_s3_deps(
+            owner_name="owner", repo_name="repo", clone_dir=str(tmp_path)
+        )
+
+    assert mock_stream.call_count == 4
+
+
+def test_extract_failure_is_swallowed_and_logged(tmp_path):
+    with patch(f"{MODULE}.read_dep_pointer", side_effect=fake_pointer), patch(
+        f"{MODULE}.stream_extract_s3_tarball",
+        side_effect=OSError("tar failed"),
     ):
-        mock_s3.download_file.return_value = None
-        mock_run.return_value = MagicMock(returncode=0)
+        # handle_exceptions(raise_on_error=False) returns None instead of raising
+        assert (
+            download_and_extract_s3_deps(
+                owner_name="owner", repo_name="repo", clone_dir=str(tmp_path)
+            )
+            is None
+        )
+
 
+def test_skips_package_dirs_without_a_pointer(tmp_path):
+    with patch(f"{MODULE}.read_dep_pointer", return_value=None), patch(
+        f"{MODULE}.stream_extract_s3_tarball", return_value=1
+    ) as mock_stream:
         download_and_extract_s3_deps(
-            owner_name="owner", repo_name="repo", clone_dir=clone_dir
+            owner_name="owner", repo_name="repo", clone_dir=str(tmp_path)
+        )
+
+    assert [c.kwargs["s3_key"] for c in mock_stream.call_args_list] == [
+        "owner/repo/mongodb-binaries.tar.gz"
+    ]
+
+
+def test_follows_pointer_in_local_store(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path / "store"))
+    clone_dir = tmp_path / "clone"
+    for dep_dir in ("mongodb-binaries", "vendor", "venv"):
+        os.makedirs(clone_dir / dep_dir)
+
+    with patch(
+        "services.aws.s3.write_dep_pointer.get_dep_store_client", return_value=store
+    ), patch(
+        "services.aws.s3.read_dep_pointer.get_dep_store_client", return_value=store
+    ), patch(
+        f"{MODULE}.stream_extract_s3_tarball", return_value=1
+    ) as mock_stream:
+        write_dep_pointer(
+            "owner",
+            "repo",
+            "node_modules.tar.gz",
+            "_deps/shared/abc123/node_modules.tar.gz",
+            "abc123",
+        )
+        download_and_extract_s3_deps(
+            owner_name="owner", repo_name="repo", clone_dir=str(clone_dir)
         )
 
-        # Should have called download_file for mongodb-binaries, node_modules, vendor, and venv
-        assert mock_s3.download_file.call_count == 4
-        assert mock_run.call_count == 4
+    mock_stream.assert_called_once_with(
+        s3_key="_deps/shared/abc123/node_modules.tar.gz",
+        clone_dir=str(clone_dir),
+        target_path=os.path.join(str(clone_dir), "node_modules"),
+    )
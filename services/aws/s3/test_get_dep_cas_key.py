@@ -0,0 +1,15 @@
+from services.aws.s3.get_dep_cas_key import get_dep_cas_key
+
+
+def test_shared_scope_by_default():
+    assert (
+        get_dep_cas_key("abc123", "node_modules.tar.gz")
+        == "_deps/shared/abc123/node_modules.tar.gz"
+    )
+
+
+def test_owner_scope():
+    assert (
+        get_dep_cas_key("abc123", "node_modules.tar.gz", "4242")
+        == "_deps/4242/abc123/node_modules.tar.gz"
+    )
@@ -0,0 +1,8 @@
+from services.aws.s3.get_dep_pointer_key import get_dep_pointer_key
+
+
+def test_pointer_sits_beside_repo_prefix():
+    assert (
+        get_dep_pointer_key("owner", "repo", "vendor.tar.gz")
+        == "owner/repo/vendor.tar.gz.json"
+    )
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from services.aws.s3.get_dep_store_client import get_dep_store_client
+from services.aws.s3.local_object_store import LocalObjectStore
+
+MODULE = "services.aws.s3.get_dep_store_client"
+
+
+def test_uses_s3_by_default():
+    get_dep_store_client.cache_clear()
+    with patch(f"{MODULE}.DEPENDENCY_STORE_DIR", ""), patch(
+        f"{MODULE}.get_s3_client"
+    ) as mock_s3:
+        first = get_dep_store_client()
+        second = get_dep_store_client()
+
+    assert first is mock_s3.return_value
+    assert second is first
+    mock_s3.assert_called_once_with()
+    get_dep_store_client.cache_clear()
+
+
+def test_uses_local_store_when_dir_is_set(tmp_path):
+    get_dep_store_client.cache_clear()
+    with patch(f"{MODULE}.DEPENDENCY_STORE_DIR", str(tmp_path)), patch(
+        f"{MODULE}.get_s3_client"
+    ) as mock_s3:
+        client = get_dep_store_client()
+
+    assert client == LocalObjectStore(root=str(tmp_path))
+    mock_s3.assert_not_called()
+    get_dep_store_client.cache_clear()
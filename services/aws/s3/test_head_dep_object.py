@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.head_dep_object import head_dep_object
+from services.aws.s3.local_object_store import LocalObjectStore
+
+MODULE = "services.aws.s3.head_dep_object"
+
+
+def test_returns_head_with_metadata(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+    store.put_object(
+        Bucket=S3_DEPENDENCY_BUCKET,
+        Key="_deps/shared/abc/venv.tar.gz",
+        Body=b"12345",
+        Metadata={"manifest-hash": "abc"},
+    )
+
+    with patch(f"{MODULE}.get_dep_store_client", return_value=store):
+        assert head_dep_object("_deps/shared/abc/venv.tar.gz") == {
+            "ContentLength": 5,
+            "Metadata": {"manifest-hash": "abc"},
+        }
+
+
+def test_returns_none_when_missing(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+
+    with patch(f"{MODULE}.get_dep_store_client", return_value=store):
+        assert head_dep_object("_deps/shared/abc/venv.tar.gz") is None
+
+
+def test_raises_other_errors():
+    with patch(f"{MODULE}.get_dep_store_client") as mock_client:
+        mock_client.return_value.head_object.side_effect = ClientError(
+            {"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadObject"
+        )
+        with pytest.raises(ClientError):
+            head_dep_object("_deps/shared/abc/venv.tar.gz")
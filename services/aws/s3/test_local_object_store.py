@@ -0,0 +1,77 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from services.aws.s3.local_object_store import LocalObjectStore
+
+
+def test_put_then_get_round_trips_body_and_metadata(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+    store.put_object(
+        Bucket="bucket", Key="a/b.tar.gz", Body=b"data", Metadata={"k": "v"}
+    )
+
+    response = store.get_object(Bucket="bucket", Key="a/b.tar.gz")
+
+    assert response["ContentLength"] == 4
+    assert response["Metadata"] == {"k": "v"}
+    assert list(response["Body"].iter_chunks(2)) == [b"da", b"ta"]
+
+
+def test_missing_object_raises_like_s3(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+
+    with pytest.raises(ClientError) as head_error:
+        store.head_object(Bucket="bucket", Key="missing")
+    with pytest.raises(ClientError) as get_error:
+        store.get_object(Bucket="bucket", Key="missing")
+    with pytest.raises(ClientError) as copy_error:
+        store.copy_object(
+            Bucket="bucket",
+            Key="target",
+            CopySource={"Bucket": "bucket", "Key": "missing"},
+        )
+
+    assert head_error.value.response["Error"]["Code"] == "404"
+    assert get_error.value.response["Error"]["Code"] == "NoSuchKey"
+    assert copy_error.value.response["Error"]["Code"] == "NoSuchKey"
+
+
+def test_copy_keeps_metadata(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+    store.put_object(
+        Bucket="bucket", Key="src", Body=b"x", Metadata={"manifest-hash": "abc"}
+    )
+
+    store.copy_object(
+        Bucket="bucket", Key="dst", CopySource={"Bucket": "bucket", "Key": "src"}
+    )
+
+    assert store.head_object(Bucket="bucket", Key="dst") == {
+        "ContentLength": 1,
+        "Metadata": {"manifest-hash": "abc"},
+    }
+
+
+def test_list_and_delete(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+    for key in ("owner/repo/a", "owner/repo/b/c", "owner/other/d"):
+        store.put_object(Bucket="bucket", Key=key, Body=b"12")
+
+    assert store.list_objects_v2(Bucket="bucket", Prefix="owner/repo/") == {
+        "Contents": [
+            {"Key": "owner/repo/a", "Size": 2},
+            {"Key": "owner/repo/b/c", "Size": 2},
+        ],
+        "KeyCount": 2,
+    }
+
+    store.delete_object(Bucket="bucket", Key="owner/repo/a")
+    store.delete_object(Bucket="bucket", Key="never/existed")
+
+    assert store.list_objects_v2(Bucket="bucket") == {
+        "Contents": [
+            {"Key": "owner/other/d", "Size": 2},
+            {"Key": "owner/repo/b/c", "Size": 2},
+        ],
+        "KeyCount": 2,
+    }
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.local_object_store import LocalObjectStore
+from services.aws.s3.read_dep_pointer import read_dep_pointer
+
+MODULE = "services.aws.s3.read_dep_pointer"
+
+
+def test_reads_pointer(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+    store.put_object(
+        Bucket=S3_DEPENDENCY_BUCKET,
+        Key="owner/repo/node_modules.tar.gz.json",
+        Body=b'{"key": "_deps/shared/abc/node_modules.tar.gz", "manifest_hash": "abc"}',
+    )
+
+    with patch(f"{MODULE}.get_dep_store_client", return_value=store):
+        assert read_dep_pointer("owner", "repo", "node_modules.tar.gz") == {
+            "key": "_deps/shared/abc/node_modules.tar.gz",
+            "manifest_hash": "abc",
+        }
+
+
+def test_returns_none_without_pointer(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+
+    with patch(f"{MODULE}.get_dep_store_client", return_value=store):
+        assert read_dep_pointer("owner", "repo", "node_modules.tar.gz") is None
+
+
+def test_returns_none_on_other_errors():
+    with patch(f"{MODULE}.get_dep_store_client") as mock_client:
+        mock_client.return_value.get_object.side_effect = ClientError(
+            {"Error": {"Code": "403", "Message": "Forbidden"}}, "GetObject"
+        )
+        assert read_dep_pointer("owner", "repo", "node_modules.tar.gz") is None
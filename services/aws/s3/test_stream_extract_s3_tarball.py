@@ -0,0 +1,155 @@
+import io
+import os
+import subprocess
+import tarfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.aws.s3.stream_extract_s3_tarball import stream_extract_s3_tarball
+
+
+def make_tarball(files: dict[str, bytes]):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def make_body(data: bytes):
+    """Stand-in for botocore's StreamingBody: yields the object in small chunks like a network read."""
+    body = MagicMock()
+    body.iter_chunks.side_effect = lambda chunk_size: (
+        data[i : i + 7] for i in range(0, len(data), 7)
+    )
+    return body
+
+
+def test_streams_tarball_into_clone_dir(tmp_path):
+    archive = make_tarball(
+        {
+            "node_modules/left-pad/index.js": b"module.exports = 1;\n",
+            "node_modules/.bin/tool": b"#!/bin/sh\n",
+        }
+    )
+    target_path = str(tmp_path / "node_modules")
+
+    with patch(
+        "services.aws.s3.stream_extract_s3_tarball.get_dep_store_client"
+    ) as mock_s3, patch(
+        "services.aws.s3.stream_extract_s3_tarball.shutil.which",
+        return_value=None,
+    ):
+        mock_s3.return_value.get_object.return_value = {"Body": make_body(archive)}
+        streamed = stream_extract_s3_tarball(
+            s3_key="owner/repo/node_modules.tar.gz",
+            clone_dir=str(tmp_path),
+            target_path=target_path,
+        )
+
+    assert streamed == len(archive)
+    with open(os.path.join(target_path, "left-pad", "index.js"), encoding="utf-8") as f:
+        assert f.read() == "module.exports = 1;\n"
+    # The archive never touches disk
+    assert sorted(os.listdir(tmp_path)) == ["node_modules"]
+
+
+def test_uses_pigz_when_available(tmp_path):
+    archive = make_tarball({"vendor/autoload.php": b"<?php\n"})
+
+    with patch(
+        "services.aws.s3.stream_extract_s3_tarball.get_dep_store_client"
+    ) as mock_s3, patch(
+        "services.aws.s3.stream_extract_s3_tarball.shutil.which",
+        return_value="/usr/bin/pigz",
+    ), patch(
+        "services.aws.s3.stream_extract_s3_tarball.subprocess.Popen"
+    ) as mock_popen:
+        mock_s3.return_value.get_object.return_value = {"Body": make_body(archive)}
+        mock_popen.return_value.__enter__.return_value.wait.return_value = 0
+        stream_extract_s3_tarball(
+            s3_key="owner/repo/vendor.tar.gz",
+            clone_dir=str(tmp_path),
+            target_path=str(tmp_path / "vendor"),
+        )
+
+    assert mock_popen.call_args[0][0] == [
+        "tar",
+        "-x",
+        "-I",
+        "/usr/bin/pigz",
+        "-f",
+        "-",
+        "-C",
+        str(tmp_path),
+    ]
+
+
+def test_returns_none_when_object_missing(tmp_path):
+    with patch(
+        "services.aws.s3.stream_extract_s3_tarball.get_dep_store_client"
+    ) as mock_s3:
+        mock_s3.return_value.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "Not Found"}}, "GetObject"
+        )
+        assert (
+            stream_extract_s3_tarball(
+                s3_key="owner/repo/vendor.tar.gz",
+                clone_dir=str(tmp_path),
+                target_path=str(tmp_path / "vendor"),
+            )
+            is None
+        )
+
+
+def test_corrupt_archive_raises_and_removes_partial_target(tmp_path):
+    archive = make_tarball({"venv/bin/python": b"x" * 4096})
+    target_path = tmp_path / "venv"
+
+    with patch(
+        "services.aws.s3.stream_extract_s3_tarball.get_dep_store_client"
+    ) as mock_s3, patch(
+        "services.aws.s3.stream_extract_s3_tarball.shutil.which", return_value=None
+    ):
+        # Truncated download: valid gzip header, missing tail
+        mock_s3.return_value.get_object.return_value = {
+            "Body": make_body(archive[: len(archive) // 2])
+        }
+        with pytest.raises(subprocess.CalledProcessError):
+            stream_extract_s3_tarball(
+                s3_key="owner/repo/venv.tar.gz",
+                clone_dir=str(tmp_path),
+                target_path=str(target_path),
+            )
+
+    assert not target_path.exists()
+
+
+def test_download_error_kills_tar_and_removes_partial_target(tmp_path):
+    archive = make_tarball({"node_modules/a/index.js": b"x" * 65536})
+    target_path = tmp_path / "node_modules"
+
+    def dropped_connection(chunk_size):
+        yield archive[: len(archive) // 2]
+        raise ConnectionResetError("connection reset by peer")
+
+    with patch(
+        "services.aws.s3.stream_extract_s3_tarball.get_dep_store_client"
+    ) as mock_s3, patch(
+        "services.aws.s3.stream_extract_s3_tarball.shutil.which", return_value=None
+    ):
+        body = MagicMock()
+        body.iter_chunks.side_effect = dropped_connection
+        mock_s3.return_value.get_object.return_value = {"Body": body}
+        with pytest.raises(ConnectionResetError):
+            stream_extract_s3_tarball(
+                s3_key="owner/repo/node_modules.tar.gz",
+                clone_dir=str(tmp_path),
+                target_path=str(target_path),
+            )
+
+    assert not target_path.exists()
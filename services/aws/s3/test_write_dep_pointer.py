@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.local_object_store import LocalObjectStore
+from services.aws.s3.write_dep_pointer import write_dep_pointer
+
+MODULE = "services.aws.s3.write_dep_pointer"
+
+
+def test_writes_json_pointer(tmp_path):
+    store = LocalObjectStore(root=str(tmp_path))
+
+    with patch(f"{MODULE}.get_dep_store_client", return_value=store):
+        assert (
+            write_dep_pointer(
+                "owner",
+                "repo",
+                "vendor.tar.gz",
+                "_deps/shared/abc/vendor.tar.gz",
+                "abc",
+            )
+            is True
+        )
+
+    body = store.get_object(
+        Bucket=S3_DEPENDENCY_BUCKET, Key="owner/repo/vendor.tar.gz.json"
+    )["Body"].read()
+    assert body == b'{"key": "_deps/shared/abc/vendor.tar.gz", "manifest_hash": "abc"}'
+
+
+def test_returns_false_when_put_fails():
+    with patch(f"{MODULE}.get_dep_store_client") as mock_client:
+        mock_client.return_value.put_object.side_effect = OSError("disk full")
+        assert (
+            write_dep_pointer(
+                "owner",
+                "repo",
+                "vendor.tar.gz",
+                "_deps/shared/abc/vendor.tar.gz",
+                "abc",
+            )
+            is False
+        )
@@ -0,0 +1,28 @@
+import json
+
+from config import UTF8
+from constants.aws import S3_DEPENDENCY_BUCKET
+from services.aws.s3.get_dep_pointer_key import get_dep_pointer_key
+from services.aws.s3.get_dep_store_client import get_dep_store_client
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=False, raise_on_error=False)
+def write_dep_pointer(
+    owner_name: str,
+    repo_name: str,
+    tarball_name: str,
+    cas_key: str,
+    manifest_hash: str,
+):
+    """Point the repo's dependency dir at the content-addressed tarball cas_key."""
+    pointer_key = get_dep_pointer_key(owner_name, repo_name, tarball_name)
+    get_dep_store_client().put_object(
+        Bucket=S3_DEPENDENCY_BUCKET,
+        Key=pointer_key,
+        Body=json.dumps({"key": cas_key, "manifest_hash": manifest_hash}).encode(UTF8),
+        ContentType="application/json",
+    )
+    logger.info("write_dep_pointer: %s -> %s", pointer_key, cas_key)
+    return True
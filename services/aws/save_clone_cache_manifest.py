@@ -0,0 +1,18 @@
+import json
+import os
+
+from services.aws.load_clone_cache_manifest import CloneCacheEntry
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def save_clone_cache_manifest(manifest_path: str, manifest: dict[str, CloneCacheEntry]):
+    # Write-then-rename so a timeout or OOM mid-write never leaves a truncated manifest behind
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+    logger.info(
+        "save_clone_cache_manifest: %d clone(s) in %s", len(manifest), manifest_path
+    )
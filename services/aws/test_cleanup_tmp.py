@@ -1,10 +1,36 @@
+import json
 import os
 import tempfile
+from collections import namedtuple
 from unittest.mock import patch
 
 from services.aws.cleanup_tmp import cleanup_tmp
 
 
+DiskUsage = namedtuple("DiskUsage", ["total", "used", "free"])
+
+
+def fake_disk_usage(total: int):
+    """shutil.disk_usage stand-in whose `used` is the bytes actually written under the temp dir, so eviction sees space come back as folders are deleted."""
+
+    def disk_usage(path: str):
+        used = 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                used += os.path.getsize(os.path.join(dirpath, filename))
+        return DiskUsage(total, used, total - used)
+
+    return disk_usage
+
+
+def write_clone(tmp_dir: str, rel_path: str, size: int):
+    clone_dir = os.path.join(tmp_dir, rel_path)
+    os.makedirs(clone_dir, exist_ok=True)
+    with open(os.path.join(clone_dir, "blob"), "w", encoding="utf-8") as f:
+        f.write("x" * size)
+    return clone_dir
+
+
 def test_cleanup_tmp_deletes_owner_folders():
     """Test that cleanup_tmp deletes owner/repo folders."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -17,7 +43,13 @@ def test_cleanup_tmp_deletes_owner_folders():
         with open(test_file, "w", encoding="utf-8") as f:
             f.write("test content")
 
-        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir):
+        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir), patch(
+            "services.aws.cleanup_tmp.CLONE_CACHE_MANIFEST_PATH",
+            os.path.join(tmp_dir, ".manifest.json"),
+        ), patch(
+            "services.aws.cleanup_tmp.shutil.disk_usage",
+            side_effect=fake_disk_usage(total=10),
+        ):
             with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
                 cleanup_tmp()
 
@@ -37,9 +69,15 @@ def test_cleanup_tmp_skips_system_directories():
                 f.write("keep me")
 
         # Create an owner folder that should be deleted
-        os.makedirs(os.path.join(tmp_dir, "Foxquilt", "repo"))
-
-        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir):
+        write_clone(tmp_dir, "Foxquilt/repo", 100)
+
+        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir), patch(
+            "services.aws.cleanup_tmp.CLONE_CACHE_MANIFEST_PATH",
+            os.path.join(tmp_dir, ".manifest.json"),
+        ), patch(
+            "services.aws.cleanup_tmp.shutil.disk_usage",
+            side_effect=fake_disk_usage(total=100),
+        ):
             with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
                 cleanup_tmp()
 
@@ -81,3 +119,106 @@ def test_cleanup_tmp_skips_when_not_on_lambda():
 
         # Folder should NOT be deleted (we're not on Lambda)
         assert os.path.exists(os.path.join(tmp_dir, "Foxquilt"))
+
+
+def test_cleanup_tmp_keeps_clones_under_high_watermark():
+    """Warm container below budget: the cached clone survives so git_clone_to_tmp can update it in place."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        clone_dir = write_clone(tmp_dir, "Foxquilt/repo/pr-1", 100)
+
+        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir), patch(
+            "services.aws.cleanup_tmp.shutil.disk_usage",
+            return_value=DiskUsage(1000, 100, 900),
+        ) as mock_disk_usage, patch(
+            "services.aws.cleanup_tmp.load_clone_cache_manifest"
+        ) as mock_load:
+            with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
+                cleanup_tmp()
+
+        assert os.path.exists(clone_dir)
+        # A single statvfs decides; the manifest and the tree are not even read
+        mock_disk_usage.assert_called_once_with(tmp_dir)
+        mock_load.assert_not_called()
+
+
+def test_cleanup_tmp_evicts_least_recently_used_until_low_watermark():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, ".manifest.json")
+        oldest = write_clone(tmp_dir, "Foxquilt/old-repo", 1000)
+        middle = write_clone(tmp_dir, "Foxquilt/repo/pr-1", 1000)
+        newest = write_clone(tmp_dir, "Other/repo", 1000)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    newest: {"last_used": 300.0, "size_bytes": 1000},
+                    oldest: {"last_used": 100.0, "size_bytes": 1000},
+                    middle: {"last_used": 200.0, "size_bytes": 1000},
+                },
+                f,
+            )
+
+        # ~3000 of 4000 bytes used: above the 70% high watermark. Evicting two clones gets under the 50% low watermark.
+        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir), patch(
+            "services.aws.cleanup_tmp.CLONE_CACHE_MANIFEST_PATH", manifest_path
+        ), patch(
+            "services.aws.cleanup_tmp.shutil.disk_usage",
+            side_effect=fake_disk_usage(total=4000),
+        ):
+            with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
+                cleanup_tmp()
+
+        assert not os.path.exists(oldest)
+        assert not os.path.exists(middle)
+        assert os.path.exists(newest)
+        # Emptied owner folders go too
+        assert not os.path.exists(os.path.join(tmp_dir, "Foxquilt"))
+        with open(manifest_path, encoding="utf-8") as f:
+            assert json.load(f) == {newest: {"last_used": 300.0, "size_bytes": 1000}}
+
+
+def test_cleanup_tmp_evicts_untracked_folders_before_cached_clones():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, ".manifest.json")
+        cached = write_clone(tmp_dir, "Foxquilt/repo", 400)
+        untracked = write_clone(tmp_dir, "Crashed/repo/pr-9", 400)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({cached: {"last_used": 1.0, "size_bytes": 400}}, f)
+
+        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir), patch(
+            "services.aws.cleanup_tmp.CLONE_CACHE_MANIFEST_PATH", manifest_path
+        ), patch(
+            "services.aws.cleanup_tmp.shutil.disk_usage",
+            side_effect=fake_disk_usage(total=1000),
+        ):
+            with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
+                cleanup_tmp()
+
+        assert not os.path.exists(os.path.join(tmp_dir, "Crashed"))
+        assert not os.path.exists(untracked)
+        assert os.path.exists(cached)
+
+
+def test_cleanup_tmp_never_deletes_manifest_entries_outside_tmp():
+    """Customer code can write the manifest; an entry escaping /tmp must not reach rmtree."""
+    with tempfile.TemporaryDirectory() as outside, tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, ".manifest.json")
+        victim = write_clone(outside, "data", 900)
+        escaping = os.path.join(tmp_dir, "..", os.path.basename(outside), "data")
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({escaping: {"last_used": 1.0, "size_bytes": 900}}, f)
+        # Over the high watermark, so cleanup_tmp walks the manifest
+        with open(os.path.join(tmp_dir, "stray.log"), "w", encoding="utf-8") as f:
+            f.write("x" * 900)
+
+        with patch("services.aws.cleanup_tmp.TMP_DIR", tmp_dir), patch(
+            "services.aws.load_clone_cache_manifest.TMP_DIR", tmp_dir
+        ), patch(
+            "services.aws.cleanup_tmp.CLONE_CACHE_MANIFEST_PATH", manifest_path
+        ), patch(
+            "services.aws.cleanup_tmp.shutil.disk_usage",
+            side_effect=fake_disk_usage(total=1000),
+        ):
+            with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
+                cleanup_tmp()
+
+        assert os.path.exists(victim)
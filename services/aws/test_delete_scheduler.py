@@ -14,8 +14,8 @@ from services.aws.delete_scheduler import delete_scheduler
 @pytest.fixture
 def mock_scheduler_client():
     """Fixture to mock the scheduler_client."""
-    with patch("services.aws.delete_scheduler.scheduler_client") as mock:
-        yield mock
+    with patch("services.aws.delete_scheduler.get_scheduler_client") as mock:
+        yield mock.return_value
 
 
 @pytest.fixture
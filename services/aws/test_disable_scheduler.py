@@ -33,8 +33,8 @@ GET_SCHEDULE_RESPONSE = {
 
 @pytest.fixture
 def mock_scheduler_client():
-    with patch("services.aws.disable_scheduler.scheduler_client") as mock:
-        yield mock
+    with patch("services.aws.disable_scheduler.get_scheduler_client") as mock:
+        yield mock.return_value
 
 
 @pytest.fixture
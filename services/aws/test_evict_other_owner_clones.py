@@ -0,0 +1,74 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from services.aws.evict_other_owner_clones import evict_other_owner_clones
+
+MODULE = "services.aws.evict_other_owner_clones"
+
+
+@pytest.fixture
+def tmp_dir(tmp_path):
+    manifest_path = str(tmp_path / ".manifest.json")
+    with patch(f"{MODULE}.TMP_DIR", str(tmp_path)), patch(
+        f"{MODULE}.CLONE_CACHE_MANIFEST_PATH", manifest_path
+    ), patch(
+        "services.aws.load_clone_cache_manifest.TMP_DIR", str(tmp_path)
+    ), patch.dict(
+        os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}
+    ):
+        yield tmp_path
+
+
+def test_deletes_other_owners_and_keeps_own(tmp_dir):
+    for rel_path in ("acme/api/pr-1", "acme/web", "other/repo", "pip", ".hidden"):
+        os.makedirs(tmp_dir / rel_path)
+    (tmp_dir / "stray.txt").write_text("x", encoding="utf-8")
+    entry = {"last_used": 1.0, "size_bytes": 1}
+    (tmp_dir / ".manifest.json").write_text(
+        json.dumps({f"{tmp_dir}/acme/web": entry, f"{tmp_dir}/other/repo": entry}),
+        encoding="utf-8",
+    )
+
+    evict_other_owner_clones(f"{tmp_dir}/acme/api/pr-1")
+
+    assert sorted(os.listdir(tmp_dir)) == [
+        ".hidden",
+        ".manifest.json",
+        "acme",
+        "pip",
+        "stray.txt",
+    ]
+    assert sorted(os.listdir(tmp_dir / "acme")) == ["api", "web"]
+    manifest = json.loads((tmp_dir / ".manifest.json").read_text(encoding="utf-8"))
+    assert manifest == {f"{tmp_dir}/acme/web": entry}
+
+
+def test_removes_symlink_without_following_it(tmp_dir, tmp_path_factory):
+    target = tmp_path_factory.mktemp("target")
+    (target / "keep.txt").write_text("x", encoding="utf-8")
+    os.symlink(target, tmp_dir / "link")
+
+    evict_other_owner_clones(f"{tmp_dir}/acme/api")
+
+    assert os.listdir(tmp_dir) == []
+    assert os.listdir(target) == ["keep.txt"]
+
+
+def test_skips_when_not_on_lambda(tmp_dir):
+    os.makedirs(tmp_dir / "other" / "repo")
+
+    with patch.dict(os.environ, {}, clear=True):
+        evict_other_owner_clones(f"{tmp_dir}/acme/api")
+
+    assert os.listdir(tmp_dir) == ["other"]
+
+
+def test_ignores_clone_dir_outside_tmp(tmp_dir):
+    os.makedirs(tmp_dir / "other" / "repo")
+
+    evict_other_owner_clones("/var/clones/acme/api")
+
+    assert os.listdir(tmp_dir) == ["other"]
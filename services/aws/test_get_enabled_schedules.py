@@ -5,6 +5,7 @@ from unittest.mock import patch
 # Third party imports
 import pytest
 from botocore.exceptions import BotoCoreError, ClientError
+
 # Local imports
 from services.aws.get_enabled_schedules import get_enabled_schedules
 
@@ -12,8 +13,8 @@ from services.aws.get_enabled_schedules import get_enabled_schedules
 @pytest.fixture
 def mock_scheduler_client():
     """Fixture to mock the scheduler_client used by get_enabled_schedules."""
-    with patch("services.aws.get_enabled_schedules.scheduler_client") as mock:
-        yield mock
+    with patch("services.aws.get_enabled_schedules.get_scheduler_client") as mock:
+        yield mock.return_value
 
 
 def test_single_page_returns_enabled_repo_tuples(mock_scheduler_client):
@@ -0,0 +1,17 @@
+from unittest.mock import patch
+
+from constants.aws import AWS_REGION
+from services.aws.get_scheduler_client import get_scheduler_client
+
+
+@patch("services.aws.get_scheduler_client.boto3")
+def test_creates_client_once_and_reuses_it(mock_boto3):
+    get_scheduler_client.cache_clear()
+
+    first = get_scheduler_client()
+    second = get_scheduler_client()
+
+    assert first is second
+    assert first is mock_boto3.client.return_value
+    mock_boto3.client.assert_called_once_with("scheduler", region_name=AWS_REGION)
+    get_scheduler_client.cache_clear()
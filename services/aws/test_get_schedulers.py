@@ -12,8 +12,8 @@ from services.aws.get_schedulers import get_schedulers_by_owner_id
 @pytest.fixture
 def mock_scheduler_client():
     """Fixture to mock the scheduler_client."""
-    with patch("services.aws.get_schedulers.scheduler_client") as mock:
-        yield mock
+    with patch("services.aws.get_schedulers.get_scheduler_client") as mock:
+        yield mock.return_value
 
 
 def test_get_schedulers_by_owner_id_success_single_page(mock_scheduler_client):
@@ -270,10 +270,11 @@ def test_get_schedulers_by_owner_id_various_owner_ids(
 
 def test_get_schedulers_by_owner_id_handle_exceptions_decorator():
     """Test that the function has the correct handle_exceptions decorator configuration."""
-    # This test verifies the decorator is applied with correct parameters
-    # by checking the function's behavior when an exception occurs
-    with patch("services.aws.get_schedulers.scheduler_client") as mock_client:
-        mock_client.list_schedules.side_effect = RuntimeError("Test exception")
+    # This test verifies the decorator is applied with correct parameters by checking the function's behavior when an exception occurs
+    with patch("services.aws.get_schedulers.get_scheduler_client") as mock_client:
+        mock_client.return_value.list_schedules.side_effect = RuntimeError(
+            "Test exception"
+        )
 
         result = get_schedulers_by_owner_id(123)
 
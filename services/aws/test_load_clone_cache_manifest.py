@@ -0,0 +1,37 @@
+import json
+
+from services.aws.load_clone_cache_manifest import load_clone_cache_manifest
+
+
+def test_load_clone_cache_manifest_reads_entries(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps({"/tmp/o/r": {"last_used": 1.5, "size_bytes": 42}}),
+        encoding="utf-8",
+    )
+
+    assert load_clone_cache_manifest(str(manifest_path)) == {
+        "/tmp/o/r": {"last_used": 1.5, "size_bytes": 42}
+    }
+
+
+def test_load_clone_cache_manifest_missing_file_is_empty(tmp_path):
+    assert load_clone_cache_manifest(str(tmp_path / "missing.json")) == {}
+
+
+def test_load_clone_cache_manifest_corrupt_file_is_empty(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"/tmp/o/r": {"last_us', encoding="utf-8")
+
+    assert load_clone_cache_manifest(str(manifest_path)) == {}
+
+
+def test_load_clone_cache_manifest_drops_paths_outside_tmp(tmp_path):
+    entry = {"last_used": 1.5, "size_bytes": 42}
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps({"/tmp/o/r": entry, "/var/task": entry, "/tmp/o/../../etc": entry}),
+        encoding="utf-8",
+    )
+
+    assert load_clone_cache_manifest(str(manifest_path)) == {"/tmp/o/r": entry}
@@ -18,12 +18,12 @@ def test_run_install_via_codebuild_starts_build():
 
     with patch("services.aws.run_install_via_codebuild.IS_PRD", True):
         with patch(
-            "services.aws.run_install_via_codebuild.codebuild_client"
+            "services.aws.run_install_via_codebuild.get_codebuild_client"
         ) as mock_client:
             with patch(
                 "services.aws.run_install_via_codebuild.get_npm_token"
             ) as mock_token:
-                mock_client.start_build.return_value = mock_response
+                mock_client.return_value.start_build.return_value = mock_response
                 mock_token.return_value = None
 
                 from services.aws.run_install_via_codebuild import (
@@ -34,9 +34,9 @@ def test_run_install_via_codebuild_starts_build():
                     s3_key_prefix="owner/repo", owner_id=123, pkg_manager="npm"
                 )
 
-                mock_client.start_build.assert_called_once()
+                mock_client.return_value.start_build.assert_called_once()
                 mock_token.assert_called_once_with(platform="github", owner_id=123)
-                call_args = mock_client.start_build.call_args
+                call_args = mock_client.return_value.start_build.call_args
                 assert call_args.kwargs["projectName"] == "gitauto-package-install"
                 env_vars = call_args.kwargs["environmentVariablesOverride"]
                 assert {
@@ -62,12 +62,12 @@ def test_run_install_via_codebuild_includes_npm_token():
 
     with patch("services.aws.run_install_via_codebuild.IS_PRD", True):
         with patch(
-            "services.aws.run_install_via_codebuild.codebuild_client"
+            "services.aws.run_install_via_codebuild.get_codebuild_client"
         ) as mock_client:
             with patch(
                 "services.aws.run_install_via_codebuild.get_npm_token"
             ) as mock_token:
-                mock_client.start_build.return_value = mock_response
+                mock_client.return_value.start_build.return_value = mock_response
                 mock_token.return_value = "npm_secret_token"
 
                 from services.aws.run_install_via_codebuild import (
@@ -78,7 +78,7 @@ def test_run_install_via_codebuild_includes_npm_token():
                     s3_key_prefix="owner/repo", owner_id=123, pkg_manager="yarn"
                 )
 
-                call_args = mock_client.start_build.call_args
+                call_args = mock_client.return_value.start_build.call_args
                 env_vars = call_args.kwargs["environmentVariablesOverride"]
                 assert {
                     "name": "NPM_TOKEN",
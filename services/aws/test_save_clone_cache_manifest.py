@@ -0,0 +1,29 @@
+import json
+import os
+
+from services.aws.save_clone_cache_manifest import save_clone_cache_manifest
+
+
+def test_save_clone_cache_manifest_writes_json(tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+
+    save_clone_cache_manifest(
+        manifest_path, {"/tmp/o/r": {"last_used": 2.0, "size_bytes": 7}}
+    )
+
+    with open(manifest_path, encoding="utf-8") as f:
+        assert json.load(f) == {"/tmp/o/r": {"last_used": 2.0, "size_bytes": 7}}
+    # The temp file was renamed over the manifest, not left behind
+    assert os.listdir(tmp_path) == ["manifest.json"]
+
+
+def test_save_clone_cache_manifest_replaces_existing(tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    save_clone_cache_manifest(
+        manifest_path, {"/tmp/a": {"last_used": 1.0, "size_bytes": 1}}
+    )
+
+    save_clone_cache_manifest(manifest_path, {})
+
+    with open(manifest_path, encoding="utf-8") as f:
+        assert json.load(f) == {}
@@ -0,0 +1,53 @@
+import json
+import os
+from unittest.mock import patch
+
+from services.aws.touch_clone_cache import touch_clone_cache
+
+
+def test_touch_clone_cache_records_new_clone(tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    with patch(
+        "services.aws.touch_clone_cache.CLONE_CACHE_MANIFEST_PATH", manifest_path
+    ), patch("services.aws.touch_clone_cache.time.time", return_value=123.0):
+        with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
+            touch_clone_cache("/tmp/o/r/pr-1", size_bytes=2048)
+
+    with open(manifest_path, encoding="utf-8") as f:
+        assert json.load(f) == {
+            "/tmp/o/r/pr-1": {"last_used": 123.0, "size_bytes": 2048}
+        }
+
+
+def test_touch_clone_cache_keeps_size_on_update(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "/tmp/o/r": {"last_used": 1.0, "size_bytes": 500},
+                "/tmp/o/other": {"last_used": 2.0, "size_bytes": 9},
+            }
+        ),
+        encoding="utf-8",
+    )
+    with patch(
+        "services.aws.touch_clone_cache.CLONE_CACHE_MANIFEST_PATH", str(manifest_path)
+    ), patch("services.aws.touch_clone_cache.time.time", return_value=50.0):
+        with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "test"}):
+            touch_clone_cache("/tmp/o/r")
+
+    assert json.loads(manifest_path.read_text(encoding="utf-8")) == {
+        "/tmp/o/r": {"last_used": 50.0, "size_bytes": 500},
+        "/tmp/o/other": {"last_used": 2.0, "size_bytes": 9},
+    }
+
+
+def test_touch_clone_cache_is_noop_off_lambda(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    with patch(
+        "services.aws.touch_clone_cache.CLONE_CACHE_MANIFEST_PATH", str(manifest_path)
+    ):
+        with patch.dict(os.environ, {}, clear=True):
+            touch_clone_cache("/tmp/o/r", size_bytes=1)
+
+    assert not manifest_path.exists()
@@ -0,0 +1,27 @@
+import os
+import time
+
+from constants.aws import CLONE_CACHE_MANIFEST_PATH
+from services.aws.load_clone_cache_manifest import load_clone_cache_manifest
+from services.aws.save_clone_cache_manifest import save_clone_cache_manifest
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def touch_clone_cache(clone_dir: str, size_bytes: int | None = None):
+    """Mark clone_dir as used now in the clone cache manifest. size_bytes is recorded on fresh clones and kept as-is on in-place updates."""
+    # Same guard as cleanup_tmp: only Lambda keeps the clone cache, local /tmp is shared by all processes
+    if not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        logger.debug("touch_clone_cache: not on Lambda, skipping %s", clone_dir)
+        return
+
+    manifest = load_clone_cache_manifest(CLONE_CACHE_MANIFEST_PATH)
+    entry = manifest.get(clone_dir, {"last_used": 0.0, "size_bytes": 0})
+    entry["last_used"] = time.time()
+    if size_bytes is not None:
+        logger.debug("touch_clone_cache: %s is %d bytes", clone_dir, size_bytes)
+        entry["size_bytes"] = size_bytes
+    manifest[clone_dir] = entry
+    save_clone_cache_manifest(CLONE_CACHE_MANIFEST_PATH, manifest)
+    logger.info("touch_clone_cache: touched %s", clone_dir)
@@ -1,8 +1,11 @@
+from typing import Callable
+
 from anthropic.types import MessageParam, ToolUnionParam
 
 from constants.models import ClaudeModelId, GoogleModelId, ModelId
 from services.claude.chat_with_claude import chat_with_claude
 from services.google_ai.chat_with_google import chat_with_google
+from services.llm_result import ToolCall
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -15,6 +18,7 @@ def chat_with_model(
     model_id: ModelId,
     usage_id: int,
     created_by: str,
+    on_tool_call: Callable[[ToolCall], bool] | None = None,
 ):
     if isinstance(model_id, ClaudeModelId):
         logger.info("Routing to Claude: %s", model_id)
@@ -25,6 +29,7 @@ def chat_with_model(
             model_id=model_id,
             usage_id=usage_id,
             created_by=created_by,
+            on_tool_call=on_tool_call,
         )
 
     if isinstance(model_id, GoogleModelId):
@@ -36,6 +41,7 @@ def chat_with_model(
             model_id=model_id,
             usage_id=usage_id,
             created_by=created_by,
+            on_tool_call=on_tool_call,
         )
 
     raise ValueError(f"Unknown provider for model '{model_id}'")
@@ -1,5 +1,6 @@
 import time
 from functools import partial
+from typing import Callable
 
 from anthropic import AuthenticationError
 from anthropic._exceptions import OverloadedError
@@ -13,6 +14,7 @@ from services.claude.exceptions import (
     ClaudeAuthenticationError,
     ClaudeOverloadedError,
 )
+from services.claude.plan_prompt_cache import plan_prompt_cache
 from services.llm_result import LlmResult, ToolCall
 from services.messages.trim_messages import trim_messages_to_token_limit
 from services.supabase.llm_requests.insert_llm_request import insert_llm_request
@@ -28,7 +30,9 @@ def chat_with_claude(
     model_id: ClaudeModelId,
     usage_id: int,
     created_by: str,
+    on_tool_call: Callable[[ToolCall], bool] | None = None,
 ):
+    """When on_tool_call is given, the response is streamed and on_tool_call gets each tool_use block as soon as the block is complete, while later blocks are still generating. It returns whether it started running the call; the time from the first such start to the end of the stream is recorded as tool_overlap_ms."""
     # Check token count and delete messages if necessary
     buffer = 4096
     context_window = CONTEXT_WINDOW[model_id]
@@ -40,18 +44,65 @@ def chat_with_claude(
         count_tokens_fn=partial(count_tokens_claude, client=claude, model=model_id),
     )
 
+    # Cache breakpoints go on copies; `messages` stays clean for llm_requests and the caller's next turn.
+    cached_system, cached_tools, cached_messages = plan_prompt_cache(
+        system_content=system_content,
+        tools=tools,
+        messages=messages,
+        model_id=model_id,
+    )
+
     # https://docs.anthropic.com/en/api/messages
     start_time = time.time()
+    time_to_first_token_ms: int | None = None
+    first_dispatch_time: float | None = None
     try:
         # https://platform.claude.com/docs/en/docs/about-claude/models/all-models#model-comparison-table
         # Opus 4.7 deprecated the temperature parameter; omit it to stay compatible across models.
-        response = claude.messages.create(
-            model=model_id,
-            system=system_content,
-            messages=messages,
-            tools=tools,
-            max_tokens=max_output,
-        )
+        if on_tool_call is None:
+            logger.info("chat_with_claude: non-streaming request")
+            response = claude.messages.create(
+                model=model_id,
+                system=cached_system,
+                messages=cached_messages,
+                tools=cached_tools,
+                max_tokens=max_output,
+            )
+        else:
+            logger.info("chat_with_claude: streaming request")
+            # https://docs.anthropic.com/en/api/messages-streaming
+            with claude.messages.stream(
+                model=model_id,
+                system=cached_system,
+                messages=cached_messages,
+                tools=cached_tools,
+                max_tokens=max_output,
+            ) as stream:
+                for event in stream:
+                    if (
+                        event.type == "content_block_delta"
+                        and time_to_first_token_ms is None
+                    ):
+                        logger.info("chat_with_claude: first token received")
+                        time_to_first_token_ms = int((time.time() - start_time) * 1000)
+                    elif (
+                        event.type == "content_block_stop"
+                        and event.content_block.type == "tool_use"
+                    ):
+                        logger.info(
+                            "chat_with_claude: tool_use block complete: %s",
+                            event.content_block.name,
+                        )
+                        block = event.content_block
+                        dispatched = on_tool_call(
+                            ToolCall(id=block.id, name=block.name, args=block.input)
+                        )
+                        if dispatched and first_dispatch_time is None:
+                            logger.info(
+                                "chat_with_claude: %s started early", block.name
+                            )
+                            first_dispatch_time = time.time()
+                response = stream.get_final_message()
         response_time_ms = int((time.time() - start_time) * 1000)
     except OverloadedError as e:
         raise ClaudeOverloadedError("Claude API is overloaded (529)") from e
@@ -107,6 +158,15 @@ def chat_with_claude(
         else 0
     )
 
+    # Anthropic reports None for these when caching did not apply (e.g. prefix under the minimum cacheable length).
+    usage = getattr(response, "usage", None)
+    cache_read_tokens = getattr(usage, "cache_read_input_tokens", None)
+    cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None)
+    cache_read_tokens = cache_read_tokens if isinstance(cache_read_tokens, int) else 0
+    cache_write_tokens = (
+        cache_write_tokens if isinstance(cache_write_tokens, int) else 0
+    )
+
     llm_record = insert_llm_request(
         usage_id=usage_id,
         provider="claude",
@@ -118,13 +178,23 @@ def chat_with_claude(
         system_prompt=system_content,
         response_time_ms=response_time_ms,
         created_by=created_by,
+        cache_read_input_tokens=cache_read_tokens,
+        cache_creation_input_tokens=cache_write_tokens,
+        time_to_first_token_ms=time_to_first_token_ms,
+        tool_overlap_ms=(
+            int((time.time() - first_dispatch_time) * 1000)
+            if first_dispatch_time is not None
+            else None
+        ),
     )
     cost_usd = llm_record["total_cost_usd"] if llm_record else 0.0
 
     logger.info(
-        "chat_with_claude returning: tool_calls=%d token_input=%d token_output=%d cost_usd=%.4f",
+        "chat_with_claude returning: tool_calls=%d token_input=%d cache_read=%d cache_write=%d token_output=%d cost_usd=%.4f",
         len(tool_calls),
         token_input,
+        cache_read_tokens,
+        cache_write_tokens,
         token_output,
         cost_usd,
     )
@@ -0,0 +1,122 @@
+# Standard imports
+import hashlib
+import json
+from typing import Any, Sequence
+
+# Third party imports
+from anthropic.types import (
+    CacheControlEphemeralParam,
+    MessageParam,
+    TextBlockParam,
+    ToolUnionParam,
+)
+from cachetools import TTLCache
+
+# Local imports
+from constants.claude import PROMPT_CACHE_TTL_SECONDS
+from services.messages.message_to_dict import message_to_dict
+from utils.logging.logging_config import logger
+
+# Cumulative prefix hashes (model + tools + system + messages[:i+1]) that we put a cache_control breakpoint on in an earlier request. Anthropic only serves cache reads for prefixes that were written at a breakpoint, so this is how we find the longest prefix that survived remove_outdated_messages / trim_messages_to_token_limit rewriting earlier turns.
+WRITTEN_PREFIXES: TTLCache[str, bool] = TTLCache(
+    maxsize=4096, ttl=PROMPT_CACHE_TTL_SECONDS
+)
+
+
+def plan_prompt_cache(
+    system_content: str,
+    tools: Sequence[ToolUnionParam],
+    messages: Sequence[MessageParam],
+    model_id: str,
+):
+    """Return (system, tools, messages) copies with Anthropic cache_control breakpoints placed for an agent loop.
+
+    Breakpoints (Anthropic allows 4): the last tool definition, the system prompt, a read anchor on the longest message prefix we wrote to the cache earlier and that is still byte-identical, and a write on the newest message so the next turn can read everything up to here.
+    The caller's messages and tools are never mutated because they are stored in llm_requests and reused across turns.
+    """
+    chain = hashlib.sha256(model_id.encode())
+    chain.update(json.dumps(list(tools), sort_keys=True, default=str).encode())
+    chain.update(system_content.encode())
+
+    prefix_hashes: list[str] = []
+    # Messages whose last block can carry cache_control. Anthropic rejects it on an empty text block, so a message with "" content (or ending in one) never gets a breakpoint and the write moves back to the newest message that can.
+    stampable: list[int] = []
+    for i, msg in enumerate(messages):
+        msg_dict = message_to_dict(msg)
+        chain.update(json.dumps(msg_dict, sort_keys=True, default=str).encode())
+        prefix_hashes.append(chain.copy().hexdigest())
+        content = msg_dict.get("content")
+        last_block = content[-1] if isinstance(content, list) and content else None
+        if (isinstance(content, str) and content) or (
+            isinstance(last_block, dict)
+            and (last_block.get("type") != "text" or last_block.get("text"))
+        ):
+            logger.debug("plan_prompt_cache: msg[%d] can take a breakpoint", i)
+            stampable.append(i)
+
+    anchor = None
+    for i in reversed(stampable[:-1]):
+        if prefix_hashes[i] in WRITTEN_PREFIXES:
+            logger.info("plan_prompt_cache: read anchor at msg[%d]", i)
+            anchor = i
+            break
+
+    if anchor is None:
+        logger.info("plan_prompt_cache: no surviving cached prefix; writing fresh")
+
+    tail = stampable[-1] if stampable else None
+    breakpoints = {tail} if tail is not None else set()
+    if anchor is not None:
+        logger.info("plan_prompt_cache: adding anchor breakpoint")
+        breakpoints.add(anchor)
+
+    cached_messages = list(messages)
+    for i in sorted(breakpoints):
+        msg_dict = message_to_dict(messages[i])
+        content = msg_dict.get("content")
+        if isinstance(content, str):
+            logger.info("plan_prompt_cache: msg[%d] string content -> text block", i)
+            blocks: list[Any] = [{"type": "text", "text": content}]
+        else:
+            logger.info("plan_prompt_cache: msg[%d] copying block list", i)
+            blocks = [
+                dict(block) if isinstance(block, dict) else block
+                for block in content or []
+            ]
+
+        if blocks and isinstance(blocks[-1], dict):
+            logger.info("plan_prompt_cache: msg[%d] stamping last block", i)
+            blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        cached_messages[i] = {"role": msg_dict["role"], "content": blocks}
+
+    if tail is not None:
+        logger.info(
+            "plan_prompt_cache: recording written prefix %s", prefix_hashes[tail][:12]
+        )
+        WRITTEN_PREFIXES[prefix_hashes[tail]] = True
+
+    cached_tools = list(tools)
+    if cached_tools:
+        logger.info("plan_prompt_cache: stamping last of %d tools", len(cached_tools))
+        last_tool = cached_tools[-1].copy()
+        last_tool["cache_control"] = CacheControlEphemeralParam(type="ephemeral")
+        cached_tools[-1] = last_tool
+
+    # Anthropic rejects cache_control on an empty text block, so an empty system prompt goes through unchanged.
+    cached_system: str | list[TextBlockParam] = system_content
+    if system_content:
+        logger.info("plan_prompt_cache: stamping system prompt")
+        cached_system = [
+            {
+                "type": "text",
+                "text": system_content,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    logger.info(
+        "plan_prompt_cache: %d messages, breakpoints at %s",
+        len(messages),
+        sorted(breakpoints),
+    )
+    return cached_system, cached_tools, cached_messages
@@ -0,0 +1,59 @@
+import asyncio
+import inspect
+from typing import Any
+
+from anthropic.types import MessageParam
+
+from services.claude.sanitize_tool_args import sanitize_tool_args
+from services.claude.tools.tools import READ_ONLY_TOOLS
+from services.llm_result import ToolCall
+from services.types.base_args import BaseArgs
+from utils.logging.logging_config import logger
+
+# query_file and web_fetch each hold an LLM round trip; a handful in flight is where the latency win is without hammering the API
+MAX_CONCURRENT_READ_TOOLS = 4
+
+
+async def run_read_only_tool_calls(
+    *,
+    tool_calls: list[ToolCall],
+    tools: dict[str, Any],
+    base_args: BaseArgs,
+    messages: list[MessageParam],
+):
+    """Run the leading run of READ_ONLY_TOOLS calls in tool_calls concurrently and return their results in call order.
+
+    Stops at the first mutating call, so a read the model issued after an edit still sees that edit. The tools are sync, so each runs on a worker thread.
+    """
+    run: list[ToolCall] = []
+    for tc in tool_calls:
+        if tc.name not in READ_ONLY_TOOLS:
+            logger.info("run_read_only_tool_calls: %s is mutating, run ends", tc.name)
+            break
+        logger.debug("run_read_only_tool_calls: batching %s", tc.name)
+        run.append(tc)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_READ_TOOLS)
+
+    async def call_tool(tc: ToolCall):
+        tool_args = tc.args if isinstance(tc.args, dict) else {}
+        # Same cleanup chat_with_agent applies before a sequential call; both are idempotent
+        sanitize_tool_args(tool_args)
+        tool_args.pop("base_args", None)
+        tool_args.pop("messages", None)
+        async with semaphore:
+            result = await asyncio.to_thread(
+                tools[tc.name], **tool_args, base_args=base_args, messages=messages
+            )
+            if inspect.iscoroutine(result):
+                logger.debug("run_read_only_tool_calls: awaiting %s", tc.name)
+                result = await result
+        logger.info("run_read_only_tool_calls: %s (%s) done", tc.name, tc.id)
+        return result
+
+    logger.info(
+        "run_read_only_tool_calls: running %d read-only call(s) concurrently: %s",
+        len(run),
+        [tc.name for tc in run],
+    )
+    return list(await asyncio.gather(*(call_tool(tc) for tc in run)))
@@ -199,5 +199,154 @@ def test_max_input_uses_full_context_window_no_200k_clamp(
     create_kwargs = mock_claude.messages.create.call_args.kwargs
     # Sonnet 4.6's MAX_OUTPUT_TOKENS is 64_000 per constants/claude.py.
     assert create_kwargs["max_tokens"] == 64_000
-    # The 500k probe must be passed straight to messages.create (no trim) because the unclamped budget (991840) accommodates it.
-    assert create_kwargs["messages"] == [{"role": "user", "content": "x"}]
+    # The 500k probe must be passed straight to messages.create (no trim) because the unclamped budget (991840) accommodates it. The only change is the prompt-cache breakpoint on the newest message.
+    assert create_kwargs["messages"] == [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "x", "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+    ]
+
+
+@patch("services.claude.chat_with_claude.insert_llm_request")
+@patch("services.claude.chat_with_claude.claude")
+def test_chat_with_claude_sends_cache_breakpoints_and_records_cache_usage(
+    mock_claude, mock_insert_llm_request
+):
+    mock_response = Mock()
+    mock_response.content = [Mock(type="text", text="ok")]
+    mock_response.usage = Mock(
+        output_tokens=5, cache_read_input_tokens=900, cache_creation_input_tokens=80
+    )
+    mock_insert_llm_request.return_value = {"total_cost_usd": 0.0}
+    mock_claude.messages.create.return_value = mock_response
+    mock_claude.messages.count_tokens.return_value = Mock(input_tokens=1000)
+    messages = cast(list[MessageParam], [{"role": "user", "content": "cache me"}])
+    tools = cast(
+        list[ToolUnionParam],
+        [{"name": "t", "description": "d", "input_schema": {"type": "object"}}],
+    )
+
+    chat_with_claude(
+        messages=messages,
+        system_content="sys",
+        tools=tools,
+        model_id=ClaudeModelId.SONNET_4_6,
+        usage_id=1,
+        created_by="4:test-user",
+    )
+
+    create_kwargs = mock_claude.messages.create.call_args.kwargs
+    assert create_kwargs["system"] == [
+        {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert create_kwargs["tools"] == [
+        {
+            "name": "t",
+            "description": "d",
+            "input_schema": {"type": "object"},
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    # The caller's list is what gets stored; breakpoints only live on the copies sent to the API.
+    assert messages == [{"role": "user", "content": "cache me"}]
+    insert_kwargs = mock_insert_llm_request.call_args.kwargs
+    assert insert_kwargs["input_messages"] == messages
+    assert insert_kwargs["system_prompt"] == "sys"
+    assert insert_kwargs["cache_read_input_tokens"] == 900
+    assert insert_kwargs["cache_creation_input_tokens"] == 80
+
+
+@patch("services.claude.chat_with_claude.insert_llm_request")
+@patch("services.claude.chat_with_claude.claude")
+def test_streaming_hands_each_tool_use_to_callback_before_stream_ends(
+    mock_claude, mock_insert_llm_request
+):
+    first = Mock(type="tool_use", input={"file_path": "a.py"})
+    first.id = "toolu_1"
+    first.name = "get_local_file_content"
+    second = Mock(type="tool_use", input={"file_path": "b.py"})
+    second.id = "toolu_2"
+    second.name = "write_and_commit_file"
+    final = Mock()
+    final.content = [Mock(type="text", text="Reading."), first, second]
+    final.usage = Mock(output_tokens=40)
+
+    seen: list[str] = []
+    events = [
+        Mock(type="message_start"),
+        Mock(type="content_block_delta"),
+        Mock(type="content_block_stop", content_block=final.content[0]),
+        Mock(type="content_block_stop", content_block=first),
+        Mock(type="content_block_stop", content_block=second),
+    ]
+
+    def stream_events():
+        for event in events:
+            yield event
+        # Nothing is finalized until the whole stream is consumed
+        seen.append("stream end")
+
+    stream = Mock()
+    stream.__iter__ = Mock(side_effect=stream_events)
+    stream.get_final_message.return_value = final
+    mock_claude.messages.stream.return_value.__enter__.return_value = stream
+    mock_claude.messages.count_tokens.return_value = Mock(input_tokens=30)
+    mock_insert_llm_request.return_value = {"total_cost_usd": 0.01}
+
+    def on_tool_call(tc):
+        seen.append(tc.name)
+        return tc.name == "get_local_file_content"
+
+    result = chat_with_claude(
+        messages=cast(list[MessageParam], [{"role": "user", "content": "go"}]),
+        system_content="sys",
+        tools=[],
+        model_id=ClaudeModelId.SONNET_4_6,
+        usage_id=1,
+        created_by="4:test-user",
+        on_tool_call=on_tool_call,
+    )
+
+    assert seen == ["get_local_file_content", "write_and_commit_file", "stream end"]
+    mock_claude.messages.create.assert_not_called()
+    assert set(mock_claude.messages.stream.call_args.kwargs) == {
+        "model",
+        "system",
+        "messages",
+        "tools",
+        "max_tokens",
+    }
+    assert [tc.id for tc in result.tool_calls] == ["toolu_1", "toolu_2"]
+    insert_kwargs = mock_insert_llm_request.call_args.kwargs
+    assert isinstance(insert_kwargs["time_to_first_token_ms"], int)
+    assert isinstance(insert_kwargs["tool_overlap_ms"], int)
+
+
+@patch("services.claude.chat_with_claude.insert_llm_request")
+@patch("services.claude.chat_with_claude.claude")
+def test_non_streaming_records_no_streaming_metrics(
+    mock_claude, mock_insert_llm_request
+):
+    mock_response = Mock()
+    mock_response.content = [Mock(type="text", text="hi")]
+    mock_response.usage = Mock(output_tokens=1)
+    mock_claude.messages.create.return_value = mock_response
+    mock_claude.messages.count_tokens.return_value = Mock(input_tokens=1)
+    mock_insert_llm_request.return_value = {"total_cost_usd": 0.0}
+
+    chat_with_claude(
+        messages=cast(list[MessageParam], [{"role": "user", "content": "hi"}]),
+        system_content="sys",
+        tools=[],
+        model_id=ClaudeModelId.SONNET_4_6,
+        usage_id=1,
+        created_by="4:test-user",
+    )
+
+    mock_claude.messages.stream.assert_not_called()
+    insert_kwargs = mock_insert_llm_request.call_args.kwargs
+    assert insert_kwargs["time_to_first_token_ms"] is None
+    assert insert_kwargs["tool_overlap_ms"] is None
@@ -0,0 +1,150 @@
+from typing import Any, cast
+
+from anthropic.types import MessageParam, ToolUnionParam
+import pytest
+
+from services.claude.plan_prompt_cache import WRITTEN_PREFIXES, plan_prompt_cache
+
+MODEL = "claude-sonnet-4-6"
+TOOLS = cast(
+    list[ToolUnionParam],
+    [
+        {"name": "a", "description": "a", "input_schema": {"type": "object"}},
+        {"name": "b", "description": "b", "input_schema": {"type": "object"}},
+    ],
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_written_prefixes():
+    WRITTEN_PREFIXES.clear()
+    yield
+    WRITTEN_PREFIXES.clear()
+
+
+def make_message(role, content):
+    return cast(MessageParam, {"role": role, "content": content})
+
+
+def cached_positions(messages: list[Any]):
+    return [
+        i
+        for i, msg in enumerate(messages)
+        if isinstance(msg["content"], list) and "cache_control" in msg["content"][-1]
+    ]
+
+
+def test_first_turn_stamps_tools_system_and_tail_only():
+    messages = [make_message("user", "task"), make_message("assistant", "plan")]
+
+    system, tools, cached = plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    assert system == [
+        {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert tools[0] == TOOLS[0]
+    assert tools[1] == {**TOOLS[1], "cache_control": {"type": "ephemeral"}}
+    assert cached == [
+        messages[0],
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "plan",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        },
+    ]
+
+
+def test_inputs_are_not_mutated():
+    block = {"type": "tool_result", "tool_use_id": "t1", "content": "ok"}
+    messages = [make_message("user", "task"), make_message("user", [block])]
+
+    plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    assert block == {"type": "tool_result", "tool_use_id": "t1", "content": "ok"}
+    assert TOOLS[1] == {
+        "name": "b",
+        "description": "b",
+        "input_schema": {"type": "object"},
+    }
+
+
+def test_next_turn_anchors_on_previous_tail():
+    messages = [make_message("user", "task"), make_message("assistant", "plan")]
+    plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    messages += [make_message("user", "more"), make_message("assistant", "done")]
+    _, _, cached = plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    assert cached_positions(cached) == [1, 3]
+
+
+def test_rewritten_history_falls_back_to_longest_intact_prefix():
+    messages = [make_message("user", "task"), make_message("assistant", "plan")]
+    plan_prompt_cache("sys", TOOLS, messages, MODEL)
+    messages += [make_message("user", "file v1"), make_message("assistant", "edit")]
+    plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    # remove_outdated_messages rewrote msg[2]; the prefix written at msg[3] is gone, the one at msg[1] still matches.
+    messages[2] = make_message("user", "file v1 (outdated)")
+    messages.append(make_message("user", "next"))
+    _, _, cached = plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    assert cached_positions(cached) == [1, 4]
+
+
+def test_system_or_tool_change_invalidates_anchor():
+    messages = [make_message("user", "task"), make_message("assistant", "plan")]
+    plan_prompt_cache("sys", TOOLS, messages, MODEL)
+    messages.append(make_message("user", "more"))
+
+    _, _, cached = plan_prompt_cache("other sys", TOOLS, messages, MODEL)
+
+    assert cached_positions(cached) == [2]
+
+
+def test_empty_system_and_tools_pass_through():
+    messages = [make_message("user", "task")]
+
+    system, tools, cached = plan_prompt_cache("", [], messages, MODEL)
+
+    assert system == ""
+    assert tools == []
+    assert cached_positions(cached) == [0]
+
+
+def test_no_messages():
+    system, tools, cached = plan_prompt_cache("sys", TOOLS, [], MODEL)
+
+    assert cached == []
+    assert len(tools) == 2
+    assert isinstance(system, list)
+    assert len(WRITTEN_PREFIXES) == 0
+
+
+def test_empty_string_tail_moves_breakpoint_back():
+    messages = [make_message("user", "task"), make_message("assistant", "")]
+
+    _, _, cached = plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    assert cached_positions(cached) == [0]
+    assert cached[1] == {"role": "assistant", "content": ""}
+
+
+def test_empty_text_block_is_never_stamped():
+    messages = [
+        make_message("user", "task"),
+        make_message("assistant", "plan"),
+        make_message("user", [{"type": "text", "text": ""}]),
+    ]
+    plan_prompt_cache("sys", TOOLS, messages[:2], MODEL)
+
+    _, _, cached = plan_prompt_cache("sys", TOOLS, messages, MODEL)
+
+    # msg[1] was written last turn and is still the newest message that can take a breakpoint
+    assert cached_positions(cached) == [1]
+    assert cached[2] == {"role": "user", "content": [{"type": "text", "text": ""}]}
@@ -0,0 +1,89 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from services.claude.run_read_only_tool_calls import run_read_only_tool_calls
+from services.llm_result import ToolCall
+
+
+@pytest.mark.asyncio
+async def test_runs_leading_read_only_calls_concurrently_in_order(
+    create_test_base_args,
+):
+    # Each query waits until all three are in flight; run one by one, the first would time out at the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_query_file(file_path, **_kwargs):
+        barrier.wait()
+        return f"answer for {file_path}"
+
+    write = Mock()
+    tool_calls = [
+        ToolCall(id="1", name="query_file", args={"file_path": "a.py", "prompt": "?"}),
+        ToolCall(id="2", name="query_file", args={"file_path": "b.py", "prompt": "?"}),
+        ToolCall(id="3", name="query_file", args={"file_path": "c.py", "prompt": "?"}),
+        ToolCall(id="4", name="write_and_commit_file", args={"file_path": "a.py"}),
+        ToolCall(id="5", name="query_file", args={"file_path": "d.py", "prompt": "?"}),
+    ]
+
+    results = await run_read_only_tool_calls(
+        tool_calls=tool_calls,
+        tools={"query_file": fake_query_file, "write_and_commit_file": write},
+        base_args=create_test_base_args(),
+        messages=[],
+    )
+
+    assert results == ["answer for a.py", "answer for b.py", "answer for c.py"]
+    # The run stops at the first mutating call; neither it nor the read after it ran
+    write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_passes_base_args_and_messages_explicitly(create_test_base_args):
+    base_args = create_test_base_args()
+    messages = [{"role": "user", "content": "hi"}]
+    tool = Mock(return_value=["src/a.py"])
+    # Model-supplied base_args/messages are dropped so the real ones don't collide with them
+    args = {"dir_path": "src", "base_args": "bogus", "messages": "bogus"}
+
+    results = await run_read_only_tool_calls(
+        tool_calls=[ToolCall(id="1", name="get_local_file_tree", args=args)],
+        tools={"get_local_file_tree": tool},
+        base_args=base_args,
+        messages=messages,
+    )
+
+    assert results == [["src/a.py"]]
+    tool.assert_called_once_with(dir_path="src", base_args=base_args, messages=messages)
+
+
+@pytest.mark.asyncio
+async def test_none_args_call_tool_with_only_base_args(create_test_base_args):
+    base_args = create_test_base_args()
+    tool = Mock(return_value="diff")
+
+    results = await run_read_only_tool_calls(
+        tool_calls=[ToolCall(id="1", name="git_diff", args=None)],
+        tools={"git_diff": tool},
+        base_args=base_args,
+        messages=[],
+    )
+
+    assert results == ["diff"]
+    tool.assert_called_once_with(base_args=base_args, messages=[])
+
+
+@pytest.mark.asyncio
+async def test_returns_empty_when_first_call_is_mutating(create_test_base_args):
+    write = Mock()
+
+    results = await run_read_only_tool_calls(
+        tool_calls=[ToolCall(id="1", name="write_and_commit_file", args={})],
+        tools={"write_and_commit_file": write},
+        base_args=create_test_base_args(),
+        messages=[],
+    )
+
+    assert not results
+    write.assert_not_called()
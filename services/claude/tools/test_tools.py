@@ -90,6 +90,17 @@ def test_file_edit_tools_moved_to_file_tracking():
         ), f"{tool_name} missing from tools_to_call"
 
 
+def test_read_only_tools_are_dispatchable_and_never_edit_files():
+    # chat_with_agent runs READ_ONLY_TOOLS concurrently, so an edit tool slipping in would race other calls in the turn
+    for tool_name in tools.READ_ONLY_TOOLS:
+        assert (
+            tools.tools_to_call.get(tool_name) is not None
+        ), f"{tool_name} missing from tools_to_call"
+    assert not tools.READ_ONLY_TOOLS & set(FILE_EDIT_TOOLS)
+    for tool_name in ("forget_messages", "run_command", "verify_task_is_complete"):
+        assert tool_name not in tools.READ_ONLY_TOOLS
+
+
 def test_git_diff_in_base_tools():
     # git_diff should be available in all tool sets
     assert tools.GIT_DIFF["name"] == "git_diff"
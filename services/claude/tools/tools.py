@@ -134,3 +134,16 @@ tools_to_call: dict[str, Any] = {
     "web_fetch": web_fetch,
     "write_and_commit_file": write_and_commit_file,
 }
+
+# Tools in tools_to_call with no side effects on the clone, the branch, the PR or the conversation. chat_with_agent runs consecutive calls to these concurrently; every other tool is mutating and runs strictly in order.
+READ_ONLY_TOOLS = frozenset(
+    {
+        "curl",
+        "get_local_file_content",
+        "get_local_file_tree",
+        "git_diff",
+        "query_file",
+        "search_local_file_contents",
+        "web_fetch",
+    }
+)
@@ -1,8 +1,12 @@
 import json
 
+from cachetools import LRUCache
+
 from services.types.base_args import BaseArgs
-from utils.files.read_local_file import read_local_file
 from utils.error.handle_exceptions import handle_exceptions
+from utils.files.get_local_files_signature import get_local_files_signature
+from utils.files.read_local_file import read_local_file
+from utils.logging.logging_config import logger
 
 # Flat configs first (ESLint 9+ default), then legacy configs
 CONFIG_FILES = [
@@ -17,24 +21,44 @@ CONFIG_FILES = [
     ".eslintrc",
 ]
 
+# (clone_dir, stat signature of CONFIG_FILES + package.json) -> resolved config. verify_task_is_complete resolves the config on every pass of the agent loop; the signature drops stale entries when ensure_eslint_relaxed_for_tests or the agent rewrites a config file.
+ESLINT_CONFIG_CACHE: LRUCache[tuple, dict[str, str] | None] = LRUCache(maxsize=256)
+
 
 @handle_exceptions(default_return_value=None, raise_on_error=False)
 def get_eslint_config(base_args: BaseArgs):
     clone_dir = base_args["clone_dir"]
+    signature = get_local_files_signature(clone_dir, CONFIG_FILES + ["package.json"])
+    cache_key = (clone_dir, signature)
+    if signature and cache_key in ESLINT_CONFIG_CACHE:
+        logger.debug("get_eslint_config: cache hit for %s", clone_dir)
+        return ESLINT_CONFIG_CACHE[cache_key]
 
+    config: dict[str, str] | None = None
     for config_file in CONFIG_FILES:
         content = read_local_file(config_file, base_dir=clone_dir)
         if content:
-            return {"filename": config_file, "content": content}
+            logger.info("get_eslint_config: found %s", config_file)
+            config = {"filename": config_file, "content": content}
+            break
 
     # ESLint config can also be defined in package.json under the "eslintConfig" key
-    package_content = read_local_file("package.json", base_dir=clone_dir)
+    package_content = (
+        read_local_file("package.json", base_dir=clone_dir) if not config else None
+    )
     if package_content:
+        logger.debug("get_eslint_config: checking package.json")
         package_json = json.loads(package_content)
         if "eslintConfig" in package_json:
-            return {
+            logger.info("get_eslint_config: found package.json eslintConfig")
+            config = {
                 "filename": "package.json",
                 "content": json.dumps(package_json["eslintConfig"], indent=2),
             }
 
-    return None
+    # An empty signature means no config file exists, so there was nothing to read and nothing worth caching
+    if signature:
+        logger.debug("get_eslint_config: caching result for %s", clone_dir)
+        ESLINT_CONFIG_CACHE[cache_key] = config
+    logger.debug("get_eslint_config: resolved %s", config and config["filename"])
+    return config
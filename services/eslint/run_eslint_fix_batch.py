@@ -0,0 +1,283 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import TypedDict
+
+import sentry_sdk
+
+from config import UTF8
+from services.eslint.eslint_config_has_parser_project import (
+    eslint_config_has_parser_project,
+)
+from services.eslint.get_eslint_config import get_eslint_config
+from services.node.get_dependency_major_version import get_dependency_major_version
+from services.node.get_npm_cache_dir import set_npm_cache_env
+from services.types.base_args import BaseArgs
+from utils.command.run_subprocess_async import run_subprocess_async
+from utils.env.passthrough_env_for_subprocess import passthrough_env_for_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.files.is_source_file import is_source_file
+from utils.logging.logging_config import logger
+
+
+class ESLintMessage(TypedDict, total=False):
+    line: int
+    column: int
+    message: str
+    ruleId: str
+    fatal: bool
+
+
+class ESLintFileResult(TypedDict, total=False):
+    filePath: str
+    messages: list[ESLintMessage]
+
+
+# Rules relevant to coverage/testability (dead code, unreachable code, parsing errors).
+# Other unfixable rules (no-explicit-any, explicit-module-boundary-types) are lint_errors that don't affect coverage but DO fail CI builds with CI=true.
+COVERAGE_RELEVANT_RULES = {
+    "@typescript-eslint/no-unnecessary-condition",
+    "no-unreachable",
+}
+
+
+@dataclass
+class ESLintResult:
+    success: bool
+    content: str | None
+    lint_errors: str | None
+    coverage_errors: str | None
+
+
+@handle_exceptions(default_return_value={}, raise_on_error=False)
+async def run_eslint_fix_batch(*, base_args: BaseArgs, files: dict[str, str]):
+    """Lint and --fix every file in files ({path: content}) and return {path: ESLintResult}, parsing per-file messages from ESLint's JSON formatter.
+
+    Source files and other JS/TS files (tests, configs) need different CLI flags for typed linting, so there is at most one ESLint process for each group. Skipped files (empty, not JS/TS, no ESLint config) get an all-None success result, same as run_eslint_fix.
+    """
+    results: dict[str, ESLintResult] = {}
+    to_lint: list[str] = []
+    for file_path, file_content in files.items():
+        if not file_content.strip():
+            logger.info("ESLint: Skipping %s - empty content", file_path)
+            results[file_path] = ESLintResult(
+                success=True, content=None, lint_errors=None, coverage_errors=None
+            )
+        elif not file_path.endswith((".js", ".jsx", ".ts", ".tsx")):
+            logger.info("ESLint: Skipping %s - not a JS/TS file", file_path)
+            results[file_path] = ESLintResult(
+                success=True, content=None, lint_errors=None, coverage_errors=None
+            )
+        else:
+            logger.debug("ESLint: queueing %s", file_path)
+            to_lint.append(file_path)
+
+    if not to_lint:
+        logger.info("ESLint: Nothing to lint")
+        return results
+
+    eslint_config = get_eslint_config(base_args)
+    if not eslint_config:
+        logger.info("ESLint: Skipping %d files - no ESLint config", len(to_lint))
+        for file_path in to_lint:
+            results[file_path] = ESLintResult(
+                success=True, content=None, lint_errors=None, coverage_errors=None
+            )
+        return results
+
+    config_filename = eslint_config.get("filename", "")
+    is_legacy_config = config_filename.startswith(".eslintrc")
+
+    clone_dir = base_args.get("clone_dir", "")
+
+    # Write to disk and use --fix (alternative: stdin/stdout without file)
+    full_paths = {fp: os.path.join(clone_dir, fp) for fp in to_lint}
+    for file_path, full_path in full_paths.items():
+        # For new files in new directories
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w", encoding=UTF8) as f:
+            f.write(files[file_path])
+
+    env = passthrough_env_for_subprocess()
+    set_npm_cache_env(env)
+
+    # ESLint 9+ uses flat config (eslint.config.js) by default
+    # For repos using legacy .eslintrc.* config, disable flat config mode
+    if is_legacy_config:
+        env["ESLINT_USE_FLAT_CONFIG"] = "false"
+        logger.info("ESLint: Using legacy config mode for %s", config_filename)
+
+    # Check if eslint exists locally before running npx
+    eslint_bin = os.path.join(clone_dir, "node_modules", ".bin", "eslint")
+    eslint_exists = os.path.exists(eslint_bin)
+    logger.info(
+        "ESLint: Local binary exists=%s at %s",
+        eslint_exists,
+        eslint_bin,
+    )
+
+    # Check if we can enable typed linting for unreachable code detection
+    tsconfig_exists = os.path.exists(os.path.join(clone_dir, "tsconfig.json"))
+    ts_eslint_plugin = os.path.exists(
+        os.path.join(clone_dir, "node_modules", "@typescript-eslint", "eslint-plugin")
+    )
+    ts_eslint_parser = os.path.exists(
+        os.path.join(clone_dir, "node_modules", "@typescript-eslint", "parser")
+    )
+    # Typed linting is only for source files (dead code detection for coverage).
+    # Non-source files are typically excluded from tsconfig.json, which causes
+    # ESLint to fail entirely (losing all linting including --fix).
+    typed_linting_available = tsconfig_exists and ts_eslint_plugin and ts_eslint_parser
+    typed_files = [
+        fp for fp in to_lint if typed_linting_available and is_source_file(fp)
+    ]
+    untyped_files = [fp for fp in to_lint if fp not in typed_files]
+
+    eslint_major_version = get_dependency_major_version(clone_dir, "eslint")
+
+    for group, can_use_typed_linting in ((typed_files, True), (untyped_files, False)):
+        if not group:
+            logger.debug("ESLint: empty group (typed=%s)", can_use_typed_linting)
+            continue
+
+        # Build ESLint command
+        # --max-warnings 0: Treat warnings as errors (exit code 1) to match CI behavior.
+        # CRA/craco builds set CI=true which promotes all ESLint warnings to errors.
+        # Without this, ESLint returns exit code 0 for warnings-only, and we skip JSON parsing, missing unfixable warnings like @typescript-eslint/no-explicit-any.
+        cmd = [
+            "npx",
+            "--yes",
+            "eslint",
+            "--fix",
+            "--max-warnings",
+            "0",
+            "--format",
+            "json",
+        ]
+        # --no-warn-ignored: Suppress "File ignored because of a matching ignore pattern" warnings.
+        # Without this, ignored files produce a JSON message with no ruleId that gets
+        # misclassified as a lint error, causing the agent to loop trying to fix it.
+        # Only available in ESLint v9+. Using it on v8 causes fatal error (exit code 2).
+        if eslint_major_version is not None and eslint_major_version >= 9:
+            logger.info("ESLint: v%d, adding --no-warn-ignored", eslint_major_version)
+            cmd.append("--no-warn-ignored")
+        if can_use_typed_linting:
+            cmd.extend(
+                [
+                    "--rule",
+                    "@typescript-eslint/no-unnecessary-condition: error",
+                ]
+            )
+            # Only add --parser-options if the repo's ESLint config doesn't already specify a project. CLI --parser-options overrides config file settings, which breaks repos that use a dedicated tsconfig for linting (e.g., tsconfig.eslint.json).
+            if not eslint_config_has_parser_project(eslint_config):
+                logger.info("ESLint: config has no parser project, using tsconfig.json")
+                cmd.extend(["--parser-options", "project:tsconfig.json"])
+            logger.info("ESLint: Typed linting enabled for unreachable code detection")
+        cmd.extend(full_paths[fp] for fp in group)
+
+        # --yes: fallback to download if not in node_modules
+        logger.info("ESLint: Running eslint with --fix on %d files...", len(group))
+        result = await run_subprocess_async(cmd, cwd=clone_dir, env=env)
+
+        fixed_contents: dict[str, str] = {}
+        for file_path in group:
+            with open(full_paths[file_path], "r", encoding=UTF8) as f:
+                fixed_contents[file_path] = f.read()
+
+        # ESLint exit codes:
+        # 0 = no linting errors
+        # 1 = linting errors found (some fixable, some not)
+        # 2+ = fatal error (bad config, missing file, crash, invalid CLI option)
+        if result.returncode == 0:
+            logger.info("ESLint: Successfully fixed %s", ", ".join(group))
+            for file_path in group:
+                results[file_path] = ESLintResult(
+                    success=True,
+                    content=fixed_contents[file_path],
+                    lint_errors=None,
+                    coverage_errors=None,
+                )
+            continue
+
+        if result.returncode >= 2:
+            error_msg = result.stderr.strip() or "Fatal ESLint error"
+            # Fatal ESLint errors are infrastructure issues (invalid CLI options, missing plugins, bad config), not code issues the agent can fix. Reporting them as lint_errors causes the agent to loop endlessly calling verify_task_is_complete.
+            logger.warning(
+                "ESLint fatal error for %s (non-blocking): %s",
+                ", ".join(group),
+                error_msg,
+            )
+            for file_path in group:
+                results[file_path] = ESLintResult(
+                    success=True, content=None, lint_errors=None, coverage_errors=None
+                )
+            continue
+
+        # ESLint reports absolute filePath; match on that, the repo-relative path, or the only file in the group
+        by_full_path = {os.path.normpath(full_paths[fp]): fp for fp in group}
+        lint_errors: dict[str, list[str]] = {fp: [] for fp in group}
+        coverage_errors: dict[str, list[str]] = {fp: [] for fp in group}
+        eslint_output: list[ESLintFileResult] = []
+        if result.stdout:
+            logger.info("ESLint: parsing JSON output for %d files", len(group))
+            try:
+                eslint_output = json.loads(result.stdout)
+            except json.JSONDecodeError as e:
+                logger.warning("ESLint: could not parse JSON output")
+                sentry_sdk.capture_exception(e)
+        for file_result in eslint_output:
+            reported = file_result.get("filePath", "")
+            owner = by_full_path.get(os.path.normpath(reported)) if reported else None
+            if not owner and reported in lint_errors:
+                logger.debug("ESLint: %s reported by relative path", reported)
+                owner = reported
+            if not owner and len(group) == 1:
+                logger.debug("ESLint: attributing %s to single file", reported)
+                owner = group[0]
+            if not owner:
+                logger.warning("ESLint: result for unknown file %s", reported)
+                continue
+            for message in file_result.get("messages", []):
+                rule_id = message.get("ruleId") or ""
+                # Skip infrastructure messages (e.g., "File ignored")
+                if not rule_id:
+                    logger.debug("ESLint: skipping message without ruleId")
+                    continue
+                line = message.get("line", "?")
+                msg = message.get("message", "Unknown error")
+                rule_suffix = f" ({rule_id})"
+                error_str = f"Line {line}: {msg}{rule_suffix}"
+                if rule_id in COVERAGE_RELEVANT_RULES:
+                    logger.debug("ESLint: coverage error in %s", owner)
+                    coverage_errors[owner].append(error_str)
+                else:
+                    logger.debug("ESLint: lint error in %s", owner)
+                    lint_errors[owner].append(error_str)
+
+        for file_path in group:
+            file_lint = lint_errors[file_path]
+            file_coverage = coverage_errors[file_path]
+            if file_lint or file_coverage:
+                logger.warning(
+                    "ESLint: Remaining errors in %s: %s",
+                    file_path,
+                    "; ".join(file_lint + file_coverage),
+                )
+                results[file_path] = ESLintResult(
+                    success=False,
+                    content=fixed_contents[file_path],
+                    lint_errors="; ".join(file_lint) if file_lint else None,
+                    coverage_errors=(
+                        "; ".join(file_coverage) if file_coverage else None
+                    ),
+                )
+            else:
+                logger.info("ESLint: Successfully fixed %s", file_path)
+                results[file_path] = ESLintResult(
+                    success=True,
+                    content=fixed_contents[file_path],
+                    lint_errors=None,
+                    coverage_errors=None,
+                )
+
+    return results
@@ -478,3 +478,31 @@ def test_get_eslint_config_skips_to_package_json_when_no_config_files(
         assert result is not None
         assert result["filename"] == "package.json"
         assert call_count == 10  # 9 config files + 1 package.json
+
+
+def test_get_eslint_config_caches_until_config_changes(create_test_base_args, tmp_path):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+    config_path = tmp_path / "eslint.config.js"
+    config_path.write_text("export default [];", encoding="utf-8")
+
+    with patch(
+        "services.eslint.get_eslint_config.read_local_file",
+        side_effect=lambda file_name, base_dir: (
+            config_path.read_text(encoding="utf-8")
+            if file_name == "eslint.config.js"
+            else None
+        ),
+    ) as mock_read:
+        first = get_eslint_config(base_args)
+        second = get_eslint_config(base_args)
+        reads_after_second_call = mock_read.call_count
+
+        config_path.write_text("export default [{ rules: {} }];", encoding="utf-8")
+        third = get_eslint_config(base_args)
+
+    assert reads_after_second_call == 2
+    assert first == second
+    assert first is not None
+    assert first["content"] == "export default [];"
+    assert third is not None
+    assert third["content"] == "export default [{ rules: {} }];"
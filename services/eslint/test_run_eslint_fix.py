@@ -51,7 +51,9 @@ async def test_run_eslint_fix_skips_whitespace_only(create_test_base_args):
 @pytest.mark.asyncio
 async def test_run_eslint_fix_skips_when_no_config(create_test_base_args):
     base_args = create_test_base_args()
-    with patch("services.eslint.run_eslint_fix.get_eslint_config", return_value=None):
+    with patch(
+        "services.eslint.run_eslint_fix_batch.get_eslint_config", return_value=None
+    ):
         coro = run_eslint_fix(
             base_args=base_args,
             file_path="test.ts",
@@ -71,17 +73,17 @@ async def test_run_eslint_fix_sets_npm_cache_env_on_lambda(create_test_base_args
         env["npm_config_cache"] = "/tmp/.npm"
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
         with patch(
-            "services.eslint.run_eslint_fix.set_npm_cache_env",
+            "services.eslint.run_eslint_fix_batch.set_npm_cache_env",
             side_effect=mock_set_npm_cache_env,
         ):
-            with patch("services.eslint.run_eslint_fix.os.makedirs"):
+            with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="formatted")):
                     with patch(
-                        "services.eslint.run_eslint_fix.subprocess.run"
+                        "services.eslint.run_eslint_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         mock_run.return_value = MagicMock(
                             returncode=0, stdout=eslint_output
@@ -108,12 +110,14 @@ async def test_run_eslint_fix_returns_fixed_content(create_test_base_args):
     eslint_output = json.dumps([{"filePath": "test.js", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data=fixed_content)):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output, stderr=""
                     )
@@ -151,18 +155,20 @@ async def test_run_eslint_fix_with_unfixable_errors(create_test_base_args):
     )
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=1, stdout=eslint_output, stderr=""
                     )
 
                     with patch(
-                        "services.eslint.run_eslint_fix.sentry_sdk.capture_message"
+                        "services.eslint.run_eslint_fix_batch.sentry_sdk.capture_message"
                     ):
                         coro = run_eslint_fix(
                             base_args=base_args,
@@ -184,18 +190,20 @@ async def test_run_eslint_fix_with_json_decode_error(create_test_base_args):
     file_content = "export const foo = 'bar';\n"
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout="not json output", stderr=""
                     )
 
                     with patch(
-                        "services.eslint.run_eslint_fix.sentry_sdk.capture_exception"
+                        "services.eslint.run_eslint_fix_batch.sentry_sdk.capture_exception"
                     ):
                         coro = run_eslint_fix(
                             base_args=base_args,
@@ -214,12 +222,14 @@ async def test_run_eslint_fix_fatal_error_is_non_blocking(create_test_base_args)
     # They should not block task completion by returning lint_errors.
     base_args = create_test_base_args()
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open()):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=2, stdout="", stderr="Fatal error"
                     )
@@ -241,12 +251,14 @@ async def test_run_eslint_fix_fatal_error_is_non_blocking(create_test_base_args)
 async def test_run_eslint_fix_timeout_returns_none(create_test_base_args):
     base_args = create_test_base_args()
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open()):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.side_effect = subprocess.TimeoutExpired(
                         cmd="npx eslint", timeout=SUBPROCESS_TIMEOUT_SECONDS
                     )
@@ -277,12 +289,14 @@ async def test_run_eslint_fix_supported_extensions(create_test_base_args, file_p
     eslint_output = json.dumps([{"filePath": file_path, "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data="formatted")):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output, stderr=""
                     )
@@ -310,12 +324,14 @@ async def test_run_eslint_fix_creates_directories(create_test_base_args):
     )
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs") as mock_makedirs:
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs") as mock_makedirs:
             with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output, stderr=""
                     )
@@ -339,12 +355,14 @@ async def test_run_eslint_fix_sets_flat_config_false_for_legacy_config(
     eslint_output = json.dumps([{"filePath": "test.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data="formatted")):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output
                     )
@@ -371,12 +389,14 @@ async def test_run_eslint_fix_does_not_set_flat_config_for_new_config(
     eslint_output = json.dumps([{"filePath": "test.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": "eslint.config.js", "content": "export default {};"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data="formatted")):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output
                     )
@@ -413,12 +433,14 @@ async def test_run_eslint_fix_legacy_config_variants(
     eslint_output = json.dumps([{"filePath": "test.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": config_filename, "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data="formatted")):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output
                     )
@@ -449,14 +471,16 @@ async def test_run_eslint_fix_skips_parser_options_when_config_has_project(
     eslint_output = json.dumps([{"filePath": "src/index.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": eslint_config_content},
     ):
-        with patch("services.eslint.run_eslint_fix.os.path.exists", return_value=True):
-            with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch(
+            "services.eslint.run_eslint_fix_batch.os.path.exists", return_value=True
+        ):
+            with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="formatted")):
                     with patch(
-                        "services.eslint.run_eslint_fix.subprocess.run"
+                        "services.eslint.run_eslint_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         mock_run.return_value = MagicMock(
                             returncode=0, stdout=eslint_output
@@ -485,14 +509,16 @@ async def test_run_eslint_fix_adds_parser_options_when_config_lacks_project(
     eslint_output = json.dumps([{"filePath": "src/index.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.path.exists", return_value=True):
-            with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch(
+            "services.eslint.run_eslint_fix_batch.os.path.exists", return_value=True
+        ):
+            with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="formatted")):
                     with patch(
-                        "services.eslint.run_eslint_fix.subprocess.run"
+                        "services.eslint.run_eslint_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         mock_run.return_value = MagicMock(
                             returncode=0, stdout=eslint_output
@@ -518,17 +544,17 @@ async def test_run_eslint_fix_includes_no_warn_ignored_for_v9(create_test_base_a
     eslint_output = json.dumps([{"filePath": "test.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": "eslint.config.js", "content": "export default {};"},
     ):
         with patch(
-            "services.eslint.run_eslint_fix.get_dependency_major_version",
+            "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
             return_value=9,
         ):
-            with patch("services.eslint.run_eslint_fix.os.makedirs"):
+            with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="formatted")):
                     with patch(
-                        "services.eslint.run_eslint_fix.subprocess.run"
+                        "services.eslint.run_eslint_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         mock_run.return_value = MagicMock(
                             returncode=0, stdout=eslint_output, stderr=""
@@ -574,17 +600,17 @@ async def test_run_eslint_fix_ignores_file_ignored_message_on_v8(create_test_bas
     )
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
         with patch(
-            "services.eslint.run_eslint_fix.get_dependency_major_version",
+            "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
             return_value=8,
         ):
-            with patch("services.eslint.run_eslint_fix.os.makedirs"):
+            with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="const x = 1;")):
                     with patch(
-                        "services.eslint.run_eslint_fix.subprocess.run"
+                        "services.eslint.run_eslint_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         # ESLint v7/v8 returns exit code 0 for ignored files (warningCount=1, errorCount=0)
                         mock_run.return_value = MagicMock(
@@ -612,17 +638,17 @@ async def test_run_eslint_fix_excludes_no_warn_ignored_for_v8(create_test_base_a
     eslint_output = json.dumps([{"filePath": "test.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
         with patch(
-            "services.eslint.run_eslint_fix.get_dependency_major_version",
+            "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
             return_value=8,
         ):
-            with patch("services.eslint.run_eslint_fix.os.makedirs"):
+            with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="formatted")):
                     with patch(
-                        "services.eslint.run_eslint_fix.subprocess.run"
+                        "services.eslint.run_eslint_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         mock_run.return_value = MagicMock(
                             returncode=0, stdout=eslint_output, stderr=""
@@ -648,12 +674,14 @@ async def test_run_eslint_fix_includes_max_warnings_zero(create_test_base_args):
     eslint_output = json.dumps([{"filePath": "test.ts", "messages": []}])
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data="formatted")):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=0, stdout=eslint_output, stderr=""
                     )
@@ -697,12 +725,14 @@ async def test_run_eslint_fix_catches_unfixable_warnings(create_test_base_args):
     )
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=1, stdout=eslint_output, stderr=""
                     )
@@ -743,12 +773,14 @@ async def test_run_eslint_fix_skips_messages_without_rule_id(create_test_base_ar
     )
 
     with patch(
-        "services.eslint.run_eslint_fix.get_eslint_config",
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
         return_value={"filename": ".eslintrc.json", "content": "{}"},
     ):
-        with patch("services.eslint.run_eslint_fix.os.makedirs"):
+        with patch("services.eslint.run_eslint_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch("services.eslint.run_eslint_fix.subprocess.run") as mock_run:
+                with patch(
+                    "services.eslint.run_eslint_fix_batch.run_subprocess_async"
+                ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=1, stdout=eslint_output, stderr=""
                     )
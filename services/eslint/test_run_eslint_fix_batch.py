@@ -0,0 +1,178 @@
+# pylint: disable=unused-argument
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.eslint.run_eslint_fix_batch import ESLintResult, run_eslint_fix_batch
+
+
+def make_typed_repo(clone_dir: Path):
+    (clone_dir / "tsconfig.json").write_text("{}", encoding="utf-8")
+    for package in ("eslint-plugin", "parser"):
+        (clone_dir / "node_modules" / "@typescript-eslint" / package).mkdir(
+            parents=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_eslint_fix_batch_runs_one_process_per_group(
+    create_test_base_args, tmp_path: Path
+):
+    make_typed_repo(tmp_path)
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+
+    with patch(
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
+        return_value={"filename": "eslint.config.js", "content": "export default []"},
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
+        return_value=9,
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.run_subprocess_async",
+        return_value=MagicMock(returncode=0, stdout="[]", stderr=""),
+    ) as mock_run:
+        results = await run_eslint_fix_batch(
+            base_args=base_args,
+            files={
+                "src/a.ts": "const a = 1;\n",
+                "src/b.ts": "const b = 1;\n",
+                "src/a.test.ts": "test('a', () => {});\n",
+            },
+        )
+
+    assert mock_run.call_count == 2
+    typed_cmd = mock_run.call_args_list[0][0][0]
+    untyped_cmd = mock_run.call_args_list[1][0][0]
+    base_cmd = [
+        "npx",
+        "--yes",
+        "eslint",
+        "--fix",
+        "--max-warnings",
+        "0",
+        "--format",
+        "json",
+        "--no-warn-ignored",
+    ]
+    assert typed_cmd == base_cmd + [
+        "--rule",
+        "@typescript-eslint/no-unnecessary-condition: error",
+        "--parser-options",
+        "project:tsconfig.json",
+        str(tmp_path / "src/a.ts"),
+        str(tmp_path / "src/b.ts"),
+    ]
+    assert untyped_cmd == base_cmd + [str(tmp_path / "src/a.test.ts")]
+    assert results["src/a.ts"] == ESLintResult(
+        success=True, content="const a = 1;\n", lint_errors=None, coverage_errors=None
+    )
+    assert results["src/a.test.ts"] == ESLintResult(
+        success=True,
+        content="test('a', () => {});\n",
+        lint_errors=None,
+        coverage_errors=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_eslint_fix_batch_attributes_messages_by_file_path(
+    create_test_base_args, tmp_path: Path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+    eslint_output = [
+        {"filePath": str(tmp_path / "src/clean.js"), "messages": []},
+        {
+            "filePath": str(tmp_path / "src/dirty.js"),
+            "messages": [
+                {"line": 3, "message": "'x' is unused", "ruleId": "no-unused-vars"},
+                {"line": 5, "message": "Unreachable code", "ruleId": "no-unreachable"},
+            ],
+        },
+    ]
+
+    with patch(
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
+        return_value={"filename": "eslint.config.js", "content": "export default []"},
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
+        return_value=9,
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.run_subprocess_async",
+        return_value=MagicMock(
+            returncode=1, stdout=json.dumps(eslint_output), stderr=""
+        ),
+    ) as mock_run:
+        results = await run_eslint_fix_batch(
+            base_args=base_args,
+            files={"src/clean.js": "ok();\n", "src/dirty.js": "dirty();\n"},
+        )
+
+    mock_run.assert_called_once()
+    assert results["src/clean.js"] == ESLintResult(
+        success=True, content="ok();\n", lint_errors=None, coverage_errors=None
+    )
+    assert results["src/dirty.js"] == ESLintResult(
+        success=False,
+        content="dirty();\n",
+        lint_errors="Line 3: 'x' is unused (no-unused-vars)",
+        coverage_errors="Line 5: Unreachable code (no-unreachable)",
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_eslint_fix_batch_fatal_error_is_non_blocking_for_group(
+    create_test_base_args, tmp_path: Path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+
+    with patch(
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
+        return_value={"filename": "eslint.config.js", "content": "export default []"},
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
+        return_value=9,
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.run_subprocess_async",
+        return_value=MagicMock(returncode=2, stdout="", stderr="Invalid option"),
+    ):
+        results = await run_eslint_fix_batch(
+            base_args=base_args,
+            files={"src/a.js": "a();\n", "src/b.js": "b();\n"},
+        )
+
+    empty = ESLintResult(
+        success=True, content=None, lint_errors=None, coverage_errors=None
+    )
+    assert results == {"src/a.js": empty, "src/b.js": empty}
+
+
+@pytest.mark.asyncio
+async def test_run_eslint_fix_batch_malformed_json_keeps_fixed_content(
+    create_test_base_args, tmp_path: Path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+
+    with patch(
+        "services.eslint.run_eslint_fix_batch.get_eslint_config",
+        return_value={"filename": "eslint.config.js", "content": "export default []"},
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.get_dependency_major_version",
+        return_value=9,
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.run_subprocess_async",
+        return_value=MagicMock(returncode=1, stdout="not json", stderr=""),
+    ), patch(
+        "services.eslint.run_eslint_fix_batch.sentry_sdk.capture_exception"
+    ) as mock_capture:
+        results = await run_eslint_fix_batch(
+            base_args=base_args, files={"src/a.js": "a();\n"}
+        )
+
+    mock_capture.assert_called_once()
+    assert results == {
+        "src/a.js": ESLintResult(
+            success=True, content="a();\n", lint_errors=None, coverage_errors=None
+        )
+    }
@@ -1,4 +1,3 @@
-from services.aws.s3.download_and_extract_dependency import download_and_extract_s3_deps
 from services.git.copy_config_templates import copy_config_templates
 from services.git.get_clone_url import get_clone_url
 from services.git.git_checkout import git_checkout
@@ -32,10 +31,7 @@ def clone_repo_and_install_dependencies(
         return False
     git_checkout(clone_dir, pr_branch)
 
-    # Step 3: Extract cached dependencies from S3
-    download_and_extract_s3_deps(owner_name=owner, repo_name=repo, clone_dir=clone_dir)
-
-    # Step 4: Copy config templates (e.g., .env.example → .env)
+    # Step 3: Copy config templates (e.g., .env.example → .env)
     copy_config_templates(clone_dir)
     logger.info("clone_repo_and_install_dependencies: completed for %s", clone_dir)
     return True
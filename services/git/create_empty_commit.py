@@ -1,4 +1,7 @@
 from services.git.get_branch_head_author import get_branch_head_author
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
 from services.types.base_args import BaseArgs
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
@@ -37,5 +40,7 @@ def create_empty_commit(
         )
         return False
 
+    # The new head commit changes what GitHub returns for this repo (PR head, check suites)
+    invalidate_github_response_cache(base_args["owner"], base_args["repo"])
     logger.info("create_empty_commit pushed on %s", branch)
     return True
@@ -1,3 +1,6 @@
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
 from services.types.base_args import BaseArgs
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
@@ -25,3 +28,5 @@ def create_remote_branch(sha: str, base_args: BaseArgs) -> None:
         args=["git", "push", clone_url, f"{sha}:refs/heads/{branch_name}"],
         cwd=clone_dir,
     )
+    # Branch listings and refs cached before the push no longer match the remote
+    invalidate_github_response_cache(base_args["owner"], base_args["repo"])
@@ -1,10 +1,11 @@
+from services.git.split_clone_url_auth import split_clone_url_auth
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
 
 @handle_exceptions(default_return_value=False, raise_on_error=False)
-def deepen_until_merge_base(clone_dir: str, base_branch: str):
+def deepen_until_merge_base(clone_dir: str, clone_url: str, base_branch: str):
     """Fetch enough history of origin/base_branch that HEAD and origin/base_branch share a visible merge-base.
 
     Why this exists: GitAuto clones repos with `git clone --depth 1` and fetches PR branches with `git fetch --depth 1`. Both histories are 1-commit deep with no commits in common locally, so any operation that needs the merge-base (git merge, three-dot git diff, etc.) fails with 'no merge base' or similar.
@@ -18,6 +19,8 @@ def deepen_until_merge_base(clone_dir: str, base_branch: str):
     - git_diff: falls back here when three-dot diff syntax fails on a shallow clone (Sentry AGENT-3JQ/3J2/3J3 on gitautoai/website PR 821, 2026-04-20).
 
     Centralizing the schedule means both callers stay in lockstep when we tune it.
+
+    origin holds no token (see git_clone_to_tmp), so the fetches carry clone_url's credentials as per-command auth args.
     """
     try:
         run_subprocess(
@@ -30,13 +33,15 @@ def deepen_until_merge_base(clone_dir: str, base_branch: str):
             "deepen_until_merge_base: merge-base missing, starting exponential deepen"
         )
 
+    _, auth_args = split_clone_url_auth(clone_url)
     depth = 100
     while depth <= 12500:
         logger.info(
             "deepen_until_merge_base: deepening origin/%s by %d", base_branch, depth
         )
         run_subprocess(
-            ["git", "fetch", "--deepen", str(depth), "origin", base_branch], clone_dir
+            ["git", *auth_args, "fetch", "--deepen", str(depth), "origin", base_branch],
+            clone_dir,
         )
         try:
             run_subprocess(
@@ -53,5 +58,7 @@ def deepen_until_merge_base(clone_dir: str, base_branch: str):
     logger.warning(
         "deepen_until_merge_base: exponential deepen exhausted, falling back to --unshallow"
     )
-    run_subprocess(["git", "fetch", "--unshallow", "origin", base_branch], clone_dir)
+    run_subprocess(
+        ["git", *auth_args, "fetch", "--unshallow", "origin", base_branch], clone_dir
+    )
     return True
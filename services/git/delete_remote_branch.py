@@ -1,6 +1,10 @@
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
 from services.types.base_args import BaseArgs
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
 
 
 @handle_exceptions(default_return_value=False, raise_on_error=False)
@@ -13,4 +17,7 @@ def delete_remote_branch(base_args: BaseArgs):
         args=["git", "push", clone_url, "--delete", branch_name],
         cwd=clone_dir,
     )
+    # Branch listings and refs cached before the push no longer match the remote
+    invalidate_github_response_cache(base_args["owner"], base_args["repo"])
+    logger.info("delete_remote_branch: deleted %s", branch_name)
     return True
@@ -1,5 +1,6 @@
 import os
 
+from services.git.get_repo_snapshot import get_repo_snapshot
 from services.git.tree import Tree
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
@@ -19,11 +20,29 @@ def get_file_tree(clone_dir: str, ref: str, root_only: bool = False):
         logger.warning("No valid git repo at %s", clone_dir)
         return tree_items
 
-    # -r: recursive, -l: show size, --full-tree: show full paths
-    args = ["git", "ls-tree", "--full-tree", "-l"]
+    # The recursive listing is the shared snapshot other file-discovery helpers read too
     if not root_only:
-        args.append("-r")
-    args.append(ref)
+        snapshot = get_repo_snapshot(clone_dir, ref)
+        if snapshot is None:
+            logger.warning("get_file_tree: no snapshot for ref %s", ref)
+            return tree_items
+
+        for file in snapshot.files:
+            item: Tree = {
+                "path": file.path,
+                "mode": file.mode,
+                "type": file.type,
+                "sha": file.sha,
+            }
+            if file.size is not None:
+                logger.debug("get_file_tree: %s is %d bytes", file.path, file.size)
+                item["size"] = file.size
+            tree_items.append(item)
+        logger.info("get_file_tree: %d items at %s", len(tree_items), ref)
+        return tree_items
+
+    # -l: show size, --full-tree: show full paths
+    args = ["git", "ls-tree", "--full-tree", "-l", ref]
 
     try:
         result = run_subprocess(args=args, cwd=clone_dir)
@@ -33,10 +52,12 @@ def get_file_tree(clone_dir: str, ref: str, root_only: bool = False):
 
     output = result.stdout.strip() if result and result.stdout else ""
     if not output:
+        logger.info("get_file_tree: empty listing at %s", ref)
         return tree_items
 
     for line in output.split("\n"):
         if not line.strip():
+            logger.debug("get_file_tree: skipping blank line")
             continue
         # Format: "<mode> <type> <sha> <size>\t<path>"
         # Size is "-" for trees (directories)
@@ -54,8 +75,10 @@ def get_file_tree(clone_dir: str, ref: str, root_only: bool = False):
             "sha": sha,
         }
         if size_str != "-":
+            logger.debug("get_file_tree: %s is %s bytes", path, size_str)
             item["size"] = int(size_str)
 
         tree_items.append(item)
 
+    logger.info("get_file_tree: %d root items at %s", len(tree_items), ref)
     return tree_items
@@ -0,0 +1,40 @@
+from services.git.get_file_tree import get_file_tree
+from services.git.split_clone_url_auth import split_clone_url_auth
+from services.git.tree import Tree
+from utils.command.run_subprocess import run_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=[], raise_on_error=False)
+def get_file_tree_at_commit(clone_dir: str, clone_url: str, commit_sha: str):
+    """get_file_tree for an older commit that a depth-1 clone may not have, fetching just that commit from origin when it is missing.
+
+    Returns [] when the commit can't be read (force-pushed away, fetch refused), which callers must treat as "unknown", not "empty".
+    """
+    try:
+        run_subprocess(
+            args=["git", "cat-file", "-e", f"{commit_sha}^{{commit}}"], cwd=clone_dir
+        )
+        logger.info("get_file_tree_at_commit: %s already in %s", commit_sha, clone_dir)
+    except ValueError:
+        logger.info(
+            "get_file_tree_at_commit: fetching %s into %s", commit_sha, clone_dir
+        )
+        # --depth 1: only the tree of that commit is needed, not its history. origin holds no token, so it goes on the command.
+        _, auth_args = split_clone_url_auth(clone_url)
+        try:
+            run_subprocess(
+                args=["git", *auth_args, "fetch", "--depth", "1", "origin", commit_sha],
+                cwd=clone_dir,
+            )
+        except ValueError as e:
+            logger.warning(
+                "get_file_tree_at_commit: cannot fetch %s: %s", commit_sha, e
+            )
+            empty: list[Tree] = []
+            return empty
+
+    tree_items = get_file_tree(clone_dir=clone_dir, ref=commit_sha)
+    logger.info("get_file_tree_at_commit: %d items at %s", len(tree_items), commit_sha)
+    return tree_items
@@ -0,0 +1,140 @@
+import os
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+
+from cachetools import LRUCache
+
+from constants.files import TEST_NAMING_PATTERNS
+from utils.command.run_subprocess import run_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.files.is_code_file import is_code_file
+from utils.files.is_config_file import is_config_file
+from utils.files.is_dependency_file import is_dependency_file
+from utils.files.is_test_file import is_test_file
+from utils.files.is_type_file import is_type_file
+from utils.logging.logging_config import logger
+
+
+@dataclass(frozen=True)
+class RepoSnapshotFile:
+    path: str  # "src/main.py", relative to the repo root
+    mode: str  # "100644", "120000" for symlinks, "160000" for submodules
+    type: str  # "blob", or "commit" for submodules
+    sha: str  # Blob SHA at the snapshot commit
+    size: int | None  # None for submodules
+
+    # Classification bits are worked out on first read and kept with the file, so helpers sharing a snapshot classify each path at most once and nobody pays for a bit no helper reads
+
+    @cached_property
+    def test_naming_pattern(self):
+        """TestNamingPattern.name matched by the file name, e.g. "dot_test" for foo.test.ts."""
+        filename_lower = self.path.rsplit("/", 1)[-1].lower()
+        for p in TEST_NAMING_PATTERNS:
+            if p.detect.search(filename_lower):  # pylint: disable=no-member
+                logger.debug("%s matches naming pattern %s", self.path, p.name)
+                return p.name
+        logger.debug("%s matches no naming pattern", self.path)
+        return None
+
+    @cached_property
+    def is_test(self):
+        # is_test_file tries the naming patterns first, so a test-named file needs no second pass
+        logger.debug("RepoSnapshotFile: classifying %s as test?", self.path)
+        return self.test_naming_pattern is not None or is_test_file(self.path)
+
+    @cached_property
+    def is_code(self):
+        logger.debug("RepoSnapshotFile: classifying %s as code?", self.path)
+        return is_code_file(self.path)
+
+    @cached_property
+    def is_config(self):
+        logger.debug("RepoSnapshotFile: classifying %s as config?", self.path)
+        return is_config_file(self.path)
+
+    @cached_property
+    def is_type(self):
+        logger.debug("RepoSnapshotFile: classifying %s as type?", self.path)
+        return is_type_file(self.path)
+
+    @cached_property
+    def is_dependency(self):
+        logger.debug("RepoSnapshotFile: classifying %s as dependency?", self.path)
+        return is_dependency_file(self.path)
+
+
+@dataclass(frozen=True)
+class RepoSnapshot:
+    clone_dir: str
+    commit: str
+    files: list[RepoSnapshotFile]
+
+
+# Keyed by (clone_dir, commit SHA), so a fetch, checkout or commit can never serve an old listing; a handful covers the clones one invocation touches
+REPO_SNAPSHOTS: LRUCache[tuple[str, str], RepoSnapshot] = LRUCache(maxsize=8)
+
+# Read-only agent tools (search, tree listing) run on threads
+REPO_SNAPSHOTS_LOCK = threading.Lock()
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def get_repo_snapshot(clone_dir: str, ref: str = "HEAD"):
+    """Return the RepoSnapshot of every tracked file at ref in clone_dir, or None when clone_dir is not a git clone or ref does not resolve.
+
+    One `git ls-tree` per clone and commit replaces the os.walk / ls-files / ls-tree that each file-discovery helper used to run on its own; later calls cost a `git rev-parse`.
+    """
+    if not clone_dir or not os.path.isdir(os.path.join(clone_dir, ".git")):
+        logger.warning("get_repo_snapshot: no valid git repo at %s", clone_dir)
+        return None
+
+    try:
+        commit = run_subprocess(
+            args=["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=clone_dir,
+        ).stdout.strip()
+    except ValueError as e:
+        logger.warning("get_repo_snapshot: cannot resolve %s: %s", ref, e)
+        return None
+
+    key = (clone_dir, commit)
+    with REPO_SNAPSHOTS_LOCK:
+        snapshot = REPO_SNAPSHOTS.get(key)
+    if snapshot is not None:
+        logger.info(
+            "get_repo_snapshot: reusing snapshot of %s at %s", clone_dir, commit
+        )
+        return snapshot
+
+    # -z: NUL-terminated entries with unquoted paths (non-ASCII names come back verbatim), -r: recursive, -l: blob sizes
+    output = run_subprocess(
+        args=["git", "ls-tree", "--full-tree", "-r", "-l", "-z", commit],
+        cwd=clone_dir,
+    ).stdout
+
+    files: list[RepoSnapshotFile] = []
+    for entry in output.split("\0"):
+        if not entry:
+            logger.debug("get_repo_snapshot: skipping empty entry")
+            continue
+
+        # Format: "<mode> <type> <sha> <size>\t<path>", size is "-" for submodules
+        meta, path = entry.split("\t", 1)
+        mode, obj_type, sha, size = meta.split()
+        files.append(
+            RepoSnapshotFile(
+                path=path,
+                mode=mode,
+                type=obj_type,
+                sha=sha,
+                size=None if size == "-" else int(size),
+            )
+        )
+
+    snapshot = RepoSnapshot(clone_dir=clone_dir, commit=commit, files=files)
+    with REPO_SNAPSHOTS_LOCK:
+        REPO_SNAPSHOTS[key] = snapshot
+    logger.info(
+        "get_repo_snapshot: %d files in %s at %s", len(files), clone_dir, commit
+    )
+    return snapshot
@@ -0,0 +1,12 @@
+from utils.command.run_subprocess import run_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value="", raise_on_error=False)
+def get_tree_sha(clone_dir: str, ref: str):
+    """SHA of the root tree of ref. Two commits with the same tree SHA have identical file listings."""
+    result = run_subprocess(args=["git", "rev-parse", f"{ref}^{{tree}}"], cwd=clone_dir)
+    sha = result.stdout.strip()
+    logger.info("Tree of %s in %s: %s", ref, clone_dir, sha)
+    return sha
@@ -1,6 +1,10 @@
 import os
+import shutil
 
+from services.aws.evict_other_owner_clones import evict_other_owner_clones
+from services.aws.touch_clone_cache import touch_clone_cache
 from services.git.set_git_identity import set_git_identity
+from services.git.split_clone_url_auth import split_clone_url_auth
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -8,26 +12,37 @@ from utils.logging.logging_config import logger
 
 @handle_exceptions(default_return_value=None, raise_on_error=False)
 def git_clone_to_tmp(clone_dir: str, clone_url: str, branch: str):
+    # Cached clones survive warm starts; drop every other owner's before this owner's code (tests, npm scripts) can run next to them
+    evict_other_owner_clones(clone_dir)
+    # The token rides on each command as a header, so .git/config only ever holds the bare URL
+    public_url, auth_args = split_clone_url_auth(clone_url)
     clone_git_dir = os.path.join(clone_dir, ".git")
     if os.path.exists(clone_git_dir):
         # Already cloned (e.g. Lambda reuse or retry) — update in place
         logger.info("Existing clone at %s, fetching branch %s", clone_dir, branch)
 
-        # Update origin URL (token may have expired between Lambda invocations)
+        # Reset origin to the bare URL (also scrubs a token older code saved there)
         try:
             run_subprocess(["git", "remote", "get-url", "origin"], clone_dir)
-            run_subprocess(["git", "remote", "set-url", "origin", clone_url], clone_dir)
+            run_subprocess(
+                ["git", "remote", "set-url", "origin", public_url], clone_dir
+            )
         except ValueError:
             logger.warning("Origin remote missing at %s, adding it", clone_dir)
-            run_subprocess(["git", "remote", "add", "origin", clone_url], clone_dir)
+            run_subprocess(["git", "remote", "add", "origin", public_url], clone_dir)
 
         # --depth 1: only fetch the latest commit (saves time and disk)
-        run_subprocess(["git", "fetch", "--depth", "1", "origin", branch], clone_dir)
+        run_subprocess(
+            ["git", *auth_args, "fetch", "--depth", "1", "origin", branch], clone_dir
+        )
 
         # -f: discard local changes, -B: create or reset branch to FETCH_HEAD
         # FETCH_HEAD: ref written by git fetch pointing to the fetched commit (more reliable than origin/branch in shallow clones)
         run_subprocess(["git", "checkout", "-f", "-B", branch, "FETCH_HEAD"], clone_dir)
+        # -fd: drop untracked files a previous invocation left behind (e.g. uncommitted test files). No -x, so gitignored node_modules/vendor stay cached.
+        run_subprocess(["git", "clean", "-fd"], clone_dir)
         set_git_identity(clone_dir)
+        touch_clone_cache(clone_dir)
         logger.info("Updated clone: %s @ %s", clone_dir, branch)
         return clone_dir
 
@@ -36,11 +51,26 @@ def git_clone_to_tmp(clone_dir: str, clone_url: str, branch: str):
     # GitHub tarball API was 2x slower (37s) — git pack protocol is more efficient
     logger.info("Shallow cloning: branch=%s dir=%s", branch, clone_dir)
     os.makedirs(clone_dir, exist_ok=True)
+    used_before = shutil.disk_usage(clone_dir).used
     # --depth 1: shallow clone (latest commit only), -b: checkout this branch
     run_subprocess(
-        ["git", "clone", "--depth", "1", "-b", branch, clone_url, clone_dir],
+        [
+            "git",
+            *auth_args,
+            "clone",
+            "--depth",
+            "1",
+            "-b",
+            branch,
+            public_url,
+            clone_dir,
+        ],
         clone_dir,
     )
     set_git_identity(clone_dir)
+    # Disk usage delta instead of walking the new tree; approximate, but cleanup_tmp budgets on real disk usage anyway
+    touch_clone_cache(
+        clone_dir, size_bytes=max(shutil.disk_usage(clone_dir).used - used_before, 0)
+    )
     logger.info("Clone completed: %s @ %s", clone_dir, branch)
     return clone_dir
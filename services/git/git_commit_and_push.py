@@ -2,10 +2,15 @@ from dataclasses import dataclass, field
 
 from services.git.format_commit_message import format_commit_message
 from services.git.get_branch_head_author import get_branch_head_author
+from services.git.invalidate_repo_snapshot import invalidate_repo_snapshot
+from services.git.split_clone_url_auth import split_clone_url_auth
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
 from services.types.base_args import BaseArgs
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
-from utils.git.is_path_gitignored import is_path_gitignored
+from utils.git.get_gitignored_paths import get_gitignored_paths
 from utils.logging.logging_config import logger
 
 
@@ -33,7 +38,7 @@ def git_commit_and_push(
     # Drop gitignored paths from the stage list.
     # Without this, `git add` fails with "paths are ignored by one of your .gitignore files" and the agent has wasted an edit turn on a path it shouldn't have touched (e.g. node_modules after a search_and_replace on an installed dependency, see AGENT-3J4).
     # Surface the first skipped path on the result so the caller can warn the agent; commit the rest.
-    gitignored = [f for f in files if is_path_gitignored(clone_dir, f)]
+    gitignored = get_gitignored_paths(clone_dir, files)
     if gitignored:
         logger.warning(
             "git_commit_and_push: dropping %d gitignored path(s) from stage list: %s",
@@ -57,10 +62,19 @@ def git_commit_and_push(
 
     # -m: commit message inline (not opening an editor)
     run_subprocess(["git", "commit", "-m", message], clone_dir)
+    # Every agent file-edit tool lands here; the committed tree replaces the snapshot file-discovery helpers were reading
+    invalidate_repo_snapshot(clone_dir)
 
-    # Update remote URL with fresh token and push
-    run_subprocess(["git", "remote", "set-url", "origin", clone_url], clone_dir)
-    push_cmd = ["git", "push"]
+    # Coalescing mode: leave the commit local and let push_pending_commits push everything at once at the end of the agent turn. A force push rewrites history, so it never waits.
+    if base_args.get("defer_push") and not force:
+        logger.info("Committed locally, push deferred: %s", message.split("\n")[0])
+        base_args["has_unpushed_commits"] = True
+        return GitCommitResult(success=True, gitignored_paths=gitignored)
+
+    # Fresh token goes on the push command only, never into .git/config
+    public_url, auth_args = split_clone_url_auth(clone_url)
+    run_subprocess(["git", "remote", "set-url", "origin", public_url], clone_dir)
+    push_cmd = ["git", *auth_args, "push"]
     if force:
         logger.info("git_commit_and_push: force push via --force-with-lease")
         push_cmd.append("--force-with-lease")
@@ -83,5 +97,10 @@ def git_commit_and_push(
         )
         return GitCommitResult(success=False, concurrent_push_detected=True)
 
+    # The pushed commits change what GitHub returns for this repo
+    invalidate_github_response_cache(base_args["owner"], base_args["repo"])
+
+    # The push carried any earlier deferred commits along with this one
+    base_args.pop("has_unpushed_commits", None)
     logger.info("Committed and pushed: %s", message.split("\n")[0])
     return GitCommitResult(success=True, gitignored_paths=gitignored)
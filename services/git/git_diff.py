@@ -52,7 +52,7 @@ def git_diff(
             logger.error("git_diff: unhandled subprocess error: %s", err)
             raise
         logger.warning("git_diff: no merge base, deepening base branch")
-        deepen_until_merge_base(clone_dir, base_branch)
+        deepen_until_merge_base(clone_dir, base_args["clone_url"], base_branch)
         logger.info("git_diff: retrying diff after deepen")
         result = run_subprocess(args=cmd, cwd=clone_dir)
 
@@ -1,11 +1,14 @@
 from services.git.deepen_until_merge_base import deepen_until_merge_base
+from services.git.split_clone_url_auth import split_clone_url_auth
 from utils.command.run_subprocess import run_subprocess
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
 
 @handle_exceptions(default_return_value=False, raise_on_error=False)
-def git_merge_base_into_pr(clone_dir: str, base_branch: str, behind_by: int):
+def git_merge_base_into_pr(
+    clone_dir: str, clone_url: str, base_branch: str, behind_by: int
+):
     # Need a merge-base before merging; see deepen_until_merge_base for the why.
     # When GitHub's Compare API gave us a known behind_by, deepen by that exact amount in one shot — cheaper than the helper's exponential climb.
     # Otherwise fall back to the shared helper.
@@ -13,14 +16,17 @@ def git_merge_base_into_pr(clone_dir: str, base_branch: str, behind_by: int):
         # behind_by from GitHub Compare API: e.g. PR is 50 commits behind main → deepen 60
         depth = behind_by + 10
         logger.info("Deepening by %d (behind_by=%d + buffer)", depth, behind_by)
+        # origin holds no token, so the fetch carries it as per-command auth args
+        _, auth_args = split_clone_url_auth(clone_url)
         run_subprocess(
-            ["git", "fetch", "--deepen", str(depth), "origin", base_branch], clone_dir
+            ["git", *auth_args, "fetch", "--deepen", str(depth), "origin", base_branch],
+            clone_dir,
         )
     else:
         logger.info(
             "behind_by=0, delegating to deepen_until_merge_base for exponential fallback"
         )
-        deepen_until_merge_base(clone_dir, base_branch)
+        deepen_until_merge_base(clone_dir, clone_url, base_branch)
 
     # Merge base branch into PR branch
     try:
@@ -0,0 +1,16 @@
+from services.git.get_repo_snapshot import REPO_SNAPSHOTS, REPO_SNAPSHOTS_LOCK
+from utils.logging.logging_config import logger
+
+
+def invalidate_repo_snapshot(clone_dir: str):
+    """Drop every cached RepoSnapshot of clone_dir. Called after the agent's file-edit tools commit, so the next helper lists the new tree instead of holding the old one in memory."""
+    with REPO_SNAPSHOTS_LOCK:
+        keys = [key for key in REPO_SNAPSHOTS if key[0] == clone_dir]
+        for key in keys:
+            logger.debug("invalidate_repo_snapshot: dropping %s at %s", *key)
+            del REPO_SNAPSHOTS[key]
+
+    logger.info(
+        "invalidate_repo_snapshot: dropped %d snapshots of %s", len(keys), clone_dir
+    )
+    return len(keys)
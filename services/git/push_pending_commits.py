@@ -0,0 +1,50 @@
+from services.git.get_branch_head_author import get_branch_head_author
+from services.git.git_commit_and_push import GitCommitResult
+from services.git.split_clone_url_auth import split_clone_url_auth
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
+from services.types.base_args import BaseArgs
+from utils.command.run_subprocess import run_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(raise_on_error=True)
+def push_pending_commits(base_args: BaseArgs):
+    """Push commits that git_commit_and_push left local while base_args["defer_push"] was set. One push covers every edit of the agent turn. No-op when nothing is pending."""
+    if not base_args.get("has_unpushed_commits"):
+        logger.info("push_pending_commits: nothing to push")
+        return GitCommitResult(success=True)
+
+    clone_dir = base_args["clone_dir"]
+    clone_url = base_args["clone_url"]
+    new_branch = base_args["new_branch"]
+
+    # Fresh token goes on the push command only, never into .git/config
+    public_url, auth_args = split_clone_url_auth(clone_url)
+    run_subprocess(["git", "remote", "set-url", "origin", public_url], clone_dir)
+    try:
+        run_subprocess(
+            ["git", *auth_args, "push", "origin", f"HEAD:refs/heads/{new_branch}"],
+            clone_dir,
+        )
+    except ValueError as err:
+        err_text = str(err)
+        if "fetch first" not in err_text and "non-fast-forward" not in err_text:
+            logger.error("git push failed with unhandled error: %s", err_text)
+            raise
+
+        # Same race git_commit_and_push handles (Sentry AGENT-36T), just detected once per turn instead of once per edit
+        author = get_branch_head_author(clone_dir, clone_url, new_branch)
+        logger.warning(
+            "push_pending_commits bailing on %s: racer=%s advanced the branch. Not rebasing. Signaling concurrent_push_detected so chat_with_agent can break the agent loop.",
+            new_branch,
+            author,
+        )
+        return GitCommitResult(success=False, concurrent_push_detected=True)
+
+    invalidate_github_response_cache(base_args["owner"], base_args["repo"])
+    base_args.pop("has_unpushed_commits", None)
+    logger.info("push_pending_commits: pushed deferred commits to %s", new_branch)
+    return GitCommitResult(success=True)
@@ -0,0 +1,20 @@
+import base64
+from urllib.parse import urlsplit, urlunsplit
+
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(raise_on_error=True)
+def split_clone_url_auth(clone_url: str):
+    """Split a token-bearing clone URL into (url without credentials, git -c args carrying them as an http.extraheader). Pass the args on each git command that talks to the remote so the token is never written to .git/config, where code run later in a cached clone could read it."""
+    parts = urlsplit(clone_url)
+    if not parts.username:
+        logger.debug("split_clone_url_auth: no credentials in %s", clone_url)
+        return clone_url, []
+
+    credentials = f"{parts.username}:{parts.password or ''}".encode()
+    header = f"AUTHORIZATION: basic {base64.b64encode(credentials).decode()}"
+    public_url = urlunsplit(parts._replace(netloc=parts.netloc.rsplit("@", 1)[-1]))
+    logger.info("split_clone_url_auth: moved credentials for %s", public_url)
+    return public_url, ["-c", f"http.extraheader={header}"]
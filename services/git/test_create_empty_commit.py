@@ -42,6 +42,31 @@ def test_create_empty_commit_with_clone_dir(create_test_base_args):
         )
 
 
+def test_create_empty_commit_invalidates_github_response_cache(create_test_base_args):
+    base_args = create_test_base_args(owner="o", repo="r", new_branch="b")
+    with patch("services.git.create_empty_commit.run_subprocess"), patch(
+        "services.git.create_empty_commit.invalidate_github_response_cache"
+    ) as mock_invalidate:
+        assert create_empty_commit(base_args) is True
+
+    mock_invalidate.assert_called_once_with("o", "r")
+
+
+def test_create_empty_commit_abandon_keeps_github_response_cache(
+    create_test_base_args,
+):
+    base_args = create_test_base_args(owner="o", repo="r", new_branch="b")
+    with patch(
+        "services.git.create_empty_commit.run_subprocess",
+        side_effect=[None, ValueError("! [rejected] HEAD -> b (fetch first)")],
+    ), patch("services.git.create_empty_commit.get_branch_head_author"), patch(
+        "services.git.create_empty_commit.invalidate_github_response_cache"
+    ) as mock_invalidate:
+        assert create_empty_commit(base_args) is False
+
+    mock_invalidate.assert_not_called()
+
+
 def test_create_empty_commit_skips_pre_commit_hooks(create_test_base_args):
     """Reproduces production failure: repos with pre-commit hooks (e.g. lint-staged)
     fail in Lambda because npm can't mkdir in /home/sbx_user1051. --no-verify skips hooks.
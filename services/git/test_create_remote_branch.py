@@ -41,6 +41,28 @@ class TestCreateRemoteBranch:
             cwd=base_args["clone_dir"],
         )
 
+    @patch("services.git.create_remote_branch.invalidate_github_response_cache")
+    @patch("services.git.create_remote_branch.run_subprocess")
+    def test_invalidates_github_response_cache_after_push(
+        self, _mock_run, mock_invalidate, create_test_base_args
+    ):
+        base_args = create_test_base_args(owner="o", repo="r", new_branch="b")
+        create_remote_branch(sha="abc123", base_args=base_args)
+
+        mock_invalidate.assert_called_once_with("o", "r")
+
+    @patch("services.git.create_remote_branch.invalidate_github_response_cache")
+    @patch("services.git.create_remote_branch.run_subprocess")
+    def test_failed_push_keeps_github_response_cache(
+        self, mock_run, mock_invalidate, create_test_base_args
+    ):
+        mock_run.side_effect = [None, ValueError("push failed")]
+        base_args = create_test_base_args(owner="o", repo="r", new_branch="b")
+        with pytest.raises(ValueError):
+            create_remote_branch(sha="abc123", base_args=base_args)
+
+        mock_invalidate.assert_not_called()
+
 
 # --- Integration tests (real git, local bare repo) ---
 
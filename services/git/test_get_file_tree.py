@@ -5,6 +5,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from services.git.get_file_tree import get_file_tree
+from services.git.get_repo_snapshot import RepoSnapshot, RepoSnapshotFile
 
 
 @pytest.fixture
@@ -13,41 +14,56 @@ def mock_run_subprocess():
         yield mock
 
 
-GIT_LS_TREE_OUTPUT = """100644 blob abc123    1234\tsrc/main.py
-100644 blob def456     567\tsrc/utils.py
-040000 tree ghi789       -\tsrc/tests"""
+GIT_LS_TREE_ROOT_OUTPUT = """100644 blob abc123    1234\tREADME.md
+040000 tree ghi789       -\tsrc"""
 
 
-class TestGetFileTree:
-    @patch("os.path.isdir", return_value=True)
-    def test_returns_tree_items(self, _mock_isdir, mock_run_subprocess):
-        result = MagicMock()
-        result.stdout = GIT_LS_TREE_OUTPUT
-        mock_run_subprocess.return_value = result
-
-        items = get_file_tree(clone_dir="/tmp/owner/repo", ref="main")
+def snapshot_file(path: str, obj_type: str = "blob", size: int | None = 10):
+    return RepoSnapshotFile(
+        path=path,
+        mode="160000" if obj_type == "commit" else "100644",
+        type=obj_type,
+        sha="abc123",
+        size=size,
+    )
 
-        assert len(items) == 3
-        assert items[0]["path"] == "src/main.py"
-        assert items[0]["type"] == "blob"
-        assert items[0].get("size") == 1234
-        assert items[1]["path"] == "src/utils.py"
-        assert items[2]["path"] == "src/tests"
-        assert items[2]["type"] == "tree"
-        assert "size" not in items[2]
 
+class TestGetFileTree:
     @patch("os.path.isdir", return_value=True)
-    def test_uses_local_ref_directly(self, _mock_isdir, mock_run_subprocess):
-        result = MagicMock()
-        result.stdout = ""
-        mock_run_subprocess.return_value = result
-
-        get_file_tree(clone_dir="/tmp/owner/repo", ref="main")
-
-        # Should call git ls-tree with local ref, no fetch, no origin/ prefix
-        call = mock_run_subprocess.call_args_list[0]
-        assert call[1]["args"] == ["git", "ls-tree", "--full-tree", "-l", "-r", "main"]
-        assert mock_run_subprocess.call_count == 1
+    def test_returns_tree_items_from_snapshot(self, _mock_isdir, mock_run_subprocess):
+        snapshot = RepoSnapshot(
+            clone_dir="/tmp/owner/repo",
+            commit="c0ffee",
+            files=[
+                snapshot_file("src/main.py", size=1234),
+                snapshot_file("src/utils.py", size=567),
+                snapshot_file("vendor/lib", obj_type="commit", size=None),
+            ],
+        )
+        with patch(
+            "services.git.get_file_tree.get_repo_snapshot", return_value=snapshot
+        ) as mock_snapshot:
+            items = get_file_tree(clone_dir="/tmp/owner/repo", ref="main")
+
+        mock_snapshot.assert_called_once_with("/tmp/owner/repo", "main")
+        mock_run_subprocess.assert_not_called()
+        assert items == [
+            {
+                "path": "src/main.py",
+                "mode": "100644",
+                "type": "blob",
+                "sha": "abc123",
+                "size": 1234,
+            },
+            {
+                "path": "src/utils.py",
+                "mode": "100644",
+                "type": "blob",
+                "sha": "abc123",
+                "size": 567,
+            },
+            {"path": "vendor/lib", "mode": "160000", "type": "commit", "sha": "abc123"},
+        ]
 
     @patch("os.path.isdir", return_value=False)
     def test_returns_empty_for_invalid_clone_dir(
@@ -60,31 +76,56 @@ class TestGetFileTree:
         mock_run_subprocess.assert_not_called()
 
     @patch("os.path.isdir", return_value=True)
-    def test_returns_empty_for_empty_output(self, _mock_isdir, mock_run_subprocess):
-        result = MagicMock()
-        result.stdout = ""
-        mock_run_subprocess.return_value = result
+    def test_returns_empty_for_empty_snapshot(self, _mock_isdir, mock_run_subprocess):
+        snapshot = RepoSnapshot(clone_dir="/tmp/owner/repo", commit="c0ffee", files=[])
+        with patch(
+            "services.git.get_file_tree.get_repo_snapshot", return_value=snapshot
+        ):
+            items = get_file_tree(clone_dir="/tmp/owner/repo", ref="main")
+
+        assert not items
 
-        items = get_file_tree(clone_dir="/tmp/owner/repo", ref="main")
+    @patch("os.path.isdir", return_value=True)
+    def test_returns_empty_without_snapshot(self, _mock_isdir, mock_run_subprocess):
+        with patch("services.git.get_file_tree.get_repo_snapshot", return_value=None):
+            items = get_file_tree(clone_dir="/tmp/owner/repo", ref="missing")
 
         assert not items
 
     @patch("os.path.isdir", return_value=True)
-    def test_root_only_flag(self, _mock_isdir, mock_run_subprocess):
+    def test_root_only_lists_top_level_with_ls_tree(
+        self, _mock_isdir, mock_run_subprocess
+    ):
         result = MagicMock()
-        result.stdout = ""
+        result.stdout = GIT_LS_TREE_ROOT_OUTPUT
         mock_run_subprocess.return_value = result
 
-        get_file_tree(clone_dir="/tmp/owner/repo", ref="main", root_only=True)
+        with patch("services.git.get_file_tree.get_repo_snapshot") as mock_snapshot:
+            items = get_file_tree(
+                clone_dir="/tmp/owner/repo", ref="main", root_only=True
+            )
 
+        mock_snapshot.assert_not_called()
         call = mock_run_subprocess.call_args_list[0]
-        assert "-r" not in call[1]["args"]
+        assert call[1]["args"] == ["git", "ls-tree", "--full-tree", "-l", "main"]
+        assert items == [
+            {
+                "path": "README.md",
+                "mode": "100644",
+                "type": "blob",
+                "sha": "abc123",
+                "size": 1234,
+            },
+            {"path": "src", "mode": "040000", "type": "tree", "sha": "ghi789"},
+        ]
 
     @patch("os.path.isdir", return_value=True)
-    def test_returns_empty_when_ls_tree_fails(self, _mock_isdir, mock_run_subprocess):
+    def test_root_only_returns_empty_when_ls_tree_fails(
+        self, _mock_isdir, mock_run_subprocess
+    ):
         mock_run_subprocess.side_effect = ValueError("ref not found")
 
-        items = get_file_tree(clone_dir="/tmp/owner/repo", ref="main")
+        items = get_file_tree(clone_dir="/tmp/owner/repo", ref="main", root_only=True)
 
         assert not items
 
@@ -98,9 +139,7 @@ def test_integration_get_file_tree_returns_all_files(local_repo):
     items = get_file_tree(clone_dir=work_dir, ref="main")
 
     paths = {item["path"] for item in items}
-    assert "README.md" in paths
-    assert "src/main.py" in paths
-    assert "src/utils.py" in paths
+    assert paths == {"README.md", "src/main.py", "src/utils.py"}
 
     blobs = [item for item in items if item["type"] == "blob"]
     assert len(blobs) >= 3
@@ -114,7 +153,5 @@ def test_integration_get_file_tree_root_only(local_repo):
     items = get_file_tree(clone_dir=work_dir, ref="main", root_only=True)
 
     paths = {item["path"] for item in items}
-    assert "README.md" in paths
     # root_only should list "src" as a tree, not recurse into it
-    assert "src" in paths
-    assert "src/main.py" not in paths
+    assert paths == {"README.md", "src"}
@@ -0,0 +1,160 @@
+# pylint: disable=redefined-outer-name
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from services.git.get_repo_snapshot import (
+    REPO_SNAPSHOTS,
+    RepoSnapshotFile,
+    get_repo_snapshot,
+)
+from utils.command.run_subprocess import run_subprocess
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshots():
+    REPO_SNAPSHOTS.clear()
+    yield
+    REPO_SNAPSHOTS.clear()
+
+
+def _commit(repo_dir: str, files: dict[str, str]):
+    for rel_path, content in files.items():
+        full = os.path.join(repo_dir, rel_path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8") as f:
+            f.write(content)
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@test.com",
+            "commit",
+            "-q",
+            "-m",
+            "fixture",
+        ],
+        cwd=repo_dir,
+        check=True,
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def test_lists_tracked_files_with_sizes_shas_and_classification(tmp_path):
+    repo_dir = str(tmp_path)
+    commit = _commit(
+        repo_dir,
+        {
+            "src/app.ts": "export {};\n",
+            "src/app.test.ts": "test();\n",
+            "jest.config.js": "module.exports = {};\n",
+            "src/types/user.ts": "type U = {};\n",
+            "node_modules/pkg/index.js": "1\n",
+        },
+    )
+
+    snapshot = get_repo_snapshot(repo_dir)
+
+    assert snapshot is not None
+    assert snapshot.clone_dir == repo_dir
+    assert snapshot.commit == commit
+    by_path = {file.path: file for file in snapshot.files}
+    assert sorted(by_path) == [
+        "jest.config.js",
+        "node_modules/pkg/index.js",
+        "src/app.test.ts",
+        "src/app.ts",
+        "src/types/user.ts",
+    ]
+    app = by_path["src/app.ts"]
+    assert app.size == len("export {};\n")
+    assert app.type == "blob"
+    assert app.mode == "100644"
+    assert len(app.sha) == 40
+    assert (app.is_code, app.is_test, app.test_naming_pattern) == (True, False, None)
+    test = by_path["src/app.test.ts"]
+    assert (test.is_test, test.test_naming_pattern) == (True, "dot_test")
+    assert by_path["jest.config.js"].is_config is True
+    assert by_path["src/types/user.ts"].is_type is True
+    assert by_path["node_modules/pkg/index.js"].is_dependency is True
+
+
+def test_reuses_snapshot_until_the_commit_changes(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(repo_dir, {"a.py": "a\n"})
+
+    with patch(
+        "services.git.get_repo_snapshot.run_subprocess", wraps=run_subprocess
+    ) as spy:
+        first = get_repo_snapshot(repo_dir)
+        second = get_repo_snapshot(repo_dir)
+        ls_tree_calls = [c for c in spy.call_args_list if "ls-tree" in c.kwargs["args"]]
+        assert second is first
+        assert len(ls_tree_calls) == 1
+
+        _commit(repo_dir, {"b.py": "b\n"})
+        third = get_repo_snapshot(repo_dir)
+
+    assert third is not None
+    assert third is not first
+    assert [file.path for file in third.files] == ["a.py", "b.py"]
+
+
+def test_snapshot_at_another_ref(tmp_path):
+    repo_dir = str(tmp_path)
+    first_commit = _commit(repo_dir, {"a.py": "a\n"})
+    _commit(repo_dir, {"b.py": "b\n"})
+
+    snapshot = get_repo_snapshot(repo_dir, first_commit)
+
+    assert snapshot is not None
+    assert [file.path for file in snapshot.files] == ["a.py"]
+
+
+def test_non_ascii_paths_are_not_quoted(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(repo_dir, {"docs/résumé.md": "x\n", "src/with space.py": "y\n"})
+
+    snapshot = get_repo_snapshot(repo_dir)
+
+    assert snapshot is not None
+    assert [file.path for file in snapshot.files] == [
+        "docs/résumé.md",
+        "src/with space.py",
+    ]
+
+
+def test_returns_none_for_non_git_dir(tmp_path):
+    assert get_repo_snapshot(str(tmp_path)) is None
+
+
+def test_returns_none_for_unknown_ref(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(repo_dir, {"a.py": "a\n"})
+
+    assert get_repo_snapshot(repo_dir, "no-such-branch") is None
+
+
+def test_snapshot_file_is_immutable():
+    file = RepoSnapshotFile(
+        path="a.py",
+        mode="100644",
+        type="blob",
+        sha="0" * 40,
+        size=1,
+    )
+
+    with pytest.raises(AttributeError):
+        file.path = "b.py"  # type: ignore[misc]
@@ -0,0 +1,41 @@
+# pyright: reportUnusedVariable=false
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from services.git.get_tree_sha import get_tree_sha
+
+
+def test_returns_empty_string_when_subprocess_fails():
+    with patch("services.git.get_tree_sha.run_subprocess") as mock_run:
+        mock_run.side_effect = ValueError("unknown revision")
+        assert get_tree_sha(clone_dir="/nonexistent", ref="main") == ""
+
+
+def test_returns_stripped_tree_sha_from_stdout():
+    class FakeResult:
+        stdout = "tree123\n"
+
+    with patch(
+        "services.git.get_tree_sha.run_subprocess", return_value=FakeResult()
+    ) as mock_run:
+        assert get_tree_sha(clone_dir="/tmp/fake", ref="main") == "tree123"
+        mock_run.assert_called_once_with(
+            args=["git", "rev-parse", "main^{tree}"], cwd="/tmp/fake"
+        )
+
+
+@pytest.mark.integration
+def test_sociable_empty_commit_keeps_tree_sha(local_repo):
+    _clone_url, work_dir = local_repo
+    # The last commit on main is empty, so it shares its tree with its parent
+    parent_tree = subprocess.run(
+        ["git", "rev-parse", "main~1^{tree}"],
+        cwd=work_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    assert get_tree_sha(clone_dir=work_dir, ref="main") == parent_tree
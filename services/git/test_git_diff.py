@@ -101,7 +101,7 @@ def test_delegates_to_deepen_helper_on_no_merge_base(
     result = git_diff(base_args=base_args, file_path="file.py")
 
     assert result == "diff --git a/file.py b/file.py\n+added\n"
-    mock_deepen.assert_called_once_with("/tmp/repo", "main")
+    mock_deepen.assert_called_once_with("/tmp/repo", base_args["clone_url"], "main")
     # diff was called twice: once before deepen (raised), once after.
     assert diff_calls["count"] == 2
 
@@ -0,0 +1,31 @@
+# pylint: disable=redefined-outer-name
+import pytest
+
+from services.git.get_repo_snapshot import REPO_SNAPSHOTS, RepoSnapshot
+from services.git.invalidate_repo_snapshot import invalidate_repo_snapshot
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshots():
+    REPO_SNAPSHOTS.clear()
+    yield
+    REPO_SNAPSHOTS.clear()
+
+
+def test_drops_only_snapshots_of_the_clone():
+    for clone_dir, commit in [
+        ("/tmp/o/r", "c1"),
+        ("/tmp/o/r", "c2"),
+        ("/tmp/o/r2", "c1"),
+    ]:
+        REPO_SNAPSHOTS[(clone_dir, commit)] = RepoSnapshot(
+            clone_dir=clone_dir, commit=commit, files=[]
+        )
+
+    assert invalidate_repo_snapshot("/tmp/o/r") == 2
+
+    assert list(REPO_SNAPSHOTS) == [("/tmp/o/r2", "c1")]
+
+
+def test_unknown_clone_is_a_noop():
+    assert invalidate_repo_snapshot("/tmp/o/r") == 0
@@ -0,0 +1,23 @@
+import base64
+
+from services.git.get_clone_url import get_clone_url
+from services.git.split_clone_url_auth import split_clone_url_auth
+
+
+def test_split_clone_url_auth_moves_token_to_header():
+    url, auth_args = split_clone_url_auth(get_clone_url("owner", "repo", "ghs_abc"))
+
+    assert url == "https://github.com/owner/repo.git"
+    encoded = base64.b64encode(b"x-access-token:ghs_abc").decode()
+    assert auth_args == ["-c", f"http.extraheader=AUTHORIZATION: basic {encoded}"]
+
+
+def test_split_clone_url_auth_leaves_plain_url():
+    url, auth_args = split_clone_url_auth("https://github.com/owner/repo.git")
+
+    assert url == "https://github.com/owner/repo.git"
+    assert auth_args == []
+
+
+def test_split_clone_url_auth_leaves_local_path():
+    assert split_clone_url_auth("/tmp/remote.git") == ("/tmp/remote.git", [])
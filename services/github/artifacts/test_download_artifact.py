@@ -61,7 +61,9 @@ def mock_headers():
 
 def test_download_artifact_success_with_lcov(mock_zip_with_lcov, mock_headers):
     """Test successful artifact download with lcov.info present."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -86,7 +88,9 @@ def test_download_artifact_success_with_lcov(mock_zip_with_lcov, mock_headers):
 
 def test_download_artifact_success_without_lcov(mock_zip_without_lcov, mock_headers):
     """Test artifact download when lcov.info is not present."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -111,7 +115,9 @@ def test_download_artifact_success_without_lcov(mock_zip_without_lcov, mock_head
 
 def test_download_artifact_empty_zip(mock_zip_empty, mock_headers):
     """Test artifact download with empty zip file."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -138,7 +144,9 @@ def test_download_artifact_with_different_parameters():
     ]
 
     for owner, repo, artifact_id, token in test_cases:
-        with patch("requests.get") as mock_get, patch(
+        with patch(
+            "services.github.artifacts.download_artifact.github_session.get"
+        ) as mock_get, patch(
             "services.github.artifacts.download_artifact.create_headers"
         ) as mock_create_headers:
 
@@ -180,7 +188,9 @@ def test_download_artifact_lcov_with_unicode_content():
     zip_buffer.seek(0)
     zip_content = zip_buffer.getvalue()
 
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -207,7 +217,9 @@ def test_download_artifact_lcov_with_binary_content():
     zip_buffer.seek(0)
     zip_content = zip_buffer.getvalue()
 
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -236,7 +248,9 @@ def test_download_artifact_multiple_files_with_lcov():
     zip_buffer.seek(0)
     zip_content = zip_buffer.getvalue()
 
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -255,7 +269,9 @@ def test_download_artifact_multiple_files_with_lcov():
 
 def test_download_artifact_exception_handling():
     """Test that exceptions are handled by the decorator."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -272,7 +288,9 @@ def test_download_artifact_exception_handling():
 
 def test_download_artifact_request_timeout():
     """Test that request timeout is handled by the decorator."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -289,7 +307,9 @@ def test_download_artifact_request_timeout():
 
 def test_download_artifact_invalid_zip_content():
     """Test download_artifact with invalid zip content."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -308,7 +328,9 @@ def test_download_artifact_invalid_zip_content():
 
 def test_download_artifact_url_construction():
     """Test that the GitHub API URL is constructed correctly."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers, patch(
         "services.github.artifacts.download_artifact.zipfile.ZipFile"
@@ -346,7 +368,9 @@ def test_download_artifact_url_construction():
 )
 def test_download_artifact_edge_case_parameters(owner, repo, artifact_id, token):
     """Test download_artifact with edge case parameters."""
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers, patch(
         "services.github.artifacts.download_artifact.zipfile.ZipFile"
@@ -385,7 +409,9 @@ def test_download_artifact_large_lcov_content():
     zip_buffer.seek(0)
     zip_content = zip_buffer.getvalue()
 
-    with patch("requests.get") as mock_get, patch(
+    with patch(
+        "services.github.artifacts.download_artifact.github_session.get"
+    ) as mock_get, patch(
         "services.github.artifacts.download_artifact.create_headers"
     ) as mock_create_headers:
 
@@ -2,11 +2,9 @@
 from dataclasses import dataclass
 from typing import cast
 
-# Third party imports
-import requests
-
 # Local imports
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.types.branch_protection import BranchProtection
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -26,7 +24,7 @@ def get_required_status_checks(owner: str, repo: str, branch: str, token: str):
     """https://docs.github.com/en/rest/branches/branch-protection#get-branch-protection"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/branches/{branch}/protection"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
 
     # NOTE: 403 happens when GitHub App lacks "Administration: Read" permission
     if response.status_code == 403:
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -12,7 +11,7 @@ def is_repo_archived(owner: str, repo: str, token: str):
     """
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     response.raise_for_status()
     data: dict[str, bool] = response.json()
     return data.get("archived", False)
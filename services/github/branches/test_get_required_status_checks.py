@@ -29,7 +29,7 @@ def test_get_required_status_checks_success(
     test_owner, test_repo, test_token, mock_branch_protection_response
 ):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -64,7 +64,7 @@ def test_get_required_status_checks_403_no_permission(
     test_owner, test_repo, test_token
 ):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -87,7 +87,7 @@ def test_get_required_status_checks_404_no_protection(
     test_owner, test_repo, test_token
 ):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -110,7 +110,7 @@ def test_get_required_status_checks_no_required_checks(
     test_owner, test_repo, test_token
 ):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -132,7 +132,7 @@ def test_get_required_status_checks_no_required_checks(
 
 def test_get_required_status_checks_only_contexts(test_owner, test_repo, test_token):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -160,7 +160,7 @@ def test_get_required_status_checks_only_contexts(test_owner, test_repo, test_to
 
 def test_get_required_status_checks_only_checks(test_owner, test_repo, test_token):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -188,7 +188,7 @@ def test_get_required_status_checks_only_checks(test_owner, test_repo, test_toke
 
 def test_get_required_status_checks_http_error_500(test_owner, test_repo, test_token):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
@@ -211,7 +211,7 @@ def test_get_required_status_checks_http_error_500(test_owner, test_repo, test_t
 
 def test_get_required_status_checks_network_error(test_owner, test_repo, test_token):
     with patch(
-        "services.github.branches.get_required_status_checks.requests.get"
+        "services.github.branches.get_required_status_checks.github_session.get"
     ) as mock_get, patch(
         "services.github.branches.get_required_status_checks.create_headers"
     ) as mock_headers:
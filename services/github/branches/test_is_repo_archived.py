@@ -9,7 +9,7 @@ from services.github.branches.is_repo_archived import is_repo_archived
 
 @pytest.fixture
 def mock_requests_get():
-    with patch("services.github.branches.is_repo_archived.requests.get") as mock:
+    with patch("services.github.branches.is_repo_archived.github_session.get") as mock:
         yield mock
 
 
@@ -1,7 +1,7 @@
 import json
 
-import requests
 
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -14,7 +14,7 @@ def get_circleci_workflow_ids_from_check_suite(
     url = f"https://api.github.com/repos/{owner}/{repo}/check-suites/{check_suite_id}/check-runs"
     headers = create_headers(github_token)
 
-    response = requests.get(url, headers=headers, timeout=30)
+    response = github_session.get(url, headers=headers, timeout=30)
 
     if response.status_code != 200:
         logger.error(
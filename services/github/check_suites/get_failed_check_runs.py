@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, GITHUB_CHECK_RUN_FAILURES
+from services.github.session import github_session
 from services.github.types.check_run import CheckRun
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -14,7 +13,7 @@ def get_failed_check_runs_from_check_suite(
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/check-suites/{check_suite_id}/check-runs"
     headers = create_headers(github_token)
 
-    response = requests.get(url, headers=headers, timeout=30)
+    response = github_session.get(url, headers=headers, timeout=30)
 
     if response.status_code != 200:
         logger.error(
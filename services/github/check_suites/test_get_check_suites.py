@@ -34,7 +34,7 @@ def test_get_check_suites_success(
     test_owner, test_repo, test_token, mock_check_suites_response
 ):
     with patch(
-        "services.github.check_suites.get_check_suites.requests.get"
+        "services.github.check_suites.get_check_suites.github_session.get"
     ) as mock_get, patch(
         "services.github.check_suites.get_check_suites.create_headers"
     ) as mock_headers:
@@ -58,7 +58,7 @@ def test_get_check_suites_success(
 
 def test_get_check_suites_headers_creation(test_owner, test_repo):
     with patch(
-        "services.github.check_suites.get_check_suites.requests.get"
+        "services.github.check_suites.get_check_suites.github_session.get"
     ) as mock_get, patch(
         "services.github.check_suites.get_check_suites.create_headers"
     ) as mock_headers:
@@ -76,7 +76,7 @@ def test_get_check_suites_headers_creation(test_owner, test_repo):
 
 def test_get_check_suites_http_error_404(test_owner, test_repo, test_token):
     with patch(
-        "services.github.check_suites.get_check_suites.requests.get"
+        "services.github.check_suites.get_check_suites.github_session.get"
     ) as mock_get, patch(
         "services.github.check_suites.get_check_suites.create_headers"
     ) as mock_headers:
@@ -97,7 +97,7 @@ def test_get_check_suites_http_error_404(test_owner, test_repo, test_token):
 
 def test_get_check_suites_network_error(test_owner, test_repo, test_token):
     with patch(
-        "services.github.check_suites.get_check_suites.requests.get"
+        "services.github.check_suites.get_check_suites.github_session.get"
     ) as mock_get, patch(
         "services.github.check_suites.get_check_suites.create_headers"
     ) as mock_headers:
@@ -9,7 +9,7 @@ from services.github.check_suites.get_circleci_workflow_id import (
 )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_success(mock_create_headers, mock_get):
     """Test successful retrieval of workflow IDs"""
@@ -45,7 +45,7 @@ def test_get_circleci_workflow_ids_success(mock_create_headers, mock_get):
     )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_duplicate_workflow_ids(
     mock_create_headers, mock_get
@@ -70,7 +70,7 @@ def test_get_circleci_workflow_ids_duplicate_workflow_ids(
     assert result == ["abc123-456-def"]
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_no_external_id(mock_create_headers, mock_get):
     """Test handling of check runs without external_id"""
@@ -90,7 +90,7 @@ def test_get_circleci_workflow_ids_no_external_id(mock_create_headers, mock_get)
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_invalid_json(mock_create_headers, mock_get):
     """Test handling of invalid JSON in external_id"""
@@ -113,7 +113,7 @@ def test_get_circleci_workflow_ids_invalid_json(mock_create_headers, mock_get):
     assert not result  # Should return empty list due to handle_exceptions
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 @patch("services.github.check_suites.get_circleci_workflow_id.logger.error")
 def test_get_circleci_workflow_ids_api_error(
@@ -141,7 +141,7 @@ def test_get_circleci_workflow_ids_api_error(
     )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_empty_response(mock_create_headers, mock_get):
     """Test handling of empty API response"""
@@ -159,7 +159,7 @@ def test_get_circleci_workflow_ids_empty_response(mock_create_headers, mock_get)
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_empty_check_runs(mock_create_headers, mock_get):
     """Test when check_runs is an empty array"""
@@ -177,7 +177,7 @@ def test_get_circleci_workflow_ids_empty_check_runs(mock_create_headers, mock_ge
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_missing_workflow_id_in_json(
     mock_create_headers, mock_get
@@ -203,7 +203,7 @@ def test_get_circleci_workflow_ids_missing_workflow_id_in_json(
     assert result == ["valid-id"]
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_none_workflow_id(mock_create_headers, mock_get):
     """Test when workflow-id is None in external_id JSON"""
@@ -226,7 +226,7 @@ def test_get_circleci_workflow_ids_none_workflow_id(mock_create_headers, mock_ge
     assert result == ["valid-id"]
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_empty_workflow_id(mock_create_headers, mock_get):
     """Test when workflow-id is an empty string in external_id JSON"""
@@ -249,7 +249,7 @@ def test_get_circleci_workflow_ids_empty_workflow_id(mock_create_headers, mock_g
     assert result == ["valid-id"]
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_different_error_codes(mock_create_headers, mock_get):
     """Test different HTTP error status codes"""
@@ -268,7 +268,7 @@ def test_get_circleci_workflow_ids_different_error_codes(mock_create_headers, mo
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 @patch("services.github.check_suites.get_circleci_workflow_id.logger.error")
 def test_get_circleci_workflow_ids_401_unauthorized(
@@ -292,7 +292,7 @@ def test_get_circleci_workflow_ids_401_unauthorized(
     )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_network_timeout(mock_create_headers, mock_get):
     """Test network timeout exception"""
@@ -309,7 +309,7 @@ def test_get_circleci_workflow_ids_network_timeout(mock_create_headers, mock_get
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_connection_error(mock_create_headers, mock_get):
     """Test connection error exception"""
@@ -326,7 +326,7 @@ def test_get_circleci_workflow_ids_connection_error(mock_create_headers, mock_ge
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_malformed_response_json(
     mock_create_headers, mock_get
@@ -345,7 +345,7 @@ def test_get_circleci_workflow_ids_malformed_response_json(
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_mixed_valid_invalid_external_ids(
     mock_create_headers, mock_get
@@ -375,7 +375,7 @@ def test_get_circleci_workflow_ids_mixed_valid_invalid_external_ids(
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_large_dataset(mock_create_headers, mock_get):
     """Test with a large number of check runs"""
@@ -402,7 +402,7 @@ def test_get_circleci_workflow_ids_large_dataset(mock_create_headers, mock_get):
     assert result == expected_ids
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_special_characters_in_workflow_id(
     mock_create_headers, mock_get
@@ -437,7 +437,7 @@ def test_get_circleci_workflow_ids_special_characters_in_workflow_id(
     assert result == expected
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_unicode_characters(mock_create_headers, mock_get):
     """Test workflow IDs with unicode characters"""
@@ -460,7 +460,7 @@ def test_get_circleci_workflow_ids_unicode_characters(mock_create_headers, mock_
     assert result == ["workflow-测试", "workflow-🚀"]
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 @patch("services.github.check_suites.get_circleci_workflow_id.logger.error")
 def test_get_circleci_workflow_ids_403_forbidden_with_logging(
@@ -486,7 +486,7 @@ def test_get_circleci_workflow_ids_403_forbidden_with_logging(
     )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_http_error_exception(mock_create_headers, mock_get):
     """Test HTTP error exception handling"""
@@ -503,7 +503,7 @@ def test_get_circleci_workflow_ids_http_error_exception(mock_create_headers, moc
     assert not result
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_request_exception(mock_create_headers, mock_get):
     """Test general request exception handling"""
@@ -527,7 +527,7 @@ def test_get_circleci_workflow_ids_function_signature():
     assert params == ["owner", "repo", "check_suite_id", "github_token"]
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_verify_url_construction(
     mock_create_headers, mock_get
@@ -553,7 +553,7 @@ def test_get_circleci_workflow_ids_verify_url_construction(
     )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_verify_headers_called(mock_create_headers, mock_get):
     """Test that create_headers is called with the correct token"""
@@ -574,7 +574,7 @@ def test_get_circleci_workflow_ids_verify_headers_called(mock_create_headers, mo
     )
 
 
-@patch("services.github.check_suites.get_circleci_workflow_id.requests.get")
+@patch("services.github.check_suites.get_circleci_workflow_id.github_session.get")
 @patch("services.github.check_suites.get_circleci_workflow_id.create_headers")
 def test_get_circleci_workflow_ids_timeout_parameter(mock_create_headers, mock_get):
     """Test that the timeout parameter is set correctly"""
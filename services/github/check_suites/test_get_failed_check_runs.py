@@ -6,7 +6,7 @@ from services.github.check_suites.get_failed_check_runs import (
 )
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_failed_check_runs_when_mixed_outcomes(mock_create_headers, mock_get):
     """Returns only failed check runs when suite includes failed and non-failed runs"""
@@ -34,7 +34,7 @@ def test_returns_failed_check_runs_when_mixed_outcomes(mock_create_headers, mock
     assert result[2]["conclusion"] == "startup_failure"
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_all_when_only_failures(mock_create_headers, mock_get):
     """Returns all check runs when all are failures"""
@@ -58,7 +58,7 @@ def test_returns_all_when_only_failures(mock_create_headers, mock_get):
     assert all(cr["conclusion"] == "failure" for cr in result)
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_no_failures(mock_create_headers, mock_get):
     """Returns empty list when there are no failed check runs"""
@@ -81,7 +81,7 @@ def test_returns_empty_when_no_failures(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_api_error(mock_create_headers, mock_get):
     """Returns empty list when API returns error status code"""
@@ -99,7 +99,7 @@ def test_returns_empty_when_api_error(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_not_found(mock_create_headers, mock_get):
     """Returns empty list when check suite is not found"""
@@ -117,7 +117,7 @@ def test_returns_empty_when_not_found(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_unauthorized(mock_create_headers, mock_get):
     """Returns empty list when authentication fails"""
@@ -135,7 +135,7 @@ def test_returns_empty_when_unauthorized(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_response_has_no_check_runs_key(
     mock_create_headers, mock_get
@@ -155,7 +155,7 @@ def test_returns_empty_when_response_has_no_check_runs_key(
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_forbidden(mock_create_headers, mock_get):
     """Returns empty list when access is forbidden"""
@@ -173,7 +173,7 @@ def test_returns_empty_when_forbidden(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_check_runs_array_is_empty(mock_create_headers, mock_get):
     """Returns empty list when check_runs array is empty"""
@@ -191,7 +191,7 @@ def test_returns_empty_when_check_runs_array_is_empty(mock_create_headers, mock_
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_network_timeout(mock_create_headers, mock_get):
     """Returns empty list when network request times out"""
@@ -206,7 +206,7 @@ def test_returns_empty_when_network_timeout(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_connection_error(mock_create_headers, mock_get):
     """Returns empty list when connection fails"""
@@ -221,7 +221,7 @@ def test_returns_empty_when_connection_error(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_http_error(mock_create_headers, mock_get):
     """Returns empty list when HTTP error occurs"""
@@ -236,7 +236,7 @@ def test_returns_empty_when_http_error(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_request_exception(mock_create_headers, mock_get):
     """Returns empty list when general request exception occurs"""
@@ -251,7 +251,7 @@ def test_returns_empty_when_request_exception(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_all_failure_types(mock_create_headers, mock_get):
     """Returns all types of failures including startup_failure, failure, and timed_out"""
@@ -283,7 +283,7 @@ def test_returns_all_failure_types(mock_create_headers, mock_get):
     assert "neutral" not in conclusions
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_skips_check_runs_without_conclusion(mock_create_headers, mock_get):
     """Skips check runs that don't have a conclusion field"""
@@ -307,7 +307,7 @@ def test_skips_check_runs_without_conclusion(mock_create_headers, mock_get):
     assert result[0]["conclusion"] == "failure"
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_skips_check_runs_with_none_conclusion(mock_create_headers, mock_get):
     """Skips check runs with None as conclusion value"""
@@ -331,7 +331,7 @@ def test_skips_check_runs_with_none_conclusion(mock_create_headers, mock_get):
     assert result[0]["conclusion"] == "failure"
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_handles_large_number_of_check_runs(mock_create_headers, mock_get):
     """Correctly filters large number of check runs"""
@@ -355,7 +355,7 @@ def test_handles_large_number_of_check_runs(mock_create_headers, mock_get):
     assert all(cr["conclusion"] == "failure" for cr in result)
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_filters_various_conclusion_values(mock_create_headers, mock_get):
     """Correctly filters check runs with various conclusion values"""
@@ -387,7 +387,7 @@ def test_filters_various_conclusion_values(mock_create_headers, mock_get):
     assert "startup_failure" in conclusions
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_json_parsing_fails(mock_create_headers, mock_get):
     """Returns empty list when API response has malformed JSON"""
@@ -405,7 +405,7 @@ def test_returns_empty_when_json_parsing_fails(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_skips_check_runs_with_empty_string_conclusion(mock_create_headers, mock_get):
     """Skips check runs with empty string as conclusion"""
@@ -429,7 +429,7 @@ def test_skips_check_runs_with_empty_string_conclusion(mock_create_headers, mock
     assert result[0]["conclusion"] == "failure"
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_returns_empty_when_unprocessable_entity(mock_create_headers, mock_get):
     """Returns empty list when API returns 422 Unprocessable Entity"""
@@ -447,7 +447,7 @@ def test_returns_empty_when_unprocessable_entity(mock_create_headers, mock_get):
     assert not result
 
 
-@patch("services.github.check_suites.get_failed_check_runs.requests.get")
+@patch("services.github.check_suites.get_failed_check_runs.github_session.get")
 @patch("services.github.check_suites.get_failed_check_runs.create_headers")
 def test_preserves_order_of_failed_check_runs(mock_create_headers, mock_get):
     """Preserves original order of failed check runs in result"""
@@ -1,5 +1,5 @@
-import requests
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -9,7 +9,7 @@ def check_user_is_collaborator(owner: str, repo: str, user: str, token: str) ->
     """https://docs.github.com/en/rest/collaborators/collaborators?apiVersion=2022-11-28#check-if-a-user-is-a-repository-collaborator"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/collaborators/{user}"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
 
     # Return False if 404 (user is not a collaborator)
     if response.status_code == 404:
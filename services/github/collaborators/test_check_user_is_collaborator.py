@@ -19,7 +19,7 @@ from services.github.collaborators.check_user_is_collaborator import (
 def mock_requests_get():
     """Fixture to mock requests.get calls."""
     with patch(
-        "services.github.collaborators.check_user_is_collaborator.requests.get"
+        "services.github.collaborators.check_user_is_collaborator.github_session.get"
     ) as mock:
         yield mock
 
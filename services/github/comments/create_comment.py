@@ -1,7 +1,7 @@
-import requests
 from anthropic.types import ToolUnionParam
 
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import CommentArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -35,7 +35,7 @@ def create_comment(body: str, base_args: CommentArgs, **_kwargs):
     token = base_args["token"]
     number = base_args["pr_number"]
 
-    response = requests.post(
+    response = github_session.post(
         url=f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{number}/comments",
         headers=create_headers(token=token),
         json={"body": body},
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, GITHUB_APP_IDS, TIMEOUT
+from services.github.session import github_session
 from services.github.types.webhook.pr_comment import Comment
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -14,7 +13,7 @@ def get_pr_comments(
     """https://docs.github.com/en/rest/issues/comments#list-issue-comments"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{pr_number}/comments"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     response.raise_for_status()
     comments: list[Comment] = response.json()
     if exclude_self:
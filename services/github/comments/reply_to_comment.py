@@ -1,8 +1,7 @@
-import requests
-
 from anthropic.types import ToolUnionParam
 
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import ReviewBaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -57,7 +56,7 @@ def reply_to_comment(base_args: ReviewBaseArgs, body: str, **_kwargs):
         url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{pr_number}/comments/{comment_id}/replies"
 
     headers: dict[str, str] = create_headers(token=token)
-    response = requests.post(
+    response = github_session.post(
         url=url, headers=headers, json={"body": body}, timeout=TIMEOUT
     )
     # Parent comment is deleted. GitHub returns 404 on the replies endpoint. resolved-but-still-existing threads return 2xx, so 404 specifically means deletion. Sentry AGENT-303/304 (Foxquilt/foxden-shared-lib PR 629 comment 3093714165 deleted before GitAuto could reply).
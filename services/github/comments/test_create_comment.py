@@ -20,7 +20,7 @@ def test_create_comment_success(
 
     # Act
     with patch(
-        "services.github.comments.create_comment.requests.post"
+        "services.github.comments.create_comment.github_session.post"
     ) as mock_post, patch(
         "services.github.comments.create_comment.create_headers"
     ) as mock_create_headers:
@@ -48,7 +48,9 @@ def test_create_comment_request_error(
     )
 
     # Act
-    with patch("services.github.comments.create_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.create_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_response
         result = create_comment(body="Test comment", base_args=comment_args)
 
@@ -70,7 +72,7 @@ def test_create_comment_returns_none_when_url_is_not_str(
     )
 
     with patch(
-        "services.github.comments.create_comment.requests.post"
+        "services.github.comments.create_comment.github_session.post"
     ) as mock_post, patch(
         "services.github.comments.create_comment.create_headers"
     ) as mock_create_headers:
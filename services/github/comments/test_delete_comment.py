@@ -25,7 +25,7 @@ def test_delete_comment_success(mock_delete_response):
     comment_id = fake.random_int(min=1000, max=99999)
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         with patch(
             "services.github.comments.delete_comment.create_headers"
@@ -53,7 +53,7 @@ def test_delete_comment_with_different_comment_id(mock_delete_response):
     comment_id = fake.random_int(min=1000, max=99999)
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         mock_delete.return_value = mock_delete_response
 
@@ -84,7 +84,7 @@ def test_delete_comment_404_returns_none_silently():
     mock_response.raise_for_status.side_effect = HTTPError("404 Not Found")
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         mock_delete.return_value = mock_response
 
@@ -111,7 +111,7 @@ def test_delete_comment_non_404_error_handled_by_decorator():
     mock_response.raise_for_status.side_effect = HTTPError("500 Server Error")
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         mock_delete.return_value = mock_response
 
@@ -133,7 +133,7 @@ def test_delete_comment_request_timeout_handled():
     comment_id = fake.random_int(min=1000, max=99999)
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         mock_delete.side_effect = requests.exceptions.Timeout("Request timed out")
 
@@ -155,7 +155,7 @@ def test_delete_comment_uses_correct_timeout(mock_delete_response):
     comment_id = fake.random_int(min=1000, max=99999)
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         with patch("services.github.comments.delete_comment.TIMEOUT", 60):
             mock_delete.return_value = mock_delete_response
@@ -179,7 +179,7 @@ def test_delete_comment_uses_github_api_url(mock_delete_response):
     comment_id = fake.random_int(min=1000, max=99999)
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         with patch(
             "services.github.comments.delete_comment.GITHUB_API_URL",
@@ -209,7 +209,7 @@ def test_delete_comment_with_various_comment_ids(mock_delete_response, comment_i
     token = fake.sha256()
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete:
         mock_delete.return_value = mock_delete_response
 
@@ -236,7 +236,7 @@ def test_delete_comment_connection_error_handled():
     comment_id = fake.random_int(min=1000, max=99999)
 
     with patch(
-        "services.github.comments.delete_comment.requests.delete"
+        "services.github.comments.delete_comment.github_session.delete"
     ) as mock_delete, patch("utils.error.handle_exceptions.time.sleep"):
         mock_delete.side_effect = requests.exceptions.ConnectionError(
             "Connection failed"
@@ -29,7 +29,7 @@ def token():
 
 @pytest.fixture
 def mock_requests_get():
-    with patch("services.github.comments.get_pr_comments.requests.get") as mock:
+    with patch("services.github.comments.get_pr_comments.github_session.get") as mock:
         yield mock
 
 
@@ -41,7 +41,9 @@ def test_reply_to_comment_success(
         pr_number=123,
         review_id=456,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         result = reply_to_comment(base_args, "Test reply body")
@@ -76,7 +78,9 @@ def test_reply_to_comment_with_empty_body(
         pr_number=123,
         review_id=456,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         result = reply_to_comment(base_args, "")
@@ -115,7 +119,9 @@ It contains multiple paragraphs.
 - And some bullet points
 - With various content"""
 
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         result = reply_to_comment(base_args, multiline_body)
@@ -149,7 +155,9 @@ def test_reply_to_comment_with_special_characters(
     )
     special_body = "Reply with special chars: @user #123 $var & <tag> \"quotes\" 'apostrophes' 中文 🚀"
 
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         result = reply_to_comment(base_args, special_body)
@@ -181,7 +189,9 @@ def test_reply_to_comment_http_error_handled(
         pr_number=123,
         review_id=456,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_response = MagicMock()
         # status_code != 404 so the new 404-skip branch doesn't fire — we want this test to exercise raise_for_status. handle_http_error short-circuits 5xx via is_server_error (returns default without retry).
         mock_response.status_code = 500
@@ -212,7 +222,9 @@ def test_reply_to_comment_skips_on_404_without_raising(
         pr_number=629,
         review_id=3093714165,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 404
         # If we mistakenly fall through to raise_for_status, this side_effect proves it — but the new branch returns before reaching it.
@@ -238,7 +250,9 @@ def test_reply_to_comment_request_exception_handled(
         pr_number=123,
         review_id=456,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.side_effect = requests.exceptions.RequestException("Connection error")
 
         result = reply_to_comment(base_args, "Test body")
@@ -258,7 +272,9 @@ def test_reply_to_comment_json_decode_error_handled(
         pr_number=123,
         review_id=456,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
         mock_response.json.side_effect = ValueError("Invalid JSON")
@@ -295,7 +311,7 @@ def test_reply_to_comment_url_construction(
         expected_url = f"https://api.github.com/repos/{case['owner']}/{case['repo']}/pulls/{case['pr_number']}/comments/{case['review_id']}/replies"
 
         with patch(
-            "services.github.comments.reply_to_comment.requests.post"
+            "services.github.comments.reply_to_comment.github_session.post"
         ) as mock_post:
             mock_post.return_value = mock_post_response
 
@@ -321,7 +337,7 @@ def test_reply_to_comment_different_tokens(
         )
 
         with patch(
-            "services.github.comments.reply_to_comment.requests.post"
+            "services.github.comments.reply_to_comment.github_session.post"
         ) as mock_post:
             mock_post.return_value = mock_post_response
 
@@ -348,7 +364,7 @@ def test_reply_to_comment_response_url_extraction(
 
     for response_data in test_responses:
         with patch(
-            "services.github.comments.reply_to_comment.requests.post"
+            "services.github.comments.reply_to_comment.github_session.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = response_data
@@ -379,7 +395,9 @@ def test_reply_to_comment_various_ids(
     )
     expected_url = f"https://api.github.com/repos/test-owner/test-repo/pulls/{pr_number}/comments/{review_id}/replies"
 
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         result = reply_to_comment(base_args, "Test body")
@@ -428,7 +446,9 @@ def test_reply_to_comment_various_body_content(
         pr_number=123,
         review_id=456,
     )
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         result = reply_to_comment(base_args, body_content)
@@ -493,7 +513,9 @@ def test_pr_review_uses_issue_comments_api(mock_post_response, mock_create_heade
         "review_subject_type": "pr_review",
     }
 
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         # Intentionally passing partial dict to test runtime behavior
@@ -519,7 +541,9 @@ def test_pr_comment_uses_issue_comments_api(mock_post_response, mock_create_head
         "review_subject_type": "pr_comment",
     }
 
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         # Intentionally passing partial dict to test runtime behavior
@@ -564,7 +588,9 @@ def test_inline_review_with_review_id_uses_replies_api(
         "review_subject_type": "line",
     }
 
-    with patch("services.github.comments.reply_to_comment.requests.post") as mock_post:
+    with patch(
+        "services.github.comments.reply_to_comment.github_session.post"
+    ) as mock_post:
         mock_post.return_value = mock_post_response
 
         # Intentionally passing partial dict to test runtime behavior
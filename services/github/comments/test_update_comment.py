@@ -18,7 +18,9 @@ def test_update_comment_success(
     )
 
     # Act
-    with patch("services.github.comments.update_comment.requests.patch") as mock_patch:
+    with patch(
+        "services.github.comments.update_comment.github_session.patch"
+    ) as mock_patch:
         mock_patch.return_value = mock_response
         result = update_comment("Updated comment", base_args)
 
@@ -40,7 +42,9 @@ def test_update_comment_none_url(
     )
 
     # Act
-    with patch("services.github.comments.update_comment.requests.patch") as mock_patch:
+    with patch(
+        "services.github.comments.update_comment.github_session.patch"
+    ) as mock_patch:
         result = update_comment("Test comment", base_args)
 
     # Assert
@@ -63,7 +67,9 @@ def test_update_comment_request_error(
     )
 
     # Act
-    with patch("services.github.comments.update_comment.requests.patch") as mock_patch:
+    with patch(
+        "services.github.comments.update_comment.github_session.patch"
+    ) as mock_patch:
         mock_patch.return_value = mock_response
         result = update_comment("Test comment", base_args)
 
@@ -87,7 +93,9 @@ def test_update_comment_empty_body(
     )
 
     # Act
-    with patch("services.github.comments.update_comment.requests.patch") as mock_patch:
+    with patch(
+        "services.github.comments.update_comment.github_session.patch"
+    ) as mock_patch:
         mock_patch.return_value = mock_response
         result = update_comment("", base_args)
 
@@ -113,7 +121,7 @@ def test_update_comment_with_headers(
 
     # Act
     with patch(
-        "services.github.comments.update_comment.requests.patch"
+        "services.github.comments.update_comment.github_session.patch"
     ) as mock_patch, patch(
         "services.github.comments.update_comment.create_headers"
     ) as mock_create_headers:
@@ -141,7 +149,9 @@ def test_update_comment_missing_comment_url_key(
     )
 
     # Act
-    with patch("services.github.comments.update_comment.requests.patch") as mock_patch:
+    with patch(
+        "services.github.comments.update_comment.github_session.patch"
+    ) as mock_patch:
         result = update_comment("Test comment", base_args)
 
     # Assert
@@ -165,7 +175,7 @@ def test_update_comment_404_not_found(
 
     # Act
     with patch(
-        "services.github.comments.update_comment.requests.patch"
+        "services.github.comments.update_comment.github_session.patch"
     ) as mock_patch, patch(
         "services.github.comments.update_comment.logger"
     ) as mock_logger:
@@ -196,7 +206,7 @@ def test_update_comment_uses_timeout(
 
     # Act
     with patch(
-        "services.github.comments.update_comment.requests.patch"
+        "services.github.comments.update_comment.github_session.patch"
     ) as mock_patch, patch("services.github.comments.update_comment.TIMEOUT", 30):
         mock_patch.return_value = mock_response
         result = update_comment("Test comment", base_args)
@@ -223,7 +233,9 @@ def test_update_comment_calls_raise_for_status(
     )
 
     # Act
-    with patch("services.github.comments.update_comment.requests.patch") as mock_patch:
+    with patch(
+        "services.github.comments.update_comment.github_session.patch"
+    ) as mock_patch:
         mock_patch.return_value = mock_response
         result = update_comment("Test comment", base_args)
 
@@ -1,7 +1,5 @@
-import requests
-
-
 from config import TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -16,7 +14,7 @@ def update_comment(body: str, base_args: BaseArgs, **_kwargs):
     if comment_url is None:
         return None
 
-    response = requests.patch(
+    response = github_session.patch(
         url=comment_url,
         headers=create_headers(token=token),
         json={"body": body},
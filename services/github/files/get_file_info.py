@@ -1,8 +1,6 @@
-# Third party imports
-import requests
-
 # Local imports
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.types.contents import Contents
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import BaseArgs
@@ -23,7 +21,7 @@ def get_file_info(
 
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{file_path}?ref={new_branch}"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
 
     if response.status_code == 404:
         return None
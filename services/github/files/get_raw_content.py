@@ -1,6 +1,6 @@
 import base64
-import requests
 from config import GITHUB_API_URL, TIMEOUT, UTF8
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -9,7 +9,7 @@ from utils.error.handle_exceptions import handle_exceptions
 def get_raw_content(owner: str, repo: str, file_path: str, ref: str, token: str):
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{file_path}?ref={ref}"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
 
     if response.status_code == 404:
         return None
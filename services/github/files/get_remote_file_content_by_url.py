@@ -1,8 +1,8 @@
 import base64
 
-import requests
 
 from config import GITHUB_API_URL, TIMEOUT, UTF8
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -22,7 +22,7 @@ def get_remote_file_content_by_url(url: str, token: str):
     start, end = parts["start_line"], parts["end_line"]
     api_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{file_path}?ref={ref}"
     headers = create_headers(token=token)
-    response = requests.get(url=api_url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=api_url, headers=headers, timeout=TIMEOUT)
     if response.status_code == 404:
         logger.warning("%s/%s %s not found on ref %s", owner, repo, file_path, ref)
         return ("", "")
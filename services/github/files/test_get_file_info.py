@@ -83,7 +83,7 @@ class TestGetFileInfo:
             },
         ]
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_successful_file_retrieval(
         self, mock_create_headers, mock_get, base_args, mock_file_info
@@ -106,7 +106,7 @@ class TestGetFileInfo:
         )
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_file_not_found_404(self, mock_create_headers, mock_get, base_args):
         """Test handling of 404 file not found."""
@@ -127,7 +127,7 @@ class TestGetFileInfo:
         # Should not call raise_for_status for 404
         mock_response.raise_for_status.assert_not_called()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_directory_response_returns_none(
         self, mock_create_headers, mock_get, base_args, mock_directory_info
@@ -150,7 +150,7 @@ class TestGetFileInfo:
         )
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_directory_listing_returns_none(
         self, mock_create_headers, mock_get, base_args, mock_directory_listing
@@ -173,7 +173,7 @@ class TestGetFileInfo:
         )
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_http_error_handled_by_decorator(
         self, mock_create_headers, mock_get, base_args
@@ -203,7 +203,7 @@ class TestGetFileInfo:
         mock_get.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_json_decode_error_handled_by_decorator(
         self, mock_create_headers, mock_get, base_args
@@ -223,7 +223,7 @@ class TestGetFileInfo:
         mock_get.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_request_exception_handled_by_decorator(
         self, mock_create_headers, mock_get, base_args
@@ -239,7 +239,7 @@ class TestGetFileInfo:
         mock_create_headers.assert_called_once_with(token="test-token")
         mock_get.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_kwargs_parameter_ignored(
         self, mock_create_headers, mock_get, base_args, mock_file_info
@@ -259,7 +259,7 @@ class TestGetFileInfo:
         mock_create_headers.assert_called_once_with(token="test-token")
         mock_get.assert_called_once()
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_url_construction_with_special_characters(
         self, mock_create_headers, mock_get, base_args, mock_file_info
@@ -283,7 +283,7 @@ class TestGetFileInfo:
             timeout=120,
         )
 
-    @patch("services.github.files.get_file_info.requests.get")
+    @patch("services.github.files.get_file_info.github_session.get")
     @patch("services.github.files.get_file_info.create_headers")
     def test_different_base_args_values(
         self, mock_create_headers, mock_get, mock_file_info, create_test_base_args
@@ -83,7 +83,7 @@ def mock_response_500():
     return mock_response
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_successful_file_retrieval(
     mock_create_headers, mock_requests_get, mock_response_success
@@ -104,7 +104,7 @@ def test_successful_file_retrieval(
     mock_response_success.raise_for_status.assert_called_once()
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_file_not_found_404(mock_create_headers, mock_requests_get, mock_response_404):
     """Test handling of 404 file not found."""
@@ -126,7 +126,7 @@ def test_file_not_found_404(mock_create_headers, mock_requests_get, mock_respons
     mock_response_404.raise_for_status.assert_not_called()
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_directory_returns_none(
     mock_create_headers, mock_requests_get, mock_response_directory
@@ -147,7 +147,7 @@ def test_directory_returns_none(
     mock_response_directory.raise_for_status.assert_called_once()
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_response_without_content_field(
     mock_create_headers, mock_requests_get, mock_response_no_content
@@ -168,7 +168,7 @@ def test_response_without_content_field(
     mock_response_no_content.raise_for_status.assert_called_once()
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_server_error_handled_by_decorator(
     mock_create_headers, mock_requests_get, mock_response_500
@@ -189,7 +189,7 @@ def test_server_error_handled_by_decorator(
     )
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_different_branch_ref(
     mock_create_headers, mock_requests_get, mock_response_success
@@ -210,7 +210,7 @@ def test_different_branch_ref(
     )
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_nested_file_path(
     mock_create_headers, mock_requests_get, mock_response_success
@@ -231,7 +231,7 @@ def test_nested_file_path(
     )
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_unicode_content_decoding(mock_create_headers, mock_requests_get):
     """Test proper decoding of Unicode content."""
@@ -257,7 +257,7 @@ def test_unicode_content_decoding(mock_create_headers, mock_requests_get):
     assert result == unicode_content
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_json_decode_error_handled_by_decorator(mock_create_headers, mock_requests_get):
     """Test that JSON decode errors are handled by the exception decorator."""
@@ -275,7 +275,7 @@ def test_json_decode_error_handled_by_decorator(mock_create_headers, mock_reques
     assert result is None
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_empty_file_content(mock_create_headers, mock_requests_get):
     """Test handling of empty file content."""
@@ -301,7 +301,7 @@ def test_empty_file_content(mock_create_headers, mock_requests_get):
     assert result == ""
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_base64_decode_error_handled_by_decorator(
     mock_create_headers, mock_requests_get
@@ -324,7 +324,7 @@ def test_base64_decode_error_handled_by_decorator(
     assert result is None
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_requests_exception_handled_by_decorator(
     mock_create_headers, mock_requests_get
@@ -341,7 +341,7 @@ def test_requests_exception_handled_by_decorator(
     assert result is None
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_create_headers_exception_handled_by_decorator(
     mock_create_headers, mock_requests_get
@@ -355,7 +355,7 @@ def test_create_headers_exception_handled_by_decorator(
     assert result is None
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_commit_sha_as_ref(
     mock_create_headers, mock_requests_get, mock_response_success
@@ -377,7 +377,7 @@ def test_commit_sha_as_ref(
     )
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_special_characters_in_file_path(
     mock_create_headers, mock_requests_get, mock_response_success
@@ -397,7 +397,7 @@ def test_special_characters_in_file_path(
     )
 
 
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_large_file_content(mock_create_headers, mock_requests_get):
     """Test handling of large file content."""
@@ -437,7 +437,7 @@ def test_large_file_content(mock_create_headers, mock_requests_get):
         ("CamelCaseOwner", "CamelCaseRepo", "CamelCase/File.py", "CamelCaseBranch"),
     ],
 )
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_various_parameter_combinations(
     mock_create_headers,
@@ -469,7 +469,7 @@ def test_various_parameter_combinations(
     "status_code",
     [400, 401, 403, 422, 500, 502, 503],
 )
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_various_http_error_codes(mock_create_headers, mock_requests_get, status_code):
     """Test handling of various HTTP error status codes."""
@@ -503,7 +503,7 @@ def test_various_http_error_codes(mock_create_headers, mock_requests_get, status
         (".yml", "version: '3'\nservices:\n  app:\n    image: nginx"),
     ],
 )
-@patch("services.github.files.get_raw_content.requests.get")
+@patch("services.github.files.get_raw_content.github_session.get")
 @patch("services.github.files.get_raw_content.create_headers")
 def test_various_file_types(
     mock_create_headers, mock_requests_get, file_extension, content
@@ -78,7 +78,7 @@ class TestGetRemoteFileContentByUrl:
             "end_line": None,
         }
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_successful_file_retrieval_full_content(
@@ -119,7 +119,7 @@ class TestGetRemoteFileContentByUrl:
         )
         mock_github_response.raise_for_status.assert_called_once()
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_successful_file_retrieval_with_line_range(
@@ -156,7 +156,7 @@ class TestGetRemoteFileContentByUrl:
             timeout=120,
         )
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_successful_file_retrieval_single_line(
@@ -187,7 +187,7 @@ class TestGetRemoteFileContentByUrl:
             timeout=120,
         )
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_http_error_handled_by_decorator(
@@ -219,7 +219,7 @@ class TestGetRemoteFileContentByUrl:
         mock_create_headers.assert_called_once_with(token="test-token")
         mock_requests_get.assert_called_once()
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_json_decode_error_handled_by_decorator(
@@ -248,7 +248,7 @@ class TestGetRemoteFileContentByUrl:
         mock_create_headers.assert_called_once_with(token="test-token")
         mock_requests_get.assert_called_once()
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_base64_decode_error_handled_by_decorator(
@@ -281,7 +281,7 @@ class TestGetRemoteFileContentByUrl:
         mock_requests_get.assert_called_once()
 
     @patch("utils.error.handle_exceptions.time.sleep")
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_requests_exception_handled_by_decorator(
@@ -308,7 +308,7 @@ class TestGetRemoteFileContentByUrl:
         assert mock_create_headers.call_count == 3
         assert mock_requests_get.call_count == 3
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_parse_github_url_exception_handled_by_decorator(
@@ -327,7 +327,7 @@ class TestGetRemoteFileContentByUrl:
         mock_create_headers.assert_not_called()
         mock_requests_get.assert_not_called()
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_create_headers_exception_handled_by_decorator(
@@ -350,7 +350,7 @@ class TestGetRemoteFileContentByUrl:
         mock_create_headers.assert_called_once_with(token="test-token")
         mock_requests_get.assert_not_called()
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_empty_file_content(
@@ -385,7 +385,7 @@ class TestGetRemoteFileContentByUrl:
         assert file_path == "src/test.py"
         assert content == expected_content
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_unicode_content_handling(
@@ -426,7 +426,7 @@ class TestGetRemoteFileContentByUrl:
         assert file_path == "src/test.py"
         assert content == expected_content
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_different_branch_and_commit_sha(
@@ -468,7 +468,7 @@ class TestGetRemoteFileContentByUrl:
             timeout=120,
         )
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_nested_file_path(
@@ -510,7 +510,7 @@ class TestGetRemoteFileContentByUrl:
             timeout=120,
         )
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_line_range_edge_cases(
@@ -545,7 +545,7 @@ class TestGetRemoteFileContentByUrl:
         assert file_path == "src/test.py"
         assert content == expected_content
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_single_line_edge_case(
@@ -577,7 +577,7 @@ class TestGetRemoteFileContentByUrl:
         "status_code",
         [400, 401, 403, 422, 500, 502, 503],
     )
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_various_http_error_codes(
@@ -618,7 +618,7 @@ class TestGetRemoteFileContentByUrl:
             ("CamelCaseOwner", "CamelCaseRepo", "CamelCaseBranch", "CamelCase/File.py"),
         ],
     )
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_various_parameter_combinations(
@@ -666,7 +666,7 @@ class TestGetRemoteFileContentByUrl:
             timeout=120,
         )
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_large_file_content(
@@ -706,7 +706,7 @@ class TestGetRemoteFileContentByUrl:
         expected_body = "\n".join(numbered)
         assert content == f"```src/test.py\n{expected_body}\n```"
 
-    @patch("services.github.files.get_remote_file_content_by_url.requests.get")
+    @patch("services.github.files.get_remote_file_content_by_url.github_session.get")
     @patch("services.github.files.get_remote_file_content_by_url.create_headers")
     @patch("services.github.files.get_remote_file_content_by_url.parse_github_url")
     def test_404_returns_empty_without_sentry(
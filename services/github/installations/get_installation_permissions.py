@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.token.get_jwt import get_jwt
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -15,6 +14,6 @@ def get_installation_permissions(installation_id: int):
     # https://docs.github.com/en/rest/apps/apps?apiVersion=2022-11-28#get-an-installation-for-the-authenticated-app
     url = f"{GITHUB_API_URL}/app/installations/{installation_id}"
     headers = create_headers(token=jwt_token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     response.raise_for_status()
     return response.json().get("permissions", {})
@@ -45,7 +45,7 @@ def test_get_installation_permissions_success(mock_response, mock_headers):
     expected_url = f"{GITHUB_API_URL}/app/installations/{installation_id}"
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
@@ -85,7 +85,7 @@ def test_get_installation_permissions_no_permissions_key(mock_headers):
     mock_response.raise_for_status.return_value = None
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
@@ -111,7 +111,7 @@ def test_get_installation_permissions_empty_permissions(mock_headers):
     mock_response.raise_for_status.return_value = None
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
@@ -142,7 +142,7 @@ def test_get_installation_permissions_http_error(mock_headers):
     mock_response.raise_for_status.side_effect = http_error
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
@@ -165,7 +165,7 @@ def test_get_installation_permissions_request_exception(mock_headers):
     mock_jwt = "mock_jwt_token"
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
@@ -192,7 +192,7 @@ def test_get_installation_permissions_json_decode_error(mock_headers):
     mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
@@ -218,7 +218,7 @@ def test_get_installation_permissions_with_different_installation_ids():
         expected_url = f"{GITHUB_API_URL}/app/installations/{installation_id}"
 
         with patch(
-            "services.github.installations.get_installation_permissions.requests.get"
+            "services.github.installations.get_installation_permissions.github_session.get"
         ) as mock_get, patch(
             "services.github.installations.get_installation_permissions.create_headers"
         ) as mock_create_headers, patch(
@@ -247,7 +247,7 @@ def test_get_installation_permissions_always_uses_jwt():
     mock_jwt = "mock_jwt_token"
 
     with patch(
-        "services.github.installations.get_installation_permissions.requests.get"
+        "services.github.installations.get_installation_permissions.github_session.get"
     ) as mock_get, patch(
         "services.github.installations.get_installation_permissions.create_headers"
     ) as mock_create_headers, patch(
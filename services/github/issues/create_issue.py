@@ -1,6 +1,6 @@
 from typing import cast
-import requests
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.types.issue import Issue
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -29,7 +29,7 @@ def create_issue(
     if assignees:
         payload["assignees"] = assignees
 
-    response = requests.post(
+    response = github_session.post(
         url=f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues",
         headers=create_headers(token=token),
         json=payload,
@@ -48,7 +48,7 @@ def create_issue(
             "body": body,
             "labels": labels,
         }
-        response = requests.post(
+        response = github_session.post(
             url=f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues",
             headers=create_headers(token=token),
             json=payload_without_assignees,
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -9,7 +8,7 @@ from utils.error.handle_exceptions import handle_exceptions
 def issue_exists(*, owner: str, repo: str, token: str, title: str):
     """https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-issues-and-pull-requests"""
     query = f'repo:{owner}/{repo} is:issue is:open "{title}" in:title'
-    response = requests.get(
+    response = github_session.get(
         url=f"{GITHUB_API_URL}/search/issues",
         headers=create_headers(token=token),
         params={"q": query},
@@ -14,7 +14,9 @@ def test_create_issue_success_with_assignees(test_owner, test_repo, test_token):
         "html_url": "https://github.com/owner/repo/issues/123",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -51,7 +53,9 @@ def test_create_issue_success_without_assignees(test_owner, test_repo, test_toke
         "html_url": "https://github.com/owner/repo/issues/456",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -90,7 +94,9 @@ def test_create_issue_success_with_empty_assignees_list(
         "html_url": "https://github.com/owner/repo/issues/789",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -124,7 +130,9 @@ def test_create_issue_http_error(test_owner, test_repo, test_token):
     http_error.response = mock_error_response
     mock_response.raise_for_status.side_effect = http_error
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -146,7 +154,9 @@ def test_create_issue_http_error(test_owner, test_repo, test_token):
 
 
 def test_create_issue_request_exception(test_owner, test_repo, test_token):
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -175,7 +185,9 @@ def test_create_issue_with_none_assignees(test_owner, test_repo, test_token):
         "html_url": "https://github.com/owner/repo/issues/101",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -207,7 +219,9 @@ def test_create_issue_api_url_construction():
         "html_url": "https://github.com/test-owner/test-repo/issues/202",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers, patch(
         "services.github.issues.create_issue.GITHUB_API_URL", "https://api.github.com"
@@ -241,9 +255,13 @@ def test_create_issue_timeout_parameter(test_owner, test_repo, test_token):
         "html_url": "https://github.com/owner/repo/issues/303",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
-    ) as mock_create_headers, patch("services.github.issues.create_issue.TIMEOUT", 60):
+    ) as mock_create_headers, patch(
+        "services.github.issues.create_issue.TIMEOUT", 60
+    ):
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
         mock_post.return_value = mock_response
 
@@ -270,7 +288,9 @@ def test_create_issue_headers_creation(test_owner, test_repo):
         "html_url": "https://github.com/owner/repo/issues/404",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": "Bearer test-token-123"}
@@ -306,7 +326,9 @@ def test_create_issue_retry_on_invalid_assignees(test_owner, test_repo, test_tok
         "html_url": "https://github.com/owner/repo/issues/555",
     }
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers:
         mock_create_headers.return_value = {"Authorization": f"Bearer {test_token}"}
@@ -349,7 +371,9 @@ def test_create_issue_410_issues_disabled(test_owner, test_repo, test_token):
     mock_response.status_code = 410
     mock_response.raise_for_status.return_value = None  # Won't be called for 410
 
-    with patch("services.github.issues.create_issue.requests.post") as mock_post, patch(
+    with patch(
+        "services.github.issues.create_issue.github_session.post"
+    ) as mock_post, patch(
         "services.github.issues.create_issue.create_headers"
     ) as mock_create_headers, patch(
         "services.github.issues.create_issue.logger"
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 from services.github.issues.issue_exists import issue_exists
 
 
-@patch("services.github.issues.issue_exists.requests.get")
+@patch("services.github.issues.issue_exists.github_session.get")
 @patch("services.github.issues.issue_exists.create_headers")
 def test_returns_true_when_issue_found(mock_headers, mock_get):
     mock_headers.return_value = {"Authorization": "Bearer token"}
@@ -23,7 +23,7 @@ def test_returns_true_when_issue_found(mock_headers, mock_get):
     assert "Fix something" in call_kwargs["params"]["q"]
 
 
-@patch("services.github.issues.issue_exists.requests.get")
+@patch("services.github.issues.issue_exists.github_session.get")
 @patch("services.github.issues.issue_exists.create_headers")
 def test_returns_false_when_no_issue(mock_headers, mock_get):
     mock_headers.return_value = {"Authorization": "Bearer token"}
@@ -40,7 +40,7 @@ def test_returns_false_when_no_issue(mock_headers, mock_get):
     assert result is False
 
 
-@patch("services.github.issues.issue_exists.requests.get")
+@patch("services.github.issues.issue_exists.github_session.get")
 @patch("services.github.issues.issue_exists.create_headers")
 def test_returns_false_on_error(mock_headers, mock_get):
     mock_headers.return_value = {"Authorization": "Bearer token"}
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 from services.github.labels.add_labels import add_labels
 
 
-@patch("services.github.labels.add_labels.requests.post")
+@patch("services.github.labels.add_labels.github_session.post")
 @patch("services.github.labels.add_labels.create_headers")
 def test_add_labels_success(mock_create_headers, mock_post):
     mock_create_headers.return_value = {"Authorization": "token abc"}
@@ -25,7 +25,7 @@ def test_add_labels_success(mock_create_headers, mock_post):
     assert "repos/test-owner/test-repo/issues/42/labels" in call_kwargs["url"]
 
 
-@patch("services.github.labels.add_labels.requests.post")
+@patch("services.github.labels.add_labels.github_session.post")
 @patch("services.github.labels.add_labels.create_headers")
 def test_add_labels_empty_list(mock_create_headers, mock_post):
     mock_create_headers.return_value = {"Authorization": "token abc"}
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -15,6 +14,6 @@ def render_text(base_args: BaseArgs, text: str) -> str:
     url = f"{GITHUB_API_URL}/markdown"
     headers = create_headers(token=token)
     body = {"text": text, "mode": "gfm", "context": f"{owner}/{repo}"}
-    response = requests.post(url=url, headers=headers, json=body, timeout=TIMEOUT)
+    response = github_session.post(url=url, headers=headers, json=body, timeout=TIMEOUT)
     response.raise_for_status()
     return response.text
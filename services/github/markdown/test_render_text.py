@@ -42,7 +42,7 @@ def mock_headers():
 @pytest.fixture
 def mock_post_request(mock_response):
     """Fixture providing a mocked post request."""
-    with patch("services.github.markdown.render_text.requests.post") as mock_post:
+    with patch("services.github.markdown.render_text.github_session.post") as mock_post:
         mock_post.return_value = mock_response
         yield mock_post
 
@@ -217,7 +217,7 @@ def test_render_text_http_error_returns_empty_string(mock_base_args):
     """Test that HTTP errors return empty string due to handle_exceptions decorator."""
     text = "Test content"
 
-    with patch("services.github.markdown.render_text.requests.post") as mock_post:
+    with patch("services.github.markdown.render_text.github_session.post") as mock_post:
         mock_response = MagicMock()
         # Create a proper HTTPError with a response object
         http_error = HTTPError("404 Not Found")
@@ -239,7 +239,7 @@ def test_render_text_request_exception_returns_empty_string(mock_base_args):
     """Test that request exceptions return empty string due to handle_exceptions decorator."""
     text = "Test content"
 
-    with patch("services.github.markdown.render_text.requests.post") as mock_post:
+    with patch("services.github.markdown.render_text.github_session.post") as mock_post:
         mock_post.side_effect = requests.RequestException("Connection error")
 
         result = render_text(mock_base_args, text)
@@ -262,7 +262,7 @@ def test_render_text_returns_response_text(mock_base_args):
     text = "Test content"
     expected_response = "<h1>Rendered HTML</h1>"
 
-    with patch("services.github.markdown.render_text.requests.post") as mock_post:
+    with patch("services.github.markdown.render_text.github_session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.text = expected_response
         mock_response.raise_for_status.return_value = None
@@ -366,7 +366,7 @@ def test_render_text_json_decode_error_returns_empty_string(mock_base_args):
     """Test that JSON decode errors return empty string due to handle_exceptions decorator."""
     text = "Test content"
 
-    with patch("services.github.markdown.render_text.requests.post") as mock_post:
+    with patch("services.github.markdown.render_text.github_session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
         mock_response.text = "Invalid JSON response"
@@ -384,7 +384,7 @@ def test_render_text_attribute_error_returns_empty_string(mock_base_args):
     """Test that attribute errors return empty string due to handle_exceptions decorator."""
     text = "Test content"
 
-    with patch("services.github.markdown.render_text.requests.post") as mock_post:
+    with patch("services.github.markdown.render_text.github_session.post") as mock_post:
         # Create a mock response that doesn't have a text attribute
         mock_response = MagicMock(spec=[])  # Empty spec means no attributes
         mock_response.raise_for_status = MagicMock()
@@ -1,9 +1,8 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
 from services.github.collaborators.check_user_is_collaborator import (
     check_user_is_collaborator,
 )
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -46,5 +45,5 @@ def add_reviewers(base_args: BaseArgs):
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{pr_number}/requested_reviewers"
     headers = create_headers(token=token)
     json = {"reviewers": valid_reviewers}
-    response = requests.post(url=url, headers=headers, json=json, timeout=TIMEOUT)
+    response = github_session.post(url=url, headers=headers, json=json, timeout=TIMEOUT)
     response.raise_for_status()
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -21,7 +20,9 @@ def change_pr_base_branch(
     headers = create_headers(token=token)
     body = {"base": new_base_branch}
 
-    response = requests.patch(url=url, headers=headers, json=body, timeout=TIMEOUT)
+    response = github_session.patch(
+        url=url, headers=headers, json=body, timeout=TIMEOUT
+    )
     response.raise_for_status()
     logger.info("Changed base of PR #%d to %s", pr_number, new_base_branch)
     return True
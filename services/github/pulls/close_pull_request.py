@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -12,7 +11,7 @@ def close_pull_request(pr_number: int, base_args: BaseArgs):
     owner = base_args["owner"]
     repo = base_args["repo"]
     token = base_args["token"]
-    response = requests.patch(
+    response = github_session.patch(
         url=f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{pr_number}",
         headers=create_headers(token=token),
         json={"state": "closed"},
@@ -2,6 +2,7 @@ import requests
 
 from config import GITHUB_API_URL, TIMEOUT
 from services.github.pulls.add_reviewers import add_reviewers
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -17,7 +18,7 @@ def create_pull_request(body: str, title: str, base_args: BaseArgs):
         base_args["new_branch"],
         base_args["token"],
     )
-    response: requests.Response = requests.post(
+    response: requests.Response = github_session.post(
         url=f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls",
         headers=create_headers(token=token),
         json={"title": title, "body": body, "head": head, "base": base},
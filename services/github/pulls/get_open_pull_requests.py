@@ -1,5 +1,5 @@
-import requests
 from config import GITHUB_API_URL, GITHUB_APP_USER_NAME, PER_PAGE, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -18,7 +18,7 @@ def get_open_pull_requests(owner: str, repo: str, token: str):
             "per_page": PER_PAGE,
             "page": page,
         }
-        response = requests.get(
+        response = github_session.get(
             url=url, headers=headers, params=params, timeout=TIMEOUT
         )
         response.raise_for_status()
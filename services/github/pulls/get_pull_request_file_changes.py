@@ -1,5 +1,5 @@
-import requests
 from config import TIMEOUT, PER_PAGE
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -14,7 +14,7 @@ def get_pull_request_file_changes(url: str, token: str):
     page = 1
     while True:
         params = {"per_page": PER_PAGE, "page": page}
-        response = requests.get(
+        response = github_session.get(
             url=url, headers=headers, params=params, timeout=TIMEOUT
         )
         response.raise_for_status()
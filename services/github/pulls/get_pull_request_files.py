@@ -1,8 +1,6 @@
-# Third party imports
-import requests
-
 # Local imports
 from config import GITHUB_API_URL, PER_PAGE, TIMEOUT
+from services.github.session import github_session
 from services.github.types.pull_request_file import PullRequestFile
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -18,7 +16,7 @@ def get_pull_request_files(owner: str, repo: str, pr_number: int, token: str):
 
     while True:
         params = {"per_page": PER_PAGE, "page": page}
-        response = requests.get(
+        response = github_session.get(
             url=url, headers=headers, params=params, timeout=TIMEOUT
         )
         response.raise_for_status()
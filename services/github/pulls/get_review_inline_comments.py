@@ -1,9 +1,7 @@
-# Third party imports
-import requests
-
 # Local imports
 from config import GITHUB_API_URL, PER_PAGE, TIMEOUT
 from payloads.github.pull_request_review_comment.types import ReviewComment
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -18,7 +16,7 @@ def get_review_inline_comments(
     all_comments: list[ReviewComment] = []
     page = 1
     while True:
-        response = requests.get(
+        response = github_session.get(
             url=url,
             headers=headers,
             timeout=TIMEOUT,
@@ -1,8 +1,6 @@
-# Third party imports
-import requests
-
 # Local imports
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -14,7 +12,7 @@ def get_review_summary_comment(
     """https://docs.github.com/en/rest/pulls/reviews#get-a-review-for-a-pull-request"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{pr_number}/reviews/{review_id}"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     response.raise_for_status()
     data: dict[str, str | int | None] = response.json()
     body = data.get("body") or ""
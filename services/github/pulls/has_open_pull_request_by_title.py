@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.types.pull_request import PullRequest
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -13,7 +12,9 @@ def has_open_pull_request_by_title(owner: str, repo: str, token: str, title: str
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls"
     headers = create_headers(token=token)
     params: dict[str, str | int] = {"state": "open", "per_page": 100}
-    response = requests.get(url=url, headers=headers, params=params, timeout=TIMEOUT)
+    response = github_session.get(
+        url=url, headers=headers, params=params, timeout=TIMEOUT
+    )
     response.raise_for_status()
 
     prs: list[PullRequest] = response.json()
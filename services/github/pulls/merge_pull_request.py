@@ -1,8 +1,8 @@
 from typing import Literal
 
-import requests
 
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -24,7 +24,7 @@ def merge_pull_request(
 
     data = {"merge_method": merge_method}
 
-    response = requests.put(url=url, headers=headers, json=data, timeout=TIMEOUT)
+    response = github_session.put(url=url, headers=headers, json=data, timeout=TIMEOUT)
 
     if response.status_code == 405:
         error_detail = response.json().get(
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -20,7 +19,9 @@ def reopen_pull_request(
     headers = create_headers(token=token)
     body = {"state": "open"}
 
-    response = requests.patch(url=url, headers=headers, json=body, timeout=TIMEOUT)
+    response = github_session.patch(
+        url=url, headers=headers, json=body, timeout=TIMEOUT
+    )
     response.raise_for_status()
     logger.info("Reopened PR #%d", pr_number)
     return True
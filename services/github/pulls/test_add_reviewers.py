@@ -31,7 +31,7 @@ def mock_error_response():
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_success_all_valid(
     mock_check_collaborator,
@@ -82,7 +82,7 @@ def test_add_reviewers_success_all_valid(
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_success_partial_valid(
     mock_check_collaborator,
@@ -221,7 +221,7 @@ def test_add_reviewers_pr_number_none(test_owner, test_repo, create_test_base_ar
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_http_error(
     mock_check_collaborator,
@@ -253,7 +253,7 @@ def test_add_reviewers_http_error(
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_requests_exception(
     mock_check_collaborator,
@@ -328,7 +328,7 @@ def test_add_reviewers_collaborator_check_exception(
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_single_reviewer(
     mock_check_collaborator,
@@ -363,7 +363,7 @@ def test_add_reviewers_single_reviewer(
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_422_unprocessable_entity(
     mock_check_collaborator,
@@ -413,7 +413,7 @@ def test_add_reviewers_missing_required_fields(create_test_base_args):
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_mixed_collaborator_results(
     mock_check_collaborator,
@@ -456,7 +456,7 @@ def test_add_reviewers_mixed_collaborator_results(
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_timeout_error(
     mock_check_collaborator,
@@ -485,7 +485,7 @@ def test_add_reviewers_timeout_error(
 
 @patch("utils.error.handle_exceptions.time.sleep")
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_connection_error(
     mock_check_collaborator,
@@ -515,7 +515,7 @@ def test_add_reviewers_connection_error(
 
 
 @patch("services.github.pulls.add_reviewers.create_headers")
-@patch("services.github.pulls.add_reviewers.requests.post")
+@patch("services.github.pulls.add_reviewers.github_session.post")
 @patch("services.github.pulls.add_reviewers.check_user_is_collaborator")
 def test_add_reviewers_url_construction(
     mock_check_collaborator,
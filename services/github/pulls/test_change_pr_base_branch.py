@@ -7,7 +7,7 @@ from services.github.pulls.change_pr_base_branch import change_pr_base_branch
 MODULE = "services.github.pulls.change_pr_base_branch"
 
 
-@patch(f"{MODULE}.requests.patch")
+@patch(f"{MODULE}.github_session.patch")
 def test_changes_base_branch(mock_patch):
     mock_response = MagicMock()
     mock_response.raise_for_status = MagicMock()
@@ -22,7 +22,7 @@ def test_changes_base_branch(mock_patch):
     assert call_kwargs["json"] == {"base": "develop"}
 
 
-@patch(f"{MODULE}.requests.patch")
+@patch(f"{MODULE}.github_session.patch")
 def test_returns_false_on_error(mock_patch):
     mock_patch.side_effect = Exception("API error")
 
@@ -43,7 +43,7 @@ def mock_error_response():
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_success(
     mock_post,
     mock_create_headers,
@@ -89,7 +89,7 @@ def test_create_pull_request_success(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_422_error(
     mock_post,
     mock_create_headers,
@@ -137,7 +137,7 @@ def test_create_pull_request_422_error(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_http_error(
     mock_post,
     mock_create_headers,
@@ -180,7 +180,7 @@ def test_create_pull_request_http_error(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_json_error(
     mock_post,
     mock_create_headers,
@@ -214,7 +214,7 @@ def test_create_pull_request_json_error(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_add_reviewers_error(
     mock_post,
     mock_create_headers,
@@ -253,7 +253,7 @@ def test_create_pull_request_add_reviewers_error(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_empty_strings(
     mock_post,
     mock_create_headers,
@@ -291,7 +291,7 @@ def test_create_pull_request_empty_strings(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_different_branches(
     mock_post,
     mock_create_headers,
@@ -330,7 +330,7 @@ def test_create_pull_request_different_branches(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_requests_exception(
     mock_post,
     mock_create_headers,
@@ -360,7 +360,7 @@ def test_create_pull_request_requests_exception(
 
 @patch("services.github.pulls.create_pull_request.add_reviewers")
 @patch("services.github.pulls.create_pull_request.create_headers")
-@patch("services.github.pulls.create_pull_request.requests.post")
+@patch("services.github.pulls.create_pull_request.github_session.post")
 def test_create_pull_request_create_headers_exception(
     mock_post,
     mock_create_headers,
@@ -26,7 +26,9 @@ def test_get_open_pull_requests_success():
     ]
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_open_pull_requests.github_session.get"
+    ) as mock_get:
         mock_get.side_effect = [
             mock_response,
             Mock(json=lambda: [], raise_for_status=Mock()),
@@ -68,7 +70,9 @@ def test_get_open_pull_requests_pagination():
     mock_response_3.json.return_value = []
     mock_response_3.raise_for_status = Mock()
 
-    with patch("requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_open_pull_requests.github_session.get"
+    ) as mock_get:
         mock_get.side_effect = [mock_response_1, mock_response_2, mock_response_3]
 
         result = get_open_pull_requests(
@@ -86,7 +90,10 @@ def test_get_open_pull_requests_empty():
     mock_response.json.return_value = []
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get", return_value=mock_response):
+    with patch(
+        "services.github.pulls.get_open_pull_requests.github_session.get",
+        return_value=mock_response,
+    ):
         result = get_open_pull_requests(
             owner="test-owner",
             repo="test-repo",
@@ -97,7 +104,10 @@ def test_get_open_pull_requests_empty():
 
 
 def test_get_open_pull_requests_error():
-    with patch("requests.get", side_effect=Exception("API error")):
+    with patch(
+        "services.github.pulls.get_open_pull_requests.github_session.get",
+        side_effect=Exception("API error"),
+    ):
         result = get_open_pull_requests(
             owner="test-owner",
             repo="test-repo",
@@ -138,7 +148,9 @@ def test_get_open_pull_requests_filters_non_gitauto_prs():
     ]
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_open_pull_requests.github_session.get"
+    ) as mock_get:
         mock_get.side_effect = [
             mock_response,
             Mock(json=lambda: [], raise_for_status=Mock()),
@@ -179,7 +191,9 @@ def test_get_open_pull_requests_no_gitauto_prs():
     ]
     mock_response.raise_for_status = Mock()
 
-    with patch("requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_open_pull_requests.github_session.get"
+    ) as mock_get:
         mock_get.side_effect = [
             mock_response,
             Mock(json=lambda: [], raise_for_status=Mock()),
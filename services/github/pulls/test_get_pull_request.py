@@ -71,7 +71,7 @@ def test_get_pull_request_success():
     }
 
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -103,7 +103,7 @@ def test_get_pull_request_success():
 def test_get_pull_request_http_error_404():
     """Test handling of 404 HTTP error."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -131,7 +131,7 @@ def test_get_pull_request_http_error_404():
 def test_get_pull_request_http_error_500():
     """Test handling of 500 HTTP error."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -159,7 +159,7 @@ def test_get_pull_request_http_error_500():
 def test_get_pull_request_network_error():
     """Test handling of network connection error."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -178,7 +178,7 @@ def test_get_pull_request_network_error():
 def test_get_pull_request_timeout_error():
     """Test handling of timeout error."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -197,7 +197,7 @@ def test_get_pull_request_timeout_error():
 def test_get_pull_request_url_construction():
     """Test that the URL is constructed correctly with different parameters."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -221,7 +221,7 @@ def test_get_pull_request_url_construction():
 def test_get_pull_request_headers_creation():
     """Test that headers are created correctly."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -241,7 +241,7 @@ def test_get_pull_request_headers_creation():
 def test_get_pull_request_json_decode_error():
     """Test handling of JSON decode error."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -262,7 +262,7 @@ def test_get_pull_request_json_decode_error():
 def test_get_pull_request_with_special_characters():
     """Test with owner/repo names containing special characters."""
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
@@ -288,7 +288,7 @@ def test_get_pull_request_return_type_cast():
     mock_pr_data = {"number": 123, "title": "Test PR", "state": "open"}
 
     with patch(
-        "services.github.pulls.get_pull_request.requests.get"
+        "services.github.pulls.get_pull_request.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request.create_headers"
     ) as mock_headers:
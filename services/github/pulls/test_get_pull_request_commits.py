@@ -30,7 +30,7 @@ def test_get_pull_request_commits_success_single_page():
     ]
 
     with patch(
-        "services.github.pulls.get_pull_request_commits.requests.get"
+        "services.github.pulls.get_pull_request_commits.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request_commits.create_headers"
     ) as mock_headers:
@@ -55,7 +55,7 @@ def test_get_pull_request_commits_success_multiple_pages():
     page2_commits = [{"sha": f"commit{i}"} for i in range(100, 150)]
 
     with patch(
-        "services.github.pulls.get_pull_request_commits.requests.get"
+        "services.github.pulls.get_pull_request_commits.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request_commits.create_headers"
     ) as mock_headers:
@@ -85,7 +85,7 @@ def test_get_pull_request_commits_success_multiple_pages():
 
 def test_get_pull_request_commits_empty_result():
     with patch(
-        "services.github.pulls.get_pull_request_commits.requests.get"
+        "services.github.pulls.get_pull_request_commits.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request_commits.create_headers"
     ) as mock_headers:
@@ -104,7 +104,7 @@ def test_get_pull_request_commits_empty_result():
 
 def test_get_pull_request_commits_http_error():
     with patch(
-        "services.github.pulls.get_pull_request_commits.requests.get"
+        "services.github.pulls.get_pull_request_commits.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request_commits.create_headers"
     ) as mock_headers:
@@ -125,7 +125,7 @@ def test_get_pull_request_commits_http_error():
 
 def test_get_pull_request_commits_network_error():
     with patch(
-        "services.github.pulls.get_pull_request_commits.requests.get"
+        "services.github.pulls.get_pull_request_commits.github_session.get"
     ) as mock_get, patch(
         "services.github.pulls.get_pull_request_commits.create_headers"
     ) as mock_headers:
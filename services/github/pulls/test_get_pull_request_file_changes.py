@@ -14,7 +14,9 @@ from services.github.pulls.get_pull_request_file_changes import (
 @pytest.fixture
 def mock_requests():
     """Mock requests module for testing."""
-    with patch("services.github.pulls.get_pull_request_file_changes.requests") as mock:
+    with patch(
+        "services.github.pulls.get_pull_request_file_changes.github_session"
+    ) as mock:
         yield mock
 
 
@@ -6,7 +6,7 @@ from services.github.pulls.get_pull_request_files import get_pull_request_files
 
 @pytest.fixture
 def mock_requests():
-    with patch("services.github.pulls.get_pull_request_files.requests") as mock:
+    with patch("services.github.pulls.get_pull_request_files.github_session") as mock:
         yield mock
 
 
@@ -51,7 +51,9 @@ def test_get_pull_request_files_pagination():
     page1_data = [{"filename": "file1.py", "status": "modified"}]
     page2_data = [{"filename": "file2.js", "status": "added"}]
 
-    with patch("services.github.pulls.get_pull_request_files.requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_pull_request_files.github_session.get"
+    ) as mock_get:
         mock_response1 = Mock()
         mock_response1.json.return_value = page1_data
         mock_response1.raise_for_status.return_value = None
@@ -87,7 +89,9 @@ def test_get_pull_request_files_missing_fields():
         {"filename": "file3.txt", "status": "removed"},
     ]
 
-    with patch("services.github.pulls.get_pull_request_files.requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_pull_request_files.github_session.get"
+    ) as mock_get:
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
@@ -106,7 +110,9 @@ def test_get_pull_request_files_missing_fields():
 
 
 def test_get_pull_request_files_http_error():
-    with patch("services.github.pulls.get_pull_request_files.requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_pull_request_files.github_session.get"
+    ) as mock_get:
         mock_response = Mock()
         mock_response.status_code = 404
         http_error = requests.exceptions.HTTPError("404 Not Found")
@@ -122,7 +128,9 @@ def test_get_pull_request_files_http_error():
 
 
 def test_get_pull_request_files_empty_response():
-    with patch("services.github.pulls.get_pull_request_files.requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_pull_request_files.github_session.get"
+    ) as mock_get:
         mock_response = Mock()
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
@@ -136,7 +144,9 @@ def test_get_pull_request_files_empty_response():
 
 
 def test_get_pull_request_files_constructs_correct_url():
-    with patch("services.github.pulls.get_pull_request_files.requests.get") as mock_get:
+    with patch(
+        "services.github.pulls.get_pull_request_files.github_session.get"
+    ) as mock_get:
         mock_response = Mock()
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
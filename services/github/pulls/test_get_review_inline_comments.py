@@ -15,7 +15,7 @@ def test_get_review_inline_comments_success():
         {"id": 1, "body": "Fix this line", "path": "src/main.py", "line": 10},
         {"id": 2, "body": "Typo here", "path": "src/utils.py", "line": 5},
     ]
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_response = MagicMock()
@@ -37,7 +37,7 @@ def test_get_review_inline_comments_success():
 
 
 def test_get_review_inline_comments_empty():
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_response = MagicMock()
@@ -51,7 +51,7 @@ def test_get_review_inline_comments_empty():
 
 
 def test_get_review_inline_comments_http_error():
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_response = MagicMock()
@@ -67,7 +67,7 @@ def test_get_review_inline_comments_http_error():
 
 
 def test_get_review_inline_comments_network_error():
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -83,7 +83,7 @@ def test_get_review_inline_comments_paginates():
     page1 = [{"id": i, "body": f"c{i}", "path": "a.py", "line": i} for i in range(100)]
     page2 = [{"id": 100, "body": "c100", "path": "b.py", "line": 1}]
 
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         resp1 = MagicMock()
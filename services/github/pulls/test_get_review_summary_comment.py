@@ -12,7 +12,7 @@ MODULE = "services.github.pulls.get_review_summary_comment"
 
 def test_get_review_summary_comment_success():
     mock_data = {"id": 100, "body": "Looks good overall", "state": "commented"}
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_response = MagicMock()
@@ -32,7 +32,7 @@ def test_get_review_summary_comment_success():
 
 
 def test_get_review_summary_comment_http_error():
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_response = MagicMock()
@@ -48,7 +48,7 @@ def test_get_review_summary_comment_http_error():
 
 
 def test_get_review_summary_comment_network_error():
-    with patch(f"{MODULE}.requests.get") as mock_get, patch(
+    with patch(f"{MODULE}.github_session.get") as mock_get, patch(
         f"{MODULE}.create_headers"
     ) as mock_headers:
         mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -9,7 +9,7 @@ MODULE = "services.github.pulls.has_open_pull_request_by_title"
 
 
 class TestHasOpenPullRequestByTitle:
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_returns_true_when_pr_exists(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -25,7 +25,7 @@ class TestHasOpenPullRequestByTitle:
 
         assert result is True
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_returns_false_when_no_matching_pr(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -40,7 +40,7 @@ class TestHasOpenPullRequestByTitle:
 
         assert result is False
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_returns_false_when_no_open_prs(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -53,7 +53,7 @@ class TestHasOpenPullRequestByTitle:
 
         assert result is False
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_calls_correct_api_url(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 from services.github.pulls.merge_pull_request import merge_pull_request
 
 
-@patch("services.github.pulls.merge_pull_request.requests.put")
+@patch("services.github.pulls.merge_pull_request.github_session.put")
 def test_merge_pull_request_success(mock_put):
     mock_response = MagicMock()
     mock_response.json.return_value = {
@@ -28,7 +28,7 @@ def test_merge_pull_request_success(mock_put):
     assert call_args[1]["json"]["merge_method"] == "squash"
 
 
-@patch("services.github.pulls.merge_pull_request.requests.put")
+@patch("services.github.pulls.merge_pull_request.github_session.put")
 def test_merge_pull_request_handles_error(mock_put):
     mock_put.side_effect = Exception("API error")
 
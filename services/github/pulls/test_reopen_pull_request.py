@@ -7,7 +7,7 @@ from services.github.pulls.reopen_pull_request import reopen_pull_request
 MODULE = "services.github.pulls.reopen_pull_request"
 
 
-@patch(f"{MODULE}.requests.patch")
+@patch(f"{MODULE}.github_session.patch")
 def test_reopens_pr(mock_patch):
     mock_response = MagicMock()
     mock_response.raise_for_status = MagicMock()
@@ -20,7 +20,7 @@ def test_reopens_pr(mock_patch):
     assert call_kwargs["json"] == {"state": "open"}
 
 
-@patch(f"{MODULE}.requests.patch")
+@patch(f"{MODULE}.github_session.patch")
 def test_returns_false_on_error(mock_patch):
     mock_patch.side_effect = Exception("API error")
 
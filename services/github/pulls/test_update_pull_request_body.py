@@ -14,7 +14,9 @@ EXPECTED_URL = f"https://api.github.com/repos/{OWNER}/{REPO}/pulls/{PR_NUMBER}"
 
 @pytest.fixture
 def mock_requests_patch():
-    with patch("services.github.pulls.update_pull_request_body.requests.patch") as mock:
+    with patch(
+        "services.github.pulls.update_pull_request_body.github_session.patch"
+    ) as mock:
         yield mock
 
 
@@ -1,4 +1,7 @@
 from unittest.mock import Mock, patch
+
+import pytest
+
 from services.github.pulls.update_pull_request_branch import update_pull_request_branch
 
 
@@ -6,7 +9,10 @@ def test_update_pull_request_branch_success():
     mock_response = Mock()
     mock_response.status_code = 202
 
-    with patch("requests.put", return_value=mock_response) as mock_put:
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        return_value=mock_response,
+    ) as mock_put:
         status, error = update_pull_request_branch(
             owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
         )
@@ -15,11 +21,16 @@ def test_update_pull_request_branch_success():
         assert error is None
         mock_put.assert_called_once()
         _, kwargs = mock_put.call_args
-        assert "/repos/test-owner/test-repo/pulls/123/update-branch" in kwargs["url"]
+        assert kwargs["url"] == (
+            "https://api.github.com/repos/test-owner/test-repo/pulls/123/update-branch"
+        )
 
 
 def test_update_pull_request_branch_error():
-    with patch("requests.put", side_effect=Exception("API error")):
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        side_effect=Exception("API error"),
+    ):
         status, error = update_pull_request_branch(
             owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
         )
@@ -35,7 +46,10 @@ def test_update_pull_request_branch_already_up_to_date():
         "message": "There are no new commits on the base branch."
     }
 
-    with patch("requests.put", return_value=mock_response):
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        return_value=mock_response,
+    ):
         status, error = update_pull_request_branch(
             owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
         )
@@ -51,7 +65,10 @@ def test_update_pull_request_branch_merge_conflict():
         "message": "merge conflict between base and head"
     }
 
-    with patch("requests.put", return_value=mock_response):
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        return_value=mock_response,
+    ):
         status, error = update_pull_request_branch(
             owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
         )
@@ -65,11 +82,55 @@ def test_update_pull_request_branch_http_error():
     mock_response.status_code = 500
     mock_response.json.return_value = {"message": "Internal server error"}
 
-    with patch("requests.put", return_value=mock_response):
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        return_value=mock_response,
+    ):
         status, error = update_pull_request_branch(
             owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
         )
 
         assert status == "failed"
-        assert error is not None
-        assert "500" in error
+        assert error == "HTTP 500: Internal server error"
+
+
+@pytest.mark.parametrize(
+    "status_code,message",
+    [
+        (403, "You have exceeded a secondary rate limit. Please wait a few minutes."),
+        (403, "API rate limit exceeded for installation ID 123."),
+        (429, "You have exceeded a secondary rate limit."),
+    ],
+)
+def test_update_pull_request_branch_rate_limited(status_code, message):
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = {"message": message}
+
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        return_value=mock_response,
+    ):
+        result = update_pull_request_branch(
+            owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
+        )
+
+    assert result == ("rate_limited", f"HTTP {status_code}: {message}")
+
+
+def test_update_pull_request_branch_forbidden_is_not_rate_limited():
+    mock_response = Mock()
+    mock_response.status_code = 403
+    mock_response.json.return_value = {
+        "message": "Resource not accessible by integration"
+    }
+
+    with patch(
+        "services.github.pulls.update_pull_request_branch.github_session.put",
+        return_value=mock_response,
+    ):
+        result = update_pull_request_branch(
+            owner="test-owner", repo="test-repo", pr_number=123, token="test-token"
+        )
+
+    assert result == ("failed", "HTTP 403: Resource not accessible by integration")
@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -13,6 +12,8 @@ def update_pull_request_body(
     url = f"{GITHUB_API_URL}/repos/{owner_name}/{repo_name}/pulls/{pr_number}"
     headers = create_headers(token=token)
     data = {"body": body}
-    response = requests.patch(url=url, headers=headers, json=data, timeout=TIMEOUT)
+    response = github_session.patch(
+        url=url, headers=headers, json=data, timeout=TIMEOUT
+    )
     response.raise_for_status()
     return response.json()
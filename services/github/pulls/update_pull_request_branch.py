@@ -1,9 +1,10 @@
 import json
 
-import requests
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
 
 
 @handle_exceptions(
@@ -15,30 +16,44 @@ def update_pull_request_branch(
     """https://docs.github.com/en/rest/pulls/pulls?apiVersion=2022-11-28#update-a-pull-request-branch"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{pr_number}/update-branch"
     headers = create_headers(token=token)
-    response = requests.put(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.put(url=url, headers=headers, timeout=TIMEOUT)
 
     if response.status_code == 202:
+        logger.info("PR #%s branch update accepted", pr_number)
         return ("updated", None)
 
     if response.status_code == 422:
+        logger.info("PR #%s update-branch returned 422; reading message", pr_number)
         try:
             error_detail = response.json().get("message", "")
             error_lower = error_detail.lower()
             if "no new commits" in error_lower:
+                logger.info("PR #%s has no new base commits", pr_number)
                 return ("up_to_date", None)
             if "merge conflict" in error_lower:
+                logger.info("PR #%s conflicts with its base", pr_number)
                 return ("conflict", None)
         except (json.JSONDecodeError, ValueError, KeyError):
-            pass
+            logger.info("PR #%s 422 body is not JSON", pr_number)
 
     if response.status_code not in [200, 202]:
+        logger.info("PR #%s update-branch returned %s", pr_number, response.status_code)
         error_msg = f"HTTP {response.status_code}"
         try:
             error_detail = response.json().get("message", "")
             if error_detail:
+                logger.info("PR #%s error message: %s", pr_number, error_detail)
                 error_msg += f": {error_detail}"
         except (json.JSONDecodeError, ValueError, KeyError):
-            pass
+            logger.info("PR #%s error body is not JSON", pr_number)
+        # "API rate limit exceeded for installation ..." or "You have exceeded a secondary rate limit ..."; fan_out_github_calls retries these after the back-off
+        if response.status_code in (403, 429) and "rate limit" in error_msg.lower():
+            logger.warning(
+                "PR #%s update-branch rate limited: %s", pr_number, error_msg
+            )
+            return ("rate_limited", error_msg)
+        logger.warning("PR #%s update-branch failed: %s", pr_number, error_msg)
         return ("failed", error_msg)
 
+    logger.info("PR #%s branch updated", pr_number)
     return ("updated", None)
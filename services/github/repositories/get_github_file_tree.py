@@ -1,7 +1,6 @@
-import requests
-
 from config import TIMEOUT
 from services.git.tree import Tree
+from services.github.session import github_session
 from utils.logging.logging_config import logger
 
 
@@ -14,7 +13,7 @@ def get_github_file_tree(owner: str, repo: str, ref: str, token: str):
         "Accept": "application/vnd.github.v3+json",
     }
     url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
-    response = requests.get(url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url, headers=headers, timeout=TIMEOUT)
 
     if response.status_code != 200:
         logger.warning(
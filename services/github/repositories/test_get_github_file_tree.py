@@ -29,7 +29,7 @@ GITHUB_TREE_RESPONSE = {
 
 
 class TestGetGithubFileTree:
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_returns_tree_items(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -47,7 +47,7 @@ class TestGetGithubFileTree:
         assert items[2]["type"] == "tree"
         assert "size" not in items[2]
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_returns_empty_list_on_api_failure(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -58,7 +58,7 @@ class TestGetGithubFileTree:
         assert not items
         assert isinstance(items, list)
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_returns_empty_list_when_tree_is_empty(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -69,7 +69,7 @@ class TestGetGithubFileTree:
 
         assert not items
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_calls_correct_api_url(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -85,7 +85,7 @@ class TestGetGithubFileTree:
         )
         assert mock_get.call_args[1]["headers"]["Authorization"] == "token mytoken"
 
-    @patch(f"{MODULE}.requests.get")
+    @patch(f"{MODULE}.github_session.get")
     def test_handles_truncated_tree(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
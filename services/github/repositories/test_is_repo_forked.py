@@ -6,7 +6,7 @@ MODULE = "services.github.repositories.is_repo_forked"
 
 
 @patch(f"{MODULE}.create_headers")
-@patch(f"{MODULE}.requests.get")
+@patch(f"{MODULE}.github_session.get")
 def test_returns_true_for_forked_repo(_mock_get: MagicMock, _mock_headers: MagicMock):
     response = MagicMock()
     response.json.return_value = {"fork": True}
@@ -15,7 +15,7 @@ def test_returns_true_for_forked_repo(_mock_get: MagicMock, _mock_headers: Magic
 
 
 @patch(f"{MODULE}.create_headers")
-@patch(f"{MODULE}.requests.get")
+@patch(f"{MODULE}.github_session.get")
 def test_returns_false_for_non_forked_repo(
     _mock_get: MagicMock, _mock_headers: MagicMock
 ):
@@ -26,7 +26,7 @@ def test_returns_false_for_non_forked_repo(
 
 
 @patch(f"{MODULE}.create_headers")
-@patch(f"{MODULE}.requests.get")
+@patch(f"{MODULE}.github_session.get")
 def test_returns_false_when_fork_key_missing(
     _mock_get: MagicMock, _mock_headers: MagicMock
 ):
@@ -37,7 +37,7 @@ def test_returns_false_when_fork_key_missing(
 
 
 @patch(f"{MODULE}.create_headers")
-@patch(f"{MODULE}.requests.get")
+@patch(f"{MODULE}.github_session.get")
 def test_returns_false_on_api_error(_mock_get: MagicMock, _mock_headers: MagicMock):
     _mock_get.side_effect = Exception("API error")
     assert is_repo_forked(owner="owner", repo="repo", token="token") is False
@@ -0,0 +1,27 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.github.utils.add_conditional_headers import add_conditional_headers
+from services.github.utils.cache_conditional_response import (
+    cache_conditional_response,
+)
+from services.github.utils.forget_rejected_installation_token import (
+    forget_rejected_installation_token,
+)
+from services.github.utils.record_github_backoff import record_github_backoff
+from services.github.utils.track_rate_limit import track_rate_limit
+
+# Shared by every REST helper under services/github so calls reuse keep-alive TLS connections to api.github.com instead of opening a new one per request (bare requests.get builds a throwaway Session each time)
+github_session = requests.Session()
+github_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# requests calls session.auth on every prepared request (helpers pass their token in headers, never auth=), which is where repeat GETs pick up If-None-Match; the response hook then serves the cached body on 304
+github_session.auth = add_conditional_headers
+github_session.hooks["response"].extend(
+    [
+        cache_conditional_response,
+        track_rate_limit,
+        record_github_backoff,
+        forget_rejected_installation_token,
+    ]
+)
@@ -0,0 +1,79 @@
+# pylint: disable=redefined-outer-name
+import io
+from unittest.mock import patch
+
+import pytest
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from services.github.session import github_session
+from services.github.utils.add_conditional_headers import (
+    GITHUB_RESPONSE_CACHE,
+    GITHUB_RESPONSE_CACHE_STATS,
+    add_conditional_headers,
+)
+from services.github.utils.cache_conditional_response import (
+    cache_conditional_response,
+)
+from services.github.utils.forget_rejected_installation_token import (
+    forget_rejected_installation_token,
+)
+from services.github.utils.record_github_backoff import record_github_backoff
+from services.github.utils.track_rate_limit import track_rate_limit
+
+URL = "https://api.github.com/repos/o/r"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    GITHUB_RESPONSE_CACHE.clear()
+    GITHUB_RESPONSE_CACHE_STATS.clear()
+    yield
+    GITHUB_RESPONSE_CACHE.clear()
+    GITHUB_RESPONSE_CACHE_STATS.clear()
+
+
+def test_session_pools_https_connections():
+    adapter = github_session.get_adapter("https://api.github.com/repos/o/r")
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 16  # pylint: disable=protected-access
+
+
+def test_session_hooks_cache_and_rate_limits_on_every_response():
+    assert github_session.auth is add_conditional_headers
+    assert github_session.hooks["response"] == [
+        cache_conditional_response,
+        track_rate_limit,
+        record_github_backoff,
+        forget_rejected_installation_token,
+    ]
+
+
+def test_repeat_read_is_revalidated_with_etag():
+    """Second GET sends If-None-Match and the caller still gets the body when GitHub answers 304."""
+    sent_headers: list[dict[str, str]] = []
+
+    def send(request, **_kwargs):
+        sent_headers.append(dict(request.headers))
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 304 if "If-None-Match" in request.headers else 200
+        response.headers = CaseInsensitiveDict({"ETag": '"v1"'})
+        response.raw = io.BytesIO(
+            b"" if response.status_code == 304 else b'{"archived": false}'
+        )
+        return response
+
+    with patch.object(HTTPAdapter, "send", side_effect=send):
+        first = github_session.get(URL, headers={"Authorization": "Bearer t"})
+        second = github_session.get(URL, headers={"Authorization": "Bearer t"})
+
+    assert first.json() == {"archived": False}
+    assert second.status_code == 200
+    assert second.json() == {"archived": False}
+    assert sent_headers[0].get("If-None-Match") is None
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert GITHUB_RESPONSE_CACHE_STATS == {"misses": 1, "hits": 1}
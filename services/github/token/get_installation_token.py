@@ -1,24 +1,52 @@
+from datetime import datetime
+import time
+
 import requests
+
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.token.get_jwt import get_jwt
 from services.github.utils.create_headers import create_headers
+from services.github.utils.forget_rejected_installation_token import (
+    INSTALLATION_TOKEN_CACHE,
+)
 from services.supabase.installations.delete_installation import delete_installation
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
+from utils.time.is_lambda_timeout_approaching import LAMBDA_TIMEOUT_SECONDS
+
+# A handler may keep using the token it was handed for the whole invocation, so only reuse a token that outlives the longest invocation plus room for clock skew
+INSTALLATION_TOKEN_MIN_REMAINING_SECONDS = LAMBDA_TIMEOUT_SECONDS + 5 * 60
+
+# GitHub's documented lifetime, for a mint response without expires_at
+INSTALLATION_TOKEN_LIFETIME_SECONDS = 60 * 60
 
 
 @handle_exceptions(raise_on_error=True)
 def get_installation_access_token(installation_id: int):
     """https://docs.github.com/en/rest/apps/apps?apiVersion=2022-11-28#create-an-installation-access-token-for-an-app"""
+    cached = INSTALLATION_TOKEN_CACHE.get(installation_id)
+    if (
+        cached
+        and cached["expires_at"] - time.time()
+        >= INSTALLATION_TOKEN_MIN_REMAINING_SECONDS
+    ):
+        logger.info(
+            "get_installation_access_token: reusing token for installation %s",
+            installation_id,
+        )
+        return cached["token"]
+
     try:
         jwt_token = get_jwt()
-        response = requests.post(
+        response = github_session.post(
             url=f"{GITHUB_API_URL}/app/installations/{installation_id}/access_tokens",
             headers=create_headers(token=jwt_token),
             timeout=TIMEOUT,
         )
         response.raise_for_status()
-        raw_token = response.json()["token"]
+        body = response.json()
+        raw_token = body["token"]
         if not isinstance(raw_token, str):
             logger.error(
                 "get_installation_access_token: non-string token for installation %s",
@@ -29,6 +57,17 @@ def get_installation_access_token(installation_id: int):
             )
 
         token = raw_token
+        raw_expires_at = body.get("expires_at")
+        if isinstance(raw_expires_at, str):
+            logger.debug("get_installation_access_token: expires at %s", raw_expires_at)
+            expires_at = datetime.fromisoformat(raw_expires_at).timestamp()
+        else:
+            logger.warning("get_installation_access_token: no expires_at, assuming 1h")
+            expires_at = time.time() + INSTALLATION_TOKEN_LIFETIME_SECONDS
+        INSTALLATION_TOKEN_CACHE[installation_id] = {
+            "token": token,
+            "expires_at": expires_at,
+        }
         logger.info(
             "get_installation_access_token: minted token for installation %s",
             installation_id,
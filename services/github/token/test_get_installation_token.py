@@ -3,13 +3,30 @@ from unittest.mock import patch, MagicMock
 import json
 import inspect
 
+from datetime import datetime, timezone
+
 import pytest
 import requests
 
-from services.github.token.get_installation_token import get_installation_access_token
+from services.github.token.get_installation_token import (
+    INSTALLATION_TOKEN_CACHE,
+    INSTALLATION_TOKEN_MIN_REMAINING_SECONDS,
+    get_installation_access_token,
+)
+from services.github.utils.forget_rejected_installation_token import (
+    forget_rejected_installation_token,
+)
+from utils.time.is_lambda_timeout_approaching import LAMBDA_TIMEOUT_SECONDS
 from config import GITHUB_API_URL, TIMEOUT
 
 
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    INSTALLATION_TOKEN_CACHE.clear()
+    yield
+    INSTALLATION_TOKEN_CACHE.clear()
+
+
 @pytest.fixture
 def mock_get_jwt():
     with patch("services.github.token.get_installation_token.get_jwt") as mock:
@@ -34,7 +51,9 @@ def mock_delete_installation():
 
 @pytest.fixture
 def mock_requests_post():
-    with patch("services.github.token.get_installation_token.requests.post") as mock:
+    with patch(
+        "services.github.token.get_installation_token.github_session.post"
+    ) as mock:
         yield mock
 
 
@@ -504,10 +523,10 @@ def test_get_installation_access_token_various_exceptions(
     assert mock_requests_post.call_count == expected_calls
 
 
-def test_get_installation_access_token_multiple_calls_independence(
+def test_get_installation_access_token_reuses_cached_token(
     mock_get_jwt, mock_create_headers, mock_requests_post
 ):
-    """Test that multiple calls to the function are independent"""
+    """Test that repeated calls for one installation mint a single token"""
     # Arrange
     installation_id = 12345
     mock_response = MagicMock()
@@ -520,9 +539,93 @@ def test_get_installation_access_token_multiple_calls_independence(
 
     # Assert
     assert result1 == result2 == "test_token"
+    assert mock_requests_post.call_count == 1
+    assert mock_get_jwt.call_count == 1
+    assert mock_create_headers.call_count == 1
+
+
+def test_get_installation_access_token_caches_per_installation(
+    mock_get_jwt, mock_create_headers, mock_requests_post
+):
+    """Test that each installation gets its own cached token"""
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {"token": "token_1"}
+    second.json.return_value = {"token": "token_2"}
+    mock_requests_post.side_effect = [first, second]
+
+    assert get_installation_access_token(1) == "token_1"
+    assert get_installation_access_token(2) == "token_2"
+    assert get_installation_access_token(1) == "token_1"
     assert mock_requests_post.call_count == 2
-    assert mock_get_jwt.call_count == 2
-    assert mock_create_headers.call_count == 2
+
+
+@patch("services.github.token.get_installation_token.time.time")
+def test_get_installation_access_token_mints_again_when_too_little_time_is_left(
+    mock_time, mock_get_jwt, mock_create_headers, mock_requests_post
+):
+    """Test that a cached token is only reused while it outlives a whole invocation, using expires_at from the mint response"""
+    minted_at = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {
+        "token": "old_token",
+        "expires_at": "2026-05-01T13:00:00Z",
+    }
+    second.json.return_value = {
+        "token": "new_token",
+        "expires_at": "2026-05-01T13:45:00Z",
+    }
+    mock_requests_post.side_effect = [first, second]
+    reuse_until = minted_at + 60 * 60 - INSTALLATION_TOKEN_MIN_REMAINING_SECONDS
+
+    mock_time.return_value = minted_at
+    assert get_installation_access_token(12345) == "old_token"
+    mock_time.return_value = reuse_until
+    assert get_installation_access_token(12345) == "old_token"
+    mock_time.return_value = reuse_until + 1
+    assert get_installation_access_token(12345) == "new_token"
+
+    assert INSTALLATION_TOKEN_MIN_REMAINING_SECONDS > LAMBDA_TIMEOUT_SECONDS
+    assert mock_requests_post.call_count == 2
+
+
+def test_get_installation_access_token_mints_again_after_401(
+    mock_get_jwt, mock_create_headers, mock_requests_post
+):
+    """Test that a 401 on a request carrying the cached token drops it from the cache"""
+    first, second = MagicMock(), MagicMock()
+    first.json.return_value = {"token": "revoked_token"}
+    second.json.return_value = {"token": "new_token"}
+    mock_requests_post.side_effect = [first, second]
+    assert get_installation_access_token(12345) == "revoked_token"
+
+    rejected = requests.Response()
+    rejected.status_code = 401
+    rejected.request = requests.Request(
+        "GET",
+        f"{GITHUB_API_URL}/repos/o/r",
+        headers={"Authorization": "Bearer revoked_token"},
+    ).prepare()
+    forget_rejected_installation_token(rejected)
+
+    assert get_installation_access_token(12345) == "new_token"
+    assert mock_requests_post.call_count == 2
+
+
+def test_get_installation_access_token_does_not_cache_failures(
+    mock_get_jwt, mock_create_headers, mock_requests_post
+):
+    """Test that a failed mint leaves nothing cached, so the next call tries again"""
+    mock_response = MagicMock()
+    mock_response.status_code = 422
+    mock_response.text = "Unprocessable Entity"
+    mock_requests_post.return_value.raise_for_status.side_effect = (
+        requests.exceptions.HTTPError(response=mock_response)
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_installation_access_token(12345)
+
+    assert not INSTALLATION_TOKEN_CACHE
 
 
 def test_get_installation_access_token_suspended_with_partial_message(
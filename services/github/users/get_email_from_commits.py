@@ -1,6 +1,5 @@
-import requests
-
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -12,7 +11,7 @@ NOREPLY_SUFFIX = "@users.noreply.github.com"
 def get_email_from_commits(owner: str, repo: str, username: str, token: str):
     """Fallback: get email from recent commits when the public profile has no email.
     https://docs.github.com/en/rest/commits/commits#list-commits"""
-    response = requests.get(
+    response = github_session.get(
         url=f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits",
         headers=create_headers(token=token),
         params={"author": username, "per_page": 5},
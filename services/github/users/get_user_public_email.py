@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import requests
 
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -24,7 +25,7 @@ def get_user_public_info(username: str, token: str):
     if "[bot]" in username:
         return UserPublicInfo(email=None, display_name="")
 
-    response: requests.Response = requests.get(
+    response: requests.Response = github_session.get(
         url=f"{GITHUB_API_URL}/users/{username}",
         headers=create_headers(token=token),
         timeout=TIMEOUT,
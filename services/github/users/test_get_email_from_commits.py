@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 from services.github.users.get_email_from_commits import get_email_from_commits
 
 
-@patch("services.github.users.get_email_from_commits.requests.get")
+@patch("services.github.users.get_email_from_commits.github_session.get")
 def test_returns_first_non_noreply_email(mock_get: MagicMock):
     mock_get.return_value.status_code = 200
     mock_get.return_value.raise_for_status = MagicMock()
@@ -16,7 +16,7 @@ def test_returns_first_non_noreply_email(mock_get: MagicMock):
     assert result == "wes@gitauto.ai"
 
 
-@patch("services.github.users.get_email_from_commits.requests.get")
+@patch("services.github.users.get_email_from_commits.github_session.get")
 def test_skips_noreply_email(mock_get: MagicMock):
     mock_get.return_value.status_code = 200
     mock_get.return_value.raise_for_status = MagicMock()
@@ -28,7 +28,7 @@ def test_skips_noreply_email(mock_get: MagicMock):
     assert result == "real@example.com"
 
 
-@patch("services.github.users.get_email_from_commits.requests.get")
+@patch("services.github.users.get_email_from_commits.github_session.get")
 def test_returns_none_when_all_noreply(mock_get: MagicMock):
     mock_get.return_value.status_code = 200
     mock_get.return_value.raise_for_status = MagicMock()
@@ -39,7 +39,7 @@ def test_returns_none_when_all_noreply(mock_get: MagicMock):
     assert result is None
 
 
-@patch("services.github.users.get_email_from_commits.requests.get")
+@patch("services.github.users.get_email_from_commits.github_session.get")
 def test_returns_none_when_no_commits(mock_get: MagicMock):
     mock_get.return_value.status_code = 200
     mock_get.return_value.raise_for_status = MagicMock()
@@ -48,14 +48,14 @@ def test_returns_none_when_no_commits(mock_get: MagicMock):
     assert result is None
 
 
-@patch("services.github.users.get_email_from_commits.requests.get")
+@patch("services.github.users.get_email_from_commits.github_session.get")
 def test_returns_none_when_repo_is_empty(mock_get: MagicMock):
     mock_get.return_value.status_code = 409
     result = get_email_from_commits(owner="o", repo="r", username="u", token="t")
     assert result is None
 
 
-@patch("services.github.users.get_email_from_commits.requests.get")
+@patch("services.github.users.get_email_from_commits.github_session.get")
 def test_returns_none_on_api_error(mock_get: MagicMock):
     mock_get.side_effect = Exception("API error")
     result = get_email_from_commits(owner="o", repo="r", username="u", token="t")
@@ -32,7 +32,8 @@ def test_get_owner_name_successful_request(
 ):
     """Test successful API request returns the login name."""
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result == "test-user"
@@ -40,7 +41,7 @@ def test_get_owner_name_successful_request(
 
 def test_get_owner_name_calls_correct_api_endpoint(sample_owner_id, sample_token):
     """Test that the function calls the correct GitHub API endpoint."""
-    with patch("services.github.users.get_owner_name.requests.get") as mock_get:
+    with patch("services.github.users.get_owner_name.github_session.get") as mock_get:
         mock_get.return_value.json.return_value = {"login": "test-user"}
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -54,7 +55,9 @@ def test_get_owner_name_calls_correct_api_endpoint(sample_owner_id, sample_token
 
 def test_get_owner_name_uses_correct_headers(sample_owner_id, sample_token):
     """Test that the function uses correct headers including authorization."""
-    with patch("services.github.users.get_owner_name.requests.get") as mock_get, patch(
+    with patch(
+        "services.github.users.get_owner_name.github_session.get"
+    ) as mock_get, patch(
         "services.github.users.get_owner_name.create_headers"
     ) as mock_create_headers:
 
@@ -73,7 +76,7 @@ def test_get_owner_name_uses_correct_headers(sample_owner_id, sample_token):
 
 def test_get_owner_name_uses_correct_timeout(sample_owner_id, sample_token):
     """Test that the function uses the configured timeout."""
-    with patch("services.github.users.get_owner_name.requests.get") as mock_get:
+    with patch("services.github.users.get_owner_name.github_session.get") as mock_get:
         mock_get.return_value.json.return_value = {"login": "test-user"}
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -89,7 +92,8 @@ def test_get_owner_name_calls_raise_for_status(
 ):
     """Test that the function calls raise_for_status on the response."""
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         get_owner_name(owner_id=sample_owner_id, token=sample_token)
         mock_response.raise_for_status.assert_called_once()
@@ -103,7 +107,8 @@ def test_get_owner_name_extracts_login_from_response(sample_owner_id, sample_tok
     mock_response.raise_for_status.return_value = None
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result == expected_login
@@ -123,7 +128,7 @@ def test_get_owner_name_with_different_owner_ids():
         mock_response.raise_for_status.return_value = None
 
         with patch(
-            "services.github.users.get_owner_name.requests.get",
+            "services.github.users.get_owner_name.github_session.get",
             return_value=mock_response,
         ):
             result = get_owner_name(owner_id=owner_id, token="test-token")
@@ -145,7 +150,7 @@ def test_get_owner_name_with_different_tokens():
         mock_response.raise_for_status.return_value = None
 
         with patch(
-            "services.github.users.get_owner_name.requests.get",
+            "services.github.users.get_owner_name.github_session.get",
             return_value=mock_response,
         ), patch(
             "services.github.users.get_owner_name.create_headers"
@@ -171,7 +176,8 @@ def test_get_owner_name_http_error_returns_none(sample_owner_id, sample_token):
 
     mock_response.raise_for_status.side_effect = http_error
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result is None
@@ -180,7 +186,7 @@ def test_get_owner_name_http_error_returns_none(sample_owner_id, sample_token):
 def test_get_owner_name_request_exception_returns_none(sample_owner_id, sample_token):
     """Test that request exceptions are handled and return None due to decorator."""
     with patch(
-        "services.github.users.get_owner_name.requests.get",
+        "services.github.users.get_owner_name.github_session.get",
         side_effect=RequestException("Network error"),
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
@@ -190,7 +196,7 @@ def test_get_owner_name_request_exception_returns_none(sample_owner_id, sample_t
 def test_get_owner_name_timeout_returns_none(sample_owner_id, sample_token):
     """Test that timeout exceptions are handled and return None due to decorator."""
     with patch(
-        "services.github.users.get_owner_name.requests.get",
+        "services.github.users.get_owner_name.github_session.get",
         side_effect=Timeout("Request timed out"),
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
@@ -204,7 +210,8 @@ def test_get_owner_name_json_decode_error_returns_none(sample_owner_id, sample_t
     mock_response.json.side_effect = ValueError("Invalid JSON")
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result is None
@@ -220,7 +227,8 @@ def test_get_owner_name_missing_login_key_returns_none(sample_owner_id, sample_t
     }  # Missing "login" key
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result is None
@@ -233,7 +241,8 @@ def test_get_owner_name_empty_response_returns_none(sample_owner_id, sample_toke
     mock_response.json.return_value = {}
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result is None
@@ -246,7 +255,8 @@ def test_get_owner_name_null_login_value_returns_none(sample_owner_id, sample_to
     mock_response.json.return_value = {"login": None, "id": sample_owner_id}
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result is None
@@ -284,7 +294,8 @@ def test_get_owner_name_with_complete_github_response(sample_owner_id, sample_to
     mock_response.json.return_value = complete_response
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
         assert result == "octocat"
@@ -307,7 +318,8 @@ def test_get_owner_name_with_various_owner_ids(owner_id, expected_login, sample_
     mock_response.json.return_value = {"login": expected_login, "id": owner_id}
 
     with patch(
-        "services.github.users.get_owner_name.requests.get", return_value=mock_response
+        "services.github.users.get_owner_name.github_session.get",
+        return_value=mock_response,
     ):
         result = get_owner_name(owner_id=owner_id, token=sample_token)
         assert result == expected_login
@@ -317,7 +329,7 @@ def test_get_owner_name_decorator_behavior(sample_owner_id, sample_token):
     """Test that the handle_exceptions decorator is properly applied."""
     # Test that the function has the decorator applied by checking it returns None on exception
     with patch(
-        "services.github.users.get_owner_name.requests.get",
+        "services.github.users.get_owner_name.github_session.get",
         side_effect=Exception("Unexpected error"),
     ):
         result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
@@ -341,7 +353,7 @@ def test_get_owner_name_with_special_login_characters(sample_owner_id, sample_to
         mock_response.json.return_value = {"login": login, "id": sample_owner_id}
 
         with patch(
-            "services.github.users.get_owner_name.requests.get",
+            "services.github.users.get_owner_name.github_session.get",
             return_value=mock_response,
         ):
             result = get_owner_name(owner_id=sample_owner_id, token=sample_token)
@@ -44,7 +44,7 @@ def test_get_user_public_info_successful_request(
 ):
     """Test successful API request returns email and display_name."""
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -57,7 +57,9 @@ def test_get_user_public_info_successful_request(
 
 def test_get_user_public_info_bot_user_skips_api_call(sample_token):
     """Test that bot usernames skip the API call (bots have name=null, email=null)."""
-    with patch("services.github.users.get_user_public_email.requests.get") as mock_get:
+    with patch(
+        "services.github.users.get_user_public_email.github_session.get"
+    ) as mock_get:
         result = get_user_public_info(
             username="github-actions[bot]",
             token=sample_token,
@@ -68,7 +70,9 @@ def test_get_user_public_info_bot_user_skips_api_call(sample_token):
 
 def test_get_user_public_info_calls_correct_api_endpoint(sample_username, sample_token):
     """Test that the function calls the correct GitHub API endpoint."""
-    with patch("services.github.users.get_user_public_email.requests.get") as mock_get:
+    with patch(
+        "services.github.users.get_user_public_email.github_session.get"
+    ) as mock_get:
         mock_get.return_value.json.return_value = {
             "email": "test@example.com",
             "name": "Test User",
@@ -89,7 +93,7 @@ def test_get_user_public_info_calls_correct_api_endpoint(sample_username, sample
 def test_get_user_public_info_uses_correct_headers(sample_username, sample_token):
     """Test that the function uses correct headers including authorization."""
     with patch(
-        "services.github.users.get_user_public_email.requests.get"
+        "services.github.users.get_user_public_email.github_session.get"
     ) as mock_get, patch(
         "services.github.users.get_user_public_email.create_headers"
     ) as mock_create_headers:
@@ -114,7 +118,9 @@ def test_get_user_public_info_uses_correct_headers(sample_username, sample_token
 
 def test_get_user_public_info_uses_correct_timeout(sample_username, sample_token):
     """Test that the function uses the configured timeout."""
-    with patch("services.github.users.get_user_public_email.requests.get") as mock_get:
+    with patch(
+        "services.github.users.get_user_public_email.github_session.get"
+    ) as mock_get:
         mock_get.return_value.json.return_value = {
             "email": "test@example.com",
             "name": "Test User",
@@ -136,7 +142,7 @@ def test_get_user_public_info_calls_raise_for_status(
 ):
     """Test that the function calls raise_for_status on the response."""
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         get_user_public_info(
@@ -160,7 +166,7 @@ def test_get_user_public_info_extracts_email_and_name_from_response(
     mock_response.raise_for_status.return_value = None
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -189,7 +195,7 @@ def test_get_user_public_info_with_different_usernames():
         mock_response.raise_for_status.return_value = None
 
         with patch(
-            "services.github.users.get_user_public_email.requests.get",
+            "services.github.users.get_user_public_email.github_session.get",
             return_value=mock_response,
         ):
             result = get_user_public_info(
@@ -217,7 +223,7 @@ def test_get_user_public_info_with_different_tokens():
         mock_response.raise_for_status.return_value = None
 
         with patch(
-            "services.github.users.get_user_public_email.requests.get",
+            "services.github.users.get_user_public_email.github_session.get",
             return_value=mock_response,
         ), patch(
             "services.github.users.get_user_public_email.create_headers"
@@ -235,7 +241,7 @@ def test_get_user_public_info_404_returns_default_without_raising(sample_token):
     mock_response = MagicMock()
     mock_response.status_code = 404
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(username="Copilot", token=sample_token)
@@ -256,7 +262,7 @@ def test_get_user_public_info_http_error_returns_default(sample_username, sample
 
     mock_response.raise_for_status.side_effect = http_error
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -271,7 +277,7 @@ def test_get_user_public_info_request_exception_returns_default(
 ):
     """Test that request exceptions are handled and return default UserPublicInfo due to decorator."""
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         side_effect=RequestException("Network error"),
     ):
         result = get_user_public_info(
@@ -284,7 +290,7 @@ def test_get_user_public_info_request_exception_returns_default(
 def test_get_user_public_info_timeout_returns_default(sample_username, sample_token):
     """Test that timeout exceptions are handled and return default UserPublicInfo due to decorator."""
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         side_effect=Timeout("Request timed out"),
     ):
         result = get_user_public_info(
@@ -303,7 +309,7 @@ def test_get_user_public_info_json_decode_error_returns_default(
     mock_response.json.side_effect = ValueError("Invalid JSON")
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -325,7 +331,7 @@ def test_get_user_public_info_missing_email_key_returns_none_email(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -349,7 +355,7 @@ def test_get_user_public_info_null_email_value_returns_none_email(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -372,7 +378,7 @@ def test_get_user_public_info_missing_name_key_returns_empty_display_name(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -393,7 +399,7 @@ def test_get_user_public_info_title_cases_lowercase_name(sample_username, sample
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -413,7 +419,7 @@ def test_get_user_public_info_title_cases_uppercase_name(sample_username, sample
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -435,7 +441,7 @@ def test_get_user_public_info_title_cases_already_correct_name(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -457,7 +463,7 @@ def test_get_user_public_info_title_cases_mixed_case_name(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -477,7 +483,7 @@ def test_get_user_public_info_strips_unicode_bold(sample_username, sample_token)
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -497,7 +503,7 @@ def test_get_user_public_info_replaces_dots_with_spaces(sample_username, sample_
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -517,7 +523,7 @@ def test_get_user_public_info_preserves_accented_latin(sample_username, sample_t
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -537,7 +543,7 @@ def test_get_user_public_info_preserves_cjk_characters(sample_username, sample_t
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -559,7 +565,7 @@ def test_get_user_public_info_empty_name_returns_empty_display_name(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
@@ -581,7 +587,7 @@ def test_get_user_public_info_null_name_returns_empty_display_name(
     }
 
     with patch(
-        "services.github.users.get_user_public_email.requests.get",
+        "services.github.users.get_user_public_email.github_session.get",
         return_value=mock_response,
     ):
         result = get_user_public_info(
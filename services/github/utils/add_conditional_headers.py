@@ -0,0 +1,46 @@
+import threading
+from collections import Counter
+
+from cachetools import LRUCache
+from requests import PreparedRequest, Response
+
+from constants.requests import GITHUB_RESPONSE_CACHE_MAX_BYTES
+from services.github.utils.get_github_response_cache_key import (
+    get_github_response_cache_key,
+)
+from utils.logging.logging_config import logger
+
+# Last 200 response per GitHub REST URL that carried an ETag or Last-Modified. Kept across warm starts: every read is still revalidated with GitHub, so an entry can never be served stale.
+GITHUB_RESPONSE_CACHE: LRUCache[str, Response] = LRUCache(
+    maxsize=GITHUB_RESPONSE_CACHE_MAX_BYTES,
+    getsizeof=lambda response: len(response.content or b"") + 1,
+)
+
+# Handlers fan GitHub reads out to threads, and LRUCache is not thread-safe
+GITHUB_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# hits (304 served from cache) / misses (cacheable GET answered with a body) / invalidated entries, reset at the start of each invocation by main.handler
+GITHUB_RESPONSE_CACHE_STATS: Counter[str] = Counter()
+
+
+def add_conditional_headers(request: PreparedRequest):
+    """Installed as github_session.auth, which requests calls on every prepared request: turn a GET for a cached GitHub URL into a conditional request so an unchanged resource comes back as a 304 that does not count against the primary rate limit."""
+    key = get_github_response_cache_key(request)
+    if key is None or "If-None-Match" in request.headers:
+        logger.debug("add_conditional_headers: leaving %s unconditional", request.url)
+        return request
+
+    with GITHUB_RESPONSE_CACHE_LOCK:
+        cached = GITHUB_RESPONSE_CACHE.get(key)
+    if cached is None:
+        logger.debug("add_conditional_headers: nothing cached for %s", request.url)
+        return request
+
+    etag = cached.headers.get("ETag")
+    if etag:
+        logger.debug("add_conditional_headers: If-None-Match %s", etag)
+        request.headers["If-None-Match"] = etag
+    else:
+        logger.debug("add_conditional_headers: If-Modified-Since for %s", request.url)
+        request.headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+    return request
@@ -0,0 +1,92 @@
+import copy
+import re
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from config import GITHUB_API_URL
+from constants.requests import GITHUB_RESPONSE_CACHE_MAX_BYTES
+from services.github.utils.add_conditional_headers import (
+    GITHUB_RESPONSE_CACHE,
+    GITHUB_RESPONSE_CACHE_LOCK,
+    GITHUB_RESPONSE_CACHE_STATS,
+)
+from services.github.utils.get_github_response_cache_key import (
+    get_github_response_cache_key,
+)
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
+from utils.logging.logging_config import logger
+
+REPO_URL_PATTERN = re.compile(re.escape(GITHUB_API_URL) + r"/repos/([^/?#]+)/([^/?#]+)")
+
+
+def cache_conditional_response(
+    response: Response, *_args, stream: bool = False, **_kwargs
+):
+    """Response hook for github_session, paired with add_conditional_headers: answer a 304 with the cached body, remember cacheable 200s, and invalidate a repository's entries after a successful write to it."""
+    request = response.request
+    if request.method not in ("GET", "HEAD"):
+        match = REPO_URL_PATTERN.match(request.url or "")
+        if response.ok and match:
+            logger.info("cache_conditional_response: %s is a write", request.method)
+            invalidate_github_response_cache(match.group(1), match.group(2))
+        else:
+            logger.debug("cache_conditional_response: no invalidation needed")
+        return response
+
+    key = get_github_response_cache_key(request)
+    if key is None or stream:
+        logger.debug("cache_conditional_response: %s not cacheable", response.url)
+        return response
+
+    if response.status_code == 304:
+        with GITHUB_RESPONSE_CACHE_LOCK:
+            cached = GITHUB_RESPONSE_CACHE.get(key)
+        if cached is None:
+            # The caller set its own validator; hand it the 304 it asked for
+            logger.info("cache_conditional_response: 304 with no cached body")
+            return response
+
+        # Cached body with the fresh headers (rate limit, ETag) of the 304
+        revalidated = copy.copy(cached)
+        revalidated.headers = CaseInsensitiveDict(cached.headers)
+        revalidated.headers.update(response.headers)
+        revalidated.request = request
+        revalidated.elapsed = response.elapsed
+        response.close()
+        GITHUB_RESPONSE_CACHE_STATS["hits"] += 1
+        logger.info("cache_conditional_response: 304 for %s", response.url)
+    else:
+        GITHUB_RESPONSE_CACHE_STATS["misses"] += 1
+        revalidated = response
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            # Bodies past the cache bound would make LRUCache raise rather than evict
+            if len(response.content) >= GITHUB_RESPONSE_CACHE_MAX_BYTES:
+                logger.info(
+                    "cache_conditional_response: %s too large to cache", response.url
+                )
+                return response
+            logger.info("cache_conditional_response: caching %s", response.url)
+            with GITHUB_RESPONSE_CACHE_LOCK:
+                GITHUB_RESPONSE_CACHE[key] = copy.copy(response)
+        else:
+            logger.info(
+                "cache_conditional_response: %d without validator for %s",
+                response.status_code,
+                response.url,
+            )
+
+    lookups = (
+        GITHUB_RESPONSE_CACHE_STATS["hits"] + GITHUB_RESPONSE_CACHE_STATS["misses"]
+    )
+    logger.info(
+        "GitHub response cache: %d/%d reads revalidated (304) this invocation, %d entries invalidated",
+        GITHUB_RESPONSE_CACHE_STATS["hits"],
+        lookups,
+        GITHUB_RESPONSE_CACHE_STATS["invalidated"],
+    )
+    return revalidated
@@ -0,0 +1,56 @@
+import time
+from typing import Callable, TypeVar
+
+from services.github.utils.record_github_backoff import (
+    GITHUB_BACKOFF,
+    GITHUB_BACKOFF_LOCK,
+)
+from utils.logging.logging_config import logger
+
+T = TypeVar("T")  # Item the call operates on, e.g. an open PR
+R = TypeVar("R")  # What the call returns for it
+
+# Attempts per item, counting the first; a call still rate limited after this many is returned as is and the caller reports it as failed
+GITHUB_BACKOFF_MAX_ATTEMPTS = 3
+
+# Longest single wait. A drained primary quota can take up to an hour to reset, far past a Lambda invocation, so past this the remaining attempts run and fail rather than sleep out the clock.
+GITHUB_BACKOFF_MAX_SECONDS = 60.0
+
+# Wait before a retry when the rejected response carried no back-off hint
+GITHUB_BACKOFF_MIN_SECONDS = 1.0
+
+
+def call_github_with_backoff(
+    call: Callable[[T], R],
+    item: T,
+    should_retry: Callable[[R], bool],
+    token_key: str,
+):
+    """Run call(item), holding off while GitHub has asked for a back-off on the token identified by token_key (see get_github_token_key) and retrying while should_retry says the result was rate limited."""
+    attempt = 1
+    while True:
+        with GITHUB_BACKOFF_LOCK:
+            until = GITHUB_BACKOFF.get(token_key, 0.0)
+        delay = min(until - time.time(), GITHUB_BACKOFF_MAX_SECONDS)
+        if attempt > 1:
+            logger.info("call_github_with_backoff: retry %d", attempt)
+            delay = max(delay, GITHUB_BACKOFF_MIN_SECONDS)
+        if delay > 0:
+            logger.info("call_github_with_backoff: sleeping %.1fs", delay)
+            time.sleep(delay)
+
+        result = call(item)
+        if not should_retry(result):
+            logger.debug("call_github_with_backoff: done after %d attempts", attempt)
+            return result
+
+        if attempt == GITHUB_BACKOFF_MAX_ATTEMPTS:
+            logger.warning("call_github_with_backoff: still rate limited; giving up")
+            return result
+
+        logger.warning(
+            "call_github_with_backoff: rate limited on attempt %d/%d",
+            attempt,
+            GITHUB_BACKOFF_MAX_ATTEMPTS,
+        )
+        attempt += 1
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from services.github.utils.call_github_with_backoff import call_github_with_backoff
+from services.github.utils.track_rate_limit import (
+    GITHUB_RATE_LIMIT_WARN_FRACTION,
+    GITHUB_RATE_LIMITS,
+    GITHUB_RATE_LIMITS_LOCK,
+)
+from utils.logging.logging_config import logger
+
+T = TypeVar("T")  # Item the call operates on, e.g. an open PR
+R = TypeVar("R")  # What the call returns for it
+
+# Upper bound on concurrent calls. GitHub counts concurrent requests toward its secondary rate limit and asks for mutating calls to be spread out, so this stays well under github_session's 16-connection pool.
+GITHUB_FAN_OUT_MAX_WORKERS = 8
+
+
+def fan_out_github_calls(
+    items: list[T],
+    call: Callable[[T], R],
+    should_retry: Callable[[R], bool],
+    token_key: str,
+    resource: str = "core",
+):
+    """Run call on every item with bounded concurrency and return the results in item order.
+
+    token_key (get_github_token_key of the token the calls use) picks that installation's rate-limit state. The pool is sized from the last X-RateLimit-* headers seen for resource: once the quota is down to its warning reserve the calls run one at a time, and never with more workers than there are requests left. Each call waits out a back-off GitHub has asked for (see record_github_backoff) and is retried while should_retry says it was rate limited.
+    """
+    if not items:
+        logger.info("fan_out_github_calls: no items")
+        return []
+
+    workers = min(GITHUB_FAN_OUT_MAX_WORKERS, len(items))
+    with GITHUB_RATE_LIMITS_LOCK:
+        rate_limit = GITHUB_RATE_LIMITS.get((token_key, resource))
+    if rate_limit:
+        spare = rate_limit["remaining"] - int(
+            rate_limit["limit"] * GITHUB_RATE_LIMIT_WARN_FRACTION
+        )
+        logger.info(
+            "fan_out_github_calls: %s quota %d/%d, %d above reserve",
+            resource,
+            rate_limit["remaining"],
+            rate_limit["limit"],
+            spare,
+        )
+        workers = max(1, min(workers, spare))
+
+    logger.info("fan_out_github_calls: %d calls on %d workers", len(items), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map re-raises the first exception in item order, same as a sequential loop
+        results = list(
+            executor.map(
+                lambda item: call_github_with_backoff(
+                    call, item, should_retry, token_key
+                ),
+                items,
+            )
+        )
+
+    logger.info("fan_out_github_calls: %d calls done", len(results))
+    return results
@@ -0,0 +1,37 @@
+from typing import TypedDict
+
+from cachetools import LRUCache
+from requests import Response
+
+from utils.logging.logging_config import logger
+
+
+class InstallationToken(TypedDict):
+    token: str
+    expires_at: float  # time.time() at which GitHub stops accepting the token
+
+
+# Minted installation tokens by installation id. get_installation_access_token checks expires_at before reusing one, so no TTL here.
+INSTALLATION_TOKEN_CACHE: LRUCache[int, InstallationToken] = LRUCache(maxsize=1024)
+
+
+def forget_rejected_installation_token(response: Response, *_args, **_kwargs):
+    """Response hook for github_session: on a 401, drop the cached installation token the request carried (revoked or expired early) so the next get_installation_access_token mints a fresh one instead of handing out the dead token until it ages out."""
+    if response.status_code != 401:
+        logger.debug(
+            "forget_rejected_installation_token: status %s", response.status_code
+        )
+        return response
+
+    authorization = response.request.headers.get("Authorization", "")
+    token = authorization.removeprefix("Bearer ").removeprefix("token ")
+    for installation_id, entry in list(INSTALLATION_TOKEN_CACHE.items()):
+        if entry["token"] == token:
+            logger.warning(
+                "GitHub rejected the cached token for installation %s, forgetting it",
+                installation_id,
+            )
+            INSTALLATION_TOKEN_CACHE.pop(installation_id, None)
+
+    logger.info("forget_rejected_installation_token: 401 from %s", response.url)
+    return response
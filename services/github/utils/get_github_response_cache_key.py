@@ -0,0 +1,25 @@
+import hashlib
+
+from requests import PreparedRequest
+
+from config import GITHUB_API_URL, UTF8
+from utils.logging.logging_config import logger
+
+
+def get_github_response_cache_key(request: PreparedRequest):
+    """Return the GitHub response cache key for a GET to the REST API, or None for anything that should not be cached.
+
+    The key includes Accept (raw vs JSON bodies of the same URL differ) and a digest of Authorization, so a token never reads a response cached for another installation.
+    """
+    url = request.url or ""
+    if request.method != "GET" or not url.startswith(GITHUB_API_URL + "/"):
+        logger.debug(
+            "get_github_response_cache_key: not cacheable %s %s", request.method, url
+        )
+        return None
+
+    token = request.headers.get("Authorization", "")
+    token_digest = hashlib.sha256(token.encode(UTF8)).hexdigest()[:16]
+    accept = request.headers.get("Accept", "")
+    logger.debug("get_github_response_cache_key: %s (accept=%s)", url, accept)
+    return f"{url}|{accept}|{token_digest}"
@@ -0,0 +1,14 @@
+import hashlib
+
+from config import UTF8
+from utils.logging.logging_config import logger
+
+
+def get_github_token_key(token: str):
+    """Return a short digest identifying the token a GitHub request is made with. Takes the raw token or the Authorization header carrying it, so response hooks and the handlers that hold the token agree on the key for per-installation rate-limit state."""
+    if token.startswith(("Bearer ", "token ")):
+        logger.debug("get_github_token_key: stripping Authorization scheme")
+        token = token.split(" ", 1)[1]
+
+    logger.debug("get_github_token_key: hashing token")
+    return hashlib.sha256(token.encode(UTF8)).hexdigest()[:16]
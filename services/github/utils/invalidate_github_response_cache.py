@@ -0,0 +1,30 @@
+from config import GITHUB_API_URL
+from services.github.utils.add_conditional_headers import (
+    GITHUB_RESPONSE_CACHE,
+    GITHUB_RESPONSE_CACHE_LOCK,
+    GITHUB_RESPONSE_CACHE_STATS,
+)
+from utils.logging.logging_config import logger
+
+
+def invalidate_github_response_cache(owner: str, repo: str):
+    """Drop every cached GitHub response under /repos/{owner}/{repo} after a write to that repository (a REST write through github_session or a git push), so the next read fetches a fresh body instead of trusting an ETag GitHub may not have bumped yet."""
+    repo_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}"
+    with GITHUB_RESPONSE_CACHE_LOCK:
+        keys = [
+            key
+            for key in GITHUB_RESPONSE_CACHE
+            if key.startswith((repo_url + "/", repo_url + "?", repo_url + "|"))
+        ]
+        for key in keys:
+            logger.debug("invalidate_github_response_cache: dropping %s", key)
+            del GITHUB_RESPONSE_CACHE[key]
+
+    GITHUB_RESPONSE_CACHE_STATS["invalidated"] += len(keys)
+    logger.info(
+        "invalidate_github_response_cache: dropped %d entries for %s/%s",
+        len(keys),
+        owner,
+        repo,
+    )
+    return len(keys)
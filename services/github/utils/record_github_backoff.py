@@ -0,0 +1,57 @@
+import threading
+import time
+
+from cachetools import LRUCache
+from requests import Response
+
+from services.github.utils.get_github_token_key import get_github_token_key
+from utils.error.parse_github_rate_limit_headers import (
+    parse_github_rate_limit_headers,
+)
+from utils.error.parse_retry_after_header import parse_retry_after_header
+from utils.logging.logging_config import logger
+
+# Wall-clock time (time.time()) before which GitHub asked us to stop sending requests, per get_github_token_key. Rate limits are per installation token, so a back-off for one installation never stalls another served by the same warm container; within an installation every thread shares it, so one rate-limited call pauses the whole fan-out.
+GITHUB_BACKOFF: LRUCache[str, float] = LRUCache(maxsize=1024)
+
+# Fan-out threads record and read back-offs concurrently, and LRUCache is not thread-safe
+GITHUB_BACKOFF_LOCK = threading.Lock()
+
+# GitHub's guidance for a secondary rate limit without Retry-After: "wait for at least one minute before retrying"
+GITHUB_SECONDARY_RATE_LIMIT_SECONDS = 60.0
+
+
+def record_github_backoff(response: Response, *_args, **_kwargs):
+    """Response hook for github_session: when GitHub rejects a request for a primary or secondary rate limit, record how long to hold off that token in GITHUB_BACKOFF.
+
+    https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#handle-rate-limit-errors-appropriately
+    """
+    if response.status_code not in (403, 429):
+        logger.debug("record_github_backoff: status %s", response.status_code)
+        return response
+
+    headers = response.headers
+    if "X-RateLimit-Remaining" in headers:
+        logger.info("record_github_backoff: checking github rate-limit headers")
+        delay = parse_github_rate_limit_headers(response)
+    else:
+        logger.info("record_github_backoff: no github rate-limit headers")
+        delay = parse_retry_after_header(headers)
+
+    if delay is None and "secondary rate limit" in response.text.lower():
+        logger.info("record_github_backoff: secondary rate limit without Retry-After")
+        delay = GITHUB_SECONDARY_RATE_LIMIT_SECONDS
+
+    if delay is None:
+        logger.debug("record_github_backoff: %s is not a rate limit", response.url)
+        return response
+
+    key = get_github_token_key(response.request.headers.get("Authorization", ""))
+    with GITHUB_BACKOFF_LOCK:
+        GITHUB_BACKOFF[key] = max(GITHUB_BACKOFF.get(key, 0.0), time.time() + delay)
+    logger.warning(
+        "GitHub rate limit hit on %s; holding off requests for %.1fs",
+        response.url,
+        delay,
+    )
+    return response
@@ -0,0 +1,85 @@
+# pylint: disable=redefined-outer-name
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+import pytest
+
+from services.github.utils.add_conditional_headers import (
+    GITHUB_RESPONSE_CACHE,
+    add_conditional_headers,
+)
+from services.github.utils.get_github_response_cache_key import (
+    get_github_response_cache_key,
+)
+
+URL = "https://api.github.com/repos/o/r"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    GITHUB_RESPONSE_CACHE.clear()
+    yield
+    GITHUB_RESPONSE_CACHE.clear()
+
+
+def prepare(method: str = "GET", headers: dict[str, str] | None = None):
+    return Request(
+        method, URL, headers=headers or {"Authorization": "Bearer t"}
+    ).prepare()
+
+
+def cache(headers: dict[str, str]):
+    response = Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = b"{}"  # pylint: disable=protected-access
+    key = get_github_response_cache_key(prepare())
+    assert key is not None
+    GITHUB_RESPONSE_CACHE[key] = response
+
+
+def test_adds_if_none_match_for_cached_etag():
+    cache({"ETag": '"abc"'})
+    request = prepare()
+
+    assert add_conditional_headers(request) is request
+    assert request.headers["If-None-Match"] == '"abc"'
+
+
+def test_falls_back_to_if_modified_since():
+    cache({"Last-Modified": "Tue, 01 Oct 2026 00:00:00 GMT"})
+    request = add_conditional_headers(prepare())
+
+    assert request.headers["If-Modified-Since"] == "Tue, 01 Oct 2026 00:00:00 GMT"
+    assert request.headers.get("If-None-Match") is None
+
+
+def test_leaves_uncached_request_alone():
+    request = add_conditional_headers(prepare())
+
+    assert request.headers.get("If-None-Match") is None
+    assert request.headers.get("If-Modified-Since") is None
+
+
+def test_other_token_does_not_reuse_validator():
+    cache({"ETag": '"abc"'})
+    request = add_conditional_headers(
+        prepare(headers={"Authorization": "Bearer other"})
+    )
+
+    assert request.headers.get("If-None-Match") is None
+
+
+def test_keeps_caller_validator():
+    cache({"ETag": '"abc"'})
+    request = add_conditional_headers(
+        prepare(headers={"Authorization": "Bearer t", "If-None-Match": '"mine"'})
+    )
+
+    assert request.headers["If-None-Match"] == '"mine"'
+
+
+def test_writes_stay_unconditional():
+    cache({"ETag": '"abc"'})
+    request = add_conditional_headers(prepare(method="PATCH"))
+
+    assert request.headers.get("If-None-Match") is None
@@ -0,0 +1,155 @@
+# pylint: disable=redefined-outer-name
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+
+from services.github.utils.add_conditional_headers import (
+    GITHUB_RESPONSE_CACHE,
+    GITHUB_RESPONSE_CACHE_STATS,
+)
+from services.github.utils.cache_conditional_response import (
+    cache_conditional_response,
+)
+
+URL = "https://api.github.com/repos/o/r/pulls/1/files"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    GITHUB_RESPONSE_CACHE.clear()
+    GITHUB_RESPONSE_CACHE_STATS.clear()
+    yield
+    GITHUB_RESPONSE_CACHE.clear()
+    GITHUB_RESPONSE_CACHE_STATS.clear()
+
+
+def make_response(
+    status_code: int,
+    headers: dict[str, str],
+    content: bytes = b"",
+    method: str = "GET",
+    url: str = URL,
+):
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content  # pylint: disable=protected-access
+    response.raw = io.BytesIO(content)
+    response.url = url
+    response.elapsed = timedelta(milliseconds=5)
+    response.request = Request(
+        method, url, headers={"Authorization": "Bearer t"}
+    ).prepare()
+    return response
+
+
+def test_caches_200_with_etag():
+    response = make_response(200, {"ETag": '"v1"'}, b'[{"filename": "a.py"}]')
+
+    assert cache_conditional_response(response) is response
+
+    assert len(GITHUB_RESPONSE_CACHE) == 1
+    assert GITHUB_RESPONSE_CACHE_STATS == {"misses": 1}
+
+
+def test_serves_cached_body_on_304_with_fresh_headers():
+    cache_conditional_response(
+        make_response(
+            200, {"ETag": '"v1"', "X-RateLimit-Remaining": "10"}, b'[{"n": 1}]'
+        )
+    )
+    not_modified = make_response(304, {"ETag": '"v1"', "X-RateLimit-Remaining": "9"})
+
+    result = cache_conditional_response(not_modified)
+
+    assert result.status_code == 200
+    assert result.json() == [{"n": 1}]
+    assert result.headers["X-RateLimit-Remaining"] == "9"
+    assert result.request is not_modified.request
+    assert GITHUB_RESPONSE_CACHE_STATS == {"misses": 1, "hits": 1}
+
+
+def test_304_without_cached_body_is_passed_through():
+    not_modified = make_response(304, {"ETag": '"v1"'})
+
+    assert cache_conditional_response(not_modified) is not_modified
+    assert not GITHUB_RESPONSE_CACHE_STATS
+
+
+def test_changed_resource_replaces_entry():
+    cache_conditional_response(make_response(200, {"ETag": '"v1"'}, b"[1]"))
+    cache_conditional_response(make_response(200, {"ETag": '"v2"'}, b"[2]"))
+
+    (cached,) = GITHUB_RESPONSE_CACHE.values()
+    assert cached.headers["ETag"] == '"v2"'
+    assert cached.json() == [2]
+
+
+@pytest.mark.parametrize(
+    "status_code,headers",
+    [(200, {}), (404, {"ETag": '"v1"'}), (500, {"ETag": '"v1"'})],
+)
+def test_does_not_cache_without_validator_or_on_error(
+    status_code: int, headers: dict[str, str]
+):
+    cache_conditional_response(make_response(status_code, headers, b"{}"))
+
+    assert not GITHUB_RESPONSE_CACHE
+    assert GITHUB_RESPONSE_CACHE_STATS == {"misses": 1}
+
+
+def test_does_not_cache_streamed_response():
+    cache_conditional_response(make_response(200, {"ETag": '"v1"'}, b"{}"), stream=True)
+
+    assert not GITHUB_RESPONSE_CACHE
+
+
+def test_does_not_cache_body_larger_than_the_cache():
+    with patch(
+        "services.github.utils.cache_conditional_response.GITHUB_RESPONSE_CACHE_MAX_BYTES",
+        4,
+    ):
+        cache_conditional_response(make_response(200, {"ETag": '"v1"'}, b"12345"))
+
+    assert not GITHUB_RESPONSE_CACHE
+
+
+def test_successful_write_invalidates_the_repository():
+    cache_conditional_response(make_response(200, {"ETag": '"v1"'}, b"{}"))
+    write = make_response(
+        200,
+        {},
+        method="PATCH",
+        url="https://api.github.com/repos/o/r/issues/comments/9",
+    )
+
+    with patch(
+        "services.github.utils.cache_conditional_response.invalidate_github_response_cache"
+    ) as mock_invalidate:
+        assert cache_conditional_response(write) is write
+
+    mock_invalidate.assert_called_once_with("o", "r")
+
+
+def test_failed_or_non_repo_write_keeps_cache():
+    cache_conditional_response(make_response(200, {"ETag": '"v1"'}, b"{}"))
+
+    cache_conditional_response(
+        make_response(
+            422, {}, method="POST", url="https://api.github.com/repos/o/r/issues"
+        )
+    )
+    cache_conditional_response(
+        make_response(
+            201,
+            {},
+            method="POST",
+            url="https://api.github.com/app/installations/1/access_tokens",
+        )
+    )
+
+    assert len(GITHUB_RESPONSE_CACHE) == 1
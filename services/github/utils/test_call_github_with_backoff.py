@@ -0,0 +1,100 @@
+# pylint: disable=redefined-outer-name
+from unittest.mock import call, patch
+
+import pytest
+
+from services.github.utils.call_github_with_backoff import (
+    GITHUB_BACKOFF_MAX_ATTEMPTS,
+    GITHUB_BACKOFF_MAX_SECONDS,
+    call_github_with_backoff,
+)
+from services.github.utils.record_github_backoff import GITHUB_BACKOFF
+
+NOW = 1_700_000_000.0
+KEY = "token_a"
+
+
+@pytest.fixture(autouse=True)
+def clock():
+    GITHUB_BACKOFF.clear()
+    with patch(
+        "services.github.utils.call_github_with_backoff.time.time", return_value=NOW
+    ), patch("services.github.utils.call_github_with_backoff.time.sleep") as sleep:
+        yield sleep
+    GITHUB_BACKOFF.clear()
+
+
+def is_rate_limited(result: str):
+    return result == "rate_limited"
+
+
+def test_returns_first_result_without_sleeping(clock):
+    calls: list[int] = []
+
+    def update(item: int):
+        calls.append(item)
+        return "updated"
+
+    assert call_github_with_backoff(update, 7, is_rate_limited, KEY) == "updated"
+    assert calls == [7]
+    clock.assert_not_called()
+
+
+def test_waits_out_pending_backoff_before_calling(clock):
+    GITHUB_BACKOFF[KEY] = NOW + 20
+
+    assert (
+        call_github_with_backoff(lambda _: "updated", 1, is_rate_limited, KEY)
+        == "updated"
+    )
+    assert clock.call_args_list == [call(20.0)]
+
+
+def test_caps_a_long_backoff(clock):
+    GITHUB_BACKOFF[KEY] = NOW + 3600
+
+    call_github_with_backoff(lambda _: "updated", 1, is_rate_limited, KEY)
+
+    assert clock.call_args_list == [call(GITHUB_BACKOFF_MAX_SECONDS)]
+
+
+def test_retries_until_not_rate_limited(clock):
+    results = iter(["rate_limited", "updated"])
+
+    def update(_item: int):
+        # What record_github_backoff does when the rejected response says Retry-After: 5
+        GITHUB_BACKOFF[KEY] = NOW + 5
+        return next(results)
+
+    assert call_github_with_backoff(update, 1, is_rate_limited, KEY) == "updated"
+    assert clock.call_args_list == [call(5.0)]
+
+
+def test_retry_without_hint_waits_minimum(clock):
+    results = iter(["rate_limited", "updated"])
+
+    assert (
+        call_github_with_backoff(lambda _: next(results), 1, is_rate_limited, KEY)
+        == "updated"
+    )
+    assert clock.call_args_list == [call(1.0)]
+
+
+def test_gives_up_after_max_attempts(clock):
+    calls: list[int] = []
+
+    def update(item: int):
+        calls.append(item)
+        return "rate_limited"
+
+    assert call_github_with_backoff(update, 3, is_rate_limited, KEY) == "rate_limited"
+    assert calls == [3] * GITHUB_BACKOFF_MAX_ATTEMPTS
+    assert clock.call_count == GITHUB_BACKOFF_MAX_ATTEMPTS - 1
+
+
+def test_ignores_backoff_of_another_token(clock):
+    GITHUB_BACKOFF["token_b"] = NOW + 20
+
+    call_github_with_backoff(lambda _: "updated", 1, is_rate_limited, KEY)
+
+    clock.assert_not_called()
@@ -0,0 +1,151 @@
+# pylint: disable=redefined-outer-name
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.github.utils.fan_out_github_calls import (
+    GITHUB_FAN_OUT_MAX_WORKERS,
+    fan_out_github_calls,
+)
+from services.github.utils.record_github_backoff import GITHUB_BACKOFF
+from services.github.utils.track_rate_limit import GITHUB_RATE_LIMITS
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limits():
+    GITHUB_RATE_LIMITS.clear()
+    GITHUB_BACKOFF.clear()
+    yield
+    GITHUB_RATE_LIMITS.clear()
+    GITHUB_BACKOFF.clear()
+
+
+KEY = "token_a"
+
+
+def never_retry(_result):
+    return False
+
+
+class ConcurrencyProbe:
+    """Call that holds briefly so overlapping calls are counted."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __call__(self, item: int):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return item * 10
+
+
+def test_no_items():
+    assert not fan_out_github_calls([], lambda item: item, never_retry, KEY)
+
+
+def test_results_in_item_order():
+    items = list(range(30))
+
+    def call(item: int):
+        # Later items finish first
+        time.sleep((30 - item) / 3000)
+        return item * 2
+
+    assert fan_out_github_calls(items, call, never_retry, KEY) == [i * 2 for i in items]
+
+
+def test_runs_calls_concurrently_up_to_max_workers():
+    probe = ConcurrencyProbe()
+
+    assert fan_out_github_calls(list(range(20)), probe, never_retry, KEY) == [
+        i * 10 for i in range(20)
+    ]
+    assert probe.peak == GITHUB_FAN_OUT_MAX_WORKERS
+
+
+def test_never_more_workers_than_items():
+    with patch(
+        "services.github.utils.fan_out_github_calls.ThreadPoolExecutor"
+    ) as executor:
+        executor.return_value.__enter__.return_value.map.return_value = iter([1, 2])
+        fan_out_github_calls([1, 2], lambda item: item, never_retry, KEY)
+
+    executor.assert_called_once_with(max_workers=2)
+
+
+def test_runs_serially_when_quota_at_reserve():
+    GITHUB_RATE_LIMITS[(KEY, "core")] = {"limit": 5000, "remaining": 400, "reset": 0}
+    probe = ConcurrencyProbe()
+
+    fan_out_github_calls(list(range(5)), probe, never_retry, KEY)
+
+    assert probe.peak == 1
+
+
+def test_workers_limited_by_quota_above_reserve():
+    GITHUB_RATE_LIMITS[(KEY, "core")] = {"limit": 5000, "remaining": 503, "reset": 0}
+    probe = ConcurrencyProbe()
+
+    fan_out_github_calls(list(range(12)), probe, never_retry, KEY)
+
+    assert probe.peak == 3
+
+
+def test_other_resource_quota_does_not_limit_core():
+    GITHUB_RATE_LIMITS[(KEY, "search")] = {"limit": 30, "remaining": 0, "reset": 0}
+    probe = ConcurrencyProbe()
+
+    fan_out_github_calls(list(range(12)), probe, never_retry, KEY)
+
+    assert probe.peak == GITHUB_FAN_OUT_MAX_WORKERS
+
+
+def test_other_token_quota_does_not_limit_this_one():
+    GITHUB_RATE_LIMITS[("token_b", "core")] = {
+        "limit": 5000,
+        "remaining": 0,
+        "reset": 0,
+    }
+    probe = ConcurrencyProbe()
+
+    fan_out_github_calls(list(range(12)), probe, never_retry, KEY)
+
+    assert probe.peak == GITHUB_FAN_OUT_MAX_WORKERS
+
+
+@patch("services.github.utils.call_github_with_backoff.time.sleep")
+def test_retries_rate_limited_items(mock_sleep):
+    seen: list[int] = []
+    lock = threading.Lock()
+
+    def call(item: int):
+        with lock:
+            first = item not in seen
+            seen.append(item)
+        return "rate_limited" if item == 3 and first else "updated"
+
+    results = fan_out_github_calls(
+        [1, 2, 3, 4], call, lambda result: result == "rate_limited", KEY
+    )
+
+    assert results == ["updated"] * 4
+    assert sorted(seen) == [1, 2, 3, 3, 4]
+    mock_sleep.assert_called_once_with(1.0)
+
+
+def test_exception_propagates():
+    def call(item: int):
+        if item == 2:
+            raise ValueError("boom")
+        return item
+
+    with pytest.raises(ValueError):
+        fan_out_github_calls([1, 2, 3], call, never_retry, KEY)
@@ -0,0 +1,52 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from requests import Request, Response
+
+from services.github.utils.forget_rejected_installation_token import (
+    INSTALLATION_TOKEN_CACHE,
+    InstallationToken,
+    forget_rejected_installation_token,
+)
+
+URL = "https://api.github.com/repos/o/r"
+REVOKED: InstallationToken = {"token": "ghs_revoked", "expires_at": 3600.0}
+OTHER: InstallationToken = {"token": "ghs_other", "expires_at": 3600.0}
+
+
+@pytest.fixture(autouse=True)
+def seeded_cache():
+    INSTALLATION_TOKEN_CACHE.clear()
+    INSTALLATION_TOKEN_CACHE[1] = REVOKED
+    INSTALLATION_TOKEN_CACHE[2] = OTHER
+    yield
+    INSTALLATION_TOKEN_CACHE.clear()
+
+
+def make_response(status_code: int, authorization: str):
+    response = Response()
+    response.status_code = status_code
+    response.url = URL
+    response.request = Request(
+        "GET", URL, headers={"Authorization": authorization}
+    ).prepare()
+    return response
+
+
+@pytest.mark.parametrize("authorization", ["Bearer ghs_revoked", "token ghs_revoked"])
+def test_401_forgets_only_the_rejected_token(authorization: str):
+    response = make_response(401, authorization)
+
+    assert forget_rejected_installation_token(response) is response
+    assert dict(INSTALLATION_TOKEN_CACHE) == {2: OTHER}
+
+
+def test_401_with_unknown_token_keeps_cache():
+    forget_rejected_installation_token(make_response(401, "Bearer ghs_unknown"))
+
+    assert dict(INSTALLATION_TOKEN_CACHE) == {1: REVOKED, 2: OTHER}
+
+
+def test_successful_response_keeps_cache():
+    forget_rejected_installation_token(make_response(200, "Bearer ghs_revoked"))
+
+    assert dict(INSTALLATION_TOKEN_CACHE) == {1: REVOKED, 2: OTHER}
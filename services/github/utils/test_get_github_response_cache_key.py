@@ -0,0 +1,67 @@
+import pytest
+from requests import Request
+
+from services.github.utils.get_github_response_cache_key import (
+    get_github_response_cache_key,
+)
+
+
+def prepare(method: str, url: str, headers: dict[str, str] | None = None):
+    return Request(method, url, headers=headers).prepare()
+
+
+def test_key_includes_url_and_accept():
+    key = get_github_response_cache_key(
+        prepare(
+            "GET",
+            "https://api.github.com/repos/o/r/pulls/1/files?page=2",
+            {"Accept": "application/vnd.github.raw", "Authorization": "Bearer t"},
+        )
+    )
+
+    assert key is not None
+    url, accept, token_digest = key.split("|")
+    assert url == "https://api.github.com/repos/o/r/pulls/1/files?page=2"
+    assert accept == "application/vnd.github.raw"
+    assert len(token_digest) == 16
+
+
+def test_key_differs_per_token():
+    url = "https://api.github.com/repos/o/r"
+
+    first = get_github_response_cache_key(
+        prepare("GET", url, {"Authorization": "Bearer a"})
+    )
+    second = get_github_response_cache_key(
+        prepare("GET", url, {"Authorization": "Bearer b"})
+    )
+
+    assert first != second
+
+
+def test_key_never_contains_the_token():
+    key = get_github_response_cache_key(
+        prepare(
+            "GET",
+            "https://api.github.com/repos/o/r",
+            {"Authorization": "Bearer secret"},
+        )
+    )
+
+    assert key is not None
+    assert key.split("|")[2] != "Bearer secret"
+    assert not key.endswith("secret")
+
+
+@pytest.mark.parametrize(
+    "method,url",
+    [
+        ("POST", "https://api.github.com/repos/o/r/issues"),
+        ("PATCH", "https://api.github.com/repos/o/r/issues/comments/1"),
+        ("HEAD", "https://api.github.com/repos/o/r"),
+        ("GET", "https://github.com/o/r"),
+        ("GET", "https://api.github.com.evil.example/repos/o/r"),
+    ],
+)
+def test_returns_none_for_uncacheable_requests(method: str, url: str):
+    assert get_github_response_cache_key(prepare(method, url)) is None
@@ -0,0 +1,18 @@
+import hashlib
+
+from services.github.utils.get_github_token_key import get_github_token_key
+
+TOKEN_KEY = hashlib.sha256(b"ghs_abc").hexdigest()[:16]
+
+
+def test_raw_token():
+    assert get_github_token_key("ghs_abc") == TOKEN_KEY
+
+
+def test_authorization_header_matches_raw_token():
+    assert get_github_token_key("Bearer ghs_abc") == TOKEN_KEY
+    assert get_github_token_key("token ghs_abc") == TOKEN_KEY
+
+
+def test_differs_per_token():
+    assert get_github_token_key("ghs_other") != TOKEN_KEY
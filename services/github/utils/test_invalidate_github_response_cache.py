@@ -0,0 +1,47 @@
+# pylint: disable=redefined-outer-name
+from requests import Response
+import pytest
+
+from services.github.utils.add_conditional_headers import (
+    GITHUB_RESPONSE_CACHE,
+    GITHUB_RESPONSE_CACHE_STATS,
+)
+from services.github.utils.invalidate_github_response_cache import (
+    invalidate_github_response_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    GITHUB_RESPONSE_CACHE.clear()
+    GITHUB_RESPONSE_CACHE_STATS.clear()
+    yield
+    GITHUB_RESPONSE_CACHE.clear()
+    GITHUB_RESPONSE_CACHE_STATS.clear()
+
+
+def test_drops_only_the_repository_entries():
+    keys = [
+        "https://api.github.com/repos/o/r|application/json|t",
+        "https://api.github.com/repos/o/r/pulls/1/files?page=1|application/json|t",
+        "https://api.github.com/repos/o/r?x=1||t",
+        "https://api.github.com/repos/o/r-other/pulls/1||t",
+        "https://api.github.com/repos/other/r||t",
+        "https://api.github.com/app/installations/1||t",
+    ]
+    for key in keys:
+        GITHUB_RESPONSE_CACHE[key] = Response()
+
+    assert invalidate_github_response_cache("o", "r") == 3
+
+    assert sorted(GITHUB_RESPONSE_CACHE) == [
+        "https://api.github.com/app/installations/1||t",
+        "https://api.github.com/repos/o/r-other/pulls/1||t",
+        "https://api.github.com/repos/other/r||t",
+    ]
+    assert GITHUB_RESPONSE_CACHE_STATS["invalidated"] == 3
+
+
+def test_empty_cache_is_a_noop():
+    assert invalidate_github_response_cache("o", "r") == 0
+    assert GITHUB_RESPONSE_CACHE_STATS["invalidated"] == 0
@@ -0,0 +1,121 @@
+# pylint: disable=redefined-outer-name
+from unittest.mock import patch
+
+import pytest
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+
+from services.github.utils.get_github_token_key import get_github_token_key
+from services.github.utils.record_github_backoff import (
+    GITHUB_BACKOFF,
+    GITHUB_SECONDARY_RATE_LIMIT_SECONDS,
+    record_github_backoff,
+)
+
+NOW = 1_700_000_000.0
+KEY = get_github_token_key("ghs_a")
+
+
+@pytest.fixture(autouse=True)
+def clear_backoff():
+    GITHUB_BACKOFF.clear()
+    with patch(
+        "services.github.utils.record_github_backoff.time.time", return_value=NOW
+    ):
+        yield
+    GITHUB_BACKOFF.clear()
+
+
+def make_response(
+    status_code: int, headers: dict[str, str], body: str = "", token: str = "ghs_a"
+):
+    response = Response()
+    response.status_code = status_code
+    response.url = "https://api.github.com/repos/o/r/pulls/1/update-branch"
+    response.request = Request(
+        "PUT", response.url, headers={"Authorization": f"Bearer {token}"}
+    ).prepare()
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body.encode()  # pylint: disable=protected-access
+    return response
+
+
+def test_ignores_successful_responses():
+    response = make_response(202, {"Retry-After": "30"})
+
+    assert record_github_backoff(response) is response
+    assert not GITHUB_BACKOFF
+
+
+def test_secondary_limit_with_retry_after():
+    response = make_response(
+        403,
+        {"X-RateLimit-Remaining": "4000", "Retry-After": "30"},
+        '{"message": "You have exceeded a secondary rate limit"}',
+    )
+
+    assert record_github_backoff(response) is response
+    assert dict(GITHUB_BACKOFF) == {KEY: NOW + 30}
+
+
+def test_secondary_limit_without_retry_after_waits_a_minute():
+    response = make_response(
+        403,
+        {"X-RateLimit-Remaining": "4000"},
+        '{"message": "You have exceeded a secondary rate limit"}',
+    )
+
+    record_github_backoff(response)
+
+    assert dict(GITHUB_BACKOFF) == {KEY: NOW + GITHUB_SECONDARY_RATE_LIMIT_SECONDS}
+
+
+def test_primary_limit_waits_for_reset():
+    with patch(
+        "utils.error.parse_github_rate_limit_headers.time.time", return_value=NOW
+    ):
+        record_github_backoff(
+            make_response(
+                403,
+                {
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(int(NOW) + 100),
+                },
+                '{"message": "API rate limit exceeded"}',
+            )
+        )
+
+    # parse_github_rate_limit_headers adds a 5s clock-skew buffer
+    assert dict(GITHUB_BACKOFF) == {KEY: NOW + 105}
+
+
+def test_429_without_github_headers_uses_retry_after():
+    record_github_backoff(make_response(429, {"Retry-After": "12"}))
+
+    assert dict(GITHUB_BACKOFF) == {KEY: NOW + 12}
+
+
+def test_permission_error_is_not_a_rate_limit():
+    record_github_backoff(
+        make_response(
+            403,
+            {"X-RateLimit-Remaining": "4000"},
+            '{"message": "Resource not accessible by integration"}',
+        )
+    )
+
+    assert not GITHUB_BACKOFF
+
+
+def test_keeps_the_later_deadline():
+    GITHUB_BACKOFF[KEY] = NOW + 50
+
+    record_github_backoff(make_response(429, {"Retry-After": "10"}))
+
+    assert dict(GITHUB_BACKOFF) == {KEY: NOW + 50}
+
+
+def test_backoff_is_recorded_per_token():
+    record_github_backoff(make_response(429, {"Retry-After": "10"}, token="ghs_b"))
+
+    assert dict(GITHUB_BACKOFF) == {get_github_token_key("ghs_b"): NOW + 10}
@@ -0,0 +1,100 @@
+# pylint: disable=redefined-outer-name
+import time
+from unittest.mock import patch
+
+import pytest
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+
+from services.github.utils.get_github_token_key import get_github_token_key
+from services.github.utils.track_rate_limit import (
+    GITHUB_RATE_LIMITS,
+    track_rate_limit,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limits():
+    GITHUB_RATE_LIMITS.clear()
+    yield
+    GITHUB_RATE_LIMITS.clear()
+
+
+KEY = get_github_token_key("ghs_a")
+
+
+def make_response(headers: dict[str, str], token: str = "ghs_a"):
+    response = Response()
+    response.url = "https://api.github.com/repos/o/r"
+    response.request = Request(
+        "GET", response.url, headers={"Authorization": f"Bearer {token}"}
+    ).prepare()
+    response.headers = CaseInsensitiveDict(headers)
+    return response
+
+
+def test_records_headers_per_resource():
+    core = make_response(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Reset": "1700000000",
+            "X-RateLimit-Resource": "core",
+        }
+    )
+    search = make_response(
+        {
+            "x-ratelimit-limit": "30",
+            "x-ratelimit-remaining": "29",
+            "x-ratelimit-reset": "1700000060",
+            "x-ratelimit-resource": "search",
+        }
+    )
+
+    assert track_rate_limit(core) is core
+    track_rate_limit(search)
+
+    assert dict(GITHUB_RATE_LIMITS) == {
+        (KEY, "core"): {"limit": 5000, "remaining": 4999, "reset": 1700000000},
+        (KEY, "search"): {"limit": 30, "remaining": 29, "reset": 1700000060},
+    }
+
+
+def test_records_headers_per_token():
+    headers = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "10"}
+    track_rate_limit(make_response(headers))
+    track_rate_limit(
+        make_response({**headers, "X-RateLimit-Remaining": "4000"}, token="ghs_b")
+    )
+
+    assert dict(GITHUB_RATE_LIMITS) == {
+        (KEY, "core"): {"limit": 5000, "remaining": 10, "reset": 0},
+        (get_github_token_key("ghs_b"), "core"): {
+            "limit": 5000,
+            "remaining": 4000,
+            "reset": 0,
+        },
+    }
+
+
+def test_warns_when_quota_nearly_spent():
+    response = make_response(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "12",
+            "X-RateLimit-Reset": str(int(time.time()) + 600),
+        }
+    )
+
+    with patch("services.github.utils.track_rate_limit.logger") as logger:
+        track_rate_limit(response)
+
+    logger.warning.assert_called_once()
+    assert logger.warning.call_args.args[1:4] == ("core", 12, 5000)
+
+
+def test_ignores_responses_without_rate_limit_headers():
+    track_rate_limit(make_response({"Content-Type": "application/json"}))
+    track_rate_limit(make_response({"X-RateLimit-Remaining": "soon"}))
+
+    assert not GITHUB_RATE_LIMITS
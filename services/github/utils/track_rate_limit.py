@@ -0,0 +1,64 @@
+import threading
+import time
+from typing import TypedDict
+
+from cachetools import LRUCache
+from requests import Response
+
+from services.github.utils.get_github_token_key import get_github_token_key
+from utils.logging.logging_config import logger
+
+
+class GitHubRateLimit(TypedDict):
+    limit: int
+    remaining: int
+    reset: int
+
+
+# Latest X-RateLimit-* headers seen per (get_github_token_key, resource), resource being "core", "search", "graphql", ... Limits are per token, so one installation's drained quota never throttles another served by the same warm container.
+GITHUB_RATE_LIMITS: LRUCache[tuple[str, str], GitHubRateLimit] = LRUCache(maxsize=1024)
+
+# Every response hook on every fan-out thread writes here, and LRUCache is not thread-safe
+GITHUB_RATE_LIMITS_LOCK = threading.Lock()
+
+# Warn once remaining drops below this fraction of the limit, while there is still quota left to finish the current invocation
+GITHUB_RATE_LIMIT_WARN_FRACTION = 0.1
+
+
+def track_rate_limit(response: Response, *_args, **_kwargs):
+    """Response hook for github_session: record the rate-limit headers of every GitHub response and warn when the quota is nearly spent."""
+    headers = response.headers
+    if "X-RateLimit-Remaining" not in headers:
+        logger.debug("track_rate_limit: no rate-limit headers on %s", response.url)
+        return response
+
+    try:
+        rate_limit = GitHubRateLimit(
+            limit=int(headers.get("X-RateLimit-Limit", 0)),
+            remaining=int(headers["X-RateLimit-Remaining"]),
+            reset=int(headers.get("X-RateLimit-Reset", 0)),
+        )
+    except ValueError:
+        logger.info("track_rate_limit: unparseable rate-limit headers; ignoring")
+        return response
+
+    resource = headers.get("X-RateLimit-Resource", "core")
+    key = get_github_token_key(response.request.headers.get("Authorization", ""))
+    with GITHUB_RATE_LIMITS_LOCK:
+        GITHUB_RATE_LIMITS[(key, resource)] = rate_limit
+    if rate_limit["remaining"] < rate_limit["limit"] * GITHUB_RATE_LIMIT_WARN_FRACTION:
+        logger.warning(
+            "GitHub %s rate limit low: %d/%d left, resets in %ds",
+            resource,
+            rate_limit["remaining"],
+            rate_limit["limit"],
+            max(rate_limit["reset"] - int(time.time()), 0),
+        )
+    else:
+        logger.debug(
+            "track_rate_limit: %s %d/%d",
+            resource,
+            rate_limit["remaining"],
+            rate_limit["limit"],
+        )
+    return response
@@ -1,8 +1,6 @@
-# Third-party libraries
-import requests
-
 # Internal libraries
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 
 
@@ -10,7 +8,7 @@ def get_failed_step_log_file_name(owner: str, repo: str, run_id: int, token: str
     """No official API documents"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}/jobs"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     if response.status_code == 404 and "Not Found" in response.text:
         return response.status_code
     response.raise_for_status()
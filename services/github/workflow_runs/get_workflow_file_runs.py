@@ -1,10 +1,9 @@
 # Third party imports
 from typing import cast
 
-import requests
-
 # Local imports
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.types.workflow_run import WorkflowRun
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
@@ -31,7 +30,7 @@ def get_workflow_file_runs(
         if branch:
             url += f"&branch={branch}"
 
-        response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+        response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
         response.raise_for_status()
 
         runs = response.json().get("workflow_runs", [])
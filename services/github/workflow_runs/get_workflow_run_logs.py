@@ -2,11 +2,9 @@
 import io
 import zipfile
 
-# Third-party libraries
-import requests
-
 # Internal libraries
 from config import GITHUB_API_URL, TIMEOUT, UTF8
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from services.github.workflow_runs.get_failed_step_log_file_name import (
     get_failed_step_log_file_name,
@@ -19,7 +17,7 @@ def get_workflow_run_logs(owner: str, repo: str, run_id: int, token: str):
     """https://docs.github.com/en/rest/actions/workflow-runs?apiVersion=2022-11-28#download-workflow-run-logs"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}/logs"
     headers = create_headers(media_type="", token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     if response.status_code == 404 and "Not Found" in response.text:
         return response.status_code
     response.raise_for_status()
@@ -1,5 +1,5 @@
-import requests
 from config import GITHUB_API_URL, TIMEOUT
+from services.github.session import github_session
 from services.github.utils.create_headers import create_headers
 from utils.error.handle_exceptions import handle_exceptions
 
@@ -9,7 +9,7 @@ def get_workflow_run_path(owner: str, repo: str, run_id: int, token: str):
     """https://docs.github.com/en/rest/actions/workflow-runs?apiVersion=2022-11-28#get-a-workflow-run"""
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}"
     headers = create_headers(token=token)
-    response = requests.get(url=url, headers=headers, timeout=TIMEOUT)
+    response = github_session.get(url=url, headers=headers, timeout=TIMEOUT)
     if response.status_code == 404 and "Not Found" in response.text:
         return response.status_code
     response.raise_for_status()
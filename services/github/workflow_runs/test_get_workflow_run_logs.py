@@ -94,7 +94,7 @@ def test_get_workflow_run_logs_success(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -131,7 +131,7 @@ def test_get_workflow_run_logs_404_not_found(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -166,7 +166,7 @@ def test_get_workflow_run_logs_404_without_not_found_text(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -197,7 +197,7 @@ def test_get_workflow_run_logs_failed_step_not_found(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -228,7 +228,7 @@ def test_get_workflow_run_logs_failed_step_none(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -267,7 +267,7 @@ def test_get_workflow_run_logs_failed_step_file_not_in_zip_falls_back_to_combine
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -312,7 +312,7 @@ def test_get_workflow_run_logs_combined_log_fallback_like_spiderplus(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -354,7 +354,7 @@ def test_get_workflow_run_logs_no_matching_log_file(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -390,7 +390,7 @@ def test_get_workflow_run_logs_empty_zip(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -436,7 +436,7 @@ def test_get_workflow_run_logs_short_log_lines(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -477,7 +477,7 @@ def test_get_workflow_run_logs_exactly_29_char_lines(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -517,7 +517,7 @@ def test_get_workflow_run_logs_timestamp_removal_verification(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -546,7 +546,7 @@ def test_get_workflow_run_logs_url_construction(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -579,7 +579,7 @@ def test_get_workflow_run_logs_timeout_parameter(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -614,7 +614,7 @@ def test_get_workflow_run_logs_http_error_after_404_check(
 
     # Act - function has handle_exceptions decorator, so it should return default value
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers:
@@ -643,7 +643,7 @@ def test_get_workflow_run_logs_invalid_zip_content(
 
     # Act - function has handle_exceptions decorator, so it should return default value
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -691,7 +691,7 @@ def test_get_workflow_run_logs_different_log_file_names(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -732,7 +732,7 @@ def test_get_workflow_run_logs_unicode_content(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -770,7 +770,7 @@ def test_get_workflow_run_logs_empty_log_file(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
@@ -812,7 +812,7 @@ def test_get_workflow_run_logs_single_line_log(
 
     # Act
     with patch(
-        "services.github.workflow_runs.get_workflow_run_logs.requests.get"
+        "services.github.workflow_runs.get_workflow_run_logs.github_session.get"
     ) as mock_get, patch(
         "services.github.workflow_runs.get_workflow_run_logs.create_headers"
     ) as mock_create_headers, patch(
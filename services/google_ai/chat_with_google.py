@@ -2,6 +2,7 @@
 import time
 import uuid
 from functools import partial
+from typing import Callable
 
 # Third-party imports
 from anthropic.types import MessageParam, ToolUnionParam
@@ -29,7 +30,9 @@ def chat_with_google(
     model_id: GoogleModelId,
     usage_id: int,
     created_by: str,
+    on_tool_call: Callable[[ToolCall], bool] | None = None,
 ):
+    """on_tool_call streams the response; see chat_with_claude."""
     client = get_google_ai_client()
 
     # Trim messages to stay under the model's context window. Gemma-4-31B caps at 262144 input tokens; without this guard, a bursty test_failure payload can produce a 400 INVALID_ARGUMENT cascade (AGENT-3JR/3JS/3JT/3JV, 2026-04-20 gitautoai/website).
@@ -54,30 +57,23 @@ def chat_with_google(
         # chat_with_agent manages the tool-call loop, so disable the SDK's auto-execution
         automatic_function_calling=types.AutomaticFunctionCallingConfig(disable=True),
     )
-    start_time = time.time()
-    response = client.models.generate_content(
-        model=model_id,
-        contents=google_contents,
-        config=config,
-    )
-    response_time_ms = int((time.time() - start_time) * 1000)
-
-    # Extract token counts
-    usage = response.usage_metadata
-    token_input = (usage.prompt_token_count or 0) if usage else 0
-    token_output = (usage.candidates_token_count or 0) if usage else 0
-
     # Process response: extract text and function calls
     content_text = ""
     tool_calls: list[ToolCall] = []
     content_list = []
 
-    if response.candidates:
+    def add_candidates(candidates: list[types.Candidate] | None):
+        nonlocal content_text
+        added: list[ToolCall] = []
+        if not candidates:
+            logger.info("chat_with_google: no candidates to parse")
+            return added
+
         logger.info(
             "chat_with_google: response has %d candidate(s); parsing first",
-            len(response.candidates),
+            len(candidates),
         )
-        candidate = response.candidates[0]
+        candidate = candidates[0]
         if candidate.content and candidate.content.parts:
             logger.info(
                 "chat_with_google: candidate has %d part(s); iterating",
@@ -98,13 +94,54 @@ def chat_with_google(
                     fc = part.function_call
                     # Generate a tool_use ID matching Anthropic format
                     tool_id = fc.id or f"toolu_{uuid.uuid4().hex[:24]}"
-                    tool_calls.append(
+                    added.append(
                         ToolCall(
                             id=tool_id,
                             name=fc.name or "",
                             args=dict(fc.args) if fc.args else None,
                         )
                     )
+        tool_calls.extend(added)
+        logger.info("chat_with_google: %d tool call(s) parsed", len(added))
+        return added
+
+    start_time = time.time()
+    time_to_first_token_ms: int | None = None
+    first_dispatch_time: float | None = None
+    if on_tool_call is None:
+        logger.info("chat_with_google: non-streaming request")
+        response = client.models.generate_content(
+            model=model_id,
+            contents=google_contents,
+            config=config,
+        )
+        usage = response.usage_metadata
+        add_candidates(response.candidates)
+    else:
+        logger.info("chat_with_google: streaming request")
+        usage = None
+        # Gemini streams each function_call part whole, so it can start as soon as its chunk arrives
+        for chunk in client.models.generate_content_stream(
+            model=model_id,
+            contents=google_contents,
+            config=config,
+        ):
+            if time_to_first_token_ms is None:
+                logger.info("chat_with_google: first chunk received")
+                time_to_first_token_ms = int((time.time() - start_time) * 1000)
+            if chunk.usage_metadata:
+                # Each chunk carries the running totals; the last one is the final count
+                logger.debug("chat_with_google: usage updated from chunk")
+                usage = chunk.usage_metadata
+            for tc in add_candidates(chunk.candidates):
+                if on_tool_call(tc) and first_dispatch_time is None:
+                    logger.info("chat_with_google: %s started early", tc.name)
+                    first_dispatch_time = time.time()
+    response_time_ms = int((time.time() - start_time) * 1000)
+
+    # Extract token counts
+    token_input = (usage.prompt_token_count or 0) if usage else 0
+    token_output = (usage.candidates_token_count or 0) if usage else 0
 
     # Build content list in Anthropic format
     if content_text:
@@ -141,6 +178,12 @@ def chat_with_google(
         system_prompt=system_content,
         response_time_ms=response_time_ms,
         created_by=created_by,
+        time_to_first_token_ms=time_to_first_token_ms,
+        tool_overlap_ms=(
+            int((time.time() - first_dispatch_time) * 1000)
+            if first_dispatch_time is not None
+            else None
+        ),
     )
     cost_usd = llm_record["total_cost_usd"] if llm_record else 0.0
 
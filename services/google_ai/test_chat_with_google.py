@@ -422,3 +422,60 @@ def test_429_is_not_retried_locally_bubbles_to_handle_exceptions(
     # handle_exceptions retries up to TRANSIENT_MAX_ATTEMPTS=3 times before giving up, so the SDK gets called 3 times (honoring the 5s hint between each).
     assert client.models.generate_content.call_count == 3
     mock_insert.assert_not_called()
+
+
+@patch("services.google_ai.chat_with_google.insert_llm_request")
+@patch("services.google_ai.chat_with_google.get_google_ai_client")
+def test_streaming_hands_each_function_call_to_callback_as_it_arrives(
+    mock_get_client, mock_insert
+):
+    """Streamed chunks are accumulated into one response; each function_call goes to on_tool_call before later chunks are read."""
+    mock_insert.return_value = {"total_cost_usd": 0.0}
+    first = _mock_tool_call_response(
+        "Reading.", "get_local_file_content", {"file_path": "a.py"}, fc_id="toolu_1"
+    )
+    first.usage_metadata = None
+    second = _mock_tool_call_response(
+        " Then writing.",
+        "write_and_commit_file",
+        {"file_path": "b.py"},
+        fc_id="toolu_2",
+        prompt_tokens=30,
+        candidates_tokens=25,
+    )
+    seen: list[str] = []
+
+    def stream(**_kwargs):
+        yield first
+        seen.append("second chunk")
+        yield second
+
+    mock_client = Mock()
+    mock_client.models.generate_content_stream.side_effect = stream
+    mock_client.models.count_tokens.return_value = Mock(total_tokens=1)
+    mock_get_client.return_value = mock_client
+
+    def on_tool_call(tc):
+        seen.append(tc.name)
+        return tc.name == "get_local_file_content"
+
+    result = chat_with_google(
+        messages=cast(list[MessageParam], [{"role": "user", "content": "go"}]),
+        system_content="sys",
+        tools=[],
+        model_id=GoogleModelId.GEMMA_4_31B,
+        usage_id=1,
+        created_by="4:test-user",
+        on_tool_call=on_tool_call,
+    )
+
+    assert seen == ["get_local_file_content", "second chunk", "write_and_commit_file"]
+    mock_client.models.generate_content.assert_not_called()
+    assert [tc.id for tc in result.tool_calls] == ["toolu_1", "toolu_2"]
+    assert result.token_input == 30
+    assert result.token_output == 25
+    content = cast(list, result.assistant_message["content"])
+    assert content[0] == {"type": "text", "text": "Reading. Then writing."}
+    insert_kwargs = mock_insert.call_args.kwargs
+    assert isinstance(insert_kwargs["time_to_first_token_ms"], int)
+    assert isinstance(insert_kwargs["tool_overlap_ms"], int)
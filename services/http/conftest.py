@@ -0,0 +1,33 @@
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.http.load_fetch_cache import FETCH_CACHE, FETCH_CACHE_STATS
+
+
+@pytest.fixture(autouse=True)
+def fetch_cache_s3():
+    """Start every test with an empty fetch cache and an in-memory stand-in for the shared S3 tier; yields {s3_key: body bytes}."""
+    objects: dict[str, bytes] = {}
+
+    def get_object(Bucket, Key):  # pylint: disable=invalid-name,unused-argument
+        if Key not in objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(objects[Key])}
+
+    def put_object(
+        Bucket, Key, Body, **_kwargs
+    ):  # pylint: disable=invalid-name,unused-argument
+        objects[Key] = Body
+
+    s3 = Mock(get_object=Mock(side_effect=get_object), put_object=put_object)
+    FETCH_CACHE.clear()
+    FETCH_CACHE_STATS.clear()
+    with patch("services.http.load_fetch_cache.get_s3_client", return_value=s3), patch(
+        "services.http.save_fetch_cache.get_s3_client", return_value=s3
+    ):
+        yield objects
+    FETCH_CACHE.clear()
+    FETCH_CACHE_STATS.clear()
@@ -0,0 +1,81 @@
+import time
+from typing import Callable
+
+import requests
+
+from config import TIMEOUT
+from constants.requests import FETCH_CACHE_TTL_SECONDS, USER_AGENT
+from services.http.github_auth_headers import github_auth_headers
+from services.http.load_fetch_cache import (
+    FETCH_CACHE_LOCK,
+    FETCH_CACHE_STATS,
+    FetchCacheEntry,
+    load_fetch_cache,
+)
+from services.http.save_fetch_cache import save_fetch_cache
+from services.types.base_args import BaseArgs
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(raise_on_error=True)
+def fetch_with_cache(
+    *,
+    kind: str,
+    url: str,
+    base_args: BaseArgs,
+    convert: Callable[[requests.Response], dict[str, str]],
+):
+    """GET url and return convert(response), or the cached result of an earlier convert for the same kind and url.
+
+    Within FETCH_CACHE_TTL_SECONDS the cached result is returned with no request. After that the request carries the cached ETag / Last-Modified, and a 304 keeps the cached result. Only 2xx responses are cached. URLs fetched with the installation token are cached in this container only, keyed by installation, and never written to the shared S3 tier.
+    """
+    # raw.githubusercontent.com and api.github.com return 404 for private repos without a token (AGENT-364/363/23G). Send the installation token so fetching the agent's own private repo content works; harmless for other URLs.
+    auth_headers = github_auth_headers(url, base_args.get("token"))
+    shared = not auth_headers
+    key = f"{kind}:{url}" if shared else f"{kind}:{base_args['installation_id']}:{url}"
+
+    cached = load_fetch_cache(key=key, shared=shared)
+    headers = {"User-Agent": USER_AGENT, **auth_headers}
+    if cached is not None:
+        age = time.time() - cached["fetched_at"]
+        if age < FETCH_CACHE_TTL_SECONDS:
+            logger.info("fetch_with_cache: %s fresh (%.0fs old)", key, age)
+            return cached["data"]
+
+        logger.info("fetch_with_cache: %s stale (%.0fs old), revalidating", key, age)
+        if "etag" in cached:
+            logger.debug("fetch_with_cache: sending If-None-Match")
+            headers["If-None-Match"] = cached["etag"]
+        if "last_modified" in cached:
+            logger.debug("fetch_with_cache: sending If-Modified-Since")
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = requests.get(url, headers=headers, timeout=TIMEOUT)
+
+    status_code = response.status_code
+    if cached is not None and status_code == 304:
+        logger.info("fetch_with_cache: %s not modified", key)
+        with FETCH_CACHE_LOCK:
+            FETCH_CACHE_STATS["revalidated"] += 1
+        cached["fetched_at"] = time.time()
+        save_fetch_cache(key=key, entry=cached, shared=shared)
+        return cached["data"]
+
+    data = convert(response)
+    if not isinstance(status_code, int) or not 200 <= status_code < 300:
+        logger.info("fetch_with_cache: not caching %s (status %s)", key, status_code)
+        return data
+
+    entry: FetchCacheEntry = {"fetched_at": time.time(), "data": data}
+    etag = response.headers.get("ETag")
+    if isinstance(etag, str):
+        logger.debug("fetch_with_cache: recording ETag for %s", key)
+        entry["etag"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if isinstance(last_modified, str):
+        logger.debug("fetch_with_cache: recording Last-Modified for %s", key)
+        entry["last_modified"] = last_modified
+    save_fetch_cache(key=key, entry=entry, shared=shared)
+    logger.info("fetch_with_cache: cached %s", key)
+    return data
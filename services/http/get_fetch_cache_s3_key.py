@@ -0,0 +1,14 @@
+import hashlib
+
+from config import UTF8
+from constants.aws import FETCH_CACHE_S3_PREFIX
+from utils.logging.logging_config import logger
+
+
+def get_fetch_cache_s3_key(key: str):
+    """Hash the cache key: URLs can hold characters and lengths S3 keys don't allow."""
+    s3_key = (
+        f"{FETCH_CACHE_S3_PREFIX}{hashlib.sha256(key.encode(UTF8)).hexdigest()}.json"
+    )
+    logger.debug("get_fetch_cache_s3_key: %s -> %s", key, s3_key)
+    return s3_key
@@ -0,0 +1,83 @@
+import json
+import threading
+from collections import Counter
+from typing import NotRequired, TypedDict
+
+from botocore.exceptions import ClientError
+from cachetools import LRUCache
+
+from config import UTF8
+from constants.aws import S3_FETCH_CACHE_BUCKET
+from constants.requests import FETCH_CACHE_MEMORY_MAX_CHARS
+from services.aws.get_s3_client import get_s3_client
+from services.http.get_fetch_cache_s3_key import get_fetch_cache_s3_key
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+class FetchCacheEntry(TypedDict):
+    fetched_at: float
+    data: dict[str, str]
+    etag: NotRequired[str]
+    last_modified: NotRequired[str]
+
+
+# Tier 1: survives warm Lambda starts, bounded by cached characters rather than entry count since pages range from a few hundred chars to megabytes
+FETCH_CACHE: LRUCache[str, FetchCacheEntry] = LRUCache(
+    maxsize=FETCH_CACHE_MEMORY_MAX_CHARS,
+    getsizeof=lambda entry: sum(len(value) for value in entry["data"].values()) + 1,
+)
+
+# memory_hits / s3_hits / misses per container, plus revalidated (304) from fetch_with_cache
+FETCH_CACHE_STATS: Counter[str] = Counter()
+
+# web_fetch and curl run concurrently on the agent's tool threads, and LRUCache is not thread-safe; also guards FETCH_CACHE_STATS
+FETCH_CACHE_LOCK = threading.Lock()
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def load_fetch_cache(*, key: str, shared: bool):
+    """Return the FetchCacheEntry for key from the in-process LRU, then (when shared) from S3, or None. Freshness is the caller's call: entries are returned however old they are so a stale page can still be revalidated with its ETag."""
+    with FETCH_CACHE_LOCK:
+        entry = FETCH_CACHE.get(key)
+    if entry is None and shared:
+        logger.info("load_fetch_cache: memory miss for %s, trying S3", key)
+        try:
+            response = get_s3_client().get_object(
+                Bucket=S3_FETCH_CACHE_BUCKET, Key=get_fetch_cache_s3_key(key)
+            )
+        except ClientError as e:
+            error_info = e.response.get("Error")
+            error_code = error_info.get("Code") if error_info else None
+            if error_code not in ("404", "NoSuchKey"):
+                logger.error("load_fetch_cache: S3 get_object failed: %s", error_code)
+                raise
+            logger.info("load_fetch_cache: no S3 object for %s", key)
+        else:
+            logger.info("load_fetch_cache: S3 hit for %s", key)
+            entry = json.loads(response["Body"].read().decode(UTF8))
+            with FETCH_CACHE_LOCK:
+                FETCH_CACHE_STATS["s3_hits"] += 1
+                # S3 entries are capped well below the LRU size, so they always fit
+                FETCH_CACHE[key] = entry
+    elif entry is not None:
+        logger.info("load_fetch_cache: memory hit for %s", key)
+        with FETCH_CACHE_LOCK:
+            FETCH_CACHE_STATS["memory_hits"] += 1
+
+    with FETCH_CACHE_LOCK:
+        if entry is None:
+            logger.info("load_fetch_cache: miss for %s", key)
+            FETCH_CACHE_STATS["misses"] += 1
+        stats = FETCH_CACHE_STATS.copy()
+
+    lookups = sum(stats[k] for k in ("memory_hits", "s3_hits", "misses"))
+    logger.info(
+        "load_fetch_cache: hit rate %.0f%% over %d lookups (memory=%d, s3=%d, revalidated=%d)",
+        100 * (lookups - stats["misses"]) / lookups,
+        lookups,
+        stats["memory_hits"],
+        stats["s3_hits"],
+        stats["revalidated"],
+    )
+    return entry
@@ -0,0 +1,41 @@
+import json
+
+from config import UTF8
+from constants.aws import S3_FETCH_CACHE_BUCKET
+from constants.requests import FETCH_CACHE_S3_MAX_CHARS
+from services.aws.get_s3_client import get_s3_client
+from services.http.get_fetch_cache_s3_key import get_fetch_cache_s3_key
+from services.http.load_fetch_cache import (
+    FETCH_CACHE,
+    FETCH_CACHE_LOCK,
+    FetchCacheEntry,
+)
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def save_fetch_cache(*, key: str, entry: FetchCacheEntry, shared: bool):
+    """Store entry in the in-process LRU and, when shared, in S3. Callers pass shared=False for anything fetched with credentials so it never reaches other customers."""
+    size = FETCH_CACHE.getsizeof(entry)
+    if size > FETCH_CACHE.maxsize:
+        logger.info("save_fetch_cache: %s too large to cache (%d chars)", key, size)
+        return
+
+    with FETCH_CACHE_LOCK:
+        FETCH_CACHE[key] = entry
+    if not shared:
+        logger.info("save_fetch_cache: %s cached in memory only (private)", key)
+        return
+
+    if size > FETCH_CACHE_S3_MAX_CHARS:
+        logger.info("save_fetch_cache: %s kept out of S3 (%d chars)", key, size)
+        return
+
+    get_s3_client().put_object(
+        Bucket=S3_FETCH_CACHE_BUCKET,
+        Key=get_fetch_cache_s3_key(key),
+        Body=json.dumps(entry, ensure_ascii=False).encode(UTF8),
+        ContentType="application/json",
+    )
+    logger.info("save_fetch_cache: %s cached in memory and S3", key)
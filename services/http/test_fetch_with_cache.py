@@ -0,0 +1,174 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from config import TIMEOUT
+from constants.requests import FETCH_CACHE_TTL_SECONDS, USER_AGENT
+from services.http.fetch_with_cache import fetch_with_cache
+from services.http.load_fetch_cache import FETCH_CACHE, FETCH_CACHE_STATS
+
+URL = "https://jestjs.io/docs/mock-functions"
+
+
+def make_response(text="page", status_code=200, headers=None):
+    response = Mock(text=text, status_code=status_code)
+    response.headers = headers or {}
+    return response
+
+
+def convert(response):
+    return {"content": response.text.upper()}
+
+
+@patch("services.http.fetch_with_cache.requests.get")
+def test_second_fetch_within_ttl_makes_no_request(mock_get, create_test_base_args):
+    mock_get.return_value = make_response("page")
+    base_args = create_test_base_args()
+
+    first = fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+    second = fetch_with_cache(
+        kind="curl", url=URL, base_args=base_args, convert=convert
+    )
+
+    assert first == second == {"content": "PAGE"}
+    mock_get.assert_called_once_with(
+        URL, headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT
+    )
+    assert FETCH_CACHE_STATS["memory_hits"] == 1
+
+
+@patch("services.http.fetch_with_cache.requests.get")
+def test_other_container_is_served_from_s3(mock_get, create_test_base_args):
+    mock_get.return_value = make_response("page")
+    base_args = create_test_base_args()
+    fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+    # A fresh container has an empty memory tier but the same bucket
+    FETCH_CACHE.clear()
+
+    result = fetch_with_cache(
+        kind="curl", url=URL, base_args=base_args, convert=convert
+    )
+
+    assert result == {"content": "PAGE"}
+    mock_get.assert_called_once()
+    assert FETCH_CACHE_STATS["s3_hits"] == 1
+
+
+@patch("services.http.fetch_with_cache.time.time")
+@patch("services.http.fetch_with_cache.requests.get")
+def test_stale_entry_is_revalidated_and_304_keeps_it(
+    mock_get, mock_time, create_test_base_args
+):
+    base_args = create_test_base_args()
+    mock_time.return_value = 1_000.0
+    mock_get.return_value = make_response(
+        "page",
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+
+    mock_time.return_value = 1_000.0 + FETCH_CACHE_TTL_SECONDS + 1
+    mock_get.return_value = make_response("", status_code=304)
+    result = fetch_with_cache(
+        kind="curl", url=URL, base_args=base_args, convert=convert
+    )
+
+    assert result == {"content": "PAGE"}
+    assert mock_get.call_args.kwargs["headers"] == {
+        "User-Agent": USER_AGENT,
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert FETCH_CACHE_STATS["revalidated"] == 1
+    # The 304 restarted the TTL and kept the validators for the next revalidation
+    assert FETCH_CACHE["curl:" + URL] == {
+        "fetched_at": mock_time.return_value,
+        "data": {"content": "PAGE"},
+        "etag": '"v1"',
+        "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+@patch("services.http.fetch_with_cache.time.time")
+@patch("services.http.fetch_with_cache.requests.get")
+def test_stale_entry_replaced_when_page_changed(
+    mock_get, mock_time, create_test_base_args
+):
+    base_args = create_test_base_args()
+    mock_time.return_value = 1_000.0
+    mock_get.return_value = make_response("old", headers={"ETag": '"v1"'})
+    fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+
+    mock_time.return_value = 1_000.0 + FETCH_CACHE_TTL_SECONDS + 1
+    mock_get.return_value = make_response("new", headers={"ETag": '"v2"'})
+    result = fetch_with_cache(
+        kind="curl", url=URL, base_args=base_args, convert=convert
+    )
+
+    assert result == {"content": "NEW"}
+    assert FETCH_CACHE["curl:" + URL].get("etag") == '"v2"'
+
+
+@patch("services.http.fetch_with_cache.requests.get")
+def test_error_responses_are_not_cached(mock_get, create_test_base_args):
+    mock_get.return_value = make_response("gone", status_code=404)
+    base_args = create_test_base_args()
+
+    fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+    fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+
+    assert mock_get.call_count == 2
+    assert not FETCH_CACHE
+
+
+@patch("services.http.fetch_with_cache.requests.get")
+def test_token_fetch_is_scoped_to_installation_and_never_shared(
+    mock_get, create_test_base_args, fetch_cache_s3
+):
+    url = "https://raw.githubusercontent.com/o/private/main/README.md"
+    mock_get.return_value = make_response("secret")
+
+    fetch_with_cache(
+        kind="curl",
+        url=url,
+        base_args=create_test_base_args(token="ghs_a", installation_id=1),
+        convert=convert,
+    )
+    # Another installation asking for the same URL must go to GitHub with its own token
+    fetch_with_cache(
+        kind="curl",
+        url=url,
+        base_args=create_test_base_args(token="ghs_b", installation_id=2),
+        convert=convert,
+    )
+
+    assert mock_get.call_count == 2
+    assert not fetch_cache_s3
+    assert set(FETCH_CACHE) == {f"curl:1:{url}", f"curl:2:{url}"}
+
+
+@patch("services.http.fetch_with_cache.time.time")
+@patch("services.http.fetch_with_cache.requests.get")
+def test_concurrent_revalidations_are_all_counted(
+    mock_get, mock_time, create_test_base_args
+):
+    base_args = create_test_base_args()
+    mock_time.return_value = 1_000.0
+    mock_get.return_value = make_response("page", headers={"ETag": '"v1"'})
+    fetch_with_cache(kind="curl", url=URL, base_args=base_args, convert=convert)
+
+    # A negative TTL makes every call see a stale entry, so each one revalidates and gets a 304
+    mock_get.return_value = make_response("", status_code=304)
+    with patch(
+        "services.http.fetch_with_cache.FETCH_CACHE_TTL_SECONDS", -1
+    ), ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: fetch_with_cache(
+                    kind="curl", url=URL, base_args=base_args, convert=convert
+                ),
+                range(200),
+            )
+        )
+
+    assert results == [{"content": "PAGE"}] * 200
+    assert FETCH_CACHE_STATS["revalidated"] == 200
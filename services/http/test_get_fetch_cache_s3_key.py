@@ -0,0 +1,16 @@
+from constants.aws import FETCH_CACHE_S3_PREFIX
+from services.http.get_fetch_cache_s3_key import get_fetch_cache_s3_key
+
+
+def test_key_is_prefixed_hash():
+    s3_key = get_fetch_cache_s3_key("web_fetch:https://jestjs.io/docs/mock-functions")
+
+    assert s3_key.startswith(FETCH_CACHE_S3_PREFIX)
+    assert s3_key.endswith(".json")
+    assert len(s3_key) == len(FETCH_CACHE_S3_PREFIX) + 64 + len(".json")
+
+
+def test_different_keys_do_not_collide():
+    assert get_fetch_cache_s3_key("curl:https://a.example") != get_fetch_cache_s3_key(
+        "curl:https://b.example"
+    )
@@ -0,0 +1,71 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from services.http.get_fetch_cache_s3_key import get_fetch_cache_s3_key
+from services.http.load_fetch_cache import (
+    FETCH_CACHE,
+    FETCH_CACHE_STATS,
+    FetchCacheEntry,
+    load_fetch_cache,
+)
+
+ENTRY: FetchCacheEntry = {"fetched_at": 1.0, "data": {"content": "hello"}}
+
+
+def test_memory_hit():
+    FETCH_CACHE["curl:https://a.example"] = ENTRY
+
+    assert load_fetch_cache(key="curl:https://a.example", shared=True) == ENTRY
+    assert FETCH_CACHE_STATS == {"memory_hits": 1}
+
+
+def test_s3_hit_is_promoted_to_memory(fetch_cache_s3):
+    key = "curl:https://a.example"
+    fetch_cache_s3[get_fetch_cache_s3_key(key)] = json.dumps(ENTRY).encode()
+
+    assert load_fetch_cache(key=key, shared=True) == ENTRY
+    assert FETCH_CACHE[key] == ENTRY
+    assert FETCH_CACHE_STATS == {"s3_hits": 1}
+
+
+def test_miss_in_both_tiers():
+    assert load_fetch_cache(key="curl:https://a.example", shared=True) is None
+    assert FETCH_CACHE_STATS == {"misses": 1}
+
+
+def test_private_lookup_never_reads_s3(fetch_cache_s3):
+    key = "curl:7:https://api.github.com/repos/o/r"
+    fetch_cache_s3[get_fetch_cache_s3_key(key)] = json.dumps(ENTRY).encode()
+
+    with patch("services.http.load_fetch_cache.get_s3_client") as s3:
+        assert load_fetch_cache(key=key, shared=False) is None
+
+    s3.return_value.get_object.assert_not_called()
+    assert FETCH_CACHE_STATS == {"misses": 1}
+
+
+def test_s3_error_other_than_missing_returns_none():
+    with patch("services.http.load_fetch_cache.get_s3_client") as s3:
+        s3.return_value.get_object.side_effect = RuntimeError("throttled")
+
+        assert load_fetch_cache(key="curl:https://a.example", shared=True) is None
+
+
+def test_concurrent_lookups_count_every_hit():
+    """web_fetch and curl run on separate tool threads, so lookups race on the LRU and the stats Counter."""
+    for n in range(50):
+        FETCH_CACHE[f"curl:https://{n}.example"] = ENTRY
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda n: load_fetch_cache(
+                    key=f"curl:https://{n % 50}.example", shared=False
+                ),
+                range(2000),
+            )
+        )
+
+    assert results == [ENTRY] * 2000
+    assert FETCH_CACHE_STATS == {"memory_hits": 2000}
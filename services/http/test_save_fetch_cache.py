@@ -0,0 +1,104 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from cachetools import LRUCache
+
+from constants.aws import S3_FETCH_CACHE_BUCKET
+from constants.requests import FETCH_CACHE_S3_MAX_CHARS
+from services.http.get_fetch_cache_s3_key import get_fetch_cache_s3_key
+from services.http.load_fetch_cache import FETCH_CACHE, FetchCacheEntry
+from services.http.save_fetch_cache import save_fetch_cache
+
+
+def test_shared_entry_goes_to_memory_and_s3(fetch_cache_s3):
+    entry: FetchCacheEntry = {
+        "fetched_at": 1.0,
+        "data": {"content": "hello"},
+        "etag": '"abc"',
+    }
+
+    save_fetch_cache(key="curl:https://a.example", entry=entry, shared=True)
+
+    assert FETCH_CACHE["curl:https://a.example"] == entry
+    stored = fetch_cache_s3[get_fetch_cache_s3_key("curl:https://a.example")]
+    assert json.loads(stored) == entry
+
+
+def test_private_entry_stays_in_memory(fetch_cache_s3):
+    entry: FetchCacheEntry = {"fetched_at": 1.0, "data": {"content": "secret"}}
+
+    save_fetch_cache(key="curl:7:https://api.github.com/x", entry=entry, shared=False)
+
+    assert FETCH_CACHE["curl:7:https://api.github.com/x"] == entry
+    assert not fetch_cache_s3
+
+
+def test_large_entry_kept_out_of_s3(fetch_cache_s3):
+    entry: FetchCacheEntry = {
+        "fetched_at": 1.0,
+        "data": {"content": "x" * (FETCH_CACHE_S3_MAX_CHARS + 1)},
+    }
+
+    save_fetch_cache(key="curl:https://big.example", entry=entry, shared=True)
+
+    assert FETCH_CACHE["curl:https://big.example"] == entry
+    assert not fetch_cache_s3
+
+
+def test_entry_larger_than_memory_budget_is_not_cached(fetch_cache_s3):
+    entry: FetchCacheEntry = {"fetched_at": 1.0, "data": {"content": "x" * 11}}
+
+    small_cache = LRUCache(maxsize=10, getsizeof=FETCH_CACHE.getsizeof)
+    with patch("services.http.save_fetch_cache.FETCH_CACHE", small_cache):
+        save_fetch_cache(key="curl:https://huge.example", entry=entry, shared=True)
+
+    assert not small_cache
+    assert not fetch_cache_s3
+
+
+def test_least_recently_used_entries_are_evicted_by_size():
+    small_cache = LRUCache(maxsize=25, getsizeof=FETCH_CACHE.getsizeof)
+    with patch("services.http.save_fetch_cache.FETCH_CACHE", small_cache):
+        for name in ("a", "b", "c"):
+            save_fetch_cache(
+                key=f"curl:{name}",
+                entry={"fetched_at": 1.0, "data": {"content": "x" * 9}},
+                shared=False,
+            )
+
+    # Each entry counts 10 toward the 25 budget, so the oldest made room for the third
+    assert list(small_cache) == ["curl:b", "curl:c"]
+
+
+def test_shared_entry_put_uses_fetch_cache_bucket():
+    entry: FetchCacheEntry = {"fetched_at": 1.0, "data": {"content": "hello"}}
+
+    with patch("services.http.save_fetch_cache.get_s3_client") as get_s3:
+        save_fetch_cache(key="curl:https://a.example", entry=entry, shared=True)
+
+    get_s3.return_value.put_object.assert_called_once_with(
+        Bucket=S3_FETCH_CACHE_BUCKET,
+        Key=get_fetch_cache_s3_key("curl:https://a.example"),
+        Body=json.dumps(entry).encode(),
+        ContentType="application/json",
+    )
+
+
+def test_concurrent_saves_keep_the_lru_consistent():
+    """Tool threads saving at once must leave the LRU's size bookkeeping matching its entries."""
+    small_cache = LRUCache(maxsize=100, getsizeof=FETCH_CACHE.getsizeof)
+    entry: FetchCacheEntry = {"fetched_at": 1.0, "data": {"content": "x" * 9}}
+
+    with patch("services.http.save_fetch_cache.FETCH_CACHE", small_cache):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda n: save_fetch_cache(
+                        key=f"curl:https://{n}.example", entry=entry, shared=False
+                    ),
+                    range(2000),
+                )
+            )
+
+    assert (len(small_cache), small_cache.currsize) == (10, 100)
@@ -15,7 +15,7 @@ class TestWebFetch:
     """Test cases for web_fetch function."""
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_success(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -60,7 +60,7 @@ class TestWebFetch:
         mock_haiku.assert_called_once()
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_no_title(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -83,7 +83,7 @@ class TestWebFetch:
         }
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_extracts_main_tag(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -108,7 +108,7 @@ class TestWebFetch:
         )
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_extracts_article_tag(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -133,7 +133,7 @@ class TestWebFetch:
         )
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_removes_unnecessary_tags(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -158,7 +158,7 @@ class TestWebFetch:
             == "Keep this\n\n---\n\nWhat should we keep?"
         )
 
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_http_error(self, _mock_slack, mock_get, create_test_base_args):
         mock_response = Mock()
@@ -173,7 +173,7 @@ class TestWebFetch:
         assert result is None
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_strips_whitespace_title(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -191,7 +191,7 @@ class TestWebFetch:
         assert result["title"] == "Title with spaces"
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_fallback_to_full_soup(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -215,7 +215,7 @@ class TestWebFetch:
         }
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_sends_slack_notification(
         self, mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -239,7 +239,7 @@ class TestWebFetch:
         )
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_passes_prompt_to_haiku(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -268,7 +268,7 @@ class TestWebFetch:
         )
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_web_fetch_uses_haiku_model(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -286,6 +286,76 @@ class TestWebFetch:
         assert call_args[1]["model_id"] == "claude-haiku-4-5"
 
 
+class TestWebFetchCache:
+    @patch(MOCK_HAIKU_PATH)
+    @patch("services.http.fetch_with_cache.requests.get")
+    @patch("services.http.web_fetch.slack_notify")
+    def test_repeat_fetch_reuses_page_and_summary(
+        self, _mock_slack, mock_get, mock_haiku, create_test_base_args
+    ):
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.text = "<html><head><title>Jest</title></head><body><main><p>Mocks</p></main></body></html>"
+        mock_get.return_value = mock_response
+        mock_haiku.return_value = "jest.fn() creates a mock"
+        url = "https://jestjs.io/docs/mock-functions"
+
+        first = web_fetch(create_test_base_args(owner="a"), url, "How do I mock?")
+        # Another customer asking the same question about the same page
+        second = web_fetch(create_test_base_args(owner="b"), url, "How do I mock?")
+
+        assert (
+            first
+            == second
+            == {
+                "title": "Jest",
+                "content": "jest.fn() creates a mock",
+                "url": url,
+            }
+        )
+        mock_get.assert_called_once()
+        mock_haiku.assert_called_once()
+
+    @patch(MOCK_HAIKU_PATH)
+    @patch("services.http.fetch_with_cache.requests.get")
+    @patch("services.http.web_fetch.slack_notify")
+    def test_new_prompt_on_cached_page_calls_haiku_without_refetching(
+        self, _mock_slack, mock_get, mock_haiku, create_test_base_args
+    ):
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.text = "<html><body><main><p>Mocks</p></main></body></html>"
+        mock_get.return_value = mock_response
+        mock_haiku.side_effect = ["answer 1", "answer 2"]
+        url = "https://jestjs.io/docs/mock-functions"
+        base_args = create_test_base_args()
+
+        web_fetch(base_args, url, "How do I mock?")
+        result = web_fetch(base_args, url, "How do I reset mocks?")
+
+        assert result is not None
+        assert result["content"] == "answer 2"
+        mock_get.assert_called_once()
+        assert mock_haiku.call_count == 2
+
+    @patch(MOCK_HAIKU_PATH)
+    @patch("services.http.fetch_with_cache.requests.get")
+    @patch("services.http.web_fetch.slack_notify")
+    def test_private_github_page_and_summary_stay_out_of_s3(
+        self, _mock_slack, mock_get, mock_haiku, create_test_base_args, fetch_cache_s3
+    ):
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.text = "<html><body>private code</body></html>"
+        mock_get.return_value = mock_response
+        mock_haiku.return_value = "summary"
+
+        web_fetch(
+            create_test_base_args(token="ghs_installation_token"),
+            "https://raw.githubusercontent.com/o/private/main/a.ts",
+            "summarize",
+        )
+
+        assert not fetch_cache_s3
+
+
 class TestWebFetchIntegration:
     """Integration tests with real HTTP calls, only mocking slack_notify and Haiku."""
 
@@ -345,7 +415,7 @@ class TestConstants:
 
 class TestWebFetchAuth:
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_raw_githubusercontent_gets_bearer_when_token_present(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
@@ -373,7 +443,7 @@ class TestWebFetchAuth:
         }
 
     @patch(MOCK_HAIKU_PATH)
-    @patch("services.http.web_fetch.requests.get")
+    @patch("services.http.fetch_with_cache.requests.get")
     @patch("services.http.web_fetch.slack_notify")
     def test_third_party_host_receives_no_bearer(
         self, _mock_slack, mock_get, mock_haiku, create_test_base_args
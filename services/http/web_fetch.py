@@ -1,13 +1,18 @@
+import hashlib
+import time
+
 import html2text
 import requests
 from anthropic.types import ToolUnionParam
 from bs4 import BeautifulSoup
 
-from config import TIMEOUT
+from config import UTF8
 from constants.models import ClaudeModelId
-from constants.requests import USER_AGENT
 from services.claude.chat_with_claude_simple import chat_with_claude_simple
+from services.http.fetch_with_cache import fetch_with_cache
 from services.http.github_auth_headers import github_auth_headers
+from services.http.load_fetch_cache import load_fetch_cache
+from services.http.save_fetch_cache import save_fetch_cache
 from services.slack.slack_notify import slack_notify
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
@@ -59,43 +64,69 @@ def web_fetch(base_args: BaseArgs, url: str, prompt: str, **_kwargs):
     repo = base_args.get("repo", "unknown")
     logger.info("Fetching URL: url=%s, owner=%s, repo=%s", url, owner, repo)
 
-    # raw.githubusercontent.com and api.github.com return 404 for private repos without a token (AGENT-364/363/23G). Send the installation token so fetching the agent's own private repo content works; harmless for other URLs.
-    headers = {"User-Agent": USER_AGENT}
-    headers.update(github_auth_headers(url, base_args.get("token")))
-    response = requests.get(url, headers=headers, timeout=TIMEOUT)
-    response.raise_for_status()
+    def convert(response: requests.Response):
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.text, "html.parser")
 
-    soup = BeautifulSoup(response.text, "html.parser")
+        # Get title before removing unnecessary elements
+        title = soup.title.string if soup.title else ""
 
-    # Get title before removing unnecessary elements
-    title = soup.title.string if soup.title else ""
+        # Remove unnecessary elements
+        for element in soup.select(", ".join(UNNECESSARY_TAGS)):
+            element.decompose()
 
-    # Remove unnecessary elements
-    for element in soup.select(", ".join(UNNECESSARY_TAGS)):
-        element.decompose()
+        logger.info("Scraped url: %s, Title: %s", url, title)
 
-    logger.info("Scraped url: %s, Title: %s", url, title)
+        # Find main content area if possible
+        main_content = soup.select_one("main, article, div[role='main']") or soup
 
-    # Find main content area if possible
-    main_content = soup.select_one("main, article, div[role='main']") or soup
+        # Convert HTML to markdown so Claude can parse headings, code blocks, links, etc.
+        converter = html2text.HTML2Text()
+        converter.ignore_images = True
+        converter.body_width = 0  # No line wrapping
+        return {
+            "title": str(title) if title else "",
+            "markdown": converter.handle(str(main_content)).strip(),
+        }
 
-    # Convert HTML to markdown so Claude can parse headings, code blocks, links, etc.
-    converter = html2text.HTML2Text()
-    converter.ignore_images = True
-    converter.body_width = 0  # No line wrapping
-    markdown = converter.handle(str(main_content)).strip()
+    page = fetch_with_cache(
+        kind="web_fetch", url=url, base_args=base_args, convert=convert
+    )
+    title = page["title"]
+    markdown = page["markdown"]
 
-    # Summarize using Haiku to avoid sending full page content to the main (expensive) model
-    usage_id = base_args.get("usage_id", 0)
-    summary = chat_with_claude_simple(
-        system_input=f"You are extracting information from a web page at {url} (title: {title}).",
-        user_input=f"{markdown}\n\n---\n\n{prompt}",
-        usage_id=usage_id,
-        model_id=ClaudeModelId.HAIKU_4_5,
+    # Same page and prompt, same summary: skip the Haiku call. Keyed by content so an updated page gets a new summary. Summaries of token-fetched pages stay out of the shared tier like the pages themselves.
+    shared = not github_auth_headers(url, base_args.get("token"))
+    summary_key = (
+        "web_fetch_summary:"
+        f"{hashlib.sha256(markdown.encode(UTF8)).hexdigest()}:"
+        f"{hashlib.sha256(prompt.encode(UTF8)).hexdigest()}"
     )
+    cached_summary = load_fetch_cache(key=summary_key, shared=shared)
+    if cached_summary is not None:
+        logger.info("web_fetch: reusing cached summary for %s", url)
+        summary = cached_summary["data"]["summary"]
+    else:
+        logger.info("web_fetch: no cached summary for %s, asking Haiku", url)
+        # Summarize using Haiku to avoid sending full page content to the main (expensive) model
+        usage_id = base_args.get("usage_id", 0)
+        summary = chat_with_claude_simple(
+            system_input=f"You are extracting information from a web page at {url} (title: {title}).",
+            user_input=f"{markdown}\n\n---\n\n{prompt}",
+            usage_id=usage_id,
+            model_id=ClaudeModelId.HAIKU_4_5,
+        )
+        if isinstance(summary, str):
+            logger.info("web_fetch: caching summary for %s", url)
+            save_fetch_cache(
+                key=summary_key,
+                entry={"fetched_at": time.time(), "data": {"summary": summary}},
+                shared=shared,
+            )
 
     result = {
-        "title": title.strip() if title else "",
+        "title": title.strip(),
         "content": summary,
         "url": url,
     }
@@ -1,9 +1,7 @@
 import os
 import shutil
-import subprocess
 from dataclasses import dataclass, field
 
-from constants.aws import SUBPROCESS_TIMEOUT_SECONDS
 from constants.mongoms import MONGOMS_MAJOR_TO_MONGODB_VERSION
 from services.jest.parse_coverage_json import Coverage, parse_coverage_json
 from services.mongoms.get_archive_name import get_mongoms_archive_name
@@ -15,6 +13,8 @@ from services.node.get_dependency_major_version import get_dependency_major_vers
 from services.node.detect_package_manager import detect_package_manager
 from services.node.get_test_script_name import get_test_script_name
 from services.types.base_args import BaseArgs
+from utils.command.run_subprocess_async import run_subprocess_async
+from utils.env.passthrough_env_for_subprocess import passthrough_env_for_subprocess
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 from utils.logs.minimize_jest_test_logs import minimize_jest_test_logs
@@ -76,7 +76,7 @@ async def run_js_ts_test(
         base_cmd = [jest_bin]
 
     # CI=true disables watch mode and interactive prompts for both jest and vitest
-    env = os.environ.copy()
+    env = passthrough_env_for_subprocess()
     env["CI"] = "true"
 
     # MongoMemoryServer looks for mongod binary here. CodeBuild caches it to S3 as mongodb-binaries.tar.gz, extracted alongside node_modules by download_and_extract_s3_deps into {clone_dir}/mongodb-binaries/.
@@ -145,15 +145,7 @@ async def run_js_ts_test(
     logger.info("%s: Running %s...", runner_name, ", ".join(test_file_paths))
     all_errors: list[str] = []
     error_files: set[str] = set()
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT_SECONDS,
-        check=False,
-        cwd=clone_dir,
-        env=env,
-    )
+    result = await run_subprocess_async(cmd, cwd=clone_dir, env=env)
     if result.returncode != 0:
         output = result.stdout + result.stderr
         # Jest/yarn may exit with code 1 due to environment issues (teardown failures, MongoDB Memory Server cleanup, etc.) even when all tests pass. Without this check, the agent loops for 900s trying to fix it, and if CI also fails, GitAuto gets re-triggered - burning more Lambda time and cost.
@@ -195,12 +187,8 @@ async def run_js_ts_test(
 
     # Detect snapshot files updated by -u flag
     updated_snapshots: set[str] = set()
-    diff_result = subprocess.run(
-        ["git", "diff", "--name-only"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=clone_dir,
+    diff_result = await run_subprocess_async(
+        ["git", "diff", "--name-only"], cwd=clone_dir
     )
     if diff_result.returncode == 0:
         logger.info("test: scanning git diff for updated snapshots")
@@ -9,7 +9,7 @@ from utils.memory.is_lambda_oom_approaching import NODE_MAX_OLD_SPACE_SIZE_MB
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_success(
     mock_exists, mock_subprocess, create_test_base_args
@@ -88,7 +88,7 @@ async def test_run_js_ts_test_no_runner(mock_exists, create_test_base_args):
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_with_failures(
     mock_exists, mock_subprocess, create_test_base_args
@@ -117,7 +117,7 @@ async def test_run_js_ts_test_with_failures(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_detects_updated_snapshots(
     mock_exists, mock_subprocess, create_test_base_args
@@ -150,7 +150,7 @@ async def test_run_js_ts_test_detects_updated_snapshots(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_no_snapshots_updated(
     mock_exists, mock_subprocess, create_test_base_args
@@ -177,7 +177,7 @@ async def test_run_js_ts_test_no_snapshots_updated(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_uses_vitest_when_no_jest(
     mock_exists, mock_subprocess, create_test_base_args
@@ -210,7 +210,7 @@ async def test_run_js_ts_test_uses_vitest_when_no_jest(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_spec_files(
     mock_exists, mock_subprocess, create_test_base_args
@@ -236,7 +236,7 @@ async def test_run_js_ts_test_spec_files(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_one_of_three_fails(
     mock_exists, mock_subprocess, create_test_base_args
@@ -264,7 +264,7 @@ async def test_run_js_ts_test_one_of_three_fails(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_two_of_three_fail(
     mock_exists, mock_subprocess, create_test_base_args
@@ -292,7 +292,7 @@ async def test_run_js_ts_test_two_of_three_fail(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_all_three_fail(
     mock_exists, mock_subprocess, create_test_base_args
@@ -324,7 +324,7 @@ async def test_run_js_ts_test_all_three_fail(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_type_error_in_output(
     mock_exists, mock_subprocess, create_test_base_args
@@ -352,7 +352,7 @@ async def test_run_js_ts_test_type_error_in_output(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_sets_mongoms_download_dir(
     mock_exists, mock_subprocess, create_test_base_args
@@ -378,7 +378,7 @@ async def test_run_js_ts_test_sets_mongoms_download_dir(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_sets_mongoms_md5_check_false(
     mock_exists, mock_subprocess, create_test_base_args
@@ -403,7 +403,7 @@ async def test_run_js_ts_test_sets_mongoms_md5_check_false(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_sets_node_max_old_space_size(
     mock_exists, mock_subprocess, create_test_base_args
@@ -562,7 +562,7 @@ Ran all test suites matching /tests\\/js\\/unit\\/annotation\\/print_dialog.kyud
 
 @pytest.mark.asyncio
 @patch("services.jest.run_js_ts_test.get_test_script_name", return_value=(None, ""))
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_captures_full_esm_error(
     mock_exists, mock_subprocess, _mock_get_test_script_name, create_test_base_args
@@ -603,7 +603,7 @@ async def test_run_js_ts_test_captures_full_esm_error(
     "services.jest.run_js_ts_test.get_test_script_name",
     return_value=("test:unit", "jest --selectProjects unit"),
 )
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_uses_test_unit_script(
     mock_exists,
@@ -647,7 +647,7 @@ async def test_run_js_ts_test_uses_test_unit_script(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_exit_code_1_all_pass_in_stderr_treated_as_success(
     mock_exists, mock_subprocess, create_test_base_args
@@ -679,7 +679,7 @@ async def test_run_js_ts_test_exit_code_1_all_pass_in_stderr_treated_as_success(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_forcexit_pass_in_stderr_treated_as_success(
     mock_exists, mock_subprocess, create_test_base_args
@@ -711,7 +711,7 @@ async def test_run_js_ts_test_forcexit_pass_in_stderr_treated_as_success(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_real_fail_in_stderr_treated_as_failure(
     mock_exists, mock_subprocess, create_test_base_args
@@ -743,7 +743,7 @@ async def test_run_js_ts_test_real_fail_in_stderr_treated_as_failure(
 
 @pytest.mark.asyncio
 @patch("services.jest.run_js_ts_test.kill_processes_by_name")
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_kills_mongod_before_tests(
     mock_exists, mock_subprocess, mock_kill, create_test_base_args
@@ -768,7 +768,7 @@ async def test_run_js_ts_test_kills_mongod_before_tests(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_includes_force_exit(
     mock_exists, mock_subprocess, create_test_base_args
@@ -802,7 +802,7 @@ async def test_run_js_ts_test_includes_force_exit(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_find_related_tests_with_only_test_files(
     mock_exists, mock_subprocess, create_test_base_args
@@ -837,7 +837,7 @@ async def test_run_js_ts_test_find_related_tests_with_only_test_files(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_find_related_tests_with_both(
     mock_exists, mock_subprocess, create_test_base_args
@@ -873,7 +873,7 @@ async def test_run_js_ts_test_find_related_tests_with_both(
 
 
 @pytest.mark.asyncio
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_always_uses_find_related_tests(
     mock_exists, mock_subprocess, create_test_base_args
@@ -913,7 +913,7 @@ async def test_run_js_ts_test_always_uses_find_related_tests(
     "services.jest.run_js_ts_test.get_test_script_name",
     return_value=("test", "jest"),
 )
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_vitest_binary_but_jest_script_uses_find_related_tests(
     mock_exists,
@@ -964,7 +964,7 @@ async def test_run_js_ts_test_vitest_binary_but_jest_script_uses_find_related_te
     "services.jest.run_js_ts_test.get_test_script_name",
     return_value=("test", "vitest run"),
 )
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_jest_binary_but_vitest_script_uses_related(
     mock_exists,
@@ -1011,7 +1011,7 @@ def _only_jest_bin_exists(path):
 
 @pytest.mark.asyncio
 @patch("services.jest.run_js_ts_test.get_test_script_name")
-@patch("services.jest.run_js_ts_test.subprocess.run")
+@patch("services.jest.run_js_ts_test.run_subprocess_async")
 @patch("services.jest.run_js_ts_test.os.path.exists")
 async def test_run_js_ts_test_does_not_pass_coverage_provider(
     mock_exists,
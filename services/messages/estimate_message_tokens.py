@@ -0,0 +1,64 @@
+# Standard imports
+import hashlib
+import json
+from typing import Any
+
+# Third party imports
+from cachetools import LRUCache
+
+# Local imports
+from services.messages.message_to_dict import message_to_dict
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+# Anthropic's tokenizer averages ~3.5 chars/token on the code-heavy, JSON-heavy content our agent loop sends. Only the ratio between messages matters because trim_messages_to_token_limit calibrates the absolute scale against one server-side count.
+CHARS_PER_TOKEN = 3.5
+
+# Role marker + block framing that every message pays regardless of content length.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Anthropic bills images by pixel area, not by base64 length; 1600 is the documented ~1.15MP ceiling and keeps us on the safe side.
+IMAGE_BLOCK_TOKENS = 1600
+
+# Keyed by sha256 of the canonical message JSON so the same message object (or an equal copy rebuilt by remove_outdated_messages) is only serialized and measured once per container.
+MESSAGE_TOKEN_CACHE: LRUCache[str, int] = LRUCache(maxsize=8192)
+
+
+@handle_exceptions(default_return_value=MESSAGE_OVERHEAD_TOKENS, raise_on_error=False)
+def estimate_message_tokens(message: Any):
+    """Local, network-free token estimate for one message. Cached by content hash."""
+    msg_dict = message_to_dict(message)
+    serialized = json.dumps(msg_dict, sort_keys=True, default=str)
+    content_hash = hashlib.sha256(serialized.encode()).hexdigest()
+
+    cached = MESSAGE_TOKEN_CACHE.get(content_hash)
+    if cached is not None:
+        logger.info(
+            "estimate_message_tokens: cache hit %s=%d", content_hash[:12], cached
+        )
+        return cached
+
+    content = msg_dict.get("content")
+    image_tokens = 0
+    if isinstance(content, list):
+        logger.info(
+            "estimate_message_tokens: list content with %d blocks", len(content)
+        )
+        measured_blocks = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "image":
+                logger.info("estimate_message_tokens: image block, using fixed cost")
+                image_tokens += IMAGE_BLOCK_TOKENS
+                continue
+            measured_blocks.append(block)
+        measured = json.dumps(measured_blocks, default=str)
+    else:
+        logger.info("estimate_message_tokens: scalar content")
+        measured = content if isinstance(content, str) else str(content)
+
+    tokens = (
+        int(len(measured) / CHARS_PER_TOKEN) + image_tokens + MESSAGE_OVERHEAD_TOKENS
+    )
+    MESSAGE_TOKEN_CACHE[content_hash] = tokens
+    logger.info("estimate_message_tokens: cache miss %s=%d", content_hash[:12], tokens)
+    return tokens
@@ -0,0 +1,101 @@
+from typing import Sequence
+
+from anthropic.types import MessageParam
+
+from services.messages.message_to_dict import message_to_dict
+from utils.logging.logging_config import logger
+from utils.objects.safe_get_attribute import safe_get_attribute
+
+
+def plan_message_trim(
+    messages: Sequence[MessageParam],
+    token_counts: Sequence[float],
+    token_input: float,
+    max_input: int,
+):
+    """Pick the whole cut set in one pass using per-message token_counts (parallel to messages) instead of re-counting after every removal.
+
+    Removal order is the same as the old one-at-a-time loop: the first removable message wins each round, system messages and a leading user message are kept, and an assistant tool_use is dropped together with the next message when that message carries the matching tool_result.
+
+    Returns (kept_messages, estimated_tokens)."""
+    messages = list(messages)
+    counts = list(token_counts)
+    estimated = token_input
+
+    while estimated > max_input and len(messages) > 1:
+        logger.info("trim: scanning %d messages for removable candidate", len(messages))
+        cut = None
+        for i, msg in enumerate(messages):
+            msg_dict = message_to_dict(msg)
+            role = safe_get_attribute(msg_dict, "role", "")
+
+            if role == "system":
+                logger.info("trim: msg[%d] role=system, skipping", i)
+                continue
+
+            if i == 0 and role == "user":
+                logger.info("trim: msg[%d] first user, skipping", i)
+                continue
+
+            tool_use_id = None
+            if role == "assistant" and i + 1 < len(messages):
+                logger.info("trim: msg[%d] inspecting assistant content", i)
+                content = safe_get_attribute(msg_dict, "content", [])
+                if not isinstance(content, list):
+                    logger.info(
+                        "trim: msg[%d] assistant non-list content; removing single", i
+                    )
+                    cut = slice(i, i + 1)
+                    break
+
+                for block in content:
+                    if isinstance(block, dict) and block.get("type") == "tool_use":
+                        logger.info("trim: msg[%d] found tool_use block", i)
+                        tool_use_id = block.get("id")
+                        break
+
+            if not tool_use_id or i + 1 >= len(messages):
+                logger.info("trim: msg[%d] no tool pair; removing single", i)
+                cut = slice(i, i + 1)
+                break
+
+            next_msg = message_to_dict(messages[i + 1])
+            next_content = safe_get_attribute(next_msg, "content", [])
+
+            if not isinstance(next_content, list):
+                logger.info("trim: msg[%d] next content non-list; removing single", i)
+                cut = slice(i, i + 1)
+                break
+
+            has_matching_tool_result = False
+            for block in next_content:
+                if (
+                    isinstance(block, dict)
+                    and block.get("type") == "tool_result"
+                    and block.get("tool_use_id") == tool_use_id
+                ):
+                    logger.info("trim: msg[%d] matching tool_result found", i)
+                    has_matching_tool_result = True
+                    break
+
+            if has_matching_tool_result:
+                logger.info("trim: msg[%d] removing tool_use/result pair", i)
+                cut = slice(i, i + 2)
+            else:
+                logger.info("trim: msg[%d] no matching result; removing single", i)
+                cut = slice(i, i + 1)
+            break
+
+        if cut is None:
+            logger.info("trim: no removable candidate left")
+            break
+
+        estimated -= sum(counts[cut])
+        del messages[cut]
+        del counts[cut]
+        logger.info("trim: after removal len=%d estimated=%d", len(messages), estimated)
+
+    logger.info(
+        "plan_message_trim: returning len=%d estimated=%d", len(messages), estimated
+    )
+    return messages, estimated
@@ -0,0 +1,76 @@
+import pytest
+
+from services.messages.estimate_message_tokens import (
+    IMAGE_BLOCK_TOKENS,
+    MESSAGE_OVERHEAD_TOKENS,
+    MESSAGE_TOKEN_CACHE,
+    estimate_message_tokens,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    MESSAGE_TOKEN_CACHE.clear()
+    yield
+    MESSAGE_TOKEN_CACHE.clear()
+
+
+def test_string_content():
+    result = estimate_message_tokens({"role": "user", "content": "a" * 350})
+    assert result == 100 + MESSAGE_OVERHEAD_TOKENS
+
+
+def test_list_content_measures_serialized_blocks():
+    block = {"type": "text", "text": "b" * 700}
+    message = {"role": "assistant", "content": [block]}
+    result = estimate_message_tokens(message)
+    serialized_len = len('[{"type": "text", "text": "' + "b" * 700 + '"}]')
+    assert result == int(serialized_len / 3.5) + MESSAGE_OVERHEAD_TOKENS
+
+
+def test_image_block_uses_fixed_cost():
+    message = {
+        "role": "user",
+        "content": [
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/png",
+                    "data": "x" * 100_000,
+                },
+            }
+        ],
+    }
+    result = estimate_message_tokens(message)
+    assert result == IMAGE_BLOCK_TOKENS + int(len("[]") / 3.5) + MESSAGE_OVERHEAD_TOKENS
+
+
+def test_equal_messages_share_cache_entry():
+    first = {"role": "user", "content": "same"}
+    second = {"role": "user", "content": "same"}
+    estimate_message_tokens(first)
+    estimate_message_tokens(second)
+    assert len(MESSAGE_TOKEN_CACHE) == 1
+
+
+def test_cache_hit_returns_stored_value():
+    message = {"role": "user", "content": "hello"}
+    estimate_message_tokens(message)
+    key = next(iter(MESSAGE_TOKEN_CACHE))
+    MESSAGE_TOKEN_CACHE[key] = 12345
+    assert estimate_message_tokens(message) == 12345
+
+
+def test_role_is_part_of_the_key():
+    estimate_message_tokens({"role": "user", "content": "x"})
+    estimate_message_tokens({"role": "assistant", "content": "x"})
+    assert len(MESSAGE_TOKEN_CACHE) == 2
+
+
+def test_message_object_is_converted():
+    class Message:
+        role = "user"
+        content = "a" * 35
+
+    assert estimate_message_tokens(Message()) == 10 + MESSAGE_OVERHEAD_TOKENS
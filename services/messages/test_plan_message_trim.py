@@ -0,0 +1,75 @@
+from typing import Any, cast
+
+from anthropic.types import MessageParam
+
+from services.messages.plan_message_trim import plan_message_trim
+
+
+def make_message(role, content="test"):
+    return cast(MessageParam, {"role": role, "content": content})
+
+
+def make_tool_pair(tool_id):
+    content: list[Any] = [{"type": "tool_use", "id": tool_id, "name": "t", "input": {}}]
+    return [
+        cast(MessageParam, {"role": "assistant", "content": content}),
+        cast(
+            MessageParam,
+            {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": tool_id, "content": "r"}
+                ],
+            },
+        ),
+    ]
+
+
+def test_under_budget_keeps_everything():
+    messages = [make_message("user"), make_message("assistant")]
+    kept, estimated = plan_message_trim(messages, [10, 10], 20, 100)
+    assert kept == messages
+    assert estimated == 20
+
+
+def test_cuts_oldest_until_estimate_fits():
+    messages = [
+        make_message("user", "first"),
+        make_message("assistant", "a"),
+        make_message("user", "b"),
+        make_message("assistant", "c"),
+    ]
+    kept, estimated = plan_message_trim(messages, [10, 50, 50, 10], 120, 30)
+    assert kept == [messages[0], messages[3]]
+    assert estimated == 20
+
+
+def test_tool_pair_removed_together():
+    pair = make_tool_pair("t1")
+    messages = [make_message("user", "first"), *pair, make_message("user", "last")]
+    kept, estimated = plan_message_trim(messages, [10, 30, 30, 10], 80, 50)
+    assert kept == [messages[0], messages[3]]
+    assert estimated == 20
+
+
+def test_system_and_first_user_survive():
+    messages = [make_message("system"), make_message("user"), make_message("user")]
+    kept, estimated = plan_message_trim(messages, [10, 10, 10], 30, 0)
+    assert kept == [messages[0]]
+    assert estimated == 10
+
+
+def test_stops_when_nothing_removable():
+    messages = [make_message("system", "a"), make_message("system", "b")]
+    kept, estimated = plan_message_trim(messages, [10, 10], 20, 0)
+    assert kept == messages
+    assert estimated == 20
+
+
+def test_input_list_not_mutated():
+    messages = [make_message("user", "first"), make_message("assistant", "a")]
+    original = list(messages)
+    counts = [10, 10]
+    plan_message_trim(messages, counts, 20, 10)
+    assert messages == original
+    assert counts == [10, 10]
@@ -53,6 +53,17 @@ class MessageObject:
         self.content = content
 
 
+def make_counters(messages, weights):
+    """Build an additive server-side counter and a matching local estimator from per-message weights."""
+    by_id = {id(msg): weight for msg, weight in zip(messages, weights)}
+
+    def estimate(msg):
+        return by_id[id(msg)]
+
+    count_fn = Mock(side_effect=lambda msgs: sum(estimate(m) for m in msgs))
+    return count_fn, estimate
+
+
 @pytest.fixture
 def count_fn():
     """Default token counter: 1000 tokens per message."""
@@ -141,15 +152,19 @@ def test_preserves_first_user_message():
         make_message("user", "second"),
     ]
 
-    def progressive(msgs):
-        return 5000 if len(msgs) >= 3 else 800
+    count_fn, estimate = make_counters(messages, [400, 4200, 400])
 
     trimmed, _ = trim_messages_to_token_limit(
-        messages, max_input=1000, count_tokens_fn=progressive
+        messages,
+        max_input=1000,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
     )
     assert len(trimmed) == 2
     assert trimmed[0] == make_message("user", "first")
     assert trimmed[1] == make_message("user", "second")
+    # One count up front, one to confirm the planned cut.
+    assert count_fn.call_count == 2
 
 
 def test_tool_use_and_result_paired_trimming():
@@ -161,14 +176,18 @@ def test_tool_use_and_result_paired_trimming():
         make_message("user", "follow up"),
     ]
 
-    def progressive(msgs):
-        return 5000 if len(msgs) >= 4 else 1000
+    count_fn, estimate = make_counters(messages, [500, 2000, 2000, 500])
 
     trimmed, _ = trim_messages_to_token_limit(
-        messages, max_input=2000, count_tokens_fn=progressive
+        messages,
+        max_input=2000,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
     )
     assert len(trimmed) == 2
     assert trimmed == [messages[0], messages[3]]
+    # One count up front, one to confirm the planned cut.
+    assert count_fn.call_count == 2
 
 
 def test_tool_use_without_matching_result():
@@ -179,14 +198,18 @@ def test_tool_use_without_matching_result():
         make_message("user", "different message"),
     ]
 
-    def progressive(msgs):
-        return 5000 if len(msgs) >= 3 else 800
+    count_fn, estimate = make_counters(messages, [400, 4200, 400])
 
     trimmed, _ = trim_messages_to_token_limit(
-        messages, max_input=1000, count_tokens_fn=progressive
+        messages,
+        max_input=1000,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
     )
     assert len(trimmed) == 2
     assert trimmed == [messages[0], messages[2]]
+    # One count up front, one to confirm the planned cut.
+    assert count_fn.call_count == 2
 
 
 def test_tool_use_with_non_matching_result():
@@ -197,14 +220,18 @@ def test_tool_use_with_non_matching_result():
         make_tool_result_message("different_id"),
     ]
 
-    def progressive(msgs):
-        return 5000 if len(msgs) >= 3 else 800
+    count_fn, estimate = make_counters(messages, [400, 4200, 400])
 
     trimmed, _ = trim_messages_to_token_limit(
-        messages, max_input=1000, count_tokens_fn=progressive
+        messages,
+        max_input=1000,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
     )
     assert len(trimmed) == 2
     assert trimmed == [messages[0], messages[2]]
+    # One count up front, one to confirm the planned cut.
+    assert count_fn.call_count == 2
 
 
 def test_assistant_message_with_non_list_content():
@@ -215,14 +242,18 @@ def test_assistant_message_with_non_list_content():
         make_message("user", "follow up"),
     ]
 
-    def progressive(msgs):
-        return 5000 if len(msgs) >= 3 else 800
+    count_fn, estimate = make_counters(messages, [400, 4200, 400])
 
     trimmed, _ = trim_messages_to_token_limit(
-        messages, max_input=1000, count_tokens_fn=progressive
+        messages,
+        max_input=1000,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
     )
     assert len(trimmed) == 2
     assert trimmed == [messages[0], messages[2]]
+    # One count up front, one to confirm the planned cut.
+    assert count_fn.call_count == 2
 
 
 def test_message_object_conversion(count_fn):
@@ -271,16 +302,72 @@ def test_complex_tool_chain_trimming():
         make_message("user", "final"),
     ]
 
-    def progressive(msgs):
-        length = len(msgs)
-        if length >= 6:
-            return 6000
-        if length >= 4:
-            return 4000
-        return 2000
+    count_fn, estimate = make_counters(messages, [500, 1250, 1250, 1250, 1250, 500])
 
     trimmed, _ = trim_messages_to_token_limit(
-        messages, max_input=3000, count_tokens_fn=progressive
+        messages,
+        max_input=3000,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
     )
     assert len(trimmed) == 2
     assert trimmed == [messages[0], messages[5]]
+    # One count up front, one to confirm the planned cut.
+    assert count_fn.call_count == 2
+
+
+def test_long_conversation_counts_twice():
+    """A 40-pair tool conversation over budget is cut with one initial count and one confirmation, not one count per removed pair."""
+    messages = [make_message("user", "initial")]
+    for i in range(40):
+        messages.append(make_tool_use_message("assistant", f"tool{i}"))
+        messages.append(make_tool_result_message(f"tool{i}", "x" * 500))
+    count_fn, estimate = make_counters(messages, [100] + [1000] * 80)
+
+    trimmed, token_count = trim_messages_to_token_limit(
+        messages,
+        max_input=10_100,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=estimate,
+    )
+
+    assert trimmed == [messages[0]] + messages[-10:]
+    assert token_count == 10_100
+    assert count_fn.call_count == 2
+
+
+def test_recalibrates_when_estimate_undercuts():
+    """When the local estimator overrates the oldest messages, the planned cut saves less than expected and the confirmation is still over budget, so the estimator is recalibrated against that count and a second plan runs."""
+    messages = [
+        make_message("user", "first"),
+        make_message("assistant", "a"),
+        make_message("user", "b"),
+        make_message("assistant", "c"),
+        make_message("user", "d"),
+    ]
+    count_fn, _ = make_counters(messages, [100, 100, 100, 1000, 1000])
+
+    trimmed, token_count = trim_messages_to_token_limit(
+        messages,
+        max_input=1500,
+        count_tokens_fn=count_fn,
+        estimate_tokens_fn=lambda msg: 1,
+    )
+
+    assert trimmed == [messages[0], messages[4]]
+    assert token_count == 1100
+    assert count_fn.call_count == 3
+
+
+def test_zero_count_skips_trimming():
+    """count_tokens_claude returns 0 on API failure; that must not trigger a trim."""
+    messages = [make_message("user"), make_message("assistant")]
+    count_fn = Mock(return_value=0)
+
+    trimmed, token_count = trim_messages_to_token_limit(
+        messages, max_input=1, count_tokens_fn=count_fn
+    )
+
+    assert trimmed == messages
+    assert token_count == 0
+    count_fn.assert_called_once_with(messages)
@@ -1,9 +1,11 @@
+from constants.aws import DEPENDENCY_CAS_SHARED_SCOPE
 from services.aws.s3.check_s3_dep_freshness_and_trigger_install import (
     check_s3_dep_freshness_and_trigger_install,
 )
 from services.aws.s3.get_dep_manifest_hash import get_dep_manifest_hash
 from services.node.detect_node_version import detect_node_version
 from services.node.detect_package_manager import detect_package_manager
+from services.supabase.npm_tokens.get_npm_token import get_npm_token
 from utils.error.handle_exceptions import handle_exceptions
 from utils.files.read_local_file import read_local_file
 from utils.logging.logging_config import logger
@@ -37,23 +39,32 @@ def ensure_node_packages(
     manifest_files = {"package.json": package_json_content}
 
     if npmrc_content:
+        logger.info("node: Uploading .npmrc with https registry")
         sanitized_npmrc = npmrc_content.replace(
             "http://registry.npmjs.org", "https://registry.npmjs.org"
         )
         manifest_files[".npmrc"] = sanitized_npmrc
 
     if lock_file_name and lock_file_content:
+        logger.info("node: Uploading %s", lock_file_name)
         manifest_files[lock_file_name] = lock_file_content
 
     # Upload version files so CodeBuild can see them
     nvmrc_content = read_local_file(".nvmrc", base_dir=clone_dir)
     if nvmrc_content:
+        logger.info("node: Uploading .nvmrc")
         manifest_files[".nvmrc"] = nvmrc_content
 
     node_version_content = read_local_file(".node-version", base_dir=clone_dir)
     if node_version_content:
+        logger.info("node: Uploading .node-version")
         manifest_files[".node-version"] = node_version_content
 
+    # CodeBuild installs with the owner's NPM_TOKEN when one is set, so the tarball may hold private packages; keep those builds out of the shared cache
+    npm_token = get_npm_token(platform="github", owner_id=owner_id)
+    cas_scope = str(owner_id) if npm_token else DEPENDENCY_CAS_SHARED_SCOPE
+    logger.info("node: tarball cache scope=%s", cas_scope)
+
     return check_s3_dep_freshness_and_trigger_install(
         owner_name=owner_name,
         repo_name=repo_name,
@@ -64,4 +75,5 @@ def ensure_node_packages(
         manifest_files=manifest_files,
         log_prefix="node",
         node_version=node_version,
+        cas_scope=cas_scope,
     )
@@ -1,11 +1,20 @@
 # pyright: reportUnusedVariable=false
+# pylint: disable=redefined-outer-name
 from unittest.mock import patch
 
+import pytest
+
 from services.node.ensure_node_packages import ensure_node_packages
 
 MODULE = "services.node.ensure_node_packages"
 
 
+@pytest.fixture(autouse=True)
+def mock_get_npm_token():
+    with patch(f"{MODULE}.get_npm_token", return_value=None) as mock:
+        yield mock
+
+
 def test_returns_false_when_no_package_json():
     with patch(f"{MODULE}.read_local_file") as mock_get:
         mock_get.return_value = None
@@ -55,6 +64,7 @@ def test_calls_shared_function_with_correct_args():
                             },
                             log_prefix="node",
                             node_version="22",
+                            cas_scope="shared",
                         )
 
 
@@ -85,7 +95,27 @@ def test_sanitizes_http_to_https_in_npmrc():
                         )
 
                         manifest_files = mock_check.call_args.kwargs["manifest_files"]
-                        assert "https://registry.npmjs.org/" in manifest_files[".npmrc"]
-                        assert (
-                            "http://registry.npmjs.org/" not in manifest_files[".npmrc"]
+                        assert manifest_files[".npmrc"] == (
+                            "registry=https://registry.npmjs.org/"
                         )
+
+
+def test_scopes_tarball_to_owner_with_npm_token(mock_get_npm_token):
+    mock_get_npm_token.return_value = "npm_secret"
+    with patch(f"{MODULE}.read_local_file") as mock_get:
+        mock_get.side_effect = ['{"name": "test"}', None, None, None]
+        with patch(f"{MODULE}.detect_node_version", return_value="22"), patch(
+            f"{MODULE}.detect_package_manager", return_value=("npm", None, None)
+        ), patch(f"{MODULE}.get_dep_manifest_hash", return_value="abc123"), patch(
+            f"{MODULE}.check_s3_dep_freshness_and_trigger_install",
+            return_value=True,
+        ) as mock_check:
+            ensure_node_packages(
+                owner_id=123,
+                clone_dir="/tmp/clone",
+                owner_name="owner",
+                repo_name="repo",
+            )
+
+    mock_get_npm_token.assert_called_once_with(platform="github", owner_id=123)
+    assert mock_check.call_args.kwargs["cas_scope"] == "123"
@@ -1,11 +1,10 @@
 import glob
 import os
-import subprocess
 from dataclasses import dataclass, field
 
-from constants.aws import SUBPROCESS_TIMEOUT_SECONDS
 from constants.files import PHP_TEST_FILE_EXTENSIONS
 from services.types.base_args import BaseArgs
+from utils.command.run_subprocess_async import run_subprocess_async
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -64,14 +63,7 @@ async def run_phpunit_test(
     logger.info("phpunit: Running %s...", ", ".join(php_test_files))
     all_errors: list[str] = []
     error_files: set[str] = set()
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT_SECONDS,
-        check=False,
-        cwd=clone_dir,
-    )
+    result = await run_subprocess_async(cmd, cwd=clone_dir)
     if result.returncode != 0:
         output = result.stdout + result.stderr
         # PHPUnit prints "OK" when all tests pass, even with non-zero exit (e.g., deprecation warnings)
@@ -8,7 +8,7 @@ from services.phpunit.run_phpunit_test import run_phpunit_test
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_success(
     mock_exists, mock_subprocess, create_test_base_args
@@ -86,7 +86,7 @@ async def test_run_phpunit_test_no_binary(mock_exists, create_test_base_args):
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_with_failures(
     mock_exists, mock_subprocess, create_test_base_args
@@ -120,7 +120,7 @@ async def test_run_phpunit_test_with_failures(
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_exit_code_nonzero_but_ok(
     mock_exists, mock_subprocess, create_test_base_args
@@ -154,7 +154,7 @@ async def test_run_phpunit_test_exit_code_nonzero_but_ok(
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_multiple_failures(
     mock_exists, mock_subprocess, create_test_base_args
@@ -189,7 +189,7 @@ async def test_run_phpunit_test_multiple_failures(
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_one_of_three_fails(
     mock_exists, mock_subprocess, create_test_base_args
@@ -228,7 +228,7 @@ async def test_run_phpunit_test_one_of_three_fails(
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_all_three_fail(
     mock_exists, mock_subprocess, create_test_base_args
@@ -267,7 +267,7 @@ async def test_run_phpunit_test_all_three_fail(
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_uses_bootstrap_when_no_config(
     mock_exists, mock_subprocess, create_test_base_args
@@ -301,7 +301,7 @@ async def test_run_phpunit_test_uses_bootstrap_when_no_config(
 
 
 @pytest.mark.asyncio
-@patch("services.phpunit.run_phpunit_test.subprocess.run")
+@patch("services.phpunit.run_phpunit_test.run_subprocess_async")
 @patch("services.phpunit.run_phpunit_test.os.path.exists")
 async def test_run_phpunit_test_suppresses_deprecation_warnings(
     mock_exists, mock_subprocess, create_test_base_args
@@ -0,0 +1,21 @@
+from services.prettier.run_prettier_fix_batch import PrettierResult
+from utils.logging.logging_config import logger
+
+
+def merge_prettier_output(
+    original_contents: dict[str, str], prettier_results: dict[str, PrettierResult]
+):
+    """Return {path: content} to lint after run_prettier_fix_batch: Prettier's output where it formatted the file without error, the original content otherwise."""
+    formatted_contents: dict[str, str] = {}
+    for file_path, content in original_contents.items():
+        result = prettier_results.get(file_path)
+        if result and not result.error and result.content:
+            logger.debug("merge_prettier_output: using formatted %s", file_path)
+            formatted_contents[file_path] = result.content
+        else:
+            logger.debug("merge_prettier_output: keeping original %s", file_path)
+            formatted_contents[file_path] = content
+    logger.info(
+        "merge_prettier_output: %d files ready for ESLint", len(formatted_contents)
+    )
+    return formatted_contents
@@ -0,0 +1,126 @@
+import os
+from dataclasses import dataclass
+
+from config import UTF8
+from services.node.get_npm_cache_dir import set_npm_cache_env
+from services.prettier.get_prettier_config import get_prettier_config
+from services.types.base_args import BaseArgs
+from utils.command.run_subprocess_async import run_subprocess_async
+from utils.env.passthrough_env_for_subprocess import passthrough_env_for_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+PRETTIER_EXTENSIONS = (
+    ".js",
+    ".jsx",
+    ".ts",
+    ".tsx",
+    ".json",
+    ".css",
+    ".scss",
+    ".md",
+    ".yaml",
+    ".yml",
+)
+
+
+@dataclass
+class PrettierResult:
+    success: bool
+    content: str | None
+    error: str | None
+
+
+@handle_exceptions(default_return_value={}, raise_on_error=False)
+async def run_prettier_fix_batch(*, base_args: BaseArgs, files: dict[str, str]):
+    """Format every file in files ({path: content}) with a single `prettier --write` process and return {path: PrettierResult}.
+
+    Files that are skipped (empty, unsupported extension, no Prettier config) get PrettierResult(success=True, content=None, error=None), same as run_prettier_fix.
+    """
+    results: dict[str, PrettierResult] = {}
+    to_format: list[str] = []
+    for file_path, file_content in files.items():
+        if not file_content.strip():
+            logger.info("Prettier: Skipping %s - empty content", file_path)
+            results[file_path] = PrettierResult(success=True, content=None, error=None)
+        elif not file_path.endswith(PRETTIER_EXTENSIONS):
+            logger.info(
+                "Prettier: Skipping %s - not a Prettier-supported file", file_path
+            )
+            results[file_path] = PrettierResult(success=True, content=None, error=None)
+        else:
+            logger.debug("Prettier: queueing %s", file_path)
+            to_format.append(file_path)
+
+    if not to_format:
+        logger.info("Prettier: Nothing to format")
+        return results
+
+    if not get_prettier_config(base_args):
+        logger.info("Prettier: Skipping %d files - no Prettier config", len(to_format))
+        for file_path in to_format:
+            results[file_path] = PrettierResult(success=True, content=None, error=None)
+        return results
+
+    clone_dir = base_args.get("clone_dir", "")
+
+    # Write to disk and use --write (alternative: stdin/stdout without file)
+    full_paths = {fp: os.path.join(clone_dir, fp) for fp in to_format}
+    for file_path, full_path in full_paths.items():
+        # For new files in new directories
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w", encoding=UTF8) as f:
+            f.write(files[file_path])
+
+    env = passthrough_env_for_subprocess()
+    set_npm_cache_env(env)
+
+    # --yes: fallback to download if not in node_modules
+    result = await run_subprocess_async(
+        ["npx", "--yes", "prettier", "--write", *full_paths.values()],
+        cwd=clone_dir,
+        env=env,
+    )
+
+    errors: dict[str, str] = {}
+    if result.returncode != 0:
+        error_msg = result.stderr.strip() or result.stdout.strip()
+        # Prettier keeps formatting the other files after a parse error and reports each failure as "[error] <path>: <message>" followed by "[error]" code-frame lines, so split the output back per file.
+        blocks: dict[str, list[str]] = {}
+        current = ""
+        for line in error_msg.splitlines():
+            for file_path, full_path in full_paths.items():
+                if line.startswith((f"[error] {full_path}:", f"[error] {file_path}:")):
+                    logger.debug("Prettier: error block for %s", file_path)
+                    current = file_path
+                    break
+            if current:
+                logger.debug("Prettier: attributing line to %s", current)
+                blocks.setdefault(current, []).append(line)
+
+        if len(to_format) == 1 or not blocks:
+            logger.warning(
+                "Prettier failed for %s: %s", ", ".join(to_format), error_msg
+            )
+            errors = {fp: error_msg for fp in to_format}
+        else:
+            logger.warning("Prettier failed for %s", ", ".join(blocks))
+            errors = {fp: "\n".join(lines) for fp, lines in blocks.items()}
+
+    for file_path, full_path in full_paths.items():
+        if file_path in errors:
+            logger.info("Prettier: %s failed", file_path)
+            results[file_path] = PrettierResult(
+                success=False, content=None, error=errors[file_path]
+            )
+            continue
+
+        with open(full_path, "r", encoding=UTF8) as f:
+            fixed_content = f.read()
+        logger.info("Prettier: Successfully formatted %s", file_path)
+        results[file_path] = PrettierResult(
+            success=True, content=fixed_content, error=None
+        )
+
+    logger.info("Prettier: %d results", len(results))
+    return results
@@ -189,3 +189,32 @@ def test_get_prettier_config_handles_json_decode_error(create_test_base_args):
         result = get_prettier_config(base_args)
 
         assert result is None
+
+
+def test_get_prettier_config_caches_until_config_changes(
+    create_test_base_args, tmp_path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+    config_path = tmp_path / ".prettierrc"
+    config_path.write_text('{"semi": false}', encoding="utf-8")
+
+    with patch(
+        "services.prettier.get_prettier_config.read_local_file",
+        side_effect=lambda file_name, base_dir: (
+            config_path.read_text(encoding="utf-8")
+            if file_name == ".prettierrc"
+            else None
+        ),
+    ) as mock_read:
+        first = get_prettier_config(base_args)
+        second = get_prettier_config(base_args)
+        assert mock_read.call_count == 1
+
+        config_path.write_text('{"semi": true, "tabWidth": 4}', encoding="utf-8")
+        third = get_prettier_config(base_args)
+
+    assert first == second == {"filename": ".prettierrc", "content": '{"semi": false}'}
+    assert third == {
+        "filename": ".prettierrc",
+        "content": '{"semi": true, "tabWidth": 4}',
+    }
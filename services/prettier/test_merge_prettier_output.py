@@ -0,0 +1,27 @@
+from services.prettier.merge_prettier_output import merge_prettier_output
+from services.prettier.run_prettier_fix_batch import PrettierResult
+
+
+def test_uses_prettier_output_only_when_it_succeeded():
+    original = {
+        "a.ts": "a",
+        "b.ts": "b",
+        "c.ts": "c",
+        "d.ts": "d",
+    }
+    results = {
+        "a.ts": PrettierResult(success=True, content="A", error=None),
+        "b.ts": PrettierResult(success=False, content="partial", error="boom"),
+        "c.ts": PrettierResult(success=True, content=None, error=None),
+    }
+
+    assert merge_prettier_output(original, results) == {
+        "a.ts": "A",
+        "b.ts": "b",
+        "c.ts": "c",
+        "d.ts": "d",
+    }
+
+
+def test_empty():
+    assert not merge_prettier_output({}, {})
@@ -12,13 +12,13 @@ from services.prettier.run_prettier_fix import run_prettier_fix
 async def test_run_prettier_fix_success(create_test_base_args):
     base_args = create_test_base_args()
     with patch(
-        "services.prettier.run_prettier_fix.get_prettier_config",
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
         return_value={"filename": ".prettierrc", "content": "{}"},
     ):
-        with patch("services.prettier.run_prettier_fix.os.makedirs"):
+        with patch("services.prettier.run_prettier_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open()):
                 with patch(
-                    "services.prettier.run_prettier_fix.subprocess.run"
+                    "services.prettier.run_prettier_fix_batch.run_subprocess_async"
                 ) as mock_run:
                     mock_run.return_value = MagicMock(returncode=0)
 
@@ -46,17 +46,17 @@ async def test_run_prettier_fix_sets_npm_cache_env_on_lambda(create_test_base_ar
         env["npm_config_cache"] = "/tmp/.npm"
 
     with patch(
-        "services.prettier.run_prettier_fix.get_prettier_config",
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
         return_value={"filename": ".prettierrc", "content": "{}"},
     ):
         with patch(
-            "services.prettier.run_prettier_fix.set_npm_cache_env",
+            "services.prettier.run_prettier_fix_batch.set_npm_cache_env",
             side_effect=mock_set_npm_cache_env,
         ):
-            with patch("services.prettier.run_prettier_fix.os.makedirs"):
+            with patch("services.prettier.run_prettier_fix_batch.os.makedirs"):
                 with patch("builtins.open", mock_open(read_data="formatted")):
                     with patch(
-                        "services.prettier.run_prettier_fix.subprocess.run"
+                        "services.prettier.run_prettier_fix_batch.run_subprocess_async"
                     ) as mock_run:
                         mock_run.return_value = MagicMock(returncode=0)
 
@@ -120,7 +120,8 @@ async def test_run_prettier_fix_unsupported_file(create_test_base_args):
 async def test_run_prettier_fix_skips_when_no_config(create_test_base_args):
     base_args = create_test_base_args()
     with patch(
-        "services.prettier.run_prettier_fix.get_prettier_config", return_value=None
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
+        return_value=None,
     ):
         coro = run_prettier_fix(
             base_args=base_args,
@@ -136,13 +137,13 @@ async def test_run_prettier_fix_skips_when_no_config(create_test_base_args):
 async def test_run_prettier_fix_subprocess_failure(create_test_base_args):
     base_args = create_test_base_args()
     with patch(
-        "services.prettier.run_prettier_fix.get_prettier_config",
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
         return_value={"filename": ".prettierrc", "content": "{}"},
     ):
-        with patch("services.prettier.run_prettier_fix.os.makedirs"):
+        with patch("services.prettier.run_prettier_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open()):
                 with patch(
-                    "services.prettier.run_prettier_fix.subprocess.run"
+                    "services.prettier.run_prettier_fix_batch.run_subprocess_async"
                 ) as mock_run:
                     mock_run.return_value = MagicMock(
                         returncode=1, stderr="Prettier failed"
@@ -163,13 +164,13 @@ async def test_run_prettier_fix_subprocess_failure(create_test_base_args):
 async def test_run_prettier_fix_timeout(create_test_base_args):
     base_args = create_test_base_args()
     with patch(
-        "services.prettier.run_prettier_fix.get_prettier_config",
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
         return_value={"filename": ".prettierrc", "content": "{}"},
     ):
-        with patch("services.prettier.run_prettier_fix.os.makedirs"):
+        with patch("services.prettier.run_prettier_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open()):
                 with patch(
-                    "services.prettier.run_prettier_fix.subprocess.run"
+                    "services.prettier.run_prettier_fix_batch.run_subprocess_async"
                 ) as mock_run:
                     mock_run.side_effect = subprocess.TimeoutExpired(
                         cmd="npx prettier", timeout=SUBPROCESS_TIMEOUT_SECONDS
@@ -205,13 +206,13 @@ async def test_run_prettier_fix_timeout(create_test_base_args):
 async def test_run_prettier_fix_supported_extensions(create_test_base_args, file_path):
     base_args = create_test_base_args()
     with patch(
-        "services.prettier.run_prettier_fix.get_prettier_config",
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
         return_value={"filename": ".prettierrc", "content": "{}"},
     ):
-        with patch("services.prettier.run_prettier_fix.os.makedirs"):
+        with patch("services.prettier.run_prettier_fix_batch.os.makedirs"):
             with patch("builtins.open", mock_open(read_data="formatted")):
                 with patch(
-                    "services.prettier.run_prettier_fix.subprocess.run"
+                    "services.prettier.run_prettier_fix_batch.run_subprocess_async"
                 ) as mock_run:
                     mock_run.return_value = MagicMock(returncode=0)
 
@@ -0,0 +1,138 @@
+# pylint: disable=unused-argument
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.prettier.run_prettier_fix_batch import (
+    PrettierResult,
+    run_prettier_fix_batch,
+)
+
+
+@pytest.mark.asyncio
+async def test_run_prettier_fix_batch_formats_all_files_in_one_process(
+    create_test_base_args, tmp_path: Path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+
+    async def fake_prettier(args, **kwargs):
+        for full_path in args[4:]:
+            Path(full_path).write_text("formatted\n", encoding="utf-8")
+        return MagicMock(returncode=0, stdout="", stderr="")
+
+    with patch(
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
+        return_value={"filename": ".prettierrc", "content": "{}"},
+    ), patch(
+        "services.prettier.run_prettier_fix_batch.run_subprocess_async",
+        side_effect=fake_prettier,
+    ) as mock_run:
+        results = await run_prettier_fix_batch(
+            base_args=base_args,
+            files={
+                "src/a.ts": "const a=1",
+                "src/nested/b.ts": "const b=1",
+                "README.txt": "not formatted",
+            },
+        )
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args[0][0] == [
+        "npx",
+        "--yes",
+        "prettier",
+        "--write",
+        str(tmp_path / "src/a.ts"),
+        str(tmp_path / "src/nested/b.ts"),
+    ]
+    assert results == {
+        "src/a.ts": PrettierResult(success=True, content="formatted\n", error=None),
+        "src/nested/b.ts": PrettierResult(
+            success=True, content="formatted\n", error=None
+        ),
+        "README.txt": PrettierResult(success=True, content=None, error=None),
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_prettier_fix_batch_attributes_errors_per_file(
+    create_test_base_args, tmp_path: Path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+    bad_path = tmp_path / "src/bad.ts"
+    stderr = (
+        f"[error] {bad_path}: SyntaxError: Unexpected token (1:7)\n"
+        "[error] > 1 | const = 1\n"
+        "[error]     |       ^"
+    )
+
+    async def fake_prettier(args, **kwargs):
+        (tmp_path / "src/good.ts").write_text("const x = 1;\n", encoding="utf-8")
+        return MagicMock(returncode=2, stdout="", stderr=stderr)
+
+    with patch(
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
+        return_value={"filename": ".prettierrc", "content": "{}"},
+    ), patch(
+        "services.prettier.run_prettier_fix_batch.run_subprocess_async",
+        side_effect=fake_prettier,
+    ):
+        results = await run_prettier_fix_batch(
+            base_args=base_args,
+            files={"src/good.ts": "const x=1", "src/bad.ts": "const = 1"},
+        )
+
+    assert results["src/good.ts"] == PrettierResult(
+        success=True, content="const x = 1;\n", error=None
+    )
+    assert results["src/bad.ts"] == PrettierResult(
+        success=False, content=None, error=stderr
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_prettier_fix_batch_unattributed_error_fails_every_file(
+    create_test_base_args, tmp_path: Path
+):
+    base_args = create_test_base_args(clone_dir=str(tmp_path))
+
+    with patch(
+        "services.prettier.run_prettier_fix_batch.get_prettier_config",
+        return_value={"filename": ".prettierrc", "content": "{}"},
+    ), patch(
+        "services.prettier.run_prettier_fix_batch.run_subprocess_async",
+        return_value=MagicMock(returncode=1, stdout="", stderr="Cannot find module"),
+    ):
+        results = await run_prettier_fix_batch(
+            base_args=base_args,
+            files={"src/a.ts": "const a=1", "src/b.ts": "const b=1"},
+        )
+
+    assert results == {
+        "src/a.ts": PrettierResult(
+            success=False, content=None, error="Cannot find module"
+        ),
+        "src/b.ts": PrettierResult(
+            success=False, content=None, error="Cannot find module"
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_prettier_fix_batch_skips_subprocess_when_nothing_to_format(
+    create_test_base_args,
+):
+    base_args = create_test_base_args()
+    with patch(
+        "services.prettier.run_prettier_fix_batch.run_subprocess_async"
+    ) as mock_run:
+        results = await run_prettier_fix_batch(
+            base_args=base_args, files={"a.py": "x = 1", "b.ts": "  "}
+        )
+
+    mock_run.assert_not_called()
+    assert results == {
+        "a.py": PrettierResult(success=True, content=None, error=None),
+        "b.ts": PrettierResult(success=True, content=None, error=None),
+    }
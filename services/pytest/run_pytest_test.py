@@ -1,10 +1,9 @@
 import os
 import shutil
-import subprocess
 from dataclasses import dataclass, field
 
-from constants.aws import SUBPROCESS_TIMEOUT_SECONDS
 from services.types.base_args import BaseArgs
+from utils.command.run_subprocess_async import run_subprocess_async
 from utils.error.handle_exceptions import handle_exceptions
 from utils.files.is_python_test_file import is_python_test_file
 from utils.logging.logging_config import logger
@@ -66,14 +65,7 @@ async def run_pytest_test(
     )
     logger.info("pytest: Running %s...", ", ".join(py_test_files))
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT_SECONDS,
-        check=False,
-        cwd=clone_dir,
-    )
+    result = await run_subprocess_async(cmd, cwd=clone_dir)
 
     # Exit code 5 = no tests collected (e.g., test files removed), treat as success
     if result.returncode == 5:
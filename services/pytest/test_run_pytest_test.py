@@ -8,7 +8,7 @@ from services.pytest.run_pytest_test import run_pytest_test
 
 
 @pytest.mark.asyncio
-@patch("services.pytest.run_pytest_test.subprocess.run")
+@patch("services.pytest.run_pytest_test.run_subprocess_async")
 @patch("services.pytest.run_pytest_test.os.path.exists")
 async def test_run_pytest_test_success(
     mock_exists, mock_subprocess, create_test_base_args
@@ -82,7 +82,7 @@ async def test_run_pytest_test_no_binary(
 
 
 @pytest.mark.asyncio
-@patch("services.pytest.run_pytest_test.subprocess.run")
+@patch("services.pytest.run_pytest_test.run_subprocess_async")
 @patch("services.pytest.run_pytest_test.os.path.exists")
 async def test_run_pytest_test_with_failures(
     mock_exists, mock_subprocess, create_test_base_args
@@ -109,7 +109,7 @@ async def test_run_pytest_test_with_failures(
 
 
 @pytest.mark.asyncio
-@patch("services.pytest.run_pytest_test.subprocess.run")
+@patch("services.pytest.run_pytest_test.run_subprocess_async")
 @patch("services.pytest.run_pytest_test.os.path.exists")
 async def test_run_pytest_test_exit_code_5_no_tests(
     mock_exists, mock_subprocess, create_test_base_args
@@ -151,7 +151,7 @@ async def test_run_pytest_test_filters_non_python_files(create_test_base_args):
 
 
 @pytest.mark.asyncio
-@patch("services.pytest.run_pytest_test.subprocess.run")
+@patch("services.pytest.run_pytest_test.run_subprocess_async")
 @patch("services.pytest.run_pytest_test.os.path.exists")
 async def test_run_pytest_test_passes_importlib_mode(
     mock_exists, mock_subprocess, create_test_base_args
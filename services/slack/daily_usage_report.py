@@ -18,7 +18,9 @@ if os.environ.get("SUPABASE_SERVICE_ROLE_KEY_PRD"):
 from services.aws.get_enabled_schedules import get_enabled_schedules
 from services.slack.slack_notify import slack_notify
 from services.supabase.client import supabase
+from services.supabase.fetch_all_rows import fetch_all_rows
 from services.supabase.resolve_repo_keys import resolve_repo_keys
+from services.supabase.usage.get_prs_used_before import get_prs_used_before
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -27,7 +29,10 @@ PT = ZoneInfo("America/Los_Angeles")
 
 @handle_exceptions(default_return_value=None, raise_on_error=False)
 def generate_daily_usage_report():
-    """Query last 24h usage/credits/llm_requests, format by scheduled repos, post to Slack."""
+    """Query last 24h usage/credits/llm_requests, format by scheduled repos, post to Slack.
+
+    A fixed number of queries whatever the traffic: the window's usage, one lookup for which of its PRs were used earlier, and one each for credits and llm_requests. Everything else is aggregated in memory.
+    """
     now = datetime.now(tz=timezone.utc)
     window_start = now - timedelta(hours=24)
     twenty_four_hours_ago = window_start.isoformat()
@@ -38,102 +43,72 @@ def generate_daily_usage_report():
     scheduled_repos = resolve_repo_keys(repo_keys)
 
     # Usage rows in the last 24 hours
-    usage_result = (
-        supabase.table("usage")
+    usage_rows = fetch_all_rows(
+        lambda: supabase.table("usage")
         .select("id, owner_id, owner_name, repo_name, pr_number")
         .gte("created_at", twenty_four_hours_ago)
-        .execute()
+        .order("id")
     )
-    usage_rows = usage_result.data or []
     logger.debug("Loaded %d usage rows", len(usage_rows))
 
     # A PR counts only if its first-ever usage row (== when GitAuto first touched it) falls inside the 24h window. Runs on PRs that first appeared earlier are dropped entirely so yesterday's PRs don't leak into today's report.
-    pr_tuples = sorted(
-        {
-            (row["owner_name"], row["repo_name"], row["pr_number"])
-            for row in usage_rows
-            if row["pr_number"] and row["pr_number"] > 0
-        }
+    pr_tuples = {
+        (row["owner_name"], row["repo_name"], row["pr_number"])
+        for row in usage_rows
+        if row["pr_number"] and row["pr_number"] > 0
+    }
+    earlier_pr_tuples = get_prs_used_before(prs=pr_tuples, before=twenty_four_hours_ago)
+    logger.info(
+        "Excluding %d of %d PRs first used before the window: %s",
+        len(earlier_pr_tuples),
+        len(pr_tuples),
+        sorted(earlier_pr_tuples),
     )
-    eligible_pr_tuples: set[tuple[str, str, int]] = set()
-    for owner, repo, pr_num in pr_tuples:
-        first_row = (
-            supabase.table("usage")
-            .select("created_at")
-            .eq("owner_name", owner)
-            .eq("repo_name", repo)
-            .eq("pr_number", pr_num)
-            .order("created_at")
-            .limit(1)
-            .execute()
-        )
-        data = first_row.data or []
-        if not data:
-            logger.warning(
-                "No usage rows found for %s/%s#%s; excluding", owner, repo, pr_num
-            )
-            continue
-        first_created_at = datetime.fromisoformat(
-            data[0]["created_at"].replace("Z", "+00:00")
-        )
-        if first_created_at >= window_start:
-            logger.info(
-                "Keeping %s/%s#%s (first usage %s)",
-                owner,
-                repo,
-                pr_num,
-                first_created_at.isoformat(),
-            )
-            eligible_pr_tuples.add((owner, repo, pr_num))
-        else:
-            logger.info(
-                "Excluding %s/%s#%s (first usage %s, before window start)",
-                owner,
-                repo,
-                pr_num,
-                first_created_at.isoformat(),
-            )
 
     usage_rows = [
         row
         for row in usage_rows
         if not row["pr_number"]
         or row["pr_number"] <= 0
-        or (row["owner_name"], row["repo_name"], row["pr_number"]) in eligible_pr_tuples
+        or (row["owner_name"], row["repo_name"], row["pr_number"])
+        not in earlier_pr_tuples
     ]
-    usage_ids = [row["id"] for row in usage_rows]
+    usage_ids = {row["id"] for row in usage_rows}
     logger.info("After PR-creation filter: %d usage rows remain", len(usage_rows))
 
     # Revenue: paid inflows in window (purchases + auto_reload top-ups)
-    revenue_result = (
-        supabase.table("credits")
+    revenue_rows = fetch_all_rows(
+        lambda: supabase.table("credits")
         .select("owner_id, amount_usd")
         .in_("transaction_type", ["purchase", "auto_reload"])
         .gte("created_at", twenty_four_hours_ago)
-        .execute()
+        .order("id")
     )
     revenue_by_owner_id: dict[int, int] = {}
-    for row in revenue_result.data or []:
+    for row in revenue_rows:
         owner_id = row["owner_id"]
         revenue_by_owner_id[owner_id] = revenue_by_owner_id.get(owner_id, 0) + int(
             row["amount_usd"]
         )
 
-    # Cost: our LLM spend for usage rows in window
+    # Cost: our LLM spend for usage rows in window. An llm_requests row is written after its usage row, so every request of an in-window run is itself in the window; selecting by time instead of `usage_id IN (...)` keeps this one query however many runs there were.
     cost_by_usage_id: dict[int, float] = {}
     if usage_ids:
         logger.info("Fetching llm_requests for %d usage ids", len(usage_ids))
-        llm_result = (
-            supabase.table("llm_requests")
+        llm_rows = fetch_all_rows(
+            lambda: supabase.table("llm_requests")
             .select("usage_id, total_cost_usd")
-            .in_("usage_id", usage_ids)
-            .execute()
+            .gte("created_at", twenty_four_hours_ago)
+            .order("id")
         )
-        for row in llm_result.data or []:
+        for row in llm_rows:
             uid = row["usage_id"]
             if uid is None:
                 logger.warning("llm_requests row has no usage_id; skipping")
                 continue
+            if uid not in usage_ids:
+                logger.debug("llm_requests row for excluded usage %s; skipping", uid)
+                continue
             cost_by_usage_id[uid] = cost_by_usage_id.get(uid, 0.0) + float(
                 row["total_cost_usd"]
             )
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.slack.daily_usage_report import generate_daily_usage_report
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FakeQuery:
+    """Evaluates the postgrest builder calls the report makes against in-memory rows."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.filters: list = []
+        self.order_col: str | None = None
+        self.start = 0
+        self.end: int | None = None
+
+    @staticmethod
+    def value(col: str, v):
+        if col == "created_at" and isinstance(v, str):
+            return datetime.fromisoformat(v.replace("Z", "+00:00"))
+        return v
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def gte(self, col, v):
+        self.filters.append(lambda r: self.value(col, r[col]) >= self.value(col, v))
+        return self
+
+    def lt(self, col, v):
+        self.filters.append(lambda r: self.value(col, r[col]) < self.value(col, v))
+        return self
+
+    def eq(self, col, v):
+        self.filters.append(lambda r: r[col] == v)
+        return self
+
+    def in_(self, col, values):
+        self.filters.append(lambda r: r[col] in values)
+        return self
+
+    def order(self, col, **_kwargs):
+        self.order_col = col
+        return self
+
+    def limit(self, n):
+        self.end = self.start + n - 1
+        return self
+
+    def range(self, start, end):
+        self.start, self.end = start, end
+        return self
+
+    def execute(self):
+        rows = [r for r in self.rows if all(f(r) for f in self.filters)]
+        order_col = self.order_col
+        if order_col:
+            rows.sort(key=lambda r: self.value(order_col, r[order_col]))
+        end = len(rows) if self.end is None else self.end + 1
+        return Mock(data=[dict(r) for r in rows[self.start : end]])
+
+
+class FakeSupabase:
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = tables
+        self.queries: list[str] = []
+
+    def table(self, name: str):
+        self.queries.append(name)
+        return FakeQuery(self.tables[name])
+
+
+def run_report(fixture: dict, prs_supabase=None):
+    now = datetime.fromisoformat(fixture["now"])
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    fake = FakeSupabase(fixture["tables"])
+    scheduled = {tuple(key): None for key in fixture["scheduled_repos"]}
+    with patch("services.slack.daily_usage_report.datetime", FixedDatetime), patch(
+        "services.slack.daily_usage_report.supabase", fake
+    ), patch(
+        "services.supabase.usage.get_prs_used_before.supabase", prs_supabase or fake
+    ), patch(
+        "services.slack.daily_usage_report.get_enabled_schedules", return_value=set()
+    ), patch(
+        "services.slack.daily_usage_report.resolve_repo_keys", return_value=scheduled
+    ), patch(
+        "services.slack.daily_usage_report.slack_notify"
+    ) as mock_slack:
+        result = generate_daily_usage_report()
+    message = mock_slack.call_args.args[0] if mock_slack.called else None
+    return result, message, fake
+
+
+def test_slack_message_matches_fixture_byte_for_byte():
+    fixture = json.loads((FIXTURES / "daily_usage_report.json").read_text())
+    expected = (FIXTURES / "daily_usage_report.txt").read_text(encoding="utf-8")
+
+    result, message, fake = run_report(fixture)
+
+    # Recorded from the per-PR first-usage implementation this replaced
+    assert message == expected
+    assert result == {
+        "prs": 3,
+        "runs": 8,
+        "revenue_usd": 170,
+        "cost_usd": pytest.approx(8.4593),
+    }
+    # Window usage, earlier-usage lookup for all PRs at once, credits, llm_requests
+    assert fake.queries == ["usage", "usage", "credits", "llm_requests"]
+
+
+def test_query_count_does_not_grow_with_prs():
+    fixture = json.loads((FIXTURES / "daily_usage_report.json").read_text())
+    usage = fixture["tables"]["usage"]
+    for pr_number in range(100, 150):
+        usage.append(
+            {
+                "id": len(usage) + 1,
+                "owner_id": 11,
+                "owner_name": "acme",
+                "repo_name": "api",
+                "pr_number": pr_number,
+                "created_at": "2026-05-02T12:00:00+00:00",
+            }
+        )
+
+    result, _message, fake = run_report(fixture)
+
+    assert result["prs"] == 53
+    assert fake.queries == ["usage", "usage", "credits", "llm_requests"]
+
+
+def test_query_error_skips_posting():
+    fixture = json.loads((FIXTURES / "daily_usage_report.json").read_text())
+    failing = Mock()
+    failing.table.side_effect = RuntimeError("boom")
+
+    # The earlier-usage lookup fails; posting without it would count every PR as new
+    result, message, _fake = run_report(fixture, prs_supabase=failing)
+
+    assert result is None
+    assert message is None
@@ -0,0 +1,25 @@
+from schemas.supabase.types import CoverageSyncs
+from services.supabase.client import supabase
+from services.types.base_args import Platform
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def get_coverage_sync(*, platform: Platform, repo_id: int):
+    """Return the last commit/tree that sync_files_from_github_to_coverage synced into coverages for this repo, or None if it never ran."""
+    result = (
+        supabase.table("coverage_syncs")
+        .select("*")
+        .eq("platform", platform)
+        .eq("repo_id", repo_id)
+        .maybe_single()
+        .execute()
+    )
+
+    if result and result.data:
+        logger.info("get_coverage_sync: found for %s/%s", platform, repo_id)
+        return CoverageSyncs(**result.data)
+
+    logger.info("get_coverage_sync: no row for %s/%s", platform, repo_id)
+    return None
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock, patch
+
+from services.supabase.coverage_syncs.get_coverage_sync import get_coverage_sync
+
+
+@patch("services.supabase.coverage_syncs.get_coverage_sync.supabase")
+def test_get_coverage_sync_found(mock_supabase):
+    row = {
+        "id": 1,
+        "owner_id": 12345,
+        "repo_id": 123456,
+        "branch_name": "main",
+        "commit_sha": "c" * 40,
+        "tree_sha": "t" * 40,
+        "created_at": "2025-01-01T00:00:00Z",
+        "created_by": "system",
+        "updated_at": "2025-01-01T00:00:00Z",
+        "updated_by": "system",
+        "platform": "github",
+    }
+    query = mock_supabase.table.return_value.select.return_value
+    query.eq.return_value.eq.return_value.maybe_single.return_value.execute.return_value = MagicMock(
+        data=row
+    )
+
+    result = get_coverage_sync(platform="github", repo_id=123456)
+
+    assert result == row
+    mock_supabase.table.assert_called_once_with("coverage_syncs")
+    query.eq.assert_called_once_with("platform", "github")
+    query.eq.return_value.eq.assert_called_once_with("repo_id", 123456)
+
+
+@patch("services.supabase.coverage_syncs.get_coverage_sync.supabase")
+def test_get_coverage_sync_not_found(mock_supabase):
+    query = mock_supabase.table.return_value.select.return_value
+    # maybe_single().execute() returns None when no row matches
+    query.eq.return_value.eq.return_value.maybe_single.return_value.execute.return_value = (
+        None
+    )
+
+    assert get_coverage_sync(platform="github", repo_id=123456) is None
+
+
+@patch("services.supabase.coverage_syncs.get_coverage_sync.supabase")
+def test_get_coverage_sync_error_returns_none(mock_supabase):
+    mock_supabase.table.side_effect = Exception("db down")
+
+    assert get_coverage_sync(platform="github", repo_id=123456) is None
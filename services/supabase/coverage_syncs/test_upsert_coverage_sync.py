@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock, patch
+
+from schemas.supabase.types import CoverageSyncsInsert
+from services.supabase.coverage_syncs.upsert_coverage_sync import upsert_coverage_sync
+
+
+def _sync():
+    return CoverageSyncsInsert(
+        platform="github",
+        owner_id=12345,
+        repo_id=123456,
+        branch_name="main",
+        commit_sha="c" * 40,
+        tree_sha="t" * 40,
+        created_by="user",
+        updated_by="user",
+    )
+
+
+@patch("services.supabase.coverage_syncs.upsert_coverage_sync.supabase")
+def test_upsert_coverage_sync_keys_on_platform_and_repo(mock_supabase):
+    upsert = mock_supabase.table.return_value.upsert
+    upsert.return_value.execute.return_value = MagicMock(data=[{"id": 1}])
+
+    result = upsert_coverage_sync(sync=_sync())
+
+    assert result == [{"id": 1}]
+    mock_supabase.table.assert_called_once_with("coverage_syncs")
+    upsert.assert_called_once_with(dict(_sync()), on_conflict="platform,repo_id")
+
+
+@patch("services.supabase.coverage_syncs.upsert_coverage_sync.supabase")
+def test_upsert_coverage_sync_error_returns_none(mock_supabase):
+    mock_supabase.table.side_effect = Exception("db down")
+
+    assert upsert_coverage_sync(sync=_sync()) is None
@@ -0,0 +1,19 @@
+from schemas.supabase.types import CoverageSyncsInsert
+from services.supabase.client import supabase
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def upsert_coverage_sync(*, sync: CoverageSyncsInsert):
+    result = (
+        supabase.table("coverage_syncs")
+        .upsert(dict(sync), on_conflict="platform,repo_id")
+        .execute()
+    )
+    logger.info(
+        "upsert_coverage_sync: repo %s at tree %s",
+        sync["repo_id"],
+        sync.get("tree_sha"),
+    )
+    return result.data
@@ -0,0 +1,61 @@
+from constants.supabase import SUPABASE_UPSERT_BATCH_SIZE
+from schemas.supabase.types import Coverages, CoveragesInsert
+from services.supabase.client import supabase
+from services.types.base_args import Platform
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def bulk_exclude_from_testing(
+    *,
+    platform: Platform,
+    owner_id: int,
+    repo_id: int,
+    branch_name: str,
+    updated_by: str,
+    exclusions: list[tuple[str, str, str | None]],
+):
+    """Same row shape as exclude_from_testing, for many (full_path, exclusion_reason, impl_blob_sha) at once, upserted in batches of SUPABASE_UPSERT_BATCH_SIZE."""
+    if not exclusions:
+        logger.info("bulk_exclude_from_testing: no exclusions, skipping")
+        return None
+
+    records: list[CoveragesInsert] = [
+        {
+            "platform": platform,
+            "owner_id": owner_id,
+            "repo_id": repo_id,
+            "full_path": full_path,
+            "branch_name": branch_name,
+            "level": "file",
+            "created_by": updated_by,
+            "is_excluded_from_testing": True,
+            "exclusion_reason": exclusion_reason,
+            "updated_by": updated_by,
+            "impl_blob_sha": impl_blob_sha,
+        }
+        for full_path, exclusion_reason, impl_blob_sha in exclusions
+    ]
+    rows: list[Coverages] = []
+    for i in range(0, len(records), SUPABASE_UPSERT_BATCH_SIZE):
+        batch = records[i : i + SUPABASE_UPSERT_BATCH_SIZE]
+        result = (
+            supabase.table("coverages")
+            .upsert(
+                [dict(r) for r in batch],
+                on_conflict="platform,repo_id,full_path",
+                default_to_null=False,
+            )
+            .execute()
+        )
+        logger.info("bulk_exclude_from_testing: upserted batch of %d", len(batch))
+        rows.extend(result.data or [])
+
+    logger.info(
+        "bulk_exclude_from_testing: repo_id=%s platform=%s upserted %d exclusions",
+        repo_id,
+        platform,
+        len(records),
+    )
+    return rows
@@ -1,11 +1,13 @@
 from services.supabase.coverages.delete_coverages_by_paths import (
     delete_coverages_by_paths,
 )
-from services.supabase.coverages.get_all_coverages import get_all_coverages
+from services.supabase.coverages.iter_coverages import iter_coverages
 from services.types.base_args import Platform
+from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
 
+@handle_exceptions(default_return_value=None, raise_on_error=False)
 def delete_stale_coverages(
     *,
     platform: Platform,
@@ -13,23 +15,29 @@ def delete_stale_coverages(
     repo_id: int,
     current_files: set[str],
 ):
-    """Delete coverage records for files that no longer exist in the repository."""
-    all_records = get_all_coverages(
-        platform=platform, owner_id=owner_id, repo_id=repo_id
-    )
+    """Delete coverage records for files that no longer exist in the repository. Returns how many were deleted, or None when the delete failed."""
+    # Paths only: the stale check never looks at the other (large) columns
     stale_paths = [
-        record["full_path"]
-        for record in all_records
-        if record["full_path"] not in current_files
+        row["full_path"]
+        for row in iter_coverages(
+            platform=platform,
+            owner_id=owner_id,
+            repo_id=repo_id,
+            columns=["full_path"],
+        )
+        if row["full_path"] not in current_files
     ]
 
     if stale_paths:
-        delete_coverages_by_paths(
+        deleted = delete_coverages_by_paths(
             platform=platform,
             owner_id=owner_id,
             repo_id=repo_id,
             file_paths=stale_paths,
         )
+        if deleted is None:
+            logger.warning("Failed to delete %d stale coverages", len(stale_paths))
+            return None
         logger.info("Deleted %d stale coverage records", len(stale_paths))
 
     logger.info(
@@ -0,0 +1,61 @@
+from typing import Any, Sequence
+
+from services.supabase.client import supabase
+from services.types.base_args import Platform
+from utils.logging.logging_config import logger
+
+# PostgREST's max-rows cap on Supabase; a page this size may have more behind it
+PAGE_SIZE = 1000
+
+
+def iter_coverages(
+    *,
+    platform: Platform,
+    owner_id: int,
+    repo_id: int,
+    columns: Sequence[str] | None = None,
+    page_size: int = PAGE_SIZE,
+):
+    """Yield a repo's file-level coverage rows in full_path order, fetching one page at a time.
+
+    columns limits the select to those columns (full_path is always included); None selects "*". Pages are keyset-paginated with `full_path > last`, which is unique per repo, so each page is an index seek instead of an OFFSET that rescans every earlier row.
+    Errors propagate to the caller: a generator can't fall back to a default after it has yielded rows.
+    """
+    select = (
+        "*" if columns is None else ",".join(dict.fromkeys(["full_path", *columns]))
+    )
+    # Every path sorts after "", so the first page needs no special case
+    last_path = ""
+    pages = 0
+    while True:
+        result = (
+            supabase.table("coverages")
+            .select(select)
+            .eq("platform", platform)
+            .eq("owner_id", owner_id)
+            .eq("repo_id", repo_id)
+            .eq("level", "file")
+            .gt("full_path", last_path)
+            .order("full_path")
+            .limit(page_size)
+            .execute()
+        )
+        rows: list[dict[str, Any]] = result.data or []
+        pages += 1
+        yield from rows
+
+        if len(rows) < page_size:
+            logger.info(
+                "iter_coverages: %d page(s) of %s for %s/%s/%s",
+                pages,
+                select,
+                platform,
+                owner_id,
+                repo_id,
+            )
+            return
+
+        logger.debug(
+            "iter_coverages: full page, continuing after %s", rows[-1]["full_path"]
+        )
+        last_path = rows[-1]["full_path"]
@@ -0,0 +1,133 @@
+# pylint: disable=redefined-outer-name
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.supabase.coverages.bulk_exclude_from_testing import (
+    bulk_exclude_from_testing,
+)
+
+
+@pytest.fixture
+def mock_supabase():
+    with patch(
+        "services.supabase.coverages.bulk_exclude_from_testing.supabase"
+    ) as mock:
+        yield mock
+
+
+def test_upserts_all_exclusions_in_one_call(mock_supabase):
+    mock_result = MagicMock()
+    mock_result.data = [{"id": 1}, {"id": 2}]
+    mock_supabase.table.return_value.upsert.return_value.execute.return_value = (
+        mock_result
+    )
+
+    result = bulk_exclude_from_testing(
+        platform="github",
+        owner_id=123,
+        repo_id=456,
+        branch_name="main",
+        updated_by="test_user",
+        exclusions=[
+            ("README.md", "not code file", None),
+            ("src/index.ts", "only exports", None),
+            ("src/constants.ts", "no testable logic", "abc123"),
+        ],
+    )
+
+    assert result == mock_result.data
+    mock_supabase.table.assert_called_once_with("coverages")
+    common = {
+        "platform": "github",
+        "owner_id": 123,
+        "repo_id": 456,
+        "branch_name": "main",
+        "level": "file",
+        "created_by": "test_user",
+        "is_excluded_from_testing": True,
+        "updated_by": "test_user",
+    }
+    mock_supabase.table.return_value.upsert.assert_called_once_with(
+        [
+            {
+                **common,
+                "full_path": "README.md",
+                "exclusion_reason": "not code file",
+                "impl_blob_sha": None,
+            },
+            {
+                **common,
+                "full_path": "src/index.ts",
+                "exclusion_reason": "only exports",
+                "impl_blob_sha": None,
+            },
+            {
+                **common,
+                "full_path": "src/constants.ts",
+                "exclusion_reason": "no testable logic",
+                "impl_blob_sha": "abc123",
+            },
+        ],
+        on_conflict="platform,repo_id,full_path",
+        default_to_null=False,
+    )
+
+
+def test_upserts_in_batches(mock_supabase):
+    execute = mock_supabase.table.return_value.upsert.return_value.execute
+    execute.side_effect = [MagicMock(data=[{"id": 1}]), MagicMock(data=[{"id": 2}])]
+    exclusions: list[tuple[str, str, str | None]] = [
+        (f"src/file{i}.ts", "only exports", None) for i in range(3)
+    ]
+
+    with patch(
+        "services.supabase.coverages.bulk_exclude_from_testing.SUPABASE_UPSERT_BATCH_SIZE",
+        2,
+    ):
+        result = bulk_exclude_from_testing(
+            platform="github",
+            owner_id=123,
+            repo_id=456,
+            branch_name="main",
+            updated_by="test_user",
+            exclusions=exclusions,
+        )
+
+    assert result == [{"id": 1}, {"id": 2}]
+    upsert = mock_supabase.table.return_value.upsert
+    assert [[row["full_path"] for row in c.args[0]] for c in upsert.call_args_list] == [
+        ["src/file0.ts", "src/file1.ts"],
+        ["src/file2.ts"],
+    ]
+
+
+def test_no_exclusions_skips_request(mock_supabase):
+    result = bulk_exclude_from_testing(
+        platform="github",
+        owner_id=123,
+        repo_id=456,
+        branch_name="main",
+        updated_by="test_user",
+        exclusions=[],
+    )
+
+    assert result is None
+    mock_supabase.table.assert_not_called()
+
+
+def test_database_error_returns_none(mock_supabase):
+    mock_supabase.table.return_value.upsert.return_value.execute.side_effect = (
+        Exception("Database error")
+    )
+
+    result = bulk_exclude_from_testing(
+        platform="github",
+        owner_id=123,
+        repo_id=456,
+        branch_name="main",
+        updated_by="test_user",
+        exclusions=[("README.md", "not code file", None)],
+    )
+
+    assert result is None
@@ -6,11 +6,11 @@ from services.supabase.coverages.delete_stale_coverages import delete_stale_cove
 
 def test_deletes_stale_files():
     with patch(
-        "services.supabase.coverages.delete_stale_coverages.get_all_coverages"
-    ) as mock_all_cov, patch(
+        "services.supabase.coverages.delete_stale_coverages.iter_coverages"
+    ) as mock_iter, patch(
         "services.supabase.coverages.delete_stale_coverages.delete_coverages_by_paths"
     ) as mock_delete:
-        mock_all_cov.return_value = [
+        mock_iter.return_value = [
             {"full_path": "src/main.py"},
             {"full_path": "src/deleted.py"},
         ]
@@ -33,11 +33,11 @@ def test_deletes_stale_files():
 
 def test_no_stale_files():
     with patch(
-        "services.supabase.coverages.delete_stale_coverages.get_all_coverages"
-    ) as mock_all_cov, patch(
+        "services.supabase.coverages.delete_stale_coverages.iter_coverages"
+    ) as mock_iter, patch(
         "services.supabase.coverages.delete_stale_coverages.delete_coverages_by_paths"
     ) as mock_delete:
-        mock_all_cov.return_value = [
+        mock_iter.return_value = [
             {"full_path": "src/main.py"},
         ]
 
@@ -50,3 +50,51 @@ def test_no_stale_files():
 
         assert result == 0
         mock_delete.assert_not_called()
+
+
+def test_reads_paths_only():
+    with patch(
+        "services.supabase.coverages.delete_stale_coverages.iter_coverages"
+    ) as mock_iter, patch(
+        "services.supabase.coverages.delete_stale_coverages.delete_coverages_by_paths"
+    ):
+        mock_iter.return_value = []
+
+        delete_stale_coverages(
+            platform="github", owner_id=123, repo_id=456, current_files=set()
+        )
+
+        mock_iter.assert_called_once_with(
+            platform="github", owner_id=123, repo_id=456, columns=["full_path"]
+        )
+
+
+def test_read_failure_deletes_nothing_and_returns_none():
+    with patch(
+        "services.supabase.coverages.delete_stale_coverages.iter_coverages"
+    ) as mock_iter, patch(
+        "services.supabase.coverages.delete_stale_coverages.delete_coverages_by_paths"
+    ) as mock_delete:
+        mock_iter.side_effect = Exception("Database error")
+
+        result = delete_stale_coverages(
+            platform="github", owner_id=123, repo_id=456, current_files=set()
+        )
+
+        assert result is None
+        mock_delete.assert_not_called()
+
+
+def test_delete_failure_returns_none():
+    with patch(
+        "services.supabase.coverages.delete_stale_coverages.iter_coverages",
+        return_value=[{"full_path": "src/gone.py"}],
+    ), patch(
+        "services.supabase.coverages.delete_stale_coverages.delete_coverages_by_paths",
+        return_value=None,
+    ):
+        result = delete_stale_coverages(
+            platform="github", owner_id=123, repo_id=456, current_files=set()
+        )
+
+    assert result is None
@@ -2,13 +2,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from services.supabase.coverages.get_all_coverages import get_all_coverages, PAGE_SIZE
+from services.supabase.coverages.get_all_coverages import get_all_coverages
+from services.supabase.coverages.iter_coverages import PAGE_SIZE
 
 
 @pytest.fixture
 def mock_supabase_client():
     """Fixture to provide a mocked supabase client."""
-    with patch("services.supabase.coverages.get_all_coverages.supabase") as mock:
+    with patch("services.supabase.coverages.iter_coverages.supabase") as mock:
         yield mock
 
 
@@ -39,7 +40,7 @@ def _setup_mock_chain(mock_supabase_client, results):
     """Helper to set up the mock chain for paginated queries.
     results: list of lists, one per page call."""
     chain = (
-        mock_supabase_client.table.return_value.select.return_value.eq.return_value.eq.return_value.eq.return_value.eq.return_value.order.return_value.range.return_value
+        mock_supabase_client.table.return_value.select.return_value.eq.return_value.eq.return_value.eq.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value
     )
     mock_results = []
     for data in results:
@@ -106,3 +107,16 @@ def test_get_all_coverages_stops_on_empty_second_page(mock_supabase_client):
     result = get_all_coverages(platform="github", owner_id=789, repo_id=123)
 
     assert len(result) == PAGE_SIZE
+
+
+def test_get_all_coverages_passes_column_projection(mock_supabase_client):
+    _setup_mock_chain(mock_supabase_client, [[{"full_path": "src/main.py"}]])
+
+    result = get_all_coverages(
+        platform="github", owner_id=789, repo_id=123, columns=["file_size"]
+    )
+
+    assert result == [{"full_path": "src/main.py"}]
+    mock_supabase_client.table.return_value.select.assert_called_once_with(
+        "full_path,file_size"
+    )
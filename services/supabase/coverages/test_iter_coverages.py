@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.supabase.coverages.iter_coverages import iter_coverages
+
+
+@pytest.fixture
+def mock_supabase():
+    with patch("services.supabase.coverages.iter_coverages.supabase") as mock:
+        yield mock
+
+
+def _page_query(mock_supabase):
+    return (
+        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.eq.return_value.eq.return_value
+    )
+
+
+def test_keyset_paginates_after_last_path_of_each_full_page(mock_supabase):
+    query = _page_query(mock_supabase)
+    query.gt.return_value.order.return_value.limit.return_value.execute.side_effect = [
+        MagicMock(data=[{"full_path": "a.py"}, {"full_path": "b.py"}]),
+        MagicMock(data=[{"full_path": "c.py"}]),
+    ]
+
+    rows = list(iter_coverages(platform="github", owner_id=1, repo_id=2, page_size=2))
+
+    assert rows == [{"full_path": "a.py"}, {"full_path": "b.py"}, {"full_path": "c.py"}]
+    assert [c.args for c in query.gt.call_args_list] == [
+        ("full_path", ""),
+        ("full_path", "b.py"),
+    ]
+    query.gt.return_value.order.assert_called_with("full_path")
+    query.gt.return_value.order.return_value.limit.assert_called_with(2)
+
+
+def test_stops_on_empty_page_after_exactly_full_page(mock_supabase):
+    query = _page_query(mock_supabase)
+    query.gt.return_value.order.return_value.limit.return_value.execute.side_effect = [
+        MagicMock(data=[{"full_path": "a.py"}]),
+        MagicMock(data=None),
+    ]
+
+    rows = list(iter_coverages(platform="github", owner_id=1, repo_id=2, page_size=1))
+
+    assert rows == [{"full_path": "a.py"}]
+
+
+def test_projection_always_includes_full_path_once(mock_supabase):
+    query = _page_query(mock_supabase)
+    query.gt.return_value.order.return_value.limit.return_value.execute.return_value = (
+        MagicMock(data=[])
+    )
+
+    list(
+        iter_coverages(
+            platform="github",
+            owner_id=1,
+            repo_id=2,
+            columns=["statement_coverage", "full_path", "impl_blob_sha"],
+        )
+    )
+
+    mock_supabase.table.return_value.select.assert_called_once_with(
+        "full_path,statement_coverage,impl_blob_sha"
+    )
+
+
+def test_selects_all_columns_without_projection(mock_supabase):
+    query = _page_query(mock_supabase)
+    query.gt.return_value.order.return_value.limit.return_value.execute.return_value = (
+        MagicMock(data=[])
+    )
+
+    list(iter_coverages(platform="github", owner_id=1, repo_id=2))
+
+    mock_supabase.table.return_value.select.assert_called_once_with("*")
+
+
+def test_yields_first_page_before_fetching_next(mock_supabase):
+    query = _page_query(mock_supabase)
+    execute = query.gt.return_value.order.return_value.limit.return_value.execute
+    execute.side_effect = [
+        MagicMock(data=[{"full_path": "a.py"}]),
+        MagicMock(data=[]),
+    ]
+
+    rows = iter_coverages(platform="github", owner_id=1, repo_id=2, page_size=1)
+
+    assert next(rows) == {"full_path": "a.py"}
+    assert execute.call_count == 1
+
+
+def test_errors_propagate_to_caller(mock_supabase):
+    mock_supabase.table.side_effect = Exception("Database error")
+
+    with pytest.raises(Exception, match="Database error"):
+        list(iter_coverages(platform="github", owner_id=1, repo_id=2))
@@ -211,7 +211,8 @@ class TestUpsertCoverages:
         result = upsert_coverages(coverage_records=coverage_records)
 
         # Assert
-        assert result is None
+        # None is reserved for failures; a batch without returned rows still succeeded
+        assert result == []
 
     def test_upsert_coverages_method_chaining(
         self, mock_supabase, sample_coverage_record
@@ -449,3 +450,43 @@ class TestUpsertCoverages:
             on_conflict="platform,repo_id,full_path",
             default_to_null=False,
         )
+
+    def test_upsert_coverages_splits_into_batches(self, mock_supabase):
+        """Test that records beyond SUPABASE_UPSERT_BATCH_SIZE go out in separate requests."""
+        # Arrange
+        coverage_records: list[CoveragesInsert] = [
+            {
+                "platform": "github",
+                "repo_id": 123,
+                "full_path": f"src/file_{i}.py",
+                "owner_id": 456,
+                "level": "file",
+                "branch_name": "main",
+                "created_by": "test_user",
+                "updated_by": "test_user",
+            }
+            for i in range(5)
+        ]
+        mock_supabase.table.return_value.upsert.return_value.execute.side_effect = [
+            MagicMock(data=[{"id": 1}, {"id": 2}]),
+            MagicMock(data=[{"id": 3}, {"id": 4}]),
+            MagicMock(data=[{"id": 5}]),
+        ]
+
+        # Act
+        with patch(
+            "services.supabase.coverages.upsert_coverages.SUPABASE_UPSERT_BATCH_SIZE",
+            2,
+        ):
+            result = upsert_coverages(coverage_records=coverage_records)
+
+        # Assert
+        assert result == [{"id": i} for i in range(1, 6)]
+        batches = [
+            c.args[0] for c in mock_supabase.table.return_value.upsert.call_args_list
+        ]
+        assert batches == [
+            coverage_records[0:2],
+            coverage_records[2:4],
+            coverage_records[4:5],
+        ]
@@ -1,4 +1,5 @@
 # Local imports
+from constants.supabase import SUPABASE_UPSERT_BATCH_SIZE
 from schemas.supabase.types import CoveragesInsert
 from services.supabase.client import supabase
 from utils.error.handle_exceptions import handle_exceptions
@@ -11,14 +12,20 @@ def upsert_coverages(*, coverage_records: list[CoveragesInsert]):
         logger.info("upsert_coverages: no records, skipping")
         return None
 
-    result = (
-        supabase.table("coverages")
-        .upsert(
-            [dict(r) for r in coverage_records],
-            on_conflict="platform,repo_id,full_path",
-            default_to_null=False,
+    upserted: list[dict] = []
+    for i in range(0, len(coverage_records), SUPABASE_UPSERT_BATCH_SIZE):
+        batch = coverage_records[i : i + SUPABASE_UPSERT_BATCH_SIZE]
+        result = (
+            supabase.table("coverages")
+            .upsert(
+                [dict(r) for r in batch],
+                on_conflict="platform,repo_id,full_path",
+                default_to_null=False,
+            )
+            .execute()
         )
-        .execute()
-    )
+        logger.info("upsert_coverages: upserted batch of %d records", len(batch))
+        upserted.extend(result.data or [])
+
     logger.info("upsert_coverages: upserted %d records", len(coverage_records))
-    return result.data
+    return upserted
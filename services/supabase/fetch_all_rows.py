@@ -0,0 +1,32 @@
+from typing import Any, Callable
+
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+# PostgREST's max-rows cap on Supabase; a page this size may have more behind it
+PAGE_SIZE = 1000
+
+
+@handle_exceptions(raise_on_error=True)
+def fetch_all_rows(build_query: Callable[[], Any]):
+    """Run build_query() page by page with .range() until a short page and return every row.
+
+    build_query must return a fresh, stably ordered select each call (e.g. `.order("id")`), otherwise rows can repeat or go missing between pages.
+    Raises on a failed page: returning the rows fetched so far would look like a complete, smaller result.
+    """
+    rows: list[dict[str, Any]] = []
+    offset = 0
+    while True:
+        result = build_query().range(offset, offset + PAGE_SIZE - 1).execute()
+        page = result.data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            logger.info(
+                "fetch_all_rows: %d rows in %d page(s)",
+                len(rows),
+                offset // PAGE_SIZE + 1,
+            )
+            return rows
+
+        logger.debug("fetch_all_rows: full page at offset %d, fetching next", offset)
+        offset += PAGE_SIZE
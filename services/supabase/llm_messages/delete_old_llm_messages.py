@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from constants.supabase import SUPABASE_BATCH_SIZE
+from services.supabase.client import supabase
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def delete_old_llm_messages(retention_days: int = 14):
+    """Content-addressed counterpart of clear_old_content: prune transcript messages no container has sent in retention_days."""
+    cutoff_date = (datetime.now() - timedelta(days=retention_days)).isoformat()
+    total_deleted = 0
+
+    while True:
+        batch = (
+            supabase.table("llm_messages")
+            .select("hash")
+            .lt("last_seen_at", cutoff_date)
+            .limit(SUPABASE_BATCH_SIZE)
+            .execute()
+        )
+
+        if not batch.data:
+            logger.info("delete_old_llm_messages: no more old messages")
+            break
+
+        hashes = [row["hash"] for row in batch.data]
+        supabase.table("llm_messages").delete().in_("hash", hashes).execute()
+        total_deleted += len(hashes)
+
+        if len(hashes) < SUPABASE_BATCH_SIZE:
+            logger.info("delete_old_llm_messages: last partial batch")
+            break
+
+    logger.info("delete_old_llm_messages: deleted %d", total_deleted)
+    return total_deleted
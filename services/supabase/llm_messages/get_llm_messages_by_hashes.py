@@ -0,0 +1,31 @@
+# Standard imports
+import json
+
+# Local imports
+from constants.supabase import SUPABASE_BATCH_SIZE
+from services.supabase.client import supabase
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value={}, raise_on_error=False)
+def get_llm_messages_by_hashes(hashes: list[str]):
+    """Return {hash: parsed message} for the hashes that still exist in llm_messages (pruned ones are simply absent)."""
+    unique_hashes = list(dict.fromkeys(hashes))
+    messages: dict[str, object] = {}
+
+    for start in range(0, len(unique_hashes), SUPABASE_BATCH_SIZE):
+        batch = unique_hashes[start : start + SUPABASE_BATCH_SIZE]
+        result = (
+            supabase.table("llm_messages")
+            .select("hash, content")
+            .in_("hash", batch)
+            .execute()
+        )
+        for row in result.data or []:
+            messages[row["hash"]] = json.loads(row["content"])
+
+    logger.info(
+        "get_llm_messages_by_hashes: found %d of %d", len(messages), len(unique_hashes)
+    )
+    return messages
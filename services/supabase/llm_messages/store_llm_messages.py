@@ -0,0 +1,55 @@
+# Standard imports
+from datetime import datetime, timezone
+import hashlib
+import json
+from typing import Sequence
+
+# Third party imports
+from cachetools import TTLCache
+
+# Local imports
+from services.supabase.client import supabase
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+# Hashes this container has already upserted. An agent run re-sends the same prefix every turn, so only the newly appended messages reach Supabase. The TTL is well under clear_old_content's retention window, so long-lived containers still bump last_seen_at on messages they keep reusing (system prompts) before delete_old_llm_messages would prune them.
+STORED_HASHES: TTLCache[str, bool] = TTLCache(maxsize=16384, ttl=6 * 60 * 60)
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def store_llm_messages(messages: Sequence[object]):
+    """Content-address each message into llm_messages and return (hashes, total_serialized_length).
+
+    Identical messages across turns, runs, and customers share one row."""
+    hashes: list[str] = []
+    total_length = 0
+    new_rows: dict[str, dict[str, str]] = {}
+    now = datetime.now(timezone.utc).isoformat()
+
+    for message in messages:
+        content = json.dumps(message, ensure_ascii=False, sort_keys=True)
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        hashes.append(content_hash)
+        total_length += len(content)
+        if content_hash not in STORED_HASHES:
+            logger.debug("store_llm_messages: new message %s", content_hash[:12])
+            new_rows[content_hash] = {
+                "hash": content_hash,
+                "content": content,
+                "last_seen_at": now,
+            }
+
+    if not new_rows:
+        logger.info("store_llm_messages: all %d messages already stored", len(hashes))
+        return hashes, total_length
+
+    supabase.table("llm_messages").upsert(
+        list(new_rows.values()), on_conflict="hash"
+    ).execute()
+    for content_hash in new_rows:
+        STORED_HASHES[content_hash] = True
+
+    logger.info(
+        "store_llm_messages: upserted %d of %d messages", len(new_rows), len(hashes)
+    )
+    return hashes, total_length
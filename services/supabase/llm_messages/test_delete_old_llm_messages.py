@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from constants.supabase import SUPABASE_BATCH_SIZE
+from services.supabase.llm_messages.delete_old_llm_messages import (
+    delete_old_llm_messages,
+)
+
+
+@patch("services.supabase.llm_messages.delete_old_llm_messages.supabase")
+@patch("services.supabase.llm_messages.delete_old_llm_messages.datetime")
+def test_deletes_in_batches_until_partial(mock_datetime, mock_supabase):
+    fixed_now = datetime(2026, 5, 1, 12, 0, 0)
+    mock_datetime.now.return_value = fixed_now
+    table = mock_supabase.table.return_value
+    select_chain = table.select.return_value.lt.return_value.limit.return_value
+    full = [{"hash": str(i)} for i in range(SUPABASE_BATCH_SIZE)]
+    select_chain.execute.side_effect = [Mock(data=full), Mock(data=[{"hash": "x"}])]
+
+    result = delete_old_llm_messages(retention_days=7)
+
+    assert result == SUPABASE_BATCH_SIZE + 1
+    table.select.return_value.lt.assert_called_with(
+        "last_seen_at", (fixed_now - timedelta(days=7)).isoformat()
+    )
+    assert table.delete.return_value.in_.call_args_list[1][0] == ("hash", ["x"])
+
+
+@patch("services.supabase.llm_messages.delete_old_llm_messages.supabase")
+def test_nothing_to_delete(mock_supabase):
+    table = mock_supabase.table.return_value
+    table.select.return_value.lt.return_value.limit.return_value.execute.return_value = Mock(
+        data=[]
+    )
+
+    assert delete_old_llm_messages() == 0
+    table.delete.assert_not_called()
+
+
+@patch("services.supabase.llm_messages.delete_old_llm_messages.supabase")
+def test_error_returns_none(mock_supabase):
+    mock_supabase.table.side_effect = Exception("boom")
+    assert delete_old_llm_messages() is None
@@ -0,0 +1,38 @@
+from unittest.mock import Mock, patch
+
+from constants.supabase import SUPABASE_BATCH_SIZE
+from services.supabase.llm_messages.get_llm_messages_by_hashes import (
+    get_llm_messages_by_hashes,
+)
+
+
+@patch("services.supabase.llm_messages.get_llm_messages_by_hashes.supabase")
+def test_returns_parsed_messages_by_hash(mock_supabase):
+    query = mock_supabase.table.return_value.select.return_value.in_
+    query.return_value.execute.return_value = Mock(
+        data=[{"hash": "a", "content": '{"role": "user", "content": "hi"}'}]
+    )
+
+    result = get_llm_messages_by_hashes(["a", "b", "a"])
+
+    assert result == {"a": {"role": "user", "content": "hi"}}
+    query.assert_called_once_with("hash", ["a", "b"])
+
+
+@patch("services.supabase.llm_messages.get_llm_messages_by_hashes.supabase")
+def test_batches_large_hash_lists(mock_supabase):
+    query = mock_supabase.table.return_value.select.return_value.in_
+    query.return_value.execute.return_value = Mock(data=[])
+    hashes = [str(i) for i in range(SUPABASE_BATCH_SIZE + 1)]
+
+    result = get_llm_messages_by_hashes(hashes)
+
+    assert not result
+    assert query.call_count == 2
+    assert query.call_args_list[1][0][1] == [str(SUPABASE_BATCH_SIZE)]
+
+
+@patch("services.supabase.llm_messages.get_llm_messages_by_hashes.supabase")
+def test_error_returns_empty(mock_supabase):
+    mock_supabase.table.side_effect = Exception("boom")
+    assert not get_llm_messages_by_hashes(["a"])
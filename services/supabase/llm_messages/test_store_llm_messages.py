@@ -0,0 +1,85 @@
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from services.supabase.llm_messages.store_llm_messages import (
+    STORED_HASHES,
+    store_llm_messages,
+)
+
+
+def sha(message):
+    content = json.dumps(message, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def clear_stored_hashes():
+    STORED_HASHES.clear()
+    yield
+    STORED_HASHES.clear()
+
+
+@patch("services.supabase.llm_messages.store_llm_messages.supabase")
+def test_upserts_new_messages_and_returns_ordered_hashes(mock_supabase):
+    messages = [{"role": "system", "content": "sys"}, {"role": "user", "content": "é"}]
+
+    hashes, length = store_llm_messages(messages)
+
+    assert hashes == [sha(messages[0]), sha(messages[1])]
+    assert length == len('{"content": "sys", "role": "system"}') + len(
+        '{"content": "é", "role": "user"}'
+    )
+    rows = mock_supabase.table.return_value.upsert.call_args[0][0]
+    assert [row["hash"] for row in rows] == hashes
+    assert rows[1]["content"] == '{"content": "é", "role": "user"}'
+    mock_supabase.table.return_value.upsert.assert_called_once_with(
+        rows, on_conflict="hash"
+    )
+
+
+@patch("services.supabase.llm_messages.store_llm_messages.supabase")
+def test_second_turn_only_sends_appended_messages(mock_supabase):
+    turn1 = [{"role": "user", "content": "task"}]
+    turn2 = [*turn1, {"role": "assistant", "content": "plan"}]
+
+    store_llm_messages(turn1)
+    store_llm_messages(turn2)
+
+    second_rows = mock_supabase.table.return_value.upsert.call_args_list[1][0][0]
+    assert [row["hash"] for row in second_rows] == [sha(turn2[1])]
+
+
+@patch("services.supabase.llm_messages.store_llm_messages.supabase")
+def test_duplicate_messages_in_one_call_sent_once(mock_supabase):
+    message = {"role": "user", "content": "same"}
+
+    hashes, _ = store_llm_messages([message, message])
+
+    assert hashes == [sha(message), sha(message)]
+    rows = mock_supabase.table.return_value.upsert.call_args[0][0]
+    assert len(rows) == 1
+
+
+@patch("services.supabase.llm_messages.store_llm_messages.supabase")
+def test_all_known_skips_network(mock_supabase):
+    message = {"role": "user", "content": "x"}
+    store_llm_messages([message])
+    mock_supabase.reset_mock()
+
+    hashes, _ = store_llm_messages([message])
+
+    assert hashes == [sha(message)]
+    mock_supabase.table.assert_not_called()
+
+
+@patch("services.supabase.llm_messages.store_llm_messages.supabase")
+def test_failed_upsert_returns_none_and_remembers_nothing(mock_supabase):
+    mock_supabase.table.return_value.upsert.return_value.execute.side_effect = (
+        Exception("boom")
+    )
+
+    assert store_llm_messages([{"role": "user", "content": "x"}]) is None
+    assert len(STORED_HASHES) == 0
@@ -1,3 +1,4 @@
+from constants.claude import CACHE_READ_PRICE_RATIO, CACHE_WRITE_PRICE_RATIO
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -6,8 +7,14 @@ from utils.logging.logging_config import logger
 # https://platform.openai.com/docs/pricing?latest-pricing=standard
 @handle_exceptions(default_return_value=(0, 0), raise_on_error=False)
 def calculate_costs(
-    provider: str, model_id: str, input_tokens: int, output_tokens: int
+    provider: str,
+    model_id: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ):
+    """input_tokens is the full prompt size; the cache_read/cache_write share of it is billed at the discounted/premium cache rates instead of the base input rate."""
     # Pricing per 1M tokens (input/output)
     pricing = {
         "claude": {
@@ -35,7 +42,13 @@ def calculate_costs(
         logger.warning("Unknown model %s for provider %s", model_id, provider)
         return 0, 0
 
-    input_cost_usd = (input_tokens / 1_000_000) * model_pricing["input"]
+    uncached_tokens = max(input_tokens - cache_read_tokens - cache_write_tokens, 0)
+    billed_input_tokens = (
+        uncached_tokens
+        + cache_read_tokens * CACHE_READ_PRICE_RATIO
+        + cache_write_tokens * CACHE_WRITE_PRICE_RATIO
+    )
+    input_cost_usd = (billed_input_tokens / 1_000_000) * model_pricing["input"]
     output_cost_usd = (output_tokens / 1_000_000) * model_pricing["output"]
 
     return input_cost_usd, output_cost_usd
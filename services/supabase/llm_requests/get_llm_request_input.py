@@ -0,0 +1,59 @@
+# Standard imports
+import json
+
+# Local imports
+from services.supabase.client import supabase
+from services.supabase.llm_messages.get_llm_messages_by_hashes import (
+    get_llm_messages_by_hashes,
+)
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def get_llm_request_input(request_id: int):
+    """Rebuild the full input transcript (system prompt first) that insert_llm_request recorded for one llm_requests row.
+
+    Handles both legacy rows with inline input_content and content-addressed rows that store a hash delta against parent_request_id. Messages already pruned by delete_old_llm_messages come back as {"pruned_hash": "<sha256>"} so positions stay intact.
+    """
+    # Walk up to the root; each row contributes parent_prefix_length leading hashes from its parent plus its own suffix.
+    chain: list[tuple[list[str], int]] = []
+    next_id: int | None = request_id
+    while next_id is not None:
+        result = (
+            supabase.table("llm_requests")
+            .select(
+                "id, input_content, input_message_hashes, parent_request_id, parent_prefix_length"
+            )
+            .eq("id", next_id)
+            .execute()
+        )
+        if not result.data:
+            logger.warning("get_llm_request_input: row %s not found", next_id)
+            return None
+
+        row = result.data[0]
+        if row.get("input_message_hashes") is None:
+            logger.info("get_llm_request_input: row %s has inline content", next_id)
+            if chain:
+                logger.warning("get_llm_request_input: parent %s is inline", next_id)
+                return None
+            return json.loads(row["input_content"]) if row["input_content"] else []
+
+        logger.info("get_llm_request_input: row %s has hash delta", next_id)
+        chain.append(
+            (row["input_message_hashes"], row.get("parent_prefix_length") or 0)
+        )
+        next_id = row.get("parent_request_id")
+
+    hashes: list[str] = []
+    for suffix, prefix_length in reversed(chain):
+        hashes = hashes[:prefix_length] + suffix
+
+    messages = get_llm_messages_by_hashes(hashes)
+    logger.info(
+        "get_llm_request_input: rebuilt %d messages over %d rows",
+        len(hashes),
+        len(chain),
+    )
+    return [messages.get(h, {"pruned_hash": h}) for h in hashes]
@@ -2,10 +2,12 @@ import json
 from typing import Sequence
 
 from anthropic.types import MessageParam
+from cachetools import LRUCache
 from openai.types.chat import ChatCompletionMessageParam
 
 from schemas.supabase.types import LlmRequests
 from services.supabase.client import supabase
+from services.supabase.llm_messages.store_llm_messages import store_llm_messages
 from services.supabase.llm_requests.calculate_costs import calculate_costs
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
@@ -13,6 +15,11 @@ from utils.logging.logging_config import logger
 # Both Anthropic's MessageParam and OpenAI's ChatCompletionMessageParam are TypedDicts with different role/content shapes. The union keeps per-provider typing at call sites; json.dumps handles serialization uniformly below.
 LlmMessage = MessageParam | ChatCompletionMessageParam
 
+# (usage_id, hash of the first input message) -> (llm_requests.id, full input hash list) of the latest request this container recorded for that conversation. Lets each row store only the hashes appended since its parent instead of the whole transcript. The first message (the system prompt when there is one) tells the agent loop apart from side calls under the same usage, such as query_file or the web_fetch summary, which run concurrently with it and would otherwise replace its parent.
+LAST_REQUEST_BY_CONVERSATION: LRUCache[tuple[int, str], tuple[int, list[str]]] = (
+    LRUCache(maxsize=1024)
+)
+
 
 @handle_exceptions(default_return_value=None, raise_on_error=False)
 def insert_llm_request(
@@ -27,6 +34,10 @@ def insert_llm_request(
     system_prompt: str | None = None,
     response_time_ms: int | None = None,
     error_message: str | None = None,
+    cache_read_input_tokens: int = 0,
+    cache_creation_input_tokens: int = 0,
+    time_to_first_token_ms: int | None = None,
+    tool_overlap_ms: int | None = None,
 ):
     # Claude/Google take the system prompt as a separate kwarg rather than a message, and anthropic.MessageParam's role field is Literal["user", "assistant"] (no "system"). Prepending a role="system" entry here keeps the stored JSON honest about what the model received without forcing callers to contort it into a fake user message.
     serialized_input: list[object] = []
@@ -37,16 +48,55 @@ def insert_llm_request(
         )
         serialized_input.append({"role": "system", "content": system_prompt})
     serialized_input.extend(input_messages)
-    input_content = json.dumps(serialized_input, ensure_ascii=False)
     output_content = json.dumps(output_message, ensure_ascii=False)
-
-    # Calculate lengths
-    input_length = len(input_content)
     output_length = len(output_content)
 
+    # Transcript goes to llm_messages (content-addressed); the row keeps an ordered hash delta against the previous request of the same run. Reconstruct with get_llm_request_input.
+    input_content = ""
+    input_message_hashes: list[str] | None = None
+    parent_request_id: int | None = None
+    parent_prefix_length = 0
+    conversation_key = (usage_id, "")
+    stored = store_llm_messages(serialized_input)
+    if stored is None:
+        logger.warning("insert_llm_request: transcript store failed; inlining input")
+        input_content = json.dumps(serialized_input, ensure_ascii=False)
+        input_length = len(input_content)
+    else:
+        logger.info(
+            "insert_llm_request: transcript stored as %d hashes", len(stored[0])
+        )
+        all_hashes, messages_length = stored
+        # Same length json.dumps(serialized_input) would have produced: "[" + ", ".join(...) + "]".
+        input_length = messages_length + 2 + 2 * max(len(all_hashes) - 1, 0)
+        input_message_hashes = all_hashes
+        conversation_key = (usage_id, all_hashes[0] if all_hashes else "")
+        parent = LAST_REQUEST_BY_CONVERSATION.get(conversation_key)
+        if parent is not None:
+            logger.info("insert_llm_request: delta against parent id=%d", parent[0])
+            parent_hashes = parent[1]
+            while (
+                parent_prefix_length < min(len(parent_hashes), len(all_hashes))
+                and parent_hashes[parent_prefix_length]
+                == all_hashes[parent_prefix_length]
+            ):
+                parent_prefix_length += 1
+            if parent_prefix_length > 0:
+                logger.info(
+                    "insert_llm_request: sharing %d leading messages with parent",
+                    parent_prefix_length,
+                )
+                parent_request_id = parent[0]
+                input_message_hashes = all_hashes[parent_prefix_length:]
+
     # Calculate costs based on provider and model
     input_cost_usd, output_cost_usd = calculate_costs(
-        provider, model_id, input_tokens, output_tokens
+        provider,
+        model_id,
+        input_tokens,
+        output_tokens,
+        cache_read_tokens=cache_read_input_tokens,
+        cache_write_tokens=cache_creation_input_tokens,
     )
     total_cost_usd = input_cost_usd + output_cost_usd
 
@@ -56,15 +106,23 @@ def insert_llm_request(
         "provider": provider,
         "model_id": model_id,
         "input_content": input_content,
+        "input_message_hashes": input_message_hashes,
+        "parent_request_id": parent_request_id,
+        "parent_prefix_length": parent_prefix_length,
         "input_length": input_length,
         "input_tokens": input_tokens,
         "input_cost_usd": input_cost_usd,
+        "cache_read_input_tokens": cache_read_input_tokens,
+        "cache_creation_input_tokens": cache_creation_input_tokens,
         "output_content": output_content,
         "output_length": output_length,
         "output_tokens": output_tokens,
         "output_cost_usd": output_cost_usd,
         "total_cost_usd": total_cost_usd,
         "response_time_ms": response_time_ms,
+        # Streaming only: time to the first content delta, and how long early-started tool calls ran before the stream finished
+        "time_to_first_token_ms": time_to_first_token_ms,
+        "tool_overlap_ms": tool_overlap_ms,
         "error_message": error_message,
         "created_by": created_by,
         "updated_by": created_by,
@@ -72,12 +130,20 @@ def insert_llm_request(
 
     result = supabase.table("llm_requests").insert(data).execute()
     if result.data:
+        if stored is not None:
+            logger.info("insert_llm_request: remembering row as parent for next turn")
+            LAST_REQUEST_BY_CONVERSATION[conversation_key] = (
+                result.data[0]["id"],
+                stored[0],
+            )
         logger.info(
-            "insert_llm_request: recorded provider=%s model=%s usage_id=%s tokens_in=%d tokens_out=%d cost_usd=%.6f",
+            "insert_llm_request: recorded provider=%s model=%s usage_id=%s tokens_in=%d cache_read=%d cache_write=%d tokens_out=%d cost_usd=%.6f",
             provider,
             model_id,
             usage_id,
             input_tokens,
+            cache_read_input_tokens,
+            cache_creation_input_tokens,
             output_tokens,
             total_cost_usd,
         )
@@ -90,3 +90,27 @@ def test_all_models_have_pricing():
     )
     assert input_cost > 0, f"Missing pricing for openai model: {OPENAI_MODEL_ID}"
     assert output_cost > 0, f"Missing pricing for openai model: {OPENAI_MODEL_ID}"
+
+
+def test_calculate_costs_claude_cache_tokens():
+    """Cache reads bill at 0.1x and cache writes at 1.25x the base input price; only the remainder bills at the base rate."""
+    input_cost, output_cost = calculate_costs(
+        "claude",
+        "claude-sonnet-4-6",
+        10_000,
+        500,
+        cache_read_tokens=8_000,
+        cache_write_tokens=1_000,
+    )
+    expected_input = ((1_000 + 8_000 * 0.1 + 1_000 * 1.25) / 1_000_000) * 3.00
+    expected_output = (500 / 1_000_000) * 15.00
+
+    assert input_cost == expected_input
+    assert output_cost == expected_output
+
+
+def test_calculate_costs_cache_tokens_exceeding_input_clamp_uncached_to_zero():
+    input_cost, _ = calculate_costs(
+        "claude", "claude-sonnet-4-6", 100, 0, cache_read_tokens=200
+    )
+    assert input_cost == ((200 * 0.1) / 1_000_000) * 3.00
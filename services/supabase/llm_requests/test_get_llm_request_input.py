@@ -0,0 +1,95 @@
+from unittest.mock import Mock, patch
+
+from services.supabase.llm_requests.get_llm_request_input import get_llm_request_input
+
+
+def make_row(row_id, hashes, parent=None, prefix=0, input_content=""):
+    return {
+        "id": row_id,
+        "input_content": input_content,
+        "input_message_hashes": hashes,
+        "parent_request_id": parent,
+        "parent_prefix_length": prefix,
+    }
+
+
+def mock_rows(mock_supabase, rows):
+    by_id = {row["id"]: row for row in rows}
+    eq = mock_supabase.table.return_value.select.return_value.eq
+
+    def lookup(_column, row_id):
+        result = Mock()
+        result.execute.return_value = Mock(
+            data=[by_id[row_id]] if row_id in by_id else []
+        )
+        return result
+
+    eq.side_effect = lookup
+
+
+@patch(
+    "services.supabase.llm_requests.get_llm_request_input.get_llm_messages_by_hashes"
+)
+@patch("services.supabase.llm_requests.get_llm_request_input.supabase")
+def test_rebuilds_transcript_across_parent_chain(mock_supabase, mock_get_messages):
+    mock_rows(
+        mock_supabase,
+        [
+            make_row(1, ["s", "u1"]),
+            make_row(2, ["a1", "u2"], parent=1, prefix=2),
+            # Turn 3 rewrote u2 (remove_outdated_messages), so it only shares 3 leading messages with turn 2.
+            make_row(3, ["u2b", "a2"], parent=2, prefix=3),
+        ],
+    )
+    mock_get_messages.return_value = {
+        h: {"h": h} for h in ["s", "u1", "a1", "u2b", "a2"]
+    }
+
+    result = get_llm_request_input(3)
+
+    mock_get_messages.assert_called_once_with(["s", "u1", "a1", "u2b", "a2"])
+    assert result == [{"h": "s"}, {"h": "u1"}, {"h": "a1"}, {"h": "u2b"}, {"h": "a2"}]
+
+
+@patch(
+    "services.supabase.llm_requests.get_llm_request_input.get_llm_messages_by_hashes"
+)
+@patch("services.supabase.llm_requests.get_llm_request_input.supabase")
+def test_pruned_messages_become_placeholders(mock_supabase, mock_get_messages):
+    mock_rows(mock_supabase, [make_row(1, ["s", "gone"])])
+    mock_get_messages.return_value = {"s": {"role": "system", "content": "sys"}}
+
+    result = get_llm_request_input(1)
+
+    assert result == [{"role": "system", "content": "sys"}, {"pruned_hash": "gone"}]
+
+
+@patch("services.supabase.llm_requests.get_llm_request_input.supabase")
+def test_legacy_inline_row(mock_supabase):
+    mock_rows(
+        mock_supabase,
+        [make_row(5, None, input_content='[{"role": "user", "content": "hi"}]')],
+    )
+
+    assert get_llm_request_input(5) == [{"role": "user", "content": "hi"}]
+
+
+@patch("services.supabase.llm_requests.get_llm_request_input.supabase")
+def test_legacy_cleared_row(mock_supabase):
+    mock_rows(mock_supabase, [make_row(5, None)])
+
+    assert get_llm_request_input(5) == []
+
+
+@patch("services.supabase.llm_requests.get_llm_request_input.supabase")
+def test_missing_row(mock_supabase):
+    mock_rows(mock_supabase, [])
+
+    assert get_llm_request_input(404) is None
+
+
+@patch("services.supabase.llm_requests.get_llm_request_input.supabase")
+def test_missing_parent(mock_supabase):
+    mock_rows(mock_supabase, [make_row(2, ["a"], parent=1, prefix=1)])
+
+    assert get_llm_request_input(2) is None
@@ -3,9 +3,13 @@ import json
 from unittest.mock import Mock, patch
 
 from anthropic.types import MessageParam
+import pytest
 
 from constants.models import ClaudeModelId
-from services.supabase.llm_requests.insert_llm_request import insert_llm_request
+from services.supabase.llm_requests.insert_llm_request import (
+    LAST_REQUEST_BY_CONVERSATION,
+    insert_llm_request,
+)
 
 MOCK_DB_ROW = {
     "id": 1,
@@ -30,6 +34,23 @@ MOCK_DB_ROW = {
 }
 
 
+def fake_store(messages):
+    """Stand-in for store_llm_messages: hash = the message's JSON, so tests can read which messages a row references."""
+    contents = [json.dumps(m, ensure_ascii=False, sort_keys=True) for m in messages]
+    return contents, sum(len(c) for c in contents)
+
+
+@pytest.fixture(autouse=True)
+def mock_store_llm_messages():
+    LAST_REQUEST_BY_CONVERSATION.clear()
+    with patch(
+        "services.supabase.llm_requests.insert_llm_request.store_llm_messages",
+        side_effect=fake_store,
+    ) as mock_store:
+        yield mock_store
+    LAST_REQUEST_BY_CONVERSATION.clear()
+
+
 @patch("services.supabase.llm_requests.insert_llm_request.supabase")
 @patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
 def test_insert_llm_request_success(mock_calculate_costs, mock_supabase):
@@ -59,23 +80,35 @@ def test_insert_llm_request_success(mock_calculate_costs, mock_supabase):
     assert result["id"] == 1
     assert result["total_cost_usd"] == 0.006
     mock_calculate_costs.assert_called_once_with(
-        "claude", ClaudeModelId.SONNET_4_6, 10, 5
+        "claude",
+        ClaudeModelId.SONNET_4_6,
+        10,
+        5,
+        cache_read_tokens=0,
+        cache_write_tokens=0,
     )
 
     expected_data = {
         "usage_id": 123,
         "provider": "claude",
         "model_id": ClaudeModelId.SONNET_4_6,
-        "input_content": json.dumps(input_messages, ensure_ascii=False),
+        "input_content": "",
+        "input_message_hashes": [json.dumps(input_messages[0], sort_keys=True)],
+        "parent_request_id": None,
+        "parent_prefix_length": 0,
         "input_length": len(json.dumps(input_messages, ensure_ascii=False)),
         "input_tokens": 10,
         "input_cost_usd": 0.001,
+        "cache_read_input_tokens": 0,
+        "cache_creation_input_tokens": 0,
         "output_content": json.dumps(output_message, ensure_ascii=False),
         "output_length": len(json.dumps(output_message, ensure_ascii=False)),
         "output_tokens": 5,
         "output_cost_usd": 0.005,
         "total_cost_usd": 0.006,
         "response_time_ms": 1000,
+        "time_to_first_token_ms": None,
+        "tool_overlap_ms": None,
         "error_message": None,
         "created_by": "test",
         "updated_by": "test",
@@ -104,7 +137,9 @@ def test_insert_llm_request_database_error(mock_supabase):
 
 @patch("services.supabase.llm_requests.insert_llm_request.supabase")
 @patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
-def test_insert_llm_request_prepends_system_prompt(mock_calculate_costs, mock_supabase):
+def test_insert_llm_request_prepends_system_prompt(
+    mock_calculate_costs, mock_supabase, mock_store_llm_messages
+):
     mock_calculate_costs.return_value = (0.001, 0.005)
     mock_result = Mock()
     mock_result.data = [MOCK_DB_ROW]
@@ -126,17 +161,19 @@ def test_insert_llm_request_prepends_system_prompt(mock_calculate_costs, mock_su
     )
 
     assert result is not None
-    inserted = mock_supabase.table.return_value.insert.call_args[0][0]
-    stored_messages = json.loads(inserted["input_content"])
-    assert stored_messages == [
-        {"role": "system", "content": "You are a helpful assistant."},
-        {"role": "user", "content": "hi"},
-    ]
+    mock_store_llm_messages.assert_called_once_with(
+        [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "hi"},
+        ]
+    )
 
 
 @patch("services.supabase.llm_requests.insert_llm_request.supabase")
 @patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
-def test_insert_llm_request_no_system_prompt(mock_calculate_costs, mock_supabase):
+def test_insert_llm_request_no_system_prompt(
+    mock_calculate_costs, mock_supabase, mock_store_llm_messages
+):
     mock_calculate_costs.return_value = (0.001, 0.005)
     mock_result = Mock()
     mock_result.data = [MOCK_DB_ROW]
@@ -156,6 +193,216 @@ def test_insert_llm_request_no_system_prompt(mock_calculate_costs, mock_supabase
         created_by="test",
     )
 
+    mock_store_llm_messages.assert_called_once_with([{"role": "user", "content": "hi"}])
+
+
+@patch("services.supabase.llm_requests.insert_llm_request.supabase")
+@patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
+def test_insert_llm_request_records_cache_tokens(mock_calculate_costs, mock_supabase):
+    mock_calculate_costs.return_value = (0.001, 0.005)
+    mock_result = Mock()
+    mock_result.data = [MOCK_DB_ROW]
+    mock_supabase.table.return_value.insert.return_value.execute.return_value = (
+        mock_result
+    )
+
+    insert_llm_request(
+        usage_id=1,
+        provider="claude",
+        model_id=ClaudeModelId.SONNET_4_6,
+        input_messages=[{"role": "user", "content": "hi"}],
+        input_tokens=10_000,
+        output_message={"role": "assistant", "content": "ok"},
+        output_tokens=5,
+        created_by="test",
+        cache_read_input_tokens=8_000,
+        cache_creation_input_tokens=1_500,
+    )
+
+    mock_calculate_costs.assert_called_once_with(
+        "claude",
+        ClaudeModelId.SONNET_4_6,
+        10_000,
+        5,
+        cache_read_tokens=8_000,
+        cache_write_tokens=1_500,
+    )
     inserted = mock_supabase.table.return_value.insert.call_args[0][0]
-    stored_messages = json.loads(inserted["input_content"])
-    assert stored_messages == [{"role": "user", "content": "hi"}]
+    assert inserted["cache_read_input_tokens"] == 8_000
+    assert inserted["cache_creation_input_tokens"] == 1_500
+
+
+@patch("services.supabase.llm_requests.insert_llm_request.supabase")
+@patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
+def test_insert_llm_request_records_streaming_metrics(
+    mock_calculate_costs, mock_supabase
+):
+    mock_calculate_costs.return_value = (0.001, 0.005)
+    mock_result = Mock()
+    mock_result.data = [MOCK_DB_ROW]
+    mock_supabase.table.return_value.insert.return_value.execute.return_value = (
+        mock_result
+    )
+
+    insert_llm_request(
+        usage_id=1,
+        provider="claude",
+        model_id=ClaudeModelId.SONNET_4_6,
+        input_messages=[{"role": "user", "content": "hi"}],
+        input_tokens=10,
+        output_message={"role": "assistant", "content": "ok"},
+        output_tokens=5,
+        created_by="test",
+        response_time_ms=4_000,
+        time_to_first_token_ms=600,
+        tool_overlap_ms=2_500,
+    )
+
+    inserted = mock_supabase.table.return_value.insert.call_args[0][0]
+    assert inserted["response_time_ms"] == 4_000
+    assert inserted["time_to_first_token_ms"] == 600
+    assert inserted["tool_overlap_ms"] == 2_500
+
+
+@patch("services.supabase.llm_requests.insert_llm_request.supabase")
+@patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
+def test_insert_llm_request_stores_delta_against_previous_turn(
+    mock_calculate_costs, mock_supabase
+):
+    mock_calculate_costs.return_value = (0.0, 0.0)
+    insert = mock_supabase.table.return_value.insert
+    insert.return_value.execute.side_effect = [
+        Mock(data=[{**MOCK_DB_ROW, "id": 10}]),
+        Mock(data=[{**MOCK_DB_ROW, "id": 11}]),
+    ]
+    turn1: list[MessageParam] = [{"role": "user", "content": "task"}]
+    turn2: list[MessageParam] = [
+        *turn1,
+        {"role": "assistant", "content": "plan"},
+        {"role": "user", "content": "go"},
+    ]
+
+    for messages in (turn1, turn2):
+        insert_llm_request(
+            usage_id=7,
+            provider="claude",
+            model_id=ClaudeModelId.SONNET_4_6,
+            input_messages=messages,
+            input_tokens=1,
+            output_message={"role": "assistant", "content": "ok"},
+            output_tokens=1,
+            created_by="test",
+            system_prompt="sys",
+        )
+
+    second = insert.call_args_list[1][0][0]
+    assert second["parent_request_id"] == 10
+    assert second["parent_prefix_length"] == 2
+    assert second["input_message_hashes"] == [
+        json.dumps(turn2[1], sort_keys=True),
+        json.dumps(turn2[2], sort_keys=True),
+    ]
+    assert second["input_content"] == ""
+
+
+@patch("services.supabase.llm_requests.insert_llm_request.supabase")
+@patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
+def test_insert_llm_request_side_call_does_not_replace_agent_parent(
+    mock_calculate_costs, mock_supabase
+):
+    mock_calculate_costs.return_value = (0.0, 0.0)
+    insert = mock_supabase.table.return_value.insert
+    insert.return_value.execute.side_effect = [
+        Mock(data=[{**MOCK_DB_ROW, "id": 10}]),
+        Mock(data=[{**MOCK_DB_ROW, "id": 20}]),
+        Mock(data=[{**MOCK_DB_ROW, "id": 11}]),
+    ]
+    turn1: list[MessageParam] = [{"role": "user", "content": "task"}]
+    turn2: list[MessageParam] = [
+        *turn1,
+        {"role": "assistant", "content": "plan"},
+        {"role": "user", "content": "go"},
+    ]
+    calls: list[tuple[str, list[MessageParam]]] = [
+        ("agent sys", turn1),
+        ("summarize", [{"role": "user", "content": "page"}]),
+        ("agent sys", turn2),
+    ]
+
+    for system_prompt, messages in calls:
+        insert_llm_request(
+            usage_id=7,
+            provider="claude",
+            model_id=ClaudeModelId.SONNET_4_6,
+            input_messages=messages,
+            input_tokens=1,
+            output_message={"role": "assistant", "content": "ok"},
+            output_tokens=1,
+            created_by="test",
+            system_prompt=system_prompt,
+        )
+
+    third = insert.call_args_list[2][0][0]
+    assert third["parent_request_id"] == 10
+    assert third["parent_prefix_length"] == 2
+    assert third["input_message_hashes"] == [
+        json.dumps(turn2[1], sort_keys=True),
+        json.dumps(turn2[2], sort_keys=True),
+    ]
+
+
+@patch("services.supabase.llm_requests.insert_llm_request.supabase")
+@patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
+def test_insert_llm_request_rewritten_history_has_no_parent(
+    mock_calculate_costs, mock_supabase
+):
+    mock_calculate_costs.return_value = (0.0, 0.0)
+    insert = mock_supabase.table.return_value.insert
+    insert.return_value.execute.return_value = Mock(data=[MOCK_DB_ROW])
+
+    for content in ("first", "rewritten"):
+        insert_llm_request(
+            usage_id=7,
+            provider="claude",
+            model_id=ClaudeModelId.SONNET_4_6,
+            input_messages=[{"role": "user", "content": content}],
+            input_tokens=1,
+            output_message={"role": "assistant", "content": "ok"},
+            output_tokens=1,
+            created_by="test",
+        )
+
+    second = insert.call_args_list[1][0][0]
+    assert second["parent_request_id"] is None
+    assert second["parent_prefix_length"] == 0
+    assert second["input_message_hashes"] == [
+        json.dumps({"role": "user", "content": "rewritten"}, sort_keys=True)
+    ]
+
+
+@patch("services.supabase.llm_requests.insert_llm_request.supabase")
+@patch("services.supabase.llm_requests.insert_llm_request.calculate_costs")
+def test_insert_llm_request_falls_back_to_inline_when_store_fails(
+    mock_calculate_costs, mock_supabase, mock_store_llm_messages
+):
+    mock_calculate_costs.return_value = (0.0, 0.0)
+    mock_store_llm_messages.side_effect = None
+    mock_store_llm_messages.return_value = None
+    insert = mock_supabase.table.return_value.insert
+    insert.return_value.execute.return_value = Mock(data=[MOCK_DB_ROW])
+
+    insert_llm_request(
+        usage_id=7,
+        provider="claude",
+        model_id=ClaudeModelId.SONNET_4_6,
+        input_messages=[{"role": "user", "content": "hi"}],
+        input_tokens=1,
+        output_message={"role": "assistant", "content": "ok"},
+        output_tokens=1,
+        created_by="test",
+    )
+
+    inserted = insert.call_args[0][0]
+    assert inserted["input_content"] == '[{"role": "user", "content": "hi"}]'
+    assert inserted["input_message_hashes"] is None
+    assert not LAST_REQUEST_BY_CONVERSATION
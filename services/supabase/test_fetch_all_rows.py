@@ -0,0 +1,45 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.supabase.fetch_all_rows import fetch_all_rows
+
+
+def make_builder(pages: list[list[dict]]):
+    query = Mock()
+    query.range.return_value.execute.side_effect = [Mock(data=p) for p in pages]
+    return query
+
+
+def test_single_short_page_is_one_request():
+    query = make_builder([[{"id": 1}, {"id": 2}]])
+
+    assert fetch_all_rows(lambda: query) == [{"id": 1}, {"id": 2}]
+    query.range.assert_called_once_with(0, 999)
+
+
+def test_full_pages_fetch_until_a_short_one():
+    with patch("services.supabase.fetch_all_rows.PAGE_SIZE", 2):
+        query = make_builder([[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], []])
+
+        rows = fetch_all_rows(lambda: query)
+
+    assert rows == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert [c.args for c in query.range.call_args_list] == [(0, 1), (2, 3), (4, 5)]
+
+
+def test_none_data_is_empty():
+    query = make_builder([None])
+
+    assert not fetch_all_rows(lambda: query)
+
+
+def test_error_raises_instead_of_returning_partial_rows():
+    query = Mock()
+    query.range.return_value.execute.side_effect = [
+        Mock(data=[{"id": i} for i in range(1000)]),
+        RuntimeError("boom"),
+    ]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        fetch_all_rows(lambda: query)
@@ -0,0 +1,34 @@
+from services.supabase.client import supabase
+from services.supabase.fetch_all_rows import fetch_all_rows
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(raise_on_error=True)
+def get_prs_used_before(*, prs: set[tuple[str, str, int]], before: str):
+    """Return the (owner_name, repo_name, pr_number) in prs that have any usage row created before `before`, i.e. whose first usage is earlier.
+
+    One query for all PRs instead of one first-row lookup per PR. The filter on repo names and PR numbers can also match other combinations, such as another owner's repo with the same name; those are dropped here.
+    """
+    if not prs:
+        logger.info("get_prs_used_before: no PRs to check")
+        return set()
+
+    rows = fetch_all_rows(
+        lambda: supabase.table("usage")
+        .select("owner_name, repo_name, pr_number")
+        .lt("created_at", before)
+        .in_("repo_name", sorted({repo for _, repo, _ in prs}))
+        .in_("pr_number", sorted({pr_number for _, _, pr_number in prs}))
+        .order("id")
+    )
+    used_before = {
+        (row["owner_name"], row["repo_name"], row["pr_number"]) for row in rows
+    } & prs
+    logger.info(
+        "get_prs_used_before: %d of %d PRs were used before %s",
+        len(used_before),
+        len(prs),
+        before,
+    )
+    return used_before
@@ -0,0 +1,58 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.supabase.usage.get_prs_used_before import get_prs_used_before
+
+BEFORE = "2026-05-01T15:00:00+00:00"
+
+
+def _build_chain(mock_supabase, data):
+    mock_chain = Mock()
+    mock_supabase.table.return_value = mock_chain
+    for method in ("select", "lt", "in_", "order", "range"):
+        getattr(mock_chain, method).return_value = mock_chain
+    mock_chain.execute.return_value = Mock(data=data)
+    return mock_chain
+
+
+def test_returns_only_requested_prs_with_earlier_usage():
+    with patch("services.supabase.usage.get_prs_used_before.supabase") as mock_supabase:
+        mock_chain = _build_chain(
+            mock_supabase,
+            [
+                {"owner_name": "acme", "repo_name": "api", "pr_number": 7},
+                {"owner_name": "acme", "repo_name": "api", "pr_number": 7},
+                # Same repo name and PR number under another owner: matched by the IN filters, not asked about
+                {"owner_name": "delta", "repo_name": "api", "pr_number": 12},
+            ],
+        )
+
+        result = get_prs_used_before(
+            prs={("acme", "api", 7), ("acme", "api", 12), ("acme", "web", 3)},
+            before=BEFORE,
+        )
+
+    assert result == {("acme", "api", 7)}
+    mock_supabase.table.assert_called_once_with("usage")
+    mock_chain.lt.assert_called_once_with("created_at", BEFORE)
+    assert [c.args for c in mock_chain.in_.call_args_list] == [
+        ("repo_name", ["api", "web"]),
+        ("pr_number", [3, 7, 12]),
+    ]
+
+
+def test_no_prs_skips_the_query():
+    with patch("services.supabase.usage.get_prs_used_before.supabase") as mock_supabase:
+        assert get_prs_used_before(prs=set(), before=BEFORE) == set()
+
+    mock_supabase.table.assert_not_called()
+
+
+def test_query_error_raises():
+    with patch("services.supabase.usage.get_prs_used_before.supabase") as mock_supabase:
+        mock_chain = _build_chain(mock_supabase, [])
+        mock_chain.execute.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            get_prs_used_before(prs={("acme", "api", 7)}, before=BEFORE)
@@ -1,3 +1,4 @@
+from cachetools import LRUCache
 from postgrest.exceptions import APIError
 
 from services.supabase.client import supabase
@@ -5,9 +6,22 @@ from services.types.base_args import Platform
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
+# Deliveries this container already inserted or saw rejected as duplicates. GitHub retries and redeliveries reuse the delivery ID, so repeats landing on a warm container skip the DB round trip.
+SEEN_DELIVERY_IDS: LRUCache[tuple[str, str], bool] = LRUCache(maxsize=4096)
+
 
 @handle_exceptions(default_return_value=None, raise_on_error=False)
 def insert_webhook_delivery(*, platform: Platform, delivery_id: str, event_name: str):
+    key = (platform, delivery_id)
+    if key in SEEN_DELIVERY_IDS:
+        logger.info(
+            "insert_webhook_delivery: %s/%s/%s already seen by this container",
+            platform,
+            event_name,
+            delivery_id,
+        )
+        return False
+
     try:
         result = (
             supabase.table("webhook_deliveries")
@@ -28,6 +42,7 @@ def insert_webhook_delivery(*, platform: Platform, delivery_id: str, event_name:
                 event_name,
                 delivery_id,
             )
+            SEEN_DELIVERY_IDS[key] = True
             return True
 
         logger.info(
@@ -36,6 +51,7 @@ def insert_webhook_delivery(*, platform: Platform, delivery_id: str, event_name:
             event_name,
             delivery_id,
         )
+        SEEN_DELIVERY_IDS[key] = True
         return False
     except APIError as e:
         if e.code == "23505":
@@ -45,6 +61,7 @@ def insert_webhook_delivery(*, platform: Platform, delivery_id: str, event_name:
                 event_name,
                 delivery_id,
             )
+            SEEN_DELIVERY_IDS[key] = True
             return False
         logger.warning(
             "insert_webhook_delivery: %s/%s/%s APIError code=%s, re-raising",
@@ -4,10 +4,18 @@ import pytest
 from postgrest.exceptions import APIError
 
 from services.supabase.webhook_deliveries.insert_webhook_delivery import (
+    SEEN_DELIVERY_IDS,
     insert_webhook_delivery,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_seen_delivery_ids():
+    SEEN_DELIVERY_IDS.clear()
+    yield
+    SEEN_DELIVERY_IDS.clear()
+
+
 @pytest.fixture
 def mock_supabase_client():
     with patch(
@@ -101,3 +109,52 @@ def test_insert_webhook_delivery_postgrest_server_error_returns_none(
     )
 
     assert result is None
+
+
+def test_insert_webhook_delivery_repeat_skips_db(mock_supabase_client):
+    mock, mock_execute = mock_supabase_client
+    mock_execute.data = [{"id": 1, "delivery_id": "abc-123"}]
+
+    first = insert_webhook_delivery(
+        platform="github", delivery_id="abc-123", event_name="check_suite"
+    )
+    second = insert_webhook_delivery(
+        platform="github", delivery_id="abc-123", event_name="check_suite"
+    )
+
+    assert (first, second) == (True, False)
+    mock.table.assert_called_once_with("webhook_deliveries")
+
+
+def test_insert_webhook_delivery_remembers_db_duplicates(mock_supabase_client):
+    mock, mock_execute = mock_supabase_client
+    mock_execute.data = []
+
+    insert_webhook_delivery(
+        platform="github", delivery_id="abc-123", event_name="check_suite"
+    )
+    result = insert_webhook_delivery(
+        platform="github", delivery_id="abc-123", event_name="check_suite"
+    )
+
+    assert result is False
+    mock.table.assert_called_once_with("webhook_deliveries")
+
+
+def test_insert_webhook_delivery_does_not_remember_db_errors(mock_supabase_client):
+    mock, mock_execute = mock_supabase_client
+    mock.table.return_value.insert.return_value.execute.side_effect = [
+        Exception("Connection refused"),
+        mock_execute,
+    ]
+    mock_execute.data = [{"id": 1, "delivery_id": "abc-123"}]
+
+    first = insert_webhook_delivery(
+        platform="github", delivery_id="abc-123", event_name="check_suite"
+    )
+    second = insert_webhook_delivery(
+        platform="github", delivery_id="abc-123", event_name="check_suite"
+    )
+
+    # A failed insert proved nothing, so the retry still goes to the DB
+    assert (first, second) == (None, True)
@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines
 # pyright: reportUnusedVariable=false
+import threading
 from typing import cast
 from unittest.mock import Mock, patch
 import pytest
@@ -8,6 +9,7 @@ from services.chat_with_agent import chat_with_agent
 from services.claude.exceptions import ClaudeOverloadedError
 from services.claude.tools import tools as tools_module
 from services.claude.tools.file_modify_result import FileMoveResult, FileWriteResult
+from services.git.git_commit_and_push import GitCommitResult
 from services.llm_result import LlmResult, ToolCall
 
 
@@ -1322,3 +1324,341 @@ async def test_concurrent_push_from_tool_short_circuits_loop(
     assert result.is_completed is False
     # Second tool call was skipped — we bailed after the first detected the race.
     assert call_count["n"] == 1
+
+
+def make_tool_call_result(calls: list[tuple[str, dict]]):
+    return LlmResult(
+        assistant_message={
+            "role": "assistant",
+            "content": [
+                {"type": "tool_use", "id": f"call_{i}", "name": name, "input": args}
+                for i, (name, args) in enumerate(calls)
+            ],
+        },
+        tool_calls=[
+            ToolCall(id=f"call_{i}", name=name, args=args)
+            for i, (name, args) in enumerate(calls)
+        ],
+        token_input=10,
+        token_output=10,
+        cost_usd=0.01,
+    )
+
+
+@pytest.mark.asyncio
+@patch("services.chat_with_agent.chat_with_model")
+async def test_edits_in_one_turn_are_pushed_once(
+    mock_chat_with_model, create_test_base_args
+):
+    mock_chat_with_model.return_value = make_tool_call_result(
+        [
+            ("write_and_commit_file", {"file_path": "a.py", "file_content": "x"}),
+            ("write_and_commit_file", {"file_path": "b.py", "file_content": "y"}),
+            ("get_local_file_content", {"file_path": "a.py"}),
+        ]
+    )
+    events: list[str] = []
+
+    def fake_write(**kwargs):
+        events.append(f"write defer_push={kwargs['base_args']['defer_push']}")
+        kwargs["base_args"]["has_unpushed_commits"] = True
+        return FileWriteResult(
+            success=True,
+            message="ok",
+            file_path=kwargs["file_path"],
+            content=kwargs["file_content"],
+        )
+
+    def fake_read(**kwargs):
+        events.append(f"read defer_push={kwargs['base_args']['defer_push']}")
+        return "content"
+
+    def fake_push(_base_args):
+        events.append("push")
+        return GitCommitResult(success=True)
+
+    with patch.dict(
+        tools_module.tools_to_call,
+        {"write_and_commit_file": fake_write, "get_local_file_content": fake_read},
+        clear=False,
+    ), patch("services.chat_with_agent.update_comment"), patch(
+        "services.chat_with_agent.push_pending_commits", side_effect=fake_push
+    ):
+        base_args = create_test_base_args(model_id=ClaudeModelId.SONNET_4_6)
+        result = await chat_with_agent(
+            messages=[{"role": "user", "content": "edit two files"}],
+            system_message="test",
+            base_args=base_args,
+            tools=[],
+            usage_id=1,
+            model_id=ClaudeModelId.SONNET_4_6,
+        )
+
+    assert events == [
+        "write defer_push=True",
+        "write defer_push=True",
+        "read defer_push=False",
+        "push",
+    ]
+    assert base_args["defer_push"] is False
+    assert result.concurrent_push_detected is False
+
+
+@pytest.mark.asyncio
+@patch("services.chat_with_agent.chat_with_model")
+async def test_edits_are_pushed_when_a_later_tool_raises(
+    mock_chat_with_model, create_test_base_args
+):
+    mock_chat_with_model.return_value = make_tool_call_result(
+        [
+            ("write_and_commit_file", {"file_path": "a.py", "file_content": "x"}),
+            ("get_local_file_content", {"file_path": "a.py"}),
+        ]
+    )
+    events: list[str] = []
+
+    def fake_write(**kwargs):
+        events.append("write")
+        kwargs["base_args"]["has_unpushed_commits"] = True
+        return FileWriteResult(
+            success=True,
+            message="ok",
+            file_path=kwargs["file_path"],
+            content=kwargs["file_content"],
+        )
+
+    def fake_read(**_kwargs):
+        events.append("read")
+        raise RuntimeError("boom")
+
+    def fake_push(_base_args):
+        events.append("push")
+        return GitCommitResult(success=True)
+
+    with patch.dict(
+        tools_module.tools_to_call,
+        {"write_and_commit_file": fake_write, "get_local_file_content": fake_read},
+        clear=False,
+    ), patch("services.chat_with_agent.update_comment"), patch(
+        "services.chat_with_agent.push_pending_commits", side_effect=fake_push
+    ), pytest.raises(
+        RuntimeError, match="boom"
+    ):
+        await chat_with_agent(
+            messages=[{"role": "user", "content": "edit a file"}],
+            system_message="test",
+            base_args=create_test_base_args(model_id=ClaudeModelId.SONNET_4_6),
+            tools=[],
+            usage_id=1,
+            model_id=ClaudeModelId.SONNET_4_6,
+        )
+
+    assert events == ["write", "read", "push"]
+
+
+@pytest.mark.asyncio
+@patch("services.chat_with_agent.chat_with_model")
+async def test_deferred_edits_are_pushed_before_verify(
+    mock_chat_with_model, create_test_base_args
+):
+    mock_chat_with_model.return_value = make_tool_call_result(
+        [
+            ("write_and_commit_file", {"file_path": "a.py", "file_content": "x"}),
+            ("verify_task_is_complete", {}),
+        ]
+    )
+    events: list[str] = []
+
+    def fake_write(**_kwargs):
+        events.append("write")
+        return FileWriteResult(
+            success=True, message="ok", file_path="a.py", content="x"
+        )
+
+    def fake_verify(**_kwargs):
+        events.append("verify")
+        return "verified"
+
+    def fake_push(_base_args):
+        events.append("push")
+        return GitCommitResult(success=True)
+
+    with patch.dict(
+        tools_module.tools_to_call,
+        {"write_and_commit_file": fake_write, "verify_task_is_complete": fake_verify},
+        clear=False,
+    ), patch("services.chat_with_agent.update_comment"), patch(
+        "services.chat_with_agent.push_pending_commits", side_effect=fake_push
+    ):
+        await chat_with_agent(
+            messages=[{"role": "user", "content": "edit and verify"}],
+            system_message="test",
+            base_args=create_test_base_args(model_id=ClaudeModelId.SONNET_4_6),
+            tools=[],
+            usage_id=1,
+            model_id=ClaudeModelId.SONNET_4_6,
+        )
+
+    assert events == ["write", "push", "verify", "push"]
+
+
+@pytest.mark.asyncio
+@patch("services.chat_with_agent.chat_with_model")
+async def test_concurrent_push_on_deferred_flush_skips_verify(
+    mock_chat_with_model, create_test_base_args
+):
+    mock_chat_with_model.return_value = make_tool_call_result(
+        [
+            ("write_and_commit_file", {"file_path": "a.py", "file_content": "x"}),
+            ("verify_task_is_complete", {}),
+        ]
+    )
+    fake_verify = Mock()
+
+    with patch.dict(
+        tools_module.tools_to_call,
+        {
+            "write_and_commit_file": Mock(
+                return_value=FileWriteResult(
+                    success=True, message="ok", file_path="a.py", content="x"
+                )
+            ),
+            "verify_task_is_complete": fake_verify,
+        },
+        clear=False,
+    ), patch("services.chat_with_agent.update_comment"), patch(
+        "services.chat_with_agent.push_pending_commits",
+        return_value=GitCommitResult(success=False, concurrent_push_detected=True),
+    ) as mock_push:
+        result = await chat_with_agent(
+            messages=[{"role": "user", "content": "edit and verify"}],
+            system_message="test",
+            base_args=create_test_base_args(model_id=ClaudeModelId.SONNET_4_6),
+            tools=[],
+            usage_id=1,
+            model_id=ClaudeModelId.SONNET_4_6,
+        )
+
+    fake_verify.assert_not_called()
+    mock_push.assert_called_once()
+    assert result.concurrent_push_detected is True
+    tool_results = result.messages[-1]["content"]
+    assert isinstance(tool_results, list)
+    assert tool_results[-1]["content"].startswith("Concurrent push detected")
+
+
+@pytest.mark.asyncio
+@patch("services.chat_with_agent.chat_with_model")
+async def test_read_only_calls_run_concurrently_and_keep_result_order(
+    mock_chat_with_model, create_test_base_args
+):
+    mock_chat_with_model.return_value = make_tool_call_result(
+        [
+            ("query_file", {"file_path": "a.py", "prompt": "?"}),
+            ("query_file", {"file_path": "b.py", "prompt": "?"}),
+            ("write_and_commit_file", {"file_path": "a.py", "file_content": "x"}),
+            ("query_file", {"file_path": "a.py", "prompt": "after write?"}),
+        ]
+    )
+    # The two leading queries only get past the barrier if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    events: list[str] = []
+
+    def fake_query(file_path, prompt, **_kwargs):
+        if prompt == "?":
+            barrier.wait()
+        events.append(f"query {file_path} {prompt}")
+        return f"answer {file_path} {prompt}"
+
+    def fake_write(**_kwargs):
+        events.append("write")
+        return FileWriteResult(
+            success=True, message="ok", file_path="a.py", content="x"
+        )
+
+    with patch.dict(
+        tools_module.tools_to_call,
+        {"query_file": fake_query, "write_and_commit_file": fake_write},
+        clear=False,
+    ), patch("services.chat_with_agent.update_comment"):
+        result = await chat_with_agent(
+            messages=[{"role": "user", "content": "read then edit"}],
+            system_message="test",
+            base_args=create_test_base_args(model_id=ClaudeModelId.SONNET_4_6),
+            tools=[],
+            usage_id=1,
+            model_id=ClaudeModelId.SONNET_4_6,
+        )
+
+    # The read issued after the edit waits for it
+    assert events[2:] == ["write", "query a.py after write?"]
+    tool_results = result.messages[-1]["content"]
+    assert isinstance(tool_results, list)
+    assert [block["tool_use_id"] for block in tool_results] == [
+        "call_0",
+        "call_1",
+        "call_2",
+        "call_3",
+    ]
+    assert tool_results[0]["content"] == "answer a.py ?"
+    assert tool_results[1]["content"] == "answer b.py ?"
+    assert tool_results[3]["content"] == "answer a.py after write?"
+
+
+@pytest.mark.asyncio
+@patch("services.chat_with_agent.update_comment")
+@patch("services.chat_with_agent.chat_with_model")
+async def test_read_only_call_starts_while_response_is_still_streaming(
+    mock_chat_with_model, mock_update_comment, create_test_base_args
+):
+    result_to_return = make_tool_call_result(
+        [
+            ("query_file", {"file_path": "a.py", "prompt": "?"}),
+            ("write_and_commit_file", {"file_path": "a.py", "file_content": "x"}),
+        ]
+    )
+    query_started = threading.Event()
+    events: list[str] = []
+
+    def fake_chat_with_model(on_tool_call, **_kwargs):
+        # Hand over each block the way a stream would, then keep "generating" until the query is running
+        assert on_tool_call(result_to_return.tool_calls[0]) is True
+        assert query_started.wait(timeout=5)
+        events.append("model done")
+        assert on_tool_call(result_to_return.tool_calls[1]) is False
+        return result_to_return
+
+    mock_chat_with_model.side_effect = fake_chat_with_model
+    query = Mock(side_effect=lambda **_kwargs: query_started.set() or "answer a.py")
+
+    def fake_write(**_kwargs):
+        events.append("write")
+        return FileWriteResult(
+            success=True, message="ok", file_path="a.py", content="x"
+        )
+
+    with patch.dict(
+        tools_module.tools_to_call,
+        {"query_file": query, "write_and_commit_file": fake_write},
+        clear=False,
+    ):
+        result = await chat_with_agent(
+            messages=[{"role": "user", "content": "read then edit"}],
+            system_message="test",
+            base_args=create_test_base_args(model_id=ClaudeModelId.SONNET_4_6),
+            tools=[],
+            usage_id=1,
+            model_id=ClaudeModelId.SONNET_4_6,
+        )
+
+    # Started once, early; the dispatch loop reused its result instead of running it again
+    query.assert_called_once()
+    assert events == ["model done", "write"]
+    tool_results = result.messages[-1]["content"]
+    assert isinstance(tool_results, list)
+    assert [block["tool_use_id"] for block in tool_results] == ["call_0", "call_1"]
+    assert tool_results[0]["content"] == "answer a.py"
+    # Progress comment went out on the first streamed block, then once more at the end of the turn
+    assert mock_update_comment.call_count == 2
+    early_body = mock_update_comment.call_args_list[0].kwargs["body"]
+    assert early_body.splitlines()[-1] == "Calling `query_file()`..."
@@ -1,9 +1,8 @@
 import os
-import subprocess
 from dataclasses import dataclass
 
-from constants.aws import SUBPROCESS_TIMEOUT_SECONDS
 from services.types.base_args import BaseArgs
+from utils.command.run_subprocess_async import run_subprocess_async
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -60,14 +59,7 @@ async def run_tsc_check(*, base_args: BaseArgs, file_paths: list[str]):
     cmd = [tsc_bin, "--noEmit", "--incremental", "false", "-p", tsconfig]
     logger.info("tsc: Running type check with %s...", tsconfig)
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT_SECONDS,
-        check=False,
-        cwd=clone_dir,
-    )
+    result = await run_subprocess_async(cmd, cwd=clone_dir)
 
     if result.returncode == 0:
         logger.info("tsc: No type errors found")
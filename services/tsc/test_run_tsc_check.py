@@ -8,7 +8,7 @@ from services.tsc.run_tsc_check import run_tsc_check
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_success(
     mock_exists, mock_subprocess, create_test_base_args
@@ -68,7 +68,7 @@ async def test_run_tsc_check_no_tsconfig(mock_exists, create_test_base_args):
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_with_errors(
     mock_exists, mock_subprocess, create_test_base_args
@@ -93,7 +93,7 @@ async def test_run_tsc_check_with_errors(
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_errors_in_node_modules_excluded(
     mock_exists, mock_subprocess, create_test_base_args
@@ -139,7 +139,7 @@ async def test_run_tsc_check_no_tsc_binary(mock_exists, create_test_base_args):
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_with_empty_lines_in_output(
     mock_exists, mock_subprocess, create_test_base_args
@@ -164,7 +164,7 @@ async def test_run_tsc_check_with_empty_lines_in_output(
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_disables_incremental(
     mock_exists, mock_subprocess, create_test_base_args
@@ -186,7 +186,7 @@ async def test_run_tsc_check_disables_incremental(
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_uses_test_config_when_only_one(
     mock_exists, mock_subprocess, create_test_base_args
@@ -212,7 +212,7 @@ async def test_run_tsc_check_uses_test_config_when_only_one(
 
 
 @pytest.mark.asyncio
-@patch("services.tsc.run_tsc_check.subprocess.run")
+@patch("services.tsc.run_tsc_check.run_subprocess_async")
 @patch("services.tsc.run_tsc_check.os.path.exists")
 async def test_run_tsc_check_uses_base_config_when_multiple_test_configs(
     mock_exists, mock_subprocess, create_test_base_args
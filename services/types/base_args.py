@@ -65,6 +65,9 @@ class BaseArgs(TypedDict):
     skip_ci: NotRequired[bool]
     last_quality_error: NotRequired[str]
     slack_thread_ts: NotRequired[str | None]
+    # Set by chat_with_agent while an edit tool runs: git_commit_and_push commits locally and push_pending_commits pushes once per turn
+    defer_push: NotRequired[bool]
+    has_unpushed_commits: NotRequired[bool]
 
 
 class ReviewBaseArgs(BaseArgs):
@@ -15,6 +15,7 @@ from constants.general import MAX_GITAUTO_COMMITS_PER_PR, MAX_INFRA_RETRIES
 from constants.messages import PERMISSION_DENIED_MESSAGE, CHECK_RUN_FAILED_MESSAGE
 from services.agents.verify_task_is_complete import verify_task_is_complete
 from services.agents.verify_task_is_ready import verify_task_is_ready
+from services.aws.s3.download_and_extract_dependency import download_and_extract_s3_deps
 from services.aws.s3.refresh_mongodb_cache import refresh_mongodb_cache
 from services.chat_with_agent import chat_with_agent
 from services.circleci.get_build_logs import get_circleci_build_logs
@@ -311,14 +312,6 @@ async def handle_check_suite(
         )
         return None
 
-    # Fire-and-forget: refresh mongodb-binaries on S3 for the next run
-    refresh_mongodb_cache(
-        owner_id=owner_id,
-        owner_name=owner_name,
-        repo_name=repo_name,
-        clone_dir=clone_dir,
-    )
-
     mergeable_state = full_pr.get("mergeable_state")
     if mergeable_state == "dirty":
         logger.info("Merging base branch, mergeable_state=%s", mergeable_state)
@@ -330,7 +323,10 @@ async def handle_check_suite(
             token=token,
         )
         git_merge_base_into_pr(
-            clone_dir=clone_dir, base_branch=base_branch, behind_by=behind_by
+            clone_dir=clone_dir,
+            clone_url=base_args["clone_url"],
+            base_branch=base_branch,
+            behind_by=behind_by,
         )
     else:
         logger.info("Skipping merge, mergeable_state=%s", mergeable_state)
@@ -352,6 +348,19 @@ async def handle_check_suite(
     )
     logger.info("php: ready=%s", php_ready)
 
+    # Extract cached dependencies only now: the ensure_* checks above move each repo pointer to the tarball built from the current manifests
+    download_and_extract_s3_deps(
+        owner_name=owner_name, repo_name=repo_name, clone_dir=clone_dir
+    )
+
+    # Fire-and-forget: refresh mongodb-binaries on S3 for the next run
+    refresh_mongodb_cache(
+        owner_id=owner_id,
+        owner_name=owner_name,
+        repo_name=repo_name,
+        clone_dir=clone_dir,
+    )
+
     # Check if CI-failed comment already exists (skip if GitAuto is already handling this PR).
     # Exception: if the LATEST CI-failed comment is from an infra retry (contains "Re-triggering CI"), proceed because CI was re-triggered and failed with real errors.
     comments = get_pr_comments(
@@ -1,5 +1,8 @@
 from services.aws.delete_scheduler import delete_scheduler
 from services.aws.get_schedulers import get_schedulers_by_owner_id
+from services.github.utils.forget_rejected_installation_token import (
+    INSTALLATION_TOKEN_CACHE,
+)
 from services.github.types.github_types import InstallationPayload
 from services.resend.get_first_name import get_first_name
 from services.resend.send_email import send_email
@@ -32,6 +35,8 @@ def handle_installation_deleted_or_suspended(payload: InstallationPayload, actio
         user_id=sender_id,
         user_name=sender_name,
     )
+    # GitHub revokes the installation's tokens, so a cached one would only produce 401s
+    INSTALLATION_TOKEN_CACHE.pop(payload["installation"]["id"], None)
 
     # Send email (deduplicated per sender)
     email_type = "uninstall" if action == "deleted" else "suspend"
@@ -12,6 +12,7 @@ from constants.agent import COST_CAP_RATIO, MAX_ITERATIONS
 from constants.messages import SETTINGS_LINKS
 from constants.triggers import NewPrTrigger
 from services.agents.verify_task_is_complete import verify_task_is_complete
+from services.aws.s3.download_and_extract_dependency import download_and_extract_s3_deps
 from services.aws.s3.refresh_mongodb_cache import refresh_mongodb_cache
 from services.agents.verify_task_is_ready import verify_task_is_ready
 from services.chat_with_agent import chat_with_agent
@@ -19,6 +20,7 @@ from services.claude.is_code_untestable import CodeAnalysisResult, is_code_untes
 from services.claude.tools.tools import TOOLS_FOR_ISSUES
 from services.git.create_empty_commit import create_empty_commit
 from services.git.get_clone_dir import get_clone_dir
+from services.git.get_repo_snapshot import get_repo_snapshot
 from services.git.clone_repo_and_install_dependencies import (
     clone_repo_and_install_dependencies,
 )
@@ -66,7 +68,6 @@ from services.webhook.utils.create_system_message import create_system_message
 from services.webhook.utils.get_preferred_model import get_preferred_model
 from services.webhook.utils.maybe_switch_to_free_model import maybe_switch_to_free_model
 from services.webhook.utils.should_bail import should_bail
-from utils.command.run_subprocess import run_subprocess
 from utils.files.detect_test_location_convention import detect_test_location_convention
 from utils.files.detect_test_naming_convention import detect_test_naming_convention
 from utils.files.find_test_files import find_test_files
@@ -413,14 +414,6 @@ async def handle_new_pr(
         clone_dir=clone_dir,
     )
 
-    # Fire-and-forget: refresh mongodb-binaries on S3 for the next run
-    refresh_mongodb_cache(
-        owner_id=owner_id,
-        owner_name=owner_name,
-        repo_name=repo_name,
-        clone_dir=clone_dir,
-    )
-
     # Install dependencies (read repo files from clone_dir, cache on S3)
     node_ready = ensure_node_packages(
         owner_id=owner_id,
@@ -446,6 +439,19 @@ async def handle_new_pr(
     )
     logger.info("python: ready=%s", python_ready)
 
+    # Extract cached dependencies only now: the ensure_* checks above move each repo pointer to the tarball built from the current manifests
+    download_and_extract_s3_deps(
+        owner_name=owner_name, repo_name=repo_name, clone_dir=clone_dir
+    )
+
+    # Fire-and-forget: refresh mongodb-binaries on S3 for the next run
+    refresh_mongodb_cache(
+        owner_id=owner_id,
+        owner_name=owner_name,
+        repo_name=repo_name,
+        clone_dir=clone_dir,
+    )
+
     # Read impl file from local clone and skip if no testable code
     impl_file_content = (
         read_local_file(file_path=impl_file_path, base_dir=clone_dir) or ""
@@ -522,10 +528,8 @@ async def handle_new_pr(
     root_files = get_local_file_tree(base_args=base_args, dir_path="")
 
     # Search for test files related to the impl file
-    ls_result = run_subprocess(args=["git", "ls-files"], cwd=clone_dir)
-    all_file_paths = (
-        ls_result.stdout.strip().split("\n") if ls_result and ls_result.stdout else []
-    )
+    snapshot = get_repo_snapshot(clone_dir)
+    all_file_paths = [file.path for file in snapshot.files] if snapshot else []
     test_file_paths = find_test_files(impl_file_path, all_file_paths, test_dir_prefixes)
     test_file_paths = prioritize_test_files(test_file_paths, impl_file_path)
     base_args["test_file_paths"] = test_file_paths
@@ -5,7 +5,7 @@ import os
 # Local imports
 from payloads.aws.setup_installed_repository_event import SetupInstalledRepositoryEvent
 from schemas.supabase.types import OwnerType
-from services.aws.clients import lambda_client
+from services.aws.get_lambda_client import get_lambda_client
 from services.github.types.repository import RepositoryAddedOrRemoved
 from services.supabase.repositories.upsert_repository import upsert_repository
 from services.webhook.setup_installed_repository import setup_installed_repository
@@ -58,7 +58,7 @@ def process_repositories(
                 "sender_display_name": sender_display_name,
             }
             logger.info("Dispatching Lambda for %s/%s", owner_name, repo["name"])
-            lambda_client.invoke(
+            get_lambda_client().invoke(
                 FunctionName=lambda_function_name,
                 InvocationType="Event",
                 Payload=json.dumps(payload),
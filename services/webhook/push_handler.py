@@ -7,6 +7,8 @@ from services.github.pulls.get_open_pull_requests import get_open_pull_requests
 from services.github.pulls.update_pull_request_branch import update_pull_request_branch
 from services.github.token.get_installation_token import get_installation_access_token
 from services.github.types.webhook.push import PushWebhookPayload
+from services.github.utils.fan_out_github_calls import fan_out_github_calls
+from services.github.utils.get_github_token_key import get_github_token_key
 from services.supabase.repositories.get_repository import get_repository
 from services.types.base_args import Platform
 from utils.error.handle_exceptions import handle_exceptions
@@ -97,11 +99,17 @@ def handle_push(payload: PushWebhookPayload):
     conflict_prs: list[int] = []
     failed_count = 0
     failures: list[str] = []
-    for pr in open_prs:
-        pr_number = pr["number"]
-        status, error = update_pull_request_branch(
+    # One PUT per PR, run concurrently within the rate limit; results come back in PR order so the summary reads the same as a sequential loop
+    results = fan_out_github_calls(
+        items=[pr["number"] for pr in open_prs],
+        call=lambda pr_number: update_pull_request_branch(
             owner=owner_name, repo=repo_name, pr_number=pr_number, token=token
-        )
+        ),
+        should_retry=lambda result: result[0] == "rate_limited",
+        token_key=get_github_token_key(token),
+    )
+    for pr, (status, error) in zip(open_prs, results):
+        pr_number = pr["number"]
         if status == "updated":
             logger.info("PR #%s branch updated", pr_number)
             updated_count += 1
@@ -15,6 +15,7 @@ from payloads.github.pull_request_review_comment.types import ReviewComment
 from services.github.types.webhook.review_run_payload import ReviewRunPayload
 from services.agents.verify_task_is_complete import verify_task_is_complete
 from services.agents.verify_task_is_ready import verify_task_is_ready
+from services.aws.s3.download_and_extract_dependency import download_and_extract_s3_deps
 from services.aws.s3.refresh_mongodb_cache import refresh_mongodb_cache
 from services.chat_with_agent import chat_with_agent
 from services.node.ensure_node_packages import ensure_node_packages
@@ -414,14 +415,6 @@ async def handle_review_run(
         )
         return None
 
-    # Fire-and-forget: refresh mongodb-binaries on S3 for the next run
-    refresh_mongodb_cache(
-        owner_id=owner_id,
-        owner_name=owner_name,
-        repo_name=repo_name,
-        clone_dir=clone_dir,
-    )
-
     # Webhook payload doesn't include mergeable_state, so fetch the full PR from REST API
     full_pr = get_pull_request(
         owner=owner_name, repo=repo_name, pr_number=pr_number, token=token
@@ -437,7 +430,10 @@ async def handle_review_run(
             token=token,
         )
         git_merge_base_into_pr(
-            clone_dir=clone_dir, base_branch=base_branch, behind_by=behind_by
+            clone_dir=clone_dir,
+            clone_url=base_args["clone_url"],
+            base_branch=base_branch,
+            behind_by=behind_by,
         )
     else:
         logger.info("Skipping merge, mergeable_state=%s", mergeable_state)
@@ -459,6 +455,19 @@ async def handle_review_run(
     )
     logger.info("php: ready=%s", php_ready)
 
+    # Extract cached dependencies only now: the ensure_* checks above move each repo pointer to the tarball built from the current manifests
+    download_and_extract_s3_deps(
+        owner_name=owner_name, repo_name=repo_name, clone_dir=clone_dir
+    )
+
+    # Fire-and-forget: refresh mongodb-binaries on S3 for the next run
+    refresh_mongodb_cache(
+        owner_id=owner_id,
+        owner_name=owner_name,
+        repo_name=repo_name,
+        clone_dir=clone_dir,
+    )
+
     # Greeting and progress tracking (skip for bots to avoid triggering bot-to-bot noise)
     p = 0
     log_messages: list[str] = []
@@ -1,19 +1,14 @@
 # Standard imports
 import hashlib
+import time
 from datetime import datetime, timezone
 
 # Local imports
 from config import PRODUCT_ID
 from constants.testing import (
     PERMANENT_EXCLUSION_REASONS,
-    REASON_CONFIG,
-    REASON_DEPENDENCY,
     REASON_EMPTY,
-    REASON_MIGRATION,
-    REASON_NOT_CODE,
     REASON_ONLY_EXPORTS,
-    REASON_TEST,
-    REASON_TYPE,
 )
 from payloads.aws.event_bridge_scheduler.event_types import EventBridgeSchedulerEvent
 from schemas.supabase.types import Coverages, CoveragesInsert
@@ -37,8 +32,11 @@ from services.github.pulls.get_open_pull_requests import get_open_pull_requests
 from services.github.token.get_installation_token import get_installation_access_token
 from services.github.users.get_email_from_commits import get_email_from_commits
 from services.github.users.get_user_public_email import get_user_public_info
-from services.supabase.coverages.exclude_from_testing import exclude_from_testing
+from services.supabase.coverages.bulk_exclude_from_testing import (
+    bulk_exclude_from_testing,
+)
 from services.supabase.coverages.get_all_coverages import get_all_coverages
+from services.supabase.coverages.get_coverages import get_coverages
 from services.supabase.coverages.insert_coverages import insert_coverages
 from services.supabase.coverages.update_issue_url import update_issue_url
 from services.supabase.coverages.update_quality_checks import update_quality_checks
@@ -51,14 +49,12 @@ from services.supabase.credits.check_purchase_exists import check_purchase_exist
 from services.types.base_args import BaseArgs
 from services.webhook.utils.get_preferred_model import get_preferred_model
 from utils.error.handle_exceptions import handle_exceptions
-from utils.files.find_test_files import find_test_files
+from utils.files.build_test_file_index import build_test_file_index
+from utils.files.find_test_files_in_index import find_test_files_in_index
+from utils.files.get_path_exclusion_reason import get_path_exclusion_reason
 from utils.files.read_local_file import read_local_file
 from utils.files.is_code_file import is_code_file
-from utils.files.is_config_file import is_config_file
-from utils.files.is_dependency_file import is_dependency_file
-from utils.files.is_migration_file import is_migration_file
 from utils.files.is_test_file import is_test_file
-from utils.files.is_type_file import is_type_file
 from utils.files.should_skip_test import should_skip_test
 from utils.generate_branch_name import generate_branch_name
 from utils.logging.logging_config import logger, set_trigger
@@ -68,6 +64,20 @@ from utils.quality_checks.get_checklist_hash import get_checklist_hash
 from utils.quality_checks.needs_reevaluation import needs_quality_reevaluation
 from utils.text.text_copy import git_command
 
+# What candidate selection reads for every file. uncovered_lines/functions/branches (large text) are only needed for the chosen target and are loaded for it alone.
+CANDIDATE_COVERAGE_COLUMNS = [
+    "id",
+    "statement_coverage",
+    "function_coverage",
+    "branch_coverage",
+    "is_excluded_from_testing",
+    "exclusion_reason",
+    "impl_blob_sha",
+    "test_blob_sha",
+    "checklist_hash",
+    "quality_checks",
+]
+
 
 @handle_exceptions(raise_on_error=True)
 def schedule_handler(event: EventBridgeSchedulerEvent):
@@ -184,6 +194,10 @@ def schedule_handler(event: EventBridgeSchedulerEvent):
         if item["type"] == "blob"  # Only files
     ]
     all_file_paths = [fp for fp, _ in all_files_with_sizes]
+    # Built once per run; the candidate loops below look up every coverage row against it
+    test_file_index = build_test_file_index(
+        all_file_paths, repo_settings.get("test_dir_prefixes")
+    )
 
     # Build blob SHA lookup from tree (free, already fetched)
     blob_sha_map: dict[str, str] = {
@@ -191,15 +205,20 @@ def schedule_handler(event: EventBridgeSchedulerEvent):
     }
 
     all_coverages = get_all_coverages(
-        platform="github", owner_id=owner_id, repo_id=repo_id
+        platform="github",
+        owner_id=owner_id,
+        repo_id=repo_id,
+        columns=CANDIDATE_COVERAGE_COLUMNS,
     )
 
-    # all_files LEFT JOIN all_coverages
+    # all_files LEFT JOIN all_coverages, hashed on full_path (first row wins like the old linear scan)
+    coverages_by_path: dict[str, Coverages] = {}
+    for c in all_coverages:
+        coverages_by_path.setdefault(c["full_path"], c)
+
     enriched_all_files: list[Coverages] = []
     for file_path, file_size in all_files_with_sizes:
-        coverages = next(
-            (c for c in all_coverages if c["full_path"] == file_path), None
-        )
+        coverages = coverages_by_path.get(file_path)
         if coverages:
             logger.debug("Enriching existing coverage row for %s", file_path)
             coverages["file_size"] = file_size
@@ -306,204 +325,125 @@ def schedule_handler(event: EventBridgeSchedulerEvent):
         )
     )
 
-    # Get open PRs once before the loop
-    open_prs = get_open_pull_requests(owner=owner_name, repo=repo_name, token=token)
+    # Path-only checks over every candidate in one pass. Exclusions are buffered and written with a single upsert after Phase 1 instead of one round trip per skipped file.
+    pending_exclusions: list[tuple[str, str, str | None]] = []
+    classify_start = time.perf_counter()
+    path_reasons = {
+        item["full_path"]: get_path_exclusion_reason(item["full_path"])
+        for item in files_needing_coverage
+        if not item.get("is_excluded_from_testing")
+    }
+    classify_seconds = time.perf_counter() - classify_start
+    logger.info(
+        "Classified %d files in %.3fs (%.0f files/s)",
+        len(path_reasons),
+        classify_seconds,
+        len(path_reasons) / classify_seconds if classify_seconds else 0.0,
+    )
+    for file_path, path_reason in path_reasons.items():
+        if path_reason:
+            logger.info("Skipping %s: %s", file_path, path_reason)
+            pending_exclusions.append((file_path, path_reason, None))
 
-    # --- Phase 1: Find first file needing coverage improvement (PRIMARY) ---
     target_item = None
     target_test_file_paths: list[str] = []
     quality_only = False
-    for item in files_needing_coverage:
-        item_path = item["full_path"]
-        logger.info(
-            "Evaluating %s (stmt=%s, func=%s, branch=%s)",
-            item_path,
-            item["statement_coverage"],
-            item["function_coverage"],
-            item["branch_coverage"],
-        )
+    # Flush in finally: an exception mid-loop (GitHub, LLM, file read) must not drop exclusions already decided, the LLM-judged ones in particular since they cost a call each
+    try:
+        # Get open PRs once before the loop
+        open_prs = get_open_pull_requests(owner=owner_name, repo=repo_name, token=token)
 
-        # Skip files excluded from testing first (avoid unnecessary work)
-        if item.get("is_excluded_from_testing"):
-            logger.info("Skipping %s: excluded from testing", item_path)
-            continue
-
-        # Skip non-code files
-        if not is_code_file(item_path):
-            logger.info("Skipping %s: not a code file", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_NOT_CODE,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip third-party dependency files (e.g. vendor/, node_modules/)
-        if is_dependency_file(item_path):
-            logger.info("Skipping %s: third-party dependency", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_DEPENDENCY,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip test files
-        if is_test_file(item_path):
-            logger.info("Skipping %s: test file", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_TEST,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip config files
-        if is_config_file(item_path):
-            logger.info("Skipping %s: config file", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_CONFIG,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip types files
-        if is_type_file(item_path):
-            logger.info("Skipping %s: type file", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_TYPE,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip migration files
-        if is_migration_file(item_path):
-            logger.info("Skipping %s: migration file", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_MIGRATION,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip files that only contain exports/re-exports or are empty
-        content = read_local_file(file_path=item_path, base_dir=clone_dir)
-        # Skip empty files or files with only whitespace
-        if not content or not content.strip():
-            logger.info("Skipping %s: empty content", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_EMPTY,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip files that should be skipped based on content
-        if should_skip_test(item_path, content):
-            logger.info("Skipping %s: should_skip_test=True", item_path)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=REASON_ONLY_EXPORTS,
-                updated_by=user_name,
-                impl_blob_sha=None,
-            )
-            continue
-
-        # Skip files that have open PRs (temporary, don't exclude)
-        matching_pr = next(
-            (pr for pr in open_prs if item_path in pr.get("title", "")), None
-        )
-        if matching_pr:
+        # --- Phase 1: Find first file needing coverage improvement (PRIMARY) ---
+        for item in files_needing_coverage:
+            item_path = item["full_path"]
             logger.info(
-                "Skipping %s: has open PR #%s (%s)",
+                "Evaluating %s (stmt=%s, func=%s, branch=%s)",
                 item_path,
-                matching_pr.get("number"),
-                matching_pr.get("base", {}).get("ref"),
+                item["statement_coverage"],
+                item["function_coverage"],
+                item["branch_coverage"],
             )
-            continue
 
-        # Check if a test file already exists for this source file
-        test_dir_prefixes = repo_settings.get("test_dir_prefixes")
-        test_file_paths = find_test_files(item_path, all_file_paths, test_dir_prefixes)
+            # Skip files excluded from testing first (avoid unnecessary work)
+            if item.get("is_excluded_from_testing"):
+                logger.info("Skipping %s: excluded from testing", item_path)
+                continue
 
-        # If tests already exist, the file is proven testable - skip AI evaluation
-        if test_file_paths:
-            logger.info(
-                "Selected %s: existing tests found, skipping AI evaluation",
-                item_path,
+            # Not code, dependency, test, config, type or migration file (already queued for exclusion above)
+            if path_reasons.get(item_path):
+                logger.debug("Skipping %s: %s", item_path, path_reasons[item_path])
+                continue
+
+            # Skip files that only contain exports/re-exports or are empty
+            content = read_local_file(file_path=item_path, base_dir=clone_dir)
+            # Skip empty files or files with only whitespace
+            if not content or not content.strip():
+                logger.info("Skipping %s: empty content", item_path)
+                pending_exclusions.append((item_path, REASON_EMPTY, None))
+                continue
+
+            # Skip files that should be skipped based on content
+            if should_skip_test(item_path, content):
+                logger.info("Skipping %s: should_skip_test=True", item_path)
+                pending_exclusions.append((item_path, REASON_ONLY_EXPORTS, None))
+                continue
+
+            # Skip files that have open PRs (temporary, don't exclude)
+            matching_pr = next(
+                (pr for pr in open_prs if item_path in pr.get("title", "")), None
             )
-            target_item = item
-            target_test_file_paths = test_file_paths
-            break
+            if matching_pr:
+                logger.info(
+                    "Skipping %s: has open PR #%s (%s)",
+                    item_path,
+                    matching_pr.get("number"),
+                    matching_pr.get("base", {}).get("ref"),
+                )
+                continue
 
-        # Final check: Use Claude AI to determine if this file should be tested (expensive, so run last)
-        eval_result = evaluate_condition(
-            content=f"File path: {item_path}\n\nContent:\n{content}",
-            system_prompt=SHOULD_TEST_FILE_PROMPT,
-            usage_id=usage_id,
-            created_by=created_by,
-        )
-        should_test, reason = eval_result.result, eval_result.reason
-        if not should_test:
-            logger.info("Skipping %s: %s", item_path, reason)
-            exclude_from_testing(
-                platform="github",
-                owner_id=owner_id,
-                repo_id=repo_id,
-                full_path=item_path,
-                branch_name=target_branch,
-                exclusion_reason=reason,
-                updated_by=user_name,
-                impl_blob_sha=blob_sha_map.get(item_path),
+            # Check if a test file already exists for this source file
+            test_file_paths = find_test_files_in_index(test_file_index, item_path)
+
+            # If tests already exist, the file is proven testable - skip AI evaluation
+            if test_file_paths:
+                logger.info(
+                    "Selected %s: existing tests found, skipping AI evaluation",
+                    item_path,
+                )
+                target_item = item
+                target_test_file_paths = test_file_paths
+                break
+
+            # Final check: Use Claude AI to determine if this file should be tested (expensive, so run last)
+            eval_result = evaluate_condition(
+                content=f"File path: {item_path}\n\nContent:\n{content}",
+                system_prompt=SHOULD_TEST_FILE_PROMPT,
+                usage_id=usage_id,
+                created_by=created_by,
             )
-            continue
+            should_test, reason = eval_result.result, eval_result.reason
+            if not should_test:
+                logger.info("Skipping %s: %s", item_path, reason)
+                pending_exclusions.append(
+                    (item_path, reason, blob_sha_map.get(item_path))
+                )
+                continue
 
-        # Found the best suitable file (no existing tests, AI says testable)
-        logger.info("Selected %s: %s", item_path, reason)
-        target_item = item
-        target_test_file_paths = []
-        break
+            # Found the best suitable file (no existing tests, AI says testable)
+            logger.info("Selected %s: %s", item_path, reason)
+            target_item = item
+            target_test_file_paths = []
+            break
+    finally:
+        logger.info("Writing %d exclusions", len(pending_exclusions))
+        bulk_exclude_from_testing(
+            platform="github",
+            owner_id=owner_id,
+            repo_id=repo_id,
+            branch_name=target_branch,
+            updated_by=user_name,
+            exclusions=pending_exclusions,
+        )
 
     # --- Phase 2: If no coverage target, find first file needing quality checks ---
     quality_results: dict[str, dict[str, dict[str, str]]] | None = None
@@ -540,10 +480,7 @@ def schedule_handler(event: EventBridgeSchedulerEvent):
 
             # Check if quality re-evaluation is needed
             current_impl_sha = blob_sha_map.get(item_path, "")
-            test_dir_prefixes = repo_settings.get("test_dir_prefixes")
-            test_file_paths = find_test_files(
-                item_path, all_file_paths, test_dir_prefixes
-            )
+            test_file_paths = find_test_files_in_index(test_file_index, item_path)
             # Combined hash of all test file SHAs — any test change triggers re-eval
             test_shas = sorted(
                 blob_sha_map[tp] for tp in test_file_paths if tp in blob_sha_map
@@ -646,6 +583,21 @@ def schedule_handler(event: EventBridgeSchedulerEvent):
 
     # --- Build PR title and body ---
     target_path = target_item["full_path"]
+    if target_item["id"]:
+        # Candidates only carry CANDIDATE_COVERAGE_COLUMNS; the PR body needs the full row
+        full_row = get_coverages(
+            platform="github",
+            owner_id=owner_id,
+            repo_id=repo_id,
+            filenames=[target_path],
+        ).get(target_path)
+        if full_row:
+            logger.info("Loaded full coverage row for %s", target_path)
+            # file_size was refreshed from the tree above
+            full_row["file_size"] = target_item["file_size"]
+            target_item = full_row
+        else:
+            logger.warning("Full coverage row for %s unavailable", target_path)
     has_existing_tests = bool(target_test_file_paths)
 
     title = get_pr_title(
@@ -663,10 +615,10 @@ def schedule_handler(event: EventBridgeSchedulerEvent):
         statement_coverage=target_item["statement_coverage"],
         function_coverage=target_item["function_coverage"],
         branch_coverage=target_item["branch_coverage"],
-        line_coverage=target_item["line_coverage"],
-        uncovered_lines=target_item["uncovered_lines"],
-        uncovered_functions=target_item["uncovered_functions"],
-        uncovered_branches=target_item["uncovered_branches"],
+        line_coverage=target_item.get("line_coverage"),
+        uncovered_lines=target_item.get("uncovered_lines"),
+        uncovered_functions=target_item.get("uncovered_functions"),
+        uncovered_branches=target_item.get("uncovered_branches"),
         quality_checks=quality_results,
     )
 
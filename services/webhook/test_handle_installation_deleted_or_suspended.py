@@ -5,6 +5,10 @@ from unittest.mock import patch
 
 import pytest
 
+from services.github.utils.forget_rejected_installation_token import (
+    INSTALLATION_TOKEN_CACHE,
+    InstallationToken,
+)
 from services.github.types.github_types import InstallationPayload
 from services.webhook.handle_installation_deleted_or_suspended import (
     handle_installation_deleted_or_suspended,
@@ -200,3 +204,33 @@ def test_schedulers_deleted(
 
     mock_get_schedulers.assert_called_once_with(11111)
     assert mock_delete_scheduler.call_count == 2
+
+
+@pytest.mark.parametrize("action", ["deleted", "suspend"])
+@patch(
+    "services.webhook.handle_installation_deleted_or_suspended.get_schedulers_by_owner_id",
+    return_value=[],
+)
+@patch(
+    "services.webhook.handle_installation_deleted_or_suspended.insert_email_send",
+    return_value=False,
+)
+@patch("services.webhook.handle_installation_deleted_or_suspended.delete_installation")
+@patch("services.webhook.handle_installation_deleted_or_suspended.slack_notify")
+def test_cached_installation_token_dropped(
+    _mock_slack,
+    _mock_delete_inst,
+    _mock_insert_email,
+    _mock_get_schedulers,
+    action,
+):
+    other: InstallationToken = {"token": "ghs_other", "expires_at": 3600.0}
+    INSTALLATION_TOKEN_CACHE[12345] = {"token": "ghs_revoked", "expires_at": 3600.0}
+    INSTALLATION_TOKEN_CACHE[99999] = other
+
+    handle_installation_deleted_or_suspended(
+        payload=cast(InstallationPayload, _make_payload(action)), action=action
+    )
+
+    assert dict(INSTALLATION_TOKEN_CACHE) == {99999: other}
+    INSTALLATION_TOKEN_CACHE.clear()
@@ -3,8 +3,9 @@
 
 import inspect
 import json
+from types import SimpleNamespace
 from typing import cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -20,6 +21,12 @@ def _mock_refresh_mongodb_cache():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _mock_download_and_extract_s3_deps():
+    with patch("services.webhook.new_pr_handler.download_and_extract_s3_deps"):
+        yield
+
+
 def test_handle_new_pr_signature():
     """Test that handle_new_pr has the expected signature with lambda_info parameter"""
 
@@ -444,9 +451,7 @@ async def test_image_base64_fetch_failed(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -491,7 +496,7 @@ async def test_timeout_approaching_breaks_loop(
     mock_chat_with_agent,
     mock_get_pr_files,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -519,9 +524,7 @@ async def test_timeout_approaching_breaks_loop(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -566,7 +569,7 @@ async def test_branch_deleted_breaks_loop(
     mock_chat_with_agent,
     mock_get_pr_files,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -594,9 +597,7 @@ async def test_branch_deleted_breaks_loop(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -646,7 +647,7 @@ async def test_retry_loop_exhausted_not_explored_but_committed(
     mock_verify_task_is_complete,
     mock_maybe_switch,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_maybe_switch.side_effect = lambda **kwargs: kwargs["model_id"]
     mock_deconstruct.return_value = (_get_base_args(), None)
@@ -786,9 +787,7 @@ async def test_retry_loop_exhausted_not_explored_but_committed(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -836,7 +835,7 @@ async def test_retry_loop_exhausted_explored_but_not_committed(
     mock_get_pr_files,
     mock_verify_task_is_complete,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -960,9 +959,7 @@ async def test_retry_loop_exhausted_explored_but_not_committed(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1007,7 +1004,7 @@ async def test_retry_counter_reset_on_successful_loop(
     mock_chat_with_agent,
     mock_get_pr_files,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -1066,9 +1063,7 @@ async def test_retry_counter_reset_on_successful_loop(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1117,7 +1112,7 @@ async def test_non_test_file_skipped_in_header_merge(
     mock_get_pr_files,
     mock_is_test_file,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -1155,9 +1150,7 @@ async def test_non_test_file_skipped_in_header_merge(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1210,7 +1203,7 @@ async def test_test_file_header_merge(
     mock_merge_headers,
     mock_replace_remote,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -1251,9 +1244,7 @@ async def test_test_file_header_merge(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1306,7 +1297,7 @@ async def test_test_file_header_merge_no_content(
     mock_merge_headers,
     mock_replace_remote,
     mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -1354,9 +1345,7 @@ async def test_test_file_header_merge_no_content(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1409,7 +1398,7 @@ async def test_test_file_header_merge_no_change(
     mock_merge_headers,
     mock_replace_remote,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -1454,9 +1443,7 @@ async def test_test_file_header_merge_no_change(
 @patch("services.webhook.new_pr_handler.insert_email_send", return_value=True)
 @patch("services.webhook.new_pr_handler.send_email")
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1509,7 +1496,7 @@ async def test_credits_depleted_email_sent(
     mock_get_user,
     mock_get_email_text,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
     mock_send_email,
     _mock_insert_email_send,
     _mock_update_email_send,
@@ -1558,9 +1545,7 @@ async def test_credits_depleted_email_sent(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -1603,7 +1588,7 @@ async def test_new_pr_handler_token_accumulation(
     mock_should_bail,
     mock_insert_credit,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     """Test that PR handler accumulates tokens correctly and calls update_usage"""
     mock_get_pull_request_files.return_value = []
@@ -1738,9 +1723,7 @@ async def test_new_pr_handler_token_accumulation(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch("services.webhook.new_pr_handler.insert_credit")
 @patch("services.webhook.new_pr_handler.should_bail", return_value=False)
 @patch("services.webhook.new_pr_handler.create_empty_commit")
@@ -1782,7 +1765,7 @@ async def test_few_test_files_include_contents_in_prompt(
     mock_create_empty_commit,
     mock_should_bail,
     mock_insert_credit,
-    _mock_run_subprocess,
+    mock_get_repo_snapshot,
 ):
     mock_deconstruct_github_payload.return_value = (
         {
@@ -1822,6 +1805,9 @@ async def test_few_test_files_include_contents_in_prompt(
     mock_get_owner.return_value = {"id": 456, "credit_balance_usd": 100}
     mock_create_user_request.return_value = 999
 
+    mock_get_repo_snapshot.return_value = SimpleNamespace(
+        files=[SimpleNamespace(path="src/logger.ts"), SimpleNamespace(path="README.md")]
+    )
     # Return 3 test files (<=5 threshold) and no related source files
     mock_find_test_files.return_value = [
         "tests/test_logger.ts",
@@ -1873,6 +1859,9 @@ async def test_few_test_files_include_contents_in_prompt(
 
     await handle_new_pr(payload=payload, trigger="dashboard")
 
+    # Test file lookup reads the repo snapshot instead of running git ls-files
+    assert mock_find_test_files.call_args.args[1] == ["src/logger.ts", "README.md"]
+
     # Verify test file paths listed in JSON and contents as separate messages
     call_kwargs = mock_chat_with_agent.call_args.kwargs
     messages = call_kwargs["messages"]
@@ -1891,9 +1880,7 @@ async def test_few_test_files_include_contents_in_prompt(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch("services.webhook.new_pr_handler.insert_credit")
 @patch("services.webhook.new_pr_handler.should_bail", return_value=False)
 @patch("services.webhook.new_pr_handler.create_empty_commit")
@@ -1935,7 +1922,7 @@ async def test_many_test_files_include_paths_only_in_prompt(
     mock_create_empty_commit,
     mock_should_bail,
     mock_insert_credit,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct_github_payload.return_value = (
         {
@@ -2042,9 +2029,7 @@ async def test_many_test_files_include_paths_only_in_prompt(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch("services.webhook.new_pr_handler.insert_credit")
 @patch("services.webhook.new_pr_handler.should_bail", return_value=False)
 @patch("services.webhook.new_pr_handler.create_empty_commit")
@@ -2088,7 +2073,7 @@ async def test_auto_detect_location_ignores_dashboard_setting(
     mock_create_empty_commit,
     mock_should_bail,
     mock_insert_credit,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     # Auto-detection returns "separate" even though dashboard says "Co-located"
     mock_detect_location.return_value = (
@@ -2205,9 +2190,7 @@ async def test_reuses_existing_usage_row_when_present(
 
 
 @pytest.mark.asyncio
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 @patch(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
@@ -2262,7 +2245,7 @@ async def test_reuse_branch_skips_create_and_charges_existing_usage_id(
     mock_get_user,
     mock_get_email_text,
     _mock_read_local_file,
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
 ):
     mock_deconstruct.return_value = (_get_base_args(), None)
     mock_render_text.return_value = "Rendered body"
@@ -2356,11 +2339,9 @@ async def test_reuse_branch_skips_create_and_charges_existing_usage_id(
     "services.webhook.new_pr_handler.read_local_file",
     return_value="def calculate():\n    return 1 + 2\n",
 )
-@patch(
-    "services.webhook.new_pr_handler.run_subprocess", return_value=MagicMock(stdout="")
-)
+@patch("services.webhook.new_pr_handler.get_repo_snapshot", return_value=None)
 async def test_insert_branch_runs_when_no_existing_usage_row(
-    _mock_run_subprocess,
+    _mock_get_repo_snapshot,
     _mock_read_local_file,
     mock_get_email_text,
     mock_get_user,
@@ -1,9 +1,11 @@
 # pyright: reportUnusedVariable=false
 from typing import cast
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from services.github.branches.get_required_status_checks import StatusChecksResult
 from services.github.types.webhook.push import PushWebhookPayload
+from services.github.utils.get_github_token_key import get_github_token_key
+from services.github.utils.record_github_backoff import GITHUB_BACKOFF
 from services.webhook.push_handler import handle_push
 
 
@@ -325,11 +327,13 @@ def test_handle_push_with_failed_updates(
         {"number": 2, "title": "PR 2"},
         {"number": 3, "title": "PR 3"},
     ]
-    mock_update_pr.side_effect = [
-        ("updated", None),
-        ("failed", "HTTP 500: Internal server error"),
-        ("updated", None),
-    ]
+    # Keyed by PR number: the updates run concurrently, so call order is not PR order
+    statuses = {
+        1: ("updated", None),
+        2: ("failed", "HTTP 500: Internal server error"),
+        3: ("updated", None),
+    }
+    mock_update_pr.side_effect = lambda pr_number, **_: statuses[pr_number]
 
     result = handle_push(cast(PushWebhookPayload, payload))
 
@@ -377,11 +381,12 @@ def test_handle_push_with_merge_conflicts(
         {"number": 2, "title": "PR 2"},
         {"number": 3, "title": "PR 3"},
     ]
-    mock_update_pr.side_effect = [
-        ("updated", None),
-        ("conflict", None),
-        ("up_to_date", None),
-    ]
+    statuses = {
+        1: ("updated", None),
+        2: ("conflict", None),
+        3: ("up_to_date", None),
+    }
+    mock_update_pr.side_effect = lambda pr_number, **_: statuses[pr_number]
 
     result = handle_push(cast(PushWebhookPayload, payload))
 
@@ -739,3 +744,114 @@ def test_handle_push_empty_commits_proceeds(
     mock_get_status_checks.assert_not_called()
     mock_get_open_prs.assert_called_once()
     mock_update_pr.assert_called_once()
+
+
+@patch("services.github.utils.call_github_with_backoff.time.sleep")
+@patch("services.webhook.push_handler.logger")
+@patch("services.webhook.push_handler.update_pull_request_branch")
+@patch("services.webhook.push_handler.get_open_pull_requests")
+@patch("services.webhook.push_handler.get_installation_access_token")
+@patch("services.webhook.push_handler.get_repository")
+def test_handle_push_many_prs_reports_in_pr_order(
+    mock_get_repository,
+    mock_get_token,
+    mock_get_open_prs,
+    mock_update_pr,
+    mock_logger,
+    mock_sleep,
+):
+    payload = {
+        "repository": {
+            "owner": {"id": 123, "login": "test-owner"},
+            "id": 456,
+            "name": "test-repo",
+        },
+        "installation": {"id": 789},
+        "ref": "refs/heads/main",
+        "commits": [],
+    }
+
+    mock_get_repository.return_value = {"target_branch": "main"}
+    mock_get_token.return_value = "test-token"
+    mock_get_open_prs.return_value = [
+        {"number": n, "title": f"PR {n}"} for n in range(1, 21)
+    ]
+    # Every 5th PR conflicts, PR 7 fails, PR 12 stays rate limited through every retry
+    rate_limited = (
+        "rate_limited",
+        "HTTP 403: You have exceeded a secondary rate limit",
+    )
+
+    def update(pr_number, **_):
+        if pr_number == 12:
+            return rate_limited
+        if pr_number == 7:
+            return ("failed", "HTTP 500: Internal server error")
+        if pr_number % 5 == 0:
+            return ("conflict", None)
+        return ("updated", None)
+
+    mock_update_pr.side_effect = update
+
+    result = handle_push(cast(PushWebhookPayload, payload))
+
+    assert result is None
+    assert sorted(c.kwargs["pr_number"] for c in mock_update_pr.call_args_list) == [
+        *range(1, 12),
+        12,
+        12,
+        12,
+        *range(13, 21),
+    ]
+    assert mock_sleep.call_args_list == [call(1.0), call(1.0)]
+    assert mock_logger.info.call_args_list[-1][0][0] == (
+        "PR branch updates (20 GitAuto PRs):\n"
+        "- Updated: 14\n"
+        "- Up-to-date: 0\n"
+        "- Conflicts: 4\n"
+        "- Failed: 2\n"
+        "Merge conflicts: PR #5, #10, #15, #20\n"
+        "Failures: PR #7: HTTP 500: Internal server error, PR #12: HTTP 403: You have exceeded a secondary rate limit"
+    )
+
+
+@patch("services.github.utils.call_github_with_backoff.time.time")
+@patch("services.github.utils.call_github_with_backoff.time.sleep")
+@patch("services.webhook.push_handler.update_pull_request_branch")
+@patch("services.webhook.push_handler.get_open_pull_requests")
+@patch("services.webhook.push_handler.get_installation_access_token")
+@patch("services.webhook.push_handler.get_repository")
+def test_handle_push_waits_only_for_its_own_installation_backoff(
+    mock_get_repository,
+    mock_get_token,
+    mock_get_open_prs,
+    mock_update_pr,
+    mock_sleep,
+    mock_time,
+):
+    payload = {
+        "repository": {
+            "owner": {"id": 123, "login": "test-owner"},
+            "id": 456,
+            "name": "test-repo",
+        },
+        "installation": {"id": 789},
+        "ref": "refs/heads/main",
+        "commits": [],
+    }
+
+    mock_get_repository.return_value = {"target_branch": "main"}
+    mock_get_token.return_value = "test-token"
+    mock_get_open_prs.return_value = [{"number": 1, "title": "PR 1"}]
+    mock_update_pr.return_value = ("updated", None)
+    mock_time.return_value = 1_000.0
+    GITHUB_BACKOFF.clear()
+    GITHUB_BACKOFF[get_github_token_key("other-token")] = 1_030.0
+
+    handle_push(cast(PushWebhookPayload, payload))
+    GITHUB_BACKOFF[get_github_token_key("test-token")] = 1_005.0
+    handle_push(cast(PushWebhookPayload, payload))
+    GITHUB_BACKOFF.clear()
+
+    assert mock_sleep.call_args_list == [call(5.0)]
+    assert mock_update_pr.call_count == 2
@@ -11,7 +11,10 @@ import pytest
 from services.claude.evaluate_condition import EvaluationResult
 from services.supabase.coverages.get_all_coverages import get_all_coverages
 from services.supabase.schedule_pauses.get_schedule_pause import SchedulePause
-from services.webhook.schedule_handler import schedule_handler
+from services.webhook.schedule_handler import (
+    CANDIDATE_COVERAGE_COLUMNS,
+    schedule_handler,
+)
 
 
 @pytest.fixture
@@ -122,12 +125,10 @@ def test_get_all_coverages_returns_empty_list_not_none(mock_get_all_coverages):
 
 
 def test_get_all_coverages_contract():
-    with patch(
-        "services.supabase.coverages.get_all_coverages.supabase"
-    ) as mock_supabase:
+    with patch("services.supabase.coverages.iter_coverages.supabase") as mock_supabase:
         mock_result = MagicMock()
         mock_result.data = []
-        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.eq.return_value.order.return_value.execute.return_value = (
+        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.eq.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = (
             mock_result
         )
         result = get_all_coverages(platform="github", owner_id=789, repo_id=123)
@@ -308,6 +309,242 @@ def test_schedule_handler_skips_export_only_files(
     assert result is not None
 
 
+@patch("services.webhook.schedule_handler.bulk_exclude_from_testing")
+@patch("services.webhook.schedule_handler.add_labels")
+@patch("services.webhook.schedule_handler.create_pull_request")
+@patch("services.webhook.schedule_handler.create_empty_commit")
+@patch("services.webhook.schedule_handler.git_checkout")
+@patch("services.webhook.schedule_handler.git_fetch")
+@patch("services.webhook.schedule_handler.create_remote_branch")
+@patch("services.webhook.schedule_handler.get_latest_remote_commit_sha")
+@patch("services.webhook.schedule_handler.generate_branch_name")
+@patch("services.webhook.schedule_handler.get_open_pull_requests")
+@patch("services.webhook.schedule_handler.should_skip_test")
+@patch("services.webhook.schedule_handler.evaluate_condition")
+@patch("services.webhook.schedule_handler.get_schedule_pause")
+@patch("services.webhook.schedule_handler.get_installation_access_token")
+@patch("services.webhook.schedule_handler.get_repository")
+@patch("services.webhook.schedule_handler.check_availability")
+@patch("services.webhook.schedule_handler.get_default_branch")
+@patch("services.webhook.schedule_handler.get_file_tree")
+@patch("services.webhook.schedule_handler.get_clone_dir")
+@patch("services.webhook.schedule_handler.git_clone_to_tmp")
+@patch("services.webhook.schedule_handler.get_all_coverages")
+@patch("services.webhook.schedule_handler.read_local_file")
+def test_schedule_handler_writes_all_exclusions_in_one_batch(
+    mock_read_local_file,
+    mock_get_all_coverages,
+    _mock_copy_repo,
+    _mock_get_clone_dir,
+    mock_get_file_tree,
+    mock_get_default_branch,
+    mock_check_availability,
+    mock_get_repository,
+    mock_get_token,
+    mock_is_paused,
+    mock_evaluate_condition,
+    mock_should_skip_test,
+    mock_get_open_pull_requests,
+    mock_generate_branch_name,
+    mock_get_latest_sha,
+    mock_create_remote_branch,
+    _mock_git_fetch,
+    _mock_git_checkout,
+    mock_create_empty_commit,
+    mock_create_pr,
+    mock_add_labels,
+    mock_bulk_exclude,
+    mock_event,
+):
+    mock_get_token.return_value = "test-token"
+    mock_is_paused.return_value = False
+    mock_get_repository.return_value = {"trigger_on_schedule": True}
+    mock_check_availability.return_value = {
+        "can_proceed": True,
+        "billing_type": "exception",
+        "credit_balance_usd": 0,
+        "user_message": "",
+        "log_message": "Exception owner - unlimited access.",
+    }
+    mock_get_default_branch.return_value = "main"
+    mock_get_file_tree.return_value = [
+        {"path": path, "type": "blob", "mode": "100644", "sha": "abc123", "size": size}
+        for path, size in [
+            ("README.md", 10),
+            ("vendor/lib/client.php", 20),
+            ("src/utils/helper.test.ts", 30),
+            ("jest.config.js", 40),
+            ("src/components/Button/index.ts", 100),
+            ("src/utils/helper.ts", 200),
+            ("src/utils/zeta.ts", 300),
+        ]
+    ]
+    mock_get_all_coverages.return_value = []
+
+    def mock_content_side_effect(file_path=None, **_):
+        content_map = {
+            "src/components/Button/index.ts": "export * from './Button';\nexport { default } from './Button';",
+            "src/utils/helper.ts": "function helper() { return processData(input); }\nexport { helper };",
+        }
+        return content_map.get(file_path or "")
+
+    mock_read_local_file.side_effect = mock_content_side_effect
+    mock_generate_branch_name.return_value = "gitauto/schedule-20240101-120000-ABCD"
+    mock_get_latest_sha.return_value = "abc123"
+    mock_create_pr.return_value = ("https://github.com/test/repo/pull/1", 1)
+
+    def mock_should_skip_side_effect(file_path, content):
+        if (
+            "index.ts" in file_path
+            and "export" in content
+            and "function" not in content
+        ):
+            return True
+        return False
+
+    mock_should_skip_test.side_effect = mock_should_skip_side_effect
+    mock_evaluate_condition.return_value = EvaluationResult(True, "has testable logic")
+    mock_get_open_pull_requests.return_value = []
+
+    result = schedule_handler(mock_event)
+
+    # Path exclusions come from the up-front pass, only-exports from the content check in the loop, all written together once
+    assert result is not None
+    mock_bulk_exclude.assert_called_once_with(
+        platform="github",
+        owner_id=mock_event["ownerId"],
+        repo_id=mock_event["repoId"],
+        branch_name="main",
+        updated_by=mock_event["userName"],
+        exclusions=[
+            ("README.md", "not code file", None),
+            ("vendor/lib/client.php", "dependency file", None),
+            ("src/utils/helper.test.ts", "test file", None),
+            ("jest.config.js", "config file", None),
+            ("src/components/Button/index.ts", "only exports", None),
+        ],
+    )
+
+
+@patch("services.webhook.schedule_handler.bulk_exclude_from_testing")
+@patch("services.webhook.schedule_handler.add_labels")
+@patch("services.webhook.schedule_handler.create_pull_request")
+@patch("services.webhook.schedule_handler.create_empty_commit")
+@patch("services.webhook.schedule_handler.git_checkout")
+@patch("services.webhook.schedule_handler.git_fetch")
+@patch("services.webhook.schedule_handler.create_remote_branch")
+@patch("services.webhook.schedule_handler.get_latest_remote_commit_sha")
+@patch("services.webhook.schedule_handler.generate_branch_name")
+@patch("services.webhook.schedule_handler.get_open_pull_requests")
+@patch("services.webhook.schedule_handler.should_skip_test")
+@patch("services.webhook.schedule_handler.evaluate_condition")
+@patch("services.webhook.schedule_handler.get_schedule_pause")
+@patch("services.webhook.schedule_handler.get_installation_access_token")
+@patch("services.webhook.schedule_handler.get_repository")
+@patch("services.webhook.schedule_handler.check_availability")
+@patch("services.webhook.schedule_handler.get_default_branch")
+@patch("services.webhook.schedule_handler.get_file_tree")
+@patch("services.webhook.schedule_handler.get_clone_dir")
+@patch("services.webhook.schedule_handler.git_clone_to_tmp")
+@patch("services.webhook.schedule_handler.get_all_coverages")
+@patch("services.webhook.schedule_handler.read_local_file")
+def test_schedule_handler_writes_exclusions_when_loop_raises(
+    mock_read_local_file,
+    mock_get_all_coverages,
+    _mock_copy_repo,
+    _mock_get_clone_dir,
+    mock_get_file_tree,
+    mock_get_default_branch,
+    mock_check_availability,
+    mock_get_repository,
+    mock_get_token,
+    mock_is_paused,
+    mock_evaluate_condition,
+    mock_should_skip_test,
+    mock_get_open_pull_requests,
+    mock_generate_branch_name,
+    mock_get_latest_sha,
+    mock_create_remote_branch,
+    _mock_git_fetch,
+    _mock_git_checkout,
+    mock_create_empty_commit,
+    mock_create_pr,
+    mock_add_labels,
+    mock_bulk_exclude,
+    mock_event,
+):
+    mock_get_token.return_value = "test-token"
+    mock_is_paused.return_value = False
+    mock_get_repository.return_value = {"trigger_on_schedule": True}
+    mock_check_availability.return_value = {
+        "can_proceed": True,
+        "billing_type": "exception",
+        "credit_balance_usd": 0,
+        "user_message": "",
+        "log_message": "Exception owner - unlimited access.",
+    }
+    mock_get_default_branch.return_value = "main"
+    mock_get_file_tree.return_value = [
+        {"path": path, "type": "blob", "mode": "100644", "sha": "abc123", "size": size}
+        for path, size in [
+            ("README.md", 10),
+            ("vendor/lib/client.php", 20),
+            ("src/utils/helper.test.ts", 30),
+            ("jest.config.js", 40),
+            ("src/components/Button/index.ts", 100),
+            ("src/utils/helper.ts", 200),
+            ("src/utils/zeta.ts", 300),
+        ]
+    ]
+    mock_get_all_coverages.return_value = []
+
+    def mock_content_side_effect(file_path=None, **_):
+        content_map = {
+            "src/components/Button/index.ts": "export * from './Button';\nexport { default } from './Button';",
+            "src/utils/helper.ts": "function helper() { return processData(input); }\nexport { helper };",
+        }
+        if file_path == "src/utils/helper.ts":
+            raise OSError("read failed")
+        return content_map.get(file_path or "")
+
+    mock_read_local_file.side_effect = mock_content_side_effect
+    mock_generate_branch_name.return_value = "gitauto/schedule-20240101-120000-ABCD"
+    mock_get_latest_sha.return_value = "abc123"
+    mock_create_pr.return_value = ("https://github.com/test/repo/pull/1", 1)
+
+    def mock_should_skip_side_effect(file_path, content):
+        if (
+            "index.ts" in file_path
+            and "export" in content
+            and "function" not in content
+        ):
+            return True
+        return False
+
+    mock_should_skip_test.side_effect = mock_should_skip_side_effect
+    mock_evaluate_condition.return_value = EvaluationResult(True, "has testable logic")
+    mock_get_open_pull_requests.return_value = []
+
+    with pytest.raises(OSError):
+        schedule_handler(mock_event)
+
+    # Exclusions decided before the failure are still written
+    mock_bulk_exclude.assert_called_once_with(
+        platform="github",
+        owner_id=mock_event["ownerId"],
+        repo_id=mock_event["repoId"],
+        branch_name="main",
+        updated_by=mock_event["userName"],
+        exclusions=[
+            ("README.md", "not code file", None),
+            ("vendor/lib/client.php", "dependency file", None),
+            ("src/utils/helper.test.ts", "test file", None),
+            ("jest.config.js", "config file", None),
+            ("src/components/Button/index.ts", "only exports", None),
+        ],
+    )
+
+
 @patch("services.webhook.schedule_handler.add_labels")
 @patch("services.webhook.schedule_handler.create_pull_request")
 @patch("services.webhook.schedule_handler.create_empty_commit")
@@ -699,7 +936,17 @@ def test_schedule_handler_skips_ai_eval_when_tests_exist(
     mock_get_latest_sha.return_value = "abc123"
     mock_create_pr.return_value = ("https://github.com/test/repo/pull/1", 1)
 
-    with patch("services.webhook.schedule_handler.update_issue_url"):
+    full_row = {
+        **mock_get_all_coverages.return_value[0],
+        "uncovered_branches": "line 3, block 0, if branch",
+    }
+
+    with patch("services.webhook.schedule_handler.update_issue_url"), patch(
+        "services.webhook.schedule_handler.get_coverages",
+        return_value={"src/services/getPolicyInfo.ts": full_row},
+    ) as mock_get_coverages, patch(
+        "services.webhook.schedule_handler.get_pr_body", return_value="body"
+    ) as mock_get_pr_body:
         result = schedule_handler(mock_event)
 
     assert result is not None
@@ -711,6 +958,20 @@ def test_schedule_handler_skips_ai_eval_when_tests_exist(
     )
     # AI evaluation should NOT have been called - existing tests prove testability
     mock_evaluate_condition.assert_not_called()
+    # Candidates come from the slim projection; only the target's full row is loaded
+    assert (
+        mock_get_all_coverages.call_args.kwargs["columns"] == CANDIDATE_COVERAGE_COLUMNS
+    )
+    mock_get_coverages.assert_called_once_with(
+        platform="github",
+        owner_id=123,
+        repo_id=456,
+        filenames=["src/services/getPolicyInfo.ts"],
+    )
+    assert (
+        mock_get_pr_body.call_args.kwargs["uncovered_branches"]
+        == "line 3, block 0, if branch"
+    )
 
 
 @patch("services.webhook.schedule_handler.get_open_pull_requests")
@@ -0,0 +1,46 @@
+import re
+
+from utils.logging.logging_config import logger
+
+# Every event/action pair handle_webhook_event acts on; None means any action (push has none). Add a route here whenever webhook_handler.py starts handling something new, or those deliveries are dropped before they reach it.
+WEBHOOK_ROUTES: dict[str, frozenset[str] | None] = {
+    "push": None,
+    "installation": frozenset({"created", "deleted", "suspend", "unsuspend"}),
+    "installation_repositories": frozenset({"added", "removed"}),
+    "pull_request": frozenset({"labeled", "closed"}),
+    "pull_request_review_comment": frozenset({"created", "edited"}),
+    "pull_request_review": frozenset({"submitted", "edited"}),
+    "issue_comment": frozenset({"created", "edited"}),
+    "workflow_run": frozenset({"completed"}),
+    "check_suite": frozenset({"completed"}),
+}
+
+# GitHub serializes "action" as the first key of the payload, so matching the start of the body avoids parsing the whole JSON (which can be hundreds of KB for push/check_suite)
+LEADING_ACTION = re.compile(rb'\s*\{\s*"action"\s*:\s*"([^"\\]*)"')
+
+
+def is_routed_event(event_name: str, body: bytes):
+    """Whether handle_webhook_event could act on this delivery, judged from the X-GitHub-Event header and the leading "action" key only.
+
+    When the action can't be read cheaply (URL-encoded body, "action" not first) this returns True and leaves the decision to the full handler, so only deliveries that certainly do nothing are dropped.
+    """
+    if event_name not in WEBHOOK_ROUTES:
+        logger.info("is_routed_event: no route for event=%s", event_name)
+        return False
+
+    actions = WEBHOOK_ROUTES[event_name]
+    if actions is None:
+        logger.info("is_routed_event: event=%s routed for any action", event_name)
+        return True
+
+    match = LEADING_ACTION.match(body)
+    if not match:
+        logger.info("is_routed_event: no leading action for event=%s", event_name)
+        return True
+
+    action = match.group(1).decode()
+    routed = action in actions
+    logger.info(
+        "is_routed_event: event=%s action=%s routed=%s", event_name, action, routed
+    )
+    return routed
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from services.webhook.utils.is_routed_event import WEBHOOK_ROUTES, is_routed_event
+
+
+def _body(action: str, **rest):
+    # GitHub puts "action" first; json.dumps keeps insertion order
+    return json.dumps({"action": action, **rest}).encode()
+
+
+@pytest.mark.parametrize(
+    "event_name, action",
+    [
+        ("pull_request", "labeled"),
+        ("pull_request", "closed"),
+        ("check_suite", "completed"),
+        ("workflow_run", "completed"),
+        ("installation", "created"),
+        ("installation", "unsuspend"),
+        ("installation_repositories", "removed"),
+        ("pull_request_review", "submitted"),
+        ("pull_request_review_comment", "edited"),
+        ("issue_comment", "created"),
+    ],
+)
+def test_routed_actions_pass(event_name, action):
+    assert is_routed_event(event_name, _body(action, number=1)) is True
+
+
+@pytest.mark.parametrize(
+    "event_name, action",
+    [
+        ("pull_request", "opened"),
+        ("pull_request", "synchronize"),
+        ("check_suite", "requested"),
+        ("check_suite", "rerequested"),
+        ("workflow_run", "requested"),
+        ("installation", "new_permissions_accepted"),
+        ("issue_comment", "deleted"),
+        ("pull_request_review_comment", "deleted"),
+    ],
+)
+def test_unrouted_actions_are_dropped(event_name, action):
+    assert is_routed_event(event_name, _body(action, number=1)) is False
+
+
+@pytest.mark.parametrize(
+    "event_name", ["check_run", "status", "marketplace_purchase", "Event not specified"]
+)
+def test_unknown_events_are_dropped(event_name):
+    assert is_routed_event(event_name, _body("completed")) is False
+
+
+def test_push_passes_without_action():
+    assert is_routed_event("push", b'{"ref": "refs/heads/main"}') is True
+
+
+def test_whitespace_before_action_is_tolerated():
+    body = b'\n  {\n  "action" :  "closed",\n  "number": 1\n}'
+    assert is_routed_event("pull_request", body) is True
+    assert is_routed_event("pull_request", body.replace(b"closed", b"opened")) is False
+
+
+def test_unreadable_action_defers_to_full_handler():
+    # URL-encoded form bodies and payloads whose first key isn't "action" can't be judged cheaply
+    assert is_routed_event("pull_request", b"payload=%7B%22action%22%3A%22opened%22%7D")
+    assert is_routed_event("pull_request", b'{"number": 1, "action": "opened"}')
+    assert is_routed_event("pull_request", b"")
+
+
+def test_every_route_is_either_any_action_or_non_empty():
+    assert all(actions is None or actions for actions in WEBHOOK_ROUTES.values())
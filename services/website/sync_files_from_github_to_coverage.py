@@ -1,10 +1,18 @@
-from schemas.supabase.types import CoveragesInsert
+from schemas.supabase.types import CoverageSyncsInsert, CoveragesInsert
 from services.git.get_clone_dir import get_clone_dir
 from services.git.get_clone_url import get_clone_url
 from services.git.get_file_tree import get_file_tree
+from services.git.get_file_tree_at_commit import get_file_tree_at_commit
+from services.git.get_local_head_sha import get_local_head_sha
+from services.git.get_tree_sha import get_tree_sha
 from services.git.git_clone_to_tmp import git_clone_to_tmp
 from services.github.repositories.get_github_file_tree import get_github_file_tree
 from services.github.token.get_installation_token import get_installation_access_token
+from services.supabase.coverage_syncs.get_coverage_sync import get_coverage_sync
+from services.supabase.coverage_syncs.upsert_coverage_sync import upsert_coverage_sync
+from services.supabase.coverages.delete_coverages_by_paths import (
+    delete_coverages_by_paths,
+)
 from services.supabase.coverages.delete_stale_coverages import delete_stale_coverages
 from services.supabase.coverages.upsert_coverages import upsert_coverages
 from services.supabase.installations.get_installation_by_owner import (
@@ -24,7 +32,10 @@ def sync_files_from_github_to_coverage(
     user_name: str,
     api_key: str | None,
 ):
-    """Sync repository files from local clone to coverage database."""
+    """Sync repository files from local clone to coverage database.
+
+    Only paths added, removed or resized since the last synced tree are written; a full sync happens when there is no usable previous state.
+    """
     if api_key:
         logger.info("sync_files_from_github_to_coverage: verifying api_key")
         verify_api_key(api_key)
@@ -45,6 +56,10 @@ def sync_files_from_github_to_coverage(
     git_clone_to_tmp(clone_dir, clone_url, branch)
     tree_items = get_file_tree(clone_dir=clone_dir, ref=branch)
 
+    # Only a local clone gives us SHAs to diff against; the GitHub API fallback always does a full sync
+    commit_sha = get_local_head_sha(clone_dir) if tree_items else ""
+    tree_sha = get_tree_sha(clone_dir, ref=branch) if commit_sha else ""
+
     # Fall back to GitHub API if clone to /tmp failed (e.g. user installed GitAuto and is redirected to the website file coverage page before the initial clone completes)
     if not tree_items:
         logger.info(
@@ -55,22 +70,64 @@ def sync_files_from_github_to_coverage(
         )
 
     current_files = {
-        item["path"]: item.get("size", 0)
+        item["path"]: item
         for item in tree_items
         if item["type"] == "blob" and is_source_file(item["path"])
     }
 
     logger.info("Fetched %d files from GitHub", len(current_files))
 
-    # Upsert all files (handles both insert and update)
-    if current_files:
+    previous = get_coverage_sync(platform="github", repo_id=repo_id)
+    if tree_sha and previous and previous["tree_sha"] == tree_sha:
+        logger.info(
+            "Tree %s already synced for %s/%s, nothing to do", tree_sha, owner, repo
+        )
+        return
+
+    # Blob SHAs at the last synced commit, so only the paths whose content differs are written
+    previous_files: dict[str, str] | None = None
+    if tree_sha and previous and previous["commit_sha"]:
+        previous_items = get_file_tree_at_commit(
+            clone_dir=clone_dir,
+            clone_url=clone_url,
+            commit_sha=previous["commit_sha"],
+        )
+        if previous_items:
+            logger.info("Diffing against last synced commit %s", previous["commit_sha"])
+            previous_files = {
+                item["path"]: item["sha"]
+                for item in previous_items
+                if item["type"] == "blob" and is_source_file(item["path"])
+            }
+        else:
+            logger.warning(
+                "Last synced commit %s unreadable, doing a full sync",
+                previous["commit_sha"],
+            )
+    else:
+        logger.info("No previous sync state for %s/%s, doing a full sync", owner, repo)
+
+    if previous_files is None:
+        logger.info("Full sync of %d files for %s/%s", len(current_files), owner, repo)
+        changed_files = current_files
+    else:
+        logger.info("Incremental sync for %s/%s", owner, repo)
+        changed_files = {
+            path: item
+            for path, item in current_files.items()
+            if previous_files.get(path) != item["sha"]
+        }
+
+    # Upsert new and modified files (handles both insert and update)
+    upserted = True
+    if changed_files:
         records: list[CoveragesInsert] = [
             CoveragesInsert(
                 platform="github",
                 owner_id=owner_id,
                 repo_id=repo_id,
                 full_path=path,
-                file_size=size,
+                file_size=item.get("size", 0),
                 branch_name=branch,
                 level="file",
                 created_by=user_name,
@@ -81,15 +138,27 @@ def sync_files_from_github_to_coverage(
                 checklist_hash=None,
                 quality_checks=None,
             )
-            for path, size in current_files.items()
+            for path, item in changed_files.items()
         ]
-        upsert_coverages(coverage_records=records)
+        upserted = upsert_coverages(coverage_records=records) is not None
         logger.info("Upserted %d coverage records", len(records))
 
     # Delete stale files (exist in DB but not in GitHub)
     # Skip if tree_items is empty — means we failed to read the repo, not safe to delete
-    deleted_count = 0
-    if tree_items:
+    deleted_count: int | None = 0
+    if previous_files is not None:
+        removed_paths = [path for path in previous_files if path not in current_files]
+        logger.info(
+            "Deleting %d removed paths for %s/%s", len(removed_paths), owner, repo
+        )
+        deleted = delete_coverages_by_paths(
+            platform="github",
+            owner_id=owner_id,
+            repo_id=repo_id,
+            file_paths=removed_paths,
+        )
+        deleted_count = len(deleted) if deleted is not None else None
+    elif tree_items:
         logger.info("Deleting stale coverages for %s/%s", owner, repo)
         deleted_count = delete_stale_coverages(
             platform="github",
@@ -104,6 +173,24 @@ def sync_files_from_github_to_coverage(
             repo,
         )
 
+    # Record what coverages now mirror; a failed upsert or delete leaves the old state so the next sync retries those paths
+    if tree_items and upserted and deleted_count is not None:
+        logger.info("Recording sync state for %s/%s at %s", owner, repo, tree_sha)
+        upsert_coverage_sync(
+            sync=CoverageSyncsInsert(
+                platform="github",
+                owner_id=owner_id,
+                repo_id=repo_id,
+                branch_name=branch,
+                commit_sha=commit_sha or None,
+                tree_sha=tree_sha or None,
+                created_by=user_name,
+                updated_by=user_name,
+            )
+        )
+    else:
+        logger.warning("Not recording sync state for %s/%s", owner, repo)
+
     logger.info(
-        "Sync completed: %d upserted, %d deleted", len(current_files), deleted_count
+        "Sync completed: %d upserted, %s deleted", len(changed_files), deleted_count
     )
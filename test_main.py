@@ -4,6 +4,8 @@
 import asyncio
 import json
 import random
+import subprocess
+import sys
 import urllib.parse
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
@@ -125,7 +127,7 @@ def mock_event_bridge_event_missing_names():
 
 
 class TestHandler:
-    @patch("main.schedule_handler")
+    @patch("services.webhook.schedule_handler.schedule_handler")
     @patch("main.slack_notify")
     def test_handler_schedule_event_success(
         self, mock_slack_notify, mock_schedule_handler, mock_event_bridge_event
@@ -154,7 +156,7 @@ class TestHandler:
         assert mock_slack_notify.call_count == 2
         assert result is None
 
-    @patch("main.schedule_handler")
+    @patch("services.webhook.schedule_handler.schedule_handler")
     @patch("main.slack_notify")
     def test_handler_schedule_event_failure(
         self, mock_slack_notify, mock_schedule_handler, mock_event_bridge_event
@@ -174,7 +176,7 @@ class TestHandler:
         )
         assert result is None
 
-    @patch("main.schedule_handler")
+    @patch("services.webhook.schedule_handler.schedule_handler")
     @patch("main.slack_notify")
     def test_handler_schedule_event_missing_owner_repo_names(
         self,
@@ -233,12 +235,23 @@ class TestHandler:
         mock_mangum_handler.assert_called_with(event=event, context=context)
         assert result == {"status": "success"}
 
+    @patch("main.mangum_handler")
+    def test_handler_resets_github_response_cache_stats(self, mock_mangum_handler):
+        main.GITHUB_RESPONSE_CACHE_STATS["hits"] = 3
+        mock_mangum_handler.return_value = {"status": "success"}
+
+        handler(event={"key": "value"}, context={})
+
+        assert not main.GITHUB_RESPONSE_CACHE_STATS
+
 
 class TestHandleWebhook:
     @patch("main.insert_webhook_delivery")
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_success(
         self,
@@ -278,46 +291,106 @@ class TestHandleWebhook:
         }
         assert response == {"message": "Webhook processed successfully"}
 
-    @patch("main.extract_lambda_info")
+    @patch("main.insert_webhook_delivery")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_no_event_header(
         self,
         mock_handle_webhook_event,
         mock_verify_signature,
-        mock_extract_lambda_info,
+        mock_insert_webhook_delivery,
         mock_github_request_no_event_header,
     ):
         """Test handle_webhook function when X-GitHub-Event header is missing."""
+        # Execute
+        response = await handle_webhook(request=mock_github_request_no_event_header)
+
+        # Verify - no route matches a missing event name, so nothing downstream runs
+        mock_insert_webhook_delivery.assert_not_called()
+        mock_verify_signature.assert_not_called()
+        mock_handle_webhook_event.assert_not_called()
+        assert response == {"message": "Webhook ignored"}
+
+    @patch("main.insert_webhook_delivery")
+    @patch("main.verify_webhook_signature", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
+    @pytest.mark.asyncio
+    async def test_handle_webhook_unrouted_action_skips_dedup(
+        self,
+        mock_handle_webhook_event,
+        mock_verify_signature,
+        mock_insert_webhook_delivery,
+        mock_github_request,
+    ):
+        """Test handle_webhook drops an event/action pair no handler acts on before dedup."""
         # Setup
-        mock_verify_signature.return_value = None
-        mock_handle_webhook_event.return_value = None
-        mock_extract_lambda_info.return_value = {}
+        mock_github_request.headers = {
+            "X-GitHub-Event": "pull_request",
+            "X-GitHub-Delivery": f"test-delivery-{random.randint(1000000, 9999999)}",
+        }
+        mock_github_request.body = AsyncMock(
+            return_value=b'{"action": "opened", "number": 1}'
+        )
 
         # Execute
-        response = await handle_webhook(request=mock_github_request_no_event_header)
+        response = await handle_webhook(request=mock_github_request)
 
         # Verify
-        mock_verify_signature.assert_called_once_with(
-            request=mock_github_request_no_event_header, secret=GITHUB_WEBHOOK_SECRET
+        mock_insert_webhook_delivery.assert_not_called()
+        mock_verify_signature.assert_not_called()
+        mock_handle_webhook_event.assert_not_called()
+        assert response == {"message": "Webhook ignored"}
+
+    @patch("main.insert_webhook_delivery")
+    @patch("main.extract_lambda_info")
+    @patch("main.verify_webhook_signature", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
+    @pytest.mark.asyncio
+    async def test_handle_webhook_routed_action_is_processed(
+        self,
+        mock_handle_webhook_event,
+        mock_verify_signature,
+        mock_extract_lambda_info,
+        mock_insert_webhook_delivery,
+        mock_github_request,
+    ):
+        """Test handle_webhook passes a routed event/action pair through dedup to the handler."""
+        # Setup
+        mock_insert_webhook_delivery.return_value = True
+        mock_extract_lambda_info.return_value = {}
+        mock_github_request.headers = {
+            "X-GitHub-Event": "pull_request",
+            "X-GitHub-Delivery": "test-delivery-routed",
+        }
+        mock_github_request.body = AsyncMock(
+            return_value=b'{"action": "labeled", "number": 1}'
         )
-        mock_extract_lambda_info.assert_called_once_with(
-            mock_github_request_no_event_header
+
+        # Execute
+        response = await handle_webhook(request=mock_github_request)
+
+        # Verify
+        mock_insert_webhook_delivery.assert_called_once_with(
+            platform="github",
+            delivery_id="test-delivery-routed",
+            event_name="pull_request",
         )
         call_args = mock_handle_webhook_event.call_args
-        assert call_args.kwargs["event_name"] == "Event not specified"
-        assert call_args.kwargs["payload"] == {"key": "value"}
-        assert call_args.kwargs["lambda_info"] == {
-            "delivery_id": mock_github_request_no_event_header.headers[
-                "X-GitHub-Delivery"
-            ],
-        }
+        assert call_args.kwargs["payload"] == {"action": "labeled", "number": 1}
         assert response == {"message": "Webhook processed successfully"}
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_body_error(
         self,
@@ -350,7 +423,9 @@ class TestHandleWebhook:
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_json_decode_error(
         self,
@@ -383,7 +458,9 @@ class TestHandleWebhook:
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_url_encoded_payload(
         self,
@@ -424,7 +501,9 @@ class TestHandleWebhook:
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_url_encoded_without_payload_key(
         self,
@@ -464,7 +543,9 @@ class TestHandleWebhook:
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_url_encoded_invalid_json_payload(
         self,
@@ -505,7 +586,9 @@ class TestHandleWebhook:
     @patch("main.insert_webhook_delivery")
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_general_exception_in_json_parsing(
         self,
@@ -542,7 +625,9 @@ class TestHandleWebhook:
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_with_custom_event_name(
         self,
@@ -608,6 +693,26 @@ class TestAppConfiguration:
         assert isinstance(mangum_handler, Mangum)
         assert mangum_handler is not None
 
+    def test_import_main_leaves_handler_sdks_unloaded(self):
+        """Handlers are imported on dispatch, so a cold start that only loads main.py doesn't pay for the LLM, Stripe, scraping or AWS SDKs."""
+        code = "import json, sys, main; print(json.dumps(sorted(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        # Import-time log lines also go to stdout; the module list is the last line
+        loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+        lazy = {
+            "anthropic",
+            "boto3",
+            "bs4",
+            "google.genai",
+            "html2text",
+            "openai",
+            "stripe",
+        }
+        assert lazy & loaded == set()
+
     def test_app_routes_configuration(self):
         """Test that the FastAPI app has the expected route paths."""
         route_paths = [
@@ -630,7 +735,9 @@ class TestAppConfiguration:
 class TestEdgeCases:
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_empty_body(
         self,
@@ -642,7 +749,7 @@ class TestEdgeCases:
         # Setup
         mock_req = MagicMock(spec=Request)
         mock_req.headers = {
-            "X-GitHub-Event": "ping",
+            "X-GitHub-Event": "push",
             "X-GitHub-Delivery": f"test-delivery-{random.randint(1000000, 9999999)}",
         }
         mock_req.body = AsyncMock(return_value=b"")
@@ -660,14 +767,14 @@ class TestEdgeCases:
         )
         mock_extract_lambda_info.assert_called_once_with(mock_req)
         call_args = mock_handle_webhook_event.call_args
-        assert call_args.kwargs["event_name"] == "ping"
+        assert call_args.kwargs["event_name"] == "push"
         assert call_args.kwargs["payload"] == {}
         assert call_args.kwargs["lambda_info"] == {
             "delivery_id": mock_req.headers["X-GitHub-Delivery"],
         }
         assert response == {"message": "Webhook processed successfully"}
 
-    @patch("main.schedule_handler")
+    @patch("services.webhook.schedule_handler.schedule_handler")
     @patch("main.slack_notify")
     def test_handler_schedule_event_with_none_result_status(
         self, mock_slack_notify, mock_schedule_handler, mock_event_bridge_event
@@ -689,7 +796,9 @@ class TestEdgeCases:
 
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_with_unicode_content(
         self,
@@ -701,7 +810,7 @@ class TestEdgeCases:
         # Setup
         mock_req = MagicMock(spec=Request)
         mock_req.headers = {
-            "X-GitHub-Event": "issues",
+            "X-GitHub-Event": "issue_comment",
             "X-GitHub-Delivery": f"test-delivery-{random.randint(1000000, 9999999)}",
         }
         unicode_content = '{"title": "测试 Unicode 内容", "body": "🚀 Emoji test"}'
@@ -720,7 +829,7 @@ class TestEdgeCases:
         )
         mock_extract_lambda_info.assert_called_once_with(mock_req)
         call_args = mock_handle_webhook_event.call_args
-        assert call_args.kwargs["event_name"] == "issues"
+        assert call_args.kwargs["event_name"] == "issue_comment"
         assert call_args.kwargs["payload"] == {
             "title": "测试 Unicode 内容",
             "body": "🚀 Emoji test",
@@ -730,7 +839,7 @@ class TestEdgeCases:
         }
         assert response == {"message": "Webhook processed successfully"}
 
-    @patch("main.schedule_handler")
+    @patch("services.webhook.schedule_handler.schedule_handler")
     @patch("main.slack_notify")
     def test_handler_schedule_event_with_missing_message_in_result(
         self, mock_slack_notify, mock_schedule_handler, mock_event_bridge_event
@@ -753,7 +862,7 @@ class TestEdgeCases:
 
 class TestLogStatements:
     @patch("main.logger")
-    @patch("main.schedule_handler")
+    @patch("services.webhook.schedule_handler.schedule_handler")
     @patch("main.slack_notify")
     def test_handler_schedule_event_logs_message(
         self,
@@ -784,7 +893,9 @@ class TestLogStatements:
     @patch("main.logger")
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_logs_body_error(
         self,
@@ -813,7 +924,9 @@ class TestLogStatements:
     @patch("main.insert_webhook_delivery")
     @patch("main.extract_lambda_info")
     @patch("main.verify_webhook_signature", new_callable=AsyncMock)
-    @patch("main.handle_webhook_event", new_callable=AsyncMock)
+    @patch(
+        "services.webhook.webhook_handler.handle_webhook_event", new_callable=AsyncMock
+    )
     @pytest.mark.asyncio
     async def test_handle_webhook_logs_json_parsing_error(
         self,
@@ -890,7 +1003,10 @@ class TestTypeAnnotations:
         """Test that handle_webhook returns the correct type."""
         with patch("main.extract_lambda_info"), patch(
             "main.verify_webhook_signature", new_callable=AsyncMock
-        ), patch("main.handle_webhook_event", new_callable=AsyncMock):
+        ), patch(
+            "services.webhook.webhook_handler.handle_webhook_event",
+            new_callable=AsyncMock,
+        ):
 
             result = await handle_webhook(request=mock_github_request)
 
@@ -909,8 +1025,11 @@ class TestTypeAnnotations:
 
 
 class TestApiRetargetPr:
-    @patch("main.retarget_pr")
-    @patch("main.get_installation_access_token", return_value="fake-token")
+    @patch("services.website.retarget_pr.retarget_pr")
+    @patch(
+        "services.github.token.get_installation_token.get_installation_access_token",
+        return_value="fake-token",
+    )
     @pytest.mark.asyncio
     async def test_api_retarget_pr_uses_background_task(
         self, mock_get_token, mock_retarget
@@ -939,7 +1058,9 @@ class TestApiRetargetPr:
 
 
 class TestApiSyncFilesFromGithubToCoverage:
-    @patch("main.sync_files_from_github_to_coverage")
+    @patch(
+        "services.website.sync_files_from_github_to_coverage.sync_files_from_github_to_coverage"
+    )
     @pytest.mark.asyncio
     async def test_api_sync_files_success(self, mock_sync_files):
         mock_background_tasks = MagicMock()
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import signal
+import subprocess
+import time
+
+from constants.aws import SUBPROCESS_TIMEOUT_SECONDS
+from utils.env.passthrough_env_for_subprocess import passthrough_env_for_subprocess
+from utils.logging.logging_config import logger
+
+
+async def run_subprocess_async(
+    args: list[str],
+    *,
+    cwd: str,
+    env: dict[str, str] | None = None,
+    timeout: float = SUBPROCESS_TIMEOUT_SECONDS,
+):
+    """Non-blocking subprocess.run(capture_output=True, text=True, check=False) for the verification toolchain.
+
+    Returns a subprocess.CompletedProcess so callers keep reading returncode/stdout/stderr. env defaults to passthrough_env_for_subprocess(); callers that add vars (CI, npm cache, MONGOMS_*) must start from that same scrubbed env. On timeout the whole process group is killed and subprocess.TimeoutExpired is raised with the output captured so far.
+    """
+    if not args:
+        logger.error("run_subprocess_async called with empty args")
+        raise ValueError("Command cannot be empty")
+
+    if env is None:
+        logger.debug("run_subprocess_async: using scrubbed passthrough env")
+        env = passthrough_env_for_subprocess()
+
+    logger.info("Running async: %s in %s", " ".join(args), cwd)
+    start = time.perf_counter()
+
+    # start_new_session gives the child its own process group, so a timeout also kills the jest workers / tsc children that npx, yarn and pnpm wrappers spawn instead of orphaning them.
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+
+    # Drain both pipes as output arrives so a chatty child never blocks on a full pipe, and a timeout still reports what was printed before it hung.
+    stdout_chunks: list[bytes] = []
+    stderr_chunks: list[bytes] = []
+
+    async def drain(stream: asyncio.StreamReader | None, chunks: list[bytes]):
+        while stream is not None:
+            chunk = await stream.read(65536)
+            if not chunk:
+                logger.debug("run_subprocess_async: stream closed")
+                break
+            chunks.append(chunk)
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                drain(process.stdout, stdout_chunks),
+                drain(process.stderr, stderr_chunks),
+                process.wait(),
+            ),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError as e:
+        logger.warning(
+            "run_subprocess_async: %s timed out after %ss, killing process group %d",
+            args[0],
+            timeout,
+            process.pid,
+        )
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            logger.info("run_subprocess_async: process group already exited")
+        await process.wait()
+        raise subprocess.TimeoutExpired(
+            cmd=args,
+            timeout=timeout,
+            output=b"".join(stdout_chunks).decode(errors="replace"),
+            stderr=b"".join(stderr_chunks).decode(errors="replace"),
+        ) from e
+
+    returncode = process.returncode if process.returncode is not None else -1
+    logger.info(
+        "run_subprocess_async: %s exited %d in %.2fs",
+        args[0],
+        returncode,
+        time.perf_counter() - start,
+    )
+    return subprocess.CompletedProcess(
+        args=args,
+        returncode=returncode,
+        stdout=b"".join(stdout_chunks).decode(errors="replace"),
+        stderr=b"".join(stderr_chunks).decode(errors="replace"),
+    )
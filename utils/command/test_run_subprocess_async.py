@@ -0,0 +1,101 @@
+import asyncio
+import os
+import subprocess
+import tempfile
+import time
+from unittest.mock import patch
+
+import pytest
+
+from utils.command.run_subprocess_async import run_subprocess_async
+
+
+@pytest.mark.asyncio
+async def test_captures_stdout_and_stderr():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = await run_subprocess_async(
+            ["sh", "-c", "echo out; echo err >&2; exit 3"], cwd=temp_dir
+        )
+    assert isinstance(result, subprocess.CompletedProcess)
+    assert result.args == ["sh", "-c", "echo out; echo err >&2; exit 3"]
+    assert result.returncode == 3
+    assert result.stdout == "out\n"
+    assert result.stderr == "err\n"
+
+
+@pytest.mark.asyncio
+async def test_runs_in_cwd():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = await run_subprocess_async(["pwd", "-P"], cwd=temp_dir)
+        assert result.stdout == os.path.realpath(temp_dir) + "\n"
+
+
+@pytest.mark.asyncio
+async def test_large_output_does_not_deadlock():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = await run_subprocess_async(
+            ["sh", "-c", "head -c 1000000 /dev/zero | tr '\\0' a"], cwd=temp_dir
+        )
+    assert result.returncode == 0
+    assert len(result.stdout) == 1000000
+
+
+@pytest.mark.asyncio
+@patch("utils.command.run_subprocess_async.passthrough_env_for_subprocess")
+async def test_defaults_to_scrubbed_env(mock_passthrough):
+    mock_passthrough.return_value = {"PATH": "/usr/bin:/bin", "KEPT": "yes"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = await run_subprocess_async(["env"], cwd=temp_dir)
+    assert sorted(result.stdout.split()) == ["KEPT=yes", "PATH=/usr/bin:/bin"]
+
+
+@pytest.mark.asyncio
+@patch("utils.command.run_subprocess_async.passthrough_env_for_subprocess")
+async def test_explicit_env_is_used_as_is(mock_passthrough):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = await run_subprocess_async(
+            ["env"], cwd=temp_dir, env={"PATH": "/usr/bin:/bin", "CI": "true"}
+        )
+    mock_passthrough.assert_not_called()
+    assert sorted(result.stdout.split()) == ["CI=true", "PATH=/usr/bin:/bin"]
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_process_group_and_keeps_partial_output():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # The backgrounded sleep is a grandchild; it must die with the group or the pipe never closes
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            await run_subprocess_async(
+                ["sh", "-c", "echo started; sleep 30 & wait"],
+                cwd=temp_dir,
+                timeout=0.5,
+            )
+    assert exc_info.value.timeout == 0.5
+    assert exc_info.value.output == "started\n"
+
+
+@pytest.mark.asyncio
+async def test_independent_processes_overlap():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            run_subprocess_async(["sleep", "0.5"], cwd=temp_dir),
+            run_subprocess_async(["sleep", "0.5"], cwd=temp_dir),
+            run_subprocess_async(["sleep", "0.5"], cwd=temp_dir),
+        )
+        elapsed = time.perf_counter() - start
+    assert [r.returncode for r in results] == [0, 0, 0]
+    assert elapsed < 1.2
+
+
+@pytest.mark.asyncio
+async def test_empty_args_raises():
+    with pytest.raises(ValueError, match=r"^Command cannot be empty$"):
+        await run_subprocess_async([], cwd="/tmp")
+
+
+@pytest.mark.asyncio
+async def test_missing_binary_raises():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(FileNotFoundError):
+            await run_subprocess_async(["nonexistent_command_xyz"], cwd=temp_dir)
@@ -1,7 +1,7 @@
 from functools import cache
 
 from constants.general import IS_PRD
-from services.aws.clients import ssm_client
+from services.aws.get_ssm_client import get_ssm_client
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -23,7 +23,7 @@ def get_internal_env_var_names():
         return set()
 
     logger.info("get_internal_env_var_names: querying SSM %s*", SSM_GITAUTO_PREFIX)
-    paginator = ssm_client.get_paginator("describe_parameters")
+    paginator = get_ssm_client().get_paginator("describe_parameters")
     names: set[str] = set()
     for page in paginator.paginate(
         ParameterFilters=[
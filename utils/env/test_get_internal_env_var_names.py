@@ -17,7 +17,7 @@ def test_returns_empty_set_locally():
     assert get_internal_env_var_names() == set()
 
 
-@patch("utils.env.get_internal_env_var_names.ssm_client")
+@patch("utils.env.get_internal_env_var_names.get_ssm_client")
 @patch("utils.env.get_internal_env_var_names.IS_PRD", True)
 def test_strips_prefix_from_ssm_names(mock_ssm):
     """SSM stores names like /gitauto/SENTRY_DSN; we strip /gitauto/ to match the env var name on the Lambda."""
@@ -39,7 +39,7 @@ def test_strips_prefix_from_ssm_names(mock_ssm):
             ]
         },
     ]
-    mock_ssm.get_paginator.return_value = paginator
+    mock_ssm.return_value.get_paginator.return_value = paginator
 
     result = get_internal_env_var_names()
 
@@ -62,7 +62,7 @@ def test_strips_prefix_from_ssm_names(mock_ssm):
     )
 
 
-@patch("utils.env.get_internal_env_var_names.ssm_client")
+@patch("utils.env.get_internal_env_var_names.get_ssm_client")
 @patch("utils.env.get_internal_env_var_names.IS_PRD", True)
 def test_skips_params_missing_name(mock_ssm):
     """Defensive: if a page comes back with a Parameter dict that has no Name (shouldn't happen per the boto3 type, but the field is technically NotRequired), skip it instead of raising."""
@@ -77,22 +77,22 @@ def test_skips_params_missing_name(mock_ssm):
             ]
         }
     ]
-    mock_ssm.get_paginator.return_value = paginator
+    mock_ssm.return_value.get_paginator.return_value = paginator
 
     assert get_internal_env_var_names() == {"SENTRY_DSN"}
 
 
-@patch("utils.env.get_internal_env_var_names.ssm_client")
+@patch("utils.env.get_internal_env_var_names.get_ssm_client")
 @patch("utils.env.get_internal_env_var_names.IS_PRD", True)
 def test_returns_empty_set_on_ssm_failure(mock_ssm):
     """If SSM is unreachable, @handle_exceptions returns the default (set()) — meaning no scrubbing happens, but the function doesn't crash. The accompanying Sentry alert is the signal to investigate."""
     _clear_cache()
-    mock_ssm.get_paginator.side_effect = RuntimeError("SSM throttled")
+    mock_ssm.return_value.get_paginator.side_effect = RuntimeError("SSM throttled")
 
     assert get_internal_env_var_names() == set()
 
 
-@patch("utils.env.get_internal_env_var_names.ssm_client")
+@patch("utils.env.get_internal_env_var_names.get_ssm_client")
 @patch("utils.env.get_internal_env_var_names.IS_PRD", True)
 def test_result_is_cached(mock_ssm):
     """SSM is queried at most once per process — the @cache decorator prevents per-subprocess-invocation cost."""
@@ -101,10 +101,10 @@ def test_result_is_cached(mock_ssm):
     paginator.paginate.return_value = [
         {"Parameters": [{"Name": "/gitauto/SENTRY_DSN"}]}
     ]
-    mock_ssm.get_paginator.return_value = paginator
+    mock_ssm.return_value.get_paginator.return_value = paginator
 
     get_internal_env_var_names()
     get_internal_env_var_names()
     get_internal_env_var_names()
 
-    assert mock_ssm.get_paginator.call_count == 1
+    assert mock_ssm.return_value.get_paginator.call_count == 1
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+
+from utils.files.find_hunk_position import find_hunk_position
+from utils.files.parse_unified_diff import parse_unified_diff
+from utils.logging.logging_config import logger
+
+
+@dataclass
+class UnifiedDiffResult:
+    content: str  # Patched text with LF line breaks, "" for a deletion or on error
+    error: str  # What `git apply --verbose --unidiff-zero` prints to stderr on failure, "" on success
+
+
+def apply_unified_diff(
+    original_text: str | None, diff_text: str, file_path: str, fuzz: int = 0
+):
+    """Apply a unified diff to original_text in memory, accepting and refusing what `git apply --unidiff-zero` does and with the same messages.
+
+    original_text is the LF-normalized file (None when it does not exist). Hunks may carry any amount of context, including none; each is searched for outward from its header line. fuzz lets a hunk that matches nowhere drop up to that many context lines from each end and try again, as GNU patch does; 0 matches git apply; a negative fuzz raises ValueError.
+    """
+    if fuzz < 0:
+        logger.error("apply_unified_diff called with negative fuzz %d", fuzz)
+        raise ValueError(f"fuzz must be non-negative, got {fuzz}")
+
+    parsed = parse_unified_diff(diff_text)
+    if parsed.error:
+        logger.info("apply_unified_diff: diff rejected: %s", parsed.error)
+        return UnifiedDiffResult(content="", error=parsed.error + "\n")
+
+    # The tool call names the file, so a single-file diff applies to it whatever its header says; in a multi-file diff only the patches for file_path apply
+    patches = [p for p in parsed.patches if file_path in (p.old_path, p.new_path)]
+    if len(parsed.patches) == 1:
+        logger.debug("apply_unified_diff: single patch applies to %s", file_path)
+        patches = parsed.patches
+    if not patches:
+        logger.info("apply_unified_diff: no patch for %s in diff", file_path)
+        return UnifiedDiffResult(
+            content="",
+            error='error: No valid patches in input (allow with "--allow-empty")\n',
+        )
+
+    stderr = ""
+    exists = original_text is not None
+    image = original_text.split("\n")[:-1] if original_text else []
+    for patch in patches:
+        stderr += f"Checking patch {file_path}...\n"
+        is_new = patch.old_path == "/dev/null"
+        is_delete = patch.new_path == "/dev/null"
+
+        if is_new and exists:
+            logger.info("apply_unified_diff: %s already exists", file_path)
+            stderr += f"error: {file_path}: already exists in working directory\n"
+            return UnifiedDiffResult(content="", error=stderr)
+        if not is_new and not exists:
+            logger.info("apply_unified_diff: %s does not exist", file_path)
+            stderr += f"error: {file_path}: No such file or directory\n"
+            return UnifiedDiffResult(content="", error=stderr)
+
+        for number, hunk in enumerate(patch.hunks, start=1):
+            leading = next(
+                (n for n, line in enumerate(hunk.lines) if line[0] != " "),
+                len(hunk.lines),
+            )
+            trailing = next(
+                (n for n, line in enumerate(reversed(hunk.lines)) if line[0] != " "),
+                len(hunk.lines),
+            )
+            preimage = [line[1:] for line in hunk.lines if line[0] in " -"]
+            postimage = [line[1:] for line in hunk.lines if line[0] in " +"]
+            # Earlier hunks are already in image, so the new-side line number is where this one should be
+            start_line = hunk.new_start - 1 if hunk.new_start else 0
+
+            position = -1
+            lead = trail = 0
+            for dropped in range(fuzz + 1):
+                lead, trail = min(dropped, leading), min(dropped, trailing)
+                if dropped and not lead and not trail:
+                    logger.debug("apply_unified_diff: no context left to drop")
+                    break
+                position = find_hunk_position(
+                    image,
+                    preimage[lead : len(preimage) - trail],
+                    start_line + lead,
+                    # -U0 diffs cannot say whether a hunk is at the start of the file, so only "@@ -0" pins it there, as with --unidiff-zero
+                    hunk.old_start == 0 and not lead,
+                )
+                if position != -1:
+                    logger.debug("apply_unified_diff: hunk applies at %d", position)
+                    image[position : position + len(preimage) - lead - trail] = (
+                        postimage[lead : len(postimage) - trail]
+                    )
+                    break
+
+            offset = position - lead - start_line
+            if position != -1 and offset:
+                # git apply --verbose reports hunks that landed away from their header line; the report only surfaces if a later hunk fails
+                logger.info(
+                    "apply_unified_diff: hunk %d offset %d lines", number, offset
+                )
+                lines_word = "line" if offset == 1 else "lines"
+                stderr += f"Hunk #{number} succeeded at {position - lead + 1} (offset {offset} {lines_word}).\n"
+
+            if position == -1:
+                logger.info(
+                    "apply_unified_diff: hunk at %d does not apply to %s",
+                    hunk.old_start,
+                    file_path,
+                )
+                searched = "".join(f"{line}\n" for line in preimage)
+                stderr += (
+                    f"error: while searching for:\n{searched}\n"
+                    f"error: patch failed: {file_path}:{hunk.old_start}\n"
+                    f"error: {file_path}: patch does not apply\n"
+                )
+                return UnifiedDiffResult(content="", error=stderr)
+
+        if is_delete and image:
+            logger.info("apply_unified_diff: removal leaves content in %s", file_path)
+            stderr += (
+                "error: removal patch leaves file contents\n"
+                f"error: {file_path}: patch does not apply\n"
+            )
+            return UnifiedDiffResult(content="", error=stderr)
+
+    logger.info("apply_unified_diff: applied %d patches to %s", len(patches), file_path)
+    return UnifiedDiffResult(content="".join(f"{line}\n" for line in image), error="")
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from utils.files.get_test_file_stem import get_test_file_stem
+from utils.logging.logging_config import logger
+
+
+@dataclass
+class TestFileIndex:
+    __test__ = False  # Keep pytest from collecting this as a test class
+
+    # Normalized impl stem -> [(test path, lowercased test dir)] in tree order, e.g. "quote" -> [("src/__tests__/Quote.test.ts", "src/__tests__")]
+    tests_by_stem: dict[str, list[tuple[str, str]]]
+    test_dir_prefixes: list[str] | None
+    # (test_dir, impl_dir) -> get_test_dir_match reason, filled lazily because most repos only look up a handful of impl dirs
+    dir_matches: dict[tuple[str, str], str] = field(default_factory=dict)
+
+
+def build_test_file_index(
+    all_file_paths: list[str], test_dir_prefixes: list[str] | None
+):
+    """One pass over the tree: run is_test_file and the naming-convention strip once per path instead of once per (impl file, path) pair."""
+    tests_by_stem: dict[str, list[tuple[str, str]]] = {}
+    for fp in all_file_paths:
+        stem = get_test_file_stem(fp)
+        if not stem:
+            logger.debug("build_test_file_index: skipping %s", fp)
+            continue
+        tests_by_stem.setdefault(stem, []).append((fp, str(Path(fp).parent).lower()))
+
+    logger.info(
+        "build_test_file_index: %d test stems from %d paths",
+        len(tests_by_stem),
+        len(all_file_paths),
+    )
+    return TestFileIndex(
+        tests_by_stem=tests_by_stem, test_dir_prefixes=test_dir_prefixes
+    )
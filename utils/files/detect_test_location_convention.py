@@ -1,8 +1,6 @@
-import os
-
 from constants.files import SKIP_DIRS, TOP_LEVEL_TEST_DIRS
+from services.git.get_repo_snapshot import get_repo_snapshot
 from utils.error.handle_exceptions import handle_exceptions
-from utils.files.is_test_file import is_test_file
 from utils.logging.logging_config import logger
 
 
@@ -11,26 +9,32 @@ def detect_test_location_convention(clone_dir: str):
     counts: dict[str, int] = {"co-located": 0, "__tests__": 0, "separate": 0}
     examples: dict[str, str] = {}
 
-    for dirpath, dirnames, filenames in os.walk(clone_dir):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-
-        for filename in filenames:
-            if not is_test_file(filename):
-                continue
+    snapshot = get_repo_snapshot(clone_dir)
+    if snapshot is None:
+        logger.info("No snapshot of %s, skipping location detection", clone_dir)
+        return None
 
-            rel_path = os.path.relpath(os.path.join(dirpath, filename), clone_dir)
-            parts = rel_path.split(os.sep)
+    for file in snapshot.files:
+        parts = file.path.split("/")
+        # Named like a test (foo.test.ts, test_foo.py); is_test would also count fixtures, mocks and .github/ files that say nothing about where tests live
+        if file.test_naming_pattern is None or SKIP_DIRS.intersection(parts[:-1]):
+            logger.debug("Location detection: skipping %s", file.path)
+            continue
 
-            if "__tests__" in parts:
-                category = "__tests__"
-            elif parts[0] in TOP_LEVEL_TEST_DIRS:
-                category = "separate"
-            else:
-                category = "co-located"
+        if "__tests__" in parts:
+            logger.debug("Location detection: %s is in __tests__", file.path)
+            category = "__tests__"
+        elif parts[0] in TOP_LEVEL_TEST_DIRS:
+            logger.debug("Location detection: %s is separate", file.path)
+            category = "separate"
+        else:
+            logger.debug("Location detection: %s is co-located", file.path)
+            category = "co-located"
 
-            counts[category] += 1
-            if category not in examples:
-                examples[category] = rel_path
+        counts[category] += 1
+        if category not in examples:
+            logger.debug("Location detection: %s example %s", category, file.path)
+            examples[category] = file.path
 
     logger.info(
         "Test location convention detection: counts=%s in %s", counts, clone_dir
@@ -1,6 +1,5 @@
-import os
-
 from constants.files import SKIP_DIRS, TEST_NAMING_PATTERNS
+from services.git.get_repo_snapshot import get_repo_snapshot
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
@@ -11,24 +10,30 @@ def detect_test_naming_convention(clone_dir: str):
     examples: dict[str, str] = {}
     templates: dict[str, str] = {}
 
-    # os.walk yields (dirpath, dirnames, filenames) for each directory in the tree:
-    # e.g. ("/tmp/repo/src", ["models", "utils"], ["index.ts", "User.spec.ts"])
-    for _dirpath, dirnames, filenames in os.walk(clone_dir):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-
-        for filename in filenames:
-            filename_lower = filename.lower()
-            for p in TEST_NAMING_PATTERNS:
-                if p.detect.search(filename_lower):  # pylint: disable=no-member
-                    counts[p.name] = counts.get(p.name, 0) + 1
-                    if p.name not in examples:
-                        examples[p.name] = filename
-                        templates[p.name] = p.description
-                    break  # One file matches at most one pattern
+    snapshot = get_repo_snapshot(clone_dir)
+    if snapshot is None:
+        logger.info("No snapshot of %s, skipping naming detection", clone_dir)
+        return None
+
+    patterns = {p.name: p for p in TEST_NAMING_PATTERNS}
+    for file in snapshot.files:
+        if file.test_naming_pattern is None or SKIP_DIRS.intersection(
+            file.path.split("/")[:-1]
+        ):
+            logger.debug("Naming detection: skipping %s", file.path)
+            continue
+
+        name = file.test_naming_pattern
+        counts[name] = counts.get(name, 0) + 1
+        if name not in examples:
+            logger.debug("Naming detection: %s example %s", name, file.path)
+            examples[name] = file.path.rsplit("/", 1)[-1]
+            templates[name] = patterns[name].description
 
     logger.info("Test naming convention detection: counts=%s in %s", counts, clone_dir)
 
     if not counts:
+        logger.info("No test files found in %s, skipping naming detection", clone_dir)
         return None
 
     total = sum(counts.values())
@@ -36,6 +41,7 @@ def detect_test_naming_convention(clone_dir: str):
 
     # Require at least 60% dominance to declare a convention
     if counts[dominant] / total < 0.6:
+        logger.info("No dominant test naming convention in %s", clone_dir)
         return None
 
     return templates[dominant].format(example=examples[dominant])
@@ -0,0 +1,47 @@
+from utils.logging.logging_config import logger
+
+
+def find_hunk_position(
+    image: list[str], preimage: list[str], line: int, match_beginning: bool
+):
+    """Return the index where preimage occurs in image, searching outward from line as git apply does (line, line + 1, line - 1, line + 2, ...), or -1 when it occurs nowhere.
+
+    The nearest occurrence wins, so a hunk whose header line numbers are a little off still lands on the copy of repeated boilerplate it was written against.
+    """
+    size = len(preimage)
+    if size > len(image):
+        logger.debug("find_hunk_position: preimage longer than file")
+        return -1
+
+    if match_beginning:
+        logger.debug("find_hunk_position: hunk must match at line 1")
+        return 0 if image[:size] == preimage else -1
+
+    line = min(max(line, 0), len(image))
+    backwards = forwards = line
+    try_line = line
+    step = 0
+    while True:
+        if image[try_line : try_line + size] == preimage:
+            logger.debug("find_hunk_position: match at %d (from %d)", try_line, line)
+            return try_line
+
+        if backwards == 0 and forwards == len(image):
+            logger.debug("find_hunk_position: no match from %d", line)
+            return -1
+
+        # Alternate forward and backward; once one side runs out only the other is left
+        go_forward = (
+            step % 2 == 0
+            if 0 < backwards and forwards < len(image)
+            else forwards < len(image)
+        )
+        if go_forward:
+            logger.debug("find_hunk_position: trying forward")
+            forwards += 1
+            try_line = forwards
+        else:
+            logger.debug("find_hunk_position: trying backward")
+            backwards -= 1
+            try_line = backwards
+        step += 1
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from utils.error.handle_exceptions import handle_exceptions
+from utils.files.build_test_file_index import TestFileIndex
+from utils.files.get_test_dir_match import get_test_dir_match
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=[], raise_on_error=False)
+def find_test_files_in_index(index: TestFileIndex, impl_file_path: str):
+    """Same result as find_test_files, but only the tests sharing impl_file_path's stem are inspected and each (test dir, impl dir) pair is resolved once per index."""
+    impl_stem = Path(impl_file_path).stem.lower()
+    if not impl_stem:
+        logger.warning("Could not extract stem from: %s", impl_file_path)
+        return list[str]()
+
+    # e.g. "src/utils" for "src/utils/generateId.ts"
+    impl_dir = str(Path(impl_file_path).parent).lower()
+
+    matches: list[str] = []
+    for fp, test_dir in index.tests_by_stem.get(impl_stem, []):
+        # Skip the impl file itself from candidate list
+        if fp == impl_file_path:
+            logger.info("Skipping %s: impl file itself", fp)
+            continue
+
+        key = (test_dir, impl_dir)
+        if key not in index.dir_matches:
+            logger.debug("find_test_files_in_index: resolving %s vs %s", *key)
+            index.dir_matches[key] = get_test_dir_match(
+                test_dir, impl_dir, index.test_dir_prefixes
+            )
+
+        reason = index.dir_matches[key]
+        if reason:
+            logger.info("Found test %s for %s (%s)", fp, impl_file_path, reason)
+            matches.append(fp)
+        else:
+            logger.info(
+                "Skipping %s: same name as %s but unrelated directory",
+                fp,
+                impl_file_path,
+            )
+
+    logger.info("Found %d test files for %s", len(matches), impl_file_path)
+    return matches
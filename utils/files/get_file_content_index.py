@@ -0,0 +1,143 @@
+import os
+import threading
+from dataclasses import dataclass
+
+from cachetools import LRUCache
+
+from services.git.get_repo_snapshot import get_repo_snapshot
+from utils.command.run_subprocess import run_subprocess
+from utils.error.handle_exceptions import handle_exceptions
+from utils.files.grep_files import GREP_EXCLUDED_DIR_NAMES
+from utils.files.read_indexable_file import read_indexable_file
+from utils.logging.logging_config import logger
+
+# Clones whose tracked text adds up to more than this are left to grep_files rather than held in memory. Non-ASCII text can take up to 4x its size as a Python str, so this keeps the index to a small share of the Lambda's memory alongside the clone, node_modules and the agent's own state.
+FILE_CONTENT_INDEX_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class FileContentIndex:
+    clone_dir: str
+    commit: str  # HEAD the texts were last brought up to date with
+    texts: dict[
+        str, str
+    ]  # "src/main.py" -> file text, for every searchable tracked file
+
+
+# Keyed by clone_dir; one invocation searches one clone, so indexing another drops the previous one instead of keeping both in memory
+FILE_CONTENT_INDEXES: LRUCache[str, FileContentIndex] = LRUCache(maxsize=1)
+
+# search_local_file_contents runs on the agent's tool threads
+FILE_CONTENT_INDEXES_LOCK = threading.Lock()
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def get_file_content_index(clone_dir: str):
+    """Return the in-memory text of every file grep_files would search in clone_dir, or None when clone_dir is not a git clone or its text is over FILE_CONTENT_INDEX_MAX_BYTES.
+
+    Built from the working tree on the first search. The agent's file-edit tools (write_and_commit_file, apply_diff_to_file, search_and_replace, move_file, delete_file) all commit, so when HEAD has moved since the last search only the files changed between the two commits are read again.
+    """
+    if not clone_dir or not os.path.isdir(os.path.join(clone_dir, ".git")):
+        logger.warning("get_file_content_index: no valid git repo at %s", clone_dir)
+        return None
+
+    try:
+        commit = run_subprocess(
+            args=["git", "rev-parse", "--verify", "--quiet", "HEAD^{commit}"],
+            cwd=clone_dir,
+        ).stdout.strip()
+    except ValueError as e:
+        logger.warning("get_file_content_index: cannot resolve HEAD: %s", e)
+        return None
+
+    with FILE_CONTENT_INDEXES_LOCK:
+        index = FILE_CONTENT_INDEXES.get(clone_dir)
+
+    if index is not None and index.commit == commit:
+        logger.info("get_file_content_index: reusing index of %s", clone_dir)
+        return index
+
+    if index is not None:
+        logger.info(
+            "get_file_content_index: %s moved from %s to %s",
+            clone_dir,
+            index.commit,
+            commit,
+        )
+        try:
+            # --no-renames: a move is listed as its old path (now gone) and its new path
+            output = run_subprocess(
+                args=["git", "diff", "--name-only", "-z", "--no-renames"]
+                + [index.commit, commit],
+                cwd=clone_dir,
+            ).stdout
+            changed = [file_path for file_path in output.split("\0") if file_path]
+        except ValueError as e:
+            logger.warning(
+                "get_file_content_index: cannot diff %s, rebuilding: %s", clone_dir, e
+            )
+            changed = None
+
+        if changed is not None:
+            logger.info("get_file_content_index: rereading changed files")
+            with FILE_CONTENT_INDEXES_LOCK:
+                for file_path in changed:
+                    text = read_indexable_file(clone_dir, file_path)
+                    if text is None:
+                        logger.debug("get_file_content_index: dropping %s", file_path)
+                        index.texts.pop(file_path, None)
+                    else:
+                        logger.debug("get_file_content_index: updating %s", file_path)
+                        index.texts[file_path] = text
+                index.commit = commit
+            logger.info(
+                "get_file_content_index: refreshed %d paths of %s",
+                len(changed),
+                clone_dir,
+            )
+            return index
+
+    snapshot = get_repo_snapshot(clone_dir, commit)
+    if snapshot is None:
+        logger.warning("get_file_content_index: no snapshot of %s", clone_dir)
+        return None
+
+    # Same selection as grep_files: tracked blobs, no symlinks, nothing under excluded dirs
+    files = [
+        file
+        for file in snapshot.files
+        if file.type == "blob"
+        and file.mode != "120000"
+        and not GREP_EXCLUDED_DIR_NAMES.intersection(file.path.split("/")[:-1])
+    ]
+
+    # Blob sizes come with the snapshot, so an oversized clone is turned away before anything is read
+    total_bytes = sum(file.size or 0 for file in files)
+    if total_bytes > FILE_CONTENT_INDEX_MAX_BYTES:
+        logger.warning(
+            "get_file_content_index: %d bytes in %s is over the %d limit",
+            total_bytes,
+            clone_dir,
+            FILE_CONTENT_INDEX_MAX_BYTES,
+        )
+        return None
+
+    texts: dict[str, str] = {}
+    for file in files:
+        text = read_indexable_file(clone_dir, file.path)
+        if text is None:
+            logger.debug("get_file_content_index: skipping %s", file.path)
+            continue
+        texts[file.path] = text
+
+    index = FileContentIndex(clone_dir=clone_dir, commit=commit, texts=texts)
+    with FILE_CONTENT_INDEXES_LOCK:
+        FILE_CONTENT_INDEXES[clone_dir] = index
+    logger.info(
+        "get_file_content_index: indexed %d files (%d bytes) of %s at %s",
+        len(texts),
+        total_bytes,
+        clone_dir,
+        commit,
+    )
+    return index
@@ -0,0 +1,26 @@
+import os
+
+from utils.logging.logging_config import logger
+
+
+def get_local_files_signature(base_dir: str, file_names: list[str]):
+    """Return ((name, mtime_ns, size), ...) for the file_names that exist under base_dir.
+
+    A cheap stat-only key for caching something derived from those files: it changes when any of them is created, deleted or rewritten, without reading their content.
+    """
+    signature: list[tuple[str, int, int]] = []
+    for name in file_names:
+        try:
+            stat = os.stat(os.path.join(base_dir, name))
+        except OSError:
+            logger.debug("get_local_files_signature: %s not present", name)
+            continue
+        signature.append((name, stat.st_mtime_ns, stat.st_size))
+
+    logger.debug(
+        "get_local_files_signature: %d of %d present in %s",
+        len(signature),
+        len(file_names),
+        base_dir,
+    )
+    return tuple(signature)
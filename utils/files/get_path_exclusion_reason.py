@@ -0,0 +1,49 @@
+from constants.testing import (
+    REASON_CONFIG,
+    REASON_DEPENDENCY,
+    REASON_MIGRATION,
+    REASON_NOT_CODE,
+    REASON_TEST,
+    REASON_TYPE,
+)
+from utils.files.is_code_file import is_code_file
+from utils.files.is_config_file import is_config_file
+from utils.files.is_dependency_file import is_dependency_file
+from utils.files.is_migration_file import is_migration_file
+from utils.files.is_test_file import is_test_file
+from utils.files.is_type_file import is_type_file
+from utils.logging.logging_config import logger
+
+
+def get_path_exclusion_reason(file_path: str):
+    """Return the permanent exclusion reason decidable from the path alone, or None if the file needs its content read.
+
+    Checks run in the order schedule_handler always applied them, so a vendored test file is still "not code file" or "dependency file", never "test file".
+    """
+    if not is_code_file(file_path):
+        logger.debug("get_path_exclusion_reason: %s not code", file_path)
+        return REASON_NOT_CODE
+
+    # e.g. vendor/, node_modules/
+    if is_dependency_file(file_path):
+        logger.debug("get_path_exclusion_reason: %s dependency", file_path)
+        return REASON_DEPENDENCY
+
+    if is_test_file(file_path):
+        logger.debug("get_path_exclusion_reason: %s test", file_path)
+        return REASON_TEST
+
+    if is_config_file(file_path):
+        logger.debug("get_path_exclusion_reason: %s config", file_path)
+        return REASON_CONFIG
+
+    if is_type_file(file_path):
+        logger.debug("get_path_exclusion_reason: %s type", file_path)
+        return REASON_TYPE
+
+    if is_migration_file(file_path):
+        logger.debug("get_path_exclusion_reason: %s migration", file_path)
+        return REASON_MIGRATION
+
+    logger.debug("get_path_exclusion_reason: %s needs content check", file_path)
+    return None
@@ -0,0 +1,95 @@
+from constants.files import TEST_DIR_NAMES
+from utils.logging.logging_config import logger
+
+
+def get_test_dir_match(
+    test_dir: str, impl_dir: str, test_dir_prefixes: list[str] | None
+):
+    """Return why a test in test_dir can belong to an impl in impl_dir ("" when it can't). Both dirs are lowercased.
+
+    Directory matching rules:
+    1. Same directory (colocated): src/utils/generateId.test.ts
+    2. Child test subdirectory: src/models/__tests__/Quote.test.ts
+    3. Custom prefix from repo settings: tests/php/unit/Services/FooTest.php for app/Services/Foo.php
+    4. Mirror directory: test/spec/services/getPolicyInfo.test.ts for src/services/getPolicyInfo.ts
+    """
+    # e.g. src/utils/generateId.ts and src/utils/generateId.test.ts
+    if test_dir == impl_dir:
+        logger.info("get_test_dir_match: %s colocated", test_dir)
+        return "colocated"
+
+    # e.g. src/models/Quote.tsx and src/models/__tests__/Quote.test.ts
+    if test_dir in {f"{impl_dir}/{d}" for d in TEST_DIR_NAMES}:
+        logger.info("get_test_dir_match: %s is child test dir", test_dir)
+        return "child test dir"
+
+    test_parts = test_dir.split("/")
+    impl_parts = impl_dir.split("/")
+
+    # Custom test dir prefixes from DB (e.g. "tests/php/unit" for SPIDERPLUS).
+    # Strip the prefix and compare remaining path with impl dir.
+    for tdp in test_dir_prefixes or []:
+        tdp_lower = tdp.lower().rstrip("/")
+
+        # e.g. test file directly in tests/php/unit/ (no subdirectory)
+        if test_dir == tdp_lower:
+            logger.info("get_test_dir_match: %s is prefix root", test_dir)
+            return f"directly in prefix root {tdp}"
+
+        # This prefix doesn't apply to this test dir
+        if not test_dir.startswith(tdp_lower + "/"):
+            logger.debug("get_test_dir_match: prefix %s does not apply", tdp)
+            continue
+
+        remainder = test_dir[len(tdp_lower) + 1 :]
+
+        # e.g. tests/php/unit/app/Services/ -> app/Services/ == app/Services/
+        if remainder == impl_dir:
+            logger.info("get_test_dir_match: %s prefix full path match", test_dir)
+            return f"prefix {tdp}, full path match"
+
+        # e.g. tests/php/unit/Services/ -> Services/ matches suffix of app/Services/
+        for i in range(len(impl_parts) + 1):
+            if "/".join(impl_parts[i:]) == remainder:
+                logger.info("get_test_dir_match: %s prefix suffix match", test_dir)
+                return f"prefix {tdp}, suffix match"
+
+    # Mirror directory: find test dir component(s) in test path, strip them, then check if the remaining structural subpath matches impl subpath.
+    # Handles leading (test/services/), mid-path (core/tests/Unit/Service/), and deep (core/tests/Feature/Api/V1/) test dirs.
+    for start, part in enumerate(test_parts):
+        if part not in TEST_DIR_NAMES:
+            logger.debug("get_test_dir_match: %s is not a test dir name", part)
+            continue
+        end = start + 1
+        while end < len(test_parts) and test_parts[end] in TEST_DIR_NAMES:
+            end += 1
+        prefix = test_parts[:start]
+        suffix = test_parts[end:]
+
+        # Strategy 1: prefix + suffix as suffix of impl_dir (strict)
+        mirror_subpath = "/".join(prefix + suffix)
+        for i in range(len(impl_parts) + 1):
+            if "/".join(impl_parts[i:]) == mirror_subpath:
+                logger.info("get_test_dir_match: %s strict mirror", test_dir)
+                return "mirror dir"
+
+        # Strategy 2: prefix is shared but mid-path diverges
+        # e.g. core/tests/Feature/Api/V1/ for core/app/Http/Controllers/Api/V1/ prefix "core" matches, but "app/Http/Controllers" differs from "tests/Feature"
+        prefix_path = "/".join(prefix)
+        # Different repo root, this test dir can't mirror this impl
+        if prefix_path and not impl_dir.startswith(prefix_path):
+            logger.debug("get_test_dir_match: different root %s", prefix_path)
+            continue
+
+        suffix_path = "/".join(suffix)
+        for i in range(len(impl_parts) + 1):
+            impl_suffix = "/".join(impl_parts[i:])
+            # Exact suffix match, or plural tolerance: "Service" matches "Services" (Laravel convention)
+            if impl_suffix in (suffix_path, suffix_path + "s") or suffix_path == (
+                impl_suffix + "s"
+            ):
+                logger.info("get_test_dir_match: %s loose mirror", test_dir)
+                return "mirror dir"
+
+    logger.info("get_test_dir_match: %s unrelated to %s", test_dir, impl_dir)
+    return ""
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from constants.files import (
+    TEST_NAMING_PATTERNS,
+    TEST_QUALIFIER_STRIP,
+    TEST_SUPPORT_PATTERNS,
+)
+from utils.files.is_test_file import is_test_file
+from utils.logging.logging_config import logger
+
+
+def get_test_file_stem(file_path: str):
+    """Return the lowercased impl stem a test file targets, or None if file_path is not a real test.
+
+    e.g. "src/__tests__/Quote.spec.ts" -> "quote", "tests/test_utils.py" -> "utils", "e2e/disable-schedules.integration.test.ts" -> "disable-schedules".
+    Mocks, fixtures and snapshots return None even though is_test_file accepts them."""
+    if not is_test_file(file_path):
+        logger.debug("get_test_file_stem: %s is not a test file", file_path)
+        return None
+
+    if any(p.search(file_path.lower()) for p in TEST_SUPPORT_PATTERNS):
+        logger.info("Skipping %s: not a real test (mock/fixture/snapshot)", file_path)
+        return None
+
+    test_base_stem = Path(file_path).stem
+    for p in TEST_NAMING_PATTERNS:
+        stripped = p.stem_strip.sub("", test_base_stem)  # pylint: disable=no-member
+        if stripped != test_base_stem:
+            # Found naming convention. Only apply first match to avoid double-stripping.
+            # e.g. "test_utils" -> "utils", "Quote.spec" -> "Quote"
+            logger.info("%s uses %s naming, impl stem: %s", file_path, p.name, stripped)
+            test_base_stem = stripped
+            break
+
+    # Without this, "disable-schedules.integration" won't match impl stem "disable-schedules"
+    # e.g. "disable-schedules.integration" -> "disable-schedules", "disable-schedules" -> no-op
+    test_base_stem = TEST_QUALIFIER_STRIP.sub("", test_base_stem).lower()
+    logger.debug("get_test_file_stem: %s -> %s", file_path, test_base_stem)
+    return test_base_stem
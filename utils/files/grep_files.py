@@ -1,59 +1,93 @@
 import os
 import subprocess
 
+from services.git.get_repo_snapshot import get_repo_snapshot
 from utils.files.grep_patterns import GREP_EXCLUDE_DIRS
 from utils.error.handle_exceptions import handle_exceptions
 from utils.logging.logging_config import logger
 
+GREP_EXCLUDED_DIR_NAMES = frozenset(
+    flag.removeprefix("--exclude-dir=") for flag in GREP_EXCLUDE_DIRS
+)
+
+# Paths passed per grep process, well under ARG_MAX even for deep monorepo paths
+GREP_PATHS_PER_CALL = 2000
+
 
 @handle_exceptions(default_return_value={}, raise_on_error=False)
 def grep_files(query: str, search_dir: str):
-    """Run grep -r -n on search_dir and return matching file paths with lines."""
+    """Run grep -n on the tracked files of search_dir and return matching file paths with lines. The query is matched as a fixed string, as the search tool tells the agent and search_file_content_index does, not as a regex."""
     if not os.path.isdir(search_dir):
         logger.warning("Directory not found: %s", search_dir)
         return dict[str, list[str]]()
 
-    result = subprocess.run(
-        [
-            "grep",
-            "-r",  # Recursive search
-            "-n",  # Show line numbers with matching lines
-            # Skip binary files (images, compiled files, etc.)
-            "--binary-files=without-match",
-            *GREP_EXCLUDE_DIRS,
-            "-e",
-            query,  # -e explicitly marks the search pattern
-            ".",  # Search under search_dir (set via cwd)
-        ],
-        capture_output=True,
-        check=False,
-        cwd=search_dir,
-        text=True,
-        timeout=30,
-    )
-
-    # grep returns 1 when no matches found (not an error)
-    if result.returncode not in (0, 1):
-        logger.warning(
-            "grep failed with return code %d: %s", result.returncode, result.stderr
-        )
+    # Search the tracked files of the shared snapshot instead of recursing the tree again on every query. Symlinks and submodules are skipped as grep -r did.
+    snapshot = get_repo_snapshot(search_dir)
+    if snapshot is None:
+        logger.warning("grep_files: no snapshot of %s", search_dir)
         return dict[str, list[str]]()
 
-    if not result.stdout.strip():
+    paths = [
+        file.path
+        for file in snapshot.files
+        if file.type == "blob"
+        and file.mode != "120000"
+        and not GREP_EXCLUDED_DIR_NAMES.intersection(file.path.split("/")[:-1])
+    ]
+
+    stdout = ""
+    for start in range(0, len(paths), GREP_PATHS_PER_CALL):
+        chunk = paths[start : start + GREP_PATHS_PER_CALL]
+        result = subprocess.run(
+            [
+                "grep",
+                "-n",  # Show line numbers with matching lines
+                "-H",  # Prefix the path even when a chunk holds a single file
+                "-s",  # A tracked file deleted from the working tree is not an error worth reporting
+                "-F",  # Literal match, so "foo(" or "a.b" is not read as a pattern
+                # Skip binary files (images, compiled files, etc.)
+                "--binary-files=without-match",
+                "-e",
+                query,  # -e explicitly marks the search pattern
+                "--",
+                *chunk,
+            ],
+            capture_output=True,
+            check=False,
+            cwd=search_dir,
+            text=True,
+            timeout=30,
+        )
+
+        # grep returns 1 when no matches found (not an error). It returns 2 for a missing file too, but -s leaves stderr empty for that.
+        if result.returncode not in (0, 1) and result.stderr.strip():
+            logger.warning(
+                "grep failed with return code %d: %s", result.returncode, result.stderr
+            )
+            return dict[str, list[str]]()
+
+        logger.debug("grep_files: searched %d paths", len(chunk))
+        stdout += result.stdout
+
+    if not stdout.strip():
+        logger.info("grep_files: no matches for %s", query)
         return dict[str, list[str]]()
 
-    # Parse grep -n output: ./path/to/file:123:matching line content
+    # Parse grep -n -H output: path/to/file:123:matching line content
     matches: dict[str, list[str]] = {}
-    for line in result.stdout.strip().split("\n"):
+    for line in stdout.strip().split("\n"):
         # Split on first two colons: file_path:line_number:content
         parts = line.split(":", 2)
         if len(parts) < 3:
+            logger.debug("grep_files: skipping unparseable line")
             continue
-        file_path = parts[0].strip().removeprefix("./")
+        file_path = parts[0].strip()
         line_num = parts[1]
         content = parts[2]
         if file_path not in matches:
+            logger.debug("grep_files: match in %s", file_path)
             matches[file_path] = []
         matches[file_path].append(f"{line_num}:{content}")
 
+    logger.info("grep_files: %d files match %s", len(matches), query)
     return matches
@@ -1,5 +1,7 @@
 import re
+
 from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
 
 CONFIG_FILE_PATTERNS = [
     # JavaScript/TypeScript config files
@@ -13,15 +15,17 @@ CONFIG_FILE_PATTERNS = [
     r"(^|/)setup\.py$",  # package setup
 ]
 
+# Joined into one regex since this runs once per file of a repo snapshot
+CONFIG_FILE_PATTERN = re.compile("|".join(CONFIG_FILE_PATTERNS))
+
 
 @handle_exceptions(default_return_value=False, raise_on_error=False)
 def is_config_file(file_path: str):
     """Check if a file is a config file (not actual test code)."""
     if not isinstance(file_path, str):
+        logger.debug("is_config_file: non-string input: %s", type(file_path))
         return False
 
-    file_path_lower = file_path.lower()
-    for pattern in CONFIG_FILE_PATTERNS:
-        if re.search(pattern, file_path_lower):
-            return True
-    return False
+    is_config = CONFIG_FILE_PATTERN.search(file_path.lower()) is not None
+    logger.debug("is_config_file: %s -> %s", file_path, is_config)
+    return is_config
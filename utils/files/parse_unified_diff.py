@@ -0,0 +1,135 @@
+from dataclasses import dataclass, field
+
+from utils.files.fix_diff_hunk_counts import HUNK_HEADER_RE
+from utils.logging.logging_config import logger
+
+
+@dataclass
+class DiffHunk:
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    # Body lines with their marker: " context", "-removed", "+added". A bare empty line is stored as " ", the empty context line GNU diff emits.
+    lines: list[str] = field(default_factory=list)
+
+
+@dataclass
+class FilePatch:
+    old_path: str  # "src/main.py" without the a/ prefix, or "/dev/null" for a new file
+    new_path: str  # "src/main.py" without the b/ prefix, or "/dev/null" for a deletion
+    hunks: list[DiffHunk] = field(default_factory=list)
+
+
+@dataclass
+class ParsedDiff:
+    patches: list[FilePatch]
+    error: str  # git apply's message for input it refuses, "" when the diff parsed
+
+
+def parse_unified_diff(diff_text: str):
+    """Split a unified diff into per-file patches the way git apply reads it.
+
+    A file header is a "--- " line directly followed by "+++ " and "@@ -"; anything else between patches (diff --git, index, prose) is skipped. Each hunk body is read for exactly as many lines as its header counts, so callers should run fix_diff_hunk_counts first.
+    """
+    lines = diff_text.split("\n")
+    if lines and lines[-1] == "":
+        logger.debug("parse_unified_diff: dropping split artifact of final newline")
+        lines.pop()
+
+    patches: list[FilePatch] = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("@@ -"):
+            logger.info(
+                "parse_unified_diff: hunk without file header at line %d", i + 1
+            )
+            return ParsedDiff(
+                patches=[],
+                error=f"error: patch fragment without header at line {i + 1}: {line}",
+            )
+
+        is_header = (
+            line.startswith("--- ")
+            and i + 2 < len(lines)
+            and lines[i + 1].startswith("+++ ")
+            and lines[i + 2].startswith("@@ -")
+        )
+        if not is_header:
+            logger.debug("parse_unified_diff: skipping line %d outside a patch", i + 1)
+            i += 1
+            continue
+
+        # "--- a/src/main.py\t2024-01-01 00:00:00" -> "src/main.py"
+        old_path = line[4:].split("\t", 1)[0].removeprefix("a/")
+        new_path = lines[i + 1][4:].split("\t", 1)[0].removeprefix("b/")
+        patch = FilePatch(old_path=old_path, new_path=new_path)
+        i += 2
+
+        while i < len(lines) and lines[i].startswith("@@ -"):
+            match = HUNK_HEADER_RE.match(lines[i])
+            if not match:
+                logger.info("parse_unified_diff: bad hunk header at line %d", i + 1)
+                return ParsedDiff(
+                    patches=[], error=f"error: corrupt patch at line {i + 1}"
+                )
+
+            old_count = 1 if match.group(2) is None else int(match.group(2))
+            new_count = 1 if match.group(4) is None else int(match.group(4))
+            hunk = DiffHunk(
+                old_start=int(match.group(1)),
+                old_count=old_count,
+                new_start=int(match.group(3)),
+                new_count=new_count,
+            )
+            i += 1
+
+            old_left, new_left = old_count, new_count
+            while old_left > 0 or new_left > 0:
+                body = lines[i] if i < len(lines) else None
+                if body is not None and body.startswith("\\"):
+                    logger.debug("parse_unified_diff: skipping no-newline marker")
+                    i += 1
+                    continue
+
+                marker = body[:1] if body else " "
+                if body is None or marker not in " -+":
+                    logger.info("parse_unified_diff: hunk cut short at line %d", i + 1)
+                    return ParsedDiff(
+                        patches=[], error=f"error: corrupt patch at line {i + 1}"
+                    )
+
+                if marker == "+":
+                    logger.debug("parse_unified_diff: added line")
+                    new_left -= 1
+                elif marker == "-":
+                    logger.debug("parse_unified_diff: removed line")
+                    old_left -= 1
+                else:
+                    logger.debug("parse_unified_diff: context line")
+                    old_left -= 1
+                    new_left -= 1
+
+                if old_left < 0 or new_left < 0:
+                    logger.info("parse_unified_diff: hunk overruns at line %d", i + 1)
+                    return ParsedDiff(
+                        patches=[], error=f"error: corrupt patch at line {i + 1}"
+                    )
+
+                hunk.lines.append(body or " ")
+                i += 1
+
+            patch.hunks.append(hunk)
+
+        patches.append(patch)
+
+    if not patches:
+        logger.info("parse_unified_diff: no patches in diff")
+        return ParsedDiff(
+            patches=[],
+            error='error: No valid patches in input (allow with "--allow-empty")',
+        )
+
+    logger.info("parse_unified_diff: %d patches", len(patches))
+    return ParsedDiff(patches=patches, error="")
@@ -0,0 +1,35 @@
+import os
+
+from config import UTF8
+from utils.error.handle_exceptions import handle_exceptions
+from utils.files.grep_files import GREP_EXCLUDED_DIR_NAMES
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def read_indexable_file(clone_dir: str, file_path: str):
+    """Return the text of file_path for the file content index, or None for a file grep_files would not search: under an excluded directory, a symlink, missing, or binary."""
+    if GREP_EXCLUDED_DIR_NAMES.intersection(file_path.split("/")[:-1]):
+        logger.debug("read_indexable_file: %s is in an excluded dir", file_path)
+        return None
+
+    local_path = os.path.join(clone_dir, file_path)
+    if os.path.islink(local_path) or not os.path.isfile(local_path):
+        logger.debug("read_indexable_file: %s is not a regular file", file_path)
+        return None
+
+    with open(local_path, "rb") as f:
+        data = f.read()
+
+    # Same files grep --binary-files=without-match skips in a UTF-8 locale: NUL bytes or invalid UTF-8
+    if b"\0" in data:
+        logger.debug("read_indexable_file: %s is binary", file_path)
+        return None
+    try:
+        text = data.decode(UTF8)
+    except UnicodeDecodeError:
+        logger.debug("read_indexable_file: %s is not valid UTF-8", file_path)
+        return None
+
+    logger.debug("read_indexable_file: read %d chars of %s", len(text), file_path)
+    return text
@@ -0,0 +1,60 @@
+from utils.error.handle_exceptions import handle_exceptions
+from utils.files.get_file_content_index import (
+    FILE_CONTENT_INDEXES_LOCK,
+    get_file_content_index,
+)
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def search_file_content_index(query: str, clone_dir: str):
+    """Find query in the in-memory file content index of clone_dir, returning the same {file_path: ["line_number:line", ...]} as grep_files, or None when the clone has no index.
+
+    The query is matched literally, as the search tool tells the agent; grep read it as a basic regex.
+    """
+    index = get_file_content_index(clone_dir)
+    if index is None:
+        logger.info("search_file_content_index: no index of %s", clone_dir)
+        return None
+
+    # Copied under the lock so a refresh on another tool thread cannot change the dict mid-scan
+    with FILE_CONTENT_INDEXES_LOCK:
+        texts = list(index.texts.items())
+
+    # One C-level substring scan per file; only the files that contain the query are split into lines
+    candidates = [
+        (file_path, text) for file_path, text in texts if text and query in text
+    ]
+
+    matches: dict[str, list[str]] = {}
+    for file_path, text in candidates:
+        lines: list[str] = []
+        line_number = 1
+        counted_to = 0
+        position = text.find(query)
+        # An empty query matches every line, but not the empty "line" after a final newline
+        while position != -1 and position < len(text):
+            line_number += text.count("\n", counted_to, position)
+            counted_to = position
+            start = text.rfind("\n", 0, position) + 1
+            end = text.find("\n", position)
+            if end == -1:
+                logger.debug("search_file_content_index: match on last line")
+                end = len(text)
+            # grep_files read grep's output in text mode, which turned CRLF into LF
+            line = text[start:end].removesuffix("\r")
+            lines.append(f"{line_number}:{line}")
+            # One entry per line however many times the query appears in it
+            position = text.find(query, end + 1)
+
+        logger.debug("search_file_content_index: %d lines in %s", len(lines), file_path)
+        matches[file_path] = lines
+
+    logger.info(
+        "search_file_content_index: %d files match %s in %d indexed",
+        len(matches),
+        query,
+        len(texts),
+    )
+    # grep listed files in git's path order, which is plain string order
+    return dict(sorted(matches.items()))
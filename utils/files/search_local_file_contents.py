@@ -3,6 +3,7 @@ from anthropic.types import ToolUnionParam
 from services.types.base_args import BaseArgs
 from utils.error.handle_exceptions import handle_exceptions
 from utils.files.grep_files import grep_files
+from utils.files.search_file_content_index import search_file_content_index
 from utils.logging.logging_config import logger
 
 SEARCH_LOCAL_FILE_CONTENT: ToolUnionParam = {
@@ -28,9 +29,12 @@ MAX_LINES_PER_FILE = 10
 
 @handle_exceptions(default_return_value="", raise_on_error=False)
 def search_local_file_contents(query: str, base_args: BaseArgs, **_kwargs):
-    """Search for a keyword in the local clone directory using grep."""
+    """Search for a keyword in the local clone directory, from memory once the clone's file content index is built."""
     clone_dir = base_args["clone_dir"]
-    matches = grep_files(query=query, search_dir=clone_dir)
+    matches = search_file_content_index(query=query, clone_dir=clone_dir)
+    if matches is None:
+        logger.info("No file content index of %s, falling back to grep", clone_dir)
+        matches = grep_files(query=query, search_dir=clone_dir)
 
     if not matches:
         msg = f"0 files found for the search query '{query}'.\n"
@@ -44,11 +48,13 @@ def search_local_file_contents(query: str, base_args: BaseArgs, **_kwargs):
         for line in lines[:MAX_LINES_PER_FILE]:
             result_lines.append(f"{fp}:{line}")
         if len(lines) > MAX_LINES_PER_FILE:
+            logger.debug("Capping %s at %d lines", fp, MAX_LINES_PER_FILE)
             result_lines.append(f"{fp}: ... and {len(lines) - MAX_LINES_PER_FILE} more")
     msg = f"{total_files} files found for the search query '{query}':\n" + "\n".join(
         result_lines
     )
     if total_files > 20:
+        logger.debug("Capping %d files at 20", total_files)
         msg += f"\n... and {total_files - 20} more files"
     msg += "\n"
     logger.info(msg)
@@ -1,20 +1,22 @@
-# pylint: disable=implicit-str-concat
+# pylint: disable=implicit-str-concat,redefined-outer-name
 # pyright: reportUnusedVariable=false
 import os
-import subprocess
 
 import pytest
 
-from utils.files.apply_patch import apply_patch
+from utils.files.apply_patch import PatchResult, apply_patch
 
 
 @pytest.fixture
 def clone_dir(tmp_path):
-    """Create a git repo in a temp directory for git apply to work."""
-    subprocess.run(["git", "init"], cwd=str(tmp_path), capture_output=True, check=True)
+    """apply_patch only checks the clone for whether the target exists."""
     return str(tmp_path)
 
 
+def _error(diff_display: str, stderr: str):
+    return f"Failed to apply diff. Fix the diff and try again.\n\ndiff_text:\n```\n{diff_display}\n```\n\nstderr:\n```\n{stderr}\n```\n"
+
+
 def test_apply_simple_modification(clone_dir):
     original = "line1\nline2\nline3\n"
     diff = (
@@ -27,9 +29,7 @@ def test_apply_simple_modification(clone_dir):
         " line3\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "line2_modified" in result.content
-    assert "line2\n" not in result.content
+    assert result == PatchResult(content="line1\nline2_modified\nline3\n", error="")
 
 
 def test_apply_new_file(clone_dir):
@@ -42,10 +42,7 @@ def test_apply_new_file(clone_dir):
         "+line3\n"
     )
     result = apply_patch("", diff, clone_dir, "new_file.txt")
-    assert result.error == ""
-    assert "line1" in result.content
-    assert "line2" in result.content
-    assert "line3" in result.content
+    assert result == PatchResult(content="line1\nline2\nline3\n", error="")
 
 
 def test_apply_add_lines(clone_dir):
@@ -60,9 +57,7 @@ def test_apply_add_lines(clone_dir):
         " line2\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "added1" in result.content
-    assert "added2" in result.content
+    assert result == PatchResult(content="line1\nadded1\nadded2\nline2\n", error="")
 
 
 def test_apply_remove_lines(clone_dir):
@@ -76,10 +71,7 @@ def test_apply_remove_lines(clone_dir):
         " line3\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "line2" not in result.content
-    assert "line1" in result.content
-    assert "line3" in result.content
+    assert result == PatchResult(content="line1\nline3\n", error="")
 
 
 def test_returns_error_on_bad_diff(clone_dir):
@@ -94,8 +86,16 @@ def test_returns_error_on_bad_diff(clone_dir):
         " line3\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error != ""
-    assert "stderr" in result.error
+    assert result == PatchResult(
+        content="",
+        error=_error(
+            "---·a/file.txt\n+++·b/file.txt\n@@·-1,3·+1,3·@@\n·WRONG_CONTEXT\n-line2\n+line2_modified\n·line3\n",
+            "Checking patch file.txt...\n"
+            "error: while searching for:\nWRONG_CONTEXT\nline2\nline3\n\n"
+            "error: patch failed: file.txt:1\n"
+            "error: file.txt: patch does not apply\n",
+        ),
+    )
 
 
 def test_preserves_crlf_line_endings(clone_dir):
@@ -110,13 +110,20 @@ def test_preserves_crlf_line_endings(clone_dir):
         " line3\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "\r\n" in result.content
+    assert result == PatchResult(
+        content="line1\r\nline2_modified\r\nline3\r\n", error=""
+    )
 
 
 def test_empty_original_no_diff_returns_empty(clone_dir):
     result = apply_patch("", "", clone_dir, "file.txt")
-    assert result.content == ""
+    assert result == PatchResult(
+        content="",
+        error=_error(
+            "",
+            'error: No valid patches in input (allow with "--allow-empty")\n',
+        ),
+    )
 
 
 def test_apply_new_file_without_ab_prefix(clone_dir):
@@ -132,12 +139,14 @@ def test_apply_new_file_without_ab_prefix(clone_dir):
         "+describe('getUserResolver', () => {});\n"
     )
     result = apply_patch("", diff, clone_dir, "src/resolvers/getUserResolver.test.ts")
-    assert result.error == ""
-    assert "getUserResolver" in result.content
+    assert result == PatchResult(
+        content="import getUserResolver from './getUserResolver';\n\ndescribe('getUserResolver', () => {});\n",
+        error="",
+    )
 
 
-def test_nested_file_path(clone_dir):
-    """Test that nested file paths work (parent dirs created automatically)."""
+def test_nested_file_path_is_not_written(clone_dir):
+    """The patch is applied in memory; apply_diff_to_file does the one write."""
     original = "content\n"
     diff = (
         "--- a/src/components/App.tsx\n"
@@ -146,10 +155,16 @@ def test_nested_file_path(clone_dir):
         "-content\n"
         "+new_content\n"
     )
+    os.makedirs(os.path.join(clone_dir, "src/components"))
+    with open(
+        os.path.join(clone_dir, "src/components/App.tsx"), "w", encoding="utf-8"
+    ) as f:
+        f.write(original)
+
     result = apply_patch(original, diff, clone_dir, "src/components/App.tsx")
-    assert result.error == ""
-    assert "new_content" in result.content
-    assert os.path.exists(os.path.join(clone_dir, "src/components/App.tsx"))
+    assert result == PatchResult(content="new_content\n", error="")
+    with open(os.path.join(clone_dir, "src/components/App.tsx"), encoding="utf-8") as f:
+        assert f.read() == original
 
 
 def test_error_message_wraps_diff_in_code_fences(clone_dir):
@@ -165,8 +180,8 @@ def test_error_message_wraps_diff_in_code_fences(clone_dir):
         " line3\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error != ""
-    assert "```" in result.error
+    assert result.error.split("\n")[2:4] == ["diff_text:", "```"]
+    assert result.error.endswith("error: file.txt: patch does not apply\n\n```\n")
 
 
 def test_zero_context_import_reorder_mid_file(clone_dir):
@@ -198,11 +213,22 @@ def test_zero_context_import_reorder_mid_file(clone_dir):
         "+from calculator import add, divide, main, multiply, subtract\n"
     )
     result = apply_patch(original, diff, clone_dir, "test_calculator.py")
-    assert result.error == ""
     # pytest should now come before calculator imports
-    pytest_pos = result.content.index("import pytest")
-    calc_pos = result.content.index("from calculator import")
-    assert pytest_pos < calc_pos
+    assert result == PatchResult(
+        content=(
+            "import math\n"
+            "from unittest.mock import patch\n"
+            "\n"
+            "import pytest\n"
+            "from calculator import add, divide, main, multiply, subtract\n"
+            "\n"
+            "\n"
+            "class TestAdd:\n"
+            "    def test_positive_integers(self):\n"
+            "        assert True\n"
+        ),
+        error="",
+    )
 
 
 def test_zero_context_empty_line_removal_mid_file(clone_dir):
@@ -220,8 +246,9 @@ def test_zero_context_empty_line_removal_mid_file(clone_dir):
         "+aaa\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "bbb\n\naaa\n" in result.content
+    assert result == PatchResult(
+        content="line1\nline2\nline3\nbbb\n\naaa\n\nline8\nline9\n", error=""
+    )
 
 
 def test_zero_context_pure_addition_mid_file(clone_dir):
@@ -235,8 +262,9 @@ def test_zero_context_pure_addition_mid_file(clone_dir):
         "+added2\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "line2\nadded1\nadded2\nline3\n" in result.content
+    assert result == PatchResult(
+        content="line1\nline2\nadded1\nadded2\nline3\n", error=""
+    )
 
 
 def test_zero_context_pure_deletion_mid_file(clone_dir):
@@ -246,7 +274,44 @@ def test_zero_context_pure_deletion_mid_file(clone_dir):
         "--- a/file.txt\n" "+++ b/file.txt\n" "@@ -3,2 +3,0 @@\n" "-line3\n" "-line4\n"
     )
     result = apply_patch(original, diff, clone_dir, "file.txt")
-    assert result.error == ""
-    assert "line3" not in result.content
-    assert "line4" not in result.content
-    assert "line2\nline5\n" in result.content
+    assert result == PatchResult(content="line1\nline2\nline5\n", error="")
+
+
+def test_stale_outer_context_is_rejected(clone_dir):
+    # With the default fuzz of 0 every context line must match, as with git apply
+    original = "line1\nline2\nline3\n"
+    diff = (
+        "--- a/file.txt\n"
+        "+++ b/file.txt\n"
+        "@@ -1,3 +1,3 @@\n"
+        " line0\n"
+        "-line2\n"
+        "+line2_modified\n"
+        " line3\n"
+    )
+    result = apply_patch(original, diff, clone_dir, "file.txt")
+    assert result == PatchResult(
+        content="",
+        error=_error(
+            diff.replace(" ", "·"),
+            "Checking patch file.txt...\n"
+            "error: while searching for:\nline0\nline2\nline3\n\n"
+            "error: patch failed: file.txt:1\n"
+            "error: file.txt: patch does not apply\n",
+        ),
+    )
+
+
+def test_fuzz_is_passed_to_apply_unified_diff(clone_dir):
+    original = "line1\nline2\nline3\n"
+    diff = (
+        "--- a/file.txt\n"
+        "+++ b/file.txt\n"
+        "@@ -1,3 +1,3 @@\n"
+        " line0\n"
+        "-line2\n"
+        "+line2_modified\n"
+        " line3\n"
+    )
+    result = apply_patch(original, diff, clone_dir, "file.txt", fuzz=1)
+    assert result == PatchResult(content="line1\nline2_modified\nline3\n", error="")
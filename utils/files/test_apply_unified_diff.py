@@ -0,0 +1,278 @@
+# pylint: disable=redefined-outer-name
+"""Tests for apply_unified_diff, most of them differential against `git apply --verbose --unidiff-zero`.
+
+The large cases edit the CPython stdlib fixtures in services/git/fixtures/ (repeated boilerplate across _pydecimal arithmetic methods, argparse Action subclasses and typing alias classes), so a zero-context hunk often matches in several places and only the search order decides where it lands. Each case is run through git apply in a scratch directory and through apply_unified_diff, and both the patched content and the stderr must agree.
+"""
+
+import difflib
+import os
+import random
+import subprocess
+
+import pytest
+
+from utils.files.apply_unified_diff import UnifiedDiffResult, apply_unified_diff
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "services",
+    "git",
+    "fixtures",
+)
+FIXTURES = ["_pydecimal.py.txt", "argparse.py.txt", "typing.py.txt"]
+TARGET = "target.py"
+
+
+def _read_fixture(name: str):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _git_apply(work_dir: str, original_text: str | None, diff_text: str):
+    """Run git apply the way apply_patch used to and return what it left behind."""
+    target = os.path.join(work_dir, TARGET)
+    if os.path.exists(target):
+        os.remove(target)
+    if original_text is not None:
+        with open(target, "w", encoding="utf-8", newline="") as f:
+            f.write(original_text)
+
+    diff_path = os.path.join(work_dir, "..", "change.diff")
+    with open(diff_path, "w", encoding="utf-8", newline="") as f:
+        f.write(diff_text)
+
+    result = subprocess.run(
+        ["git", "apply", "--verbose", "--unidiff-zero", diff_path],
+        cwd=work_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return UnifiedDiffResult(content="", error=result.stderr)
+    if not os.path.exists(target):
+        return UnifiedDiffResult(content="", error="")
+    with open(target, encoding="utf-8", newline="") as f:
+        return UnifiedDiffResult(content=f.read(), error="")
+
+
+@pytest.fixture
+def work_dir(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=str(repo), check=True)
+    return str(repo)
+
+
+def _assert_same_as_git(work_dir: str, original_text: str | None, diff_text: str):
+    expected = _git_apply(work_dir, original_text, diff_text)
+    actual = apply_unified_diff(original_text, diff_text, TARGET)
+    assert actual == expected
+    return actual
+
+
+def _random_edit(lines: list[str], rng: random.Random):
+    """Replace, insert or delete a few short runs of lines; return the new lines and the original indexes that were removed."""
+    new_lines = list(lines)
+    removed: list[int] = []
+    positions = sorted(rng.sample(range(0, len(lines) - 5, 7), 6), reverse=True)
+    for position in positions:
+        op = rng.choice(["replace", "insert", "delete"])
+        count = rng.randint(1, 3)
+        added = [f"    edited_{position}_{n} = {n}" for n in range(count)]
+        if op == "insert":
+            new_lines[position:position] = added
+        elif op == "delete":
+            del new_lines[position : position + count]
+            removed.extend(range(position, position + count))
+        else:
+            new_lines[position : position + count] = added
+            removed.extend(range(position, position + count))
+    return new_lines, sorted(removed)
+
+
+def _make_diff(old_lines: list[str], new_lines: list[str], context: int):
+    diff = difflib.unified_diff(
+        old_lines,
+        new_lines,
+        f"a/{TARGET}",
+        f"b/{TARGET}",
+        n=context,
+        lineterm="",
+    )
+    return "".join(f"{line}\n" for line in diff)
+
+
+def _join(lines: list[str]):
+    return "".join(f"{line}\n" for line in lines)
+
+
+CASES = [
+    (fixture, seed, context)
+    for fixture in FIXTURES
+    for seed in range(3)
+    for context in (0, 3)
+]
+
+
+@pytest.mark.parametrize("fixture,seed,context", CASES)
+def test_exact_line_numbers(work_dir, fixture, seed, context):
+    lines = _read_fixture(fixture).split("\n")[:-1]
+    new_lines, _ = _random_edit(lines, random.Random(seed))
+    diff = _make_diff(lines, new_lines, context)
+
+    result = _assert_same_as_git(work_dir, _join(lines), diff)
+    assert result == UnifiedDiffResult(content=_join(new_lines), error="")
+
+
+@pytest.mark.parametrize("fixture,seed,context", CASES)
+def test_shifted_line_numbers(work_dir, fixture, seed, context):
+    """The file gained lines above every hunk since the diff was written."""
+    lines = _read_fixture(fixture).split("\n")[:-1]
+    new_lines, _ = _random_edit(lines, random.Random(seed))
+    diff = _make_diff(lines, new_lines, context)
+    shifted = ["# license header"] * (seed + 2) + lines
+
+    _assert_same_as_git(work_dir, _join(shifted), diff)
+
+
+@pytest.mark.parametrize("fixture,seed,context", CASES)
+def test_stale_removed_line(work_dir, fixture, seed, context):
+    """A line the diff removes was changed since the diff was written."""
+    lines = _read_fixture(fixture).split("\n")[:-1]
+    new_lines, removed = _random_edit(lines, random.Random(seed))
+    diff = _make_diff(lines, new_lines, context)
+    stale = list(lines)
+    for index in removed:
+        stale[index] = f"{stale[index]}  # changed since"
+
+    _assert_same_as_git(work_dir, _join(stale), diff)
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_repeated_boilerplate_hunk(work_dir, fixture):
+    """A zero-context hunk whose single line occurs all over the file lands on the copy nearest its header."""
+    lines = _read_fixture(fixture).split("\n")[:-1]
+    counts: dict[str, int] = {}
+    for line in lines:
+        counts[line] = counts.get(line, 0) + 1
+    common = max((line for line in lines if line.strip()), key=lambda l: counts[l])
+    middle = [i for i, line in enumerate(lines) if line == common][counts[common] // 2]
+    new_lines = lines[:middle] + ["    # replaced"] + lines[middle + 1 :]
+    diff = _make_diff(lines, new_lines, 0)
+
+    for offset in (-3, 0, 4):
+        moved = diff.replace(
+            f"@@ -{middle + 1} +{middle + 1} @@",
+            f"@@ -{middle + 1 + offset} +{middle + 1 + offset} @@",
+        )
+        _assert_same_as_git(work_dir, _join(lines), moved)
+
+
+@pytest.mark.parametrize(
+    "original_text,diff_text",
+    [
+        # New file
+        (None, "--- /dev/null\n+++ b/target.py\n@@ -0,0 +1,2 @@\n+a\n+b\n"),
+        # New file that already exists
+        ("a\n", "--- /dev/null\n+++ b/target.py\n@@ -0,0 +1 @@\n+a\n"),
+        # Modifying a missing file
+        (None, "--- a/target.py\n+++ b/target.py\n@@ -1 +1 @@\n-a\n+b\n"),
+        # Deletion
+        ("a\nb\n", "--- a/target.py\n+++ /dev/null\n@@ -1,2 +0,0 @@\n-a\n-b\n"),
+        # Deletion that leaves lines behind
+        ("a\nb\n", "--- a/target.py\n+++ /dev/null\n@@ -1 +0,0 @@\n-a\n"),
+        # Insertion at the top of the file
+        ("a\nb\n", "--- a/target.py\n+++ b/target.py\n@@ -0,0 +1 @@\n+top\n"),
+        # Insertion at the end of the file
+        ("a\nb\n", "--- a/target.py\n+++ b/target.py\n@@ -2,0 +3 @@\n+end\n"),
+        # "@@ -0" pins the hunk to the first line, so a hunk meant elsewhere fails
+        ("a\nb\n", "--- a/target.py\n+++ b/target.py\n@@ -0,1 +0,1 @@\n-b\n+c\n"),
+        # Empty context line written as a bare newline
+        ("a\n\nb\n", "--- a/target.py\n+++ b/target.py\n@@ -1,3 +1,2 @@\n a\n\n-b\n"),
+        # Several hunks, the later one shifted by the earlier
+        (
+            "1\n2\n3\n4\n5\n6\n",
+            "--- a/target.py\n+++ b/target.py\n@@ -1,0 +2,2 @@\n+x\n+y\n@@ -5 +7 @@\n-5\n+five\n",
+        ),
+        # Second hunk fails after the first applied
+        (
+            "1\n2\n3\n",
+            "--- a/target.py\n+++ b/target.py\n@@ -1 +1 @@\n-1\n+one\n@@ -3 +3 @@\n-nope\n+three\n",
+        ),
+        # First hunk lands one line off, second fails: git reports the offset
+        (
+            "0\n1\n2\n3\n",
+            "--- a/target.py\n+++ b/target.py\n@@ -1 +1 @@\n-1\n+one\n@@ -3 +3 @@\n-nope\n+three\n",
+        ),
+        # Hunk cut short
+        ("a\nb\n", "--- a/target.py\n+++ b/target.py\n@@ -1,2 +1,2 @@\n-a\n"),
+        # Hunk without a file header
+        ("a\n", "@@ -1 +1 @@\n-a\n+b\n"),
+        # No diff at all
+        ("a\n", "not a diff\n"),
+        ("a\n", ""),
+    ],
+)
+def test_handcrafted_cases_match_git(work_dir, original_text, diff_text):
+    _assert_same_as_git(work_dir, original_text, diff_text)
+
+
+def test_single_patch_applies_whatever_its_path():
+    diff = "--- a/other.py\n+++ b/other.py\n@@ -1 +1 @@\n-a\n+b\n"
+    assert apply_unified_diff("a\n", diff, TARGET) == UnifiedDiffResult(
+        content="b\n", error=""
+    )
+
+
+def test_multi_file_diff_applies_only_matching_patch():
+    diff = (
+        "--- a/other.py\n+++ b/other.py\n@@ -1 +1 @@\n-x\n+y\n"
+        "--- a/target.py\n+++ b/target.py\n@@ -1 +1 @@\n-a\n+b\n"
+    )
+    assert apply_unified_diff("a\n", diff, TARGET) == UnifiedDiffResult(
+        content="b\n", error=""
+    )
+
+
+def test_multi_file_diff_without_matching_patch():
+    diff = (
+        "--- a/one.py\n+++ b/one.py\n@@ -1 +1 @@\n-x\n+y\n"
+        "--- a/two.py\n+++ b/two.py\n@@ -1 +1 @@\n-a\n+b\n"
+    )
+    assert apply_unified_diff("a\n", diff, TARGET) == UnifiedDiffResult(
+        content="",
+        error='error: No valid patches in input (allow with "--allow-empty")\n',
+    )
+
+
+FUZZ_ORIGINAL = "a\nb\nchanged\nold\nc\nd\n"
+FUZZ_DIFF = "--- a/target.py\n+++ b/target.py\n@@ -2,5 +2,5 @@\n b\n context\n-old\n+new\n c\n d\n"
+
+
+def test_fuzz_zero_requires_all_context():
+    assert apply_unified_diff(FUZZ_ORIGINAL, FUZZ_DIFF, TARGET) == UnifiedDiffResult(
+        content="",
+        error=(
+            "Checking patch target.py...\n"
+            "error: while searching for:\nb\ncontext\nold\nc\nd\n\n"
+            "error: patch failed: target.py:2\n"
+            "error: target.py: patch does not apply\n"
+        ),
+    )
+
+
+def test_fuzz_drops_outer_context():
+    assert apply_unified_diff(
+        FUZZ_ORIGINAL, FUZZ_DIFF, TARGET, fuzz=2
+    ) == UnifiedDiffResult(content="a\nb\nchanged\nnew\nc\nd\n", error="")
+
+
+def test_fuzz_never_drops_changed_lines():
+    diff = "--- a/target.py\n+++ b/target.py\n@@ -1,2 +1,2 @@\n x\n-gone\n+new\n"
+    assert apply_unified_diff("x\nother\n", diff, TARGET, fuzz=3).content == ""
+
+
+def test_negative_fuzz_raises():
+    with pytest.raises(ValueError, match="fuzz must be non-negative, got -1"):
+        apply_unified_diff(FUZZ_ORIGINAL, FUZZ_DIFF, TARGET, fuzz=-1)
@@ -0,0 +1,29 @@
+from utils.files.build_test_file_index import TestFileIndex, build_test_file_index
+
+
+def test_groups_tests_by_impl_stem_in_tree_order():
+    index = build_test_file_index(
+        [
+            "src/models/Quote.ts",
+            "src/models/__tests__/Quote.test.ts",
+            "test/models/quote.spec.ts",
+            "tests/test_utils.py",
+            "src/__mocks__/Quote.ts",
+        ],
+        ["tests"],
+    )
+    assert isinstance(index, TestFileIndex)
+    assert index.tests_by_stem == {
+        "quote": [
+            ("src/models/__tests__/Quote.test.ts", "src/models/__tests__"),
+            ("test/models/quote.spec.ts", "test/models"),
+        ],
+        "utils": [("tests/test_utils.py", "tests")],
+    }
+    assert index.test_dir_prefixes == ["tests"]
+    assert not index.dir_matches
+
+
+def test_tree_without_tests():
+    index = build_test_file_index(["src/a.ts", "README.md"], None)
+    assert not index.tests_by_stem
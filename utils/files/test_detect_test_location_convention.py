@@ -1,4 +1,5 @@
 import os
+import subprocess
 import tempfile
 
 from utils.files.detect_test_location_convention import detect_test_location_convention
@@ -10,6 +11,29 @@ def _create_files(base: str, paths: list[str]):
         os.makedirs(os.path.dirname(full), exist_ok=True)
         with open(full, "w", encoding="utf-8") as f:
             f.write("")
+    _commit_all(base)
+
+
+def _commit_all(repo_dir: str):
+    """detect/grep helpers read the git snapshot, so fixture files must be committed."""
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@test.com",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "fixture",
+        ],
+        cwd=repo_dir,
+        check=True,
+    )
 
 
 def test_co_located_convention():
@@ -1,5 +1,6 @@
 # pylint: disable=missing-module-docstring
 import os
+import subprocess
 
 from utils.files.detect_test_naming_convention import detect_test_naming_convention
 
@@ -10,6 +11,29 @@ def _create_files(base_dir: str, filenames: list[str]):
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         with open(filepath, "w", encoding="utf-8") as f:
             f.write("")
+    _commit_all(base_dir)
+
+
+def _commit_all(repo_dir: str):
+    """detect/grep helpers read the git snapshot, so fixture files must be committed."""
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@test.com",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "fixture",
+        ],
+        cwd=repo_dir,
+        check=True,
+    )
 
 
 # JS/TS: .spec. vs .test.
@@ -25,8 +49,7 @@ def test_js_spec_convention(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert ".spec." in result
+    assert result == "Use .spec. naming (e.g., Order.spec.ts)"
 
 
 def test_js_test_convention(tmp_path: str):
@@ -39,8 +62,7 @@ def test_js_test_convention(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert ".test." in result
+    assert result == "Use .test. naming (e.g., Order.test.tsx)"
 
 
 # Python: test_ prefix
@@ -56,8 +78,7 @@ def test_python_test_prefix(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert "test_ prefix" in result
+    assert result == "Use test_ prefix naming (e.g., test_billing.py)"
 
 
 # PHP/Java: XxxTest suffix
@@ -73,8 +94,7 @@ def test_php_test_suffix(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert "Test suffix" in result
+    assert result == "Use Test suffix naming (e.g., BillingTest.php)"
 
 
 def test_java_test_suffix(tmp_path: str):
@@ -86,8 +106,7 @@ def test_java_test_suffix(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert "Test suffix" in result
+    assert result == "Use Test suffix naming (e.g., OrderTest.java)"
 
 
 # Go: _test.go
@@ -103,8 +122,7 @@ def test_go_underscore_test(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert "_test suffix" in result
+    assert result == "Use _test suffix naming (e.g., billing_test.go)"
 
 
 # Ruby: _spec.rb (RSpec)
@@ -120,8 +138,7 @@ def test_ruby_underscore_spec(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert "_spec suffix" in result
+    assert result == "Use _spec suffix naming (e.g., order_spec.rb)"
 
 
 # Mixed within same ecosystem
@@ -138,8 +155,7 @@ def test_mixed_js_spec_dominant(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert ".spec." in result
+    assert result == "Use .spec. naming (e.g., Order.spec.ts)"
 
 
 def test_mixed_no_clear_winner(tmp_path: str):
@@ -181,8 +197,7 @@ def test_skips_node_modules(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert ".spec." in result
+    assert result == "Use .spec. naming (e.g., User.spec.ts)"
 
 
 def test_includes_example_filename(tmp_path: str):
@@ -194,5 +209,4 @@ def test_includes_example_filename(tmp_path: str):
         ],
     )
     result = detect_test_naming_convention(str(tmp_path))
-    assert result is not None
-    assert "UserTest.php" in result or "OrderTest.php" in result
+    assert result == "Use Test suffix naming (e.g., OrderTest.php)"
@@ -0,0 +1,50 @@
+from utils.files.find_hunk_position import find_hunk_position
+
+IMAGE = ["a", "b", "x", "c", "d", "x", "e"]
+
+
+def test_match_at_expected_line():
+    assert find_hunk_position(IMAGE, ["c", "d"], 3, False) == 3
+
+
+def test_match_after_expected_line():
+    assert find_hunk_position(IMAGE, ["e"], 2, False) == 6
+
+
+def test_match_before_expected_line():
+    assert find_hunk_position(IMAGE, ["a"], 4, False) == 0
+
+
+def test_nearest_copy_wins():
+    assert find_hunk_position(IMAGE, ["x"], 1, False) == 2
+    assert find_hunk_position(IMAGE, ["x"], 4, False) == 5
+
+
+def test_forward_tried_before_backward_at_same_distance():
+    assert find_hunk_position(["x", "y", "x"], ["x"], 1, False) == 2
+
+
+def test_no_match():
+    assert find_hunk_position(IMAGE, ["z"], 3, False) == -1
+
+
+def test_preimage_longer_than_image():
+    assert find_hunk_position(["a"], ["a", "b"], 0, False) == -1
+
+
+def test_empty_preimage_matches_at_line():
+    assert find_hunk_position(IMAGE, [], 4, False) == 4
+
+
+def test_line_past_end_is_clamped():
+    assert find_hunk_position(IMAGE, ["d"], 100, False) == 4
+    assert find_hunk_position(IMAGE, [], 100, False) == len(IMAGE)
+
+
+def test_negative_line_is_clamped():
+    assert find_hunk_position(IMAGE, ["b"], -5, False) == 1
+
+
+def test_match_beginning_only_tries_first_line():
+    assert find_hunk_position(IMAGE, ["a", "b"], 3, True) == 0
+    assert find_hunk_position(IMAGE, ["b"], 1, True) == -1
@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+
+from utils.files.build_test_file_index import build_test_file_index
+from utils.files.find_test_files_in_index import find_test_files_in_index
+from utils.files.is_code_file import is_code_file
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_finds_colocated_and_child_dir_tests():
+    index = build_test_file_index(
+        [
+            "src/utils/generateId.ts",
+            "src/utils/generateId.test.ts",
+            "src/utils/__tests__/generateId.spec.ts",
+            "other/generateId.test.ts",
+        ],
+        None,
+    )
+    assert find_test_files_in_index(index, "src/utils/generateId.ts") == [
+        "src/utils/generateId.test.ts",
+        "src/utils/__tests__/generateId.spec.ts",
+    ]
+
+
+def test_dir_matches_are_cached_per_dir_pair():
+    index = build_test_file_index(
+        ["src/a.ts", "src/b.ts", "src/a.test.ts", "src/b.test.ts"], None
+    )
+    find_test_files_in_index(index, "src/a.ts")
+    find_test_files_in_index(index, "src/b.ts")
+    assert index.dir_matches == {("src", "src"): "colocated"}
+
+
+def test_empty_stem():
+    index = build_test_file_index(["src/a.test.ts"], None)
+    assert not find_test_files_in_index(index, "")
+
+
+def test_matches_recorded_output_on_real_fixture():
+    # foxcom-forms-test-files.json was recorded from find_test_files before it was rebuilt on this index; code files without tests are left out of it
+    all_files = (FIXTURES_DIR / "foxcom-forms.txt").read_text().strip().split("\n")
+    expected = json.loads((FIXTURES_DIR / "foxcom-forms-test-files.json").read_text())
+    index = build_test_file_index(all_files, None)
+    actual = {
+        fp: tests
+        for fp in filter(is_code_file, all_files)
+        if (tests := find_test_files_in_index(index, fp))
+    }
+    assert actual == expected
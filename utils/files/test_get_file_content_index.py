@@ -0,0 +1,173 @@
+# pylint: disable=redefined-outer-name
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from services.git.get_repo_snapshot import REPO_SNAPSHOTS
+from utils.files.get_file_content_index import (
+    FILE_CONTENT_INDEXES,
+    get_file_content_index,
+)
+from utils.files.read_indexable_file import read_indexable_file
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    FILE_CONTENT_INDEXES.clear()
+    REPO_SNAPSHOTS.clear()
+    yield
+    FILE_CONTENT_INDEXES.clear()
+    REPO_SNAPSHOTS.clear()
+
+
+def _git(repo_dir: str, *args: str):
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test.com", *args],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _commit(repo_dir: str, files: dict[str, str | None]):
+    for rel_path, content in files.items():
+        full = os.path.join(repo_dir, rel_path)
+        if content is None:
+            os.remove(full)
+            continue
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8") as f:
+            f.write(content)
+    _git(repo_dir, "init", "-q")
+    _git(repo_dir, "add", "-A")
+    _git(repo_dir, "commit", "-q", "-m", "fixture")
+    return _git(repo_dir, "rev-parse", "HEAD")
+
+
+def test_indexes_tracked_text_files(tmp_path):
+    repo_dir = str(tmp_path)
+    commit = _commit(
+        repo_dir,
+        {
+            "src/app.ts": "export const a = 1;\n",
+            "README.md": "# Readme\n",
+            "node_modules/pkg/index.js": "module.exports = 1;\n",
+        },
+    )
+    # Untracked files are not searched, as with grep_files
+    with open(os.path.join(repo_dir, "scratch.txt"), "w", encoding="utf-8") as f:
+        f.write("untracked\n")
+
+    index = get_file_content_index(repo_dir)
+
+    assert index is not None
+    assert index.clone_dir == repo_dir
+    assert index.commit == commit
+    assert index.texts == {
+        "README.md": "# Readme\n",
+        "src/app.ts": "export const a = 1;\n",
+    }
+
+
+def test_reuses_index_while_head_is_unchanged(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(repo_dir, {"a.py": "a = 1\n", "b.py": "b = 2\n"})
+
+    with patch(
+        "utils.files.get_file_content_index.read_indexable_file",
+        wraps=read_indexable_file,
+    ) as spy:
+        first = get_file_content_index(repo_dir)
+        second = get_file_content_index(repo_dir)
+
+    assert second is first
+    assert [c.args for c in spy.call_args_list] == [
+        (repo_dir, "a.py"),
+        (repo_dir, "b.py"),
+    ]
+
+
+def test_rereads_only_files_changed_by_new_commits(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(
+        repo_dir,
+        {"a.py": "a = 1\n", "b.py": "b = 2\n", "old/c.py": "c = 3\n"},
+    )
+    first = get_file_content_index(repo_dir)
+
+    # What write_and_commit_file, move_file and delete_file leave behind
+    os.makedirs(os.path.join(repo_dir, "new"))
+    os.rename(os.path.join(repo_dir, "old/c.py"), os.path.join(repo_dir, "new/c.py"))
+    _commit(repo_dir, {"a.py": "a = 10\n", "b.py": None})
+    commit = _commit(repo_dir, {"d.py": "d = 4\n"})
+
+    with patch(
+        "utils.files.get_file_content_index.read_indexable_file",
+        wraps=read_indexable_file,
+    ) as spy:
+        index = get_file_content_index(repo_dir)
+
+    assert index is first
+    assert index is not None
+    assert index.commit == commit
+    assert index.texts == {"a.py": "a = 10\n", "d.py": "d = 4\n", "new/c.py": "c = 3\n"}
+    assert sorted(c.args[1] for c in spy.call_args_list) == [
+        "a.py",
+        "b.py",
+        "d.py",
+        "new/c.py",
+        "old/c.py",
+    ]
+
+
+def test_rebuilds_when_the_indexed_commit_is_gone(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(repo_dir, {"a.py": "a = 1\n"})
+    index = get_file_content_index(repo_dir)
+    assert index is not None
+    index.commit = "0" * 40
+    commit = _git(repo_dir, "rev-parse", "HEAD")
+
+    rebuilt = get_file_content_index(repo_dir)
+
+    assert rebuilt is not index
+    assert rebuilt is not None
+    assert (rebuilt.commit, rebuilt.texts) == (commit, {"a.py": "a = 1\n"})
+
+
+def test_leaves_oversized_clones_to_grep(tmp_path):
+    repo_dir = str(tmp_path)
+    _commit(repo_dir, {"a.py": "a = 1\n", "b.py": "b = 2\n"})
+
+    with patch("utils.files.get_file_content_index.FILE_CONTENT_INDEX_MAX_BYTES", 8):
+        assert get_file_content_index(repo_dir) is None
+
+    assert not FILE_CONTENT_INDEXES
+
+
+def test_keeps_only_the_latest_clone(tmp_path):
+    first_dir = str(tmp_path / "first")
+    second_dir = str(tmp_path / "second")
+    os.makedirs(first_dir)
+    os.makedirs(second_dir)
+    _commit(first_dir, {"a.py": "a = 1\n"})
+    _commit(second_dir, {"b.py": "b = 2\n"})
+
+    get_file_content_index(first_dir)
+    second = get_file_content_index(second_dir)
+
+    assert dict(FILE_CONTENT_INDEXES) == {second_dir: second}
+
+
+def test_returns_none_outside_a_git_clone(tmp_path):
+    assert get_file_content_index(str(tmp_path)) is None
+    assert get_file_content_index("") is None
+
+
+def test_returns_none_without_commits(tmp_path):
+    _git(str(tmp_path), "init", "-q")
+
+    assert get_file_content_index(str(tmp_path)) is None
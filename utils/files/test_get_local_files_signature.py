@@ -0,0 +1,31 @@
+import os
+
+from utils.files.get_local_files_signature import get_local_files_signature
+
+
+def test_only_existing_files_are_listed(tmp_path):
+    (tmp_path / "a.json").write_text("{}")
+    (tmp_path / "c.json").write_text('{"x": 1}')
+
+    signature = get_local_files_signature(str(tmp_path), ["a.json", "b.json", "c.json"])
+
+    assert [(name, size) for name, _, size in signature] == [
+        ("a.json", 2),
+        ("c.json", 8),
+    ]
+
+
+def test_rewrite_changes_signature(tmp_path):
+    config = tmp_path / ".eslintrc.json"
+    config.write_text("{}")
+    before = get_local_files_signature(str(tmp_path), [".eslintrc.json"])
+
+    config.write_text('{"rules": {}}')
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_local_files_signature(str(tmp_path), [".eslintrc.json"]) != before
+
+
+def test_missing_dir_returns_empty(tmp_path):
+    assert not get_local_files_signature(str(tmp_path / "nope"), ["package.json"])
@@ -0,0 +1,42 @@
+import pytest
+
+from constants.testing import (
+    REASON_CONFIG,
+    REASON_DEPENDENCY,
+    REASON_MIGRATION,
+    REASON_NOT_CODE,
+    REASON_TEST,
+    REASON_TYPE,
+)
+from utils.files.get_path_exclusion_reason import get_path_exclusion_reason
+
+
+@pytest.mark.parametrize(
+    "file_path,expected",
+    [
+        ("README.md", REASON_NOT_CODE),
+        ("package.json", REASON_NOT_CODE),
+        ("node_modules/lodash/index.js", REASON_DEPENDENCY),
+        ("vendor/autoload.php", REASON_DEPENDENCY),
+        ("src/utils/generateId.test.ts", REASON_TEST),
+        ("tests/test_main.py", REASON_TEST),
+        ("jest.config.js", REASON_CONFIG),
+        ("src/types/user.d.ts", REASON_TYPE),
+        (
+            "database/migrations/2024_01_01_000000_create_users_table.php",
+            REASON_MIGRATION,
+        ),
+        ("src/utils/generateId.ts", None),
+        ("app/services/quote.py", None),
+    ],
+)
+def test_get_path_exclusion_reason(file_path, expected):
+    assert get_path_exclusion_reason(file_path) == expected
+
+
+def test_vendored_test_file_is_dependency():
+    # Dependency check runs before the test check, matching schedule_handler's historical order
+    assert (
+        get_path_exclusion_reason("vendor/phpunit/tests/FooTest.php")
+        == REASON_DEPENDENCY
+    )
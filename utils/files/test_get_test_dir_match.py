@@ -0,0 +1,43 @@
+from utils.files.get_test_dir_match import get_test_dir_match
+
+
+def test_colocated():
+    assert get_test_dir_match("src/utils", "src/utils", None) == "colocated"
+
+
+def test_child_test_dir():
+    assert (
+        get_test_dir_match("src/models/__tests__", "src/models", None)
+        == "child test dir"
+    )
+
+
+def test_prefix_root():
+    assert (
+        get_test_dir_match("tests/php/unit", "app/services", ["tests/php/unit"])
+        == "directly in prefix root tests/php/unit"
+    )
+
+
+def test_prefix_suffix_match():
+    assert (
+        get_test_dir_match(
+            "tests/php/unit/services", "app/services", ["tests/php/unit/"]
+        )
+        == "prefix tests/php/unit/, suffix match"
+    )
+
+
+def test_strict_mirror():
+    assert get_test_dir_match("test/services", "src/services", None) == "mirror dir"
+
+
+def test_loose_mirror_with_plural():
+    assert (
+        get_test_dir_match("core/tests/unit/service", "core/app/services", None)
+        == "mirror dir"
+    )
+
+
+def test_unrelated_dirs():
+    assert not get_test_dir_match("other/tests", "src/services", None)
@@ -0,0 +1,28 @@
+from utils.files.get_test_file_stem import get_test_file_stem
+
+
+def test_jest_spec_in_tests_dir():
+    assert get_test_file_stem("src/__tests__/Quote.spec.ts") == "quote"
+
+
+def test_python_test_prefix():
+    assert get_test_file_stem("tests/test_utils.py") == "utils"
+
+
+def test_qualifier_is_stripped():
+    assert (
+        get_test_file_stem("e2e/disable-schedules.integration.test.ts")
+        == "disable-schedules"
+    )
+
+
+def test_php_test_suffix():
+    assert get_test_file_stem("tests/php/unit/Services/FooTest.php") == "foo"
+
+
+def test_non_test_file_returns_none():
+    assert get_test_file_stem("src/utils/generateId.ts") is None
+
+
+def test_mock_returns_none():
+    assert get_test_file_stem("src/__mocks__/api.ts") is None
@@ -1,4 +1,5 @@
 import os
+import subprocess
 
 from utils.files.grep_files import grep_files
 
@@ -8,15 +9,36 @@ def _create_file(base: str, rel_path: str, content: str = ""):
     os.makedirs(os.path.dirname(full), exist_ok=True)
     with open(full, "w", encoding="utf-8") as f:
         f.write(content)
+    _commit_all(str(base))
+
+
+def _commit_all(repo_dir: str):
+    """detect/grep helpers read the git snapshot, so fixture files must be committed."""
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@test.com",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "fixture",
+        ],
+        cwd=repo_dir,
+        check=True,
+    )
 
 
 def test_finds_matching_files_with_lines(tmp_path):
     _create_file(tmp_path, "src/main.py", "def hello_world(): pass")
     _create_file(tmp_path, "src/utils.py", "import os")
     result = grep_files("hello_world", str(tmp_path))
-    assert "src/main.py" in result
-    assert result["src/main.py"] == ["1:def hello_world(): pass"]
-    assert "src/utils.py" not in result
+    assert result == {"src/main.py": ["1:def hello_world(): pass"]}
 
 
 def test_returns_empty_for_no_matches(tmp_path):
@@ -34,8 +56,7 @@ def test_excludes_node_modules(tmp_path):
     _create_file(tmp_path, "node_modules/pkg/index.js", "const unique_var = 1")
     _create_file(tmp_path, "src/app.js", "const unique_var = 2")
     result = grep_files("unique_var", str(tmp_path))
-    assert "src/app.js" in result
-    assert len(result) == 1
+    assert result == {"src/app.js": ["1:const unique_var = 2"]}
 
 
 def test_finds_multiple_files(tmp_path):
@@ -43,10 +64,20 @@ def test_finds_multiple_files(tmp_path):
     _create_file(tmp_path, "b.py", "shared = 2")
     _create_file(tmp_path, "c.py", "shared = 3")
     result = grep_files("shared", str(tmp_path))
-    assert len(result) == 3
+    assert result == {
+        "a.py": ["1:shared = 1"],
+        "b.py": ["1:shared = 2"],
+        "c.py": ["1:shared = 3"],
+    }
 
 
 def test_multiple_matches_in_same_file(tmp_path):
     _create_file(tmp_path, "main.py", "target = 1\nother = 2\ntarget = 3")
     result = grep_files("target", str(tmp_path))
     assert result == {"main.py": ["1:target = 1", "3:target = 3"]}
+
+
+def test_query_is_matched_literally(tmp_path):
+    _create_file(tmp_path, "main.py", "call(a.b)\ncall(axb)\nitems[0]")
+    assert grep_files("call(a.b", str(tmp_path)) == {"main.py": ["1:call(a.b)"]}
+    assert grep_files("items[0]", str(tmp_path)) == {"main.py": ["3:items[0]"]}
@@ -45,3 +45,16 @@ from utils.files.is_config_file import is_config_file
 )
 def test_is_config_file(filename, expected):
     assert is_config_file(filename) == expected
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    ["JEST.CONFIG.TS", "src/Setup.py", "Karma.Conf.JS", "Vite.Config.Mjs"],
+)
+def test_is_config_file_ignores_case(file_path):
+    assert is_config_file(file_path) is True
+
+
+@pytest.mark.parametrize("file_path", [None, 123, ["jest.config.ts"]])
+def test_is_config_file_non_string(file_path):
+    assert is_config_file(file_path) is False
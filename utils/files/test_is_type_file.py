@@ -197,7 +197,7 @@ def test_partial_matches_should_not_match():
     assert (
         is_type_file("constant_loader.py") is False
     )  # Contains "constant" but not in pattern
-    assert is_type_file("enum_parser.py") is False  # Contains "enum" but not in pattern
+    assert is_type_file("enum_parser.py") is False  # Contains "enum" but matches no pattern
     assert (
         is_type_file("model_factory.py") is False
     )  # Contains "model" but not in pattern
@@ -227,3 +227,10 @@ def test_specific_model_file_restrictions():
     assert is_type_file("models/service.rb") is False  # Not Python
     assert is_type_file("model/handler.php") is False  # Not Python
     assert is_type_file("models/component.tsx") is False  # Not Python
+
+
+def test_verb_prefix_only_checked_on_basename():
+    # A verb-prefixed directory does not make the files inside it functions
+    assert is_type_file("get_started/types/user.py") is True
+    assert is_type_file("handlers/types/get_user.py") is False
+    assert is_type_file("Services/Types/GET_USER.py") is False
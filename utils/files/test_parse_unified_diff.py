@@ -0,0 +1,156 @@
+from utils.files.parse_unified_diff import (
+    DiffHunk,
+    FilePatch,
+    ParsedDiff,
+    parse_unified_diff,
+)
+
+NO_PATCHES = 'error: No valid patches in input (allow with "--allow-empty")'
+
+
+def test_single_hunk_with_context():
+    diff = (
+        "--- a/src/main.py\n"
+        "+++ b/src/main.py\n"
+        "@@ -1,3 +1,3 @@\n"
+        " line1\n"
+        "-line2\n"
+        "+line2_modified\n"
+        " line3\n"
+    )
+    assert parse_unified_diff(diff) == ParsedDiff(
+        patches=[
+            FilePatch(
+                old_path="src/main.py",
+                new_path="src/main.py",
+                hunks=[
+                    DiffHunk(
+                        old_start=1,
+                        old_count=3,
+                        new_start=1,
+                        new_count=3,
+                        lines=[" line1", "-line2", "+line2_modified", " line3"],
+                    )
+                ],
+            )
+        ],
+        error="",
+    )
+
+
+def test_zero_context_hunks_and_omitted_counts():
+    diff = (
+        "--- a/file.txt\n"
+        "+++ b/file.txt\n"
+        "@@ -2 +2 @@\n"
+        "-old\n"
+        "+new\n"
+        "@@ -5,0 +6,2 @@\n"
+        "+added1\n"
+        "+added2\n"
+    )
+    assert parse_unified_diff(diff).patches[0].hunks == [
+        DiffHunk(
+            old_start=2,
+            old_count=1,
+            new_start=2,
+            new_count=1,
+            lines=["-old", "+new"],
+        ),
+        DiffHunk(
+            old_start=5,
+            old_count=0,
+            new_start=6,
+            new_count=2,
+            lines=["+added1", "+added2"],
+        ),
+    ]
+
+
+def test_new_and_deleted_files_keep_dev_null():
+    diff = (
+        "--- /dev/null\n"
+        "+++ b/new.txt\n"
+        "@@ -0,0 +1 @@\n"
+        "+hello\n"
+        "--- a/old.txt\n"
+        "+++ /dev/null\n"
+        "@@ -1 +0,0 @@\n"
+        "-bye\n"
+    )
+    patches = parse_unified_diff(diff).patches
+    assert [(p.old_path, p.new_path) for p in patches] == [
+        ("/dev/null", "new.txt"),
+        ("old.txt", "/dev/null"),
+    ]
+
+
+def test_strips_timestamps_and_skips_git_metadata():
+    diff = (
+        "diff --git a/file.txt b/file.txt\n"
+        "index 1234567..89abcde 100644\n"
+        "--- a/file.txt\t2024-01-01 00:00:00.000000000 +0000\n"
+        "+++ b/file.txt\t2024-01-02 00:00:00.000000000 +0000\n"
+        "@@ -1 +1 @@\n"
+        "-a\n"
+        "+b\n"
+    )
+    patches = parse_unified_diff(diff).patches
+    assert [(p.old_path, p.new_path) for p in patches] == [("file.txt", "file.txt")]
+
+
+def test_bare_empty_line_is_empty_context():
+    diff = "--- a/f\n+++ b/f\n@@ -1,3 +1,2 @@\n a\n\n-b\n"
+    assert parse_unified_diff(diff).patches[0].hunks[0].lines == [" a", " ", "-b"]
+
+
+def test_skips_no_newline_marker():
+    diff = (
+        "--- a/f\n"
+        "+++ b/f\n"
+        "@@ -1 +1 @@\n"
+        "-a\n"
+        "\\ No newline at end of file\n"
+        "+b\n"
+        "\\ No newline at end of file\n"
+    )
+    assert parse_unified_diff(diff).patches[0].hunks[0].lines == ["-a", "+b"]
+
+
+def test_empty_input():
+    assert parse_unified_diff("") == ParsedDiff(patches=[], error=NO_PATCHES)
+
+
+def test_prose_only():
+    assert parse_unified_diff("just some text\n") == ParsedDiff(
+        patches=[], error=NO_PATCHES
+    )
+
+
+def test_hunk_without_header():
+    diff = "some text\n@@ -1 +1 @@\n-a\n+b\n"
+    assert parse_unified_diff(diff) == ParsedDiff(
+        patches=[],
+        error="error: patch fragment without header at line 2: @@ -1 +1 @@",
+    )
+
+
+def test_hunk_cut_short():
+    diff = "--- a/f\n+++ b/f\n@@ -1,3 +1,3 @@\n a\n-b\n"
+    assert parse_unified_diff(diff) == ParsedDiff(
+        patches=[], error="error: corrupt patch at line 6"
+    )
+
+
+def test_bad_marker_inside_hunk():
+    diff = "--- a/f\n+++ b/f\n@@ -1,2 +1,2 @@\n a\n*b\n"
+    assert parse_unified_diff(diff) == ParsedDiff(
+        patches=[], error="error: corrupt patch at line 5"
+    )
+
+
+def test_hunk_overruns_its_counts():
+    diff = "--- a/f\n+++ b/f\n@@ -1 +1,2 @@\n-a\n-b\n+c\n"
+    assert parse_unified_diff(diff) == ParsedDiff(
+        patches=[], error="error: corrupt patch at line 5"
+    )
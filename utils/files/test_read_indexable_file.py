@@ -0,0 +1,47 @@
+import os
+
+from utils.files.read_indexable_file import read_indexable_file
+
+
+def _write(base: str, rel_path: str, data: bytes):
+    full = os.path.join(base, rel_path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, "wb") as f:
+        f.write(data)
+
+
+def test_reads_text_file(tmp_path):
+    _write(str(tmp_path), "src/main.py", "print('héllo')\r\n".encode("utf-8"))
+
+    assert read_indexable_file(str(tmp_path), "src/main.py") == "print('héllo')\r\n"
+
+
+def test_reads_empty_file(tmp_path):
+    _write(str(tmp_path), "empty.txt", b"")
+
+    assert read_indexable_file(str(tmp_path), "empty.txt") == ""
+
+
+def test_skips_excluded_dirs(tmp_path):
+    _write(str(tmp_path), "node_modules/pkg/index.js", b"module.exports = 1;\n")
+    _write(str(tmp_path), "src/__pycache__/x.py", b"x = 1\n")
+
+    assert read_indexable_file(str(tmp_path), "node_modules/pkg/index.js") is None
+    assert read_indexable_file(str(tmp_path), "src/__pycache__/x.py") is None
+
+
+def test_skips_binary_files(tmp_path):
+    _write(str(tmp_path), "logo.png", b"\x89PNG\r\n\x1a\n\x00\x00")
+    _write(str(tmp_path), "latin1.txt", "café".encode("latin-1"))
+
+    assert read_indexable_file(str(tmp_path), "logo.png") is None
+    assert read_indexable_file(str(tmp_path), "latin1.txt") is None
+
+
+def test_skips_symlinks_directories_and_missing_files(tmp_path):
+    _write(str(tmp_path), "src/main.py", b"x = 1\n")
+    os.symlink("src/main.py", os.path.join(str(tmp_path), "link.py"))
+
+    assert read_indexable_file(str(tmp_path), "link.py") is None
+    assert read_indexable_file(str(tmp_path), "src") is None
+    assert read_indexable_file(str(tmp_path), "gone.py") is None
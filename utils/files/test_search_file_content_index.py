@@ -0,0 +1,114 @@
+# pylint: disable=redefined-outer-name
+import os
+import subprocess
+
+import pytest
+
+from services.git.delete_file import delete_file
+from services.git.get_repo_snapshot import REPO_SNAPSHOTS
+from services.git.move_file import move_file
+from services.git.write_and_commit_file import write_and_commit_file
+from utils.files.get_file_content_index import FILE_CONTENT_INDEXES
+from utils.files.grep_files import grep_files
+from utils.files.search_file_content_index import search_file_content_index
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    FILE_CONTENT_INDEXES.clear()
+    REPO_SNAPSHOTS.clear()
+    yield
+    FILE_CONTENT_INDEXES.clear()
+    REPO_SNAPSHOTS.clear()
+
+
+def _commit(repo_dir: str, files: dict[str, bytes]):
+    for rel_path, data in files.items():
+        full = os.path.join(repo_dir, rel_path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "wb") as f:
+            f.write(data)
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    # Repo-level identity so the file-edit tools can commit here too
+    subprocess.run(["git", "config", "user.name", "test"], cwd=repo_dir, check=True)
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"], cwd=repo_dir, check=True
+    )
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "fixture"], cwd=repo_dir, check=True)
+
+
+FIXTURE = {
+    "src/main.py": b"def hello_world():\n    return hello_world\n",
+    "src/utils.py": b"import os\n\nhello = 'world'  # hello_world\n",
+    "src/crlf.py": b"x = 1\r\nhello_world()\r\n",
+    "src/no_newline.py": b"print(hello_world)",
+    "src/empty.py": b"",
+    "src/blank_lines.txt": b"\n\nhello_world\n\n",
+    "logo.png": b"\x89PNG\x00hello_world",
+    "docs/café.md": "Café hello_world\n".encode("utf-8"),
+    "node_modules/pkg/index.js": b"hello_world\n",
+    "file_10.py": b"hello_world = 10\n",
+    "file_2.py": b"hello_world = 2\n",
+}
+
+
+@pytest.mark.parametrize("query", ["hello_world", "hello", "x = 1", "missing", ""])
+def test_matches_grep_files_output(tmp_path, query):
+    _commit(str(tmp_path), FIXTURE)
+
+    assert search_file_content_index(query, str(tmp_path)) == grep_files(
+        query=query, search_dir=str(tmp_path)
+    )
+
+
+def test_returns_lines_in_grep_format(tmp_path):
+    _commit(str(tmp_path), FIXTURE)
+
+    assert search_file_content_index("hello_world", str(tmp_path)) == {
+        "docs/café.md": ["1:Café hello_world"],
+        "file_10.py": ["1:hello_world = 10"],
+        "file_2.py": ["1:hello_world = 2"],
+        "src/blank_lines.txt": ["3:hello_world"],
+        "src/crlf.py": ["2:hello_world()"],
+        "src/main.py": ["1:def hello_world():", "2:    return hello_world"],
+        "src/no_newline.py": ["1:print(hello_world)"],
+        "src/utils.py": ["3:hello = 'world'  # hello_world"],
+    }
+
+
+def test_matches_query_literally(tmp_path):
+    _commit(str(tmp_path), {"a.py": b"os.path.join\nosXpathXjoin\n(a|b)\n"})
+
+    assert search_file_content_index("os.path", str(tmp_path)) == {
+        "a.py": ["1:os.path.join"]
+    }
+    assert search_file_content_index("(a|b)", str(tmp_path)) == {"a.py": ["3:(a|b)"]}
+
+
+def test_returns_none_without_index(tmp_path):
+    assert search_file_content_index("hello", str(tmp_path)) is None
+
+
+def test_sees_changes_made_by_file_edit_tools(tmp_path, create_test_base_args):
+    repo_dir = str(tmp_path)
+    _commit(
+        repo_dir,
+        {"src/a.py": b"token = 1\n", "src/b.py": b"token = 2\n", "c.py": b"c = 3\n"},
+    )
+    base_args = create_test_base_args(clone_dir=repo_dir, defer_push=True)
+    assert search_file_content_index("token", repo_dir) == {
+        "src/a.py": ["1:token = 1"],
+        "src/b.py": ["1:token = 2"],
+    }
+
+    write_and_commit_file(
+        file_content="c = 3\ntoken = 3\n", file_path="c.py", base_args=base_args
+    )
+    move_file(old_file_path="src/a.py", new_file_path="lib/a.py", base_args=base_args)
+    delete_file(file_path="src/b.py", base_args=base_args)
+
+    assert search_file_content_index("token", repo_dir) == {
+        "c.py": ["2:token = 3"],
+        "lib/a.py": ["1:token = 1"],
+    }
@@ -1,5 +1,7 @@
 import os
+import subprocess
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -9,9 +11,30 @@ from utils.files.search_local_file_contents import (
     search_local_file_contents,
 )
 
-REPO_ROOT = os.path.dirname(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# The clone root itself: grep_files only searches files tracked at its HEAD
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _commit_all(repo_dir: str):
+    """search_local_file_contents greps the git snapshot, so fixture files must be committed."""
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=repo_dir, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@test.com",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "fixture",
+        ],
+        cwd=repo_dir,
+        check=True,
+    )
 
 
 def test_search_finds_matching_files(create_test_base_args):
@@ -23,11 +46,13 @@ def test_search_finds_matching_files(create_test_base_args):
         with open(os.path.join(tmpdir, "src", "utils.py"), "w", encoding=UTF8) as f:
             f.write("import os\n")
 
+        _commit_all(tmpdir)
         base_args = create_test_base_args(clone_dir=tmpdir)
         result = search_local_file_contents(query="hello_world", base_args=base_args)
-        assert "1 files found" in result
-        assert "src/main.py" in result
-        assert "src/main.py:1:def hello_world():" in result
+        assert result == (
+            "1 files found for the search query 'hello_world':\n"
+            "src/main.py:1:def hello_world():\n"
+        )
 
 
 def test_search_no_matches(create_test_base_args):
@@ -35,17 +60,18 @@ def test_search_no_matches(create_test_base_args):
         with open(os.path.join(tmpdir, "main.py"), "w", encoding=UTF8) as f:
             f.write("def foo():\n    pass\n")
 
+        _commit_all(tmpdir)
         base_args = create_test_base_args(clone_dir=tmpdir)
         result = search_local_file_contents(
             query="nonexistent_symbol", base_args=base_args
         )
-        assert "0 files found" in result
+        assert result == "0 files found for the search query 'nonexistent_symbol'.\n"
 
 
 def test_search_clone_dir_not_found(create_test_base_args):
     base_args = create_test_base_args(clone_dir="/nonexistent/path")
     result = search_local_file_contents(query="test", base_args=base_args)
-    assert "0 files found" in result
+    assert result == "0 files found for the search query 'test'.\n"
 
 
 def test_search_excludes_node_modules(create_test_base_args):
@@ -58,11 +84,13 @@ def test_search_excludes_node_modules(create_test_base_args):
         with open(os.path.join(tmpdir, "app.js"), "w", encoding=UTF8) as f:
             f.write("const myUniqueVar = 2;\n")
 
+        _commit_all(tmpdir)
         base_args = create_test_base_args(clone_dir=tmpdir)
         result = search_local_file_contents(query="myUniqueVar", base_args=base_args)
-        assert "1 files found" in result
-        assert "app.js" in result
-        assert "node_modules" not in result
+        assert result == (
+            "1 files found for the search query 'myUniqueVar':\n"
+            "app.js:1:const myUniqueVar = 2;\n"
+        )
 
 
 def test_search_multiple_files(create_test_base_args):
@@ -74,9 +102,13 @@ def test_search_multiple_files(create_test_base_args):
         with open(os.path.join(tmpdir, "c.py"), "w", encoding=UTF8) as f:
             f.write("x = 3\n")
 
+        _commit_all(tmpdir)
         base_args = create_test_base_args(clone_dir=tmpdir)
         result = search_local_file_contents(query="x = ", base_args=base_args)
-        assert "3 files found" in result
+        assert result == (
+            "3 files found for the search query 'x = ':\n"
+            "a.py:1:x = 1\nb.py:1:x = 2\nc.py:1:x = 3\n"
+        )
 
 
 def test_search_limits_to_20_files(create_test_base_args):
@@ -85,22 +117,67 @@ def test_search_limits_to_20_files(create_test_base_args):
             with open(os.path.join(tmpdir, f"file_{i}.py"), "w", encoding=UTF8) as f:
                 f.write("common_keyword = True\n")
 
+        _commit_all(tmpdir)
         base_args = create_test_base_args(clone_dir=tmpdir)
         result = search_local_file_contents(query="common_keyword", base_args=base_args)
-        assert "25 files found" in result
-        assert "and 5 more files" in result
+        # Tracked paths come back in git's byte order, so file_10..file_19 sort before file_2
+        shown = sorted(f"file_{i}.py" for i in range(25))[:20]
+        assert result == (
+            "25 files found for the search query 'common_keyword':\n"
+            + "\n".join(f"{name}:1:common_keyword = True" for name in shown)
+            + "\n... and 5 more files\n"
+        )
 
 
 def test_search_grep_failure(create_test_base_args):
     with tempfile.TemporaryDirectory() as tmpdir:
-        with patch("utils.files.grep_files.subprocess.run") as mock_run:
+        snapshot = SimpleNamespace(
+            files=[SimpleNamespace(path="main.py", type="blob", mode="100644")]
+        )
+        with patch(
+            "utils.files.grep_files.get_repo_snapshot", return_value=snapshot
+        ), patch("utils.files.grep_files.subprocess.run") as mock_run:
             mock_run.return_value.returncode = 2
             mock_run.return_value.stderr = "grep: error"
             mock_run.return_value.stdout = ""
 
             base_args = create_test_base_args(clone_dir=tmpdir)
             result = search_local_file_contents(query="test", base_args=base_args)
-            assert "0 files found" in result
+            assert result == "0 files found for the search query 'test'.\n"
+
+
+def test_search_answers_from_index_without_grep(create_test_base_args):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "main.py"), "w", encoding=UTF8) as f:
+            f.write("def indexed():\n    pass\n")
+
+        _commit_all(tmpdir)
+        base_args = create_test_base_args(clone_dir=tmpdir)
+        with patch(
+            "utils.files.search_local_file_contents.grep_files"
+        ) as mock_grep_files:
+            first = search_local_file_contents(query="indexed", base_args=base_args)
+            second = search_local_file_contents(query="indexed", base_args=base_args)
+
+        mock_grep_files.assert_not_called()
+        expected = (
+            "1 files found for the search query 'indexed':\nmain.py:1:def indexed():\n"
+        )
+        assert (first, second) == (expected, expected)
+
+
+def test_search_falls_back_to_grep_without_index(create_test_base_args):
+    base_args = create_test_base_args(clone_dir="/tmp/not-a-clone")
+    with patch(
+        "utils.files.search_local_file_contents.grep_files",
+        return_value={"a.py": ["1:needle"]},
+    ) as mock_grep_files:
+        result = search_local_file_contents(query="needle", base_args=base_args)
+
+    mock_grep_files.assert_called_once_with(
+        query="needle", search_dir="/tmp/not-a-clone"
+    )
+    assert result == "1 files found for the search query 'needle':\na.py:1:needle\n"
 
 
 @pytest.mark.integration
@@ -108,8 +185,13 @@ def test_search_real_repo(create_test_base_args):
     """Integration test: search this repo for a known unique function name."""
     base_args = create_test_base_args(clone_dir=REPO_ROOT)
     result = search_local_file_contents(query="grep_files", base_args=base_args)
-    assert "files found" in result
-    assert "search_local_file_contents.py" in result
+    assert result.split("\n", 1)[0].endswith(
+        "files found for the search query 'grep_files':"
+    )
+    assert any(
+        line.startswith("utils/files/search_local_file_contents.py:")
+        for line in result.split("\n")
+    )
     # Verify excluded dirs don't appear as file paths (they may appear in line content)
     for line in result.split("\n"):
         if line.startswith("- "):
@@ -0,0 +1,43 @@
+import subprocess
+
+from utils.error.handle_exceptions import handle_exceptions
+from utils.logging.logging_config import logger
+
+
+@handle_exceptions(default_return_value=[], raise_on_error=False)
+def get_gitignored_paths(clone_dir: str, file_paths: list[str]):
+    """Return the subset of `file_paths` (relative to clone_dir) that git would ignore, in input order.
+
+    Batched form of is_path_gitignored: one `git check-ignore --stdin` process for all paths instead of one per path. -z keeps paths with newlines or quotes intact on both stdin and stdout. Exit 0 means at least one path is ignored, exit 1 means none are, anything else is a real error, so run_subprocess() (which raises on any non-zero exit) is bypassed here too.
+    """
+    if not file_paths:
+        logger.info("get_gitignored_paths: no paths to check")
+        return []
+
+    logger.info("get_gitignored_paths: checking %d path(s)", len(file_paths))
+    result = subprocess.run(
+        ["git", "check-ignore", "--stdin", "-z"],
+        input="\0".join(file_paths) + "\0",
+        capture_output=True,
+        check=False,
+        cwd=clone_dir,
+        text=True,
+        shell=False,
+    )
+    if result.returncode not in (0, 1):
+        logger.warning(
+            "get_gitignored_paths: git check-ignore exited %d: %s",
+            result.returncode,
+            result.stderr.strip(),
+        )
+        return []
+
+    ignored = set(result.stdout.split("\0")) - {""}
+    gitignored = [f for f in file_paths if f in ignored]
+    logger.info(
+        "get_gitignored_paths: %d of %d path(s) ignored: %s",
+        len(gitignored),
+        len(file_paths),
+        gitignored,
+    )
+    return gitignored
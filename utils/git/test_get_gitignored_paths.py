@@ -0,0 +1,61 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from utils.git.get_gitignored_paths import get_gitignored_paths
+
+
+@pytest.fixture
+def gitignore_repo(tmp_path):
+    """Real git repo with a .gitignore, same setup as test_is_path_gitignored so both functions are held to git's own check-ignore semantics."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.email", "t@t.t"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.name", "t"], cwd=tmp_path, check=True)
+    (tmp_path / ".gitignore").write_text("node_modules\ndist/\n*.log\n")
+    subprocess.run(["git", "add", ".gitignore"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+    return str(tmp_path)
+
+
+def test_returns_ignored_subset_in_input_order(gitignore_repo):
+    assert get_gitignored_paths(
+        gitignore_repo,
+        [
+            "src/index.ts",
+            "debug.log",
+            "node_modules/test-exclude/index.js",
+            "README.md",
+            "dist/bundle.js",
+        ],
+    ) == ["debug.log", "node_modules/test-exclude/index.js", "dist/bundle.js"]
+
+
+def test_returns_empty_when_nothing_is_ignored(gitignore_repo):
+    assert not get_gitignored_paths(gitignore_repo, ["src/index.ts", "README.md"])
+
+
+def test_handles_paths_with_spaces_and_quotes(gitignore_repo):
+    assert get_gitignored_paths(
+        gitignore_repo, ['my "notes" file.log', "src/my file.ts"]
+    ) == ['my "notes" file.log']
+
+
+def test_runs_a_single_process_for_many_paths(gitignore_repo):
+    paths = [f"src/file_{i}.ts" for i in range(50)] + ["node_modules/a.js"]
+    with patch(
+        "utils.git.get_gitignored_paths.subprocess.run", wraps=subprocess.run
+    ) as mock_run:
+        assert get_gitignored_paths(gitignore_repo, paths) == ["node_modules/a.js"]
+    mock_run.assert_called_once()
+
+
+def test_skips_subprocess_for_empty_list(gitignore_repo):
+    with patch("utils.git.get_gitignored_paths.subprocess.run") as mock_run:
+        assert not get_gitignored_paths(gitignore_repo, [])
+    mock_run.assert_not_called()
+
+
+def test_returns_empty_outside_a_git_repo(tmp_path):
+    # Exit 128 (not a git repository) is a real error, not "everything ignored"
+    assert not get_gitignored_paths(str(tmp_path), ["node_modules/a.js"])
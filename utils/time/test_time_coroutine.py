@@ -0,0 +1,43 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from utils.time.time_coroutine import time_coroutine
+
+
+@pytest.mark.asyncio
+async def test_returns_result_and_seconds():
+    async def work():
+        return "done"
+
+    with patch("utils.time.time_coroutine.time.perf_counter") as mock_clock:
+        mock_clock.side_effect = [10.0, 12.5]
+        result, seconds = await time_coroutine("stage", work())
+
+    assert result == "done"
+    assert seconds == 2.5
+
+
+@pytest.mark.asyncio
+async def test_gathered_stages_report_their_own_time():
+    async def sleep_then(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    (fast, fast_seconds), (slow, slow_seconds) = await asyncio.gather(
+        time_coroutine("fast", sleep_then("a", 0.05)),
+        time_coroutine("slow", sleep_then("b", 0.3)),
+    )
+
+    assert (fast, slow) == ("a", "b")
+    assert fast_seconds < slow_seconds
+
+
+@pytest.mark.asyncio
+async def test_propagates_exceptions():
+    async def boom():
+        raise RuntimeError("stage failed")
+
+    with pytest.raises(RuntimeError, match=r"^stage failed$"):
+        await time_coroutine("boom", boom())
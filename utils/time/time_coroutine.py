@@ -0,0 +1,15 @@
+import time
+from typing import Any, Coroutine, TypeVar
+
+from utils.logging.logging_config import logger
+
+T = TypeVar("T")
+
+
+async def time_coroutine(name: str, coro: Coroutine[Any, Any, T]):
+    """Await coro and return (result, seconds). Lets asyncio.gather report per-stage wall time when stages overlap."""
+    start = time.perf_counter()
+    result = await coro
+    seconds = time.perf_counter() - start
+    logger.info("%s took %.2f seconds", name, seconds)
+    return result, seconds